@@ -3,6 +3,12 @@
 Script to add navigation to ALL pages that are missing it
 """
 import os
+import sys
+
+REPO = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(REPO, 'scripts'))
+
+from html_rewrite import rewrite, transform
 
 NAV_CSS = """
 /* Logo */
@@ -259,30 +265,16 @@ NAV_HTML = """
 
 """
 
-def add_navigation_to_file(filepath):
+@transform('add-navigation')
+def add_navigation(rel, content):
     """Add navigation CSS and HTML to a page"""
-    print(f"Processing {filepath}...")
-
-    if not os.path.exists(filepath):
-        print(f"  [SKIP] File not found: {filepath}")
-        return False
-
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except Exception as e:
-        print(f"  [ERROR] Could not read {filepath}: {e}")
-        return False
-
     # Check if navigation already exists
     if 'class="nav-links"' in content:
-        print(f"  [OK] Navigation already exists")
-        return False
+        return content
 
     # Check if file has required structure
     if '<body>' not in content or '</style>' not in content:
-        print(f"  [SKIP] File doesn't have expected HTML structure")
-        return False
+        return content
 
     # Add fonts if not present
     if 'Orbitron' not in content and 'Poppins' not in content:
@@ -336,17 +328,28 @@ def add_navigation_to_file(filepath):
         )
 
     # Add navigation HTML after <body>
-    content = content.replace('<body>', '<body>\n' + NAV_HTML, 1)
+    return content.replace('<body>', '<body>\n' + NAV_HTML, 1)
 
-    # Write back
-    try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+
+def add_navigation_to_file(filepath):
+    """Add navigation CSS and HTML to one page. Returns True if it changed."""
+    print(f"Processing {filepath}...")
+
+    if not os.path.exists(filepath):
+        print(f"  [SKIP] File not found: {filepath}")
+        return False
+
+    rel = os.path.relpath(os.path.abspath(filepath), REPO).replace('\\', '/')
+    results = rewrite(['add-navigation'], pages=[rel], workers=1)
+    if results and results[0].error:
+        print(f"  [ERROR] {filepath}: {results[0].error}")
+        return False
+    if results:
         print(f"  [ADDED] Navigation added successfully")
         return True
-    except Exception as e:
-        print(f"  [ERROR] Could not write {filepath}: {e}")
-        return False
+    print(f"  [OK] Navigation already exists or page has no <body>/<style> to hook into")
+    return False
+
 
 def main():
     # All pages that need navigation (excluding those that already have it)
@@ -389,21 +392,19 @@ def main():
         'bestbook.html'
     ]
 
-    updated = 0
-    skipped = 0
-    errors = 0
-
-    for page in pages_to_update:
-        result = add_navigation_to_file(page)
-        if result:
-            updated += 1
-        elif os.path.exists(page):
-            if 'class="nav-links"' in open(page, 'r', encoding='utf-8').read():
-                skipped += 1
-            else:
-                skipped += 1
+    found = [page for page in pages_to_update if os.path.exists(os.path.join(REPO, page))]
+    errors = len(pages_to_update) - len(found)
+
+    # One pass through the rewrite engine over the pages that exist.
+    results = rewrite(['add-navigation'], pages=found)
+    for r in results:
+        if r.error:
+            print(f"  [ERROR] {r.rel}: {r.error}")
         else:
-            errors += 1
+            print(f"  [ADDED] {r.rel}")
+    updated = sum(1 for r in results if r.applied)
+    errors += sum(1 for r in results if r.error)
+    skipped = len(found) - len(results)
 
     print(f"\n========================================")
     print(f"Complete!")
@@ -243,6 +243,13 @@
     return src;
   }
 
+  // Responsive WebP/AVIF derivatives written by scripts/build_image_derivatives.py
+  // into image-derivatives-data.js. Missing entries mean "serve the original".
+  function srcsetFor(src) {
+    var map = window.BETLEGEND_IMAGE_SRCSET || {};
+    return isLocalImage(src) && map[src] ? map[src] : null;
+  }
+
   function resolveStaticImage(card) {
     var key = card && card.key ? card.key : '';
     var category = card && card.category ? card.category : 'Betting';
@@ -286,6 +293,7 @@
     isLocalImage: isLocalImage,
     escapeXml: escapeXml,
     makeThumbnail: makeThumbnail,
+    srcsetFor: srcsetFor,
     resolvePickImage: resolvePickImage,
     resolveStaticImage: resolveStaticImage,
     normalizeHomepageCardImages: normalizeHomepageCardImages,
@@ -0,0 +1,3 @@
+// Generated by scripts/build_image_derivatives.py - do not edit by hand.
+// Maps an original images/ path to its responsive WebP/AVIF srcset.
+window.BETLEGEND_IMAGE_SRCSET = {};
@@ -13,9 +13,9 @@ from data_quality import filter_reliable_games
 
 try:
     # We are in scripts/
-    from sellable_market_eligibility import public_trend_exclusion_reason
+    from sellable_market_eligibility import filter_public_trend_rows
 except ImportError:
-    public_trend_exclusion_reason = None
+    filter_public_trend_rows = None
 
 # Reverse map from English phrase to internal label
 LABEL_MAP = {
@@ -77,9 +77,9 @@ def load_data(sport):
                  and g.get('HomeTeam') and g.get('AwayTeam')
                  and g.get('HomeScore') is not None and g.get('AwayScore') is not None]
     
-    if public_trend_exclusion_reason is not None:
+    if filter_public_trend_rows is not None:
         before = len(raw_games)
-        raw_games = [g for g in raw_games if public_trend_exclusion_reason(g, sport) is None]
+        raw_games = filter_public_trend_rows(raw_games, sport)
         print(f"  [DEBUG] Guardrails excluded {before - len(raw_games)} {sport} games")
 
     games = filter_reliable_games(raw_games, sport, include_marginal=True)
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Content-hash cache-busting for every static asset a page references.
+
+Every local .js / .css / .json a page points at (calendar engines,
+homepage-picks-data.js, featured-games-data.js, the site stylesheets,
+records/archive data, ...) is referenced as `<asset>?v=<hash>`, where the
+hash is derived from the asset's bytes ('c' + md5[:10], the scheme the
+calendar engines were already stamped with). A browser refetches an asset
+exactly when its content changed and keeps its cached copy otherwise.
+
+This replaces two older stampers. stamp_calendar_cache_bust.py covered only
+the eight calendar engines and regex-scanned every page on every run.
+sync_calendars.update_calendar_cache_busters() wrote a fresh timestamp into
+the hub pages on every sync, so the ~71KB calendar JS was refetched daily
+even when nothing had changed.
+
+data/cache/asset-manifest.json records each asset's current version, and for
+each page the hash of its bytes (as last stamped) plus the assets it
+references. A run only rescans pages whose bytes changed, and only rewrites
+pages that reference an asset whose version moved. When nothing changed no
+page is touched.
+
+A reference is an src/href attribute ending in .js/.css/.json that resolves
+to a file in the repo, either relative to the page or from the site root.
+External URLs and paths that resolve to nothing are left alone, and so are
+URLs built inside inline scripts (they add their own cache-busting query).
+
+Run after anything that rewrites an asset (sync_calendars.py runs it itself;
+the auto-fix-content workflow runs it again after the featured-games sync).
+
+Usage:
+  python scripts/asset_manifest.py            # stamp changed pages
+  python scripts/asset_manifest.py --full     # ignore the manifest, rescan all
+  python scripts/asset_manifest.py --list     # print asset -> version
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import posixpath
+import re
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO = os.path.dirname(SCRIPT_DIR)
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+MANIFEST_PATH = os.path.join(REPO, 'data', 'cache', 'asset-manifest.json')
+# Bump when REF_RE or resolve() changes what counts as a reference.
+MANIFEST_VERSION = 1
+
+# An src/href pointing at a .js/.css/.json file, with its ?v= if it has one.
+REF_RE = re.compile(r'''(\b(?:src|href)=["'])([^"'\s<>()?#]+\.(?:js|css|json))(\?v=[^"'>\s]*)?(?=["'])''')
+
+
+def asset_version(path):
+    with open(path, 'rb') as f:
+        return 'c' + hashlib.md5(f.read()).hexdigest()[:10]
+
+
+def resolve(page, value):
+    """Repo-relative path of the asset `value` refers to from `page`, or None."""
+    if value.startswith(('http:', 'https:', '//', 'data:')):
+        return None
+    if value.startswith('/'):
+        candidates = [value.lstrip('/')]
+    else:
+        # Some archive pages use root-relative paths without the leading
+        # slash; accept those too, as the old engine stamper did.
+        candidates = [posixpath.normpath(posixpath.join(posixpath.dirname(page), value)), value]
+    for rel in candidates:
+        if rel.startswith('..'):
+            continue
+        if os.path.isfile(os.path.join(REPO, rel)):
+            return rel
+    return None
+
+
+class AssetManifest:
+    """data/cache/asset-manifest.json: asset versions + per-page references."""
+
+    def __init__(self, path=MANIFEST_PATH):
+        self.path = path
+        self.assets = {}
+        self.pages = {}
+        self.dirty = False
+        try:
+            with open(path, encoding='utf-8') as f:
+                raw = json.load(f)
+            if raw.get('version') == MANIFEST_VERSION:
+                self.assets = raw.get('assets', {})
+                self.pages = raw.get('pages', {})
+        except (OSError, ValueError):
+            pass
+
+    def save(self):
+        if not self.dirty:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        payload = {'version': MANIFEST_VERSION,
+                   'assets': dict(sorted(self.assets.items())),
+                   'pages': dict(sorted(self.pages.items()))}
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(payload, indent=1) + '\n')
+        self.dirty = False
+
+
+class Versions(dict):
+    """asset rel -> current version, hashing each asset once per run."""
+
+    def __missing__(self, rel):
+        version = self[rel] = asset_version(os.path.join(REPO, rel))
+        return version
+
+
+def stamp_text(page, text, versions):
+    """`text` with every asset reference pointed at its current version.
+
+    Returns (new_text, sorted referenced assets).
+    """
+    refs = set()
+
+    def repl(m):
+        rel = resolve(page, m.group(2))
+        if rel is None:
+            return m.group(0)
+        refs.add(rel)
+        return f'{m.group(1)}{m.group(2)}?v={versions[rel]}'
+
+    return REF_RE.sub(repl, text), sorted(refs)
+
+
+def html_pages():
+    from html_rewrite import html_pages as pages
+    return pages()
+
+
+def stamp(pages=None, full=False, manifest=None, verbose=False):
+    """Stamp current asset versions into the pages that need it.
+
+    Returns (rewritten pages, scanned pages). Pages unchanged since the last
+    run whose assets all kept their version are skipped without a scan.
+    Stamping only some `pages` leaves the recorded asset versions alone, so
+    the pages not stamped are still rescanned by the next full run.
+    """
+    manifest = manifest or AssetManifest()
+    versions = Versions()
+    partial = pages is not None
+    pages = html_pages() if pages is None else list(pages)
+    rewritten, scanned = [], 0
+    for rel in pages:
+        path = os.path.join(REPO, rel)
+        try:
+            with open(path, 'rb') as f:
+                raw = f.read()
+        except OSError:
+            continue
+        sha = hashlib.sha1(raw).hexdigest()
+        entry = manifest.pages.get(rel)
+        if (not full and entry and entry['sha'] == sha
+                and all(os.path.isfile(os.path.join(REPO, a)) and versions[a] == manifest.assets.get(a)
+                        for a in entry['assets'])):
+            continue
+        scanned += 1
+        text = raw.decode('utf-8', 'surrogateescape')
+        new_text, refs = stamp_text(rel, text, versions)
+        new_raw = new_text.encode('utf-8', 'surrogateescape')
+        if new_raw != raw:
+            with open(path, 'wb') as f:
+                f.write(new_raw)
+            rewritten.append(rel)
+            if verbose:
+                print(f'  [stamp] {rel}')
+        new_entry = {'sha': hashlib.sha1(new_raw).hexdigest(), 'assets': refs}
+        if entry != new_entry:
+            manifest.pages[rel] = new_entry
+            manifest.dirty = True
+    for rel in [r for r in manifest.pages if not os.path.exists(os.path.join(REPO, r))]:
+        del manifest.pages[rel]
+        manifest.dirty = True
+    current = {a: versions[a] for entry in manifest.pages.values() for a in entry['assets']
+               if os.path.isfile(os.path.join(REPO, a))}
+    if partial:
+        current = {a: manifest.assets[a] for a in current if a in manifest.assets}
+    if current != manifest.assets:
+        manifest.assets = current
+        manifest.dirty = True
+    manifest.save()
+    return rewritten, scanned
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Stamp content-hash ?v= versions on asset references.')
+    ap.add_argument('--full', action='store_true', help='Rescan every page, ignoring the manifest.')
+    ap.add_argument('--list', action='store_true', help='Print each referenced asset and its version.')
+    ap.add_argument('--verbose', action='store_true', help='Print each rewritten page.')
+    args = ap.parse_args(argv)
+
+    manifest = AssetManifest()
+    if args.list:
+        for rel, version in sorted(manifest.assets.items()):
+            print(f'  {rel:45s} ?v={version}')
+        return 0
+    before = dict(manifest.assets)
+    rewritten, scanned = stamp(full=args.full, manifest=manifest, verbose=args.verbose)
+    moved = sorted(a for a, v in manifest.assets.items() if before.get(a) != v)
+    for rel in moved:
+        print(f'  [stamp] {rel} -> ?v={manifest.assets[rel]}')
+    print(f'  [stamp] {len(manifest.assets)} asset(s); {scanned} page(s) scanned, '
+          f'{len(rewritten)} re-stamped')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -17,6 +17,8 @@ import urllib.request
 from pathlib import Path
 from xml.etree import ElementTree as ET
 
+from calendar_shards import page_bucket, read_calendar_js
+
 
 REPO = Path(__file__).resolve().parents[1]
 BASE_URL = "https://www.betlegendpicks.com"
@@ -132,7 +134,7 @@ def latest_sport_page(sport: str) -> tuple[str, str]:
     cal = REPO / "scripts" / f"{sport}-calendar.js"
     candidates = []
     if cal.exists():
-        content = cal.read_text(encoding="utf-8", errors="ignore")
+        content = read_calendar_js(cal)
         for page_date, rel in re.findall(
             r'\{\s*date:\s*"(\d{4}-\d{2}-\d{2})",\s*page:\s*"([^"]+)"', content
         ):
@@ -284,8 +286,10 @@ def assert_reachable_from_hub(hub_rel: str, target_rel: str, sport: str, args: a
     target = target_rel.lstrip("/")
     if target in content:
         return
-    js_status, _, js = read(f"scripts/{sport}-calendar.js", args)
-    if js_status == 200 and target in js:
+    # Calendar entries live in data/calendar/<sport>/ shards; the page-bucket
+    # shard lists every page the sport calendar links.
+    js_status, _, js = read(f"data/calendar/{sport}/pages-{page_bucket(target)}.json", args)
+    if js_status == 200 and f'"{target}"' in js:
         return
     raise AuditError(
         f"{target_rel} is not reachable from {hub_rel} (no static link and not in {sport} calendar)"
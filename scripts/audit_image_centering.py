@@ -6,18 +6,24 @@ For each page it finds the primary cropped image, reads its COMPUTED object-fit
 object-position, natural vs rendered aspect, and saves a screenshot. Flags any
 cover image whose object-position is the implicit 'center'/'50% 50%' (face-crop risk).
 
+Every page x viewport is audited concurrently on the shared browser_pool.py
+browser; a local page whose content is unchanged reuses its cached record and
+screenshot without being loaded.
+
 Usage:
-  python scripts/audit_image_centering.py --local      # audit working-tree files (file://)
+  python scripts/audit_image_centering.py --local      # audit working-tree files (local server)
   python scripts/audit_image_centering.py --live       # audit https://www.betlegendpicks.com
+  python scripts/audit_image_centering.py --jobs 4     # concurrent pages (default: one per core)
 """
 import sys, json
+import asyncio
 from pathlib import Path
-from playwright.sync_api import sync_playwright
+
+from browser_pool import LIVE_BASE, cache_get, cache_put, content_key, error_status, run
 
 REPO = Path(__file__).resolve().parents[1]
 OUT = REPO / "verification-screenshots" / "image-centering"
 OUT.mkdir(parents=True, exist_ok=True)
-BASE = "https://www.betlegendpicks.com"
 
 PAGES = [
     ("skenes-featured",   "dodgers-vs-pirates-skenes-analysis-stats-preview.html",            ".feature-photo"),
@@ -30,50 +36,52 @@ PAGES = [
 ]
 VIEWPORTS = [("desktop", 1440, 900), ("mobile", 390, 844)]
 
-def url_for(rel, live):
-    if live:
-        return f"{BASE}/{rel}"
-    return (REPO / rel).resolve().as_uri()
+async def audit_one(pool, mode, label, rel, sel, vname, vw, vh):
+    shot = OUT / f"{label}-{vname}-{mode}.png"
+    key = content_key(rel, "centering", (vw, vh), sel) if pool.local else None
+    rec = cache_get(key, str(shot))
+    if rec is not None:
+        rec["url"] = pool.url(rel)
+        return rec
+    rec = {"page": label, "viewport": vname, "selector": sel, "url": pool.url(rel)}
+    try:
+        async with pool.page((vw, vh)) as pg:
+            await pg.goto(rec["url"], wait_until="load", timeout=45000)
+            await pg.wait_for_timeout(500)
+            el = await pg.query_selector(sel)
+            if not el:
+                rec["status"] = "IMAGE_NOT_FOUND"
+                return rec
+            info = await el.evaluate(
+                """e=>{const c=getComputedStyle(e);const r=e.getBoundingClientRect();
+                return {fit:c.objectFit, pos:c.objectPosition,
+                        nat:(e.naturalWidth||0)+'x'+(e.naturalHeight||0),
+                        box:Math.round(r.width)+'x'+Math.round(r.height),
+                        visible:r.width>0&&r.height>0};}"""
+            )
+            rec.update(info)
+            cover = info["fit"] == "cover"
+            implicit = info["pos"].replace(" ", "") in ("50%50%", "center", "centercenter", "50%")
+            rec["status"] = "OK" if (not cover or not implicit) else "CROP_RISK_IMPLICIT_CENTER"
+            await el.scroll_into_view_if_needed(timeout=5000)
+            await el.screenshot(path=str(shot))
+            rec["screenshot"] = shot.name
+    except Exception as e:
+        rec["status"] = error_status(e)
+        return rec
+    cache_put(key, rec, str(shot))
+    return rec
 
 def main():
     live = "--live" in sys.argv
     mode = "live" if live else "local"
-    rows = []
-    with sync_playwright() as p:
-        b = p.chromium.launch()
-        for vname, vw, vh in VIEWPORTS:
-            ctx = b.new_context(viewport={"width": vw, "height": vh})
-            pg = ctx.new_page()
-            for label, rel, sel in PAGES:
-                u = url_for(rel, live)
-                rec = {"page": label, "viewport": vname, "selector": sel, "url": u}
-                try:
-                    pg.goto(u, wait_until="load", timeout=45000)
-                    pg.wait_for_timeout(500)
-                    el = pg.query_selector(sel)
-                    if not el:
-                        rec["status"] = "IMAGE_NOT_FOUND"
-                    else:
-                        info = el.evaluate(
-                            """e=>{const c=getComputedStyle(e);const r=e.getBoundingClientRect();
-                            return {fit:c.objectFit, pos:c.objectPosition,
-                                    nat:(e.naturalWidth||0)+'x'+(e.naturalHeight||0),
-                                    box:Math.round(r.width)+'x'+Math.round(r.height),
-                                    visible:r.width>0&&r.height>0};}"""
-                        )
-                        rec.update(info)
-                        cover = info["fit"] == "cover"
-                        implicit = info["pos"].replace(" ", "") in ("50%50%", "center", "centercenter", "50%")
-                        rec["status"] = "OK" if (not cover or not implicit) else "CROP_RISK_IMPLICIT_CENTER"
-                        shot = OUT / f"{label}-{vname}-{mode}.png"
-                        el.scroll_into_view_if_needed(timeout=5000)
-                        el.screenshot(path=str(shot))
-                        rec["screenshot"] = shot.name
-                except Exception as e:
-                    rec["status"] = f"ERROR:{type(e).__name__}:{str(e)[:80]}"
-                rows.append(rec)
-            ctx.close()
-        b.close()
+    jobs = int(sys.argv[sys.argv.index("--jobs") + 1]) if "--jobs" in sys.argv else None
+
+    async def audit(pool):
+        return await asyncio.gather(*(audit_one(pool, mode, label, rel, sel, vname, vw, vh)
+                                      for vname, vw, vh in VIEWPORTS for label, rel, sel in PAGES))
+
+    rows = run(audit, jobs=jobs, base=LIVE_BASE if live else None)
 
     print(f"=== IMAGE CENTERING AUDIT ({mode}) ===")
     bad = 0
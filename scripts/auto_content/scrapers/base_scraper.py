@@ -15,6 +15,10 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import ESPN_BASE_URL, get_espn_scoreboard_url, get_espn_teams_url, get_espn_standings_url
 
+# scripts/ for the shared run telemetry
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+import telemetry
+
 class BaseScraper:
     """Base class for all sport scrapers."""
 
@@ -38,6 +42,7 @@ class BaseScraper:
             except requests.RequestException as e:
                 print(f"Request failed (attempt {attempt + 1}/{retries}): {e}")
                 if attempt < retries - 1:
+                    telemetry.retry(url, 'error')
                     time.sleep(2 ** attempt)  # Exponential backoff
         return None
 
@@ -211,7 +216,9 @@ class BaseScraper:
     def get_standings(self) -> Dict:
         """Get league standings."""
         if self._standings_cache:
+            telemetry.cache_hit('scraper_standings')
             return self._standings_cache
+        telemetry.cache_miss('scraper_standings')
 
         url = get_espn_standings_url(self.sport, self.league)
         data = self._make_request(url)
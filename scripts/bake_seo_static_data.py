@@ -5,13 +5,24 @@ and hydrated everything client-side from Google Sheets CSVs, so crawlers that do
 not execute JavaScript saw no real content (GSC: upcomingpicks.html was never
 crawled; see SEO_AUDIT_REPORT_2026-07-30.md, finding A).
 
-HOW: Instead of re-implementing the pages' aggregation math in Python (drift risk
-on trust-critical record numbers), this script loads each page in headless
-Chromium, lets the page's OWN JavaScript hydrate from the live sheets, then
-copies the rendered values back into the static HTML. Baked numbers are therefore
-always exactly what the JS renders. The client-side JS still runs on load and
-rewrites these regions (records.html clears each tbody; upcomingpicks.html
-replaces the table body wholesale), so users continue to get live data.
+HOW: records_aggregate.py computes the same regions the pages' JavaScript
+renders, straight from the live sheet CSVs (no browser, well under a second once
+the CSVs are in). The client-side JS still runs on load and rewrites these
+regions (records.html clears each tbody; upcomingpicks.html replaces the table
+body wholesale), so users continue to get live data.
+
+Drift between the Python port and the page JS would put wrong trust-critical
+numbers in front of crawlers, so the old browser path survives as a parity
+check, run on a schedule (records-parity.yml):
+
+  --record-fixtures DIR  snapshot the live CSVs (+ ncaaf-records.html) to DIR
+  --check DIR            render both pages in headless Chromium with every
+                         sheet request served from DIR, and diff the page JS
+                         output against records_aggregate on the same data.
+                         Writes nothing; exit 1 on any difference. Both pages
+                         render at once on the shared browser_pool.py
+                         browser, with third-party requests other than the
+                         jsDelivr libraries blocked.
 
 SAFETY:
 - Writes NOTHING unless every validation passes (never publishes empty/misleading
@@ -23,80 +34,102 @@ SAFETY:
   restores from git and fails if corruption is detected.
 
 Run from repo root: python scripts/bake_seo_static_data.py
+Parity check (needs playwright + chromium):
+  python scripts/bake_seo_static_data.py --record-fixtures /tmp/records-fixtures
+  python scripts/bake_seo_static_data.py --check /tmp/records-fixtures
 """
 
-import http.server
+import argparse
+import asyncio
+import difflib
 import re
-import socketserver
 import subprocess
 import sys
-import threading
 from datetime import datetime, timezone
 from pathlib import Path
 
-from playwright.sync_api import sync_playwright
+from records_aggregate import (
+    NO_PICKS_MSG, RECORDS_STATS, RECORDS_TBODIES, aggregate, fetch_sources,
+    load_fixtures, record_fixtures,
+)
 
 ROOT = Path(__file__).resolve().parent.parent
 RECORD_RE = re.compile(r"^\d+-\d+(-\d+)?$")
-NO_PICKS_MSG = "No upcoming picks at this time. Check back soon!"
 FAIL_MARKERS = ("Could not load", "Loading Picks", "Loading...")
+# Third-party requests the pages need to render: papaparse / chart.js, and the
+# sheets themselves when no fixture router answers them.
+CAPTURE_ALLOW = (r"^https://cdn\.jsdelivr\.net/", r"^https://docs\.google\.com/")
+FIXTURE_ROUTES = re.compile(r"docs\.google\.com|ncaaf-records\.html")
 
-RECORDS_STATS = ["total-record", "win-rate", "avg-odds", "total-picks"]
-RECORDS_TBODIES = [
-    "sport-breakdown", "bet-type-breakdown", "monthly-breakdown",
-    "unit-sizing-breakdown", "teaser-breakdown", "parlay-breakdown",
-    "five-inning-breakdown", "total-bets-breakdown", "team-totals-by-sport",
-]
 
+def fixture_router(manifest, directory):
+    """page.route() handler serving every sheet CSV (cache-buster stripped)
+    and ncaaf-records.html from a fixture directory."""
+    by_url = {entry["url"]: Path(directory) / entry["file"]
+              for entry in manifest["sources"].values()}
 
-def serve_repo():
-    handler = http.server.SimpleHTTPRequestHandler
-    httpd = socketserver.TCPServer(("127.0.0.1", 0), handler, bind_and_activate=True)
-    httpd.RequestHandlerClass = type(
-        "H", (handler,), {"directory": str(ROOT), "log_message": lambda *a: None}
-    )
-    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
-    thread.start()
-    return httpd, httpd.server_address[1]
+    async def handle(route):
+        url = re.sub(r"[?&]_=\d+$", "", route.request.url)
+        if "ncaaf-records.html" in url:
+            path = Path(directory) / "ncaaf-records.html"
+            return await route.fulfill(body=path.read_bytes(), content_type="text/html")
+        if url in by_url:
+            return await route.fulfill(body=by_url[url].read_bytes(), content_type="text/csv",
+                                       headers={"Access-Control-Allow-Origin": "*"})
+        return await route.continue_()
+    return handle
 
 
-def capture(port):
-    with sync_playwright() as pw:
-        browser = pw.chromium.launch()
-        page = browser.new_page()
-
-        page.goto(f"http://127.0.0.1:{port}/records.html", wait_until="load", timeout=60000)
-        page.wait_for_function(
+async def _capture_records(pool, router):
+    async with pool.page((1280, 800)) as page:
+        if router:
+            await page.route(FIXTURE_ROUTES, router)
+        await page.goto(pool.url("records.html"), wait_until="load", timeout=60000)
+        await page.wait_for_function(
             "() => /\\d+-\\d+/.test(document.getElementById('total-record').textContent)",
             timeout=90000,
         )
-        page.wait_for_function(
+        await page.wait_for_function(
             "() => document.querySelectorAll('#sport-breakdown tr').length > 0",
             timeout=30000,
         )
-        records = {
-            "stats": {
-                sid: {
-                    "text": page.eval_on_selector(f"#{sid}", "el => el.textContent.trim()"),
-                    "class": page.eval_on_selector(f"#{sid}", "el => el.className"),
-                }
-                for sid in RECORDS_STATS
-            },
-            "tbodies": {
-                tid: page.eval_on_selector(f"#{tid}", "el => el.innerHTML.trim()")
-                for tid in RECORDS_TBODIES
-            },
-        }
-
-        page.goto(f"http://127.0.0.1:{port}/upcomingpicks.html", wait_until="load", timeout=60000)
-        page.wait_for_function(
+        stats = {}
+        for sid in RECORDS_STATS:
+            stats[sid] = {
+                "text": await page.eval_on_selector(f"#{sid}", "el => el.textContent.trim()"),
+                "class": await page.eval_on_selector(f"#{sid}", "el => el.className"),
+            }
+        tbodies = {}
+        for tid in RECORDS_TBODIES:
+            tbodies[tid] = await page.eval_on_selector(f"#{tid}", "el => el.innerHTML.trim()")
+    return {"stats": stats, "tbodies": tbodies}
+
+
+async def _capture_picks(pool, router):
+    async with pool.page((1280, 800)) as page:
+        if router:
+            await page.route(FIXTURE_ROUTES, router)
+        await page.goto(pool.url("upcomingpicks.html"), wait_until="load", timeout=60000)
+        await page.wait_for_function(
             "() => !document.getElementById('picks-table-body').textContent.includes('Loading')",
             timeout=60000,
         )
-        picks_html = page.eval_on_selector(
+        picks_html = await page.eval_on_selector(
             "#picks-table-body", "el => el.innerHTML.trim()"
         )
-        browser.close()
+    return picks_html
+
+
+def capture(router=None):
+    """Render both pages in headless Chromium (concurrently, on a local
+    server) and read back the regions the bake injects. `router` (see
+    fixture_router) replaces live sheet fetches."""
+    from browser_pool import run
+
+    async def both(pool):
+        return await asyncio.gather(_capture_records(pool, router), _capture_picks(pool, router))
+
+    records, picks_html = run(both, jobs=2, allow=CAPTURE_ALLOW)
     return records, picks_html
 
 
@@ -153,12 +186,71 @@ def esc(s):
     return s.replace("\\", r"\\")
 
 
-def main():
-    httpd, port = serve_repo()
+def static_stat_classes():
+    """Current classes of the stat divs the page JS leaves alone."""
+    content = (ROOT / "records.html").read_text(encoding="utf-8")
+    classes = {}
+    for sid in RECORDS_STATS:
+        m = re.search(rf'<div class="([^"]*)"\s+id="{sid}">', content)
+        if m:
+            classes[sid] = m.group(1)
+    return classes
+
+
+def _diff(name, expected, actual):
+    return "".join(difflib.unified_diff(
+        expected.splitlines(True), actual.splitlines(True),
+        fromfile=f"page-js/{name}", tofile=f"records_aggregate/{name}"))
+
+
+def check(directory):
+    """Diff records_aggregate against the pages' own JS on recorded fixtures."""
+    sources, ncaaf_html, manifest = load_fixtures(directory)
+    js_records, js_picks = capture(fixture_router(manifest, directory))
+    records, picks_html = aggregate(sources, ncaaf_html, static_stat_classes())
+
+    diffs = []
+    for sid in RECORDS_STATS:
+        if records["stats"][sid] != js_records["stats"][sid]:
+            diffs.append(f"#{sid}: page JS {js_records['stats'][sid]} != {records['stats'][sid]}\n")
+    for tid in RECORDS_TBODIES:
+        if records["tbodies"][tid] != js_records["tbodies"][tid]:
+            diffs.append(_diff(tid, js_records["tbodies"][tid], records["tbodies"][tid]))
+    if picks_html != js_picks:
+        diffs.append(_diff("picks-table-body", js_picks, picks_html))
+
+    recorded = manifest.get("recorded", "?")
+    if diffs:
+        print(f"RECORDS PARITY FAILED (fixtures recorded {recorded}):")
+        for d in diffs:
+            sys.stdout.write(d)
+        return 1
+    print(f"RECORDS PARITY OK (fixtures recorded {recorded}): "
+          f"total-record={records['stats']['total-record']['text']}, "
+          f"{len(RECORDS_TBODIES)} tables + upcoming picks identical to the page JS")
+    return 0
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Bake records/upcoming-picks data into static HTML.")
+    ap.add_argument("--record-fixtures", metavar="DIR",
+                    help="Snapshot the live sheet CSVs to DIR and exit.")
+    ap.add_argument("--check", metavar="DIR",
+                    help="Diff the Python aggregation against the page JS on DIR's fixtures; writes nothing.")
+    args = ap.parse_args(argv)
+
+    if args.record_fixtures:
+        manifest = record_fixtures(args.record_fixtures)
+        print(f"Recorded {len(manifest['sources'])} sheet fixtures to {args.record_fixtures}")
+        return 0
+    if args.check:
+        return check(args.check)
+
     try:
-        records, picks_html = capture(port)
-    finally:
-        httpd.shutdown()
+        records, picks_html = aggregate(fetch_sources(), stat_classes=static_stat_classes())
+    except OSError as e:
+        print(f"SEO BAKE FAILED - could not fetch sheet data, nothing written: {e}")
+        return 1
 
     errors = validate(records, picks_html)
     if errors:
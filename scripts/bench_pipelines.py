@@ -0,0 +1,618 @@
+#!/usr/bin/env python3
+"""Recorded-fixture benchmarks for the daily pipeline hot paths.
+
+There was no way to tell whether a change to one of the pipelines' inner
+loops made a run faster or slower: every path depends on live ESPN / Covers /
+Odds API responses, on universal_games.pkl on the Windows box, or on a site
+tree that changes every day. This harness freezes all three and times:
+
+  hub.process_game           handicapping_hub_production.process_game over
+                             each recorded slate, HTTP replayed
+  trends._run_combos         hub_trends_engine._run_combos for both sides of
+                             every recorded slate game
+  calendars.get_sport_pages  sync_calendars.get_sport_pages for every sport
+  validator._validate_file   BetLegendValidator._validate_file over a fixed
+                             sample of pages
+
+Fixtures live in data/cache/bench/fixtures/ and are written by --record (the
+only mode that touches the network):
+
+  http/index.json, http/*.gz  every response the hub fetched while recording,
+                              keyed by URL + params
+  hub-slates.json             per sport: the ESPN events, the odds table, the
+                              Covers ATS/O/U records and each game's trends
+                              inputs, plus the month the filters were built in
+  universal_games.pkl         the slice of universal_games.pkl for the
+                              recorded sports, same layout as the original
+  site.json                   the commit the site snapshot is taken from and
+                              the validator's page sample
+  rosters.json                the validator's MLB roster cache, if one existed
+
+A benchmark run is fully offline. Recorded responses are served through
+requests.get; a URL that was never recorded gets a 404 and is counted as a
+miss, so a stale fixture shows up in the report instead of reaching the
+network. The site snapshot is extracted from the recorded commit with
+`git archive` into a temporary directory, so page edits after recording do
+not move the numbers.
+
+Each case is set up once (untimed), run --repeat times for wall time (min and
+median), once under tracemalloc for peak memory and once under cProfile for
+call counts: all Python calls, calls of the hot path itself, and the busiest
+functions. Results are written to data/cache/bench/results/<commit>.json
+(<commit>-dirty.json for an uncommitted tree) and compared with the latest
+result of another commit, or with --baseline.
+
+Usage:
+  python scripts/bench_pipelines.py --record                # capture fixtures
+  python scripts/bench_pipelines.py --record site           # re-pin the site snapshot only
+  python scripts/bench_pipelines.py                         # run every case
+  python scripts/bench_pipelines.py --case trends --repeat 5
+  python scripts/bench_pipelines.py --baseline 8bbed47 --strict
+"""
+
+import argparse
+import contextlib
+import cProfile
+import gzip
+import hashlib
+import io
+import json
+import os
+import pickle
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+import tracemalloc
+from collections import Counter, namedtuple
+from datetime import datetime
+from urllib.parse import urlsplit
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO = os.path.dirname(SCRIPT_DIR)
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+BENCH_DIR = os.path.join(REPO, 'data', 'cache', 'bench')
+FIXTURES_DIR = os.path.join(BENCH_DIR, 'fixtures')
+HTTP_DIR = os.path.join(FIXTURES_DIR, 'http')
+RESULTS_DIR = os.path.join(BENCH_DIR, 'results')
+SLATES_PATH = os.path.join(FIXTURES_DIR, 'hub-slates.json')
+GAMES_PATH = os.path.join(FIXTURES_DIR, 'universal_games.pkl')
+SITE_PATH = os.path.join(FIXTURES_DIR, 'site.json')
+ROSTERS_PATH = os.path.join(FIXTURES_DIR, 'rosters.json')
+# Bump when a case changes what it measures; results of another version are
+# not compared.
+RESULTS_VERSION = 1
+
+# What a site snapshot contains: the top-level pages, the per-sport archives
+# and the hub archive manifest get_sport_pages reads.
+SITE_PATHSPECS = [':(glob)*.html', ':(glob)archives/**', ':(glob)scripts/*.json']
+
+RECORD_PARTS = ('site', 'hub', 'trends')
+GAMES_PER_SPORT = 4
+PAGE_SAMPLE = 100
+REPEAT = 3
+# Wall-time growth above which a case is flagged against the baseline.
+TOLERANCE = 0.10
+TOP_FUNCTIONS = 8
+
+
+def _git(*args):
+    try:
+        return subprocess.run(['git', '-C', REPO, *args], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _load_json(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_json(path, payload):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(payload, indent=1, default=str) + '\n')
+
+
+# ---------------------------------------------------------------------------
+# HTTP record / replay
+# ---------------------------------------------------------------------------
+
+def http_key(url, params=None):
+    raw = json.dumps([url, sorted((str(k), str(v)) for k, v in (params or {}).items())])
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]
+
+
+class HttpRecorder:
+    """Pass requests.get through to the network and keep every response."""
+
+    def __init__(self, root=HTTP_DIR):
+        self.root = root
+        self.index = {}
+
+    def __enter__(self):
+        import requests
+        self._requests = requests
+        self._get = requests.get
+        shutil.rmtree(self.root, ignore_errors=True)
+        os.makedirs(self.root)
+        requests.get = self.get
+        return self
+
+    def __exit__(self, *exc):
+        self._requests.get = self._get
+        _save_json(os.path.join(self.root, 'index.json'), dict(sorted(self.index.items())))
+
+    def get(self, url, params=None, **kwargs):
+        resp = self._get(url, params=params, **kwargs)
+        key = http_key(url, params)
+        with gzip.open(os.path.join(self.root, key + '.gz'), 'wb') as f:
+            f.write(resp.content)
+        self.index[key] = {'url': url, 'params': params or {}, 'status': resp.status_code,
+                           'content_type': resp.headers.get('Content-Type', ''),
+                           'encoding': resp.encoding}
+        return resp
+
+
+class HttpReplay:
+    """Serve requests.get from the recorded responses, counting requests per host."""
+
+    def __init__(self, root=HTTP_DIR):
+        self.root = root
+        self.index = _load_json(os.path.join(root, 'index.json')) or {}
+        self.bodies = {}
+        self.reset()
+
+    def reset(self):
+        self.hosts = Counter()
+        self.misses = 0
+
+    def __enter__(self):
+        import requests
+        self._requests = requests
+        self._get = requests.get
+        requests.get = self.get
+        return self
+
+    def __exit__(self, *exc):
+        self._requests.get = self._get
+
+    def get(self, url, params=None, **kwargs):
+        self.hosts[urlsplit(url).netloc] += 1
+        resp = self._requests.models.Response()
+        resp.url = url
+        key = http_key(url, params)
+        entry = self.index.get(key)
+        if entry is None:
+            self.misses += 1
+            resp.status_code = 404
+            resp._content = b''
+            return resp
+        if key not in self.bodies:
+            with gzip.open(os.path.join(self.root, key + '.gz'), 'rb') as f:
+                self.bodies[key] = f.read()
+        resp.status_code = entry['status']
+        resp._content = self.bodies[key]
+        resp.headers['Content-Type'] = entry['content_type']
+        resp.encoding = entry['encoding']
+        return resp
+
+    def report(self):
+        return {'requests': sum(self.hosts.values()), 'misses': self.misses,
+                'by_host': dict(self.hosts.most_common())}
+
+
+# ---------------------------------------------------------------------------
+# Site snapshot
+# ---------------------------------------------------------------------------
+
+_snapshots = {}
+
+
+def site_snapshot(ref):
+    """Directory holding the site as of `ref` (extracted once per run)."""
+    if ref not in _snapshots:
+        dest = tempfile.mkdtemp(prefix='bench-site-')
+        tar = subprocess.run(['git', '-C', REPO, 'archive', '--format=tar', ref, '--', *SITE_PATHSPECS],
+                             capture_output=True, check=True).stdout
+        with tarfile.open(fileobj=io.BytesIO(tar)) as archive:
+            archive.extractall(dest)
+        _snapshots[ref] = dest
+    return _snapshots[ref]
+
+
+def drop_snapshots():
+    for dest in _snapshots.values():
+        shutil.rmtree(dest, ignore_errors=True)
+    _snapshots.clear()
+
+
+# ---------------------------------------------------------------------------
+# Cases
+# ---------------------------------------------------------------------------
+
+# setup() -> state (raises Skip when a fixture is missing); run(state) -> items.
+Case = namedtuple('Case', 'name module func setup run http')
+
+
+class Skip(Exception):
+    pass
+
+
+def _need(path, what):
+    if not os.path.exists(path):
+        raise Skip(f'no {what} fixture (run --record)')
+
+
+def _slates():
+    _need(SLATES_PATH, 'hub slate')
+    return _load_json(SLATES_PATH)
+
+
+def setup_hub():
+    recorded = _slates()
+    import handicapping_hub_production as hub
+    jobs = []
+    for sport, slate in recorded['slates'].items():
+        o = slate['odds']
+        odds = hub.OddsTable(o['sport_key'], o['source'], o['columns'], o['fetched_at'])
+        for event in slate['events']:
+            jobs.append((event, sport, slate['sport_path'], odds, slate['betting_records']))
+    return hub, jobs
+
+
+def run_hub(state):
+    hub, jobs = state
+    for job in jobs:
+        hub.process_game(*job)
+    return len(jobs)
+
+
+def setup_trends():
+    recorded = _slates()
+    _need(GAMES_PATH, 'universal_games')
+    import hub_trends_engine as trends
+    trends.DATA_FILE = GAMES_PATH
+    trends._cached_games = trends._cached_sport = None
+    month = recorded['month']
+    jobs = []
+    # Mirrors _scan_game, with the month frozen at recording time.
+    for sport, slate in recorded['slates'].items():
+        games = trends._load_games(sport)
+        teams = trends.TEAM_NAMES.get(sport, {})
+        for g in slate['trends']:
+            home = teams.get(g['home_abbr'], g['home_abbr'])
+            away = teams.get(g['away_abbr'], g['away_abbr'])
+            home_rest, away_rest = g.get('home_rest', 3), g.get('away_rest', 3)
+            jobs.append(([x for x in games if x.get('HomeTeam') == home], 'home', trends._build_filters(
+                'home', home_rest, g.get('home_streak', 0), g.get('home_last_won'), g.get('home_last_gf'),
+                g.get('home_last_ga'), g['home_spread'], g['total'], g.get('home_wpct', 0.5), month,
+                opp_wpct=g.get('away_wpct', 0.5), opp_rest=away_rest, sport=sport)))
+            jobs.append(([x for x in games if x.get('AwayTeam') == away], 'away', trends._build_filters(
+                'away', away_rest, g.get('away_streak', 0), g.get('away_last_won'), g.get('away_last_gf'),
+                g.get('away_last_ga'), g['home_spread'], g['total'], g.get('away_wpct', 0.5), month,
+                opp_wpct=g.get('home_wpct', 0.5), opp_rest=home_rest, sport=sport)))
+    return trends, jobs
+
+
+def run_trends(state):
+    trends, jobs = state
+    for job in jobs:
+        trends._run_combos(*job)
+    return len(jobs)
+
+
+def _site():
+    _need(SITE_PATH, 'site')
+    return _load_json(SITE_PATH)
+
+
+def setup_calendars():
+    root = site_snapshot(_site()['ref'])
+    import sync_calendars
+    from pathlib import Path
+    sync_calendars.REPO_DIR = Path(root)
+    sync_calendars.SCRIPTS_DIR = Path(root) / 'scripts'
+    return sync_calendars
+
+
+def run_calendars(sync_calendars):
+    for config in sync_calendars.SPORTS.values():
+        sync_calendars.get_sport_pages(config)
+    return len(sync_calendars.SPORTS)
+
+
+def setup_validator():
+    site = _site()
+    root = site_snapshot(site['ref'])
+    if REPO not in sys.path:
+        sys.path.insert(0, REPO)
+    import betlegend_validator as bv
+    rosters = bv.RosterManager()
+    if os.path.exists(ROSTERS_PATH):
+        # Recorded rosters never expire.
+        bv.Config.ROSTER_CACHE_FILE, bv.Config.ROSTER_CACHE_HOURS = ROSTERS_PATH, 10 ** 7
+        rosters.loaded = rosters._load_cache()
+    return bv, root, rosters, [os.path.join(root, p) for p in site['pages']]
+
+
+def run_validator(state):
+    bv, root, rosters, pages = state
+    validator = bv.BetLegendValidator(root, specific_files=pages)
+    validator.roster_manager = rosters
+    for page in pages:
+        validator._validate_file(page)
+    return len(pages)
+
+
+CASES = [
+    Case('hub.process_game', 'handicapping_hub_production.py', 'process_game', setup_hub, run_hub, True),
+    Case('trends._run_combos', 'hub_trends_engine.py', '_run_combos', setup_trends, run_trends, False),
+    Case('calendars.get_sport_pages', 'sync_calendars.py', 'get_sport_pages', setup_calendars, run_calendars, False),
+    Case('validator._validate_file', 'betlegend_validator.py', '_validate_file', setup_validator, run_validator, False),
+]
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+def _calls(profile, case):
+    stats = {}
+    profile.create_stats()
+    for (filename, _, func), (_, ncalls, _, _, _) in profile.stats.items():
+        label = f'{os.path.basename(filename)}:{func}' if filename != '~' else func
+        stats[label] = stats.get(label, 0) + ncalls
+    top = dict(sorted(stats.items(), key=lambda kv: -kv[1])[:TOP_FUNCTIONS])
+    return {'total': sum(stats.values()), 'hot_path': stats.get(f'{case.module}:{case.func}', 0), 'top': top}
+
+
+def measure(case, repeat):
+    with open(os.devnull, 'w') as null, contextlib.redirect_stdout(null), contextlib.ExitStack() as stack:
+        try:
+            replay = stack.enter_context(HttpReplay()) if case.http else None
+            state = case.setup()
+        except Skip as e:
+            return {'status': 'skipped', 'note': str(e)}
+        except ImportError as e:
+            return {'status': 'skipped', 'note': f'import failed: {e}'}
+
+        walls = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            items = case.run(state)
+            walls.append(time.perf_counter() - start)
+
+        tracemalloc.start()
+        case.run(state)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        if replay:
+            replay.reset()
+        profile = cProfile.Profile()
+        profile.enable()
+        case.run(state)
+        profile.disable()
+
+    result = {'status': 'ok', 'items': items,
+              'wall_s': {'min': round(min(walls), 4), 'median': round(statistics.median(walls), 4),
+                         'runs': [round(w, 4) for w in walls]},
+              'peak_kb': peak // 1024,
+              'calls': _calls(profile, case)}
+    if replay:
+        result['http'] = replay.report()
+    return result
+
+
+def current_commit():
+    sha = _git('rev-parse', 'HEAD') or 'unknown'
+    dirty = bool(_git('status', '--porcelain', '--untracked-files=no'))
+    return sha, dirty
+
+
+def results_path(sha, dirty):
+    return os.path.join(RESULTS_DIR, sha[:12] + ('-dirty' if dirty else '') + '.json')
+
+
+def find_baseline(ref, current):
+    """Results to compare against: `ref`'s, else the newest of another commit."""
+    if ref:
+        sha = _git('rev-parse', ref)
+        return _load_json(results_path(sha, False)) if sha else None
+    best = None
+    for name in os.listdir(RESULTS_DIR) if os.path.isdir(RESULTS_DIR) else []:
+        res = _load_json(os.path.join(RESULTS_DIR, name))
+        if (not res or res.get('version') != RESULTS_VERSION or res.get('dirty')
+                or res.get('commit') == current):
+            continue
+        if best is None or res['recorded_at'] > best['recorded_at']:
+            best = res
+    return best
+
+
+def _delta(now, base):
+    if not base:
+        return ''
+    return f'{(now - base) / base * 100:+.1f}%'
+
+
+def compare(results, baseline, tolerance):
+    """Print the change per case; returns the names of regressed cases."""
+    print(f"  [bench] vs {baseline['commit'][:12]} ({baseline['recorded_at']})")
+    regressed = []
+    for name, now in results['cases'].items():
+        base = baseline['cases'].get(name)
+        if now['status'] != 'ok' or not base or base['status'] != 'ok':
+            continue
+        wall, base_wall = now['wall_s']['min'], base['wall_s']['min']
+        flag = ''
+        if (base_wall and (wall - base_wall) / base_wall > tolerance) or now['calls']['total'] > base['calls']['total']:
+            regressed.append(name)
+            flag = '  REGRESSION'
+        print(f'  [bench]   {name:28s} wall {_delta(wall, base_wall):>8s}  peak '
+              f"{_delta(now['peak_kb'], base['peak_kb']):>8s}  calls "
+              f"{_delta(now['calls']['total'], base['calls']['total']):>8s}{flag}")
+    return regressed
+
+
+def run(names, repeat):
+    sha, dirty = current_commit()
+    site = _load_json(SITE_PATH) or {}
+    results = {'version': RESULTS_VERSION, 'commit': sha, 'dirty': dirty,
+               'recorded_at': datetime.now().isoformat(timespec='seconds'),
+               'python': platform.python_version(), 'platform': platform.platform(),
+               'repeat': repeat,
+               'fixtures': {'site_ref': site.get('ref'),
+                            'http_responses': len(_load_json(os.path.join(HTTP_DIR, 'index.json')) or {})},
+               'cases': {}}
+    try:
+        for case in CASES:
+            if names and not any(case.name.startswith(n) for n in names):
+                continue
+            res = results['cases'][case.name] = measure(case, repeat)
+            if res['status'] != 'ok':
+                print(f"  [bench] {case.name:28s} skipped: {res['note']}")
+                continue
+            line = (f"  [bench] {case.name:28s} {res['items']:5d} items  wall {res['wall_s']['min']:8.3f}s "
+                    f"(median {res['wall_s']['median']:.3f}s)  peak {res['peak_kb']:9,d} KB  "
+                    f"calls {res['calls']['total']:11,d}")
+            if 'http' in res:
+                line += f"  http {res['http']['requests']} ({res['http']['misses']} missed)"
+            print(line)
+    finally:
+        drop_snapshots()
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Recording
+# ---------------------------------------------------------------------------
+
+def record_site(page_sample):
+    ref = _git('rev-parse', 'HEAD')
+    pages = sorted(p for p in _git('ls-tree', '--name-only', ref).splitlines() if p.endswith('.html'))
+    step = max(1, len(pages) // page_sample)
+    _save_json(SITE_PATH, {'ref': ref, 'pages': pages[::step][:page_sample]})
+    print(f'  [record] site snapshot pinned to {ref[:12]}, {min(page_sample, len(pages))} validator pages')
+
+    if REPO not in sys.path:
+        sys.path.insert(0, REPO)
+    from betlegend_validator import Config
+    if os.path.exists(Config.ROSTER_CACHE_FILE):
+        shutil.copyfile(Config.ROSTER_CACHE_FILE, ROSTERS_PATH)
+        print(f'  [record] rosters from {Config.ROSTER_CACHE_FILE}')
+    else:
+        print(f'  [record] no roster cache at {Config.ROSTER_CACHE_FILE}; validator runs without rosters')
+
+
+def record_hub(games_per_sport):
+    import handicapping_hub_production as hub
+    slates = {}
+    with HttpRecorder() as recorder:
+        for sport, config in hub.SPORTS.items():
+            events = hub.fetch_espn_scoreboard(config['espn_path'])
+            if not events:
+                continue
+            odds = hub.fetch_odds(config['odds_key'])
+            betting = hub.fetch_covers_betting_records(sport)
+            picked, inputs = [], []
+            # Same slate filters as main().
+            for event in events:
+                if len(picked) >= games_per_sport:
+                    break
+                if hub.is_exhibition_game(event):
+                    continue
+                if sport == 'NCAAB' and not hub.is_important_ncaab_game(
+                        event, hub.has_valid_odds(hub.match_game_odds(event, odds))):
+                    continue
+                if sport == 'NCAAF' and not hub.is_bowl_game(event):
+                    continue
+                game = hub.process_game(event, sport, config['espn_path'], odds, betting)
+                if game:
+                    picked.append(event)
+                    inputs.append(hub._game_trends_inputs(game))
+            if picked:
+                slates[sport] = {'sport_path': config['espn_path'], 'events': picked,
+                                 'odds': {'sport_key': odds.sport_key, 'source': odds.source,
+                                          'columns': odds.columns, 'fetched_at': odds.fetched_at},
+                                 'betting_records': betting, 'trends': inputs}
+    _save_json(SLATES_PATH, {'recorded_at': datetime.now().isoformat(timespec='seconds'),
+                             'month': datetime.now().month, 'slates': slates})
+    print(f'  [record] {sum(len(s["events"]) for s in slates.values())} games across '
+          f'{len(slates)} sport(s), {len(recorder.index)} HTTP responses')
+
+
+def record_trends():
+    recorded = _slates()
+    import hub_trends_engine as trends
+    with open(trends.DATA_FILE, 'rb') as f:
+        data = pickle.load(f)
+    sports = set(recorded['slates'])
+    games = [g for g in data[0] if g.get('Sport') in sports]
+    with open(GAMES_PATH, 'wb') as f:
+        pickle.dump([games], f, protocol=pickle.HIGHEST_PROTOCOL)
+    print(f'  [record] {len(games):,} historical games for {", ".join(sorted(sports))}')
+
+
+def record(parts, games_per_sport, page_sample):
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    steps = {'site': lambda: record_site(page_sample),
+             'hub': lambda: record_hub(games_per_sport),
+             'trends': record_trends}
+    failed = 0
+    for part in RECORD_PARTS:
+        if part not in parts:
+            continue
+        try:
+            steps[part]()
+        except (Skip, ImportError, OSError) as e:
+            failed += 1
+            print(f'  [record] {part} not recorded: {e}')
+    return 1 if failed else 0
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Benchmark the daily pipeline hot paths against recorded fixtures.')
+    ap.add_argument('--record', nargs='?', const=','.join(RECORD_PARTS), metavar='PARTS',
+                    help=f'Capture fixtures instead of benchmarking (default: {",".join(RECORD_PARTS)}).')
+    ap.add_argument('--games-per-sport', type=int, default=GAMES_PER_SPORT,
+                    help='Games recorded per sport slate.')
+    ap.add_argument('--pages', type=int, default=PAGE_SAMPLE, help='Pages in the validator sample.')
+    ap.add_argument('--case', action='append', help='Only cases whose name starts with this (repeatable).')
+    ap.add_argument('--repeat', type=int, default=REPEAT, help='Timed runs per case.')
+    ap.add_argument('--baseline', help='Commit whose results to compare with.')
+    ap.add_argument('--tolerance', type=float, default=TOLERANCE,
+                    help='Wall-time growth flagged as a regression (fraction).')
+    ap.add_argument('--strict', action='store_true', help='Exit 1 when a case regressed.')
+    ap.add_argument('--no-save', action='store_true', help='Do not write the results file.')
+    args = ap.parse_args(argv)
+
+    if args.record:
+        return record(set(args.record.split(',')), args.games_per_sport, args.pages)
+
+    results = run(args.case, max(1, args.repeat))
+    if not args.no_save:
+        path = results_path(results['commit'], results['dirty'])
+        _save_json(path, results)
+        print(f'  [bench] results -> {os.path.relpath(path, REPO)}')
+    baseline = find_baseline(args.baseline, results['commit'])
+    if baseline is None:
+        print('  [bench] no baseline results to compare with')
+        return 0
+    regressed = compare(results, baseline, args.tolerance)
+    return 1 if regressed and args.strict else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+One shared headless Chromium for the visual audits.
+
+audit_image_centering.py, screenshot_preview_pages and the records parity
+check in bake_seo_static_data.py each launched their own browser and walked
+their pages one at a time, so a full-site visual audit took as long as the sum
+of every page load. BrowserPool keeps one browser alive and hands out pages,
+up to `jobs` at a time (default one per core), so audits written as
+coroutines and run with asyncio.gather load pages concurrently. Each page
+gets a fresh browser context, so cookies, localStorage and sessionStorage set
+by one page (the calendar's 'showing latest' flag, a consent banner) never
+change how the next one renders.
+
+Local audits are served by a threaded static server on 127.0.0.1 rooted at
+the repo, so root-relative links resolve as they do on GitHub Pages (file://
+broke them). Requests for www.betlegendpicks.com are answered from the
+working tree. Third-party images, fonts, stylesheets and media load as usual
+(the audits measure them); third-party scripts, frames and beacons are
+aborted unless they match an `allow` pattern, such as the CDN script a page
+cannot render without, and known trackers are always aborted. Pages render
+faster and the same way on every run. Live pages are not routed at all: they
+load exactly as a visitor's browser loads them.
+
+Screenshots of local pages are cached under data/cache/screenshots/, keyed by
+the sha1 of the page bytes, the local CSS, JS and images it references, the
+URLs of the remote images it shows, the runtime data its scripts fetch (a
+calendar script's data/calendar/<sport>/*.json) and the shot options
+(viewport, selector, full page). A page that has not changed is copied from
+the cache without being loaded. Live pages are always rendered.
+
+Needs playwright + chromium (pip install playwright; python -m playwright
+install chromium).
+
+Usage:
+  from browser_pool import BrowserPool, run
+
+  async def audit(pool):
+      async with pool.page((1440, 900)) as page:
+          await page.goto(pool.url('index.html'))
+          ...
+  run(audit)                       # or: async with BrowserPool() as pool
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import http.server
+import json
+import os
+import re
+import shutil
+import sys
+import threading
+from contextlib import asynccontextmanager
+from urllib.parse import unquote, urlsplit
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO = os.path.dirname(SCRIPT_DIR)
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+CACHE_DIR = os.path.join(REPO, 'data', 'cache', 'screenshots')
+# Bump when the shot settings below change (old entries are then missed).
+CACHE_VERSION = 2
+LIVE_BASE = 'https://www.betlegendpicks.com/'
+SITE_HOSTS = {'www.betlegendpicks.com', 'betlegendpicks.com'}
+
+ASSET_RE = re.compile(r'''(?:src|href)\s*=\s*["']([^"'#?]+\.(?:css|js|png|jpe?g|webp|gif|svg|avif))(?:\?[^"']*)?["']''', re.I)
+REMOTE_IMG_RE = re.compile(r'''<img\b[^>]*?\s(?:data-)?src\s*=\s*["']((?:https?:)?//[^"']+)["']''', re.I)
+# Where a script's runtime data lives (the per-sport calendar config).
+DATA_BASE_RE = re.compile(r'''"dataBase":\s*"/?([^"]+)"''')
+
+# Third-party requests of these types pass on local pages; the rest (script,
+# xhr, fetch, document, ping ...) need an `allow` match.
+PASS_TYPES = {'image', 'font', 'stylesheet', 'media'}
+TRACKER_RE = re.compile(r'''^https?://(?:[^/]*\.)?(?:google-analytics\.com|googletagmanager\.com|doubleclick\.net|'''
+                        r'''googlesyndication\.com|googleadservices\.com|facebook\.(?:com|net)|bat\.bing\.com|'''
+                        r'''clarity\.ms|hotjar\.com|scorecardresearch\.com|quantserve\.com)/''', re.I)
+
+
+# =============================================================================
+# LOCAL SERVER
+# =============================================================================
+
+class _QuietHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+class _QuietServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        pass    # the browser dropped a connection (aborted load, closed page)
+
+
+def serve_repo():
+    """Serve the repo on 127.0.0.1 from a background thread; returns (server, port)."""
+    handler = functools.partial(_QuietHandler, directory=REPO)
+    httpd = _QuietServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd, httpd.server_address[1]
+
+
+# =============================================================================
+# SCREENSHOT CACHE
+# =============================================================================
+
+def _local_assets(rel, text):
+    """Repo paths of the local stylesheets, scripts and images a page references."""
+    base = os.path.dirname(rel)
+    for ref in ASSET_RE.findall(text):
+        if '//' in ref or ref.startswith(('data:', 'http')):
+            continue
+        path = ref.lstrip('/') if ref.startswith('/') else os.path.join(base, ref)
+        yield os.path.normpath(unquote(path))
+
+
+def _runtime_data(script):
+    """Repo paths of the JSON a local script fetches at runtime."""
+    base = DATA_BASE_RE.search(script)
+    if not base:
+        return []
+    root = os.path.join(REPO, os.path.normpath(base.group(1)))
+    try:
+        names = os.listdir(root)
+    except OSError:
+        return []
+    return [os.path.relpath(os.path.join(root, n), REPO) for n in names if n.endswith('.json')]
+
+
+def content_key(rel, *parts):
+    """Cache key for a shot of local page `rel`, or None if it is missing."""
+    try:
+        with open(os.path.join(REPO, rel), 'rb') as f:
+            raw = f.read()
+    except OSError:
+        return None
+    text = raw.decode('utf-8', 'replace')
+    files = sorted(set(_local_assets(rel, text)))
+    bodies = {}
+    for asset in files:
+        try:
+            with open(os.path.join(REPO, asset), 'rb') as f:
+                bodies[asset] = f.read()
+        except OSError:
+            continue
+        if asset.endswith('.js'):
+            files.extend(sorted(set(_runtime_data(bodies[asset].decode('utf-8', 'replace'))) - set(files)))
+    h = hashlib.sha1(raw)
+    for asset, body in bodies.items():
+        h.update(asset.encode() + b'\0' + hashlib.sha1(body).digest())
+    h.update(json.dumps([CACHE_VERSION, rel, sorted(set(REMOTE_IMG_RE.findall(text))), *parts],
+                        default=str).encode())
+    return h.hexdigest()
+
+
+def cache_get(key, out_path):
+    """The stored record for `key`, with its PNG copied to `out_path`; None on a miss."""
+    if key is None:
+        return None
+    png = os.path.join(CACHE_DIR, key + '.png')
+    try:
+        with open(os.path.join(CACHE_DIR, key + '.json'), encoding='utf-8') as f:
+            record = json.load(f)
+        os.makedirs(os.path.dirname(os.path.abspath(out_path)), exist_ok=True)
+        shutil.copyfile(png, out_path)
+    except (OSError, ValueError):
+        return None
+    record['cached'] = True
+    return record
+
+
+def cache_put(key, record, png_path):
+    if key is None:
+        return
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        shutil.copyfile(png_path, os.path.join(CACHE_DIR, key + '.png'))
+        tmp = os.path.join(CACHE_DIR, key + '.json.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(record, f)
+        os.replace(tmp, os.path.join(CACHE_DIR, key + '.json'))
+    except OSError:
+        pass
+
+
+# =============================================================================
+# POOL
+# =============================================================================
+
+class BrowserPool:
+    """One Chromium, up to `jobs` concurrent pages, each in a fresh context.
+
+    `base` None serves the working tree locally; otherwise pages load from
+    that URL (e.g. LIVE_BASE), unrouted. `allow` is a list of regexes for
+    third-party scripts and other requests a local page may load anyway.
+    """
+
+    def __init__(self, jobs=None, base=None, allow=()):
+        self.jobs = max(1, jobs or os.cpu_count() or 1)
+        self.local = base is None
+        self.base = base
+        self.allow = [re.compile(a) for a in allow]
+        self._httpd = None
+        self._pw = None
+        self._browser = None
+        self._slots = None
+        self._contexts = set()
+
+    async def __aenter__(self):
+        from playwright.async_api import async_playwright
+        if self.local:
+            self._httpd, port = serve_repo()
+            self.base = f'http://127.0.0.1:{port}/'
+        self._origin = '{0.scheme}://{0.netloc}'.format(urlsplit(self.base))
+        self._slots = asyncio.Semaphore(self.jobs)
+        self._pw = await async_playwright().start()
+        self._browser = await self._pw.chromium.launch()
+        return self
+
+    async def __aexit__(self, *exc):
+        for ctx in list(self._contexts):
+            try:
+                await ctx.close()
+            except Exception:
+                pass
+        if self._browser:
+            await self._browser.close()
+        if self._pw:
+            await self._pw.stop()
+        if self._httpd:
+            self._httpd.shutdown()
+
+    def url(self, rel):
+        return self.base + rel.lstrip('/')
+
+    async def _route(self, route):
+        url = route.request.url
+        parts = urlsplit(url)
+        if url.startswith(self._origin) or parts.scheme in ('data', 'blob'):
+            return await route.continue_()
+        if parts.netloc.lower() in SITE_HOSTS:
+            path = os.path.join(REPO, unquote(parts.path).lstrip('/') or 'index.html')
+            if os.path.isdir(path):
+                path = os.path.join(path, 'index.html')
+            if os.path.isfile(path):
+                return await route.fulfill(path=path)
+            return await route.fulfill(status=404, body='')
+        if TRACKER_RE.search(url):
+            return await route.abort('blockedbyclient')
+        if route.request.resource_type in PASS_TYPES or any(a.search(url) for a in self.allow):
+            return await route.continue_()
+        return await route.abort('blockedbyclient')
+
+    @asynccontextmanager
+    async def page(self, viewport):
+        """A page at `viewport` (width, height) for the duration of the block.
+
+        The page lives in its own context, closed when the block exits.
+        """
+        async with self._slots:
+            ctx = await self._browser.new_context(
+                viewport={'width': viewport[0], 'height': viewport[1]}, device_scale_factor=1)
+            self._contexts.add(ctx)
+            try:
+                if self.local:
+                    await ctx.route('**/*', self._route)
+                yield await ctx.new_page()
+            finally:
+                self._contexts.discard(ctx)
+                await ctx.close()
+
+    async def screenshot(self, rel, viewport, path, selector=None, full_page=False,
+                         wait_until='load', settle_ms=0, timeout=45000):
+        """Shoot `rel` (or its first `selector` match) at `viewport` to `path`.
+
+        Local shots come from the cache when the page is unchanged. Returns a
+        record with status OK, NOT_FOUND (selector matched nothing) or ERROR:...
+        """
+        key = content_key(rel, tuple(viewport), selector, full_page) if self.local else None
+        record = cache_get(key, path)
+        if record is not None:
+            return record
+        record = {'page': rel, 'viewport': list(viewport), 'file': os.path.basename(path)}
+        try:
+            async with self.page(viewport) as page:
+                await page.goto(self.url(rel), wait_until=wait_until, timeout=timeout)
+                if settle_ms:
+                    await page.wait_for_timeout(settle_ms)
+                os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+                if selector:
+                    el = await page.query_selector(selector)
+                    if el is None:
+                        record['status'] = 'NOT_FOUND'
+                        return record
+                    await el.scroll_into_view_if_needed(timeout=5000)
+                    await el.screenshot(path=path)
+                else:
+                    await page.screenshot(path=path, full_page=full_page)
+        except Exception as e:
+            record['status'] = error_status(e)
+            return record
+        record['status'] = 'OK'
+        cache_put(key, record, path)
+        return record
+
+
+def error_status(e):
+    """The status recorded for an audit that raised `e`."""
+    first = str(e).splitlines()[0] if str(e) else ''
+    return f'ERROR:{type(e).__name__}:{first[:80]}'
+
+
+def run(audit, **pool_options):
+    """Run coroutine function `audit(pool)` on a fresh pool; returns its result."""
+    async def main():
+        async with BrowserPool(**pool_options) as pool:
+            return await audit(pool)
+    return asyncio.run(main())
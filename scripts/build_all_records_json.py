@@ -9,8 +9,13 @@ picks only - the full MLB history lives in mlb-records.json. Neither
 source alone is complete, so we merge both, HTML wins on conflict because
 it's fresher.
 
-Output is deduped on (Sport, Date, Pick, Odds), sorted newest-first, and
-written to all-records.json for betlegend-verified-records.html.
+Both are parsed with the picks ledger's parsers (scripts/picks_ledger.py).
+Output is deduped on (Sport, Date, Pick, Odds) with the odds exactly as
+written, so every row the records pages show is in all-records.json: a pick
+listed twice with '105' and '+105' stays two rows, as on ncaaf-records.html.
+The ledger itself keys picks on date + pick only, which is why its rows are
+not used here. Output is sorted newest-first and written to all-records.json
+for betlegend-verified-records.html.
 
 Run standalone, or from sync_records_from_tracker.py:
     python scripts/build_all_records_json.py
@@ -21,37 +26,15 @@ import os
 import re
 from datetime import datetime
 
+from picks_ledger import RECORDS_FILES, archive_rows, html_table_rows, read_text
+
 REPO_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
-SPORTS = [
-    ('MLB',    'mlb-records.html',    'mlb-records.json'),
-    ('NHL',    'nhl-records.html',    'nhl-records.json'),
-    ('NFL',    'nfl-records.html',    'nfl-records.json'),
-    ('NBA',    'nba-records.html',    'nba-records.json'),
-    ('NCAAF',  'ncaaf-records.html',  'ncaaf-records.json'),
-    ('NCAAB',  'ncaab-records.html',  'ncaab-records.json'),
-    ('Soccer', 'soccer-records.html', 'soccer-records.json'),
-]
+# Output order within a date; files are picks_ledger.RECORDS_FILES.
+SPORTS = ['MLB', 'NHL', 'NFL', 'NBA', 'NCAAF', 'NCAAB', 'Soccer']
 
 OUTPUT_FILE = 'all-records.json'
 
-ROW_RE = re.compile(
-    r'<tr>\s*'
-    r'<td>([^<]+)</td>\s*'       # Date
-    r'<td>([^<]+)</td>\s*'       # Pick
-    r'<td>([^<]*)</td>\s*'       # Line / Odds
-    r'<td[^>]*>([^<]*)</td>\s*'  # Result
-    r'<td[^>]*>([^<]*)</td>\s*'  # Units (profit/loss)
-    r'</tr>',
-    re.IGNORECASE,
-)
-
-TBODY_RE = re.compile(
-    r'<tbody id="picks-table-body">(.*?)</tbody>',
-    re.IGNORECASE | re.DOTALL,
-)
-
-
 def normalize_date(s):
     s = (s or '').strip()
     for fmt in ('%m-%d-%Y', '%m/%d/%Y', '%Y-%m-%d', '%m-%d-%y', '%m/%d/%y'):
@@ -75,95 +58,52 @@ def parse_date_sort_key(s):
 
 def pick_key(row):
     return (
-        (row.get('Sport') or '').strip().lower(),
-        normalize_date(row.get('Date') or ''),
-        (row.get('Picks') or row.get('Pick') or '').strip().lower(),
-        (row.get('Odds') or row.get('Line') or '').strip(),
+        row['Sport'].strip().lower(),
+        row['Date'],
+        row['Picks'].strip().lower(),
+        row['Odds'].strip(),
     )
 
 
-def extract_html_rows(html, sport):
-    m = TBODY_RE.search(html)
-    if not m:
-        return []
-    body = m.group(1)
-    out = []
-    for date, pick, odds, result, units in ROW_RE.findall(body):
-        result = (result or '').strip().upper()
-        if result and result[0] in ('W', 'L', 'P'):
-            result = result[0]
-        else:
-            result = ''
-        units = (units or '').replace('+', '').strip()
-        out.append({
-            'Sport': sport,
-            'League': '',
-            'Date': normalize_date(date),
-            'Picks': pick.strip(),
-            'Odds': odds.strip(),
-            'Units': '',
-            'Result': result,
-            'ProfitLoss': units,
-            'GradedAt': '',
-        })
-    return out
-
-
-def load_json_rows(path, sport):
-    if not os.path.exists(path):
-        return []
-    with open(path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    out = []
-    for r in data:
-        row = {
-            'Sport': r.get('Sport') or sport,
-            'League': r.get('League', ''),
-            'Date': normalize_date(r.get('Date', '')),
-            'Picks': (r.get('Picks') or r.get('Pick') or '').strip(),
-            'Odds': (r.get('Odds') or r.get('Line') or '').strip(),
-            'Units': r.get('Units', ''),
-            'Result': (r.get('Result') or '').strip().upper()[:1],
-            'ProfitLoss': (r.get('ProfitLoss') or '').replace('+', '').strip(),
-            'GradedAt': r.get('GradedAt', ''),
-        }
-        if row['Result'] not in ('W', 'L', 'P'):
-            row['Result'] = ''
-        out.append(row)
-    return out
+def record_row(pick, sport):
+    """A parsed records-page or archive pick as an all-records.json row."""
+    extra = json.loads(pick['extra'])
+    return {
+        'Sport': sport,
+        'League': extra.get('League', ''),
+        'Date': normalize_date(pick['date']),
+        'Picks': pick['pick'],
+        'Odds': pick['line'],
+        'Units': extra.get('Units', ''),
+        'Result': pick['result'],
+        'ProfitLoss': pick['units_text'].replace('+', '').strip(),
+        'GradedAt': extra.get('GradedAt', ''),
+    }
 
 
 def main():
     merged = {}  # key -> row. HTML loaded last so it wins conflicts.
 
-    json_total = 0
-    html_total = 0
-
-    for sport, html_file, json_file in SPORTS:
-        j = load_json_rows(os.path.join(REPO_PATH, json_file), sport)
+    for sport in SPORTS:
+        html_file, json_file = RECORDS_FILES[sport]
         json_added = 0
-        for row in j:
+        for pick in archive_rows(read_text(os.path.join(REPO_PATH, json_file))):
+            row = record_row(pick, sport)
             k = pick_key(row)
             if k not in merged:
                 merged[k] = row
                 json_added += 1
-        json_total += json_added
 
-        html_path = os.path.join(REPO_PATH, html_file)
-        html_rows = []
-        if os.path.exists(html_path):
-            with open(html_path, 'r', encoding='utf-8', errors='ignore') as f:
-                html_rows = extract_html_rows(f.read(), sport)
         html_added = 0
         html_overwritten = 0
-        for row in html_rows:
+        for pick in html_table_rows(read_text(os.path.join(REPO_PATH, html_file))):
+            row = record_row(pick, sport)
             k = pick_key(row)
             if k in merged:
                 html_overwritten += 1
             else:
                 html_added += 1
             merged[k] = row  # HTML wins
-        html_total += html_added
 
         print(f"  {sport:6s} | JSON +{json_added:4d} | HTML +{html_added:4d} new, "
               f"{html_overwritten:4d} overwrote")
@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""Responsive image derivatives for images/.
+
+Pages reference the full-size originals in images/ directly. A 1200x675 PNG
+hero is 1-2MB, and a phone rendering it in a 390px-wide card downloads every
+byte of it. This stage builds width-bucketed WebP (and AVIF, when the local
+Pillow can encode it) copies of each referenced image and rewrites the <img>
+tags on the hot pages to offer them through srcset/sizes.
+
+How it stays cheap to re-run:
+  - Derivative filenames carry a hash of the ORIGINAL's bytes, so a replaced
+    original gets new URLs (no stale CDN/browser cache) and an unchanged one
+    keeps the URLs it already has.
+  - images/derived/manifest.json records the hash and variant list per
+    original. An original whose hash matches and whose variant files all exist
+    is skipped without being decoded.
+  - Derivatives are never upscaled: an 800px original gets 480w + 768w + its
+    own 800w, not a blown-up 1200w.
+
+`src` becomes the largest WebP derivative, so no browser fetches the
+oversized original (WebP covers every browser the site supports). The original
+path moves to `data-original`: validators that check the approved image
+manifest read it from there, and re-runs rebuild from it. width/height are
+only added to tags that already sit in an inline aspect-ratio box; elsewhere
+they could change the layout of existing pages.
+
+Homepage pick cards are rendered client-side from homepage-picks-data.js, so
+the same mapping is written to image-derivatives-data.js and read by
+homepage-image-system.js (BetLegendImages.srcsetFor).
+
+Usage:
+  python scripts/build_image_derivatives.py                 # build + rewrite hot pages
+  python scripts/build_image_derivatives.py --no-rewrite    # derivatives only
+  python scripts/build_image_derivatives.py --pages index.html mlb-previews.html
+  python scripts/build_image_derivatives.py --check         # exit 1 if anything is stale
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import html
+import json
+import re
+import sys
+from pathlib import Path
+
+try:
+    from PIL import Image, features
+except ImportError:  # pragma: no cover - local dev may not have pillow
+    Image = None
+    features = None
+
+ROOT = Path(__file__).resolve().parents[1]
+IMAGES = ROOT / "images"
+DERIVED = IMAGES / "derived"
+MANIFEST = DERIVED / "manifest.json"
+PICKS = ROOT / "homepage-picks-data.js"
+SRCSET_JS = ROOT / "image-derivatives-data.js"
+
+# Card slots top out at ~1200 CSS px on desktop; 480/768 cover phones and
+# tablets at 1x-2x DPR.
+WIDTHS = (480, 768, 1200)
+WEBP_QUALITY = 80
+AVIF_QUALITY = 55
+SOURCE_EXTS = {".jpg", ".jpeg", ".png", ".webp"}
+# Bump when encoder settings change so every derivative is rebuilt once.
+PIPELINE_VERSION = "1"
+
+DEFAULT_SIZES = "(max-width: 640px) 100vw, (max-width: 1100px) 50vw, 400px"
+
+# Pages regenerated daily that carry the heaviest image payloads.
+HOT_PAGE_GLOBS = (
+    "index.html",
+    "handicapping-hub.html",
+    "*-previews.html",
+    "*-game-previews.html",
+)
+
+IMG_TAG_RE = re.compile(r"<img\b[^>]*>", re.I)
+SRC_RE = re.compile(r"""\bsrc\s*=\s*(["'])(?P<src>[^"']+)\1""", re.I)
+ORIGINAL_RE = re.compile(r"""\bdata-original\s*=\s*(["'])(?P<src>[^"']+)\1""", re.I)
+# A real width attribute (not data-width=, max-width: in a style).
+WIDTH_ATTR_RE = re.compile(r"""(?<![\w:-])width\s*=""", re.I)
+ASPECT_BOX_RE = re.compile(r"""\bstyle\s*=\s*(["'])[^"']*aspect-ratio""", re.I)
+ATTR_RE = r"""\s+{name}\s*=\s*(["'])[^"']*\1"""
+PICTURE_RE = re.compile(
+    r"<picture data-derived>\s*(?:<source\b[^>]*>\s*)*(?P<img><img\b[^>]*>)\s*</picture>",
+    re.I,
+)
+PICK_IMAGE_RE = re.compile(r"""image:\s*"(?P<src>images/[^"]+)\"""")
+
+
+def content_hash(path: Path) -> str:
+    digest = hashlib.sha1()
+    digest.update(PIPELINE_VERSION.encode())
+    with path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:10]
+
+
+def avif_supported() -> bool:
+    if features is None:
+        return False
+    try:
+        return bool(features.check("avif"))
+    except (ValueError, AttributeError):
+        return False
+
+
+def load_manifest() -> dict:
+    if MANIFEST.exists():
+        try:
+            return json.loads(MANIFEST.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            pass
+    return {"version": PIPELINE_VERSION, "images": {}}
+
+
+def save_manifest(manifest: dict) -> None:
+    DERIVED.mkdir(parents=True, exist_ok=True)
+    manifest["version"] = PIPELINE_VERSION
+    manifest["images"] = dict(sorted(manifest["images"].items()))
+    MANIFEST.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+
+
+def normalize_src(src: str) -> str | None:
+    """Return the repo-relative images/ path for a local src, else None."""
+    src = src.split("?", 1)[0].split("#", 1)[0].strip()
+    if src.startswith("/"):
+        src = src[1:]
+    if not src.startswith("images/") or src.startswith("images/derived/"):
+        return None
+    if Path(src).suffix.lower() not in SOURCE_EXTS:
+        return None
+    return src
+
+
+def target_widths(width: int) -> list[int]:
+    widths = [w for w in WIDTHS if w < width]
+    widths.append(min(width, WIDTHS[-1]))
+    return sorted(set(widths))
+
+
+def entry_is_current(entry: dict | None, digest: str) -> bool:
+    if not entry or entry.get("hash") != digest:
+        return False
+    return all((ROOT / variant["path"]).exists() for variant in entry.get("variants", []))
+
+
+def build_entry(src: str, digest: str, use_avif: bool) -> dict:
+    path = ROOT / src
+    base = derived_base(src)
+    base.parent.mkdir(parents=True, exist_ok=True)
+    variants: list[dict] = []
+    with Image.open(path) as image:
+        image.load()
+        width, height = image.size
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+        for target in target_widths(width):
+            scaled = image if target == width else image.resize(
+                (target, max(1, round(height * target / width))), Image.LANCZOS
+            )
+            formats = [("webp", {"quality": WEBP_QUALITY, "method": 6})]
+            if use_avif:
+                formats.append(("avif", {"quality": AVIF_QUALITY}))
+            for fmt, options in formats:
+                rel = f"{base.relative_to(ROOT).as_posix()}-{target}w-{digest}.{fmt}"
+                scaled.save(ROOT / rel, format=fmt.upper(), **options)
+                variants.append({"w": target, "format": fmt, "path": rel, "bytes": (ROOT / rel).stat().st_size})
+    return {
+        "hash": digest,
+        "width": width,
+        "height": height,
+        "bytes": path.stat().st_size,
+        "variants": variants,
+    }
+
+
+def derived_base(src: str) -> Path:
+    """images/a/b.png -> images/derived/a/b-png (extension kept: b.png and b.webp both exist)."""
+    rel = Path(src).relative_to("images")
+    return DERIVED / rel.parent / f"{rel.stem}-{rel.suffix.lstrip('.').lower()}"
+
+
+def prune_stale(src: str, keep: dict) -> None:
+    """Remove derivatives of `src` left behind by an older content hash."""
+    base = derived_base(src)
+    wanted = {Path(v["path"]).name for v in keep.get("variants", [])}
+    pattern = re.compile(rf"{re.escape(base.name)}-\d+w-[0-9a-f]{{10}}\.(webp|avif)")
+    for old in base.parent.glob(f"{base.name}-*w-*.*"):
+        if old.name not in wanted and pattern.fullmatch(old.name):
+            old.unlink()
+
+
+def ensure_derivatives(sources: list[str], manifest: dict, check_only: bool = False) -> tuple[int, int, list[str]]:
+    """Build missing/stale derivatives. Returns (built, skipped, stale)."""
+    use_avif = avif_supported()
+    built = skipped = 0
+    stale: list[str] = []
+    images = manifest.setdefault("images", {})
+    for src in sources:
+        path = ROOT / src
+        if not path.exists():
+            continue
+        digest = content_hash(path)
+        if entry_is_current(images.get(src), digest):
+            skipped += 1
+            continue
+        stale.append(src)
+        if check_only:
+            continue
+        try:
+            images[src] = build_entry(src, digest, use_avif)
+        except (OSError, ValueError) as exc:
+            print(f"  [derive] skip {src}: {exc}")
+            continue
+        prune_stale(src, images[src])
+        built += 1
+    return built, skipped, stale
+
+
+def original_src(tag: str) -> str | None:
+    """The images/ original an <img> shows (data-original once rewritten)."""
+    match = ORIGINAL_RE.search(tag) or SRC_RE.search(tag)
+    return normalize_src(html.unescape(match.group("src"))) if match else None
+
+
+def largest(entry: dict, fmt: str = "webp") -> str | None:
+    variants = [v for v in entry["variants"] if v["format"] == fmt]
+    return max(variants, key=lambda v: v["w"])["path"] if variants else None
+
+
+def srcset_for(entry: dict, fmt: str) -> str:
+    return ", ".join(
+        f"{v['path']} {v['w']}w" for v in sorted(entry["variants"], key=lambda v: v["w"]) if v["format"] == fmt
+    )
+
+
+def _set_attr(tag: str, name: str, value: str) -> str:
+    attr = f' {name}="{html.escape(value, quote=True)}"'
+    pattern = re.compile(ATTR_RE.format(name=name), re.I)
+    if pattern.search(tag):
+        return pattern.sub(lambda _: attr, tag, count=1)
+    close = "/>" if tag.endswith("/>") else ">"
+    body = tag[: -len(close)].rstrip()
+    return f"{body}{attr}{close}"
+
+
+def rewrite_img(tag: str, manifest: dict) -> str:
+    src = original_src(tag)
+    entry = manifest["images"].get(src) if src else None
+    if not entry or not entry.get("variants"):
+        return tag
+    webp = srcset_for(entry, "webp")
+    if not webp:
+        return tag
+    if not ORIGINAL_RE.search(tag):
+        # Keep the original right after src so attribute order (src before alt) holds.
+        tag = SRC_RE.sub(lambda m: f'{m.group(0)} data-original="{html.escape(src, quote=True)}"', tag, count=1)
+    tag = SRC_RE.sub(lambda m: f'src="{largest(entry)}"', tag, count=1)
+    sizes_match = re.search(r"""\bsizes\s*=\s*(["'])(?P<v>[^"']*)\1""", tag, re.I)
+    sizes = sizes_match.group("v") if sizes_match else DEFAULT_SIZES
+    out = _set_attr(tag, "srcset", webp)
+    # srcset wins over src, so an onerror fallback must drop it to take effect.
+    if "this.src=" in out and "removeAttribute('srcset')" not in out:
+        out = out.replace("this.src=", "this.removeAttribute('srcset');this.src=", 1)
+    out = _set_attr(out, "sizes", sizes)
+    if not WIDTH_ATTR_RE.search(out) and ASPECT_BOX_RE.search(out):
+        out = _set_attr(out, "width", str(entry["width"]))
+        out = _set_attr(out, "height", str(entry["height"]))
+    avif = srcset_for(entry, "avif")
+    if avif:
+        return (
+            f'<picture data-derived><source type="image/avif" srcset="{avif}" sizes="{html.escape(sizes, quote=True)}">'
+            f"{out}</picture>"
+        )
+    return out
+
+
+def rewrite_html(text: str, manifest: dict) -> str:
+    # Unwrap pictures from earlier runs first so hashes refresh in place.
+    text = PICTURE_RE.sub(lambda m: m.group("img"), text)
+    return IMG_TAG_RE.sub(lambda m: rewrite_img(m.group(0), manifest), text)
+
+
+def hot_pages(explicit: list[str] | None) -> list[Path]:
+    if explicit:
+        return [ROOT / p for p in explicit if (ROOT / p).exists()]
+    seen: dict[Path, None] = {}
+    for pattern in HOT_PAGE_GLOBS:
+        for path in sorted(ROOT.glob(pattern)):
+            seen.setdefault(path, None)
+    return list(seen)
+
+
+def referenced_sources(pages: list[Path]) -> list[str]:
+    found: dict[str, None] = {}
+    for page in pages:
+        text = page.read_text(encoding="utf-8", errors="ignore")
+        for tag in IMG_TAG_RE.findall(text):
+            src = original_src(tag)
+            if src:
+                found.setdefault(src, None)
+    if PICKS.exists():
+        for match in PICK_IMAGE_RE.finditer(PICKS.read_text(encoding="utf-8")):
+            src = normalize_src(match.group("src"))
+            if src:
+                found.setdefault(src, None)
+    return list(found)
+
+
+def write_srcset_js(manifest: dict, sources: list[str]) -> bool:
+    data = {}
+    for src in sorted(sources):
+        entry = manifest["images"].get(src)
+        if not entry:
+            continue
+        item = {"src": largest(entry), "webp": srcset_for(entry, "webp")}
+        avif = srcset_for(entry, "avif")
+        if avif:
+            item["avif"] = avif
+        if item["webp"]:
+            data[src] = item
+    text = (
+        "// Generated by scripts/build_image_derivatives.py - do not edit by hand.\n"
+        "// Maps an original images/ path to its WebP src and responsive WebP/AVIF srcset.\n"
+        f"window.BETLEGEND_IMAGE_SRCSET = {json.dumps(data, indent=1, sort_keys=True)};\n"
+    )
+    if SRCSET_JS.exists() and SRCSET_JS.read_text(encoding="utf-8") == text:
+        return False
+    SRCSET_JS.write_text(text, encoding="utf-8")
+    return True
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--pages", nargs="*", help="Pages to rewrite (default: hub, previews, homepage).")
+    parser.add_argument("--all-images", action="store_true", help="Derive every image under images/, not only referenced ones.")
+    parser.add_argument("--no-rewrite", action="store_true", help="Build derivatives without touching HTML.")
+    parser.add_argument("--check", action="store_true", help="Report stale derivatives and exit 1 if any; writes nothing.")
+    args = parser.parse_args()
+
+    if Image is None:
+        print("  [derive] Pillow is not installed - nothing to do (pip install pillow)")
+        return 1 if args.check else 0
+
+    pages = hot_pages(args.pages)
+    if args.all_images:
+        sources = sorted(
+            p.relative_to(ROOT).as_posix()
+            for p in IMAGES.rglob("*")
+            if p.suffix.lower() in SOURCE_EXTS and DERIVED not in p.parents
+        )
+    else:
+        sources = referenced_sources(pages)
+
+    manifest = load_manifest()
+    if manifest.get("version") != PIPELINE_VERSION:
+        manifest = {"version": PIPELINE_VERSION, "images": {}}
+
+    built, skipped, stale = ensure_derivatives(sources, manifest, check_only=args.check)
+    if args.check:
+        for src in stale:
+            print(f"  [derive] stale: {src}")
+        print(f"  [derive] {len(stale)} stale, {skipped} current")
+        return 1 if stale else 0
+
+    save_manifest(manifest)
+    print(f"  [derive] {built} image(s) built, {skipped} up to date ({len(sources)} referenced)")
+
+    if write_srcset_js(manifest, sources):
+        print(f"  [derive] wrote {SRCSET_JS.name}")
+
+    if args.no_rewrite:
+        return 0
+    changed = 0
+    for page in pages:
+        # newline="" keeps CRLF pages CRLF.
+        with page.open(encoding="utf-8", errors="ignore", newline="") as fh:
+            text = fh.read()
+        updated = rewrite_html(text, manifest)
+        if updated != text:
+            with page.open("w", encoding="utf-8", newline="") as fh:
+                fh.write(updated)
+            changed += 1
+    print(f"  [derive] {changed} page(s) rewritten ({len(pages)} scanned)")
+
+    referenced = [manifest["images"][s] for s in sources if s in manifest["images"]]
+    original = sum(e["bytes"] for e in referenced)
+    smallest = sum(min((v["bytes"] for v in e["variants"]), default=e["bytes"]) for e in referenced)
+    if original:
+        print(f"  [derive] mobile payload for referenced images: {original / 1e6:.1f}MB -> {smallest / 1e6:.1f}MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,9 +7,10 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from mlb_prop_ledger import DAILY_CARD, TRACKER_FIELDS, TRACKER_PATH, PropLedger
+
 
 DESKTOP_ROOT = Path.home() / "Desktop" / "MLB_Props"
-TRACKER_PATH = DESKTOP_ROOT / "MLB_DAILY_PROP_TRACKER.csv"
 
 FIRST_INNING_MIN_EDGE = 0.02
 FIRST_INNING_MIN_EV = 0.03
@@ -214,46 +215,22 @@ def write_outputs(target_date: str, official: list[dict[str, Any]], candidates:
 def append_tracker(rows: list[dict[str, Any]]) -> None:
     if not rows:
         return
-    TRACKER_PATH.parent.mkdir(parents=True, exist_ok=True)
-    fields = [
-        "date",
-        "family",
-        "status",
-        "game",
-        "market",
-        "selection",
-        "line",
-        "book",
-        "odds",
-        "model_prob",
-        "market_prob",
-        "edge",
-        "ev",
-        "result",
-        "units_risked",
-        "units_won",
-        "notes",
-        "created_at",
-    ]
-    existing_keys: set[tuple[str, str, str, str, str]] = set()
-    if TRACKER_PATH.exists():
-        with TRACKER_PATH.open("r", newline="", encoding="utf-8") as f:
-            for row in csv.DictReader(f):
-                existing_keys.add((row["date"], row["family"], row["game"], row["market"], row["selection"]))
-    with TRACKER_PATH.open("a", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fields)
-        if TRACKER_PATH.stat().st_size == 0:
-            writer.writeheader()
-        for row in rows:
-            key = (str(row["date"]), row["family"], row["game"], row["market"], row["selection"])
-            if key in existing_keys:
-                continue
-            out = {field: row.get(field, "") for field in fields}
-            out["result"] = "PENDING"
-            out["units_risked"] = 1.0
-            out["units_won"] = ""
-            out["created_at"] = datetime.now().isoformat()
-            writer.writerow(out)
+    now = datetime.now().isoformat()
+    tracked = []
+    for row in rows:
+        out = {field: row.get(field, "") for field in TRACKER_FIELDS}
+        out["date"] = str(row["date"])
+        out["result"] = "PENDING"
+        out["units_risked"] = 1.0
+        out["units_won"] = ""
+        out["created_at"] = now
+        tracked.append(out)
+    with PropLedger() as ledger:
+        ledger.import_csv(DAILY_CARD, TRACKER_PATH)
+        if ledger.csv_diverged(DAILY_CARD, TRACKER_PATH):
+            print(f"WARNING: {TRACKER_PATH} was edited outside the ledger; appending anyway "
+                  f"(run scripts/mlb_prop_ledger.py --adopt-csv to keep the edits)")
+        ledger.append_csv(DAILY_CARD, TRACKER_PATH, ledger.upsert(DAILY_CARD, tracked))
 
 
 def main() -> int:
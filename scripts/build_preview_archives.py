@@ -18,6 +18,7 @@ keys that no longer exist on disk) to their dateless targets.
 Idempotent: sections are delimited by BEGIN/END comment markers.
 """
 import os, re, json, html as htmllib
+from calendar_shards import read_calendar_js
 
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 MAP_PATH = os.path.join(ROOT, 'scripts', 'date_strip_rename_map.json')
@@ -109,7 +110,7 @@ def main():
         cal = os.path.join(ROOT, 'scripts', f'{key}-calendar.js')
         if not os.path.exists(cal):
             continue
-        entries = ENTRY_RE.findall(read(cal))
+        entries = ENTRY_RE.findall(read_calendar_js(cal))
         if not entries:
             continue
         by_month = {}
@@ -13,6 +13,7 @@ data files miss (title + FORCED_PAGE_DATE read from the file).
 Regenerated on every publish by sync_homepage_crawl_links.py so it stays current.
 """
 import re, os, glob, datetime
+from calendar_shards import read_calendar_js
 
 ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 OUT = os.path.join(ROOT, "complete-archive.html")
@@ -59,7 +60,7 @@ def from_data():
     for src in [os.path.join(ROOT, "featured-games-data.js")] + glob.glob(os.path.join(SCRIPTS, "*-calendar.js")):
         if not os.path.exists(src):
             continue
-        for m in re.finditer(r'date:\s*"([0-9]{4}-[0-9]{2}-[0-9]{2})"\s*,\s*page:\s*"([^"]+\.html)"\s*,\s*title:\s*"((?:[^"\\]|\\.)*)"', read(src)):
+        for m in re.finditer(r'date:\s*"([0-9]{4}-[0-9]{2}-[0-9]{2})"\s*,\s*page:\s*"([^"]+\.html)"\s*,\s*title:\s*"((?:[^"\\]|\\.)*)"', read_calendar_js(src)):
             d, pg, tt = m.group(1), m.group(2), m.group(3).replace('\\"', '"')
             pages.setdefault(pg, {"title": tt, "date": d})
     return pages
@@ -0,0 +1,387 @@
+// BetLegend Sport Calendar Runtime (shared by scripts/<sport>-calendar.js)
+// Auto-generated by sync_calendars.py - DO NOT EDIT MANUALLY
+(function () {
+const CFG = window.BL_SPORT_CALENDAR;
+if (!CFG) return;
+
+const SPORT_HUB_PAGE = CFG.hubPage || '';
+const SPORT_LABEL = CFG.label;
+const MAIN_PAGES = CFG.mainPages;
+const MONTH_INDEX = CFG.months || {};
+const PAGE_INDEX = CFG.pages || {};
+// Must match calendar_shards.PAGE_BUCKETS / page_bucket().
+const PAGE_BUCKETS = 16;
+
+function isConcreteContentPage(page) {
+    // Pick pages use their own template (no archive calendar sidebar); a stale
+    // hub must never redirect to one as the day's board (soccer hub, June 3 2026).
+    // Featured-game (*-analysis-stats-preview) pages load featured-games-calendar.js
+    // (the all-sports marquee calendar) and have their own Featured hub; a SPORT hub
+    // must never redirect to one, or it swaps in the featured calendar and drops
+    // sport-only dates (MLB June 4 went blank when the MLB hub redirected there, June 22 2026).
+    // The combined season 'picks-predictions-analysis-<month>-<year>' pages are blog/Pick
+    // Archive indexes, not a day's preview; a hub must not redirect to one (NCAAB July 7 2026).
+    return !!page && !MAIN_PAGES.includes(page) && !page.includes('#') && !page.includes('-archive-') && !/-analysis-stats-preview\.html$/.test(page) && !/-picks?(?:-v\d+)?\.html$/.test(page) && !/picks-predictions-analysis-[a-z]+-\d{4}\.html$/.test(page);
+}
+const latestContentEntry = CFG.latestContent || null;
+const latestConcreteEntry = CFG.latestConcrete || null;
+window.LATEST_CONTENT_PAGE = latestConcreteEntry ? latestConcreteEntry.page : (latestContentEntry ? latestContentEntry.page : null);
+
+// ---- shard loading: one JSON file per month, fetched on demand and memoised ----
+// The sync run's own month is inlined (CFG.current), so the hub redirect and
+// the highlight of a recent article never wait on a fetch.
+const INLINE_MONTH = CFG.current || null;
+const shardCache = {};
+if (INLINE_MONTH) shardCache[INLINE_MONTH.month] = Promise.resolve(INLINE_MONTH.entries);
+function inlineEntries(yearMonth) {
+    return INLINE_MONTH && INLINE_MONTH.month === yearMonth ? INLINE_MONTH.entries : null;
+}
+function loadJSON(name, version) {
+    if (!shardCache[name]) {
+        shardCache[name] = fetch(CFG.dataBase + name + '.json?v=' + version)
+            .then(r => (r.ok ? r.json() : null))
+            .catch(() => null);
+    }
+    return shardCache[name];
+}
+function loadMonth(yearMonth) {
+    const meta = MONTH_INDEX[yearMonth];
+    if (!meta) return Promise.resolve([]);
+    return loadJSON(yearMonth, meta.v).then(rows => rows || []);
+}
+function shiftMonth(yearMonth, delta) {
+    const [y, m] = yearMonth.split('-').map(Number);
+    const d = new Date(y, m - 1 + delta, 1);
+    return d.getFullYear() + '-' + String(d.getMonth() + 1).padStart(2, '0');
+}
+function prefetchNeighbours(yearMonth) {
+    [-1, 1].forEach(delta => { const ym = shiftMonth(yearMonth, delta); if (MONTH_INDEX[ym]) loadMonth(ym); });
+}
+function pageBucket(page) {
+    let h = 0x811c9dc5;
+    for (let i = 0; i < page.length; i++) h = Math.imul(h ^ page.charCodeAt(i), 0x01000193) >>> 0;
+    return h % PAGE_BUCKETS;
+}
+function lookupPageDate(page) {
+    const b = String(pageBucket(page));
+    if (!PAGE_INDEX[b]) return Promise.resolve(null);
+    return loadJSON('pages-' + b, PAGE_INDEX[b]).then(map => (map && map[page]) || null);
+}
+
+function getLocalDateString(date) {
+    const parts = new Intl.DateTimeFormat('en-US', {
+        timeZone: 'America/Los_Angeles',
+        year: 'numeric',
+        month: '2-digit',
+        day: '2-digit'
+    }).formatToParts(date).reduce((acc, part) => {
+        acc[part.type] = part.value;
+        return acc;
+    }, {});
+    return parts.year + '-' + parts.month + '-' + parts.day;
+}
+
+// Current real date is separate from the active article/page date.
+const todayStr = getLocalDateString(new Date());
+
+const todayMonth = todayStr.substring(0, 7);
+
+// Handle both root pages and archive pages
+const pathname = window.location.pathname;
+let currentPage;
+if (pathname.includes('/archives/')) {
+    // For archive pages, get the full relative path from archives/
+    currentPage = pathname.replace(/^\//, '');
+} else {
+    // For root pages, just get the filename
+    currentPage = pathname.split('/').pop() || 'index.html';
+}
+
+const isMainPage = MAIN_PAGES.includes(currentPage);
+const forcedDate = window.FORCED_PAGE_DATE || null;
+// Hub/main pages never get a current-page "Article" highlight, even if a
+// stale window.FORCED_PAGE_DATE is left in the hub HTML. Pages without a baked
+// date take theirs from the inlined month, else from the page-bucket shard
+// before the first render.
+let currentPageDate = null;
+function knownArticleDate() {
+    // undefined = not known without a shard lookup
+    if (isMainPage) return null;
+    if (forcedDate) return forcedDate;
+    // Last match, as in the page-bucket map (last write wins).
+    const inline = INLINE_MONTH ? INLINE_MONTH.entries.filter(item => item.page === currentPage).pop() : null;
+    return inline ? inline.date : undefined;
+}
+
+const months = new Set(Object.keys(MONTH_INDEX));
+// Always include the current month so the hub calendar can point at today.
+months.add(todayMonth);
+
+// Main/hub pages show today's month; archive pages show their month
+const sortedMonths = Array.from(months).sort().reverse();
+const monthNames = ['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September', 'October', 'November', 'December'];
+
+function installCalendarStateStyles() {
+    if (document.getElementById('mlb-calendar-state-styles')) return;
+    const style = document.createElement('style');
+    style.id = 'mlb-calendar-state-styles';
+    style.textContent = `
+.calendar-days .cal-day,.calendar-grid .calendar-day{position:relative}
+.calendar-days .cal-day.is-linked,.calendar-days .cal-day.has-content{cursor:pointer;background:rgba(0,229,255,.15);color:#00e5ff;font-weight:700;border:1px solid rgba(0,229,255,.32)}
+.calendar-days .cal-day.is-linked:hover,.calendar-days .cal-day.has-content:hover{background:rgba(0,229,255,.25);box-shadow:0 0 12px rgba(0,229,255,.28)}
+.calendar-days .cal-day.is-disabled{opacity:.82}
+.calendar-days .cal-day.is-past:not(.current-page):not(.today){color:#9aa3af}
+.calendar-days .cal-day.is-future:not(.current-page):not(.today){color:#c7ced8}
+.calendar-days .cal-day.today{border:2px solid #ffd54f!important;box-shadow:0 0 0 1px rgba(255,213,79,.34),0 0 12px rgba(255,213,79,.28)!important}
+.calendar-days .cal-day.current-page{background:rgba(0,229,255,.72)!important;color:#fff!important;border:2px solid #00e5ff!important;font-weight:900!important;box-shadow:0 0 12px rgba(0,229,255,.45)!important}
+.calendar-days .cal-day.today.current-page{background:linear-gradient(135deg,rgba(0,229,255,.72),rgba(255,213,79,.42))!important;border-color:#ffd54f!important}
+`;
+    document.head.appendChild(style);
+}
+
+function navigateToCalendarPage(page) {
+    if (page) window.location.href = '/' + page;
+}
+
+// Multi-post dates go straight to that day's main slate/preview page (no chooser popup).
+// Falls back to the first/newest post if no slate-style page is found.
+function pickPrimaryPostForDate(postsForDate) {
+    const slate = postsForDate.find(item => {
+        const t = (item.title || '').toLowerCase();
+        const p = (item.page || '').toLowerCase();
+        return /\banalysis\b|\bpreview\b|\bslate\b|\bboard\b|\bfull card\b/.test(t)
+            || /-game-|-slate-|-board-|-previews|full-card/.test(p);
+    });
+    return slate || postsForDate[0];
+}
+
+// Popup chooser fully removed (Nima): clicking a date opens the page directly.
+
+let renderToken = 0;
+function renderCalendar(yearMonth) {
+    const token = ++renderToken;
+    prefetchNeighbours(yearMonth);
+    const inline = inlineEntries(yearMonth);
+    if (inline) return renderMonth(yearMonth, inline);
+    return loadMonth(yearMonth).then(entries => {
+        // A newer month was picked while this shard was in flight.
+        if (token === renderToken) renderMonth(yearMonth, entries);
+    });
+}
+
+function renderMonth(yearMonth, entries) {
+    const [year, month] = yearMonth.split('-').map(Number);
+    const yearEl = document.getElementById('cal-year') || document.querySelector('.year-display');
+    if (yearEl) yearEl.textContent = year;
+    const firstDay = new Date(year, month - 1, 1).getDay();
+    const daysInMonth = new Date(year, month, 0).getDate();
+    const container = document.getElementById('calendar-days') || document.getElementById('calendarDays');
+    if (!container) return;
+    container.innerHTML = '';
+    for (let i = 0; i < firstDay; i++) { const cell = document.createElement('div'); cell.className = 'cal-day empty'; container.appendChild(cell); }
+    for (let d = 1; d <= daysInMonth; d++) {
+        const dateStr = year + '-' + String(month).padStart(2, '0') + '-' + String(d).padStart(2, '0');
+        const postsForDate = entries.filter(item => item.date === dateStr && item.page);
+        const hasData = postsForDate.length > 0 ? postsForDate[0] : null;
+        let classes = 'cal-day';
+        if (dateStr === currentPageDate) classes += ' current-page';
+        // NO 'today' marker (Nima, June 24 2026): the calendar highlights ONLY the
+        // date of the article being viewed (current-page). A separate gold 'today'
+        // cell was a wrong second highlight - on out-of-season sports (NHL/NBA) it lit
+        // a day with no article, and it fought the article's own date. Removed for good.
+        if (hasData) classes += ' has-content is-linked';
+        else classes += ' is-disabled';
+        if (dateStr < todayStr) classes += ' is-past';
+        if (dateStr > todayStr) classes += ' is-future';
+        const cell = document.createElement('div');
+        cell.className = classes;
+        if (!cell.dataset) cell.dataset = {};
+        cell.dataset.date = dateStr;
+        cell.dataset.currentDate = todayStr;
+        if (dateStr === currentPageDate) cell.dataset.activeArticleDate = currentPageDate;
+        if (hasData) cell.dataset.linked = 'true';
+        cell.textContent = d;
+        if (hasData) {
+            cell.title = postsForDate.map(item => item.title).join('\n');
+            cell.onclick = () => {
+                if (postsForDate.length === 1) navigateToCalendarPage(hasData.page);
+                else navigateToCalendarPage(pickPrimaryPostForDate(postsForDate).page);
+            };
+        }
+        container.appendChild(cell);
+    }
+}
+
+// Hub guard: a `*-previews.html` hub page bakes in the last published dated
+// slate/article. When that baked article is out of date (its FORCED_PAGE_DATE
+// is not today), it must not be presented as the current board. If a current/
+// upcoming concrete preview exists we redirect to it. Otherwise the baked
+// board STAYS VISIBLE (STALE_GUARD_BANNER_20260606, Nima June 6 2026: a
+// near-empty hub is worse for visitors and Googlebot than a clearly-dated
+// older board) and is labeled with its real date plus a link to the latest
+// available preview. It is never presented as today\u2019s board. No fabricated data.
+function renderPreviewHub(todayHasData) {
+    if (currentPage !== SPORT_HUB_PAGE || !SPORT_HUB_PAGE) return;
+    const baked = window.FORCED_PAGE_DATE || null;
+    // ALWAYS-LATEST HUB (Nima, July 7 2026): the nav "<Sport> Preview" link must land
+    // on the most recent published preview for that sport - NEVER a stale/offseason
+    // archive landing screen. Leave the hub as-is ONLY when today actually has a fresh
+    // concrete board (in-season daily slate baked in). Otherwise - offseason, a hand-
+    // built archive page with no FORCED_PAGE_DATE, or an in-season gap/off-day - fall
+    // through and redirect to the newest published concrete preview below. Keyed on real
+    // content presence (todayHasData), not on whether a baked date happens to exist, so
+    // a dead offseason archive page (e.g. college-basketball-previews.html in July) can
+    // never be the primary click target while published previews exist.
+    if (todayHasData) return;
+    // UNIFIED STALE-HUB POLICY (Nima, June 1 2026): redirect to the newest
+    // valid concrete preview so stale baked content can never stand in as
+    // today\u2019s board. Strip the stale articles first (belt-and-suspenders
+    // with the pre-paint head guard). Clean empty-state below is the fallback
+    // when no concrete entry exists. Same policy as the Featured Game hub.
+    // FALLBACK-TO-LATEST (Nima, June 16 2026): redirect to the newest published
+    // preview for this sport whenever today has none. Prefer a current/upcoming
+    // preview; otherwise load the most recent past one rather than showing an
+    // empty/near-empty board. Only a sport with zero concrete entries falls
+    // through to the labeled state below. Flag past-dated loads so the target
+    // can show a subtle "latest available" note.
+    const _latest = latestConcreteEntry || latestContentEntry || null;
+    if (_latest && _latest.page && _latest.page !== currentPage && _latest.page !== SPORT_HUB_PAGE) {
+        const _m = document.querySelector('.main-content');
+        if (_m) _m.querySelectorAll('.game-preview').forEach(function(el){ el.remove(); });
+        if (_latest.date < todayStr) { try { sessionStorage.setItem('bl_showing_latest', '1'); } catch (e) {} }
+        window.location.replace('/' + _latest.page);
+        return;
+    }
+    const main = document.querySelector('.main-content');
+    if (!main) return;
+
+    const hero = document.querySelector('header.hero');
+    if (hero) {
+        const badge = hero.querySelector('.hero-badge');
+        const h1 = hero.querySelector('h1');
+        const p = hero.querySelector('p');
+        if (badge) badge.textContent = SPORT_LABEL + ' Previews';
+        if (h1) h1.textContent = SPORT_LABEL + ' Game Preview Archive';
+        if (p) p.textContent = 'Browse the latest ' + SPORT_LABEL + ' previews and the full dated archive below. This page does not present older previews as today\u2019s board.';
+    }
+
+    // STALE_GUARD_BANNER_20260606: keep the baked articles visible - only label them.
+    const latest = latestConcreteEntry || latestContentEntry || null;
+    const block = document.createElement('div');
+    block.id = 'hub-state';
+    let html = '';
+    if (baked && !document.getElementById('board-date-note')) {
+        const bakedLabel = new Date(baked + 'T12:00:00').toLocaleDateString('en-US', { weekday: 'long', month: 'long', day: 'numeric', year: 'numeric' });
+        html += '<div style="text-align:center;padding:20px 24px;background:linear-gradient(145deg,#14171f,#0f1218);border:1px solid rgba(255,213,79,0.3);border-radius:12px;margin-bottom:24px;">'
+              + '<p style="font-size:12px;font-weight:700;letter-spacing:2px;text-transform:uppercase;color:#ffd54f;margin-bottom:8px;">Board From</p>'
+              + '<p style="font-size:18px;color:#fff;margin:0;">' + bakedLabel + '</p>'
+              + '</div>';
+    }
+    if (latest && latest.page !== SPORT_HUB_PAGE) {
+        const d = new Date(latest.date + 'T12:00:00').toLocaleDateString('en-US', { weekday: 'long', month: 'long', day: 'numeric', year: 'numeric' });
+        html += '<a href="/' + latest.page + '" style="display:block;text-decoration:none;background:linear-gradient(145deg,#14171f,#0f1218);border:1px solid rgba(255,213,79,0.3);border-radius:12px;padding:28px 32px;">'
+              + '<p style="font-size:12px;font-weight:700;letter-spacing:2px;text-transform:uppercase;color:#fd5000;margin-bottom:10px;">Latest ' + SPORT_LABEL + ' Preview</p>'
+              + '<p style="font-family:Orbitron,sans-serif;font-size:22px;color:#fff;margin:0 0 8px;line-height:1.25;">' + latest.title + '</p>'
+              + '<p style="color:#b0b8c4;font-size:14px;margin:0;">' + d + ' &nbsp;&rarr;</p>'
+              + '</a>';
+    }
+    block.innerHTML = html;
+    const mobile = main.querySelector('.mobile-archive');
+    if (mobile && mobile.nextSibling) main.insertBefore(block, mobile.nextSibling);
+    else if (mobile) main.appendChild(block);
+    else main.insertBefore(block, main.firstChild);
+}
+
+// Mobile archive select: the shown month's posts, then one "jump" option per
+// other month that swaps that month's posts in when chosen.
+function renderMobileSelect(mobileSelect, yearMonth) {
+    return loadMonth(yearMonth).then(entries => {
+        mobileSelect.innerHTML = '<option value="">Select a date...</option>';
+        entries.forEach(item => {
+            const opt = document.createElement('option');
+            opt.value = item.page;
+            const dateObj = new Date(item.date + 'T12:00:00');
+            const dateLabel = dateObj.toLocaleDateString('en-US', { weekday: 'short', month: 'short', day: 'numeric' });
+            opt.textContent = dateLabel + ' - ' + item.title;
+            if (item.page === currentPage) opt.selected = true;
+            mobileSelect.appendChild(opt);
+        });
+        sortedMonths.forEach(m => {
+            if (m === yearMonth || !MONTH_INDEX[m]) return;
+            const [year, month] = m.split('-');
+            const opt = document.createElement('option');
+            opt.value = '#month:' + m;
+            opt.textContent = '\u2192 ' + monthNames[parseInt(month) - 1] + ' ' + year + ' (' + MONTH_INDEX[m].n + ')';
+            mobileSelect.appendChild(opt);
+        });
+    });
+}
+
+function initSportCalendar() {
+
+    installCalendarStateStyles();
+    const hubCheck = entries => renderPreviewHub(entries.some(item => item.date === todayStr && isConcreteContentPage(item.page)));
+    // Decided synchronously from the inlined month; only a page baked in an
+    // earlier month than the visitor's today falls back to the shard.
+    const todayEntries = inlineEntries(todayMonth);
+    if (todayEntries) hubCheck(todayEntries);
+    else loadMonth(todayMonth).then(hubCheck);
+
+    const known = knownArticleDate();
+    if (known !== undefined) startCalendar(known);
+    else lookupPageDate(currentPage).then(startCalendar);
+
+    function startCalendar(activeArticleDate) {
+        currentPageDate = activeArticleDate;
+        // Dated preview pages should open on the article month; undated hubs open on the current month.
+        const displayMonth = activeArticleDate ? activeArticleDate.substring(0, 7) : (isMainPage ? todayMonth : sortedMonths[0]);
+
+        const monthSelect = document.getElementById('month-select') || document.getElementById('monthSelect');
+        if (monthSelect) {
+            monthSelect.innerHTML = '';
+            sortedMonths.forEach(m => {
+                const [year, month] = m.split('-');
+                const opt = document.createElement('option');
+                opt.value = m;
+                opt.textContent = monthNames[parseInt(month) - 1] + ' ' + year;
+                if (m === displayMonth) opt.selected = true;
+                monthSelect.appendChild(opt);
+            });
+            monthSelect.addEventListener('change', function() { renderCalendar(this.value); });
+        }
+        renderCalendar(displayMonth);
+        const mobileSelect = document.getElementById('mobile-archive-select') || document.getElementById('mobileArchiveSelect');
+        if (mobileSelect) {
+            renderMobileSelect(mobileSelect, displayMonth);
+            mobileSelect.addEventListener('change', (e) => {
+                const v = e.target.value;
+                if (v.indexOf('#month:') === 0) renderMobileSelect(mobileSelect, v.slice(7));
+                else if (v) window.location.href = '/' + v;
+            });
+        }
+    }
+}
+
+if (document.readyState === 'loading') { document.addEventListener('DOMContentLoaded', initSportCalendar); } else { initSportCalendar(); }
+
+/* SHOWING-LATEST NOTE (Nima, June 16 2026): when a hub fell back to the most
+   recent published item (no entry for today), show a subtle one-line note on the
+   destination article. Flag is set by the hub before redirect; cleared after use. */
+(function showLatestAvailableNote() {
+    function run() {
+        var flag;
+        try { flag = sessionStorage.getItem('bl_showing_latest'); } catch (e) { return; }
+        if (!flag) return;
+        try { sessionStorage.removeItem('bl_showing_latest'); } catch (e) {}
+        if (document.getElementById('bl-latest-note')) return;
+        var host = document.querySelector('.main-content') || document.querySelector('.page-wrapper') || document.body;
+        if (!host) return;
+        var note = document.createElement('div');
+        note.id = 'bl-latest-note';
+        note.setAttribute('style', 'max-width:900px;margin:90px auto 0;padding:10px 16px;border:1px solid rgba(0,229,255,0.3);border-radius:10px;background:rgba(0,229,255,0.06);color:#9fe9f5;font-size:13px;line-height:1.5;text-align:center;font-family:Inter,system-ui,sans-serif;');
+        note.textContent = 'Showing the latest available preview. No new post has been published for today yet.';
+        host.insertBefore(note, host.firstChild);
+    }
+    if (document.readyState === 'loading') { document.addEventListener('DOMContentLoaded', run); } else { run(); }
+})();
+})();
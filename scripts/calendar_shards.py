@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Month-sharded sport calendar data.
+
+scripts/<sport>-calendar.js used to inline the sport's ENTIRE archive as one
+ARCHIVE_DATA array plus ~300 lines of calendar engine, so every article page
+downloaded and parsed the whole history (mlb-calendar.js was ~70KB and growing
+daily). sync_calendars.py now splits that into:
+
+  scripts/calendar-runtime.js            one shared engine, cached across sports
+  scripts/<sport>-calendar.js            tiny per-sport index (months, latest
+                                         entries, shard versions) that loads
+                                         the runtime
+  data/calendar/<sport>/<YYYY-MM>.json   that month's entries, ARCHIVE_DATA order
+  data/calendar/<sport>/pages-<n>.json   page -> date, bucketed by page name, for
+                                         pages without a baked FORCED_PAGE_DATE
+  data/calendar/<sport>/index.json       the same index, for tooling
+
+The runtime fetches only the visible month (prefetching its neighbours), so
+page weight stays flat as the archive grows.
+
+Validators and generators that regex the `{ date: "...", page: "...",
+title: "..." }` entries (or engine markers like renderPreviewHub) out of the
+calendar JS call read_calendar_js() instead of reading the file directly; it
+returns the file text plus the shared runtime it loads, with the archive
+entries re-rendered in that legacy form.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+CALENDAR_DATA_DIR = REPO_DIR / 'data' / 'calendar'
+RUNTIME_NAME = 'calendar-runtime.js'
+
+# Page -> date lookups are split into this many files. Must match
+# PAGE_BUCKETS / pageBucket() in the generated calendar-runtime.js.
+PAGE_BUCKETS = 16
+
+
+def page_bucket(page):
+    """FNV-1a over the page name, mod PAGE_BUCKETS (mirrored in the runtime)."""
+    h = 0x811c9dc5
+    for ch in page:
+        h = ((h ^ ord(ch)) * 0x01000193) & 0xffffffff
+    return h % PAGE_BUCKETS
+
+
+def _digest(text):
+    return hashlib.md5(text.encode('utf-8')).hexdigest()[:10]
+
+
+def _write_if_changed(path, text):
+    try:
+        if path.read_text(encoding='utf-8') == text:
+            return False
+    except OSError:
+        pass
+    path.write_text(text, encoding='utf-8')
+    return True
+
+
+def write_shards(sport, entries):
+    """Write month + page-bucket shards for one sport and return its index.
+
+    `entries` is the calendar list in ARCHIVE_DATA order (newest first).
+    Shards no longer produced are removed.
+    """
+    out_dir = CALENDAR_DATA_DIR / sport
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    by_month = {}
+    buckets = {}
+    for e in entries:
+        row = {'date': e['date'], 'page': e['page'], 'title': e['title']}
+        by_month.setdefault(e['date'][:7], []).append(row)
+        # Last write wins, same as the old pageToDateMap forEach.
+        buckets.setdefault(page_bucket(e['page']), {})[e['page']] = e['date']
+
+    keep = {'index.json'}
+    months = {}
+    for ym in sorted(by_month):
+        text = json.dumps(by_month[ym], ensure_ascii=False, separators=(',', ':'))
+        _write_if_changed(out_dir / f'{ym}.json', text)
+        keep.add(f'{ym}.json')
+        months[ym] = {'n': len(by_month[ym]), 'v': _digest(text)}
+
+    pages = {}
+    for b in sorted(buckets):
+        text = json.dumps(dict(sorted(buckets[b].items())), ensure_ascii=False, separators=(',', ':'))
+        _write_if_changed(out_dir / f'pages-{b}.json', text)
+        keep.add(f'pages-{b}.json')
+        pages[str(b)] = _digest(text)
+
+    for stale in out_dir.glob('*.json'):
+        if stale.name not in keep:
+            stale.unlink()
+
+    index = {'months': months, 'pages': pages}
+    _write_if_changed(out_dir / 'index.json', json.dumps(index, indent=1) + '\n')
+    return index
+
+
+def load_entries(sport):
+    """All calendar entries for a sport, newest first (the old ARCHIVE_DATA order)."""
+    out_dir = CALENDAR_DATA_DIR / sport
+    try:
+        index = json.loads((out_dir / 'index.json').read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return []
+    entries = []
+    for ym in sorted(index.get('months', {}), reverse=True):
+        try:
+            entries.extend(json.loads((out_dir / f'{ym}.json').read_text(encoding='utf-8')))
+        except (OSError, ValueError):
+            continue
+    return entries
+
+
+def legacy_entry_line(entry):
+    title = entry['title'].replace('"', '\\"')
+    return f'    {{ date: "{entry["date"]}", page: "{entry["page"]}", title: "{title}" }},'
+
+
+def _read(path):
+    try:
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            return f.read()
+    except OSError:
+        return ''
+
+
+def read_calendar_js(path):
+    """What a sport calendar JS amounts to once loaded: the index file, the
+    shared runtime it pulls in, and its sharded entries as ARCHIVE_DATA.
+
+    Files that are not sharded sport calendars (featured-games-calendar.js,
+    or a sport with no data/calendar/ directory yet) come back unchanged.
+    Returns '' when the file cannot be read, like the callers' old try/open.
+    """
+    text = _read(path)
+    name = os.path.basename(str(path))
+    if not text or not name.endswith('-calendar.js'):
+        return text
+    if RUNTIME_NAME in text:
+        text += '\n' + _read(os.path.join(os.path.dirname(str(path)), RUNTIME_NAME))
+    entries = load_entries(name[:-len('-calendar.js')])
+    if not entries:
+        return text
+    lines = ['', 'const ARCHIVE_DATA = [']
+    lines.extend(legacy_entry_line(e) for e in entries)
+    lines.append('];')
+    return text + '\n'.join(lines) + '\n'
@@ -30,6 +30,9 @@ from zoneinfo import ZoneInfo
 
 import requests
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from odds_history import quotes_from_prop_rows, record_safely  # noqa: E402
+
 
 PACIFIC = ZoneInfo("America/Los_Angeles")
 SPORT_KEY = "baseball_mlb"
@@ -445,6 +448,7 @@ def main() -> int:
         sync.fetch_events()
         sync.fetch_props()
         files = sync.write_outputs()
+        record_safely(SPORT_KEY, quotes_from_prop_rows(sync.rows), "the-odds-api-props")
     except Exception as exc:
         print(f"Sync failed: {exc}", file=sys.stderr)
         return 1
@@ -27,7 +27,7 @@ import sys
 from datetime import datetime
 from collections import defaultdict
 
-REPO_ROOT = r'C:\Users\Nima\nimadamus.github.io'
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 # Sports to check
 SPORTS = ['nba', 'nhl', 'nfl', 'ncaab', 'ncaaf', 'mlb', 'soccer']
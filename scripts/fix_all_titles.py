@@ -2,10 +2,15 @@
 """
 Fix all page titles to include dates.
 This ensures the calendar sync works correctly.
+
+Registered with html_rewrite as "dated-titles" (pages in page_dates only).
 """
 
 import os
 import re
+import sys
+
+from html_rewrite import REPO, run, transform
 
 # Mapping of pages to their correct dates (from sync_calendars.py output)
 page_dates = {
@@ -144,43 +149,32 @@ def format_date(date_str):
     year, month, day = int(parts[0]), int(parts[1]), int(parts[2])
     return f'{month_names[month]} {day:02d}, {year}'
 
-def main():
-    # Change to repo directory
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    repo_dir = os.path.dirname(script_dir)
-    os.chdir(repo_dir)
-
-    fixed = 0
-    for page, date in page_dates.items():
-        if not os.path.exists(page):
-            print(f'SKIP: {page} does not exist')
-            continue
-
-        with open(page, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-
-        # Check if already has date in title
-        title_match = re.search(r'<title>([^<]+)</title>', content)
-        if title_match:
-            title = title_match.group(1)
-            if any(m in title for m in month_names.values()):
-                continue  # Already has date
-
-        # Get sport prefix from filename
-        sport = page.split('-')[0].upper()
-        formatted_date = format_date(date)
-        new_title = f'{sport} Analysis - {formatted_date} | BetLegend'
+@transform('dated-titles', applies=lambda rel: rel in page_dates)
+def date_title(page, content):
+    """Put the calendar date in <title> for the pages in page_dates."""
+    # Check if already has date in title
+    title_match = re.search(r'<title>([^<]+)</title>', content)
+    if title_match:
+        title = title_match.group(1)
+        if any(m in title for m in month_names.values()):
+            return content  # Already has date
 
-        # Replace title
-        new_content = re.sub(r'<title>[^<]+</title>', f'<title>{new_title}</title>', content)
+    # Get sport prefix from filename
+    sport = page.split('-')[0].upper()
+    formatted_date = format_date(page_dates[page])
+    new_title = f'{sport} Analysis - {formatted_date} | BetLegend'
 
-        if new_content != content:
-            with open(page, 'w', encoding='utf-8') as f:
-                f.write(new_content)
-            print(f'FIXED: {page} -> {new_title}')
-            fixed += 1
+    # Replace title
+    return re.sub(r'<title>[^<]+</title>', f'<title>{new_title}</title>', content)
 
-    print(f'\nTotal fixed: {fixed} pages')
+def main():
+    pages = []
+    for page in page_dates:
+        if not os.path.exists(os.path.join(REPO, page)):
+            print(f'SKIP: {page} does not exist')
+            continue
+        pages.append(page)
+    return run(['dated-titles'], pages)
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
@@ -12,9 +12,13 @@
    "canonicalize dated hub archives to handicapping-hub.html" is NOT done.)
 
 Idempotent; prints every change. No content is removed.
+
+Fix 2 is registered with html_rewrite as "canonical-www-host".
 """
 import os, re, sys
 
+from html_rewrite import rewrite, transform
+
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 BASE = 'https://www.betlegendpicks.com'
 CANON_RE = re.compile(r'<link[^>]+rel=["\']canonical["\'][^>]*>|<link[^>]+href=["\'][^"\']+["\'][^>]+rel=["\']canonical["\'][^>]*>', re.I)
@@ -79,6 +83,13 @@ def add_self_canonical(rel):
         write(p, new_txt)
         changes.append(f'{rel}: added self-canonical')
 
+@transform('canonical-www-host')
+def www_host(rel, txt):
+    """Rewrite bare-host betlegendpicks.com hrefs to the www host."""
+    if 'href="https://betlegendpicks.com/' in txt or "href='https://betlegendpicks.com/" in txt:
+        return txt.replace('https://betlegendpicks.com/', 'https://www.betlegendpicks.com/')
+    return txt
+
 def main():
     # 1+3. hubs and multi-canonical page -> self
     for rel in ['mlb-previews.html', 'nba-previews.html', 'soccer-previews.html',
@@ -86,20 +97,8 @@ def main():
         fix_self_canonical(rel)
 
     # 2. bare-host canonicals -> www (scan whole repo root + subdirs)
-    for dirpath, dirs, files in os.walk(ROOT):
-        parts = dirpath.split(os.sep)
-        if '.git' in parts or 'node_modules' in parts or 'scripts' in parts:
-            continue
-        for fn in files:
-            if not fn.endswith('.html'):
-                continue
-            p = os.path.join(dirpath, fn)
-            txt = read(p)
-            if 'href="https://betlegendpicks.com/' in txt or "href='https://betlegendpicks.com/" in txt:
-                new_txt = txt.replace('https://betlegendpicks.com/', 'https://www.betlegendpicks.com/')
-                write(p, new_txt)
-                rel = os.path.relpath(p, ROOT).replace('\\', '/')
-                changes.append(f'{rel}: bare-host -> www')
+    for r in rewrite(['canonical-www-host']):
+        changes.append(f'{r.rel}: ERROR {r.error}' if r.error else f'{r.rel}: bare-host -> www')
 
     # 4. handicapping hub pages missing canonicals -> self
     targets = [f for f in os.listdir(ROOT)
@@ -15,12 +15,13 @@ Mapping:
   Soccer -> soccer-previews.html
   NFL    -> nfl.html (no hub exists)
   NCAAF  -> ncaaf.html (no hub exists)
+
+Registered with html_rewrite as "nav-preview-hubs" (repo-root pages).
 """
 import re
 import sys
-from pathlib import Path
 
-REPO = Path(__file__).resolve().parent.parent
+from html_rewrite import root_pages, run, transform
 
 HUB_MAP = {
     "NBA": "nba-previews.html",
@@ -57,30 +58,16 @@ def rewrite_dropdown(match):
     return prefix + new_inner + suffix
 
 
-def process_file(path: Path):
-    try:
-        content = path.read_text(encoding="utf-8")
-    except (UnicodeDecodeError, OSError):
-        return 0
-
+@transform("nav-preview-hubs", applies=root_pages)
+def rewrite_nav(rel, content):
+    """Point Game Previews dropdown links at the sport preview hubs."""
     if "Game Previews" not in content:
-        return 0
-
-    new_content, n = DROPDOWN_RE.subn(rewrite_dropdown, content)
-    if new_content != content:
-        path.write_text(new_content, encoding="utf-8")
-        return 1
-    return 0
+        return content
+    return DROPDOWN_RE.sub(rewrite_dropdown, content)
 
 
 def main():
-    fixed = 0
-    scanned = 0
-    for path in REPO.glob("*.html"):
-        scanned += 1
-        fixed += process_file(path)
-    print(f"Scanned {scanned} HTML files, updated {fixed}")
-    return 0
+    return run(["nav-preview-hubs"], verbose=False)
 
 
 if __name__ == "__main__":
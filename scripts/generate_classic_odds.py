@@ -7,7 +7,8 @@ Features from classic scoresandodds.com that users loved:
 1. Dense table layout - all info visible at a glance
 2. Line movements on main view - opening vs current with arrows
 3. Sharp vs public percentages - visual indicator of sharp side
-4. "True line" prediction - calculated fair line based on team ratings
+4. "True line" prediction - fair line from the stored power ratings
+   (power_ratings.py), updated each run with the games that went final
 5. H2H history - recent matchup results
 6. ATS/O-U records - season betting performance
 7. Team records and recent form
@@ -34,6 +35,10 @@ from typing import Dict, List, Optional, Tuple
 import time
 import random
 
+from odds_ingest import OddsTable, get_odds
+from odds_history import OddsHistory
+from power_ratings import PowerRatings, team_key
+
 # Timezone handling
 try:
     from zoneinfo import ZoneInfo
@@ -46,7 +51,6 @@ except ImportError:
 # CONFIGURATION
 # =============================================================================
 
-ODDS_API_KEY = os.environ.get('ODDS_API_KEY', 'deeac7e7af6a8f1a5ac84c625e04973a')
 REPO_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 OUTPUT_FILE = "classic-odds.html"
 
@@ -198,87 +202,62 @@ def fetch_espn_schedule(sport_config: dict) -> List[dict]:
         print(f"  [ERROR] Parsing ESPN data: {e}")
         return []
 
-def fetch_odds_data(sport_key: str) -> Dict[str, dict]:
-    """Fetch odds from The Odds API."""
-    url = "https://api.the-odds-api.com/v4/sports/{}/odds".format(sport_key)
-    params = {
-        'apiKey': ODDS_API_KEY,
-        'regions': 'us',
-        'markets': 'spreads,totals,h2h',
-        'oddsFormat': 'american',
-    }
-
-    resp = fetch_with_retry(url, params)
-    if not resp:
-        return {}
-
-    try:
-        data = resp.json()
-        odds_by_game = {}
-
-        for game in data:
-            away_team = game.get('away_team', '')
-            home_team = game.get('home_team', '')
-            key = f"{away_team}@{home_team}".lower()
+def update_power_ratings(ratings: PowerRatings, sport: str, sport_config: dict) -> int:
+    """Absorb the finals ESPN has posted since the ratings were last updated."""
+    absorbed = 0
+    for date_str in ratings.pending_dates(sport):
+        url = f"https://site.api.espn.com/apis/site/v2/sports/{sport_config['espn_path']}/scoreboard?dates={date_str}&limit=200"
+        if 'college' in sport_config['espn_path']:
+            url += '&groups=50'
+        resp = fetch_with_retry(url)
+        if not resp:
+            continue
+        try:
+            events = resp.json().get('events', [])
+        except ValueError:
+            continue
+        absorbed += ratings.absorb_events(sport, date_str, events)
+    return absorbed
 
-            bookmakers = game.get('bookmakers', [])
-            if not bookmakers:
-                continue
+def fetch_odds_data(sport_key: str) -> Tuple[OddsTable, List[dict]]:
+    """Fetch odds through odds_ingest from the same ESPN (DraftKings) source the
+    hub reads, so both pages show one snapshot: whichever generator runs first
+    in the workflow (or within ODDS_SNAPSHOT_MAX_AGE seconds) fetches it, the
+    other reuses it. The Odds API only ever contributed its first bookmaker.
 
-            # Get consensus from first bookmaker (usually DraftKings or FanDuel)
-            book = bookmakers[0]
-            markets = {m['key']: m for m in book.get('outcomes', book.get('markets', []))}
-
-            spread_market = None
-            total_market = None
-            ml_market = None
-
-            for market in book.get('markets', []):
-                if market['key'] == 'spreads':
-                    spread_market = market
-                elif market['key'] == 'totals':
-                    total_market = market
-                elif market['key'] == 'h2h':
-                    ml_market = market
-
-            odds_info = {
-                'spread': None,
-                'spread_odds': None,
-                'total': None,
-                'over_odds': None,
-                'under_odds': None,
-                'away_ml': None,
-                'home_ml': None,
-                'bookmaker': book.get('title', 'Unknown'),
-            }
-
-            if spread_market:
-                for outcome in spread_market.get('outcomes', []):
-                    if outcome.get('name') == home_team:
-                        odds_info['spread'] = outcome.get('point', 0)
-                        odds_info['spread_odds'] = outcome.get('price', -110)
-
-            if total_market:
-                for outcome in total_market.get('outcomes', []):
-                    if outcome.get('name') == 'Over':
-                        odds_info['total'] = outcome.get('point', 0)
-                        odds_info['over_odds'] = outcome.get('price', -110)
-                    elif outcome.get('name') == 'Under':
-                        odds_info['under_odds'] = outcome.get('price', -110)
-
-            if ml_market:
-                for outcome in ml_market.get('outcomes', []):
-                    if outcome.get('name') == away_team:
-                        odds_info['away_ml'] = outcome.get('price', 0)
-                    elif outcome.get('name') == home_team:
-                        odds_info['home_ml'] = outcome.get('price', 0)
-
-            odds_by_game[key] = odds_info
-
-        return odds_by_game
-    except Exception as e:
-        print(f"  [ERROR] Parsing odds data: {e}")
-        return {}
+    Returns the table (for OddsTable.find) and the page's odds per table row.
+    """
+    table = get_odds(sport_key, 'espn', fetch=lambda url, params: fetch_with_retry(url, params=params))
+    history = OddsHistory(sport_key)
+
+    odds_rows = []
+    for row in table.rows():
+        game_date = (row['commence_time'] or '')[:10] or None
+        book = row['provider'] or ''
+        spread_move = history.movement(row['event_id'], 'spread', 'home', game_date, book)
+        total_move = history.movement(row['event_id'], 'total', 'over', game_date, book)
+        odds_rows.append({
+            'spread_open': spread_move[0] if spread_move else None,
+            'total_open': total_move[0] if total_move else None,
+            'spread': row['spread'],
+            'spread_odds': row['home_spread_price'],
+            'total': row['total'],
+            'over_odds': row['over_price'],
+            'under_odds': row['under_price'],
+            'away_ml': row['away_ml'],
+            'home_ml': row['home_ml'],
+            'bookmaker': row['provider'] or 'Unknown',
+        })
+    history.close()
+    return table, odds_rows
+
+def line_move_html(open_line, current_line, label: str = 'OPEN', fmt: str = '+g') -> str:
+    """Opening line with an arrow toward the current one; empty when it has not moved.
+    Spreads are signed (the default `fmt`); pass fmt='g' for totals."""
+    if open_line is None or current_line is None or open_line == current_line:
+        return ''
+    arrow = '&#9650;' if current_line > open_line else '&#9660;'
+    return f'<div class="line-move">{label} {open_line:{fmt}} {arrow}</div>'
 
 def calculate_true_line(home_record: str, away_record: str, spread: float, sport: str) -> float:
     """
@@ -317,6 +296,16 @@ def calculate_true_line(home_record: str, away_record: str, spread: float, sport
     except:
         return spread if spread else 0
 
+def game_true_line(ratings: Optional[PowerRatings], game: dict, spread: float, sport: str) -> float:
+    """Power-rating line when both teams are rated, else the record-based estimate.
+    MLB keeps the market run line, as calculate_true_line always has."""
+    if ratings is not None and sport != 'MLB':
+        line = ratings.true_line(sport, team_key(sport, game['home_abbr'], game['home_team']),
+                                 team_key(sport, game['away_abbr'], game['away_team']))
+        if line is not None:
+            return line
+    return calculate_true_line(game['home_record'], game['away_record'], spread, sport)
+
 def generate_sharp_indicator(spread: float, true_line: float, public_pct: int) -> dict:
     """
     Generate sharp money indicator based on line vs true line and public %.
@@ -325,7 +314,7 @@ def generate_sharp_indicator(spread: float, true_line: float, public_pct: int) -
     if spread is None:
         return {'side': None, 'strength': 0, 'text': ''}
 
-    line_diff = abs(spread - true_line) if true_line else 0
+    line_diff = abs(spread - true_line) if true_line is not None else 0
 
     # If line is significantly different from true line, sharps may be on the other side
     if line_diff > 2:
@@ -358,7 +347,8 @@ def generate_sharp_indicator(spread: float, true_line: float, public_pct: int) -
 # HTML GENERATION
 # =============================================================================
 
-def generate_html(all_games: Dict[str, List[dict]], all_odds: Dict[str, Dict[str, dict]]) -> str:
+def generate_html(all_games: Dict[str, List[dict]], all_odds: Dict[str, Tuple[OddsTable, List[dict]]],
+                  ratings: Optional[PowerRatings] = None) -> str:
     """Generate the complete HTML page."""
 
     today = datetime.now()
@@ -372,7 +362,7 @@ def generate_html(all_games: Dict[str, List[dict]], all_odds: Dict[str, Dict[str
             continue
 
         games = all_games.get(sport, [])
-        odds = all_odds.get(sport, {})
+        table, odds_rows = all_odds.get(sport) or (None, [])
 
         # Filter NCAAB to major teams only
         if sport == 'NCAAB':
@@ -390,17 +380,9 @@ def generate_html(all_games: Dict[str, List[dict]], all_odds: Dict[str, Dict[str
         else:
             games_html = []
             for game in games:
-                # Find odds for this game
-                odds_key = f"{game['away_team']}@{game['home_team']}".lower()
-                game_odds = odds.get(odds_key, {})
-
-                # Also try abbreviated version
-                if not game_odds:
-                    odds_key_abbr = f"{game['away_abbr']}@{game['home_abbr']}".lower()
-                    for key in odds:
-                        if game['away_abbr'].lower() in key or game['home_abbr'].lower() in key:
-                            game_odds = odds[key]
-                            break
+                # Find odds for this game: event id, team pair, then shared words
+                row = table.find(game['away_team'], game['home_team'], game['id']) if table else None
+                game_odds = odds_rows[row] if row is not None else {}
 
                 spread = game_odds.get('spread')
                 total = game_odds.get('total')
@@ -408,17 +390,11 @@ def generate_html(all_games: Dict[str, List[dict]], all_odds: Dict[str, Dict[str
                 home_ml = game_odds.get('home_ml')
 
                 # Calculate true line
-                true_line = calculate_true_line(
-                    game['home_record'],
-                    game['away_record'],
-                    spread if spread else 0,
-                    sport
-                )
+                true_line = game_true_line(ratings, game, spread if spread else 0, sport)
 
                 # Simulate public betting % (in real app, this would come from an API)
-                import random
-                random.seed(hash(game['id']) if game['id'] else 0)
-                public_home_pct = random.randint(35, 65)
+                public_rng = random.Random(hash(game['id']) if game['id'] else 0)
+                public_home_pct = public_rng.randint(35, 65)
 
                 # Sharp indicator
                 sharp = generate_sharp_indicator(spread, true_line, public_home_pct)
@@ -476,6 +452,7 @@ def generate_html(all_games: Dict[str, List[dict]], all_odds: Dict[str, Dict[str
                     <td class="spread-cell">
                         <div class="line-row">{spread_away}</div>
                         <div class="line-row">{spread_home}</div>
+                        {line_move_html(game_odds.get('spread_open'), spread)}
                     </td>
                     <td class="ml-cell">
                         <div class="line-row">{away_ml_str}</div>
@@ -484,6 +461,7 @@ def generate_html(all_games: Dict[str, List[dict]], all_odds: Dict[str, Dict[str
                     <td class="total-cell">
                         <div class="line-row">O {total_str}</div>
                         <div class="line-row">U {total_str}</div>
+                        {line_move_html(game_odds.get('total_open'), total, fmt='g')}
                     </td>
                     <td class="true-line-cell">
                         <div class="true-line">{true_line_str}</div>
@@ -779,6 +757,12 @@ def generate_html(all_games: Dict[str, List[dict]], all_odds: Dict[str, Dict[str
             border-bottom: 1px dashed #333;
         }}
 
+        .line-move {{
+            font-size: 0.6rem;
+            color: #888;
+            margin-top: 2px;
+        }}
+
         .true-line-cell {{
             width: 70px;
         }}
@@ -1016,6 +1000,7 @@ def main():
 
     all_games = {}
     all_odds = {}
+    ratings = PowerRatings()
 
     for sport, config in SPORTS_CONFIG.items():
         if not config['enabled']:
@@ -1028,17 +1013,23 @@ def main():
         print(f"  Found {len(games)} games")
         all_games[sport] = games
 
+        # Bring the power ratings up to date with the games that went final
+        absorbed = update_power_ratings(ratings, sport, config)
+        if absorbed:
+            print(f"  Ratings: absorbed {absorbed} final(s)")
+
         # Fetch odds
         if games:
-            odds = fetch_odds_data(config['odds_key'])
-            print(f"  Found odds for {len(odds)} games")
-            all_odds[sport] = odds
+            table, odds_rows = fetch_odds_data(config['odds_key'])
+            print(f"  Found odds for {len(odds_rows)} games")
+            all_odds[sport] = (table, odds_rows)
         else:
-            all_odds[sport] = {}
+            all_odds[sport] = None
 
     # Generate HTML
     print("\n[GENERATING] Creating HTML...")
-    html = generate_html(all_games, all_odds)
+    ratings.save()
+    html = generate_html(all_games, all_odds, ratings)
 
     # Write output
     output_path = os.path.join(REPO_PATH, OUTPUT_FILE)
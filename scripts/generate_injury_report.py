@@ -3,10 +3,21 @@
 BetLegend Injury Report Generator
 Organized by TEAM - shows all players, all statuses, injury details
 Runs hourly via GitHub Actions
+
+Change detection: the four ESPN feeds are fetched concurrently, and the parsed
+data is reduced to a per-team fingerprint (player, status, injury, comment,
+displayed duration). When every team matches the previous run the page is not
+rendered or written at all, so the workflow has nothing to commit. When only
+some teams changed, unchanged team cards are reused from the fragment store in
+data/cache/injury-report-state.json and only the changed ones are re-rendered.
+Pass --force to ignore the store.
 """
 
 import urllib.request
+import hashlib
 import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 import os
 
@@ -24,6 +35,11 @@ MLB_OFFSEASON_MONTHS = [11, 12, 1, 2, 3]  # Nov, Dec, Jan, Feb, Mar
 # NFL Offseason: February through August - season is over after Super Bowl
 NFL_OFFSEASON_MONTHS = [2, 3, 4, 5, 6, 7, 8]  # Feb through Aug
 
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATE_PATH = os.path.join(REPO_ROOT, 'data', 'cache', 'injury-report-state.json')
+# Bump when the page template changes so cached fragments/fingerprints are dropped.
+TEMPLATE_VERSION = '1'
+
 # Status display order (most severe first)
 STATUS_ORDER = ['Out', 'Injured Reserve', 'Doubtful', 'Questionable', 'Day-To-Day', 'Probable']
 
@@ -260,7 +276,104 @@ def get_indicator_class(status):
     }
     return indicator_map.get(status, 'indicator-out')
 
-def generate_html(all_data):
+# Fields that reach the rendered team card. days_out is left out on purpose:
+# days_display is what the page shows, and it only moves at day/week buckets.
+FINGERPRINT_FIELDS = ('name', 'position', 'status', 'injury', 'comment', 'days_display')
+
+def team_fingerprint(sport, team_name, team_data):
+    players = [
+        [str(p.get(field, '')) for field in FINGERPRINT_FIELDS]
+        for p in team_data['players']
+    ]
+    payload = json.dumps([TEMPLATE_VERSION, sport, team_name, team_data['id'], players], ensure_ascii=False)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+def report_fingerprint(all_data):
+    """Normalized fingerprint of parse_all_injuries output for every sport.
+
+    Offseason flags are part of it because they swap whole sport sections.
+    """
+    current_month = datetime.now().month
+    parts = [
+        TEMPLATE_VERSION,
+        current_month in MLB_OFFSEASON_MONTHS,
+        current_month in NFL_OFFSEASON_MONTHS,
+        NBA_PLAYOFFS_ACTIVE,
+    ]
+    for sport in sorted(all_data):
+        for team_name, team_data in sorted(all_data[sport].items()):
+            parts.append(team_fingerprint(sport, team_name, team_data))
+    return hashlib.sha1(json.dumps(parts).encode('utf-8')).hexdigest()
+
+def load_state():
+    try:
+        with open(STATE_PATH, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {'fingerprint': None, 'fragments': {}}
+    if state.get('template_version') != TEMPLATE_VERSION:
+        return {'fingerprint': None, 'fragments': {}}
+    return state
+
+def save_state(fingerprint, fragments):
+    os.makedirs(os.path.dirname(STATE_PATH), exist_ok=True)
+    with open(STATE_PATH, 'w', encoding='utf-8') as f:
+        json.dump({
+            'template_version': TEMPLATE_VERSION,
+            'fingerprint': fingerprint,
+            'fragments': dict(sorted(fragments.items())),
+        }, f, indent=1, ensure_ascii=False)
+        f.write('\n')
+
+def render_team_card(sport, team_name, team_data):
+    players = team_data['players']
+    team_id = team_data['id']
+    logo_url = get_team_logo(sport, team_id)
+    injured_count = len(players)
+
+    html = f'''
+            <div class="team-card">
+                <div class="team-header">
+                    <img src="{logo_url}" alt="{team_name}" class="team-logo" onerror="this.style.display='none'">
+                    <span class="team-name">{team_name}</span>
+                    <span class="team-count"><span>{injured_count}</span> injured</span>
+                </div>
+'''
+    if players:
+        html += '                <div class="player-list">\n'
+        for p in players:
+            status_class = get_status_class(p['status'])
+            indicator_class = get_indicator_class(p['status'])
+            comment = p['comment'][:80] + '...' if len(p['comment']) > 80 else p['comment']
+            html += f'''                    <div class="player-row">
+                        <div class="status-indicator {indicator_class}"></div>
+                        <div class="player-name">{p['name']}</div>
+                        <div class="player-position">{p['position'] or '-'}</div>
+                        <div><span class="status {status_class}">{p['status'].replace('Injured Reserve', 'IR').replace('Day-To-Day', 'DTD')}</span></div>
+                        <div class="player-duration">{p['days_display']}</div>
+                        <div class="player-comment" title="{p['comment']}">{p['injury']} - {comment}</div>
+                    </div>
+'''
+        html += '                </div>\n'
+    else:
+        html += '                <div class="no-injuries">No injuries reported</div>\n'
+    html += '            </div>\n'
+    return html
+
+def generate_html(all_data, fragments=None, stats=None):
+    """Render the full page.
+
+    fragments: {"SPORT|Team": {"hash": ..., "html": ...}} from the previous
+    run. Team cards whose fingerprint matches are reused; the dict is updated
+    in place with the cards rendered this time. stats, when given, receives
+    reused/rendered counts.
+    """
+    if fragments is None:
+        fragments = {}
+    if stats is None:
+        stats = {}
+    stats.setdefault('reused', 0)
+    stats.setdefault('rendered', 0)
     now = datetime.now().strftime('%B %d, %Y at %I:%M %p ET')
 
     # Check if MLB/NFL are in offseason
@@ -982,38 +1095,17 @@ def generate_html(all_data):
             </div>
 '''
         for team_name, team_data in teams.items():
-            players = team_data['players']
-            team_id = team_data['id']
-            logo_url = get_team_logo(sport, team_id)
-            injured_count = len(players)
-
-            html += f'''
-            <div class="team-card">
-                <div class="team-header">
-                    <img src="{logo_url}" alt="{team_name}" class="team-logo" onerror="this.style.display='none'">
-                    <span class="team-name">{team_name}</span>
-                    <span class="team-count"><span>{injured_count}</span> injured</span>
-                </div>
-'''
-            if players:
-                html += '                <div class="player-list">\n'
-                for p in players:
-                    status_class = get_status_class(p['status'])
-                    indicator_class = get_indicator_class(p['status'])
-                    comment = p['comment'][:80] + '...' if len(p['comment']) > 80 else p['comment']
-                    html += f'''                    <div class="player-row">
-                        <div class="status-indicator {indicator_class}"></div>
-                        <div class="player-name">{p['name']}</div>
-                        <div class="player-position">{p['position'] or '-'}</div>
-                        <div><span class="status {status_class}">{p['status'].replace('Injured Reserve', 'IR').replace('Day-To-Day', 'DTD')}</span></div>
-                        <div class="player-duration">{p['days_display']}</div>
-                        <div class="player-comment" title="{p['comment']}">{p['injury']} - {comment}</div>
-                    </div>
-'''
-                html += '                </div>\n'
-            else:
-                html += '                <div class="no-injuries">No injuries reported</div>\n'
-            html += '            </div>\n'
+            key = f'{sport}|{team_name}'
+            digest = team_fingerprint(sport, team_name, team_data)
+            cached = fragments.get(key)
+            if cached and cached.get('hash') == digest:
+                html += cached['html']
+                stats['reused'] += 1
+                continue
+            card = render_team_card(sport, team_name, team_data)
+            fragments[key] = {'hash': digest, 'html': card}
+            html += card
+            stats['rendered'] += 1
         html += '        </div>\n'
 
     html += '''
@@ -1071,7 +1163,15 @@ def generate_html(all_data):
 '''
     return html
 
-def main():
+def fetch_all(sports):
+    """Fetch every sport's feed at once; returns {sport: teams_data} in ENDPOINTS order."""
+    if not sports:
+        return {}
+    with ThreadPoolExecutor(max_workers=len(sports)) as pool:
+        futures = {sport: pool.submit(fetch_injuries, sport, ENDPOINTS[sport]) for sport in sports}
+        return {sport: futures[sport].result() for sport in sports}
+
+def main(force=False):
     print("=" * 50)
     print("BetLegend Injury Report Generator")
     print("=" * 50)
@@ -1081,39 +1181,45 @@ def main():
     is_nfl_offseason = current_month in NFL_OFFSEASON_MONTHS
 
     all_data = {}
-    for sport, url in ENDPOINTS.items():
-        # Skip fetching MLB during offseason
-        if sport == 'MLB' and is_mlb_offseason:
+    live_sports = []
+    for sport in ENDPOINTS:
+        # Skip fetching MLB/NFL during their offseason
+        if (sport == 'MLB' and is_mlb_offseason) or (sport == 'NFL' and is_nfl_offseason):
             print(f"Skipping {sport} (offseason)...")
             all_data[sport] = {}
             continue
+        live_sports.append(sport)
 
-        # Skip fetching NFL during offseason
-        if sport == 'NFL' and is_nfl_offseason:
-            print(f"Skipping {sport} (offseason)...")
-            all_data[sport] = {}
-            continue
-
-        print(f"Fetching {sport}...")
-        teams_data = fetch_injuries(sport, url)
-        teams = parse_all_injuries(sport, teams_data)
+    print(f"Fetching {', '.join(live_sports)}...")
+    feeds = fetch_all(live_sports)
+    for sport in live_sports:
+        teams = parse_all_injuries(sport, feeds[sport])
         all_data[sport] = teams
         total_injured = sum(len(t['players']) for t in teams.values())
-        print(f"  {len(teams)} teams, {total_injured} injured players")
+        print(f"  {sport}: {len(teams)} teams, {total_injured} injured players")
+    all_data = {sport: all_data[sport] for sport in ENDPOINTS}
 
-    print("\nGenerating HTML...")
-    html = generate_html(all_data)
+    output_path = os.path.join(REPO_ROOT, 'injury-report.html')
+    state = {'fingerprint': None, 'fragments': {}} if force else load_state()
+    fingerprint = report_fingerprint(all_data)
+    if fingerprint == state.get('fingerprint') and os.path.exists(output_path):
+        print(f"\nNo injury changes since last run (fingerprint {fingerprint[:12]}) - page left untouched.")
+        return output_path
 
-    # Determine output path
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    repo_root = os.path.dirname(script_dir)
-    output_path = os.path.join(repo_root, 'injury-report.html')
+    print("\nGenerating HTML...")
+    fragments = state.get('fragments', {})
+    stats = {}
+    html = generate_html(all_data, fragments, stats)
+    print(f"  {stats['rendered']} team card(s) rendered, {stats['reused']} reused from cache")
 
     with open(output_path, 'w', encoding='utf-8') as f:
         f.write(html)
 
+    live_keys = {f'{sport}|{team}' for sport, teams in all_data.items() for team in teams}
+    save_state(fingerprint, {k: v for k, v in fragments.items() if k in live_keys})
+
     print(f"Saved to: {output_path}")
     return output_path
 
 if __name__ == "__main__":
-    main()
+    main(force='--force' in sys.argv[1:])
@@ -14,15 +14,16 @@ This script mirrors that exact logic:
   4. Merge all three, deduplicating by date+pick
   5. Write transparency-widget-data.js
 
+All three sources are read through the picks ledger (scripts/picks_ledger.py):
+an unchanged page or CSV is not re-parsed, and the merged per-sport totals are
+updated incrementally from whatever picks changed.
+
 Usage:
     python scripts/generate_transparency_data.py
 """
 
-import csv
-import io
 import json
 import os
-import re
 import urllib.request
 from datetime import datetime
 
@@ -61,6 +62,14 @@ SPORT_DATA_MODE = {
     "Soccer": "sheet_only",
 }
 
+# Picks-ledger sources behind each mode, highest priority first.
+MODE_SOURCES = {
+    "html_then_tracker": ["html", "tracker"],
+    "sheet_then_tracker": ["sheet", "tracker"],
+    "sheet_only": ["sheet"],
+}
+SOURCE_LABELS = {"html": "HTML", "sheet": "Sheet"}
+
 PICK_TRACKER_URL = (
     "https://docs.google.com/spreadsheets/d/"
     "1izhxwiiazn99SRqcK8QpUE4pfvDRIFpgSyw5ZlMsvmY/export?format=csv&gid=0"
@@ -246,175 +255,16 @@ def calculate_unit_result(stake_str, odds_str, result):
     return 0.0
 
 
-def latest_date_from_keys(picks_map):
-    if not picks_map:
-        return ""
-    latest_key = max(picks_map.keys(), key=lambda k: date_sort_key(k.split("|", 1)[0]))
-    return latest_key.split("|", 1)[0]
-
-
-def build_stats(picks_map):
-    """Calculate stats matching how the records pages do it:
-    - Filter out cross-sport parlays
-    - Classify W/L/P by UNITS VALUE (positive=W, negative=L, zero=P)
-    - Calculate average odds across all picks"""
-    wins = losses = pushes = 0
-    total_units = 0.0
-    odds_values = []
-    for key, entry in picks_map.items():
-        # Support both (result, units) and (result, units, odds) tuples
-        if len(entry) == 3:
-            result, units, odds = entry
-        else:
-            result, units = entry
-            odds = None
-        # Extract pick text from key (format: "date|pick_text")
-        pick_text = key.split("|", 1)[1] if "|" in key else ""
-        if is_cross_sport_parlay(pick_text):
-            continue
-        if units > 0:
-            wins += 1
-        elif units < 0:
-            losses += 1
-        else:
-            pushes += 1
-        total_units += units
-        if odds is not None and odds != 0:
-            odds_values.append(odds)
-    total_picks = wins + losses + pushes
-    win_pct = round((wins / (wins + losses) * 100) if (wins + losses) else 0.0, 1)
-    # Convert each American odd to implied probability, average, convert back
-    if odds_values:
-        probs = []
-        for o in odds_values:
-            if o < 0:
-                probs.append(abs(o) / (abs(o) + 100))
-            else:
-                probs.append(100 / (o + 100))
-        avg_prob = sum(probs) / len(probs)
-        if avg_prob >= 0.5:
-            avg_odds = round(-(avg_prob / (1 - avg_prob)) * 100)
-        else:
-            avg_odds = round(((1 - avg_prob) / avg_prob) * 100)
-    else:
-        avg_odds = -110
-    return {
-        "wins": wins,
-        "losses": losses,
-        "pushes": pushes,
-        "totalPicks": total_picks,
-        "totalUnits": round(total_units, 2),
-        "winPct": win_pct,
-        "avgOdds": avg_odds,
-        "lastDate": latest_date_from_keys(picks_map),
-    }
-
-
 # ---- Data source parsers ----
 
-def parse_html_table(filepath):
-    """Parse the embedded HTML table in a records page. Returns a pick map."""
-    if not os.path.exists(filepath):
-        return {}
-
-    with open(filepath, "r", encoding="utf-8") as f:
-        html = f.read()
-
-    picks = {}
-    # Match rows like: <tr><td>4/5/2026</td><td>Pick text</td><td>-110</td><td class="result-W">W</td><td class="win">+3.00</td></tr>
-    row_pattern = re.compile(
-        r'<tr>\s*<td[^>]*>([^<]*)</td>'   # date
-        r'\s*<td[^>]*>([^<]*)</td>'        # pick
-        r'\s*<td[^>]*>([^<]*)</td>'        # line/odds
-        r'\s*<td[^>]*[^>]*>([^<]*)</td>'   # result (W/L/P)
-        r'\s*<td[^>]*[^>]*>([^<]*)</td>'   # units
-        r'\s*</tr>',
-        re.IGNORECASE
-    )
-
-    for match in row_pattern.finditer(html):
-        date_str = match.group(1).strip()
-        pick_text = match.group(2).strip()
-        odds_str = match.group(3).strip()
-        result_text = match.group(4).strip()
-        units_str = match.group(5).strip()
-
-        result = normalize_result(result_text)
-        if not result:
-            # Derive from units
-            u = safe_float(units_str)
-            if u > 0:
-                result = "W"
-            elif u < 0:
-                result = "L"
-            elif pick_text:
-                result = "P"
-            else:
-                continue
-
-        if not date_str or not pick_text:
-            continue
-
-        units = safe_float(units_str)
-        odds = safe_float(odds_str, default=0.0)
-        key = make_pick_key(date_str, pick_text)
-        picks[key] = (result, units, odds)
-
-    return picks
-
-
-def fetch_csv_rows(url):
-    """Fetch CSV from a URL and return list of dicts."""
+def fetch_csv_text(url):
+    """Fetch a published CSV as text."""
     req = urllib.request.Request(
         url,
         headers={"User-Agent": "Mozilla/5.0 (BetLegend Transparency Widget)"},
     )
     with urllib.request.urlopen(req, timeout=30) as response:
-        csv_text = response.read().decode("utf-8-sig")
-    return list(csv.DictReader(io.StringIO(csv_text)))
-
-
-def sheet_rows_to_pick_map(rows):
-    """Parse Google Sheet CSV rows into a pick map."""
-    picks = {}
-    for row in rows:
-        result = normalize_result(row.get("Result") or row.get("result"))
-        if not result:
-            # Derive result from Units/ProfitLoss column if Result is missing
-            units_val = safe_float(
-                row.get("Units") or row.get("ProfitLoss")
-                or row.get("Profit/Loss") or row.get("P/L")
-                or row.get("UNIT_RESULT")
-            )
-            if units_val > 0:
-                result = "W"
-            elif units_val < 0:
-                result = "L"
-            else:
-                pick_text = (row.get("Pick") or row.get("Picks") or "").strip()
-                if pick_text:
-                    result = "P"
-                else:
-                    continue
-        if not result:
-            continue
-
-        date_str = row.get("Date", "")
-        pick_text = row.get("Pick") or row.get("Picks") or row.get("pick") or ""
-        if not date_str or not pick_text:
-            continue
-
-        units = safe_float(
-            row.get("Units") or row.get("ProfitLoss")
-            or row.get("Profit/Loss") or row.get("P/L")
-            or row.get("UNIT_RESULT")
-        )
-        odds = safe_float(
-            row.get("Line") or row.get("Odds") or row.get("odds") or "0"
-        )
-        key = make_pick_key(date_str, pick_text)
-        picks[key] = (result, units, odds)
-    return picks
+        return response.read().decode("utf-8-sig")
 
 
 def detect_basketball_sport(row):
@@ -447,43 +297,14 @@ def detect_tracker_sport(row):
     return None
 
 
-def fetch_tracker_pick_maps():
-    """Fetch Pick Tracker and return per-sport pick maps."""
-    sport_maps = {sport: {} for sport in ALL_SPORTS}
-    skipped = 0
-
-    try:
-        rows = fetch_csv_rows(PICK_TRACKER_URL)
-    except Exception as e:
-        print(f"  WARNING: Could not fetch Pick Tracker: {e}")
-        return sport_maps, 0
-
-    for row in rows:
-        sport = detect_tracker_sport(row)
-        if not sport:
-            skipped += 1
-            continue
-
-        result = normalize_result(row.get("Result"))
-        if not result:
-            continue
-
-        date_str = row.get("Date", "")
-        pick_text = row.get("Pick") or row.get("Picks") or ""
-        if not date_str or not pick_text:
-            continue
-
-        odds_str = row.get("Line") or row.get("Odds") or "-110"
-        stake = row.get("Units") or SPORT_DEFAULT_STAKES.get(sport, "1")
-        units = calculate_unit_result(stake, odds_str, result)
-        odds_val = safe_float(odds_str, default=0.0)
-        key = make_pick_key(date_str, pick_text)
-        sport_maps[sport][key] = (result, units, odds_val)
-
-    return sport_maps, skipped
+# ---- Main ----
 
+def _record_line(stats):
+    return (
+        f"{stats['wins']}-{stats['losses']}-{stats['pushes']} | "
+        f"Units: {stats['totalUnits']:+.2f}"
+    )
 
-# ---- Main ----
 
 def main():
     # Each sport's records page uses a specific data flow. We mirror it exactly.
@@ -497,91 +318,68 @@ def main():
     #
     # "sheet_only" (Soccer):
     #   Google Sheet only, no Pick Tracker
+    #
+    # Every source goes into the picks ledger, which only re-parses a source
+    # whose text changed and keeps the merged per-sport totals up to date
+    # incrementally. A source that cannot be fetched keeps its last
+    # ingested picks. (Imported here: picks_ledger imports this module.)
+    from picks_ledger import (
+        PicksLedger, html_table_rows, read_text, sheet_pick_rows, tracker_pick_rows,
+    )
 
-    # STEP 1: Parse HTML tables (for html_then_tracker sports)
-    print("Step 1: Parsing HTML tables (NHL, NFL, NCAAF)...")
-    html_picks = {}
-    for sport in ALL_SPORTS:
-        if SPORT_DATA_MODE[sport] == "html_then_tracker":
-            filepath = os.path.join(REPO_ROOT, HTML_RECORDS_PAGES[sport])
-            pick_map = parse_html_table(filepath)
-            html_picks[sport] = pick_map
-            stats = build_stats(pick_map)
-            print(
-                f"  {sport:8s}: {stats['wins']}-{stats['losses']}-{stats['pushes']} | "
-                f"Units: {stats['totalUnits']:+.2f} | {stats['totalPicks']} picks"
-            )
+    with PicksLedger() as ledger:
+        # STEP 1: Ingest HTML tables (for html_then_tracker sports)
+        print("Step 1: Reading HTML tables (NHL, NFL, NCAAF)...")
+        for sport in ALL_SPORTS:
+            if SPORT_DATA_MODE[sport] == "html_then_tracker":
+                filepath = os.path.join(REPO_ROOT, HTML_RECORDS_PAGES[sport])
+                ledger.ingest("html", read_text(filepath), html_table_rows, sport)
+                stats = ledger.stats("html", sport)
+                print(f"  {sport:8s}: {_record_line(stats)} | {stats['totalPicks']} picks")
+
+        # STEP 2: Fetch Google Sheets (for sheet-based sports)
+        print("\nStep 2: Fetching Google Sheets (NBA, NCAAB, MLB, Soccer)...")
+        for sport, url in SHEET_URLS.items():
+            try:
+                ledger.ingest("sheet", fetch_csv_text(url), sheet_pick_rows, sport)
+            except Exception as e:
+                print(f"  {sport:8s}: ERROR fetching sheet - {e} (using last ingested picks)")
+                continue
+            stats = ledger.stats("sheet", sport)
+            print(f"  {sport:8s}: {_record_line(stats)} | {stats['totalPicks']} picks")
 
-    # STEP 2: Fetch Google Sheets (for sheet-based sports)
-    print("\nStep 2: Fetching Google Sheets (NBA, NCAAB, MLB, Soccer)...")
-    sheet_picks = {}
-    for sport, url in SHEET_URLS.items():
+        # STEP 3: Fetch Pick Tracker
+        print("\nStep 3: Fetching Pick Tracker...")
         try:
-            rows = fetch_csv_rows(url)
-            pick_map = sheet_rows_to_pick_map(rows)
-            sheet_picks[sport] = pick_map
-            stats = build_stats(pick_map)
+            ledger.ingest("tracker", fetch_csv_text(PICK_TRACKER_URL), tracker_pick_rows)
+        except Exception as e:
+            print(f"  WARNING: Could not fetch Pick Tracker: {e} (using last ingested picks)")
+        for sport in ALL_SPORTS:
+            count = len(ledger.keys("tracker", sport))
+            if count:
+                print(f"  {sport:8s}: {count} picks from Tracker")
+
+        # STEP 4: Merge per sport using the CORRECT data flow
+        print("\nStep 4: Merging (matching each records page's logic)...")
+        ledger.define_view("widget", {sport: MODE_SOURCES[SPORT_DATA_MODE[sport]] for sport in ALL_SPORTS})
+        combined_data = {}
+        for sport in ALL_SPORTS:
+            primary = MODE_SOURCES[SPORT_DATA_MODE[sport]][0]
+            won = ledger.view_sources("widget", sport)
+            source_desc = f"{SOURCE_LABELS[primary]}:{won.get(primary, 0)}"
+            if "tracker" in MODE_SOURCES[SPORT_DATA_MODE[sport]]:
+                source_desc += f" +Tracker:{won.get('tracker', 0)}"
+
+            stats = ledger.stats("widget", sport)
+            combined_data[sport] = {
+                "displayName": DISPLAY_NAMES[sport],
+                "recordsLink": RECORDS_LINKS[sport],
+                **stats,
+            }
             print(
-                f"  {sport:8s}: {stats['wins']}-{stats['losses']}-{stats['pushes']} | "
-                f"Units: {stats['totalUnits']:+.2f} | {stats['totalPicks']} picks"
+                f"  {sport:8s}: {_record_line(stats)} | {stats['totalPicks']} total "
+                f"({source_desc})"
             )
-        except Exception as e:
-            print(f"  {sport:8s}: ERROR fetching sheet - {e}")
-            sheet_picks[sport] = {}
-
-    # STEP 3: Fetch Pick Tracker
-    print("\nStep 3: Fetching Pick Tracker...")
-    tracker_picks, skipped = fetch_tracker_pick_maps()
-    if skipped:
-        print(f"  Skipped {skipped} ambiguous tracker rows")
-    for sport in ALL_SPORTS:
-        count = len(tracker_picks.get(sport, {}))
-        if count:
-            print(f"  {sport:8s}: {count} picks from Tracker")
-
-    # STEP 4: Merge per sport using the CORRECT data flow
-    print("\nStep 4: Merging (matching each records page's logic)...")
-    combined_data = {}
-    for sport in ALL_SPORTS:
-        mode = SPORT_DATA_MODE[sport]
-        merged = {}
-
-        if mode == "html_then_tracker":
-            # Start with HTML table, add tracker picks not already present
-            merged.update(html_picks.get(sport, {}))
-            base_count = len(merged)
-            for key, value in tracker_picks.get(sport, {}).items():
-                if key not in merged:
-                    merged[key] = value
-            added = len(merged) - base_count
-            source_desc = f"HTML:{base_count} +Tracker:{added}"
-
-        elif mode == "sheet_then_tracker":
-            # Start with Google Sheet, add tracker picks not already present
-            merged.update(sheet_picks.get(sport, {}))
-            base_count = len(merged)
-            for key, value in tracker_picks.get(sport, {}).items():
-                if key not in merged:
-                    merged[key] = value
-            added = len(merged) - base_count
-            source_desc = f"Sheet:{base_count} +Tracker:{added}"
-
-        elif mode == "sheet_only":
-            # Google Sheet only
-            merged.update(sheet_picks.get(sport, {}))
-            source_desc = f"Sheet:{len(merged)}"
-
-        stats = build_stats(merged)
-        combined_data[sport] = {
-            "displayName": DISPLAY_NAMES[sport],
-            "recordsLink": RECORDS_LINKS[sport],
-            **stats,
-        }
-        print(
-            f"  {sport:8s}: {stats['wins']}-{stats['losses']}-{stats['pushes']} | "
-            f"Units: {stats['totalUnits']:+.2f} | {stats['totalPicks']} total "
-            f"({source_desc})"
-        )
 
     # STEP 5: Write JS file
     now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -21,13 +21,15 @@ from typing import Dict, List, Optional, Tuple
 
 # Import Hub Trends Engine for historical trend analysis
 try:
-    from hub_trends_engine import generate_trends_html, get_trends_css
+    from hub_trends_engine import generate_trends_html, get_trends_css, scan_slate
     TRENDS_AVAILABLE = True
     print("[TRENDS] Hub Trends Engine loaded successfully")
 except ImportError:
     TRENDS_AVAILABLE = False
     print("[TRENDS] Hub Trends Engine not available - trends section will be skipped")
 from bs4 import BeautifulSoup
+from odds_ingest import OddsTable, get_odds
+import telemetry
 
 # Timezone handling
 try:
@@ -90,21 +92,25 @@ def fetch_with_retry(url: str, params: dict = None, timeout: int = 15, max_retri
             elif resp.status_code == 429:
                 wait_time = (2 ** attempt) + random.uniform(0, 1)
                 print(f"  [RATE LIMIT] Waiting {wait_time:.1f}s before retry...")
+                telemetry.retry(url, 'rate_limit')
                 time.sleep(wait_time)
             elif resp.status_code >= 500:
                 wait_time = (2 ** attempt) + random.uniform(0, 1)
                 print(f"  [SERVER ERROR {resp.status_code}] Retry {attempt + 1}/{max_retries}...")
+                telemetry.retry(url, 'server_error')
                 time.sleep(wait_time)
             else:
                 return None
         except requests.exceptions.Timeout:
             wait_time = (2 ** attempt) + random.uniform(0, 1)
             print(f"  [TIMEOUT] Retry {attempt + 1}/{max_retries} after {wait_time:.1f}s...")
+            telemetry.retry(url, 'timeout')
             time.sleep(wait_time)
         except requests.exceptions.RequestException as e:
             print(f"  [REQUEST ERROR] {e}")
             if attempt < max_retries - 1:
                 wait_time = (2 ** attempt) + random.uniform(0, 1)
+                telemetry.retry(url, 'error')
                 time.sleep(wait_time)
     return None
 
@@ -115,15 +121,7 @@ def fetch_with_retry(url: str, params: dict = None, timeout: int = 15, max_retri
 # ESPN provides free odds data - no API key needed!
 # ODDS_API_KEY is no longer required (previously: deeac7e7af6a8f1a5ac84c625e04973a)
 
-# ESPN odds endpoints (free, powered by DraftKings data)
-ESPN_ODDS_ENDPOINTS = {
-    'basketball_nba': 'https://site.api.espn.com/apis/v2/scoreboard/header?sport=basketball&league=nba',
-    'icehockey_nhl': 'https://site.api.espn.com/apis/v2/scoreboard/header?sport=hockey&league=nhl',
-    'americanfootball_nfl': 'https://site.api.espn.com/apis/v2/scoreboard/header?sport=football&league=nfl',
-    'baseball_mlb': 'https://site.api.espn.com/apis/v2/scoreboard/header?sport=baseball&league=mlb',
-    'basketball_ncaab': 'https://site.api.espn.com/apis/v2/scoreboard/header?sport=basketball&league=mens-college-basketball',
-    'americanfootball_ncaaf': 'https://site.api.espn.com/apis/v2/scoreboard/header?sport=football&league=college-football',
-}
+# ESPN odds endpoints (free, powered by DraftKings data) live in odds_ingest.ESPN_ODDS_ENDPOINTS
 REPO_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 OUTPUT_FILE = "handicapping-hub.html"  # Production file
 
@@ -352,7 +350,9 @@ def fetch_covers_betting_records(sport: str) -> Dict[str, Dict]:
 
     # Check cache first
     if sport.lower() in _COVERS_CACHE:
+        telemetry.cache_hit('covers_records')
         return _COVERS_CACHE[sport.lower()]
+    telemetry.cache_miss('covers_records')
 
     urls = {
         'nba': 'https://www.covers.com/sport/basketball/nba/standings',
@@ -977,101 +977,19 @@ def fetch_defensive_stats(sport_path: str, team_id: str) -> Dict:
 
     return result
 
-def fetch_odds(sport_key: str) -> List[Dict]:
-    """Fetch betting odds from ESPN (free, powered by DraftKings data)"""
-    if sport_key not in ESPN_ODDS_ENDPOINTS:
-        print(f"  [ODDS] Unknown sport key: {sport_key}")
-        return []
-
-    url = ESPN_ODDS_ENDPOINTS[sport_key]
-    print(f"  [ODDS] Fetching from ESPN: {sport_key}")
+def fetch_odds(sport_key: str) -> OddsTable:
+    """Fetch betting odds from ESPN (free, powered by DraftKings data).
 
-    resp = fetch_with_retry(url, timeout=15, max_retries=3)
-    if not resp:
-        print(f"  [ODDS] Failed to fetch ESPN data for {sport_key}")
-        return []
-
-    try:
-        data = resp.json()
-        games = []
-
-        # Navigate ESPN's response structure
-        for sport in data.get('sports', []):
-            for league in sport.get('leagues', []):
-                for event in league.get('events', []):
-                    odds_data = event.get('odds', {})
-                    if not odds_data:
-                        continue
-
-                    # Get team info from odds data
-                    away_team_data = odds_data.get('awayTeamOdds', {}).get('team', {})
-                    home_team_data = odds_data.get('homeTeamOdds', {}).get('team', {})
-
-                    # Build game object in format compatible with rest of script
-                    game = {
-                        'id': event.get('id', ''),
-                        'commence_time': event.get('date', ''),
-                        'home_team': home_team_data.get('displayName', ''),
-                        'away_team': away_team_data.get('displayName', ''),
-                        'bookmakers': [{
-                            'key': 'draftkings',
-                            'title': odds_data.get('provider', {}).get('name', 'DraftKings'),
-                            'markets': []
-                        }]
-                    }
-
-                    # Build markets array
-                    markets = game['bookmakers'][0]['markets']
-
-                    # Spreads market
-                    spread = odds_data.get('spread')
-                    if spread is not None:
-                        home_spread_odds = odds_data.get('homeTeamOdds', {}).get('spreadOdds', -110)
-                        away_spread_odds = odds_data.get('awayTeamOdds', {}).get('spreadOdds', -110)
-                        markets.append({
-                            'key': 'spreads',
-                            'outcomes': [
-                                {'name': game['home_team'], 'point': spread, 'price': home_spread_odds},
-                                {'name': game['away_team'], 'point': -spread, 'price': away_spread_odds}
-                            ]
-                        })
-
-                    # Moneyline (h2h) market
-                    home_ml = odds_data.get('homeTeamOdds', {}).get('moneyLine')
-                    away_ml = odds_data.get('awayTeamOdds', {}).get('moneyLine')
-                    if home_ml is not None and away_ml is not None:
-                        markets.append({
-                            'key': 'h2h',
-                            'outcomes': [
-                                {'name': game['home_team'], 'price': home_ml},
-                                {'name': game['away_team'], 'price': away_ml}
-                            ]
-                        })
-
-                    # Totals market
-                    total = odds_data.get('overUnder')
-                    if total is not None:
-                        over_odds = odds_data.get('overOdds', -110)
-                        under_odds = odds_data.get('underOdds', -110)
-                        markets.append({
-                            'key': 'totals',
-                            'outcomes': [
-                                {'name': 'Over', 'point': total, 'price': over_odds},
-                                {'name': 'Under', 'point': total, 'price': under_odds}
-                            ]
-                        })
-
-                    games.append(game)
-
-        print(f"  [ODDS] Found {len(games)} games with odds for {sport_key}")
-        return games
-
-    except json.JSONDecodeError as e:
-        print(f"  [ODDS] JSON decode error: {e}")
-        return []
-    except Exception as e:
-        print(f"  [ODDS] Error processing ESPN data: {e}")
-        return []
+    Goes through odds_ingest: one fetch per league per run, persisted as a
+    snapshot that generate_classic_odds and later steps reuse. The returned
+    OddsTable iterates in the old list-of-games shape.
+    """
+    table = get_odds(
+        sport_key, 'espn',
+        fetch=lambda url, params: fetch_with_retry(url, params=params, timeout=15, max_retries=3),
+    )
+    print(f"  [ODDS] Found {len(table)} games with odds for {sport_key}")
+    return table
 
 def fetch_team_injuries(sport_path: str, team_id: str) -> List[Dict]:
     """Fetch team injuries"""
@@ -1545,67 +1463,13 @@ def has_valid_odds(odds: Dict) -> bool:
         return False
     return True
 
-def match_game_odds(espn_game: Dict, odds_data: List[Dict]) -> Dict:
-    """Match ESPN game with odds data"""
-    result = {
-        'spread_away': '-',
-        'spread_home': '-',
-        'ml_away': '-',
-        'ml_home': '-',
-        'total': '-',
-    }
-
+def match_game_odds(espn_game: Dict, odds_data: OddsTable) -> Dict:
+    """Match ESPN game with odds data: event id / team pair / token lookup, no scan."""
     comp = espn_game.get('competitions', [{}])[0]
-    competitors = comp.get('competitors', [])
-
-    away_team = None
-    home_team = None
-    for team in competitors:
-        if team.get('homeAway') == 'away':
-            away_team = team.get('team', {}).get('displayName', '').lower()
-        else:
-            home_team = team.get('team', {}).get('displayName', '').lower()
-
-    if not away_team or not home_team:
-        return result
-
-    for odds_game in odds_data:
-        odds_away = odds_game.get('away_team', '').lower()
-        odds_home = odds_game.get('home_team', '').lower()
-
-        def teams_match(t1, t2):
-            t1_words = set(t1.split())
-            t2_words = set(t2.split())
-            return bool(t1_words & t2_words)
-
-        if teams_match(away_team, odds_away) and teams_match(home_team, odds_home):
-            bookmakers = odds_game.get('bookmakers', [])
-            for book in bookmakers:
-                if book.get('key') in ['fanduel', 'draftkings', 'betmgm', 'caesars', 'bovada', 'pinnacle']:
-                    markets = book.get('markets', [])
-                    for market in markets:
-                        if market.get('key') == 'spreads':
-                            for outcome in market.get('outcomes', []):
-                                if outcome.get('name', '').lower() == odds_away:
-                                    point = outcome.get('point', 0)
-                                    result['spread_away'] = f"{point:+.1f}" if point else '-'
-                                    result['spread_home'] = f"{-point:+.1f}" if point else '-'
-                        elif market.get('key') == 'h2h':
-                            for outcome in market.get('outcomes', []):
-                                price = outcome.get('price', 0)
-                                price_str = f"{price:+d}" if price else '-'
-                                if outcome.get('name', '').lower() == odds_away:
-                                    result['ml_away'] = price_str
-                                else:
-                                    result['ml_home'] = price_str
-                        elif market.get('key') == 'totals':
-                            for outcome in market.get('outcomes', []):
-                                if outcome.get('name', '').lower() == 'over':
-                                    result['total'] = outcome.get('point', '-')
-                    break
-            break
-
-    return result
+    names = {t.get('homeAway'): t.get('team', {}).get('displayName', '') for t in comp.get('competitors', [])}
+    if not names.get('away') or not names.get('home'):
+        return odds_data.display(None)
+    return odds_data.display(odds_data.find(names['away'], names['home'], espn_game.get('id')))
 
 # =============================================================================
 # GAME PROCESSING
@@ -1686,7 +1550,7 @@ def is_bowl_game(game: Dict) -> bool:
             return True
     return False
 
-def process_game(espn_game: Dict, sport: str, sport_path: str, odds_data: List[Dict], betting_records: Dict = None) -> Optional[Dict]:
+def process_game(espn_game: Dict, sport: str, sport_path: str, odds_data: OddsTable, betting_records: Dict = None) -> Optional[Dict]:
     """Process a single game with all data including new situational stats and ATS/O/U"""
     # NOTE: Do NOT skip completed games. The hub shows the full day's slate
     # with pre-game stats/odds regardless of whether games have finished.
@@ -2740,99 +2604,124 @@ def generate_game_card_mlb(game: Dict) -> str:
     </div>
     '''
 
-def _get_game_trends_html(game: Dict, sport: str) -> str:
-    """Generate trends HTML for a game card using Hub Trends Engine"""
-    if not TRENDS_AVAILABLE:
-        return ''
-    try:
-        away = game.get('away', {})
-        home = game.get('home', {})
-        odds = game.get('odds', {})
-
-        home_abbr = home.get('abbr', '')
-        away_abbr = away.get('abbr', '')
-
-        # Parse spread - determine home spread
-        spread = 0
-        for spread_key in ['spread_home', 'spread', 'line']:
-            raw_spread = odds.get(spread_key)
-            if raw_spread is not None and str(raw_spread).strip() not in ('', '-', 'N/A'):
-                try:
-                    spread = float(str(raw_spread))
-                    break
-                except (ValueError, TypeError):
-                    pass
-
-        # If no spread available, derive from moneyline
-        if spread == 0:
+def _game_trends_inputs(game: Dict) -> Dict:
+    """Hub Trends Engine keyword arguments (spread, total, streaks, win pct) for a game"""
+    away = game.get('away', {})
+    home = game.get('home', {})
+    odds = game.get('odds', {})
+
+    home_abbr = home.get('abbr', '')
+    away_abbr = away.get('abbr', '')
+
+    # Parse spread - determine home spread
+    spread = 0
+    for spread_key in ['spread_home', 'spread', 'line']:
+        raw_spread = odds.get(spread_key)
+        if raw_spread is not None and str(raw_spread).strip() not in ('', '-', 'N/A'):
             try:
-                ml_home = float(str(odds.get('ml_home', 0)).replace('+', ''))
-                ml_away = float(str(odds.get('ml_away', 0)).replace('+', ''))
-                if ml_home and ml_away:
-                    # Home favorite if ML is negative
-                    if ml_home < ml_away:
-                        spread = -1.5  # Default puck/run line for favorites
-                    elif ml_home > ml_away:
-                        spread = 1.5
+                spread = float(str(raw_spread))
+                break
             except (ValueError, TypeError):
                 pass
 
-        total = 0
-        raw_total = odds.get('total', 0)
-        if raw_total is not None and str(raw_total).strip() not in ('', '-', 'N/A'):
-            try:
-                total = float(str(raw_total).replace('O ', '').replace('U ', ''))
-            except (ValueError, TypeError):
-                total = 0
-
-        # Parse streak to integer
-        def parse_streak(s):
-            if not s or s == '-':
-                return 0
-            s = str(s).strip()
-            if s.startswith('W'):
-                try: return int(s[1:])
-                except: return 0
-            elif s.startswith('L'):
-                try: return -int(s[1:])
-                except: return 0
+    # If no spread available, derive from moneyline
+    if spread == 0:
+        try:
+            ml_home = float(str(odds.get('ml_home', 0)).replace('+', ''))
+            ml_away = float(str(odds.get('ml_away', 0)).replace('+', ''))
+            if ml_home and ml_away:
+                # Home favorite if ML is negative
+                if ml_home < ml_away:
+                    spread = -1.5  # Default puck/run line for favorites
+                elif ml_home > ml_away:
+                    spread = 1.5
+        except (ValueError, TypeError):
+            pass
+
+    total = 0
+    raw_total = odds.get('total', 0)
+    if raw_total is not None and str(raw_total).strip() not in ('', '-', 'N/A'):
+        try:
+            total = float(str(raw_total).replace('O ', '').replace('U ', ''))
+        except (ValueError, TypeError):
+            total = 0
+
+    # Parse streak to integer
+    def parse_streak(s):
+        if not s or s == '-':
             return 0
+        s = str(s).strip()
+        if s.startswith('W'):
+            try: return int(s[1:])
+            except: return 0
+        elif s.startswith('L'):
+            try: return -int(s[1:])
+            except: return 0
+        return 0
 
-        home_streak = parse_streak(home.get('stats', {}).get('streak', '-'))
-        away_streak = parse_streak(away.get('stats', {}).get('streak', '-'))
+    home_streak = parse_streak(home.get('stats', {}).get('streak', '-'))
+    away_streak = parse_streak(away.get('stats', {}).get('streak', '-'))
 
-        # Win pct from record
-        def parse_wpct(rec):
-            try:
-                parts = str(rec).replace(' ', '').split('-')
-                w = int(parts[0])
-                l = int(parts[1])
-                gp = w + l + (int(parts[2]) if len(parts) > 2 else 0)
-                return w / gp if gp > 0 else 0.5
-            except:
-                return 0.5
-
-        home_wpct = parse_wpct(home.get('record', '0-0'))
-        away_wpct = parse_wpct(away.get('record', '0-0'))
-
-        return generate_trends_html(
-            sport=sport,
-            home_abbr=home_abbr,
-            away_abbr=away_abbr,
-            home_spread=spread,
-            total=total,
-            home_streak=home_streak,
-            away_streak=away_streak,
-            home_wpct=home_wpct,
-            away_wpct=away_wpct,
-        )
+    # Win pct from record
+    def parse_wpct(rec):
+        try:
+            parts = str(rec).replace(' ', '').split('-')
+            w = int(parts[0])
+            l = int(parts[1])
+            gp = w + l + (int(parts[2]) if len(parts) > 2 else 0)
+            return w / gp if gp > 0 else 0.5
+        except:
+            return 0.5
+
+    home_wpct = parse_wpct(home.get('record', '0-0'))
+    away_wpct = parse_wpct(away.get('record', '0-0'))
+
+    return dict(
+        home_abbr=home_abbr,
+        away_abbr=away_abbr,
+        home_spread=spread,
+        total=total,
+        home_streak=home_streak,
+        away_streak=away_streak,
+        home_wpct=home_wpct,
+        away_wpct=away_wpct,
+    )
+
+
+def _get_game_trends_html(game: Dict, sport: str) -> str:
+    """Generate trends HTML for a game card using Hub Trends Engine"""
+    if not TRENDS_AVAILABLE:
+        return ''
+    try:
+        return generate_trends_html(sport=sport, **_game_trends_inputs(game))
     except Exception as e:
         print(f"  [TRENDS] Error generating trends for {game.get('away', {}).get('abbr', '?')} @ {game.get('home', {}).get('abbr', '?')}: {e}")
         return ''
 
 
-def generate_game_card(game: Dict, sport: str) -> str:
-    """Route to sport-specific card generator, then append trends"""
+def _get_slate_trends_html(games: List[Dict], sport: str) -> List[str]:
+    """Trends HTML for every game on a slate, scanned in parallel, in slate order"""
+    if not TRENDS_AVAILABLE or not games:
+        return [''] * len(games)
+    slate = []
+    for game in games:
+        try:
+            slate.append(_game_trends_inputs(game))
+        except Exception as e:
+            print(f"  [TRENDS] Error reading odds for {game.get('away', {}).get('abbr', '?')} @ {game.get('home', {}).get('abbr', '?')}: {e}")
+            slate.append(None)
+    jobs = [inputs for inputs in slate if inputs is not None]
+    with telemetry.stage(f'trends-{sport}'):
+        scanned = iter(scan_slate(sport, jobs, generate_trends_html))
+    return ['' if inputs is None else (next(scanned) or '') for inputs in slate]
+
+
+def generate_game_card(game: Dict, sport: str, trends_html: Optional[str] = None) -> str:
+    """Route to sport-specific card generator, then append trends.
+
+    trends_html is the game's precomputed trends block (see
+    _get_slate_trends_html); when None it is generated here.
+    """
     if sport == 'NFL':
         card = generate_game_card_nfl(game, 'NFL')
     elif sport == 'NCAAF':
@@ -2850,7 +2739,8 @@ def generate_game_card(game: Dict, sport: str) -> str:
 
     # Inject trends section before the closing </div> of the game card
     if TRENDS_AVAILABLE and card:
-        trends_html = _get_game_trends_html(game, sport)
+        if trends_html is None:
+            trends_html = _get_game_trends_html(game, sport)
         if trends_html:
             # Insert trends before the last </div> (closing game-card div)
             last_div = card.rfind('</div>')
@@ -2932,8 +2822,9 @@ def generate_page(all_games: Dict[str, List], date_str: str) -> str:
             continue
 
         cards_html = ""
-        for game in games:
-            cards_html += generate_game_card(game, sport)
+        slate_trends = _get_slate_trends_html(games, sport)
+        for game, trends_html in zip(games, slate_trends):
+            cards_html += generate_game_card(game, sport, trends_html)
 
         # Check if any trends were injected into the cards
         any_trends_in_sport = 'trends-section' in cards_html
@@ -3875,6 +3766,7 @@ def generate_page(all_games: Dict[str, List], date_str: str) -> str:
 # =============================================================================
 
 def main():
+    telemetry.start()
     print("=" * 60)
     print("HANDICAPPING HUB - PREVIEW WITH ADVANCED STATS")
     print("=" * 60)
@@ -3892,61 +3784,67 @@ def main():
     all_games = {}
 
     for sport, config in SPORTS.items():
-        try:
-            print(f"\n[{sport}] Processing...")
+        with telemetry.stage(sport):
+            try:
+                print(f"\n[{sport}] Processing...")
 
-            # Fetch scoreboard
-            games = fetch_espn_scoreboard(config['espn_path'])
-            print(f"  Found {len(games)} games on ESPN")
+                # Fetch scoreboard
+                with telemetry.stage('scoreboard'):
+                    games = fetch_espn_scoreboard(config['espn_path'])
+                print(f"  Found {len(games)} games on ESPN")
 
-            if not games:
-                all_games[sport] = []
-                continue
+                if not games:
+                    all_games[sport] = []
+                    continue
 
-            # Fetch odds
-            odds_data = fetch_odds(config['odds_key'])
-            print(f"  Found {len(odds_data)} games with odds")
-
-            # NEW: Fetch ATS/O/U betting records from Covers.com
-            betting_records = fetch_covers_betting_records(sport)
-
-            # Process games
-            processed = []
-            for game in games:
-                try:
-                    # Filter out All-Star / exhibition games (Feb 15, 2026 fix)
-                    if is_exhibition_game(game):
-                        skipped_name = game.get('shortName', game.get('name', 'Unknown'))
-                        print(f"  [SKIP] Exhibition/All-Star: {skipped_name}")
-                        continue
+                # Fetch odds
+                with telemetry.stage('odds'):
+                    odds_data = fetch_odds(config['odds_key'])
+                print(f"  Found {len(odds_data)} games with odds")
 
-                    # NCAAB/NCAAF filtering
-                    if sport == 'NCAAB':
-                        odds_match = match_game_odds(game, odds_data)
-                        if not is_important_ncaab_game(game, has_valid_odds(odds_match)):
-                            continue
-                    elif sport == 'NCAAF':
-                        if not is_bowl_game(game):
+                # NEW: Fetch ATS/O/U betting records from Covers.com
+                with telemetry.stage('covers'):
+                    betting_records = fetch_covers_betting_records(sport)
+
+                # Process games
+                processed = []
+                for game in games:
+                    try:
+                        # Filter out All-Star / exhibition games (Feb 15, 2026 fix)
+                        if is_exhibition_game(game):
+                            skipped_name = game.get('shortName', game.get('name', 'Unknown'))
+                            print(f"  [SKIP] Exhibition/All-Star: {skipped_name}")
                             continue
 
-                    result = process_game(game, sport, config['espn_path'], odds_data, betting_records)
-                    if result:
-                        processed.append(result)
-                except Exception as e:
-                    print(f"  [ERROR] Failed to process {sport} game: {e}")
-                    continue
+                        # NCAAB/NCAAF filtering
+                        if sport == 'NCAAB':
+                            odds_match = match_game_odds(game, odds_data)
+                            if not is_important_ncaab_game(game, has_valid_odds(odds_match)):
+                                continue
+                        elif sport == 'NCAAF':
+                            if not is_bowl_game(game):
+                                continue
+
+                        with telemetry.stage('games'):
+                            result = process_game(game, sport, config['espn_path'], odds_data, betting_records)
+                        if result:
+                            processed.append(result)
+                    except Exception as e:
+                        print(f"  [ERROR] Failed to process {sport} game: {e}")
+                        continue
 
-            all_games[sport] = processed
-            print(f"  Processed {len(processed)} games")
-        except Exception as e:
-            print(f"  [CRITICAL ERROR] Failed to process {sport} slate: {e}")
-            all_games[sport] = []
-            continue
+                all_games[sport] = processed
+                print(f"  Processed {len(processed)} games")
+            except Exception as e:
+                print(f"  [CRITICAL ERROR] Failed to process {sport} slate: {e}")
+                all_games[sport] = []
+                continue
 
     # Generate HTML
     print("\n[HTML] Generating preview page...")
     try:
-        html = generate_page(all_games, date_str)
+        with telemetry.stage('html'):
+            html = generate_page(all_games, date_str)
         
         # Add empty slate message if no games across all sports
         if not any(all_games.values()):
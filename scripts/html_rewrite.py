@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Single-pass HTML rewrite engine for the fix_*/seo_* maintenance scripts.
+
+Every maintenance fix used to walk all ~2,500 pages on its own: read, a few
+regex rewrites, write back. A sweep of N fixes read and wrote the whole site
+N times. Fixes now register a transform here instead:
+
+    from html_rewrite import transform
+
+    @transform('mobile-css', applies=lambda rel: ...)
+    def inject(rel, text):
+        return text  # new page text
+
+The engine reads each page once, runs every selected transform whose
+`applies(rel)` accepts the page (in the order given), and writes the file
+only when its bytes changed. Pages are spread over a process pool.
+--dry-run prints a unified diff instead of writing.
+
+Bytes that are not valid UTF-8 and CRLF line endings survive untouched: pages
+are decoded with surrogateescape and no newline translation.
+
+Usage:
+  python scripts/html_rewrite.py --list
+  python scripts/html_rewrite.py mobile-css nav-preview-hubs [--dry-run]
+  python scripts/html_rewrite.py --all [--workers 8] [page.html ...]
+"""
+
+import argparse
+import difflib
+import importlib
+import multiprocessing
+import os
+import sys
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO = os.path.dirname(SCRIPT_DIR)
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+SKIP_DIRS = {'.git', 'node_modules', '__pycache__', 'scripts'}
+
+# Scripts that register transforms; imported by load_transforms(), in this
+# order, which is also the --all order.
+TRANSFORM_MODULES = (
+    'fix_all_titles',
+    'seo_comprehensive_fix',
+    'fix_canonical_quality_pass',
+    'fix_nav_dropdowns_to_hubs',
+    'inject_mobile_css',
+    'trim_meta_descriptions',
+)
+
+Transform = namedtuple('Transform', 'name fn applies summary')
+Result = namedtuple('Result', 'rel applied diff error')
+
+TRANSFORMS = {}
+
+
+def all_pages(rel):
+    return True
+
+
+def root_pages(rel):
+    return '/' not in rel
+
+
+def transform(name, applies=all_pages):
+    """Register `fn(rel, text) -> text` as the rewrite named `name`.
+
+    `rel` is the page path relative to the repo root with forward slashes.
+    """
+    def register(fn):
+        summary = (fn.__doc__ or '').strip().splitlines()
+        TRANSFORMS[name] = Transform(name, fn, applies, summary[0] if summary else '')
+        return fn
+    return register
+
+
+def load_transforms():
+    for module in TRANSFORM_MODULES:
+        importlib.import_module(module)
+    return TRANSFORMS
+
+
+def html_pages():
+    """Every .html page under the repo, as sorted repo-relative paths."""
+    pages = []
+    for dirpath, dirs, files in os.walk(REPO):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        for fn in files:
+            if fn.endswith('.html'):
+                pages.append(os.path.relpath(os.path.join(dirpath, fn), REPO).replace('\\', '/'))
+    return sorted(pages)
+
+
+def rewrite_page(rel, names, dry_run=False):
+    """Apply the named transforms to one page. Returns a Result."""
+    steps = [TRANSFORMS[n] for n in names if TRANSFORMS[n].applies(rel)]
+    if not steps:
+        return Result(rel, [], None, None)
+    path = os.path.join(REPO, rel)
+    try:
+        with open(path, 'rb') as f:
+            raw = f.read()
+    except OSError as e:
+        return Result(rel, [], None, str(e))
+
+    original = raw.decode('utf-8', 'surrogateescape')
+    text = original
+    applied = []
+    for step in steps:
+        try:
+            new_text = step.fn(rel, text)
+        except Exception as e:
+            return Result(rel, [], None, f'{step.name}: {e}')
+        if new_text != text:
+            applied.append(step.name)
+            text = new_text
+
+    new_raw = text.encode('utf-8', 'surrogateescape')
+    if new_raw == raw:
+        return Result(rel, [], None, None)
+    if dry_run:
+        diff = ''.join(difflib.unified_diff(
+            original.splitlines(True), text.splitlines(True),
+            fromfile=f'a/{rel}', tofile=f'b/{rel}'))
+        return Result(rel, applied, diff, None)
+    with open(path, 'wb') as f:
+        f.write(new_raw)
+    return Result(rel, applied, None, None)
+
+
+def _rewrite_chunk(job):
+    rels, names, dry_run = job
+    return [rewrite_page(rel, names, dry_run) for rel in rels]
+
+
+def rewrite(names, pages=None, dry_run=False, workers=None):
+    """Run the named transforms over `pages` (default: every page) in one pass.
+
+    Returns one Result per page that changed or failed, in page order.
+    """
+    load_transforms()
+    unknown = [n for n in names if n not in TRANSFORMS]
+    if unknown:
+        raise KeyError(f"unknown transform(s): {', '.join(unknown)}")
+    pages = html_pages() if pages is None else list(pages)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(pages) // 50 or 1))
+    fork = 'fork' in multiprocessing.get_all_start_methods()
+    if not fork and any(TRANSFORMS[n].fn.__module__ not in TRANSFORM_MODULES for n in names):
+        # Spawned workers only re-import TRANSFORM_MODULES; a transform
+        # registered at run time (e.g. built by a factory) exists only here.
+        workers = 1
+
+    if workers == 1:
+        batches = [_rewrite_chunk((pages, names, dry_run))]
+    else:
+        size = max(1, len(pages) // (workers * 8))
+        jobs = [(pages[i:i + size], names, dry_run) for i in range(0, len(pages), size)]
+        if fork:
+            pool = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('fork'))
+        else:
+            pool = ProcessPoolExecutor(workers, initializer=load_transforms)
+        with pool:
+            batches = list(pool.map(_rewrite_chunk, jobs))
+    return [r for batch in batches for r in batch if r.applied or r.error]
+
+
+def run(names, pages=None, dry_run=False, workers=None, verbose=True):
+    """rewrite() plus the usual [rewrite] report. Returns an exit code."""
+    results = rewrite(names, pages, dry_run=dry_run, workers=workers)
+    counts = Counter(n for r in results for n in r.applied)
+    errors = [r for r in results if r.error]
+    for r in results:
+        if r.error:
+            print(f'  [ERROR] {r.rel}: {r.error}')
+        elif dry_run:
+            sys.stdout.write(r.diff)
+        elif verbose:
+            print(f"  {r.rel}: {', '.join(r.applied)}")
+    changed = len(results) - len(errors)
+    verb = 'would change' if dry_run else 'changed'
+    print(f"[rewrite] {verb} {changed} page(s)"
+          + (f" ({', '.join(f'{n}: {c}' for n, c in counts.items())})" if counts else ''))
+    return 1 if errors else 0
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Apply registered HTML rewrites in one pass.')
+    ap.add_argument('transforms', nargs='*', help='Transform names, applied in this order.')
+    ap.add_argument('--all', action='store_true', help='Apply every registered transform.')
+    ap.add_argument('--list', action='store_true', help='List registered transforms.')
+    ap.add_argument('--dry-run', action='store_true', help='Print a unified diff; write nothing.')
+    ap.add_argument('--workers', type=int, default=None)
+    ap.add_argument('--pages', nargs='+', help='Only these repo-relative pages.')
+    args = ap.parse_args(argv)
+
+    load_transforms()
+    if args.list:
+        for t in TRANSFORMS.values():
+            print(f'  {t.name:24s} {t.summary}')
+        return 0
+    names = list(TRANSFORMS) if args.all else args.transforms
+    if not names:
+        ap.error('name at least one transform, or --all')
+    try:
+        return run(names, args.pages, dry_run=args.dry_run, workers=args.workers)
+    except KeyError as e:
+        ap.error(e.args[0])
+
+
+if __name__ == '__main__':
+    # Run through the importable module so the transform scripts'
+    # `from html_rewrite import transform` registers into the same TRANSFORMS.
+    import html_rewrite
+    sys.exit(html_rewrite.main())
@@ -10,10 +10,12 @@ baseline team strength to surface only "extreme" situational records.
 import sys
 import os
 import json
+import multiprocessing
 import pickle
 import statistics
 from datetime import datetime, timedelta
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from itertools import combinations
 from typing import Dict, List, Optional, Tuple
 
@@ -21,9 +23,9 @@ from typing import Dict, List, Optional, Tuple
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 try:
-    from sellable_market_eligibility import public_trend_exclusion_reason
+    from sellable_market_eligibility import filter_public_trend_rows
 except ImportError:
-    public_trend_exclusion_reason = None
+    filter_public_trend_rows = None
 
 DATA_FILE = r"C:\Users\Nima\universal_games.pkl"
 
@@ -34,6 +36,10 @@ MAX_COMBO_DEPTH = 4
 MONSTER_PCT = 75.0
 HOT_PCT = 62.0
 
+# Slates smaller than this are scanned in-process; forking (or spawning and
+# reloading the pickle) costs more than it saves on a 2-3 game night.
+PARALLEL_MIN_GAMES = 4
+
 # Cached data
 _cached_games = None
 _cached_sport = None
@@ -69,9 +75,9 @@ def _load_games(sport: str) -> list:
         games = raw_games
 
     # Apply public trend guardrails
-    if public_trend_exclusion_reason is not None:
+    if filter_public_trend_rows is not None:
         before_guardrails = len(games)
-        games = [g for g in games if public_trend_exclusion_reason(g, sport) is None]
+        games = filter_public_trend_rows(games, sport)
         excluded_guardrails = before_guardrails - len(games)
         if excluded_guardrails > 0:
             print(f"  [TRENDS] Public guardrails suppressed {excluded_guardrails:,} unresolved/unsafe {sport} rows")
@@ -499,15 +505,17 @@ def _format_trend_description(team, venue, labels):
     desc_labels = [LABEL_MAP.get(l, l) for l in labels]
     return f"{team} {venue_str}, " + ", ".join(desc_labels)
 
-def generate_trends_html(sport, home_abbr, away_abbr, home_spread, total, home_rest=3, away_rest=3, home_streak=0, away_streak=0, home_last_won=None, away_last_won=None, home_last_gf=None, home_last_ga=None, away_last_gf=None, away_last_ga=None, home_wpct=0.5, away_wpct=0.5) -> str:
+TEAM_NAMES = {
+    "NBA": {"ATL": "Atlanta Hawks", "BOS": "Boston Celtics", "BKN": "Brooklyn Nets", "CHA": "Charlotte Hornets", "CHI": "Chicago Bulls", "CLE": "Cleveland Cavaliers", "DAL": "Dallas Mavericks", "DEN": "Denver Nuggets", "DET": "Detroit Pistons", "GSW": "Golden State Warriors", "HOU": "Houston Rockets", "IND": "Indiana Pacers", "LAC": "LA Clippers", "LAL": "Los Angeles Lakers", "MEM": "Memphis Grizzlies", "MIA": "Miami Heat", "MIL": "Milwaukee Bucks", "MIN": "Minnesota Timberwolves", "NOP": "New Orleans Pelicans", "NYK": "New York Knicks", "OKC": "Oklahoma City Thunder", "ORL": "Orlando Magic", "PHI": "Philadelphia 76ers", "PHX": "Phoenix Suns", "POR": "Portland Trail Blazers", "SAC": "Sacramento Kings", "SAS": "San Antonio Spurs", "TOR": "Toronto Raptors", "UTA": "Utah Jazz", "WAS": "Washington Wizards"},
+    "NHL": {"ANA": "Anaheim Ducks", "ARI": "Arizona Coyotes", "BOS": "Boston Bruins", "BUF": "Buffalo Sabres", "CGY": "Calgary Flames", "CAR": "Carolina Hurricanes", "CHI": "Chicago Blackhawks", "COL": "Colorado Avalanche", "CBJ": "Columbus Blue Jackets", "DAL": "Dallas Stars", "DET": "Detroit Red Wings", "EDM": "Edmonton Oilers", "FLA": "Florida Panthers", "LAK": "Los Angeles Kings", "MIN": "Minnesota Wild", "MTL": "Montreal Canadiens", "NSH": "Nashville Predators", "NJ": "New Jersey Devils", "NYI": "New York Islanders", "NYR": "New York Rangers", "OTT": "Ottawa Senators", "PHI": "Philadelphia Flyers", "PIT": "Pittsburgh Penguins", "SJS": "San Jose Sharks", "SEA": "Seattle Kraken", "STL": "St. Louis Blues", "TBL": "Tampa Bay Lightning", "TOR": "Toronto Maple Leafs", "VAN": "Vancouver Canucks", "VGK": "Vegas Golden Knights", "WSH": "Washington Capitals", "WPG": "Winnipeg Jets"},
+    "MLB": {"ARI": "Arizona Diamondbacks", "ATL": "Atlanta Braves", "BAL": "Baltimore Orioles", "BOS": "Boston Red Sox", "CHC": "Chicago Cubs", "CHW": "Chicago White Sox", "CIN": "Cincinnati Reds", "CLE": "Cleveland Guardians", "COL": "Colorado Rockies", "DET": "Detroit Tigers", "HOU": "Houston Astros", "KC": "Kansas City Royals", "LAA": "Los Angeles Angels", "LAD": "Los Angeles Dodgers", "MIA": "Miami Marlins", "MIL": "Milwaukee Brewers", "MIN": "Minnesota Twins", "NYM": "New York Mets", "NYY": "New York Yankees", "OAK": "Oakland Athletics", "ATH": "Oakland Athletics", "PHI": "Philadelphia Phillies", "PIT": "Pittsburgh Pirates", "SD": "San Diego Padres", "SF": "San Francisco Giants", "SEA": "Seattle Mariners", "STL": "St. Louis Cardinals", "TB": "Tampa Bay Rays", "TEX": "Texas Rangers", "TOR": "Toronto Blue Jays", "WSH": "Washington Nationals"}
+}
+
+def _scan_game(sport, home_abbr, away_abbr, home_spread, total, home_rest=3, away_rest=3, home_streak=0, away_streak=0, home_last_won=None, away_last_won=None, home_last_gf=None, home_last_ga=None, away_last_gf=None, away_last_ga=None, home_wpct=0.5, away_wpct=0.5) -> list:
+    """Combinatorial search for both sides of one game, best trends first"""
     games = _load_games(sport)
-    if not games: return ''
-    team_map = {
-        "NBA": {"ATL": "Atlanta Hawks", "BOS": "Boston Celtics", "BKN": "Brooklyn Nets", "CHA": "Charlotte Hornets", "CHI": "Chicago Bulls", "CLE": "Cleveland Cavaliers", "DAL": "Dallas Mavericks", "DEN": "Denver Nuggets", "DET": "Detroit Pistons", "GSW": "Golden State Warriors", "HOU": "Houston Rockets", "IND": "Indiana Pacers", "LAC": "LA Clippers", "LAL": "Los Angeles Lakers", "MEM": "Memphis Grizzlies", "MIA": "Miami Heat", "MIL": "Milwaukee Bucks", "MIN": "Minnesota Timberwolves", "NOP": "New Orleans Pelicans", "NYK": "New York Knicks", "OKC": "Oklahoma City Thunder", "ORL": "Orlando Magic", "PHI": "Philadelphia 76ers", "PHX": "Phoenix Suns", "POR": "Portland Trail Blazers", "SAC": "Sacramento Kings", "SAS": "San Antonio Spurs", "TOR": "Toronto Raptors", "UTA": "Utah Jazz", "WAS": "Washington Wizards"},
-        "NHL": {"ANA": "Anaheim Ducks", "ARI": "Arizona Coyotes", "BOS": "Boston Bruins", "BUF": "Buffalo Sabres", "CGY": "Calgary Flames", "CAR": "Carolina Hurricanes", "CHI": "Chicago Blackhawks", "COL": "Colorado Avalanche", "CBJ": "Columbus Blue Jackets", "DAL": "Dallas Stars", "DET": "Detroit Red Wings", "EDM": "Edmonton Oilers", "FLA": "Florida Panthers", "LAK": "Los Angeles Kings", "MIN": "Minnesota Wild", "MTL": "Montreal Canadiens", "NSH": "Nashville Predators", "NJ": "New Jersey Devils", "NYI": "New York Islanders", "NYR": "New York Rangers", "OTT": "Ottawa Senators", "PHI": "Philadelphia Flyers", "PIT": "Pittsburgh Penguins", "SJS": "San Jose Sharks", "SEA": "Seattle Kraken", "STL": "St. Louis Blues", "TBL": "Tampa Bay Lightning", "TOR": "Toronto Maple Leafs", "VAN": "Vancouver Canucks", "VGK": "Vegas Golden Knights", "WSH": "Washington Capitals", "WPG": "Winnipeg Jets"},
-        "MLB": {"ARI": "Arizona Diamondbacks", "ATL": "Atlanta Braves", "BAL": "Baltimore Orioles", "BOS": "Boston Red Sox", "CHC": "Chicago Cubs", "CHW": "Chicago White Sox", "CIN": "Cincinnati Reds", "CLE": "Cleveland Guardians", "COL": "Colorado Rockies", "DET": "Detroit Tigers", "HOU": "Houston Astros", "KC": "Kansas City Royals", "LAA": "Los Angeles Angels", "LAD": "Los Angeles Dodgers", "MIA": "Miami Marlins", "MIL": "Milwaukee Brewers", "MIN": "Minnesota Twins", "NYM": "New York Mets", "NYY": "New York Yankees", "OAK": "Oakland Athletics", "ATH": "Oakland Athletics", "PHI": "Philadelphia Phillies", "PIT": "Pittsburgh Pirates", "SD": "San Diego Padres", "SF": "San Francisco Giants", "SEA": "Seattle Mariners", "STL": "St. Louis Cardinals", "TB": "Tampa Bay Rays", "TEX": "Texas Rangers", "TOR": "Toronto Blue Jays", "WSH": "Washington Nationals"}
-    }
-    sport_teams = team_map.get(sport, {})
+    if not games: return []
+    sport_teams = TEAM_NAMES.get(sport, {})
     home_full = sport_teams.get(home_abbr, home_abbr)
     away_full = sport_teams.get(away_abbr, away_abbr)
     home_games = [g for g in games if g.get('HomeTeam') == home_full]
@@ -521,6 +529,25 @@ def generate_trends_html(sport, home_abbr, away_abbr, home_spread, total, home_r
     for r in home_results: r["team"] = home_full; r["venue"] = "home"; all_results.append(r)
     for r in away_results: r["team"] = away_full; r["venue"] = "away"; all_results.append(r)
     all_results.sort(key=lambda x: x["edge"] * min(x["rec"]["games"], 50), reverse=True)
+    return all_results
+
+def get_trends_for_game(sport, home_abbr, away_abbr, home_spread, total, **situation) -> list:
+    """Trend records for one game as data (verified trends publisher).
+
+    Same search as generate_trends_html; each result also carries "side",
+    "desc", "ou_edge" and over/under counts under rec["over"]/rec["under"].
+    """
+    results = _scan_game(sport, home_abbr, away_abbr, home_spread, total, **situation)
+    for r in results:
+        r["side"] = r["venue"]
+        r["desc"] = _format_trend_description(r["team"], r["venue"], r["labels"])
+        r["ou_edge"] = abs(r["rec"]["ou_pct"] - 50)
+        r["rec"]["over"] = r["rec"]["ov"]
+        r["rec"]["under"] = r["rec"]["un"]
+    return results
+
+def generate_trends_html(sport, home_abbr, away_abbr, home_spread, total, **situation) -> str:
+    all_results = _scan_game(sport, home_abbr, away_abbr, home_spread, total, **situation)
     hot_rows, monster_rows, fade_rows, ou_rows = [], [], [], []
     used_labels = set()
     for r in all_results:
@@ -546,5 +573,47 @@ def generate_trends_html(sport, home_abbr, away_abbr, home_spread, total, home_r
     html += '</div>'
     return html
 
+def _scan_job(job):
+    fn, kwargs = job
+    try:
+        return fn(**kwargs), None
+    except Exception as e:
+        return None, f"{kwargs.get('away_abbr', '?')} @ {kwargs.get('home_abbr', '?')}: {e}"
+
+def scan_slate(sport, slate, fn=get_trends_for_game, workers=None) -> list:
+    """Run fn(sport=sport, **kwargs) for every game in `slate`, across processes.
+
+    Games are independent, so the per-game combinatorial searches fan out over
+    a process pool. The sport's history is loaded once here, before the pool
+    starts: forked workers share it copy-on-write instead of each unpickling
+    universal_games.pkl. Where fork is unavailable (Windows) each spawned
+    worker loads it once in its initializer. Results come back in slate
+    order; a game that raises is logged and returns None. `workers` defaults
+    to TRENDS_WORKERS or the CPU count.
+    """
+    jobs = [(fn, dict(kwargs, sport=sport)) for kwargs in slate]
+    if workers is None:
+        workers = int(os.environ.get("TRENDS_WORKERS") or os.cpu_count() or 1)
+    workers = max(1, min(workers, len(jobs)))
+    if not _load_games(sport):
+        workers = 1
+
+    if workers == 1 or len(jobs) < PARALLEL_MIN_GAMES:
+        outcomes = [_scan_job(job) for job in jobs]
+    else:
+        if "fork" in multiprocessing.get_all_start_methods():
+            pool = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("fork"))
+        else:
+            pool = ProcessPoolExecutor(workers, initializer=_load_games, initargs=(sport,))
+        with pool:
+            outcomes = list(pool.map(_scan_job, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+
+    results = []
+    for result, error in outcomes:
+        if error:
+            print(f"  [TRENDS] Error scanning {error}")
+        results.append(result)
+    return results
+
 def get_trends_css():
     return '.historical-trends { margin-top: 25px; background: rgba(0, 0, 0, 0.2); border-radius: 12px; padding: 20px; border: 1px solid rgba(255, 255, 255, 0.05); } .trends-badge { background: #f39c12; color: #000; padding: 2px 8px; border-radius: 10px; font-size: 0.75rem; margin-left: 10px; vertical-align: middle; } .trends-table { width: 100%; border-collapse: collapse; margin-top: 10px; font-size: 0.9rem; } .trends-table th { text-align: left; padding: 8px; color: #999; font-size: 0.75rem; text-transform: uppercase; border-bottom: 1px solid rgba(255, 255, 255, 0.1); } .trends-table td { padding: 12px 8px; border-bottom: 1px solid rgba(255, 255, 255, 0.05); } .trend-tier { font-weight: 800; font-size: 0.75rem; } .tier-monster .trend-tier { color: #00f5ff; text-shadow: 0 0 8px rgba(0, 245, 255, 0.4); } .tier-hot .trend-tier { color: #f1c40f; } .tier-fade .trend-tier { color: #ff69b4; text-shadow: 0 0 8px rgba(255,105,180,0.4); } .trend-desc { color: #e0e0e0; line-height: 1.4; } .trend-record { font-family: "Courier New", monospace; color: #fff; } .trend-cover { color: #2ecc71; font-weight: 800; text-align: center; } .trend-fade { color: #ff6b6b; font-weight: 800; text-align: center; } .trend-games { color: #7f8c8d; text-align: center; } .trends-ou { margin-top: 25px; border-top: 1px solid rgba(255,255,255,0.1); padding-top: 20px; } .ou-over { color: #2ecc71; font-weight: 700; font-size: 1.05rem; } .ou-under { color: #ff6b6b; font-weight: 700; font-size: 1.05rem; }'
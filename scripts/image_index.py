@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""Persistent perceptual-hash index for pick-card and homepage images.
+
+The image validators used to compare card images by URL/path only, so the
+same photo saved under two filenames (or re-encoded as .webp) passed every
+uniqueness check. validate_pick_card_images also decoded every image and
+rebuilt its colour histogram on every run.
+
+This index stores, per image CONTENT hash (sha1 of the bytes):
+  - dhash / phash  64-bit perceptual hashes (hex)
+  - stats          the visual_checks() colour/saturation numbers
+and, per path or URL, which content hash it pointed at last time plus the
+file's size/mtime (local) or ETag/Last-Modified (remote). An unchanged local
+file is answered from the index without being read; a renamed copy of a known
+image is hashed once and reuses the stored entry. A remote URL is trusted for
+REMOTE_TTL_SECONDS, after which (or always, with max_age=0) it is revalidated
+with a conditional GET, so a changed image at the same URL is re-fingerprinted
+and an unchanged one costs a 304.
+
+Near-duplicate lookup is a BK-tree over the 64-bit hashes (Hamming metric), so
+"is anything within distance 6 of this?" visits a small fraction of the
+index instead of every entry.
+
+Stored at data/cache/image-index.json and updated in place. Needs numpy + cv2
+for new images (same as validate_pick_card_images); without them, cached
+entries still answer and new images are reported as unknown.
+
+Usage:
+  python scripts/image_index.py --update                 # index every image under images/
+  python scripts/image_index.py --dupes [--distance 6]   # list near-duplicate clusters
+  python scripts/image_index.py --query images/foo.jpg   # near matches for one image
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+IMAGES = ROOT / "images"
+INDEX_PATH = ROOT / "data" / "cache" / "image-index.json"
+
+INDEX_VERSION = 1
+IMAGE_EXTS = {".jpg", ".jpeg", ".png", ".webp"}
+# dHash distance at or below which two images are treated as the same photo.
+# 0-4 is re-encode/resize noise; crops and colour grades land around 6-10.
+NEAR_DUPLICATE_DISTANCE = 6
+REMOTE_TTL_SECONDS = 7 * 86400
+
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+class BKTree:
+    """Burkhard-Keller tree over integer hashes with Hamming distance."""
+
+    def __init__(self) -> None:
+        self._root: tuple[int, list[str], dict[int, tuple]] | None = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, value: int, key: str) -> None:
+        self._size += 1
+        if self._root is None:
+            self._root = (value, [key], {})
+            return
+        node = self._root
+        while True:
+            node_value, keys, children = node
+            dist = hamming(value, node_value)
+            if dist == 0:
+                keys.append(key)
+                return
+            child = children.get(dist)
+            if child is None:
+                children[dist] = (value, [key], {})
+                return
+            node = child
+
+    def search(self, value: int, max_distance: int) -> list[tuple[int, str]]:
+        """Return (distance, key) for every stored hash within max_distance."""
+        if self._root is None:
+            return []
+        out: list[tuple[int, str]] = []
+        stack = [self._root]
+        while stack:
+            node_value, keys, children = stack.pop()
+            dist = hamming(value, node_value)
+            if dist <= max_distance:
+                out.extend((dist, key) for key in keys)
+            lo, hi = dist - max_distance, dist + max_distance
+            stack.extend(child for d, child in children.items() if lo <= d <= hi)
+        return sorted(out)
+
+
+def _decode(data: bytes):
+    try:
+        import cv2
+        import numpy as np
+    except ImportError:
+        return None, None, None
+    img = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+    return img, cv2, np
+
+
+def _bits_to_hex(bits) -> str:
+    value = 0
+    for bit in bits.ravel():
+        value = (value << 1) | int(bool(bit))
+    return f"{value:016x}"
+
+
+def fingerprint(data: bytes) -> dict | None:
+    """dHash, pHash and colour stats for raw image bytes, or None if undecodable."""
+    img, cv2, np = _decode(data)
+    if img is None:
+        return None
+    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    small = cv2.resize(gray, (9, 8), interpolation=cv2.INTER_AREA)
+    dhash = _bits_to_hex(small[:, 1:] > small[:, :-1])
+    dct = cv2.dct(np.float32(cv2.resize(gray, (32, 32), interpolation=cv2.INTER_AREA)))[:8, :8]
+    phash = _bits_to_hex(dct > np.median(dct.ravel()[1:]))
+
+    # Same numbers validate_pick_card_images.visual_checks used to recompute.
+    sized = cv2.resize(img, (640, 360), interpolation=cv2.INTER_AREA)
+    quant = (sized // 8).astype(np.int32)
+    keys = quant[:, :, 0] * 1024 + quant[:, :, 1] * 32 + quant[:, :, 2]
+    _, counts = np.unique(keys.ravel(), return_counts=True)
+    counts = np.sort(counts)[::-1]
+    total = counts.sum()
+    sat = cv2.cvtColor(sized, cv2.COLOR_BGR2HSV)[:, :, 1]
+    return {
+        "dhash": dhash,
+        "phash": phash,
+        "width": int(img.shape[1]),
+        "height": int(img.shape[0]),
+        "stats": {
+            "top1_color_ratio": float(counts[0] / total),
+            "top3_color_ratio": float(counts[:3].sum() / total),
+            "high_saturation_ratio": float((sat > 180).mean()),
+        },
+    }
+
+
+class ImageIndex:
+    """Content-hash keyed fingerprint store with path/URL memo and BK-tree lookup."""
+
+    def __init__(self, path: Path = INDEX_PATH) -> None:
+        self.path = path
+        self.entries: dict[str, dict] = {}
+        self.sources: dict[str, dict] = {}
+        self.dirty = False
+        # Sources the last lookups could not read (missing file, failed download).
+        self.unreadable: set[str] = set()
+        self._tree: BKTree | None = None
+        if path.exists():
+            try:
+                raw = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                raw = {}
+            if raw.get("version") == INDEX_VERSION:
+                self.entries = raw.get("entries", {})
+                self.sources = raw.get("sources", {})
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "version": INDEX_VERSION,
+            "entries": dict(sorted(self.entries.items())),
+            "sources": dict(sorted(self.sources.items())),
+        }
+        self.path.write_text(json.dumps(payload, indent=1) + "\n", encoding="utf-8")
+        self.dirty = False
+
+    def _add_bytes(self, data: bytes) -> str | None:
+        sha = hashlib.sha1(data).hexdigest()
+        if sha not in self.entries:
+            fp = fingerprint(data)
+            if fp is None:
+                return None
+            self.entries[sha] = fp
+            self.dirty = True
+            if self._tree is not None:
+                self._tree.add(int(fp["dhash"], 16), sha)
+        return sha
+
+    def lookup(self, src: str, loader=None, max_age: float = REMOTE_TTL_SECONDS) -> dict | None:
+        """Fingerprint for a repo path (images/...) or URL, updating the index as needed.
+
+        Local files are re-read only when size/mtime changed. Remote URLs
+        older than `max_age` seconds are revalidated against their stored
+        ETag/Last-Modified. `loader(src) -> bytes | None` overrides how remote
+        bytes are fetched (unconditionally). A source that cannot be read is
+        added to `unreadable`.
+        """
+        memo = self.sources.get(src)
+        local = not src.startswith(("http://", "https://"))
+        if local:
+            path = ROOT / src
+            if not path.exists():
+                self.unreadable.add(src)
+                return None
+            st = path.stat()
+            stamp = {"size": st.st_size, "mtime": int(st.st_mtime)}
+            if memo and memo.get("size") == stamp["size"] and memo.get("mtime") == stamp["mtime"]:
+                entry = self.entries.get(memo["sha"])
+                if entry:
+                    return {"sha": memo["sha"], **entry}
+            data = path.read_bytes()
+        else:
+            entry = self.entries.get(memo["sha"]) if memo else None
+            if entry and time.time() - memo.get("fetched", 0) < max_age:
+                return {"sha": memo["sha"], **entry}
+            if loader is not None:
+                data, validators = loader(src), {}
+            else:
+                data, validators = fetch_remote(src, memo if entry else None)
+            if data is NOT_MODIFIED:
+                memo["fetched"] = int(time.time())
+                self.dirty = True
+                return {"sha": memo["sha"], **entry}
+            if data is None:
+                self.unreadable.add(src)
+                return None
+            stamp = {"fetched": int(time.time()), **validators}
+        sha = self._add_bytes(data)
+        if sha is None:
+            return None
+        self.sources[src] = {"sha": sha, **stamp}
+        self.dirty = True
+        return {"sha": sha, **self.entries[sha]}
+
+    def tree(self) -> BKTree:
+        if self._tree is None:
+            tree = BKTree()
+            for sha, entry in self.entries.items():
+                tree.add(int(entry["dhash"], 16), sha)
+            self._tree = tree
+        return self._tree
+
+    def near(self, dhash: str, max_distance: int = NEAR_DUPLICATE_DISTANCE) -> list[tuple[int, str]]:
+        return self.tree().search(int(dhash, 16), max_distance)
+
+    def sources_for(self, sha: str) -> list[str]:
+        return sorted(src for src, memo in self.sources.items() if memo.get("sha") == sha)
+
+
+NOT_MODIFIED = object()
+
+
+def fetch_remote(src: str, memo: dict | None = None) -> tuple:
+    """(bytes, validators) for `src`; (NOT_MODIFIED, {}) when the server says
+    `memo`'s copy is current, (None, {}) on failure."""
+    headers = {"User-Agent": "Mozilla/5.0 (BetLegend ImageIndex)", "Accept": "image/*"}
+    if memo and memo.get("etag"):
+        headers["If-None-Match"] = memo["etag"]
+    if memo and memo.get("last_modified"):
+        headers["If-Modified-Since"] = memo["last_modified"]
+    try:
+        with urllib.request.urlopen(urllib.request.Request(src, headers=headers), timeout=15) as resp:
+            data = resp.read()
+            validators = {"etag": resp.headers.get("ETag"), "last_modified": resp.headers.get("Last-Modified")}
+            return data, {k: v for k, v in validators.items() if v}
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return NOT_MODIFIED, {}
+        print(f"  [warn] could not download {src}: {e}", file=sys.stderr)
+        return None, {}
+    except Exception as e:
+        print(f"  [warn] could not download {src}: {e}", file=sys.stderr)
+        return None, {}
+
+
+def perceptual_duplicates(srcs: list[str], index: ImageIndex | None = None,
+                          max_distance: int = NEAR_DUPLICATE_DISTANCE) -> list[tuple[str, str, int]]:
+    """Pairs (a, b, distance) among `srcs` that are the same picture under different names.
+
+    Identical src strings are ignored here - path-equality checks already
+    report those. Sources that cannot be fingerprinted are skipped.
+    """
+    index = index or ImageIndex()
+    tree = BKTree()
+    found: list[tuple[str, str, int]] = []
+    for src in dict.fromkeys(srcs):
+        fp = index.lookup(src)
+        if fp is None:
+            continue
+        value = int(fp["dhash"], 16)
+        for dist, other in tree.search(value, max_distance):
+            found.append((other, src, dist))
+        tree.add(value, src)
+    index.save()
+    return found
+
+
+def local_images() -> list[str]:
+    return sorted(
+        p.relative_to(ROOT).as_posix()
+        for p in IMAGES.rglob("*")
+        if p.suffix.lower() in IMAGE_EXTS and "derived" not in p.relative_to(IMAGES).parts
+    )
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Perceptual-hash image index.")
+    ap.add_argument("--update", action="store_true", help="Index every image under images/.")
+    ap.add_argument("--dupes", action="store_true", help="Print near-duplicate clusters.")
+    ap.add_argument("--query", help="Show near matches for one image path or URL.")
+    ap.add_argument("--distance", type=int, default=NEAR_DUPLICATE_DISTANCE)
+    args = ap.parse_args()
+
+    index = ImageIndex()
+    if args.update or args.dupes:
+        started = time.perf_counter()
+        before = len(index.entries)
+        for src in local_images():
+            index.lookup(src)
+        index.save()
+        print(f"[image_index] {len(index.entries)} fingerprints ({len(index.entries) - before} new) "
+              f"in {time.perf_counter() - started:.2f}s")
+
+    if args.query:
+        fp = index.lookup(args.query)
+        index.save()
+        if fp is None:
+            print(f"[image_index] cannot fingerprint {args.query}")
+            return 1
+        for dist, sha in index.near(fp["dhash"], args.distance):
+            print(f"  d={dist:2d}  {', '.join(index.sources_for(sha)) or sha}")
+
+    if args.dupes:
+        seen: set[str] = set()
+        clusters = 0
+        for sha, entry in sorted(index.entries.items()):
+            if sha in seen:
+                continue
+            group = [s for _, s in index.near(entry["dhash"], args.distance)]
+            seen.update(group)
+            names = [src for s in group for src in index.sources_for(s)]
+            if len(names) > 1:
+                clusters += 1
+                print(f"  cluster {clusters}: " + ", ".join(names))
+        print(f"[image_index] {clusters} near-duplicate cluster(s) at distance <= {args.distance}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,11 +10,15 @@ Scans every HTML page + all sitemaps and reports:
   - duplicate <title> / meta description groups
   - thin pages (low unique text)
   - orphan pages (no inbound internal link from any HTML or data JS)
+Inbound links come from the link graph (scripts/link_graph.py), refreshed for
+changed pages only.
 Outputs JSON report to scripts/indexation_audit_report.json and a console summary.
 """
 import json, os, re, sys
 from collections import defaultdict
 
+from link_graph import LinkGraph
+
 REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DOMAIN = "https://www.betlegendpicks.com"
 EXCLUDE_DIRS = {".git", "node_modules", "scripts", ".github", ".vscode", "__pycache__"}
@@ -50,7 +54,6 @@ DESC_RE2 = re.compile(r'<meta[^>]+content=["\']([^"\']*)["\'][^>]+name=["\']desc
 ROBOTS_RE = re.compile(r'<meta[^>]+name=["\']robots["\'][^>]+content=["\']([^"\']*)["\']', re.I)
 ROBOTS_RE2 = re.compile(r'<meta[^>]+content=["\']([^"\']*)["\'][^>]+name=["\']robots["\']', re.I)
 TAG_RE = re.compile(r"<script[^>]*>.*?</script>|<style[^>]*>.*?</style>|<[^>]+>", re.S)
-LINK_RE = re.compile(r'(?:href|HREF)=["\']([^"\'#?]+\.html)["\']')
 
 def main():
     files = collect_html()
@@ -75,7 +78,6 @@ def main():
     pages = {}
     titles = defaultdict(list)
     descs = defaultdict(list)
-    inbound = defaultdict(set)
     for rel in files:
         try:
             txt = open(os.path.join(REPO, rel), encoding="utf-8", errors="ignore").read()
@@ -103,18 +105,11 @@ def main():
             titles[title].append(rel)
         if desc:
             descs[desc].append(rel)
-        # outbound internal links
-        base_dir = os.path.dirname(rel)
-        for href in LINK_RE.findall(txt):
-            if href.startswith("http"):
-                if not href.startswith(DOMAIN):
-                    continue
-                target = rel_for(href)
-            else:
-                target = os.path.normpath(os.path.join(base_dir, href)).replace("\\", "/")
-                target = target.lstrip("./")
-            if target in fileset and target != rel:
-                inbound[target].add(rel)
+
+    # inbound internal links
+    graph = LinkGraph()
+    graph.update()
+    graph.save()
 
     # data JS files that drive homepage/calendar links
     js_link_sources = []
@@ -197,7 +192,7 @@ def main():
 
     orphans = sorted(
         rel for rel in files
-        if rel not in inbound and rel not in js_refs
+        if not graph.inbound(rel) and rel not in js_refs
         and rel != "index.html" and "noindex" not in pages.get(rel, {}).get("robots", "")
     )
     report["orphan_pages"] = orphans
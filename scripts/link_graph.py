@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""Persistent internal link graph of the site.
+
+The link passes each found their own way to "which pages link where":
+build_crawl_links_pass2.py and build_static_archive.py opened every pick page
+to read its title and whether it is a redirect stub, indexation_audit.py
+regex-scanned every page for anchors, and checking a page for broken links or
+for pages nothing links to meant parsing the whole site again.
+
+This module keeps that in one store, data/cache/link-graph.json, one line
+per page:
+
+  sha      sha1 of the page bytes (a run re-parses only pages whose bytes changed)
+  links    the page's outbound <a href> targets, as repo-relative paths
+  title    raw <title> text
+  date     FORCED_PAGE_DATE, if the page sets one
+  noindex  robots meta says noindex
+  stub     meta-refresh redirect stub
+
+Anchors inside <script> blocks and HTML comments are ignored (JS templates
+such as `hasData.page` are not links). External links, mailto:, tel: and
+fragment-only links are not stored. Links to the site's own domain are stored
+as the paths they point at.
+
+Targets are resolved when the graph is loaded, against the files on disk as
+they are then: the exact path, else `<path>.html`, else `<path>/index.html`
+(GitHub Pages serves all three). Inbound edges are the reverse of the resolved
+outbound ones. Broken links, orphan pages and crawl depth are then lookups
+over the stored edges, not parses.
+
+Usage:
+  python scripts/link_graph.py                         # refresh + summary
+  python scripts/link_graph.py --broken                # unresolved internal links
+  python scripts/link_graph.py --orphans               # pages no other page links to
+  python scripts/link_graph.py --depth [--from index.html] [--max 4]
+  python scripts/link_graph.py --inbound nba-previews.html
+  python scripts/link_graph.py --outbound index.html
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import html
+import json
+import os
+import posixpath
+import re
+import sys
+from collections import defaultdict, deque
+from urllib.parse import unquote, urlsplit
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO = os.path.dirname(SCRIPT_DIR)
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+STORE_PATH = os.path.join(REPO, 'data', 'cache', 'link-graph.json')
+# Bump when link extraction or the stored page facts change.
+STORE_VERSION = 1
+
+SITE_HOSTS = {'www.betlegendpicks.com', 'betlegendpicks.com'}
+# Directories whose files are never link targets (and never walked).
+SKIP_DIRS = {'.git', 'node_modules', '__pycache__'}
+
+HIDDEN_RE = re.compile(r'<script\b.*?</script\s*>|<!--.*?-->', re.S | re.I)
+ANCHOR_RE = re.compile(r'''<a\b[^>]*?\bhref\s*=\s*(["'])(.*?)\1''', re.S | re.I)
+TITLE_RE = re.compile(r'<title[^>]*>(.*?)</title>', re.S | re.I)
+FORCED_DATE_RE = re.compile(r"FORCED_PAGE_DATE\s*=\s*'([0-9]{4}-[0-9]{2}-[0-9]{2})'")
+NOINDEX_RE = re.compile(r'name="robots"[^>]*noindex')
+
+
+def link_target(page: str, href: str) -> str | None:
+    """The repo-relative path `href` on `page` points at, or None for links
+    that leave the site or stay on the page."""
+    href = html.unescape(href).strip()
+    if not href or href.startswith('#'):
+        return None
+    parts = urlsplit(href)
+    if parts.scheme or parts.netloc:
+        if parts.scheme not in ('http', 'https', '') or parts.netloc.lower() not in SITE_HOSTS:
+            return None
+        path = '/' + parts.path.lstrip('/')
+    else:
+        path = parts.path
+    if not path:
+        return None
+    path = unquote(path)
+    if path.startswith('/'):
+        joined = path.lstrip('/')
+    else:
+        joined = posixpath.join(posixpath.dirname(page), path)
+    target = posixpath.normpath(joined) if joined else '.'
+    if target == '.':
+        target = ''
+    if path.endswith('/') and target:
+        target += '/'
+    return target or '/'
+
+
+def page_facts(page: str, text: str) -> dict:
+    """What the graph stores about one page."""
+    visible = HIDDEN_RE.sub('', text)
+    links = set()
+    for m in ANCHOR_RE.finditer(visible):
+        target = link_target(page, m.group(2))
+        if target is not None and target != page:
+            links.add(target)
+    title = TITLE_RE.search(text)
+    date = FORCED_DATE_RE.search(text)
+    return {
+        'links': sorted(links),
+        'title': title.group(1) if title else '',
+        'date': date.group(1) if date else '',
+        'noindex': bool(NOINDEX_RE.search(text)),
+        'stub': 'http-equiv="refresh"' in text[:3000],
+    }
+
+
+def site_files() -> set[str]:
+    """Every file under the repo, repo-relative."""
+    files = set()
+    for dirpath, dirs, names in os.walk(REPO):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        rel_dir = os.path.relpath(dirpath, REPO).replace('\\', '/')
+        prefix = '' if rel_dir == '.' else rel_dir + '/'
+        files.update(prefix + name for name in names)
+    return files
+
+
+class LinkGraph:
+    """sha1-keyed per-page link store, with resolved and reverse edges built on load."""
+
+    def __init__(self, path: str = STORE_PATH) -> None:
+        self.path = path
+        self.pages: dict[str, dict] = {}
+        self.dirty = False
+        self._files: set[str] | None = None
+        self._resolved: dict[str, str | None] = {}
+        self._inbound: dict[str, set[str]] | None = None
+        try:
+            with open(path, encoding='utf-8') as f:
+                raw = json.load(f)
+            if raw.get('version') == STORE_VERSION:
+                self.pages = raw.get('pages', {})
+        except (OSError, ValueError):
+            pass
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write('{"version": %d, "pages": {\n' % STORE_VERSION)
+            f.write(',\n'.join(f'{json.dumps(rel)}: {json.dumps(e, ensure_ascii=False)}'
+                               for rel, e in sorted(self.pages.items())))
+            f.write('\n}}\n')
+        os.replace(tmp, self.path)
+        self.dirty = False
+
+    def update(self, pages: list[str] | None = None) -> int:
+        """Re-parse pages whose bytes changed and drop deleted ones.
+
+        `pages` limits the pass to those pages (deleted ones among them are
+        dropped); by default every page is checked. Returns the number of
+        pages (re)parsed or dropped.
+        """
+        if pages is None:
+            from html_rewrite import html_pages
+            pages = html_pages()
+            present = set(pages)
+            gone = [rel for rel in self.pages if rel not in present]
+        else:
+            gone = [rel for rel in pages if rel in self.pages
+                    and not os.path.isfile(os.path.join(REPO, rel))]
+        changed = 0
+        for rel in pages:
+            try:
+                with open(os.path.join(REPO, rel), 'rb') as f:
+                    raw = f.read()
+            except OSError:
+                continue
+            sha = hashlib.sha1(raw).hexdigest()
+            entry = self.pages.get(rel)
+            if entry and entry['sha'] == sha:
+                continue
+            self.pages[rel] = {'sha': sha, **page_facts(rel, raw.decode('utf-8', 'replace'))}
+            changed += 1
+        for rel in gone:
+            del self.pages[rel]
+            changed += 1
+        if changed:
+            self.dirty = True
+        self._files = None
+        self._resolved = {}
+        self._inbound = None
+        return changed
+
+    # -- resolution ---------------------------------------------------------
+
+    def files(self) -> set[str]:
+        if self._files is None:
+            self._files = site_files()
+        return self._files
+
+    def resolve(self, target: str) -> str | None:
+        """The file a stored link target serves, or None if it is broken."""
+        if target in self._resolved:
+            return self._resolved[target]
+        files = self.files()
+        base = target.rstrip('/')
+        if target == '/':
+            candidates = ['index.html']
+        elif target.endswith('/'):
+            candidates = [base + '/index.html']
+        else:
+            candidates = [target, target + '.html', target + '/index.html']
+        found = next((c for c in candidates if c in files and not c.startswith('../')), None)
+        self._resolved[target] = found
+        return found
+
+    def outbound(self, page: str) -> list[str]:
+        """Resolved targets `page` links to."""
+        entry = self.pages.get(page)
+        if not entry:
+            return []
+        out = (self.resolve(t) for t in entry['links'])
+        return sorted({t for t in out if t and t != page})
+
+    def inbound(self, page: str) -> list[str]:
+        """Pages with a link that resolves to `page`."""
+        if self._inbound is None:
+            inbound = defaultdict(set)
+            for rel in self.pages:
+                for target in self.outbound(rel):
+                    inbound[target].add(rel)
+            self._inbound = inbound
+        return sorted(self._inbound.get(page, ()))
+
+    def linking_to(self, page: str) -> list[str]:
+        """Pages with a link that would serve `page`, whether or not the file
+        still exists (so it also answers "who links to this deleted page")."""
+        targets = {page}
+        if page.endswith('.html'):
+            targets.add(page[:-len('.html')])
+        if page == 'index.html':
+            targets.add('/')
+        elif page.endswith('/index.html'):
+            targets.update({page[:-len('index.html')], page[:-len('/index.html')]})
+        return [rel for rel, entry in sorted(self.pages.items())
+                if rel != page and targets.intersection(entry['links'])]
+
+    # -- queries ------------------------------------------------------------
+
+    def broken(self) -> list[tuple[str, str]]:
+        """(page, target) for every stored link that resolves to no file."""
+        return [(rel, t) for rel, entry in sorted(self.pages.items())
+                for t in entry['links'] if self.resolve(t) is None]
+
+    def orphans(self, include_stubs: bool = False) -> list[str]:
+        """Pages no other page links to (redirect stubs and noindex pages
+        are left out unless `include_stubs`)."""
+        return [rel for rel, entry in sorted(self.pages.items())
+                if not self.inbound(rel)
+                and (include_stubs or not (entry['stub'] or entry['noindex']))]
+
+    def depths(self, roots: tuple[str, ...] = ('index.html',)) -> dict[str, int]:
+        """Clicks from `roots` to every page reachable from them (BFS)."""
+        depth = {root: 0 for root in roots if root in self.pages}
+        queue = deque(depth)
+        while queue:
+            rel = queue.popleft()
+            for target in self.outbound(rel):
+                if target not in depth and target in self.pages:
+                    depth[target] = depth[rel] + 1
+                    queue.append(target)
+        return depth
+
+
+def load(refresh: bool = True) -> LinkGraph:
+    """The stored graph, brought up to date with the pages on disk."""
+    graph = LinkGraph()
+    if refresh:
+        graph.update()
+        graph.save()
+    return graph
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description='Query the internal link graph of the site.')
+    ap.add_argument('--broken', action='store_true', help='List internal links that resolve to no file.')
+    ap.add_argument('--orphans', action='store_true', help='List pages no other page links to.')
+    ap.add_argument('--depth', action='store_true', help='Crawl depth of every page from --from.')
+    ap.add_argument('--from', dest='roots', nargs='+', default=['index.html'], help='Crawl roots (default index.html).')
+    ap.add_argument('--max', type=int, default=None, help='With --depth, list pages deeper than this.')
+    ap.add_argument('--inbound', nargs='+', metavar='PAGE', help='Pages linking to PAGE.')
+    ap.add_argument('--outbound', nargs='+', metavar='PAGE', help='Pages PAGE links to.')
+    args = ap.parse_args(argv)
+
+    graph = LinkGraph()
+    refreshed = graph.update()
+    graph.save()
+    links = sum(len(e['links']) for e in graph.pages.values())
+    print(f'[links] {len(graph.pages)} page(s), {links} link(s), {refreshed} refreshed')
+
+    found = 0
+    for page in args.inbound or ():
+        # A page that is gone has no resolved inbound edges; list who still links to it.
+        rels = graph.inbound(page) if page in graph.files() else graph.linking_to(page)
+        print(f'\n  {page}: {len(rels)} inbound')
+        for rel in rels:
+            print(f'    {rel}')
+    for page in args.outbound or ():
+        rels = graph.outbound(page)
+        print(f'\n  {page}: {len(rels)} outbound')
+        for rel in rels:
+            print(f'    {rel}')
+    if args.broken:
+        broken = graph.broken()
+        found += len(broken)
+        by_target = defaultdict(list)
+        for rel, target in broken:
+            by_target[target].append(rel)
+        for target, rels in sorted(by_target.items(), key=lambda kv: (-len(kv[1]), kv[0])):
+            print(f'  [X] {target}  <- {len(rels)} page(s): {", ".join(rels[:3])}{" ..." if len(rels) > 3 else ""}')
+        print(f'[links] {len(broken)} broken link(s) to {len(by_target)} missing target(s)')
+    if args.orphans:
+        orphans = graph.orphans()
+        found += len(orphans)
+        for rel in orphans:
+            print(f'  [orphan] {rel}')
+        print(f'[links] {len(orphans)} orphan page(s)')
+    if args.depth:
+        depth = graph.depths(tuple(args.roots))
+        histogram = defaultdict(int)
+        for d in depth.values():
+            histogram[d] += 1
+        for d in sorted(histogram):
+            print(f'  depth {d}: {histogram[d]} page(s)')
+        unreachable = [rel for rel, e in graph.pages.items()
+                       if rel not in depth and not (e['stub'] or e['noindex'])]
+        print(f'  unreachable: {len(unreachable)} page(s)')
+        if args.max is not None:
+            deep = sorted((d, rel) for rel, d in depth.items() if d > args.max)
+            found += len(deep)
+            for d, rel in deep:
+                print(f'  [deep] {d}  {rel}')
+    if not (args.broken or args.orphans or args.depth or args.inbound or args.outbound):
+        print(f'[links] {len(graph.broken())} broken link(s), {len(graph.orphans())} orphan page(s), '
+              f'{len(graph.depths())} page(s) reachable from index.html')
+    return 1 if found else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -16,6 +16,12 @@ Checks:
 ESPN Scoreboard API (free, no auth required):
   https://site.api.espn.com/apis/site/v2/sports/{sport}/{league}/scoreboard?dates=YYYYMMDD
 
+Scoreboards are fetched per slate, not per file: the changed files are first
+grouped by (sport, date), each distinct scoreboard is fetched once (several
+at a time) into SCOREBOARD_CACHE, and the files are then validated against
+those preloaded games over a process pool. A push touching 30 pages from one
+slate makes one ESPN request, not 30.
+
 Usage:
   python scripts/live_content_validator.py              # reads changed_files.txt
   python scripts/live_content_validator.py file1.html   # validate specific file(s)
@@ -30,6 +36,8 @@ import re
 import sys
 import io
 import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 
 # Fix Windows console encoding
@@ -99,6 +107,17 @@ THRESHOLDS = {
     "record_wins_error": 3,
 }
 
+# Concurrent ESPN scoreboard requests
+FETCH_WORKERS = 8
+
+# Fewer changed files than this are validated in-process; forking costs more
+# than it saves on a small push. VALIDATOR_WORKERS overrides the pool size.
+PARALLEL_MIN_FILES = 8
+
+# Filenames containing any of these are not content pages
+NON_CONTENT_MARKERS = ['calendar', 'script', 'style', 'template',
+                       'mobile-optimize', 'sitemap']
+
 # =============================================================================
 # EXISTING CHECKS (preserved from original validator)
 # =============================================================================
@@ -172,6 +191,30 @@ def fetch_espn_scoreboard(sport_key, date_str):
     return games
 
 
+# (sport, YYYYMMDD) -> fetch_espn_scoreboard() result, shared by every file
+# on that slate. Filled up front by prefetch_scoreboards().
+SCOREBOARD_CACHE = {}
+
+
+def get_scoreboard(sport_key, date_str):
+    """fetch_espn_scoreboard(), requested at most once per slate per run."""
+    key = (sport_key, date_str)
+    if key not in SCOREBOARD_CACHE:
+        SCOREBOARD_CACHE[key] = fetch_espn_scoreboard(sport_key, date_str)
+    return SCOREBOARD_CACHE[key]
+
+
+def prefetch_scoreboards(slates, workers=FETCH_WORKERS):
+    """Fetch each distinct (sport, date) slate once, concurrently, into SCOREBOARD_CACHE."""
+    todo = sorted(set(slates) - set(SCOREBOARD_CACHE))
+    if not todo or not HAS_REQUESTS:
+        return
+    with ThreadPoolExecutor(max_workers=min(workers, len(todo))) as pool:
+        futures = {key: pool.submit(fetch_espn_scoreboard, *key) for key in todo}
+        for key in todo:
+            SCOREBOARD_CACHE[key] = futures[key].result()
+
+
 def parse_espn_event(event):
     """Parse a single ESPN event into a structured dict."""
     competition = event.get("competitions", [{}])[0]
@@ -723,9 +766,31 @@ def check_quotes(content, filename):
 # FILE VALIDATION
 # =============================================================================
 
-def validate_file(filepath):
+def is_non_content(filename):
+    return any(marker in filename for marker in NON_CONTENT_MARKERS)
+
+
+def file_slate(filepath):
+    """(sport, YYYYMMDD) a content file is verified against, or None."""
+    filename = os.path.basename(filepath)
+    if is_non_content(filename):
+        return None
+    try:
+        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+            content = f.read()
+    except Exception:
+        return None
+    sport = detect_sport_from_file(filepath, content)
+    date_str = extract_date_from_file(filepath, content)
+    if sport and date_str:
+        return sport, date_str
+    return None
+
+
+def validate_file(filepath, log=print):
     """
     Run all validation checks on a single HTML file.
+    Progress lines go to log(); scoreboards come from get_scoreboard().
     Returns (errors, warnings, info_messages).
     """
     errors = []
@@ -742,12 +807,11 @@ def validate_file(filepath):
     filename = os.path.basename(filepath)
 
     # Skip non-content files
-    if any(skip in filename for skip in ['calendar', 'script', 'style', 'template',
-                                          'mobile-optimize', 'sitemap']):
+    if is_non_content(filename):
         info.append(f"Skipped non-content file: {filename}")
         return errors, warnings, info
 
-    print(f"\n[{filename}]")
+    log(f"\n[{filename}]")
 
     # --- Existing checks ---
     for severity, msg in check_player_teams(content, filename):
@@ -782,16 +846,16 @@ def validate_file(filepath):
     elif not HAS_REQUESTS:
         info.append("requests library not installed - skipping live data verification")
     else:
-        print(f"  Sport: {sport.upper()} | Date: {date_str[:4]}-{date_str[4:6]}-{date_str[6:]}")
+        log(f"  Sport: {sport.upper()} | Date: {date_str[:4]}-{date_str[4:6]}-{date_str[6:]}")
 
-        espn_games = fetch_espn_scoreboard(sport, date_str)
+        espn_games = get_scoreboard(sport, date_str)
 
         if espn_games is None:
             warnings.append("ESPN API unavailable - skipping live data verification")
         elif len(espn_games) == 0:
             info.append(f"ESPN returned 0 games for {sport.upper()} on {date_str}")
         else:
-            print(f"  ESPN data: {len(espn_games)} games found for this date")
+            log(f"  ESPN data: {len(espn_games)} games found for this date")
 
             # Compare betting lines
             html_lines = extract_betting_lines_from_html(content)
@@ -809,33 +873,33 @@ def validate_file(filepath):
                     matched_count += 1
                     home_name = matched_game.get("home_short", matched_game.get("home_abbrev", ""))
                     away_name = matched_game.get("away_short", matched_game.get("away_abbrev", ""))
-                    print(f"  Matched: {away_name} at {home_name}")
+                    log(f"  Matched: {away_name} at {home_name}")
 
                     # Compare spread
                     if "spread_value" in line_entry:
                         status, msg = compare_spread(line_entry["spread_value"], matched_game)
                         if status == "ok":
-                            print(f"    Spread: HTML={line_entry['spread_value']}, "
-                                  f"ESPN={matched_game.get('spread_value', 'N/A')} {OK}")
+                            log(f"    Spread: HTML={line_entry['spread_value']}, "
+                                f"ESPN={matched_game.get('spread_value', 'N/A')} {OK}")
                         elif status == "warn":
                             warnings.append(f"[{spread_team}] {msg}")
-                            print(f"    Spread: {msg} {WARN}")
+                            log(f"    Spread: {msg} {WARN}")
                         elif status == "error":
                             errors.append(f"[{spread_team}] {msg}")
-                            print(f"    Spread: {msg} {FAIL}")
+                            log(f"    Spread: {msg} {FAIL}")
 
                     # Compare total
                     if "total" in line_entry:
                         status, msg = compare_total(line_entry["total"], matched_game)
                         if status == "ok":
-                            print(f"    O/U: HTML={line_entry['total']}, "
-                                  f"ESPN={matched_game.get('overUnder', 'N/A')} {OK}")
+                            log(f"    O/U: HTML={line_entry['total']}, "
+                                f"ESPN={matched_game.get('overUnder', 'N/A')} {OK}")
                         elif status == "warn":
                             warnings.append(f"[{spread_team}] {msg}")
-                            print(f"    O/U: {msg} {WARN}")
+                            log(f"    O/U: {msg} {WARN}")
                         elif status == "error":
                             errors.append(f"[{spread_team}] {msg}")
-                            print(f"    O/U: {msg} {FAIL}")
+                            log(f"    O/U: {msg} {FAIL}")
 
                     # Compare moneylines
                     if "ml_value1" in line_entry:
@@ -845,11 +909,11 @@ def validate_file(filepath):
                             status, msg = compare_moneyline(line_entry["ml_value1"], game1, side1)
                             if status == "error":
                                 errors.append(f"[{team1}] {msg}")
-                                print(f"    ML {team1}: {msg} {FAIL}")
+                                log(f"    ML {team1}: {msg} {FAIL}")
                             elif status == "warn":
                                 warnings.append(f"[{team1}] {msg}")
                             elif status == "ok":
-                                print(f"    ML {team1}: {line_entry['ml_value1']} {OK}")
+                                log(f"    ML {team1}: {line_entry['ml_value1']} {OK}")
 
                     if "ml_value2" in line_entry:
                         team2 = line_entry["ml_team2"]
@@ -858,17 +922,17 @@ def validate_file(filepath):
                             status, msg = compare_moneyline(line_entry["ml_value2"], game2, side2)
                             if status == "error":
                                 errors.append(f"[{team2}] {msg}")
-                                print(f"    ML {team2}: {msg} {FAIL}")
+                                log(f"    ML {team2}: {msg} {FAIL}")
                             elif status == "warn":
                                 warnings.append(f"[{team2}] {msg}")
                             elif status == "ok":
-                                print(f"    ML {team2}: {line_entry['ml_value2']} {OK}")
+                                log(f"    ML {team2}: {line_entry['ml_value2']} {OK}")
 
                 else:
                     unmatched.append(spread_team)
 
             if html_lines:
-                print(f"  {matched_count} of {len(html_lines)} betting lines matched to ESPN data")
+                log(f"  {matched_count} of {len(html_lines)} betting lines matched to ESPN data")
             if unmatched:
                 info.append(f"Unmatched teams (not in ESPN data): {', '.join(unmatched)}")
 
@@ -880,17 +944,48 @@ def validate_file(filepath):
                     status, msg = compare_record(rec["wins"], rec["losses"], espn_rec)
                     team_display = rec["team_name"]
                     if status == "ok":
-                        print(f"    {team_display} record: {rec['wins']}-{rec['losses']} {OK}")
+                        log(f"    {team_display} record: {rec['wins']}-{rec['losses']} {OK}")
                     elif status == "warn":
                         warnings.append(f"[{team_display}] {msg}")
-                        print(f"    {team_display} record: {msg} {WARN}")
+                        log(f"    {team_display} record: {msg} {WARN}")
                     elif status == "error":
                         errors.append(f"[{team_display}] {msg}")
-                        print(f"    {team_display} record: {msg} {FAIL}")
+                        log(f"    {team_display} record: {msg} {FAIL}")
 
     return errors, warnings, info
 
 
+def _validate_job(filepath):
+    lines = []
+    errors, warnings, info = validate_file(filepath, log=lines.append)
+    return lines, errors, warnings, info
+
+
+def _seed_scoreboards(cache):
+    SCOREBOARD_CACHE.update(cache)
+
+
+def validate_files(files, workers=None):
+    """validate_file() for each file over a process pool, in file order.
+
+    Call prefetch_scoreboards() first: forked workers share SCOREBOARD_CACHE
+    copy-on-write (spawned ones get a copy in their initializer), so no worker
+    fetches a scoreboard itself. Returns (log_lines, errors, warnings, info)
+    per file.
+    """
+    if workers is None:
+        workers = int(os.environ.get("VALIDATOR_WORKERS") or os.cpu_count() or 1)
+    workers = max(1, min(workers, len(files)))
+    if workers == 1 or len(files) < PARALLEL_MIN_FILES:
+        return [_validate_job(f) for f in files]
+    if "fork" in multiprocessing.get_all_start_methods():
+        pool = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("fork"))
+    else:
+        pool = ProcessPoolExecutor(workers, initializer=_seed_scoreboards, initargs=(SCOREBOARD_CACHE,))
+    with pool:
+        return list(pool.map(_validate_job, files, chunksize=max(1, len(files) // (workers * 4))))
+
+
 # =============================================================================
 # MAIN
 # =============================================================================
@@ -923,12 +1018,21 @@ def main():
     total_errors = []
     total_warnings = []
 
+    existing = [f for f in files if os.path.exists(f)]
+    slates = [s for s in map(file_slate, existing) if s]
+    if HAS_REQUESTS and slates:
+        prefetch_scoreboards(slates)
+        print(f"Fetched {len(set(slates))} ESPN scoreboard(s) for {len(slates)} file(s)")
+    results = dict(zip(existing, validate_files(existing)))
+
     for filepath in files:
-        if not os.path.exists(filepath):
+        if filepath not in results:
             print(f"\n[{filepath}] File not found - skipping")
             continue
 
-        file_errors, file_warnings, file_info = validate_file(filepath)
+        lines, file_errors, file_warnings, file_info = results[filepath]
+        for line in lines:
+            print(line)
 
         for msg in file_info:
             print(f"  [INFO] {msg}")
@@ -25,6 +25,8 @@ Install:
 """
 
 import os, sys, re, json, time, argparse, hashlib
+from bisect import bisect_left
+from collections import deque
 from datetime import datetime, timedelta
 
 try:
@@ -77,13 +79,107 @@ SPORTS = {
     "ncaab": "basketball/mens-college-basketball",
 }
 
+# ═══════════ MATCHING ═══════════
+class EntityMatcher:
+    """Aho-Corasick automaton over lowercase entity strings.
+
+    One pass over a page reports every occurrence of every pattern, overlaps
+    included - the same hits repeated str.find calls would give, without
+    rescanning the text once per player and team alias.
+    """
+
+    def __init__(self, patterns):
+        self.patterns = list(dict.fromkeys(p for p in patterns if p))
+        goto, out = [{}], [[]]
+        for pid, pat in enumerate(self.patterns):
+            s = 0
+            for ch in pat:
+                nxt = goto[s].get(ch)
+                if nxt is None:
+                    nxt = len(goto); goto[s][ch] = nxt; goto.append({}); out.append([])
+                s = nxt
+            out[s].append(pid)
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            s = queue.popleft()
+            for ch, t in goto[s].items():
+                queue.append(t)
+                f = fail[s]
+                while f and ch not in goto[f]: f = fail[f]
+                fail[t] = goto[f].get(ch, 0)
+                if out[fail[t]]: out[t] = out[t] + out[fail[t]]
+        self._goto, self._fail, self._out = goto, fail, out
+        self._pattern_set = set(self.patterns)
+
+    def __contains__(self, pattern):
+        return pattern in self._pattern_set
+
+    def occurrences(self, text):
+        """{pattern: [start, ...]} for every pattern found in text, starts ascending."""
+        goto, fail, out, pats = self._goto, self._fail, self._out, self.patterns
+        hits = {}
+        s = 0
+        for i, ch in enumerate(text):
+            while s and ch not in goto[s]: s = fail[s]
+            s = goto[s].get(ch, 0)
+            for pid in out[s]:
+                p = pats[pid]
+                hits.setdefault(p, []).append(i - len(p) + 1)
+        return hits
+
+class PageEntities:
+    """Entity hits for one page's lowercased text, with window lookups."""
+
+    def __init__(self, db, tl):
+        self.db = db; self.tl = tl
+        matcher = db.matcher()
+        self.matcher = matcher
+        self.hits = matcher.occurrences(tl)
+        rank = db.team_rank
+        self.teams = sorted((pos, key) for key in self.hits if key in rank for pos in self.hits[key])
+
+    def players(self):
+        """(first_pos, player_key) for every player named on the page, in DB order."""
+        found = []
+        for pat, keys in self.db.player_patterns.items():
+            positions = self.hits.get(pat)
+            if positions:
+                found.extend((self.db.player_order[k], positions[0], k) for k in keys)
+        return [(pos, k) for _, pos, k in sorted(found)]
+
+    def first_in(self, pattern, lo, hi):
+        """Start of the first occurrence of pattern lying wholly inside [lo, hi), else -1."""
+        if pattern not in self.matcher:
+            return self.tl.find(pattern, lo, hi)
+        positions = self.hits.get(pattern, [])
+        i = bisect_left(positions, lo)
+        if i < len(positions) and positions[i] + len(pattern) <= hi:
+            return positions[i]
+        return -1
+
+    def team_in(self, lo, hi, sport_hint=None):
+        """Longest team alias inside [lo, hi) - same pick as the old sorted substring scan."""
+        best = None
+        rank = self.db.team_rank
+        for i in range(bisect_left(self.teams, (lo, "")), len(self.teams)):
+            pos, key = self.teams[i]
+            if pos >= hi: break
+            if pos + len(key) > hi: continue
+            s, name = self.db.team_lookup[key]
+            if sport_hint and s != sport_hint: continue
+            if best is None or rank[key] < rank[best]: best = key
+        return self.db.team_lookup[best] if best else None
+
 # ═══════════ DATABASE ═══════════
 class PlayerDB:
     def __init__(self):
         self.players = {}
         self.team_lookup = {}
+        self._matcher = None
 
     def add_player(self, name, team, abbr, sport, pos="", stats=None):
+        self._matcher = None
         nl = name.lower().strip()
         key = f"{sport}:{nl}"
         self.players[key] = {
@@ -94,6 +190,7 @@ class PlayerDB:
             self.players[nl] = self.players[key]
 
     def add_team(self, sport, full, abbr, nick=""):
+        self._matcher = None
         for val in [full, abbr, nick]:
             if val and len(val) >= 2:
                 self.team_lookup[val.lower().strip()] = (sport, full)
@@ -101,15 +198,26 @@ class PlayerDB:
         if len(parts) >= 2:
             self.team_lookup[parts[-1].lower()] = (sport, full)
 
+    def matcher(self):
+        """Automaton over every player name and team alias, rebuilt only after the DB changes."""
+        if self._matcher is None:
+            self.player_patterns = {}
+            self.player_order = {}
+            for key, info in self.players.items():
+                if ":" not in key: continue
+                self.player_order[key] = len(self.player_order)
+                nl = info["name"].lower()
+                if len(nl) < 5: continue
+                self.player_patterns.setdefault(nl, []).append(key)
+            team_keys = sorted((k for k in self.team_lookup if len(k) >= 3), key=len, reverse=True)
+            self.team_rank = {k: i for i, k in enumerate(team_keys)}
+            fulls = [full.lower() for _, full in self.team_lookup.values()]
+            self._matcher = EntityMatcher([*self.player_patterns, *team_keys, *fulls])
+        return self._matcher
+
     def find_team_in_text(self, text, sport_hint=None):
         tl = text.lower()
-        for key in sorted(self.team_lookup.keys(), key=len, reverse=True):
-            if len(key) < 3: continue
-            if key in tl:
-                s, name = self.team_lookup[key]
-                if sport_hint and s != sport_hint: continue
-                return (s, name)
-        return None
+        return PageEntities(self, tl).team_in(0, len(tl), sport_hint)
 
 # ═══════════ LOADING ═══════════
 def load_espn_sport(db, sport_key):
@@ -249,30 +357,36 @@ def extract_text(fp):
     for t in soup.find_all(['script', 'style']): t.decompose()
     return soup.get_text(separator='\n', strip=True)
 
+def stat_hits(text, pat, cache):
+    """(start, end, raw) for every match of a stat pattern on the page, found once per page."""
+    hits = cache.get(pat)
+    if hits is None:
+        hits = cache[pat] = [(m.start(), m.end(), m.group(1)) for m in pat.finditer(text)]
+    return hits
+
 def scan_page(fp, db):
     errors, warnings = [], []
     text = extract_text(fp)
     if not text or len(text) < 50: return errors, warnings
     tl = text.lower()
+    page = PageEntities(db, tl)
+    stat_cache = {}
 
-    for key, info in db.players.items():
-        if ":" not in key: continue
-        name = info["name"]; nl = name.lower()
-        if len(nl) < 5: continue
-        idx = tl.find(nl)
-        if idx == -1: continue
+    for idx, key in page.players():
+        info = db.players[key]
+        name = info["name"]
 
         cs = max(0, idx-300); ce = min(len(text), idx+len(name)+300)
         ctx = text[cs:ce]; ctx_l = ctx.lower()
 
         # WRONG TEAM CHECK
-        tm = db.find_team_in_text(ctx, info["sport"])
+        tm = page.team_in(cs, ce, info["sport"])
         if tm:
             fs, ft = tm
             if fs == info["sport"] and ft.lower() != info["team"].lower():
-                pp = ctx_l.find(nl)
-                rp = ctx_l.find(info["team"].lower())
-                wp = ctx_l.find(ft.lower())
+                pp = idx
+                rp = page.first_in(info["team"].lower(), cs, ce)
+                wp = page.first_in(ft.lower(), cs, ce)
                 rd = abs(pp - rp) if rp >= 0 else 9999
                 wd = abs(pp - wp) if wp >= 0 else 9999
                 if wd < rd:
@@ -283,10 +397,13 @@ def scan_page(fp, db):
                     })
 
         # WRONG STATS CHECK
+        if not info["stats"]: continue
         for pk, (pat, psport, skey, tol) in PATTERNS.items():
             if psport != info["sport"]: continue
-            matches = pat.findall(ctx)
-            for raw in matches:
+            hits = stat_hits(text, pat, stat_cache)
+            for ms, me, raw in hits[bisect_left(hits, (cs,)):]:
+                if ms >= ce: break
+                if me > ce: continue
                 try: fv = float(raw)
                 except: continue
                 if pk in ("avg", "avg2") and fv > 1: fv /= 1000.0
@@ -1,640 +1,14 @@
-// MLB Archive Calendar Data
-// Last updated: August 22, 2026
+// MLB Archive Calendar Index
+// Last updated: October 19, 2026
 // Auto-generated by sync_calendars.py - DO NOT EDIT MANUALLY
-
-const ARCHIVE_DATA = [
-    { date: "2026-08-22", page: "astros-run-line-rays-guardians-moneylines-tigers-team-total-four-play-mlb-pick.html", title: "Astros Run Line And Rays Moneyline: Four MLB Plays" },
-    { date: "2026-08-22", page: "cease-skubal-painter-fifteen-game-saturday-mlb.html", title: "MLB Saturday: Fifteen Games And A 6.5 In The Bronx" },
-    { date: "2026-08-20", page: "cole-degrom-bieber-nine-game-thursday-mlb.html", title: "MLB Thursday: Nine Games, Cole, deGrom And Bieber" },
-    { date: "2026-08-20", page: "yankees-moneyline-cole-camden-yards-one-play-mlb-pick.html", title: "Yankees Moneyline At Camden Yards: The One MLB Play" },
-    { date: "2026-08-18", page: "rodon-returns-brewers-mariners-tuesday-fifteen-game-mlb.html", title: "MLB Tuesday: Fifteen Games, Fourteen Low Totals" },
-    { date: "2026-08-18", page: "yankees-royals-cubs-moneylines-marlins-team-total-nine-play-mlb-pick.html", title: "MLB Card: Four Moneylines, Four Unders, One Over" },
-    { date: "2026-08-17", page: "imanaga-wrigley-snell-coors-monday-eleven-game-mlb.html", title: "MLB Monday: Eleven Games, Five Unproven Arms" },
-    { date: "2026-08-17", page: "royals-moneyline-red-sox-moneyline-walks-two-play-mlb-pick.html", title: "MLB Card: Royals Moneyline, Red Sox Moneyline" },
-    { date: "2026-08-16", page: "alvarez-daikin-park-skubal-dodger-stadium-sunday-fifteen-game-mlb.html", title: "MLB Sunday: Fifteen Games, Ten Unfamiliar Arms" },
-    { date: "2026-08-16", page: "rangers-moneyline-astros-mariners-under-dodgers-team-total-three-play-mlb-pick.html", title: "MLB Card: Rangers ML, Astros Under, Dodgers Total" },
-    { date: "2026-08-15", page: "first-place-saturday-misiorowski-dodger-stadium-fifteen-game-mlb.html", title: "MLB Saturday: First Place At Dodger Stadium" },
-    { date: "2026-08-15", page: "rockies-under-yankees-tigers-rangers-moneylines-six-play-card-mlb-pick.html", title: "MLB Card: Rockies Under And Three Road Moneylines" },
-    { date: "2026-08-13", page: "angels-team-total-under-degrom-field-of-dreams-over-two-play-mlb-pick.html", title: "MLB Card: Angels Under And A Field Of Dreams Over" },
-    { date: "2026-08-13", page: "field-of-dreams-phillies-twins-degrom-sasaki-nine-game-thursday-mlb.html", title: "MLB Thursday: The Field Of Dreams Returns" },
-    { date: "2026-08-11", page: "marlins-braves-team-total-unders-rays-phillies-moneylines-eight-play-mlb-pick.html", title: "MLB Card: Marlins, Braves Unders And Rays Moneyline" },
-    { date: "2026-08-11", page: "skenes-cease-sanchez-fifteen-game-tuesday-mlb.html", title: "MLB Tuesday: Skenes, Cease And Sanchez" },
-    { date: "2026-08-10", page: "gray-elder-detmers-ten-game-monday-mlb.html", title: "MLB Monday: Gray, Elder And Detmers" },
-    { date: "2026-08-10", page: "rays-moneyline-diamondbacks-team-total-dodgers-run-line-three-play-mlb-pick.html", title: "Rays Moneyline Anchors A Three-Play MLB Card" },
-    { date: "2026-08-09", page: "brewers-run-line-red-sox-yankees-dodgers-moneylines-seven-play-card-mlb-pick.html", title: "Brewers Run Line Anchors A Seven-Play MLB Card" },
-    { date: "2026-08-09", page: "misiorowski-schlittler-webb-fifteen-game-sunday-mlb.html", title: "MLB Sunday: Misiorowski, Schlittler And Webb" },
-    { date: "2026-08-07", page: "rasmussen-gilbert-seattle-fifteen-game-friday-mlb.html", title: "MLB Friday: Rasmussen And Gilbert In Seattle" },
-    { date: "2026-08-07", page: "red-sox-run-line-guardians-cubs-tigers-moneylines-six-play-card-mlb-pick.html", title: "Red Sox Run Line Anchors A Six-Play MLB Card" },
-    { date: "2026-08-06", page: "nationals-tigers-unders-red-sox-moneyline-four-play-card-mlb-pick.html", title: "Nationals, Tigers Unders Anchor Boston ML" },
-    { date: "2026-08-06", page: "sanchez-perez-buehler-six-game-thursday-mlb.html", title: "MLB Thursday: Sanchez, Buehler And Perez" },
-    { date: "2026-08-05", page: "pirates-brewers-nrfi-under-seven-team-total-mlb-pick.html", title: "Pirates Brewers NRFI, Under And Pittsburgh Team Total" },
-    { date: "2026-08-05", page: "rangers-moneyline-bradford-return-mlb-pick.html", title: "Rangers Moneyline As Cody Bradford Returns" },
-    { date: "2026-08-05", page: "skenes-imanaga-gray-fifteen-game-wednesday-mlb.html", title: "MLB Wednesday: Imanaga, Skenes And A 7 In Milwaukee" },
-    { date: "2026-08-04", page: "reds-team-total-over-dodgers-mariners-moneylines-four-play-card-mlb-pick.html", title: "Reds Team Total Over Plus Dodgers And Mariners Moneylines" },
-    { date: "2026-08-04", page: "skubal-melton-hughes-fifteen-game-tuesday-mlb.html", title: "MLB Tuesday: Skubal At Wrigley, Melton In Seattle" },
-    { date: "2026-08-03", page: "boyd-schlittler-caminero-coors-eight-game-monday-mlb.html", title: "MLB Monday Board: Boyd, Schlittler And Coors" },
-    { date: "2026-08-03", page: "brewers-yankees-moneylines-schlittler-sproat-two-play-card-mlb-pick.html", title: "Brewers And Yankees Moneylines: Two-Play Card" },
-    { date: "2026-08-01", page: "phillies-tigers-yankees-guardians-dodgers-five-moneylines-mlb-pick.html", title: "Five MLB Moneylines On A Loaded Saturday Card" },
-    { date: "2026-08-01", page: "tolle-yamamoto-chavez-ravine-fifteen-game-saturday-mlb.html", title: "Tolle Meets Yamamoto And A Fifteen-Game MLB Saturday" },
-    { date: "2026-07-30", page: "giants-twice-red-sox-gray-braves-padres-team-total-unders-mlb-pick.html", title: "Giants Twice In San Diego Lead A Three-Play Thursday" },
-    { date: "2026-07-30", page: "sasaki-woo-duel-ten-game-thursday-mlb.html", title: "Sasaki, Woo And A Ten-Game MLB Thursday" },
-    { date: "2026-07-29", page: "sale-braves-moneyline-yankees-red-sox-mariners-dodgers-under-mlb-pick.html", title: "Sale's Delayed Start Anchors A Four-Play Wednesday" },
-    { date: "2026-07-29", page: "schlittler-sale-doubleheader-wesneski-debut-wednesday-mlb.html", title: "Sale's Doubleheader Start Headlines MLB Wednesday" },
-    { date: "2026-07-28", page: "cole-kay-division-leaders-melton-rea-king-lorenzen-tuesday-mlb.html", title: "Yankees-White Sox Headline Tuesday's MLB Slate" },
-    { date: "2026-07-28", page: "mets-team-total-yankees-moneyline-tigers-cardinals-padres-unders-tuesday-mlb-pick.html", title: "Mets TT, Yankees ML Headline A Five-Play Tuesday" },
-    { date: "2026-07-25", page: "cubs-mets-team-total-unders-dodgers-mariners-rangers-unders-card-mlb-pick.html", title: "Cubs, Mets Unders Plus Two Game Totals" },
-    { date: "2026-07-25", page: "skenes-yamamoto-imanaga-saturday-eight-game-board-mlb.html", title: "MLB Saturday: Skenes, Yamamoto and Imanaga Headline" },
-    { date: "2026-07-24", page: "cardinals-yankees-moneylines-giants-first-five-card-mlb-pick.html", title: "Cardinals, Yankees Moneylines And A Giants First-Five" },
-    { date: "2026-07-24", page: "guardians-rangers-team-total-unders-athletics-twins-over-card-mlb-pick.html", title: "MLB Totals Card: Team-Total Unders and a Twins Over" },
-    { date: "2026-07-24", page: "schlittler-luzardo-headline-fifteen-game-friday-board-mlb.html", title: "Schlittler-Luzardo Headline a 15-Game Friday" },
-    { date: "2026-07-22", page: "bronx-fenway-doubleheaders-nine-game-wednesday-night-board-mlb.html", title: "Two Doubleheaders And Nine Night Games: MLB Board" },
-    { date: "2026-07-22", page: "guardians-rays-yankees-moneylines-bronx-nightcap-card-mlb-pick.html", title: "Guardians, Rays And Yankees Moneylines" },
-    { date: "2026-07-22", page: "marlins-astros-under-eight-alcantara-lambert-card-mlb-pick.html", title: "Marlins At Astros Under 8" },
-    { date: "2026-07-21", page: "chase-burns-red-sox-streak-fifteen-game-tuesday-board-mlb.html", title: "Chase Burns And Boston's Streak: MLB Board" },
-    { date: "2026-07-21", page: "dodgers-phillies-rays-blue-jays-unders-guardians-mariners-moneylines-card-mlb-pick.html", title: "Two MLB Unders And Two Moneylines" },
-    { date: "2026-07-21", page: "red-sox-yankees-brewers-diamondbacks-moneylines-card-mlb-pick.html", title: "Red Sox, Yankees, Brewers and Diamondbacks Moneylines Card" },
-    { date: "2026-07-20", page: "brewers-rockies-diamondbacks-moneylines-rays-blue-jays-nrfi-card-mlb-pick.html", title: "Brewers, Rockies, Dbacks ML and Rays-Jays NRFI Card" },
-    { date: "2026-07-20", page: "misiorowski-degrom-sanchez-duels-monday-fifteen-game-board-mlb.html", title: "Misiorowski deGrom Sanchez Monday MLB Board" },
-    { date: "2026-07-20", page: "twins-guardians-rays-blue-jays-unders-red-sox-rangers-team-totals-card-mlb-pick.html", title: "Twins-Guardians, Rays-Jays Unders and Two Team Totals" },
-    { date: "2026-07-19", page: "cardinals-team-total-under-nationals-moneyline-giants-mariners-under-card-mlb-pick.html", title: "Cardinals TT Under, Nationals ML, Mariners Under 7.5" },
-    { date: "2026-07-19", page: "dodgers-yankees-nightcap-skenes-guardians-sunday-board-mlb.html", title: "Dodgers Yankees Nightcap MLB Sunday Board Analysis" },
-    { date: "2026-07-18", page: "brewers-cardinals-angels-mariners-saturday-run-prevention-board-mlb.html", title: "Brewers and Cardinals Run Prevention Board" },
-    { date: "2026-07-18", page: "cardinals-diamondbacks-under-brewers-angels-unders-giants-run-line-card-mlb-pick.html", title: "Brewers, Angels Unders and the Giants Run Line: MLB Card" },
-    { date: "2026-07-17", page: "dodgers-yankees-under-9-guardians-moneyline-second-half-opener-card-mlb-pick.html", title: "Dodgers-Yankees Under 9, Guardians Moneyline, Orioles and Rangers Unders and a Coors Over: A Five-Play MLB Card" },
-    { date: "2026-07-17", page: "sasaki-cole-sale-alcantara-second-half-opener-fifteen-game-board-mlb.html", title: "MLB Second-Half Opener: Sasaki, Cole and Sale" },
-    { date: "2026-07-12", page: "athletics-team-total-under-phillies-tigers-nrfi-first-five-unders-card-mlb-pick.html", title: "Athletics Team Total Under and Phillies-Tigers Unders Stack" },
-    { date: "2026-07-12", page: "cardinals-giants-white-sox-blue-jays-moneylines-mariners-run-line-sides-card-mlb-pick.html", title: "Cardinals, Giants, White Sox and Blue Jays Moneylines Sides Card" },
-    { date: "2026-07-12", page: "skenes-wheeler-skubal-brewers-dodgers-sunday-fifteen-game-mlb.html", title: "MLB Analysis: Skenes and Skubal Headline Sunday" },
-    { date: "2026-07-11", page: "diamondbacks-tigers-rangers-unders-petco-nrfi-run-prevention-card-mlb-pick.html", title: "Diamondbacks, Tigers, Rangers Unders + a Petco NRFI" },
-    { date: "2026-07-11", page: "tigers-streak-sanchez-yamamoto-sixteen-game-saturday-board-mlb.html", title: "MLB Saturday Board July 11, 2026: Sanchez, Yamamoto" },
-    { date: "2026-07-11", page: "yankees-phillies-road-moneylines-schlittler-sanchez-sides-card-mlb-pick.html", title: "Yankees and Phillies Road Moneylines Sides Card" },
-    { date: "2026-07-10", page: "braves-giants-white-sox-moneylines-dodgers-run-line-sides-card-mlb-pick.html", title: "Braves, Giants and White Sox Moneylines Plus the Dodgers Run Line" },
-    { date: "2026-07-10", page: "cardinals-diamondbacks-rockies-unders-nrfi-run-prevention-card-mlb-pick.html", title: "Cardinals, Diamondbacks and Rockies Unders Plus a Mariners NRFI" },
-    { date: "2026-07-10", page: "ohtani-dodgers-diamondbacks-fifteen-game-friday-board-mlb.html", title: "MLB Friday Preview: Ohtani Headlines A 15-Game Board" },
-    { date: "2026-07-09", page: "bryce-miller-marlins-mariners-tigers-athletics-mlb.html", title: "Thursday MLB Board: Miller, Valdez And The Arms" },
-    { date: "2026-07-09", page: "tigers-moneyline-marlins-team-total-under-two-play-mlb-pick.html", title: "Tigers Moneyline and Marlins Team Total Under MLB Pick" },
-    { date: "2026-07-08", page: "brewers-moneyline-nationals-team-total-over-sides-card-mlb-pick.html", title: "Brewers Moneyline and a Nationals Team Total Over" },
-    { date: "2026-07-08", page: "chase-burns-mcclanahan-cole-webb-fifteen-game-wednesday-board-mlb.html", title: "MLB Preview: A 15-Game Wednesday Board" },
-    { date: "2026-07-08", page: "yankees-rays-giants-blue-jays-twins-unders-run-prevention-card-mlb-pick.html", title: "Yankees-Rays, Giants-Blue Jays and Twins Unders" },
-    { date: "2026-07-07", page: "braves-athletics-angels-team-total-unders-nrfi-run-prevention-card-mlb-pick.html", title: "Braves, Athletics, Angels Unders and a Rangers NRFI" },
-    { date: "2026-07-07", page: "dodgers-run-line-white-sox-giants-moneylines-card-mlb-pick.html", title: "Dodgers Run Line, White Sox and Giants Moneylines" },
-    { date: "2026-07-07", page: "skenes-degrom-skubal-wheeler-fifteen-game-tuesday-board-mlb.html", title: "MLB Tuesday Board: Full 15-Game Slate" },
-    { date: "2026-07-06", page: "brewers-dbacks-yankees-jays-monday-unders-run-prevention-card-mlb-pick.html", title: "Brewers, Diamondbacks, Yankees and Blue Jays Unders" },
-    { date: "2026-07-06", page: "phillies-dodgers-monday-moneylines-card-mlb-pick.html", title: "Phillies and Dodgers Moneylines" },
-    { date: "2026-07-06", page: "schlittler-sanchez-freeland-monday-eight-game-board-mlb.html", title: "MLB Monday Board: Full 8-Game Slate" },
-    { date: "2026-07-05", page: "brewers-guardians-red-sox-sunday-moneylines-card-mlb-pick.html", title: "Brewers, Guardians and Red Sox Moneylines" },
-    { date: "2026-07-05", page: "rockies-team-total-under-blue-jays-mariners-rays-astros-unders-card-mlb-pick.html", title: "Rockies Team Total Under and Three MLB Unders" },
-    { date: "2026-07-05", page: "rodriguez-bibee-suarez-sunday-fifteen-game-board-mlb.html", title: "MLB Sunday Board: Full 15-Game Slate" },
-    { date: "2026-07-04", page: "braves-giants-brewers-marlins-moneylines-dodgers-run-line-card-mlb-pick.html", title: "Braves, Brewers, Marlins Moneylines and a Dodgers Run Line" },
-    { date: "2026-07-04", page: "padres-mets-white-sox-team-total-unders-run-prevention-card-mlb-pick.html", title: "Padres, Mets, White Sox Team Total Unders" },
-    { date: "2026-07-04", page: "sale-braves-rasmussen-rays-yamamoto-dodgers-fourth-of-july-fifteen-game-mlb.html", title: "MLB Fourth of July Board - July 4, 2026" },
-    { date: "2026-07-03", page: "ohtani-rays-astros-marlins-friday-board-mlb.html", title: "MLB Friday Board: Ohtani, Rays, Marlins, Mariners" },
-    { date: "2026-07-03", page: "padres-dodgers-blue-jays-mariners-unders-astros-team-total-under-card-mlb-pick.html", title: "Three-Play MLB Run-Prevention Unders Card" },
-    { date: "2026-07-03", page: "rays-marlins-moneylines-athletics-over-padres-dodgers-nrfi-card-mlb-pick.html", title: "Rays, Marlins Moneylines, A's Over and a NRFI" },
-    { date: "2026-07-02", page: "dodgers-mariners-run-lines-padres-white-sox-unders-nrfi-card-mlb-pick.html", title: "Dodgers -1 and Mariners -1 Headline a Six-Play MLB Card: Padres, White Sox Unders and Tigers-Rangers NRFI" },
-    { date: "2026-07-02", page: "dodgers-padres-brewers-braves-thursday-nine-game-board-mlb.html", title: "MLB Analysis - July 2, 2026" },
-    { date: "2026-07-01", page: "braves-marlins-rays-moneylines-england-world-cup-card-mlb-pick.html", title: "Braves, Marlins, Rays Moneylines and England World Cup Pick" },
-    { date: "2026-07-01", page: "skenes-wheeler-duel-mlb-unders-reds-brewers-royals-card-mlb-pick.html", title: "Skenes-Wheeler Duel Headlines Five MLB Unders Pick" },
-    { date: "2026-07-01", page: "skenes-wheeler-meyer-unbeaten-wednesday-pitching-board-mlb.html", title: "MLB Analysis - July 1, 2026" },
-    { date: "2026-06-30", page: "dodgers-brewers-moneylines-phillies-run-line-braves-over-card-mlb-pick.html", title: "Dodgers, Brewers ML, Phillies Run Line, Braves Over Pick" },
-    { date: "2026-06-30", page: "mlb-totals-unders-board-skubal-degrom-woo-card-mlb-pick.html", title: "MLB Unders Board: Seven Run-Prevention Totals" },
-    { date: "2026-06-30", page: "skubal-degrom-sanchez-fifteen-game-tuesday-pitching-board-mlb.html", title: "MLB Tuesday Pitching Board: Skubal, deGrom, Sanchez" },
-    { date: "2026-06-29", page: "cubs-guardians-astros-moneyline-mariners-run-line-card-mlb-pick.html", title: "Cubs, Guardians, Astros ML and Mariners Run Line Pick" },
-    { date: "2026-06-29", page: "parker-messick-shota-imanaga-monday-mlb-board-mlb.html", title: "MLB Analysis - June 29, 2026" },
-    { date: "2026-06-29", page: "rangers-dodgers-team-total-unders-red-sox-over-card-mlb-pick.html", title: "Rangers, Dodgers Unders and Red Sox Over Pick" },
-    { date: "2026-06-28", page: "athletics-team-total-over-4-5-angels-civale-aldegheri-angel-stadium-mlb-pick.html", title: "Athletics Team Total Over vs Angels MLB Pick" },
-    { date: "2026-06-28", page: "braves-giants-under-7-5-sale-ray-oracle-park-mlb-pick.html", title: "Braves and Giants Under 7.5 at Oracle Park MLB Pick" },
-    { date: "2026-06-28", page: "brewers-moneyline-cubs-woodruff-rolison-american-family-field-mlb-pick.html", title: "Brewers Moneyline vs Cubs MLB Pick" },
-    { date: "2026-06-28", page: "diamondbacks-team-total-under-3-5-rays-kelly-rasmussen-tropicana-field-mlb-pick.html", title: "Diamondbacks Team Total Under vs Rays MLB Pick" },
-    { date: "2026-06-28", page: "mariners-guardians-under-7-5-hancock-williams-progressive-field-mlb-pick.html", title: "Mariners and Guardians Under 7.5 MLB Pick" },
-    { date: "2026-06-28", page: "twins-team-total-over-4-5-rockies-feltner-prielipp-target-field-mlb-pick.html", title: "Twins Team Total Over vs Rockies MLB Pick" },
-    { date: "2026-06-28", page: "yankees-red-sox-under-8-rodon-gray-fenway-park-mlb-pick.html", title: "Yankees and Red Sox Under 8 MLB Pick" },
-    { date: "2026-06-27", page: "brewers-moneyline-cubs-team-total-under-harrison-peterson-american-family-field-mlb-pick.html", title: "Brewers Moneyline and Cubs Team Total Under MLB Pick" },
-    { date: "2026-06-27", page: "giants-moneyline-braves-team-total-under-webb-elder-oracle-park-mlb-pick.html", title: "Giants Moneyline and Braves Team Total Under MLB Pick" },
-    { date: "2026-06-27", page: "harrison-yamamoto-webb-thirteen-game-saturday-board-mlb.html", title: "MLB Saturday Pitching Board Analysis Preview" },
-    { date: "2026-06-27", page: "padres-team-total-under-mariners-guardians-under-yamamoto-gilbert-mlb-pick.html", title: "Padres Team Total Under and Mariners Guardians Under MLB Pick" },
-    { date: "2026-06-26", page: "athletics-angels-over-ginn-urena-angel-stadium-mlb-pick.html", title: "Athletics Angels Over 8.5 MLB Pick" },
-    { date: "2026-06-26", page: "brewers-run-line-cubs-team-total-under-misiorowski-rea-american-family-field-mlb-pick.html", title: "Brewers Run Line and Cubs Team Total Under MLB Pick" },
-    { date: "2026-06-26", page: "cubs-brewers-dodgers-padres-misiorowski-sasaki-friday-board-mlb.html", title: "MLB Friday Pitching Board Analysis Preview" },
-    { date: "2026-06-26", page: "dodgers-moneyline-padres-team-total-under-sasaki-buehler-petco-park-mlb-pick.html", title: "Dodgers Moneyline and Padres Team Total Under MLB Pick" },
-    { date: "2026-06-26", page: "mariners-guardians-under-castillo-cantillo-progressive-field-mlb-pick.html", title: "Mariners Guardians Under 7.5 MLB Pick" },
-    { date: "2026-06-26", page: "rays-moneyline-diamondbacks-martinez-gallen-tampa-bay-mlb-pick.html", title: "Rays Moneyline vs Diamondbacks MLB Pick" },
-    { date: "2026-06-26", page: "twins-team-total-over-rockies-sugano-target-field-mlb-pick.html", title: "Twins Team Total Over 4.5 MLB Pick" },
-    { date: "2026-06-26", page: "yankees-moneyline-red-sox-warren-tolle-fenway-park-mlb-pick.html", title: "Yankees Moneyline vs Red Sox MLB Pick" },
-    { date: "2026-06-25", page: "astros-moneyline-tigers-game-under-altuve-melton-comerica-mlb-pick.html", title: "Astros Moneyline and Astros Tigers Under 9 MLB Pick" },
-    { date: "2026-06-25", page: "blue-jays-moneyline-rangers-gausman-gore-rogers-centre-mlb-pick.html", title: "Blue Jays Moneyline vs Rangers MLB Pick" },
-    { date: "2026-06-25", page: "giants-moneyline-athletics-roupp-springs-oracle-park-mlb-pick.html", title: "Giants Moneyline vs Athletics MLB Pick" },
-    { date: "2026-06-25", page: "phillies-moneyline-nationals-team-total-under-sanchez-cavalli-mlb-pick.html", title: "Phillies Moneyline and Nationals Team Total Under MLB Pick" },
-    { date: "2026-06-25", page: "phillies-sanchez-yankees-schlittler-thursday-pitching-board-mlb.html", title: "MLB Thursday Pitching Board Analysis Preview" },
-    { date: "2026-06-25", page: "yankees-moneyline-red-sox-team-total-under-schlittler-fenway-mlb-pick.html", title: "Yankees Moneyline and Red Sox Team Total Under MLB Pick" },
-    { date: "2026-06-24", page: "rays-moneyline-royals-jax-cameron-tropicana-field-mlb-pick.html", title: "Rays Moneyline vs Royals MLB Pick" },
-    { date: "2026-06-24", page: "skubal-ohtani-degrom-aces-headline-sixteen-game-wednesday-mlb.html", title: "MLB Analysis - June 24, 2026" },
-    { date: "2026-06-24", page: "twins-team-total-under-dodgers-ohtani-target-field-mlb-pick.html", title: "Twins Team Total Under vs Dodgers MLB Pick" },
-    { date: "2026-06-23", page: "cubs-vs-mets-mlb-analysis-stats-preview.html", title: "Cubs vs Mets MLB Analysis, Stats, Preview" },
-    { date: "2026-06-23", page: "giants-athletics-under-9-civale-ray-oracle-park-mlb-pick.html", title: "Giants Athletics Under 9 Pick" },
-    { date: "2026-06-23", page: "rays-mcclanahan-cubs-cabrera-mets-senga-mlb-tuesday-board-mlb.html", title: "MLB Analysis - June 23, 2026" },
-    { date: "2026-06-23", page: "rays-moneyline-royals-mcclanahan-avila-mlb-pick.html", title: "Rays Moneyline vs Royals Pick" },
-    { date: "2026-06-22", page: "astros-blue-jays-under-7-brown-cease-rogers-centre-mlb-pick.html", title: "Astros Blue Jays Under 7 Pick" },
-    { date: "2026-06-22", page: "astros-vs-blue-jays-mlb-analysis-stats-preview.html", title: "Astros vs Blue Jays MLB Analysis, Stats, Preview" },
-    { date: "2026-06-22", page: "braves-padres-under-7-5-holmes-king-petco-park-mlb-pick.html", title: "Braves Padres Under 7.5 Pick" },
-    { date: "2026-06-22", page: "brewers-moneyline-reds-woodruff-singer-great-american-ball-park-mlb-pick.html", title: "Brewers Moneyline vs Reds Pick" },
-    { date: "2026-06-22", page: "brewers-reds-yankees-tigers-rays-royals-monday-board-mlb.html", title: "MLB Analysis - June 22, 2026" },
-    { date: "2026-06-22", page: "guardians-white-sox-under-8-williams-kay-rate-field-mlb-pick.html", title: "Guardians White Sox Under 8 Pick" },
-    { date: "2026-06-22", page: "rays-moneyline-royals-rasmussen-wacha-tropicana-field-mlb-pick.html", title: "Rays Moneyline vs Royals Pick" },
-    { date: "2026-06-22", page: "red-sox-team-total-under-6-5-rockies-bennett-feltner-coors-field-mlb-pick.html", title: "Red Sox Team Total Under 6.5 Pick" },
-    { date: "2026-06-22", page: "yankees-moneyline-tigers-cole-valdez-comerica-park-mlb-pick.html", title: "Yankees Moneyline vs Tigers Pick" },
-    { date: "2026-06-21", page: "angels-athletics-over-9-detmers-perkins-sutter-health-park-mlb-pick.html", title: "Angels/Athletics Over 9 Pick" },
-    { date: "2026-06-21", page: "brewers-braves-division-leaders-wheeler-snb-sunday-board-mlb.html", title: "MLB Analysis - June 21, 2026" },
-    { date: "2026-06-21", page: "cardinals-moneyline-royals-may-kolek-kauffman-stadium-mlb-pick.html", title: "Cardinals Moneyline vs Royals Pick" },
-    { date: "2026-06-21", page: "mets-vs-phillies-mlb-analysis-stats-preview.html", title: "Mets vs Phillies MLB Analysis, Stats, Preview" },
-    { date: "2026-06-21", page: "phillies-moneyline-mets-wheeler-peterson-citizens-bank-park-mlb-pick.html", title: "Phillies Moneyline vs Mets Pick" },
-    { date: "2026-06-20", page: "brewers-braves-skenes-yamamoto-saturday-board-mlb.html", title: "MLB Analysis - June 20, 2026" },
-    { date: "2026-06-20", page: "mets-team-total-under-3-5-phillies-sanchez-citizens-bank-park-mlb-pick.html", title: "Mets Team Total Under 3.5 vs Phillies Pick" },
-    { date: "2026-06-20", page: "rockies-team-total-under-4-5-pirates-skenes-coors-field-mlb-pick.html", title: "Rockies Team Total Under 4.5 vs Pirates Pick" },
-    { date: "2026-06-19", page: "brewers-braves-padres-rangers-degrom-friday-board-mlb.html", title: "MLB Analysis - June 19, 2026" },
-    { date: "2026-06-19", page: "brewers-moneyline-braves-misiorowski-perez-truist-park-mlb-pick.html", title: "Brewers Moneyline vs Braves Pick" },
-    { date: "2026-06-19", page: "brewers-vs-braves-mlb-analysis-stats-preview.html", title: "Brewers vs Braves MLB Analysis, Stats, Preview" },
-    { date: "2026-06-19", page: "dodgers-run-line-orioles-sasaki-gibson-dodger-stadium-mlb-pick.html", title: "Dodgers Run Line -1.5 vs Orioles Pick" },
-    { date: "2026-06-19", page: "giants-run-line-marlins-roupp-bachar-loandepot-park-mlb-pick.html", title: "Giants Run Line +1.5 vs Marlins Pick" },
-    { date: "2026-06-19", page: "padres-team-total-under-3-5-rangers-degrom-globe-life-field-mlb-pick.html", title: "Padres Team Total Under 3.5 vs Rangers Pick" },
-    { date: "2026-06-19", page: "yankees-run-line-reds-schlittler-lowder-yankee-stadium-mlb-pick.html", title: "Yankees Run Line -1.5 vs Reds Pick" },
-    { date: "2026-06-18", page: "angels-athletics-under-10-gage-jump-sutter-health-park-mlb-pick.html", title: "Angels/Athletics Under 10 Pick" },
-    { date: "2026-06-18", page: "brewers-braves-yankees-mariners-thursday-board-mlb.html", title: "MLB Analysis - June 18, 2026" },
-    { date: "2026-06-18", page: "cardinals-royals-over-8-5-liberatore-cameron-kauffman-stadium-mlb-pick.html", title: "Cardinals/Royals Over 8.5 Pick" },
-    { date: "2026-06-18", page: "giants-team-total-over-3-5-braves-roupp-perez-truist-park-mlb-pick.html", title: "Giants Team Total Over 3.5 vs Braves Pick" },
-    { date: "2026-06-18", page: "guardians-brewers-under-7-5-messick-drohan-american-family-field-mlb-pick.html", title: "Guardians/Brewers Under 7.5 Pick" },
-    { date: "2026-06-18", page: "mariners-moneyline-orioles-woo-baz-t-mobile-park-mlb-pick.html", title: "Mariners Moneyline vs Orioles Pick" },
-    { date: "2026-06-18", page: "red-sox-team-total-under-4-5-blue-jays-yesavage-fenway-park-mlb-pick.html", title: "Red Sox Team Total Under 4.5 vs Blue Jays Pick" },
-    { date: "2026-06-18", page: "yankees-moneyline-white-sox-weathers-burke-yankee-stadium-mlb-pick.html", title: "Yankees Moneyline vs White Sox Pick" },
-    { date: "2026-06-17", page: "brewers-guardians-under-williams-sproat-american-family-field-mlb-pick.html", title: "Brewers/Guardians Under 7.5: Williams vs Sproat Free Pick" },
-    { date: "2026-06-17", page: "cubs-run-line-assad-rockies-wrigley-field-mlb-pick.html", title: "Cubs -1 Run Line vs Rockies: Assad At Wrigley Free Pick" },
-    { date: "2026-06-17", page: "dodgers-braves-phillies-cardinals-mariners-wednesday-board-mlb.html", title: "MLB Analysis - June 17, 2026" },
-    { date: "2026-06-17", page: "pirates-athletics-over-civale-sutter-health-park-mlb-pick.html", title: "Pirates/Athletics Over 10: Sutter Health Park Free Pick" },
-    { date: "2026-06-17", page: "rays-dodgers-under-mcclanahan-ohtani-ace-duel-mlb-pick.html", title: "Rays/Dodgers Under 7: Ohtani vs McClanahan Free Pick" },
-    { date: "2026-06-17", page: "rays-team-total-under-ohtani-dodger-stadium-mlb-pick.html", title: "Rays Team Total Under 3.5 vs Ohtani Free Pick" },
-    { date: "2026-06-17", page: "red-sox-team-total-under-bennett-blue-jays-fenway-mlb-pick.html", title: "Red Sox Team Total Under 4.5 vs Blue Jays Free Pick" },
-    { date: "2026-06-17", page: "tigers-astros-under-mize-lambert-daikin-park-mlb-pick.html", title: "Tigers/Astros Under 8.5: Mize vs Lambert Free Pick" },
-    { date: "2026-06-17", page: "yankees-moneyline-rodon-white-sox-kay-bronx-mlb-pick.html", title: "Yankees ML vs White Sox: Rodon Pick" },
-    { date: "2026-06-16", page: "cease-wrobleski-tuesday-pitching-board-mlb.html", title: "MLB Analysis - June 16, 2026" },
-    { date: "2026-06-16", page: "cubs-moneyline-cabrera-rockies-feltner-wrigley-mlb-pick.html", title: "Cubs Moneyline vs Rockies: Cabrera at Wrigley Free Pick" },
-    { date: "2026-06-16", page: "rays-vs-dodgers-mlb-analysis-stats-preview.html", title: "Rays vs Dodgers MLB Analysis, Stats, Preview" },
-    { date: "2026-06-16", page: "red-sox-blue-jays-under-cease-tolle-fenway-mlb-pick.html", title: "Red Sox vs Blue Jays Under 7.5 Pick: Cease and Tolle" },
-    { date: "2026-06-15", page: "cubs-moneyline-imanaga-rockies-wrigley-mlb-pick.html", title: "Cubs Moneyline vs Rockies: Imanaga at Wrigley Free Pick" },
-    { date: "2026-06-15", page: "phillies-moneyline-wheeler-marlins-citizens-bank-mlb-pick.html", title: "Phillies Moneyline vs Marlins: Wheeler Pick" },
-    { date: "2026-06-15", page: "wheeler-imanaga-burns-monday-pitching-board-mlb.html", title: "MLB Analysis - June 15, 2026" },
-    { date: "2026-06-14", page: "mariners-moneyline-hancock-nationals-road-favorite-mlb-pick.html", title: "Mariners Moneyline Road Favorite Pick" },
-    { date: "2026-06-14", page: "mlb-unders-skenes-sanchez-team-totals-pitching-mlb-pick.html", title: "MLB Team Total Unders: Skenes And Sanchez Pick" },
-    { date: "2026-06-14", page: "skenes-sanchez-braves-sunday-pitching-board-mlb.html", title: "MLB Analysis - June 14, 2026" },
-    { date: "2026-06-13", page: "dodgers-braves-yankees-saturday-fifteen-game-board-mlb.html", title: "MLB Analysis: Saturday's 15-Game Board" },
-    { date: "2026-06-13", page: "dodgers-moneyline-white-sox-team-total-under-yamamoto-mlb-pick.html", title: "Dodgers Moneyline and White Sox Team Total Under Pick" },
-    { date: "2026-06-13", page: "rangers-red-sox-under-degrom-suarez-fenway-park-mlb-pick.html", title: "Rangers and Red Sox Under 7.5 Pick" },
-    { date: "2026-06-13", page: "tigers-first-five-moneyline-skubal-guardians-mlb-pick.html", title: "Tigers First 5 Innings Moneyline Pick" },
-    { date: "2026-06-13", page: "yankees-moneyline-schlittler-blue-jays-rogers-centre-mlb-pick.html", title: "Yankees Moneyline at Blue Jays Pick" },
-    { date: "2026-06-12", page: "dodgers-cubs-braves-mariners-friday-board-mlb.html", title: "MLB Analysis - June 12, 2026" },
-    { date: "2026-06-12", page: "mariners-giants-moneylines-braves-mets-under-mlb-pick.html", title: "Mariners ML, Giants ML and Braves Mets Under Pick" },
-    { date: "2026-06-12", page: "nationals-angels-team-total-unders-miller-mcclanahan-mlb-pick.html", title: "Nationals and Angels Team Total Unders Pick" },
-    { date: "2026-06-11", page: "braves-moneyline-road-favorite-white-sox-perez-control-mlb-pick.html", title: "Braves ML -112 at White Sox Free Pick: Perez Control" },
-    { date: "2026-06-11", page: "dodgers-braves-mariners-cubs-coors-field-board-mlb.html", title: "MLB Analysis - June 11, 2026" },
-    { date: "2026-06-10", page: "dodgers-padres-astros-braves-fifteen-game-board-mlb.html", title: "MLB Preview: Full 15-Game Wednesday Board" },
-    { date: "2026-06-10", page: "padres-dodgers-astros-moneylines-yankees-rays-unders-white-sox-team-total-mlb-pick.html", title: "Padres, Dodgers, Astros ML, Two Unders, White Sox TT" },
-    { date: "2026-06-09", page: "dodgers-team-total-under-yankees-moneyline-phillies-red-sox-unders-mlb-pick.html", title: "Dodgers Team Total Under, Yankees ML, Two MLB Unders" },
-    { date: "2026-06-09", page: "skenes-dodgers-cole-yankees-tuesday-board-mlb.html", title: "MLB Tuesday Slate Analysis - June 09, 2026" },
-    { date: "2026-06-08", page: "road-favorites-giants-brewers-harrison-outs-athletics-team-total-under-mlb-pick.html", title: "Giants ML, Brewers ML, Harrison Outs, A's Under" },
-    { date: "2026-06-07", page: "deGrom-rangers-yankees-redsox-sunday-board-mlb.html", title: "MLB Sunday Slate Analysis: deGrom, Yankees-Red Sox" },
-    { date: "2026-06-07", page: "mlb-team-total-unders-card-tigers-astros-blue-jays-rockies-mlb-pick.html", title: "MLB Team Total Unders: Tigers, Astros, Jays, Rockies" },
-    { date: "2026-06-06", page: "braxton-ashcraft-over-strikeouts-pirates-braves-strider-truist-park-mlb-pick.html", title: "Braxton Ashcraft Over Strikeouts vs Braves Pick" },
-    { date: "2026-06-06", page: "fifteen-game-saturday-strider-yamamoto-misiorowski-mlb.html", title: "MLB Analysis: Full Saturday 15-Game Slate Preview" },
-    { date: "2026-06-06", page: "yankees-team-total-under-red-sox-warren-yankee-stadium-mlb-pick.html", title: "Yankees Team Total Under vs Red Sox Pick" },
-    { date: "2026-06-05", page: "red-sox-yankees-sasaki-freeway-series-friday-slate-mlb.html", title: "MLB Analysis: Full Friday 15-Game Slate Preview" },
-    { date: "2026-06-04", page: "blue-jays-team-total-under-braves-chris-sale-truist-park-mlb-pick.html", title: "Blue Jays Team Total Under vs Braves Pick" },
-    { date: "2026-06-03", page: "skenes-ohtani-headline-wednesday-slate-mlb.html", title: "MLB Analysis" },
-    { date: "2026-06-02", page: "braves-best-record-schlittler-martin-headline-tuesday-mlb.html", title: "MLB Analysis" },
-    { date: "2026-06-02", page: "brewers-moneyline-giants-harrison-mcdonald-american-family-field-mlb-pick.html", title: "Brewers Moneyline vs Giants Pick" },
-    { date: "2026-06-02", page: "yankees-run-line-guardians-schlittler-cantillo-yankee-stadium-mlb-pick.html", title: "Yankees Run Line vs Guardians Pick" },
-    { date: "2026-06-01", page: "degrom-burns-headline-monday-slate-mlb.html", title: "MLB Analysis - June 1, 2026" },
-    { date: "2026-06-01", page: "dodgers-moneyline-diamondbacks-sheehan-rodriguez-chase-field-mlb-pick.html", title: "Dodgers ML vs Diamondbacks Pick June 1 2026" },
-    { date: "2026-06-01", page: "marlins-moneyline-nationals-alcantara-cavalli-nationals-park-mlb-pick.html", title: "Marlins ML vs Nationals Pick June 1 2026" },
-    { date: "2026-05-31", page: "astros-plus-1-5-runline-brewers-misiorowski-imai-daikin-park-mlb-pick.html", title: "Astros +1.5 vs Brewers Pick May 31 2026" },
-    { date: "2026-05-31", page: "blue-jays-orioles-over-8-bradish-miles-camden-yards-mlb-pick.html", title: "Blue Jays vs Orioles Over 8 Pick May 31 2026" },
-    { date: "2026-05-31", page: "cubs-vs-cardinals-sunday-night-baseball-rivalry-mlb-analysis-stats-preview.html", title: "Cubs vs Cardinals Sunday Night Baseball Analysis, Stats, Preview - May 31, 2026" },
-    { date: "2026-05-31", page: "yamamoto-painter-phillies-dodgers-strider-sunday-mlb.html", title: "MLB Analysis - Yamamoto vs Painter at Dodger Stadium, Sunday Slate - May 31, 2026" },
-    { date: "2026-05-30", page: "braves-reds-team-total-over-mlb-pick.html", title: "Braves vs Reds Team Total Pick May 30 2026" },
-    { date: "2026-05-30", page: "padres-nationals-moneyline-mlb-pick.html", title: "Padres vs Nationals Pick May 30 2026" },
-    { date: "2026-05-30", page: "phillies-dodgers-cubs-cardinals-saturday-mlb.html", title: "MLB Analysis - Sasaki vs Luzardo at Dodger Stadium, Cubs-Cardinals Saturday - May 30, 2026" },
-    { date: "2026-05-30", page: "yankees-moneyline-athletics-mlb-pick.html", title: "Yankees vs Athletics Pick May 30 2026" },
-    { date: "2026-05-29", page: "wheeler-dodgers-cubs-cardinals-rivalry-friday-mlb.html", title: "MLB Analysis - Wheeler at Dodger Stadium, Cubs-Cardinals Rivalry Friday - May 29, 2026" },
-    { date: "2026-05-29", page: "yankees-moneyline-athletics-rodon-severino-sutter-health-park-mlb-pick.html", title: "Yankees Moneyline -143 at Athletics: Rodon Holds Off Severino At Sutter Health Park" },
-    { date: "2026-05-28", page: "cubs-team-total-under-3-5-pirates-skenes-mlb-pick.html", title: "Cubs Team Total Under 3.5 (-145): Skenes Caps Chicago At PNC" },
-    { date: "2026-05-28", page: "sale-skenes-eovaldi-thursday-six-game-mlb.html", title: "MLB Analysis - Sale Skenes Eovaldi Thursday Six-Game Slate - May 28, 2026" },
-    { date: "2026-05-27", page: "cubs-team-total-under-4-5-pirates-jameson-taillon-pnc-park-mlb-pick.html", title: "Cubs Team Total Under 4.5 at Pirates: Cold Road Bats" },
-    { date: "2026-05-27", page: "interleague-wednesday-fifteen-game-slate-mlb.html", title: "MLB Analysis - May 27, 2026" },
-    { date: "2026-05-27", page: "padres-team-total-under-3-5-phillies-cristopher-sanchez-petco-park-mlb-pick.html", title: "Padres Team Total Under 3.5: Sanchez Dominant At Petco Park" },
-    { date: "2026-05-26", page: "braves-red-sox-under-8-5-strider-suarez-fenway-park-mlb-pick.html", title: "Braves Red Sox Under 8.5 at Fenway Park Pick" },
-    { date: "2026-05-26", page: "cardinals-team-total-under-3-5-brewers-harrison-american-family-field-mlb-pick.html", title: "Cardinals Team Total Under 3.5 at Brewers Pick" },
-    { date: "2026-05-26", page: "judge-braves-dodgers-tuesday-fifteen-game-mlb.html", title: "MLB Analysis - May 26, 2026" },
-    { date: "2026-05-25", page: "guardians-moneyline-nationals-bibee-littell-progressive-field-mlb-pick.html", title: "Guardians Moneyline vs Nationals Progressive Field Pick" },
-    { date: "2026-05-25", page: "rays-brewers-dodgers-monday-thirteen-game-mlb.html", title: "MLB Analysis - May 25, 2026" },
-    { date: "2026-05-25", page: "yankees-team-total-under-4-5-royals-wacha-warren-kauffman-stadium-mlb-pick.html", title: "Yankees TT Under 4.5 at Royals Kauffman Pick" },
-    { date: "2026-05-24", page: "cease-imanaga-yamamoto-sunday-sixteen-game-mlb.html", title: "MLB Preview: 16-Game Sunday Slate - May 24, 2026" },
-    { date: "2026-05-23", page: "pirates-blue-jays-under-7-5-skenes-corbin-rogers-centre-mlb-pick.html", title: "Pirates-Blue Jays Under 7.5: Skenes vs Corbin At Rogers Centre" },
-    { date: "2026-05-23", page: "skenes-wheeler-kirby-saturday-sixteen-game-mlb.html", title: "MLB Preview: 16-Game Saturday Slate - May 23, 2026" },
-    { date: "2026-05-22", page: "degrom-gausman-cole-friday-fifteen-game-mlb.html", title: "MLB Preview: 15-Game Friday Slate - May 22, 2026" },
-    { date: "2026-05-21", page: "strider-alcantara-mize-thursday-seven-game-mlb.html", title: "MLB: Strider-Alcantara Seven-Game Slate - May 21, 2026" },
-    { date: "2026-05-20", page: "ohtani-sale-yesavage-fifteen-game-wednesday-mlb.html", title: "MLB Preview: Ohtani Pitches At Petco, 15-Game Wednesday - May 20, 2026" },
-    { date: "2026-05-19", page: "guardians-moneyline-minus-121-tigers-messick-montero-comerica-park-mlb-pick.html", title: "Guardians Moneyline -121 at Tigers: Parker Messick Takes The Hill At Comerica" },
-    { date: "2026-05-19", page: "yankees-blue-jays-dodgers-padres-brewers-cubs-fifteen-game-tuesday-mlb.html", title: "MLB Tuesday Preview: Yankees-Blue Jays, Dodgers-Padres, Brewers-Cubs - May 19, 2026" },
-    { date: "2026-05-18", page: "dodgers-padres-first-five-innings-under-4-5-yamamoto-king-petco-park-mlb-pick.html", title: "Dodgers-Padres First Five Under 4.5: Yamamoto vs King At Petco" },
-    { date: "2026-05-18", page: "yankees-blue-jays-dodgers-padres-fourteen-game-board-mlb.html", title: "MLB Monday Preview: Yankees, Dodgers and Padres" },
-    { date: "2026-05-17", page: "cardinals-moneyline-minus-110-royals-kolek-pallante-mlb-pick.html", title: "Cardinals Moneyline -110 vs Royals: Pallante And St. Louis At Busch" },
-    { date: "2026-05-17", page: "phillies-pirates-first-five-under-4-5-wheeler-skenes-mlb-pick.html", title: "Phillies/Pirates F5 Under 4.5 (-210): Wheeler vs Skenes Run Prevention" },
-    { date: "2026-05-17", page: "phillies-team-total-under-3-5-pirates-skenes-mlb-pick.html", title: "Phillies Team Total Under 3.5 (-135): Skenes Sets The Ceiling" },
-    { date: "2026-05-17", page: "rangers-team-total-under-4-5-astros-lambert-eovaldi-mlb-pick.html", title: "Rangers Team Total Under 4.5 (-140): Lambert Keeps Texas In Check" },
-    { date: "2026-05-17", page: "rays-moneyline-minus-151-marlins-perez-rasmussen-mlb-pick.html", title: "Rays Moneyline -151 vs Marlins: Rasmussen Backs Tampa Bay" },
-    { date: "2026-05-17", page: "red-sox-team-total-under-3-5-braves-holmes-bello-mlb-pick.html", title: "Red Sox Team Total Under 3.5 (+100): Holmes Draws A Boston Lineup Test" },
-    { date: "2026-05-17", page: "sunday-may-17-full-mlb-board-skenes-wheeler-sasaki-kirby.html", title: "MLB Sunday Preview: Full 15-Game Board for May 17, 2026" },
-    { date: "2026-05-16", page: "mlb-may-16-2026-recovery.html", title: "MLB Archive - May 16, 2026" },
-    { date: "2026-05-15", page: "mlb-preview-friday-interleague-rivalries-subway-freeway-series.html", title: "MLB Friday Preview: Subway Series, Freeway Series and 15-Game Board for May 15, 2026" },
-    { date: "2026-05-14", page: "brewers-moneyline-minus-139-padres-canning-harrison-mlb-pick.html", title: "Brewers Moneyline -139 vs Padres Pick" },
-    { date: "2026-05-14", page: "mlb-preview-today-eleven-game-board-betting-analysis.html", title: "MLB Preview Today: 11-Game Betting Analysis, Giants-Dodgers, Cubs-Braves" },
-    { date: "2026-05-13", page: "angels-team-total-under-3-5-guardians-messick-progressive-field-mlb-pick.html", title: "Angels Team Total Under 3.5 vs Guardians Pick" },
-    { date: "2026-05-12", page: "yankees-orioles-giants-dodgers-fifteen-game-board-mlb.html", title: "MLB Preview: Full 15-Game Tuesday Board" },
-    { date: "2026-05-11", page: "astros-moneyline-plus-124-mariners-kirby-lambert-daikin-park-mlb-pick.html", title: "Astros ML +124 vs Mariners" },
-    { date: "2026-05-11", page: "sasaki-kirby-rasmussen-eovaldi-monday-six-pack-mlb.html", title: "MLB Analysis - May 11, 2026" },
-    { date: "2026-05-10", page: "sunday-fifteen-game-mlb-preview.html", title: "MLB Sunday Preview: Full 15-Game Board for May 10, 2026" },
-    { date: "2026-05-10", page: "white-sox-mariners-under-8-gilbert-martin-rate-field-mlb-pick.html", title: "White Sox Mariners Under 8 MLB Free Pick, Gilbert And Martin Set Up A Sunday Pitching Shape At Rate Field" },
-    { date: "2026-05-09", page: "braves-moneyline-plus-152-dodgers-strider-snell-dodger-stadium-mlb-pick.html", title: "Braves vs Dodgers Pick: Atlanta Moneyline at Dodger Stadium" },
-    { date: "2026-05-09", page: "nationals-moneyline-plus-139-marlins-littell-junk-loandepot-park-mlb-pick.html", title: "Nationals vs Marlins Pick: Washington Moneyline at loanDepot Park" },
-    { date: "2026-05-08", page: "royals-team-total-under-4-5-tigers-montero-bubic-strike-throwers-kauffman-stadium-mlb-pick.html", title: "Royals Team Total Under 4.5 vs Tigers MLB Free Pick" },
-    { date: "2026-05-08", page: "sale-fried-friday-fifteen-game-slate-mlb.html", title: "MLB Analysis - May 08, 2026" },
-    { date: "2026-05-07", page: "gore-blackburn-yankees-rangers-thursday-mlb.html", title: "MLB Analysis - May 07, 2026" },
-    { date: "2026-05-07", page: "rangers-team-total-over-3-5-yankees-warren-eovaldi-yankee-stadium-mlb-pick.html", title: "Rangers Team Total Over 3.5 vs Yankees MLB Free Pick" },
-    { date: "2026-05-06", page: "athletics-moneyline-plus-156-phillies-springs-wheeler-citizens-bank-park-mlb-pick.html", title: "Athletics vs Phillies Pick: Oakland Moneyline at Citizens Bank Park" },
-    { date: "2026-05-06", page: "eovaldi-warren-ober-mikolas-eleven-game-wednesday-mlb.html", title: "MLB Preview: Wednesday Eleven-Game Board for May 6, 2026" },
-    { date: "2026-05-05", page: "degrom-alcantara-gausman-tuesday-mlb.html", title: "MLB Analysis - May 05, 2026" },
-    { date: "2026-05-05", page: "giants-moneyline-minus-126-padres-webb-buehler-oracle-park-mlb-pick.html", title: "Giants ML -126 vs Padres MLB Free Pick" },
-    { date: "2026-05-04", page: "guardians-moneyline-plus-109-royals-bibee-wacha-kauffman-stadium-mlb-pick.html", title: "Guardians ML +109 vs Royals MLB Free Pick" },
-    { date: "2026-05-04", page: "yamamoto-gordon-twelve-game-monday-mlb.html", title: "MLB Analysis - May 04, 2026" },
-    { date: "2026-05-03", page: "wrobleski-yesavage-leiter-fifteen-game-sunday-mlb.html", title: "MLB Analysis - May 03, 2026" },
-    { date: "2026-05-02", page: "mets-moneyline-mclean-detmers-angel-stadium-pick-mlb.html", title: "Mets Moneyline -126 Free Pick vs Angels at Angel Stadium MLB" },
-    { date: "2026-05-02", page: "sasaki-mclean-painter-fifteen-game-saturday-mlb.html", title: "MLB Analysis - May 02, 2026" },
-    { date: "2026-05-01", page: "mlb-friday-rotation-yankees-cubs-pirates-divisional-action-mlb.html", title: "MLB Analysis - May 01, 2026" },
-    { date: "2026-05-01", page: "padres-team-total-under-4-5-white-sox-marquez-schultz-petco-park-mlb.html", title: "Padres TT Under 4.5 vs White Sox Petco Pick" },
-    { date: "2026-04-30", page: "nine-game-thursday-skenes-valdez-gausman-mlb.html", title: "MLB Analysis - April 30, 2026" },
-    { date: "2026-04-30", page: "pirates-team-total-under-4-5-cardinals-dobbins-pnc-park-skenes-mlb.html", title: "Pirates Team Total Under 4.5 Free Pick vs Cardinals at PNC Park MLB" },
-    { date: "2026-04-29", page: "diamondbacks-team-total-under-sproat-american-family-field-mlb.html", title: "Diamondbacks Team Total Under 4.5 Free Pick vs Brewers MLB" },
-    { date: "2026-04-29", page: "midweek-rotation-arms-divisional-clashes-mlb.html", title: "MLB Analysis - April 29, 2026" },
-    { date: "2026-04-29", page: "royals-moneyline-plus-108-athletics-wacha-severino-sutter-health-park-mlb.html", title: "Royals Moneyline +108 Free Pick vs Athletics at Sutter Health Park MLB" },
-    { date: "2026-04-28", page: "ohtani-degrom-bibee-burns-fifteen-game-tuesday-mlb.html", title: "MLB Analysis - April 28, 2026" },
-    { date: "2026-04-28", page: "tigers-moneyline-plus-106-braves-mize-perez-truist-park-mlb.html", title: "Tigers Moneyline +106 Free Pick at Braves Truist Park MLB" },
-    { date: "2026-04-27", page: "cubs-moneyline-plus-107-padres-boyd-vasquez-petco-park-mlb.html", title: "Cubs Moneyline +107 Free Pick vs Padres at Petco Park MLB" },
-    { date: "2026-04-27", page: "fried-leiter-yankees-rangers-yamamoto-dodgers-monday-mlb.html", title: "MLB Analysis - April 27, 2026" },
-    { date: "2026-04-26", page: "phillies-ml-plus-150-braves-nola-sale-truist-park-mlb.html", title: "Phillies ML +150 Free Pick vs Braves Nola Sale Truist Park April 26 2026" },
-    { date: "2026-04-26", page: "yankees-astros-cubs-dodgers-fifteen-game-sunday-mlb.html", title: "MLB Analysis - April 26, 2026" },
-    { date: "2026-04-25", page: "cubs-streak-rea-sasaki-fifteen-game-saturday-mlb.html", title: "MLB Analysis - April 25, 2026" },
-    { date: "2026-04-25", page: "cubs-vs-dodgers-mlb-analysis-stats-preview.html", title: "Cubs vs Dodgers Analysis April 25, 2026" },
-    { date: "2026-04-25", page: "rockies-mets-over-8-quintana-senga-citi-field-mlb.html", title: "Rockies Mets Over 8 Free Pick Quintana Senga Citi Field April 25 2026" },
-    { date: "2026-04-24", page: "reds-moneyline-plus-118-home-dog-valdez-abbott-great-american-ballpark-mlb.html", title: "Reds ML +118 Home Dog vs Tigers Free Pick April 24 2026" },
-    { date: "2026-04-24", page: "skenes-scherzer-mccullers-fourteen-game-mlb.html", title: "MLB Analysis - April 24, 2026" },
-    { date: "2026-04-23", page: "glasnow-webb-degrom-tolle-rivalry-thursday-nine-game-mlb.html", title: "MLB Analysis - April 23, 2026" },
-    { date: "2026-04-22", page: "free-mlb-picks-today-full-card-release-wednesday.html", title: "Free MLB Picks Today Wednesday April 22 2026 - Full Card 6 Plays" },
-    { date: "2026-04-22", page: "ohtani-duel-yankees-redsox-rivalry-wednesday-fifteen-game-mlb.html", title: "MLB Analysis - April 22, 2026" },
-    { date: "2026-04-21", page: "giants-moneyline-plus-153-roupp-dodgers-oracle-park-mlb.html", title: "Giants ML +153 Free Pick vs Dodgers April 21 2026" },
-    { date: "2026-04-21", page: "yankees-red-sox-dodgers-giants-rivalry-tuesday-fifteen-game-mlb.html", title: "MLB Analysis - April 21, 2026" },
-    { date: "2026-04-20", page: "patriots-day-cease-nola-dodgers-coors-ten-game-mlb.html", title: "MLB Analysis - April 20, 2026" },
-    { date: "2026-04-19", page: "sasaki-gausman-crochet-sunday-fifteen-game-mlb.html", title: "MLB Analysis - April 19, 2026" },
-    { date: "2026-04-18", page: "rockies-moneyline-plus-235-home-dog-sheehan-coors-field-dodgers-mlb.html", title: "Colorado Rockies ML +235 vs Dodgers Free Pick MLB April 18" },
-    { date: "2026-04-18", page: "skubal-skenes-sale-sanchez-fifteen-game-saturday-mlb.html", title: "MLB Analysis - April 18, 2026" },
-    { date: "2026-04-18", page: "white-sox-moneyline-plus-131-fedde-athletics-sacramento-mlb.html", title: "Chicago White Sox ML +131 at Athletics Free MLB Pick Fedde April 18" },
-    { date: "2026-04-17", page: "degrom-glasnow-schlittler-fifteen-game-friday-mlb.html", title: "MLB Analysis - April 17, 2026" },
-    { date: "2026-04-17", page: "reds-moneyline-williamson-twins-target-field-mlb.html", title: "Cincinnati Reds ML +154 at Twins Free Pick MLB April 17" },
-    { date: "2026-04-16", page: "mlb-previews-archive-april-2026.html#2026-04-16", title: "MLB Analysis - 2026-04-16" },
-    { date: "2026-04-15", page: "ohtani-mound-return-imanaga-luzardo-duel-fifteen-game-wednesday-mlb.html", title: "MLB Analysis - April 15, 2026" },
-    { date: "2026-04-14", page: "rangers-moneyline-gore-strikeouts-athletics-sacramento-mlb.html", title: "Rangers ML Gore Strikeout Machine at Athletics MLB Free Pick April 14" },
-    { date: "2026-04-14", page: "yamamoto-nola-mets-dodgers-cubs-phillies-15-game-tuesday-mlb.html", title: "MLB Analysis - April 14, 2026" },
-    { date: "2026-04-13", page: "skenes-crochet-mets-dodgers-espn-10-game-monday-mlb.html", title: "MLB Analysis - April 13, 2026" },
-    { date: "2026-04-13", page: "yankees-angels-under-9-5-warren-kikuchi-yankee-stadium-mlb.html", title: "Yankees Angels Under 9.5 MLB Free Pick April 13" },
-    { date: "2026-04-12", page: "degrom-sasaki-ace-duel-alcantara-dominance-saturday-mlb.html", title: "MLB Analysis - April 12, 2026" },
-    { date: "2026-04-11", page: "giants-moneyline-webb-orioles-camden-yards-mlb.html", title: "Giants Moneyline -114 vs Orioles MLB Free Pick April 11" },
-    { date: "2026-04-10", page: "glasnow-dodgers-host-rangers-yankees-rays-15-game-friday-mlb.html", title: "MLB Analysis - April 10, 2026" },
-    { date: "2026-04-10", page: "rangers-dodgers-under-9-glasnow-rocker-dodger-stadium-mlb.html", title: "Rangers Dodgers Under 9 MLB Free Pick April 10" },
-    { date: "2026-04-09", page: "lowder-meyer-young-arms-severino-yankee-stadium-mlb.html", title: "MLB Analysis - April 9, 2026" },
-    { date: "2026-04-09", page: "mlb.html", title: "MLB Analysis - April 9, 2026" },
-    { date: "2026-04-08", page: "cardinals-nationals-over-8-5-runs-nationals-park-mlb.html", title: "Cardinals Nationals Over 8.5 MLB Pick April 8" },
-    { date: "2026-04-08", page: "ohtani-cease-world-series-rematch-coors-field-fireworks-mlb.html", title: "MLB Analysis - April 8, 2026" },
-    { date: "2026-04-07", page: "world-series-rematch-dodgers-blue-jays-skenes-skubal-ace-duels-mlb.html", title: "MLB Analysis - April 7, 2026" },
-    { date: "2026-04-06", page: "braves-f5-moneyline-sale-dominates-angels-mlb.html", title: "Braves F5 ML -150 vs Angels: Chris Sale Dominance April 6" },
-    { date: "2026-04-06", page: "dodgers-blue-jays-world-series-rematch-brewers-surge-mlb.html", title: "MLB Analysis - April 6, 2026" },
-    { date: "2026-04-05", page: "cubs-guardians-doubleheader-cardinals-tigers-snb-mlb.html", title: "MLB Analysis - April 5, 2026" },
-    { date: "2026-04-05", page: "mariners-moneyline-castillo-angels-rubber-match-mlb.html", title: "Mariners ML -162 Castillo vs Angels Rubber Match MLB Free Pick April 5 2026" },
-    { date: "2026-04-04", page: "imanaga-glasnow-headline-16-game-saturday-mlb.html", title: "MLB Analysis - April 4, 2026" },
-    { date: "2026-04-04", page: "red-sox-moneyline-early-padres-fenway-mlb.html", title: "Red Sox ML -139 vs Padres Free Pick April 4 2026" },
-    { date: "2026-04-03", page: "ohtani-blasts-418-ft-homer-rangers-reds-home-openers-mlb.html", title: "MLB Analysis - April 3, 2026" },
-    { date: "2026-04-02", page: "ragans-bradley-duel-braves-open-in-arizona-mlb.html", title: "MLB Analysis - April 2, 2026" },
-    { date: "2026-04-01", page: "skubal-sale-dominate-early-pitching-duels-yankees-dodgers-mlb.html", title: "MLB Analysis - April 1, 2026" },
-    { date: "2026-04-01", page: "twins-royals-under-8-5-joe-ryan-kauffman-mlb.html", title: "Twins at Royals Under 8.5 Free Pick April 1 2026" },
-    { date: "2026-03-31", page: "giants-moneyline-webb-padres-petco-park-mlb.html", title: "Giants vs Padres Free Pick March 31 2026" },
-    { date: "2026-03-31", page: "ohtani-pitches-dodgers-degrom-returns-fried-gilbert-duel-mlb.html", title: "MLB Analysis - March 31, 2026" },
-    { date: "2026-03-30", page: "brewers-moneyline-harrison-rays-series-opener-mlb.html", title: "Brewers vs Rays Free Pick Today March 30 2026" },
-    { date: "2026-03-30", page: "opening-week-15-game-monday-guardians-dodgers-nats-phillies-mlb.html", title: "MLB Analysis - March 30, 2026" },
-    { date: "2026-03-29", page: "brewers-moneyline-sproat-white-sox-sweep-mlb.html", title: "Brewers Moneyline Pick vs White Sox March 29 2026" },
-    { date: "2026-03-28", page: "mlb-march28-content.html", title: "MLB Analysis - Saturday, March 28, 2026" },
-    { date: "2026-03-28", page: "yankees-giants-under-8-5-oracle-park-mlb.html", title: "Yankees vs Giants Under 8.5 MLB Pick March 28" },
-    { date: "2026-03-27", page: "blue-jays-moneyline-gausman-athletics-opening-series-mlb.html", title: "Blue Jays ML -170 vs Athletics MLB Pick March 27" },
-    { date: "2026-03-26", page: "red-sox-moneyline-crochet-reds-opening-day-mlb.html", title: "Red Sox ML -158 vs Reds Opening Day MLB Pick" },
-    { date: "2026-03-25", page: "yankees-giants-over-7-opening-day-mlb.html", title: "Yankees at Giants Over 7 Opening Day MLB Pick" },
-    { date: "2026-03-24", page: "mlb-previews-archive-march-2026.html#2026-03-24", title: "MLB Analysis - 2026-03-24" },
-    { date: "2026-03-23", page: "mlb-previews-archive-march-2026.html", title: "MLB Analysis - 2026-03-23" },
-    { date: "2026-03-18", page: "spring-training-heat-wave-cubs-bregman-dodgers-tucker-mlb.html", title: "MLB Analysis - March 18, 2026" },
-    { date: "2026-01-08", page: "mlb-picks-analysis-against-the-spread.html", title: "MLB Analysis - January 08, 2026" },
-];
-
-const dateMap = {};
-ARCHIVE_DATA.forEach(item => { if (!dateMap[item.date]) dateMap[item.date] = item; });
-
-const pageToDateMap = {};
-ARCHIVE_DATA.forEach(item => { pageToDateMap[item.page] = item.date; });
-
-const SPORT_HUB_PAGE = 'mlb-previews.html';
-const SPORT_LABEL = 'MLB';
-const MAIN_PAGES = ['nba.html', 'nhl.html', 'ncaab.html', 'ncaaf.html', 'nfl.html', 'mlb.html', 'soccer.html', 'nba-previews.html', 'nhl-previews.html', 'mlb-previews.html', 'soccer-previews.html', 'college-basketball-previews.html'];
-function isConcreteContentPage(page) {
-    // Pick pages use their own template (no archive calendar sidebar); a stale
-    // hub must never redirect to one as the day's board (soccer hub, June 3 2026).
-    // Featured-game (*-analysis-stats-preview) pages load featured-games-calendar.js
-    // (the all-sports marquee calendar) and have their own Featured hub; a SPORT hub
-    // must never redirect to one, or it swaps in the featured calendar and drops
-    // sport-only dates (MLB June 4 went blank when the MLB hub redirected there, June 22 2026).
-    // The combined season 'picks-predictions-analysis-<month>-<year>' pages are blog/Pick
-    // Archive indexes, not a day's preview; a hub must not redirect to one (NCAAB July 7 2026).
-    return !!page && !MAIN_PAGES.includes(page) && !page.includes('#') && !page.includes('-archive-') && !/-analysis-stats-preview\.html$/.test(page) && !/-picks?(?:-v\d+)?\.html$/.test(page) && !/picks-predictions-analysis-[a-z]+-\d{4}\.html$/.test(page);
-}
-const latestContentEntry = ARCHIVE_DATA.find(item => item.page && item.page !== SPORT_HUB_PAGE);
-const latestConcreteEntry = ARCHIVE_DATA.find(item => isConcreteContentPage(item.page));
-window.LATEST_CONTENT_PAGE = latestConcreteEntry ? latestConcreteEntry.page : (latestContentEntry ? latestContentEntry.page : null);
-
-function getLocalDateString(date) {
-    const parts = new Intl.DateTimeFormat('en-US', {
-        timeZone: 'America/Los_Angeles',
-        year: 'numeric',
-        month: '2-digit',
-        day: '2-digit'
-    }).formatToParts(date).reduce((acc, part) => {
-        acc[part.type] = part.value;
-        return acc;
-    }, {});
-    return parts.year + '-' + parts.month + '-' + parts.day;
-}
-
-// Current real date is separate from the active article/page date.
-const todayStr = getLocalDateString(new Date());
-
-const todayMonth = todayStr.substring(0, 7);
-const latestAvailableDate = latestConcreteEntry ? latestConcreteEntry.date : (ARCHIVE_DATA.length > 0 ? ARCHIVE_DATA[0].date : todayStr);
-const todayHasData = ARCHIVE_DATA.some(item => item.date === todayStr && isConcreteContentPage(item.page));
-
-// Handle both root pages and archive pages
-const pathname = window.location.pathname;
-let currentPage;
-if (pathname.includes('/archives/')) {
-    // For archive pages, get the full relative path from archives/
-    currentPage = pathname.replace(/^\//, '');
-} else {
-    // For root pages, just get the filename
-    currentPage = pathname.split('/').pop() || 'index.html';
-}
-
-const isMainPage = MAIN_PAGES.includes(currentPage);
-const forcedDate = window.FORCED_PAGE_DATE || null;
-// Hub/main pages never get a current-page "Article" highlight, even if a
-// stale window.FORCED_PAGE_DATE is left in the hub HTML.
-const activeArticleDate = isMainPage ? null : (forcedDate || pageToDateMap[currentPage] || null);
-const currentPageDate = activeArticleDate;
-
-const months = new Set();
-ARCHIVE_DATA.forEach(item => { const [y, m] = item.date.split('-'); months.add(y + '-' + m); });
-// Always include the current month so the hub calendar can point at today.
-months.add(todayMonth);
-
-// Main/hub pages show today's month; archive pages show their month
-const sortedMonths = Array.from(months).sort().reverse();
-const monthNames = ['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September', 'October', 'November', 'December'];
-
-// Dated preview pages should open on the article month; undated hubs open on the current month.
-let displayMonth = activeArticleDate ? activeArticleDate.substring(0, 7) : (isMainPage ? todayMonth : sortedMonths[0]);
-
-function installCalendarStateStyles() {
-    if (document.getElementById('mlb-calendar-state-styles')) return;
-    const style = document.createElement('style');
-    style.id = 'mlb-calendar-state-styles';
-    style.textContent = `
-.calendar-days .cal-day,.calendar-grid .calendar-day{position:relative}
-.calendar-days .cal-day.is-linked,.calendar-days .cal-day.has-content{cursor:pointer;background:rgba(0,229,255,.15);color:#00e5ff;font-weight:700;border:1px solid rgba(0,229,255,.32)}
-.calendar-days .cal-day.is-linked:hover,.calendar-days .cal-day.has-content:hover{background:rgba(0,229,255,.25);box-shadow:0 0 12px rgba(0,229,255,.28)}
-.calendar-days .cal-day.is-disabled{opacity:.82}
-.calendar-days .cal-day.is-past:not(.current-page):not(.today){color:#9aa3af}
-.calendar-days .cal-day.is-future:not(.current-page):not(.today){color:#c7ced8}
-.calendar-days .cal-day.today{border:2px solid #ffd54f!important;box-shadow:0 0 0 1px rgba(255,213,79,.34),0 0 12px rgba(255,213,79,.28)!important}
-.calendar-days .cal-day.current-page{background:rgba(0,229,255,.72)!important;color:#fff!important;border:2px solid #00e5ff!important;font-weight:900!important;box-shadow:0 0 12px rgba(0,229,255,.45)!important}
-.calendar-days .cal-day.today.current-page{background:linear-gradient(135deg,rgba(0,229,255,.72),rgba(255,213,79,.42))!important;border-color:#ffd54f!important}
-`;
-    document.head.appendChild(style);
-}
-
-function navigateToCalendarPage(page) {
-    if (page) window.location.href = '/' + page;
-}
-
-// Multi-post dates go straight to that day's main slate/preview page (no chooser popup).
-// Falls back to the first/newest post if no slate-style page is found.
-function pickPrimaryPostForDate(postsForDate) {
-    const slate = postsForDate.find(item => {
-        const t = (item.title || '').toLowerCase();
-        const p = (item.page || '').toLowerCase();
-        return /\banalysis\b|\bpreview\b|\bslate\b|\bboard\b|\bfull card\b/.test(t)
-            || /-game-|-slate-|-board-|-previews|full-card/.test(p);
-    });
-    return slate || postsForDate[0];
-}
-
-// Popup chooser fully removed (Nima): clicking a date opens the page directly.
-
-function renderCalendar(yearMonth) {
-    const [year, month] = yearMonth.split('-').map(Number);
-    const yearEl = document.getElementById('cal-year') || document.querySelector('.year-display');
-    if (yearEl) yearEl.textContent = year;
-    const firstDay = new Date(year, month - 1, 1).getDay();
-    const daysInMonth = new Date(year, month, 0).getDate();
-    const container = document.getElementById('calendar-days') || document.getElementById('calendarDays');
-    if (!container) return;
-    container.innerHTML = '';
-    for (let i = 0; i < firstDay; i++) { const cell = document.createElement('div'); cell.className = 'cal-day empty'; container.appendChild(cell); }
-    for (let d = 1; d <= daysInMonth; d++) {
-        const dateStr = year + '-' + String(month).padStart(2, '0') + '-' + String(d).padStart(2, '0');
-        const postsForDate = ARCHIVE_DATA.filter(item => item.date === dateStr && item.page);
-        const hasData = postsForDate.length > 0 ? postsForDate[0] : null;
-        let classes = 'cal-day';
-        if (dateStr === currentPageDate) classes += ' current-page';
-        // NO 'today' marker (Nima, June 24 2026): the calendar highlights ONLY the
-        // date of the article being viewed (current-page). A separate gold 'today'
-        // cell was a wrong second highlight - on out-of-season sports (NHL/NBA) it lit
-        // a day with no article, and it fought the article's own date. Removed for good.
-        if (hasData) classes += ' has-content is-linked';
-        else classes += ' is-disabled';
-        if (dateStr < todayStr) classes += ' is-past';
-        if (dateStr > todayStr) classes += ' is-future';
-        const cell = document.createElement('div');
-        cell.className = classes;
-        if (!cell.dataset) cell.dataset = {};
-        cell.dataset.date = dateStr;
-        cell.dataset.currentDate = todayStr;
-        if (dateStr === currentPageDate) cell.dataset.activeArticleDate = currentPageDate;
-        if (hasData) cell.dataset.linked = 'true';
-        cell.textContent = d;
-        if (hasData) {
-            cell.title = postsForDate.map(item => item.title).join('\n');
-            cell.onclick = () => {
-                if (postsForDate.length === 1) navigateToCalendarPage(hasData.page);
-                else navigateToCalendarPage(pickPrimaryPostForDate(postsForDate).page);
-            };
-        }
-        container.appendChild(cell);
-    }
-}
-
-// Hub guard: a `*-previews.html` hub page bakes in the last published dated
-// slate/article. When that baked article is out of date (its FORCED_PAGE_DATE
-// is not today), it must not be presented as the current board. If a current/
-// upcoming concrete preview exists we redirect to it. Otherwise the baked
-// board STAYS VISIBLE (STALE_GUARD_BANNER_20260606, Nima June 6 2026: a
-// near-empty hub is worse for visitors and Googlebot than a clearly-dated
-// older board) and is labeled with its real date plus a link to the latest
-// available preview. It is never presented as today\u2019s board. No fabricated data.
-function renderPreviewHub() {
-    if (currentPage !== SPORT_HUB_PAGE || !SPORT_HUB_PAGE) return;
-    const baked = window.FORCED_PAGE_DATE || null;
-    // ALWAYS-LATEST HUB (Nima, July 7 2026): the nav "<Sport> Preview" link must land
-    // on the most recent published preview for that sport - NEVER a stale/offseason
-    // archive landing screen. Leave the hub as-is ONLY when today actually has a fresh
-    // concrete board (in-season daily slate baked in). Otherwise - offseason, a hand-
-    // built archive page with no FORCED_PAGE_DATE, or an in-season gap/off-day - fall
-    // through and redirect to the newest published concrete preview below. Keyed on real
-    // content presence (todayHasData), not on whether a baked date happens to exist, so
-    // a dead offseason archive page (e.g. college-basketball-previews.html in July) can
-    // never be the primary click target while published previews exist.
-    if (todayHasData) return;
-    // UNIFIED STALE-HUB POLICY (Nima, June 1 2026): redirect to the newest
-    // valid concrete preview so stale baked content can never stand in as
-    // today\u2019s board. Strip the stale articles first (belt-and-suspenders
-    // with the pre-paint head guard). Clean empty-state below is the fallback
-    // when no concrete entry exists. Same policy as the Featured Game hub.
-    // FALLBACK-TO-LATEST (Nima, June 16 2026): redirect to the newest published
-    // preview for this sport whenever today has none. Prefer a current/upcoming
-    // preview; otherwise load the most recent past one rather than showing an
-    // empty/near-empty board. Only a sport with zero concrete entries falls
-    // through to the labeled state below. Flag past-dated loads so the target
-    // can show a subtle "latest available" note.
-    const _latest = latestConcreteEntry || latestContentEntry || null;
-    if (_latest && _latest.page && _latest.page !== currentPage && _latest.page !== SPORT_HUB_PAGE) {
-        const _m = document.querySelector('.main-content');
-        if (_m) _m.querySelectorAll('.game-preview').forEach(function(el){ el.remove(); });
-        if (_latest.date < todayStr) { try { sessionStorage.setItem('bl_showing_latest', '1'); } catch (e) {} }
-        window.location.replace('/' + _latest.page);
-        return;
-    }
-    const main = document.querySelector('.main-content');
-    if (!main) return;
-
-    const hero = document.querySelector('header.hero');
-    if (hero) {
-        const badge = hero.querySelector('.hero-badge');
-        const h1 = hero.querySelector('h1');
-        const p = hero.querySelector('p');
-        if (badge) badge.textContent = SPORT_LABEL + ' Previews';
-        if (h1) h1.textContent = SPORT_LABEL + ' Game Preview Archive';
-        if (p) p.textContent = 'Browse the latest ' + SPORT_LABEL + ' previews and the full dated archive below. This page does not present older previews as today\u2019s board.';
-    }
-
-    // STALE_GUARD_BANNER_20260606: keep the baked articles visible - only label them.
-    const latest = latestConcreteEntry || latestContentEntry || null;
-    const block = document.createElement('div');
-    block.id = 'hub-state';
-    let html = '';
-    if (baked && !document.getElementById('board-date-note')) {
-        const bakedLabel = new Date(baked + 'T12:00:00').toLocaleDateString('en-US', { weekday: 'long', month: 'long', day: 'numeric', year: 'numeric' });
-        html += '<div style="text-align:center;padding:20px 24px;background:linear-gradient(145deg,#14171f,#0f1218);border:1px solid rgba(255,213,79,0.3);border-radius:12px;margin-bottom:24px;">'
-              + '<p style="font-size:12px;font-weight:700;letter-spacing:2px;text-transform:uppercase;color:#ffd54f;margin-bottom:8px;">Board From</p>'
-              + '<p style="font-size:18px;color:#fff;margin:0;">' + bakedLabel + '</p>'
-              + '</div>';
-    }
-    if (latest && latest.page !== SPORT_HUB_PAGE) {
-        const d = new Date(latest.date + 'T12:00:00').toLocaleDateString('en-US', { weekday: 'long', month: 'long', day: 'numeric', year: 'numeric' });
-        html += '<a href="/' + latest.page + '" style="display:block;text-decoration:none;background:linear-gradient(145deg,#14171f,#0f1218);border:1px solid rgba(255,213,79,0.3);border-radius:12px;padding:28px 32px;">'
-              + '<p style="font-size:12px;font-weight:700;letter-spacing:2px;text-transform:uppercase;color:#fd5000;margin-bottom:10px;">Latest ' + SPORT_LABEL + ' Preview</p>'
-              + '<p style="font-family:Orbitron,sans-serif;font-size:22px;color:#fff;margin:0 0 8px;line-height:1.25;">' + latest.title + '</p>'
-              + '<p style="color:#b0b8c4;font-size:14px;margin:0;">' + d + ' &nbsp;&rarr;</p>'
-              + '</a>';
-    }
-    block.innerHTML = html;
-    const mobile = main.querySelector('.mobile-archive');
-    if (mobile && mobile.nextSibling) main.insertBefore(block, mobile.nextSibling);
-    else if (mobile) main.appendChild(block);
-    else main.insertBefore(block, main.firstChild);
-}
-
-function initSportCalendar() {
-
-    installCalendarStateStyles();
-    renderPreviewHub();
-
-    const monthSelect = document.getElementById('month-select') || document.getElementById('monthSelect');
-    if (monthSelect) {
-        monthSelect.innerHTML = '';
-        sortedMonths.forEach(m => {
-            const [year, month] = m.split('-');
-            const opt = document.createElement('option');
-            opt.value = m;
-            opt.textContent = monthNames[parseInt(month) - 1] + ' ' + year;
-            if (m === displayMonth) opt.selected = true;
-            monthSelect.appendChild(opt);
-        });
-        monthSelect.addEventListener('change', function() { renderCalendar(this.value); });
-    }
-    renderCalendar(displayMonth);
-    const mobileSelect = document.getElementById('mobile-archive-select') || document.getElementById('mobileArchiveSelect');
-    if (mobileSelect) {
-        mobileSelect.innerHTML = '<option value="">Select a date...</option>';
-        ARCHIVE_DATA.forEach(item => {
-            const opt = document.createElement('option');
-            opt.value = item.page;
-            const dateObj = new Date(item.date + 'T12:00:00');
-            const dateLabel = dateObj.toLocaleDateString('en-US', { weekday: 'short', month: 'short', day: 'numeric' });
-            opt.textContent = dateLabel + ' - ' + item.title;
-            if (item.page === currentPage) opt.selected = true;
-            mobileSelect.appendChild(opt);
-        });
-        mobileSelect.addEventListener('change', (e) => { if (e.target.value) window.location.href = '/' + e.target.value; });
-    }
-}
-
-if (document.readyState === 'loading') { document.addEventListener('DOMContentLoaded', initSportCalendar); } else { initSportCalendar(); }
-
-/* SHOWING-LATEST NOTE (Nima, June 16 2026): when a hub fell back to the most
-   recent published item (no entry for today), show a subtle one-line note on the
-   destination article. Flag is set by the hub before redirect; cleared after use. */
-(function showLatestAvailableNote() {
-    function run() {
-        var flag;
-        try { flag = sessionStorage.getItem('bl_showing_latest'); } catch (e) { return; }
-        if (!flag) return;
-        try { sessionStorage.removeItem('bl_showing_latest'); } catch (e) {}
-        if (document.getElementById('bl-latest-note')) return;
-        var host = document.querySelector('.main-content') || document.querySelector('.page-wrapper') || document.body;
-        if (!host) return;
-        var note = document.createElement('div');
-        note.id = 'bl-latest-note';
-        note.setAttribute('style', 'max-width:900px;margin:90px auto 0;padding:10px 16px;border:1px solid rgba(0,229,255,0.3);border-radius:10px;background:rgba(0,229,255,0.06);color:#9fe9f5;font-size:13px;line-height:1.5;text-align:center;font-family:Inter,system-ui,sans-serif;');
-        note.textContent = 'Showing the latest available preview. No new post has been published for today yet.';
-        host.insertBefore(note, host.firstChild);
-    }
-    if (document.readyState === 'loading') { document.addEventListener('DOMContentLoaded', run); } else { run(); }
+// Entries: data/calendar/mlb/<YYYY-MM>.json; engine: scripts/calendar-runtime.js
+
+window.BL_SPORT_CALENDAR = {"sport": "mlb", "hubPage": "mlb-previews.html", "label": "MLB", "mainPages": ["nba.html", "nhl.html", "ncaab.html", "ncaaf.html", "nfl.html", "mlb.html", "soccer.html", "nba-previews.html", "nhl-previews.html", "mlb-previews.html", "soccer-previews.html", "college-basketball-previews.html"], "dataBase": "/data/calendar/mlb/", "latestContent": {"date": "2026-08-22", "page": "astros-run-line-rays-guardians-moneylines-tigers-team-total-four-play-mlb-pick.html", "title": "Astros Run Line And Rays Moneyline: Four MLB Plays"}, "latestConcrete": {"date": "2026-08-22", "page": "cease-skubal-painter-fifteen-game-saturday-mlb.html", "title": "MLB Saturday: Fifteen Games And A 6.5 In The Bronx"}, "months": {"2026-01": {"n": 1, "v": "25c7632b4f"}, "2026-03": {"n": 13, "v": "7584a357bc"}, "2026-04": {"n": 53, "v": "84e144be32"}, "2026-05": {"n": 65, "v": "d050f150e6"}, "2026-06": {"n": 118, "v": "901cd227c2"}, "2026-07": {"n": 60, "v": "a9da7601ef"}, "2026-08": {"n": 33, "v": "c5003e675a"}}, "pages": {"0": "fe07f866ba", "1": "e776713fbf", "2": "1caee4a37c", "3": "2fc6c363d1", "4": "71f3719969", "5": "93745df576", "6": "91afe17ceb", "7": "de90373b07", "8": "8b2f1fffa4", "9": "1b441ef352", "10": "6bafa9f6e7", "11": "984b832f10", "12": "0c663ad40a", "13": "7ccf31865e", "14": "506884fcf5", "15": "a1016c77b3"}, "current": {"month": "2026-10", "entries": []}};
+(function loadCalendarRuntime() {
+    var me = document.currentScript && document.currentScript.src;
+    var base = me ? me.slice(0, me.lastIndexOf('/') + 1) : '/scripts/';
+    var s = document.createElement('script');
+    s.src = base + 'calendar-runtime.js?v=c5c93250003';
+    s.async = false;
+    (document.head || document.documentElement).appendChild(s);
 })();
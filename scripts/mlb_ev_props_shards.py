@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Per-date, per-game shards of the MLB +EV props board.
+
+mlb_prop_analyzer.py used to dump every +EV prop into data/mlb_ev_props.json
+as one pretty-printed array (~590KB), rewritten whole on every run, and a
+props view had to download all of it to show one game. It now writes:
+
+  data/mlb-ev-props/index.json              dates -> games, with row counts,
+                                            best EV and a content version
+  data/mlb-ev-props/<YYYY-MM-DD>/<game>.json  one game's props, columnar
+
+A game shard is {"c": [column names], "r": [[row values], ...]}: keys are
+written once per shard instead of once per prop, and EV / probability are
+rounded to one decimal (they are shown that way anyway). Game and team names
+live in the index. A view fetches index.json, then only the shard(s) of the
+slate it renders (`<date>/<game>.json?v=<v>`).
+
+Shards are written only when their content changed, shards for games that
+left the slate are removed, and dates older than KEEP_DAYS are pruned.
+load_props() rebuilds the old flat row dicts for tooling.
+"""
+
+import hashlib
+import json
+import re
+import shutil
+from datetime import date, timedelta
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+EV_PROPS_DIR = REPO_DIR / 'data' / 'mlb-ev-props'
+KEEP_DAYS = 14
+
+# Shard columns, in order, with the rounding applied to each (None = as is).
+COLUMNS = (
+    ('player', None),
+    ('prop_type', None),
+    ('line', None),
+    ('odds', None),
+    ('book', None),
+    ('ev', 1),
+    ('true_prob', 1),
+)
+
+
+def game_slug(game):
+    return re.sub(r'[^a-z0-9]+', '-', game.lower()).strip('-') or 'game'
+
+
+def _digest(text):
+    return hashlib.md5(text.encode('utf-8')).hexdigest()[:10]
+
+
+def _write_if_changed(path, text):
+    try:
+        if path.read_text(encoding='utf-8') == text:
+            return False
+    except OSError:
+        pass
+    path.write_text(text, encoding='utf-8')
+    return True
+
+
+def _cell(row, name, digits):
+    value = row.get(name)
+    if digits is not None and isinstance(value, (int, float)):
+        value = round(value, digits)
+        if value == int(value):
+            value = int(value)
+    return value
+
+
+def load_index():
+    try:
+        return json.loads((EV_PROPS_DIR / 'index.json').read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {'latest': None, 'dates': {}}
+
+
+def write_shards(slate_date, rows):
+    """Write one slate's props as per-game shards and update the index.
+
+    `rows` are the analyzer's prop dicts (game, away_team, home_team, player,
+    prop_type, line, odds, book, ev, true_prob). Returns (written, total)
+    shard counts.
+    """
+    out_dir = EV_PROPS_DIR / slate_date
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    by_game = {}
+    for row in sorted(rows, key=lambda r: -(r.get('ev') or 0)):
+        by_game.setdefault(row['game'], []).append(row)
+
+    games = {}
+    written = 0
+    for game, props in sorted(by_game.items()):
+        slug = game_slug(game)
+        shard = {'c': [name for name, _ in COLUMNS],
+                 'r': [[_cell(p, name, digits) for name, digits in COLUMNS] for p in props]}
+        text = json.dumps(shard, ensure_ascii=False, separators=(',', ':'))
+        written += _write_if_changed(out_dir / f'{slug}.json', text)
+        games[slug] = {
+            'game': game,
+            'away': props[0].get('away_team', ''),
+            'home': props[0].get('home_team', ''),
+            'n': len(props),
+            'top': _cell(props[0], 'ev', 1),
+            'v': _digest(text),
+        }
+
+    for stale in out_dir.glob('*.json'):
+        if stale.stem not in games:
+            stale.unlink()
+
+    index = load_index()
+    index['dates'][slate_date] = games
+    cutoff = (date.fromisoformat(slate_date) - timedelta(days=KEEP_DAYS)).isoformat()
+    for old in [d for d in index['dates'] if d < cutoff]:
+        del index['dates'][old]
+        shutil.rmtree(EV_PROPS_DIR / old, ignore_errors=True)
+    index['dates'] = dict(sorted(index['dates'].items()))
+    index['latest'] = max(index['dates'])
+    _write_if_changed(EV_PROPS_DIR / 'index.json', json.dumps(index, indent=1) + '\n')
+    return written, len(games)
+
+
+def load_props(slate_date=None):
+    """A slate's props as flat row dicts (default: the latest slate)."""
+    index = load_index()
+    slate_date = slate_date or index.get('latest')
+    rows = []
+    for slug, meta in index.get('dates', {}).get(slate_date, {}).items():
+        try:
+            shard = json.loads((EV_PROPS_DIR / slate_date / f'{slug}.json').read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            continue
+        for values in shard['r']:
+            row = {'game': meta['game'], 'away_team': meta['away'], 'home_team': meta['home']}
+            row.update(zip(shard['c'], values))
+            rows.append(row)
+    return rows
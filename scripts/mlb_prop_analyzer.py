@@ -11,6 +11,8 @@ import pandas as pd
 from datetime import datetime
 from typing import List, Dict, Any
 
+from mlb_ev_props_shards import EV_PROPS_DIR, write_shards
+
 # Paths to accumulated data
 RECORDS_FILE = r'C:\Users\Nima\nimadamus.github.io\mlb-records.json'
 PICKS_DATA_FILE = r'C:\Users\Nima\nimadamus.github.io\mlb-data.js'
@@ -191,11 +193,10 @@ class MLBPropAnalyzer:
                 self.results.append(p)
 
     def generate_report(self):
-        """Output +EV props to a JSON file"""
-        output_file = r'C:\Users\Nima\nimadamus.github.io\data\mlb_ev_props.json'
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(self.results, f, indent=2)
-        print(f"Report generated: {output_file}")
+        """Output +EV props as per-game shards under data/mlb-ev-props/"""
+        slate_date = datetime.now().strftime('%Y-%m-%d')
+        written, total = write_shards(slate_date, self.results)
+        print(f"Report generated: {EV_PROPS_DIR / slate_date} ({written} of {total} game shard(s) changed)")
         
         # Also print top 5 EV plays
         sorted_results = sorted(self.results, key=lambda x: x['ev'], reverse=True)
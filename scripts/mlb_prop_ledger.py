@@ -0,0 +1,366 @@
+"""SQLite ledger behind the MLB prop trackers.
+
+build_mlb_daily_prop_card.append_tracker used to re-read the whole
+MLB_DAILY_PROP_TRACKER.csv to dedupe every append, and the settlement scripts
+re-read (and rewrote) every row to grade a handful of open ones. Both now go
+through this ledger, so an append or a nightly settlement costs O(new rows).
+
+One table, `props`, holds every tracked row for every tracker:
+  daily_card  the official plays from build_mlb_daily_prop_card.py
+  ev_props    the real_mlb_ev_props.py candidates graded by settle_real_mlb_ev_props.py
+
+A prop is identified by (tracker, date, family, game, market, selection).
+The full row as recorded is kept as JSON in `row`. `settled` is indexed for
+open rows only, so settlement reads just the unsettled props of the slate it
+grades.
+
+MLB_DAILY_PROP_TRACKER.csv is still written for anything that reads it:
+appends go on the end of the file, and settlement re-exports it from the
+ledger. On first use the existing CSV is imported. Both keep the CSV's own
+header, so columns added by hand survive (rows recorded later leave them
+blank).
+
+The CSV's size and mtime are recorded after every write, so a hand edit
+(manual grading, a fixed line) shows up as divergence. Exporting over a
+diverged CSV is refused rather than overwriting the edit; --adopt-csv makes
+the CSV the ledger's new contents for that tracker.
+
+CLI:
+  python scripts/mlb_prop_ledger.py --summary [--tracker daily_card]
+  python scripts/mlb_prop_ledger.py --export out.csv [--tracker daily_card]
+  python scripts/mlb_prop_ledger.py --adopt-csv        # after editing the tracker CSV
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import sqlite3
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable
+
+DESKTOP_ROOT = Path.home() / "Desktop" / "MLB_Props"
+LEDGER_PATH = DESKTOP_ROOT / "MLB_PROP_LEDGER.sqlite"
+TRACKER_PATH = DESKTOP_ROOT / "MLB_DAILY_PROP_TRACKER.csv"
+
+DAILY_CARD = "daily_card"
+EV_PROPS = "ev_props"
+
+# Column order of MLB_DAILY_PROP_TRACKER.csv.
+TRACKER_FIELDS = [
+    "date",
+    "family",
+    "status",
+    "game",
+    "market",
+    "selection",
+    "line",
+    "book",
+    "odds",
+    "model_prob",
+    "market_prob",
+    "edge",
+    "ev",
+    "result",
+    "units_risked",
+    "units_won",
+    "notes",
+    "created_at",
+]
+KEY_FIELDS = ("date", "family", "game", "market", "selection")
+OPEN_RESULTS = {"", "PENDING"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS props (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    tracker     TEXT NOT NULL,
+    date        TEXT NOT NULL,
+    family      TEXT NOT NULL,
+    game        TEXT NOT NULL,
+    market      TEXT NOT NULL,
+    selection   TEXT NOT NULL,
+    row         TEXT NOT NULL,
+    result      TEXT NOT NULL,
+    settled     INTEGER NOT NULL,
+    created_at  TEXT NOT NULL,
+    settled_at  TEXT,
+    UNIQUE (tracker, date, family, game, market, selection)
+);
+CREATE INDEX IF NOT EXISTS idx_props_open ON props (tracker, date) WHERE settled = 0;
+CREATE INDEX IF NOT EXISTS idx_props_date ON props (tracker, date);
+CREATE TABLE IF NOT EXISTS csv_files (
+    tracker     TEXT NOT NULL,
+    path        TEXT NOT NULL,
+    size        INTEGER NOT NULL,
+    mtime_ns    INTEGER NOT NULL,
+    PRIMARY KEY (tracker, path)
+);
+"""
+
+
+class CsvDiverged(RuntimeError):
+    """A tracker CSV was changed outside the ledger since the ledger last wrote it."""
+
+
+def prop_key(row: dict[str, Any]) -> tuple[str, ...]:
+    return tuple(str(row.get(field, "")) for field in KEY_FIELDS)
+
+
+def csv_header(path: Path) -> list[str] | None:
+    """The header row of an existing CSV, or None."""
+    try:
+        with path.open("r", newline="", encoding="utf-8") as f:
+            return next(csv.reader(f), None) or None
+    except OSError:
+        return None
+
+
+def _signature(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+class PropLedger:
+    """The MLB prop ledger (one SQLite file)."""
+
+    def __init__(self, path: Path = LEDGER_PATH):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.row_factory = sqlite3.Row
+        self.db.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.db.commit()
+        self.db.close()
+
+    def __enter__(self) -> "PropLedger":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # -- writes -------------------------------------------------------------
+
+    def upsert(self, tracker: str, rows: Iterable[dict[str, Any]], refresh: bool = False) -> list[dict[str, Any]]:
+        """Insert rows whose key is new; return the inserted rows.
+
+        An existing key is left as first recorded (the tracker logs the price
+        at pick time) unless `refresh` is set, in which case an open row takes
+        the new values. Settled rows never change here.
+        """
+        with self.db:
+            return self._insert(tracker, rows, refresh)
+
+    def _insert(self, tracker: str, rows: Iterable[dict[str, Any]], refresh: bool = False) -> list[dict[str, Any]]:
+        # upsert() without its own transaction.
+        inserted = []
+        now = datetime.now().isoformat()
+        for row in rows:
+            key = prop_key(row)
+            result = str(row.get("result", "") or "")
+            settled = int(result not in OPEN_RESULTS)
+            payload = json.dumps(row, sort_keys=True, default=str)
+            cur = self.db.execute(
+                "INSERT INTO props (tracker, date, family, game, market, selection, row, result, settled, created_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (tracker, date, family, game, market, selection) DO NOTHING",
+                (tracker, *key, payload, result, settled, row.get("created_at") or now),
+            )
+            if cur.rowcount:
+                inserted.append(row)
+            elif refresh:
+                self.db.execute(
+                    "UPDATE props SET row = ? WHERE tracker = ? AND date = ? AND family = ? AND game = ?"
+                    " AND market = ? AND selection = ? AND settled = 0",
+                    (payload, tracker, *key),
+                )
+        return inserted
+
+    def settle(self, tracker: str, updates: Iterable[tuple[int, dict[str, Any]]]) -> int:
+        """Store graded rows: (id, row) with row["result"] set. Returns rows settled."""
+        now = datetime.now().isoformat()
+        count = 0
+        with self.db:
+            for prop_id, row in updates:
+                count += self.db.execute(
+                    "UPDATE props SET row = ?, result = ?, settled = 1, settled_at = ?"
+                    " WHERE id = ? AND tracker = ? AND settled = 0",
+                    (json.dumps(row, sort_keys=True, default=str), str(row["result"]), now, prop_id, tracker),
+                ).rowcount
+        return count
+
+    # -- reads --------------------------------------------------------------
+
+    def open_rows(self, tracker: str, date: str | None = None, family: str | None = None) -> list[tuple[int, dict[str, Any]]]:
+        """(id, row) for the unsettled props of a tracker, optionally one date/family."""
+        sql = "SELECT id, row FROM props WHERE tracker = ? AND settled = 0"
+        params: list[Any] = [tracker]
+        if date is not None:
+            sql += " AND date = ?"
+            params.append(date)
+        if family is not None:
+            sql += " AND family = ?"
+            params.append(family)
+        return [(r["id"], json.loads(r["row"])) for r in self.db.execute(sql + " ORDER BY id", params)]
+
+    def entries(self, tracker: str, date: str | None = None) -> list[tuple[int, dict[str, Any]]]:
+        """(id, row) for every prop of a tracker (optionally one date), in insertion order."""
+        sql = "SELECT id, row FROM props WHERE tracker = ?"
+        params: list[Any] = [tracker]
+        if date is not None:
+            sql += " AND date = ?"
+            params.append(date)
+        return [(r["id"], json.loads(r["row"])) for r in self.db.execute(sql + " ORDER BY id", params)]
+
+    def rows(self, tracker: str, date: str | None = None) -> list[dict[str, Any]]:
+        return [row for _, row in self.entries(tracker, date)]
+
+    def count(self, tracker: str) -> int:
+        return self.db.execute("SELECT COUNT(*) FROM props WHERE tracker = ?", (tracker,)).fetchone()[0]
+
+    def summary(self, tracker: str) -> list[sqlite3.Row]:
+        return list(self.db.execute(
+            "SELECT date, COUNT(*) AS props, SUM(settled) AS settled FROM props"
+            " WHERE tracker = ? GROUP BY date ORDER BY date", (tracker,)))
+
+    # -- CSV compatibility --------------------------------------------------
+
+    def _remember_csv(self, tracker: str, path: Path) -> None:
+        # Callers run this inside their own transaction.
+        sig = _signature(path)
+        if sig is None:
+            return
+        self.db.execute("INSERT OR REPLACE INTO csv_files VALUES (?, ?, ?, ?)",
+                        (tracker, str(path.resolve()), *sig))
+
+    def csv_diverged(self, tracker: str, path: Path) -> bool:
+        """True when `path` changed since the ledger last wrote or read it.
+
+        A CSV the ledger has no record of counts as diverged once the tracker
+        has rows, since its edits cannot be told apart from the ledger's.
+        """
+        sig = _signature(path)
+        if sig is None:
+            return False
+        row = self.db.execute("SELECT size, mtime_ns FROM csv_files WHERE tracker = ? AND path = ?",
+                              (tracker, str(path.resolve()))).fetchone()
+        if row is None:
+            return bool(self.count(tracker))
+        return (row["size"], row["mtime_ns"]) != sig
+
+    def import_csv(self, tracker: str, path: Path) -> int:
+        """Seed an empty tracker from its legacy CSV. Returns rows imported."""
+        if self.count(tracker) or not path.exists():
+            return 0
+        with path.open("r", newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        with self.db:
+            imported = len(self._insert(tracker, rows))
+            self._remember_csv(tracker, path)
+        return imported
+
+    def adopt_csv(self, tracker: str, path: Path) -> int:
+        """Replace a tracker's rows with its CSV (after a hand edit). Returns rows.
+
+        The delete and the re-import are one transaction: if the import fails
+        the tracker keeps its old rows.
+        """
+        if not path.exists():
+            return 0
+        with path.open("r", newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        with self.db:
+            self.db.execute("DELETE FROM props WHERE tracker = ?", (tracker,))
+            adopted = len(self._insert(tracker, rows))
+            self._remember_csv(tracker, path)
+        return adopted
+
+    def export_csv(self, tracker: str, path: Path, fields: list[str] = TRACKER_FIELDS,
+                   force: bool = False) -> int:
+        """Rewrite a tracker's CSV from the ledger, keeping the CSV's own header
+        (`fields` for a new file). Returns rows written.
+
+        Raises CsvDiverged instead of overwriting a CSV edited outside the
+        ledger, unless `force`.
+        """
+        if not force and self.csv_diverged(tracker, path):
+            raise CsvDiverged(f"{path} was edited outside the ledger; not overwriting it. "
+                              f"Run `python scripts/mlb_prop_ledger.py --adopt-csv` to keep the edits.")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        header = csv_header(path) or fields
+        rows = self.rows(tracker)
+        with tmp.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=header, restval="", extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(rows)
+        tmp.replace(path)
+        with self.db:
+            self._remember_csv(tracker, path)
+        return len(rows)
+
+    def append_csv(self, tracker: str, path: Path, rows: list[dict[str, Any]],
+                   fields: list[str] = TRACKER_FIELDS) -> None:
+        """Append rows to a tracker CSV under its own header, without reading
+        the rest of it. Appending never loses a hand edit, so a diverged CSV is
+        appended to but stays flagged."""
+        if not rows:
+            return
+        in_sync = not self.csv_diverged(tracker, path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        header = csv_header(path)
+        with path.open("a", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=header or fields, restval="", extrasaction="ignore")
+            if header is None:
+                writer.writeheader()
+            writer.writerows(rows)
+        if in_sync:
+            with self.db:
+                self._remember_csv(tracker, path)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Inspect or export the MLB prop ledger.")
+    parser.add_argument("--tracker", default=DAILY_CARD, choices=[DAILY_CARD, EV_PROPS])
+    parser.add_argument("--summary", action="store_true", help="Props and settled counts per date.")
+    parser.add_argument("--export", type=Path, help="Write the tracker's rows to this CSV.")
+    parser.add_argument("--adopt-csv", action="store_true",
+                        help=f"Replace the daily card's rows with {TRACKER_PATH.name} (after editing it by hand).")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    with PropLedger() as ledger:
+        if args.adopt_csv:
+            print(f"Adopted {TRACKER_PATH} ({ledger.adopt_csv(DAILY_CARD, TRACKER_PATH)} rows)")
+        elif args.tracker == DAILY_CARD:
+            ledger.import_csv(DAILY_CARD, TRACKER_PATH)
+            if ledger.csv_diverged(DAILY_CARD, TRACKER_PATH):
+                print(f"WARNING: {TRACKER_PATH} was edited outside the ledger (see --adopt-csv)")
+        if args.export:
+            fields = TRACKER_FIELDS
+            if args.tracker == EV_PROPS:
+                rows = ledger.rows(EV_PROPS)
+                fields = sorted({field for row in rows for field in row})
+            try:
+                written = ledger.export_csv(args.tracker, args.export, fields)
+            except CsvDiverged as exc:
+                print(f"ERROR: {exc}", file=sys.stderr)
+                return 1
+            print(f"Saved {args.export} ({written} rows)")
+        if args.summary or not args.export:
+            for r in ledger.summary(args.tracker):
+                print(f"{r['date']}  props={r['props']}  settled={r['settled']}  open={r['props'] - r['settled']}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
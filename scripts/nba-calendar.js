@@ -1,520 +1,14 @@
-// NBA Archive Calendar Data
-// Last updated: August 22, 2026
+// NBA Archive Calendar Index
+// Last updated: October 19, 2026
 // Auto-generated by sync_calendars.py - DO NOT EDIT MANUALLY
-
-const ARCHIVE_DATA = [
-    { date: "2026-06-13", page: "knicks-clinch-bid-spurs-elimination-game-5-nba.html", title: "NBA Finals Game 5 Analysis: Knicks At Spurs" },
-    { date: "2026-06-13", page: "knicks-vs-spurs-nba-finals-game-5-analysis-stats-preview.html", title: "Knicks vs Spurs NBA Finals Game 5 Preview" },
-    { date: "2026-06-10", page: "knicks-spurs-game-4-msg-respond-nba.html", title: "NBA Finals Game 4: Spurs at Knicks - June 10, 2026" },
-    { date: "2026-06-10", page: "spurs-vs-knicks-nba-finals-game-4-analysis-stats-preview.html", title: "Spurs vs Knicks NBA Finals Game 4 Preview" },
-    { date: "2026-06-09", page: "knicks-spurs-finals-game-4-series-lead-nba.html", title: "NBA Finals Gm 4: Spurs at Knicks - June 9, 2026" },
-    { date: "2026-06-08", page: "spurs-vs-knicks-nba-finals-game-3-analysis-stats-preview.html", title: "Spurs vs Knicks NBA Finals Game 3 Preview" },
-    { date: "2026-06-05", page: "knicks-vs-spurs-nba-finals-game-2-analysis-stats-preview.html", title: "Knicks vs Spurs NBA Finals Game 2 Preview" },
-    { date: "2026-06-05", page: "spurs-response-game-brunson-closer-finals-game-2-nba.html", title: "NBA Finals Game 2 Analysis: Knicks at Spurs" },
-    { date: "2026-06-03", page: "knicks-vs-spurs-nba-finals-game-1-analysis-stats-preview.html", title: "Knicks vs Spurs NBA Finals Game 1 Preview" },
-    { date: "2026-06-03", page: "spurs-moneyline-knicks-nba-finals-game-1-wembanyama-frost-bank-center-nba-pick.html", title: "Spurs Moneyline vs Knicks NBA Finals Game 1 Pick" },
-    { date: "2026-06-03", page: "wembanyama-brunson-nba-finals-game-1-spurs-knicks-nba.html", title: "NBA Analysis" },
-    { date: "2026-05-30", page: "spurs-vs-thunder-western-conference-final-game-7-nba-analysis-stats-preview.html", title: "Spurs vs Thunder Game 7 Analysis, Stats, Preview - May 30, 2026" },
-    { date: "2026-05-30", page: "thunder-moneyline-spurs-game-7-western-conference-final-nba-pick.html", title: "Thunder vs Spurs Game 7 Pick May 30 2026" },
-    { date: "2026-05-30", page: "wembanyama-sga-game-7-winner-take-all-spurs-thunder-nba.html", title: "NBA Analysis - Spurs-Thunder Game 7 Winner-Take-All for the West - May 30, 2026" },
-    { date: "2026-05-28", page: "thunder-spurs-elimination-night-wcf-game-6-nba.html", title: "NBA Analysis - Thunder vs Spurs WCF Game 6 - May 28, 2026" },
-    { date: "2026-05-28", page: "thunder-vs-spurs-western-conference-final-game-6-nba-analysis-stats-preview.html", title: "Thunder vs Spurs Game 6 Analysis, Stats, Preview - May 28, 2026" },
-    { date: "2026-05-26", page: "spurs-thunder-game-5-win-or-go-home-wembanyama-shai-nba.html", title: "NBA Analysis - May 26, 2026" },
-    { date: "2026-05-26", page: "thunder-moneyline-spurs-game-5-western-conference-final-paycom-center-nba-pick.html", title: "Thunder Moneyline vs Spurs Game 5 Pick" },
-    { date: "2026-05-25", page: "knicks-sweep-bid-cavaliers-elimination-game-4-nba.html", title: "NBA Analysis - May 25, 2026" },
-    { date: "2026-05-24", page: "thunder-spurs-game-4-wembanyama-sga-nba.html", title: "NBA Analysis - May 24, 2026" },
-    { date: "2026-05-23", page: "cavaliers-season-on-the-line-knicks-eastern-conference-finals-game-3-nba.html", title: "NBA Preview: Knicks at Cavaliers ECF Game 3 - May 23, 2026" },
-    { date: "2026-05-22", page: "wembanyama-sga-spurs-thunder-western-conference-finals-game-3-nba.html", title: "NBA Preview: Thunder at Spurs WCF Game 3 - May 22, 2026" },
-    { date: "2026-05-21", page: "brunson-encore-knicks-cavaliers-eastern-conference-finals-game-2-nba.html", title: "NBA Preview: Cavaliers at Knicks ECF Game 2 - May 21, 2026" },
-    { date: "2026-05-20", page: "wembanyama-encore-fox-return-spurs-thunder-game-2-nba.html", title: "NBA Preview: Spurs at Thunder Western Conference Finals Game 2 - May 20, 2026" },
-    { date: "2026-05-19", page: "knicks-host-cavaliers-eastern-conference-finals-game-1-brunson-mitchell-nba.html", title: "NBA Preview: Knicks Host Cavaliers ECF Game 1 - May 19, 2026" },
-    { date: "2026-05-18", page: "spurs-thunder-west-final-game-one-nba.html", title: "Spurs at Thunder West Final Game 1 Preview" },
-    { date: "2026-05-17", page: "cavaliers-pistons-game-7-eastern-semis-nba.html", title: "NBA Game 7 Preview: Cavaliers at Pistons for May 17, 2026" },
-    { date: "2026-05-16", page: "nba-may-16-2026-recovery.html", title: "NBA Playoff Archive - May 16, 2026" },
-    { date: "2026-05-15", page: "pistons-cavaliers-spurs-timberwolves-game-six-nba.html", title: "NBA Playoff Preview: Pistons-Cavaliers and Spurs-Timberwolves Game 6 for May 15, 2026" },
-    { date: "2026-05-14", page: "nba-playoff-reset-cavaliers-pistons-spurs-timberwolves-game-six.html", title: "NBA Playoff Reset: Cavaliers-Pistons and Spurs-Timberwolves Game 6 Preview" },
-    { date: "2026-05-13", page: "nba-playoff-off-day-cavaliers-pistons-spurs-timberwolves.html", title: "NBA Playoff Off-Day Reset: Cavaliers-Pistons and Spurs-Timberwolves May 13, 2026" },
-    { date: "2026-05-12", page: "timberwolves-spurs-game-five-pivot-nba.html", title: "NBA Preview: Timberwolves at Spurs Game 5" },
-    { date: "2026-05-12", page: "timberwolves-spurs-game-five-pivot-nba-analysis-stats-preview.html", title: "Timberwolves vs Spurs Game 5 Preview" },
-    { date: "2026-05-11", page: "lakers-plus-11-thunder-game-4-elimination-spot-nba-pick.html", title: "Lakers +11 vs Thunder Game 4" },
-    { date: "2026-05-11", page: "thunder-sweep-watch-pistons-cavs-game-4-east-west-semis-nba.html", title: "NBA Analysis - May 11, 2026" },
-    { date: "2026-05-10", page: "knicks-76ers-spurs-wolves-game-4-east-west-semis-nba.html", title: "NBA Playoff Preview: Knicks vs 76ers and Spurs vs Timberwolves for May 10, 2026" },
-    { date: "2026-05-09", page: "nba-previews-archive-may-2026.html#2026-05-09", title: "NBA Analysis - 2026-05-09" },
-    { date: "2026-05-08", page: "knicks-76ers-spurs-wolves-game-3-east-west-semis-nba.html", title: "NBA Playoff Preview: Knicks vs 76ers and Spurs vs Timberwolves for May 8, 2026" },
-    { date: "2026-05-07", page: "thunder-cavaliers-2-0-leads-east-west-semis-nba.html", title: "NBA Analysis - May 07, 2026" },
-    { date: "2026-05-06", page: "knicks-host-sixers-spurs-host-wolves-conference-semis-nba.html", title: "NBA Playoff Preview: 76ers vs Knicks and Timberwolves vs Spurs for May 6, 2026" },
-    { date: "2026-05-05", page: "lakers-thunder-cavaliers-pistons-conference-semis-open-nba.html", title: "NBA Analysis - May 05, 2026" },
-    { date: "2026-05-04", page: "76ers-knicks-spurs-wolves-east-west-semis-open-nba.html", title: "NBA Analysis - May 04, 2026" },
-    { date: "2026-05-04", page: "knicks-76ers-under-213-game-1-second-round-madison-square-garden-nba-pick.html", title: "Knicks/76ers Under 213 Game 1 NBA Free Pick" },
-    { date: "2026-05-03", page: "game-7-sunday-pistons-magic-cavaliers-raptors-nba.html", title: "NBA Analysis - May 03, 2026" },
-    { date: "2026-05-02", page: "76ers-vs-celtics-nba-analysis-stats-preview.html", title: "76ers vs Celtics Game 7 Analysis May 02, 2026" },
-    { date: "2026-05-02", page: "celtics-76ers-game-7-winner-take-all-east-saturday-nba.html", title: "NBA Analysis - May 02, 2026" },
-    { date: "2026-05-01", page: "three-friday-game-6s-rockets-history-bid-magic-cavs-elimination-nba.html", title: "NBA Analysis - May 01, 2026" },
-    { date: "2026-04-30", page: "celtics-vs-76ers-game-6-eastern-conference-philadelphia-nba-analysis-stats-preview.html", title: "Celtics vs 76ers Game 6 Analysis April 30, 2026" },
-    { date: "2026-04-30", page: "eastern-game-6s-knicks-celtics-wolves-elimination-thursday-nba.html", title: "NBA Analysis - April 30, 2026" },
-    { date: "2026-04-29", page: "eastern-elimination-night-three-game-5s-nba.html", title: "NBA Analysis - April 29, 2026" },
-    { date: "2026-04-29", page: "lakers-moneyline-rockets-crypto-com-arena-nba.html", title: "Lakers Moneyline Free Pick vs Rockets at Crypto.com Arena NBA" },
-    { date: "2026-04-28", page: "knicks-hawks-tied-celtics-spurs-closeouts-tuesday-nba.html", title: "NBA Analysis - April 28, 2026" },
-    { date: "2026-04-27", page: "wolves-close-out-attempt-thunder-sweep-pistons-magic-monday-nba.html", title: "NBA Analysis - April 27, 2026" },
-    { date: "2026-04-27", page: "wolves-vs-nuggets-nba-analysis-stats-preview.html", title: "Featured Game Updated" },
-    { date: "2026-04-26", page: "cavs-celtics-spurs-lakers-game-four-sunday-nba.html", title: "NBA Analysis - April 26, 2026" },
-    { date: "2026-04-26", page: "lakers-vs-rockets-nba-analysis-stats-preview.html", title: "Lakers vs Rockets Analysis April 26, 2026" },
-    { date: "2026-04-25", page: "thunder-pistons-cliff-knicks-nuggets-game-four-saturday-nba.html", title: "NBA Analysis - April 25, 2026" },
-    { date: "2026-04-24", page: "lebron-kd-wemby-doubt-celtics-sixers-three-game-three-friday-nba.html", title: "NBA Analysis - April 24, 2026" },
-    { date: "2026-04-23", page: "jokic-edwards-brunson-mitchell-three-game-three-nba.html", title: "NBA Analysis - April 23, 2026" },
-    { date: "2026-04-22", page: "pistons-bounce-back-thunder-rout-magic-suns-nba.html", title: "NBA Analysis - April 22, 2026" },
-    { date: "2026-04-21", page: "durant-return-wemby-celtics-blowout-three-game-two-nba.html", title: "NBA Analysis - April 21, 2026" },
-    { date: "2026-04-20", page: "jokic-triple-double-knicks-cavs-three-game-two-nba.html", title: "NBA Analysis - April 20, 2026" },
-    { date: "2026-04-20", page: "nba-college-basketball-picks-predictions-analysis-february-2026.html", title: "NBA College Basketball Picks Predictions Feb 2026" },
-    { date: "2026-04-20", page: "timberwolves-vs-nuggets-nba-analysis-stats-preview.html", title: "Timberwolves vs Nuggets Game 2 Analysis April 20 2026" },
-    { date: "2026-04-19", page: "tatum-returns-sixers-celtics-four-game-one-sunday-nba.html", title: "NBA Analysis - April 19, 2026" },
-    { date: "2026-04-18", page: "luka-durant-first-round-four-game-one-saturday-nba.html", title: "NBA Analysis - April 18, 2026" },
-    { date: "2026-04-17", page: "curry-booker-play-in-finale-hornets-magic-east-seed-nba.html", title: "NBA Analysis - April 17, 2026" },
-    { date: "2026-04-17", page: "warriors-vs-suns-nba-analysis-stats-preview.html", title: "Warriors vs Suns NBA Play-In Analysis &amp; Preview April 17 2026" },
-    { date: "2026-04-16", page: "nba-previews-archive-april-2026.html#2026-04-16", title: "NBA Analysis - 2026-04-16" },
-    { date: "2026-04-15", page: "play-in-elimination-warriors-clippers-magic-sixers-nba.html", title: "NBA Analysis - April 15, 2026" },
-    { date: "2026-04-14", page: "play-in-tournament-heat-hornets-blazers-suns-nba.html", title: "NBA Analysis - April 14, 2026" },
-    { date: "2026-04-13", page: "nba-play-in-tournament-2026-full-preview-matchups-analysis.html", title: "2026 NBA Play-In Tournament Preview: Every Game Analyzed" },
-    { date: "2026-04-12", page: "nuggets-vs-spurs-nba-analysis-stats-preview.html", title: "Nuggets vs Spurs NBA Preview April 12 2026" },
-    { date: "2026-04-12", page: "wembanyama-awards-game-regular-season-finale-15-game-sunday-nba.html", title: "NBA Analysis - April 12, 2026" },
-    { date: "2026-04-10", page: "suns-lakers-west-showdown-spurs-dominance-15-game-friday-nba.html", title: "NBA Analysis - April 10, 2026" },
-    { date: "2026-04-09", page: "celtics-knicks-east-heavyweight-lakers-warriors-rivalry-nba.html", title: "NBA Analysis - April 9, 2026" },
-    { date: "2026-04-08", page: "pistons-historic-season-thunder-dominant-regular-season-finale-nba.html", title: "NBA Analysis - April 8, 2026" },
-    { date: "2026-04-07", page: "thunder-historic-66-win-pace-luka-sidelined-rockets-suns-showdown-nba.html", title: "NBA Analysis - April 7, 2026" },
-    { date: "2026-04-06", page: "pistons-number-one-seed-spurs-fox-dominance-final-week-nba.html", title: "NBA Analysis - April 6, 2026" },
-    { date: "2026-04-05", page: "curry-returns-lakers-visit-flagg-mavs-11-game-sunday-nba.html", title: "NBA Analysis - April 5, 2026" },
-    { date: "2026-04-05", page: "rockets-vs-warriors-nba-analysis-stats-preview.html", title: "Rockets vs Warriors NBA Analysis Stats Preview April 5 2026" },
-    { date: "2026-04-04", page: "spurs-nuggets-wemby-jokic-showdown-pistons-surge-nba.html", title: "NBA Analysis - April 4, 2026" },
-    { date: "2026-04-03", page: "flagg-historic-51-celtics-rout-bucks-blowout-friday-nba.html", title: "NBA Analysis - April 3, 2026" },
-    { date: "2026-04-02", page: "lakers-vs-thunder-nba-analysis-stats-preview.html", title: "Lakers vs Thunder Analysis Stats Preview April 2 2026" },
-    { date: "2026-04-02", page: "luka-sga-west-showdown-pistons-host-wolves-nba.html", title: "NBA Analysis - April 2, 2026" },
-    { date: "2026-04-01", page: "spurs-vs-warriors-nba-analysis-stats-preview.html", title: "Spurs vs Warriors Analysis Stats Preview April 1 2026" },
-    { date: "2026-04-01", page: "wemby-spurs-historic-run-celtics-heat-espn-doubleheader-nba.html", title: "NBA Analysis - April 1, 2026" },
-    { date: "2026-03-31", page: "cavaliers-vs-lakers-nba-analysis-stats-preview.html", title: "Cavaliers vs Lakers Analysis Stats Preview March 31 2026" },
-    { date: "2026-03-31", page: "cavs-lakers-luka-mitchell-showdown-raptors-visit-pistons-nba.html", title: "NBA Analysis - March 31, 2026" },
-    { date: "2026-03-30", page: "pistons-vs-thunder-nba-analysis-stats-preview.html", title: "Pistons vs Thunder Analysis Stats Preview March 30 2026" },
-    { date: "2026-03-29", page: "nba-previews-archive-march-2026.html#2026-03-29", title: "NBA Analysis - 2026-03-29" },
-    { date: "2026-03-28", page: "nba-previews-archive-march-2026.html#2026-03-28", title: "NBA Analysis - 2026-03-28" },
-    { date: "2026-03-27", page: "nba-previews-archive-march-2026.html#2026-03-27", title: "NBA Analysis - 2026-03-27" },
-    { date: "2026-03-26", page: "knicks-pelicans-kings-thursday-three-game-nba.html", title: "NBA Analysis - March 26, 2026" },
-    { date: "2026-03-25", page: "nba-previews-archive-march-2026.html#2026-03-25", title: "NBA Analysis - 2026-03-25" },
-    { date: "2026-03-24", page: "nba-previews-archive-march-2026.html#2026-03-24", title: "NBA Analysis - 2026-03-24" },
-    { date: "2026-03-23", page: "nba-previews-archive-march-2026.html", title: "NBA Analysis - 2026-03-23" },
-    { date: "2026-03-22", page: "nba-previews-archive-march-2026.html", title: "NBA Analysis - 2026-03-22" },
-    { date: "2026-03-21", page: "nba-previews-archive-march-2026.html#2026-03-21", title: "NBA Analysis - 2026-03-21" },
-    { date: "2026-03-20", page: "hawks-plus-2-5-at-rockets-nba.html", title: "Hawks +2.5 at Rockets NBA Pick" },
-    { date: "2026-03-20", page: "knicks-nets-rivalry-pistons-surge-celtics-road-trip-nba.html", title: "NBA Analysis - March 20, 2026" },
-    { date: "2026-03-20", page: "nba.html", title: "NBA Analysis - April 9, 2026" },
-    { date: "2026-03-19", page: "nba-previews-archive-march-2026.html#2026-03-19", title: "NBA Analysis - 2026-03-19" },
-    { date: "2026-03-18", page: "lakers-rockets-luka-durant-duel-warriors-celtics-nba.html", title: "NBA Analysis - March 18, 2026" },
-    { date: "2026-03-17", page: "cavaliers-thunder-dominate-march-madness-eve-nba.html", title: "NBA Analysis - March 17, 2026" },
-    { date: "2026-03-16", page: "luka-durant-showdown-spurs-dominate-west-nba.html", title: "NBA Analysis - March 16, 2026" },
-    { date: "2026-03-15", page: "thunder-host-wolves-pistons-surge-continues-nba.html", title: "NBA Analysis - March 15, 2026" },
-    { date: "2026-03-14", page: "nuggets-lakers-jokic-luka-showdown-nba.html", title: "NBA Game Previews Analysis Saturday March 14 2026" },
-    { date: "2026-03-14", page: "nuggets-vs-lakers-nba-analysis-stats-preview.html", title: "Denver Nuggets vs Los Angeles Lakers Analysis Stats Preview March 14 2026" },
-    { date: "2026-03-13", page: "cavaliers-mavericks-blowouts-warriors-primetime-nba.html", title: "NBA Game Previews Analysis Friday March 13 2026" },
-    { date: "2026-03-12", page: "celtics-thunder-contender-clash-pistons-surge-nba.html", title: "NBA Analysis - March 12, 2026" },
-    { date: "2026-03-12", page: "celtics-vs-thunder-nba-analysis-stats-preview.html", title: "Celtics at Thunder NBA Analysis Stats Preview March 12 2026" },
-    { date: "2026-03-11", page: "cavaliers-magic-espn-doubleheader-rockets-nuggets-nba.html", title: "NBA Analysis - March 11, 2026" },
-    { date: "2026-03-10", page: "spurs-celtics-showdown-wolves-lakers-western-clash-nba.html", title: "NBA March 10 2026: Spurs-Celtics, Wolves-Lakers" },
-    { date: "2026-03-09", page: "nuggets-thunder-defending-champs-headline-monday-nba.html", title: "NBA Game Previews Analysis Monday March 9 2026" },
-    { date: "2026-03-09", page: "nuggets-vs-thunder-nba-analysis-stats-preview.html", title: "Nuggets at Thunder NBA Analysis Stats Preview March 9 2026" },
-    { date: "2026-03-08", page: "celtics-depleted-cavs-knicks-lakers-abc-doubleheader-nba.html", title: "NBA Game Previews Analysis Sunday March 8 2026" },
-    { date: "2026-03-07", page: "pistons-first-in-east-warriors-thunder-abc-showcase-nba.html", title: "NBA Game Previews Analysis Saturday March 7 2026" },
-    { date: "2026-03-07", page: "warriors-vs-thunder-nba-analysis-stats-preview.html", title: "Warriors at Thunder NBA Analysis Stats Preview March 7 2026" },
-    { date: "2026-03-06", page: "knicks-seek-revenge-in-denver-tatum-returns-nba.html", title: "NBA Game Previews Analysis Friday March 6 2026" },
-    { date: "2026-03-05", page: "lakers-nuggets-western-conference-rivalry-nba.html", title: "NBA Game Previews Analysis Thursday March 5 2026" },
-    { date: "2026-03-05", page: "lakers-vs-nuggets-nba-analysis-stats-preview.html", title: "Lakers at Nuggets NBA Analysis Stats Preview March 5 2026" },
-    { date: "2026-03-04", page: "thunder-at-knicks-nba-analysis-stats-preview.html", title: "Thunder at Knicks NBA Analysis Stats Preview March 4 2026" },
-    { date: "2026-03-04", page: "thunder-knicks-marquee-matchup-nba.html", title: "NBA Game Previews Analysis Wednesday March 4 2026" },
-    { date: "2026-03-03", page: "pistons-cavaliers-central-division-nba.html", title: "NBA Game Previews Analysis Tuesday March 3 2026" },
-    { date: "2026-03-02", page: "celtics-bucks-playoff-positioning-nba.html", title: "NBA Game Previews Analysis Monday March 2 2026" },
-    { date: "2026-03-01", page: "spurs-at-knicks-nba-analysis-stats-preview.html", title: "Spurs at Knicks Analysis Stats Preview March 1 2026" },
-    { date: "2026-03-01", page: "timberwolves-nuggets-mile-high-rivalry-nba.html", title: "NBA Game Previews Analysis Sunday March 1 2026" },
-    { date: "2026-02-27", page: "nuggets-thunder-western-conference-clash-nba.html", title: "NBA Game Previews Analysis Friday February 27 2026" },
-    { date: "2026-02-26", page: "rockets-magic-western-playoff-race-nba.html", title: "NBA Game Previews Analysis Thursday February 26 2026" },
-    { date: "2026-02-25", page: "cavaliers-bucks-battle-for-east-supremacy-nba.html", title: "NBA Game Previews Analysis Wednesday February 25 2026" },
-    { date: "2026-02-24", page: "knicks-cavaliers-eastern-conference-showdown-nba.html", title: "NBA Game Previews Analysis Tuesday February 24 2026" },
-    { date: "2026-02-23", page: "nba-picks-analysis-against-the-spread.html", title: "NBA Analysis - February 23, 2026" },
-    { date: "2026-02-23", page: "nba-picks.html", title: "Spurs vs Pistons Under 232.5 Prediction Picks Monday February 23 2026" },
-    { date: "2026-02-22", page: "nba-picks-analysis-against-the-spread-v2.html", title: "NBA Analysis - February 22, 2026" },
-    { date: "2026-02-21", page: "kings-fox-returns-to-sacramento-nba-preview.html", title: "NBA Game Previews Analysis Saturday February 21 2026" },
-    { date: "2026-02-20", page: "nba-picks-analysis-against-the-spread-v3.html", title: "NBA Picks Against the Spread February 20 2026" },
-    { date: "2026-02-15", page: "nba-all-star-game-2026-usa-vs-world-prediction-picks.html", title: "NBA All-Star Game 2026 USA vs World Round Robin Preview Analysis February 15 2026" },
-    { date: "2026-02-15", page: "nba-picks-analysis-against-the-spread-v4.html", title: "NBA All-Star Game Analysis February 15 2026" },
-    { date: "2026-02-12", page: "nba-picks-analysis-against-the-spread-v5.html", title: "NBA Analysis - February 12, 2026" },
-    { date: "2026-02-11", page: "nba-picks-analysis-against-the-spread-v6.html", title: "NBA Analysis - February 11, 2026" },
-    { date: "2026-02-10", page: "nba-picks-analysis-against-the-spread-v7.html", title: "NBA Analysis - February 10, 2026" },
-    { date: "2026-02-09", page: "nba-picks-analysis-against-the-spread-v8.html", title: "NBA Analysis - February 9, 2026" },
-    { date: "2026-02-08", page: "nba-picks-analysis-against-the-spread-v9.html", title: "NBA Analysis - February 8, 2026" },
-    { date: "2026-02-07", page: "nba-picks-analysis-against-the-spread-v10.html", title: "NBA Analysis - February 7, 2026" },
-    { date: "2026-02-06", page: "nba-picks-analysis-against-the-spread-v11.html", title: "NBA Analysis - February 6, 2026" },
-    { date: "2026-02-05", page: "nba-picks-analysis-against-the-spread-v12.html", title: "NBA Analysis - February 5, 2026" },
-    { date: "2026-02-04", page: "nba-picks-analysis-against-the-spread-v13.html", title: "NBA Analysis - February 4, 2026" },
-    { date: "2026-02-03", page: "nba-picks-analysis-against-the-spread-v14.html", title: "NBA Analysis - February 3, 2026" },
-    { date: "2026-02-02", page: "nba-picks-analysis-against-the-spread-v15.html", title: "NBA Analysis - February 2, 2026" },
-    { date: "2026-02-01", page: "nba-picks-analysis-against-the-spread-v16.html", title: "NBA Analysis - February 1, 2026" },
-    { date: "2026-01-30", page: "nba-picks-analysis-against-the-spread-v17.html", title: "NBA Analysis - January 30, 2026" },
-    { date: "2026-01-29", page: "nba-picks-analysis-against-the-spread-v18.html", title: "NBA Analysis - January 29, 2026" },
-    { date: "2026-01-28", page: "nba-picks-analysis-against-the-spread-v19.html", title: "NBA Analysis - January 28, 2026" },
-    { date: "2026-01-27", page: "nba-picks-analysis-against-the-spread-v20.html", title: "NBA Analysis - January 27, 2026" },
-    { date: "2026-01-26", page: "nba-picks-analysis-against-the-spread-v21.html", title: "NBA Analysis - January 26, 2026" },
-    { date: "2026-01-25", page: "nba-picks-analysis-against-the-spread-v22.html", title: "NBA Analysis - January 25, 2026" },
-    { date: "2026-01-24", page: "nba-picks-analysis-against-the-spread-v23.html", title: "NBA Analysis - January 24, 2026" },
-    { date: "2026-01-23", page: "nba-picks-analysis-against-the-spread-v24.html", title: "NBA Analysis - January 23, 2026" },
-    { date: "2026-01-23", page: "pacers-vs-thunder-nba-finals-rematch-prediction-picks.html", title: "NBA: Pacers @ Thunder Picks & Prediction - January 23, 2026" },
-    { date: "2026-01-22", page: "nba-picks-analysis-against-the-spread-v25.html", title: "NBA Analysis - January 22, 2026" },
-    { date: "2026-01-22", page: "warriors-vs-mavericks-nba-prediction-picks.html", title: "NBA: Warriors @ Mavericks Picks & Prediction - January 22, 2026" },
-    { date: "2026-01-21", page: "nba-picks-analysis-against-the-spread-v26.html", title: "NBA Analysis - January 21, 2026" },
-    { date: "2026-01-21", page: "thunder-vs-bucks-nba-prediction-picks.html", title: "NBA: Thunder @ Bucks Picks & Prediction - January 21, 2026" },
-    { date: "2026-01-20", page: "nba-picks-analysis-against-the-spread-v27.html", title: "NBA Analysis - January 20, 2026" },
-    { date: "2026-01-20", page: "spurs-vs-rockets-nba-prediction-picks.html", title: "NBA: Spurs @ Rockets Picks & Prediction - January 20, 2026" },
-    { date: "2026-01-19", page: "nba-picks-analysis-against-the-spread-v28.html", title: "NBA Analysis - January 19, 2026" },
-    { date: "2026-01-18", page: "nba-picks-analysis-against-the-spread-v29.html", title: "NBA Analysis - January 18, 2026" },
-    { date: "2026-01-17", page: "nba-picks-analysis-against-the-spread-v30.html", title: "NBA Analysis - January 17, 2026" },
-    { date: "2026-01-16", page: "nba-picks-analysis-against-the-spread-v31.html", title: "NBA Analysis - January 16, 2026" },
-    { date: "2026-01-15", page: "nba-picks-analysis-against-the-spread-v32.html", title: "NBA Analysis - January 15, 2026" },
-    { date: "2026-01-14", page: "nba-picks-analysis-against-the-spread-v33.html", title: "NBA Analysis - January 14, 2026" },
-    { date: "2026-01-13", page: "nba-picks-analysis-against-the-spread-v34.html", title: "NBA Analysis - January 13, 2026" },
-    { date: "2026-01-12", page: "nba-picks-analysis-against-the-spread-v35.html", title: "NBA Analysis - January 12, 2026" },
-    { date: "2026-01-11", page: "nba-picks-analysis-against-the-spread-v36.html", title: "NBA Analysis - January 11, 2026" },
-    { date: "2026-01-10", page: "nba-picks-analysis-against-the-spread-v37.html", title: "NBA Analysis - January 10, 2026" },
-    { date: "2026-01-09", page: "nba-picks-analysis-against-the-spread-v38.html", title: "NBA Analysis - January 09, 2026" },
-    { date: "2026-01-08", page: "nba-picks-analysis-against-the-spread-v39.html", title: "NBA Analysis - January 08, 2026" },
-    { date: "2026-01-07", page: "nba-picks-analysis-against-the-spread-v40.html", title: "NBA Analysis - January 07, 2026" },
-    { date: "2026-01-06", page: "nba-picks-analysis-against-the-spread-v41.html", title: "NBA Analysis - January 06, 2026" },
-    { date: "2026-01-05", page: "nba-picks-analysis-against-the-spread-v42.html", title: "NBA Analysis - January 05, 2026" },
-    { date: "2026-01-04", page: "nba-picks-analysis-against-the-spread-v43.html", title: "NBA Analysis - January 04, 2026" },
-    { date: "2026-01-03", page: "nba-picks-analysis-against-the-spread-january-03-2026-part-2.html", title: "NBA Analysis - January 03, 2026 Part 2" },
-    { date: "2026-01-03", page: "nba-picks-analysis-against-the-spread-v44.html", title: "NBA Analysis - January 03, 2026" },
-    { date: "2026-01-02", page: "archives/nba/2026-01-02.html", title: "NBA Archive - 2026-01-02" },
-    { date: "2026-01-01", page: "nba-picks-analysis-against-the-spread-january-01-2026-part-2.html", title: "NBA Analysis - January 01, 2026 Part 2" },
-    { date: "2026-01-01", page: "nba-picks-analysis-against-the-spread-v45.html", title: "NBA Analysis - January 1, 2026" },
-    { date: "2025-12-31", page: "nba-picks-analysis-against-the-spread-december-31-2025-part-2.html", title: "NBA Analysis - December 31, 2025 Part 2" },
-    { date: "2025-12-31", page: "nba-picks-analysis-against-the-spread-v46.html", title: "NBA Analysis - December 31, 2025" },
-    { date: "2025-12-28", page: "nba-picks-analysis-against-the-spread-december-28-2025-part-2.html", title: "NBA Analysis - December 28, 2025 Part 2" },
-    { date: "2025-12-28", page: "nba-picks-analysis-against-the-spread-december-28-2025-part-3.html", title: "NBA Analysis - December 28, 2025 Part 3" },
-    { date: "2025-12-28", page: "nba-picks-analysis-against-the-spread-december-28-2025-part-4.html", title: "NBA Analysis - December 28, 2025 Part 4" },
-    { date: "2025-12-28", page: "nba-picks-analysis-against-the-spread-v47.html", title: "NBA Analysis - December 28, 2025" },
-    { date: "2025-12-27", page: "nba-picks-analysis-against-the-spread-v48.html", title: "NBA Analysis - December 27, 2025" },
-    { date: "2025-12-26", page: "nba-picks-analysis-against-the-spread-v49.html", title: "NBA Analysis - December 26, 2025" },
-    { date: "2025-12-25", page: "nba-picks-analysis-against-the-spread-v50.html", title: "NBA Analysis - December 25, 2025" },
-    { date: "2025-12-23", page: "nba-picks-analysis-against-the-spread-v51.html", title: "NBA Analysis - December 23, 2025" },
-    { date: "2025-12-22", page: "nba-picks-analysis-against-the-spread-december-22-2025-part-2.html", title: "NBA Analysis - December 22, 2025 Part 2" },
-    { date: "2025-12-22", page: "nba-picks-analysis-against-the-spread-december-22-2025-part-3.html", title: "NBA Analysis - December 22, 2025 Part 3" },
-    { date: "2025-12-22", page: "nba-picks-analysis-against-the-spread-v52.html", title: "NBA Analysis - December 22, 2025" },
-    { date: "2025-12-21", page: "nba-picks-analysis-against-the-spread-december-21-2025-part-2.html", title: "NBA Analysis - December 21, 2025 Part 2" },
-    { date: "2025-12-21", page: "nba-picks-analysis-against-the-spread-december-21-2025-part-3.html", title: "NBA Analysis - December 21, 2025 Part 3" },
-    { date: "2025-12-21", page: "nba-picks-analysis-against-the-spread-v53.html", title: "NBA Analysis - December 21, 2025" },
-    { date: "2025-12-20", page: "nba-picks-analysis-against-the-spread-december-20-2025-part-2.html", title: "NBA Analysis - December 20, 2025 Part 2" },
-    { date: "2025-12-20", page: "nba-picks-analysis-against-the-spread-december-20-2025-part-3.html", title: "NBA Analysis - December 20, 2025 Part 3" },
-    { date: "2025-12-20", page: "nba-picks-analysis-against-the-spread-december-20-2025-part-4.html", title: "NBA Analysis - December 20, 2025 Part 4" },
-    { date: "2025-12-20", page: "nba-picks-analysis-against-the-spread-v54.html", title: "NBA Analysis - December 20, 2025" },
-    { date: "2025-12-19", page: "nba-dec19.html", title: "NBA Results - December 19, 2025" },
-    { date: "2025-12-19", page: "nba-picks-analysis-against-the-spread-v55.html", title: "NBA Analysis - December 19, 2025" },
-    { date: "2025-12-18", page: "nba-picks-analysis-against-the-spread-v56.html", title: "NBA Analysis - December 18, 2025" },
-    { date: "2025-12-17", page: "nba-picks-analysis-against-the-spread-v57.html", title: "NBA Preview - December 17, 2025" },
-    { date: "2025-12-15", page: "nba-picks-analysis-against-the-spread-december-15-2025-part-2.html", title: "NBA Analysis - December 15, 2025 Part 2" },
-    { date: "2025-12-15", page: "nba-picks-analysis-against-the-spread-v58.html", title: "NBA Analysis - December 15, 2025" },
-    { date: "2025-12-14", page: "nba-picks-analysis-against-the-spread-v59.html", title: "NBA Preview - December 14, 2025" },
-    { date: "2025-12-13", page: "nba-picks-analysis-against-the-spread-v60.html", title: "NBA December 13, 2025 Preview" },
-    { date: "2025-12-12", page: "nba-picks-analysis-against-the-spread-v61.html", title: "NBA December 12, 2025 Preview" },
-    { date: "2025-12-11", page: "nba-picks-analysis-against-the-spread-v62.html", title: "NBA December 11, 2025 Preview" },
-    { date: "2025-12-10", page: "lakers-vs-spurs-nba-cup-prediction-picks.html", title: "Lakers vs Spurs NBA Cup Quarterfinal Picks & Prediction - December 10, 2025" },
-    { date: "2025-12-10", page: "nba-picks-analysis-against-the-spread-v63.html", title: "NBA December 10, 2025 Preview" },
-    { date: "2025-12-01", page: "archives/nba/2025-12-01.html", title: "NBA Archive - 2025-12-01" },
-    { date: "2025-11-30", page: "archives/nba/2025-11-30.html", title: "NBA Archive - 2025-11-30" },
-    { date: "2025-11-29", page: "archives/nba/2025-11-29.html", title: "NBA Archive - 2025-11-29" },
-    { date: "2025-11-24", page: "nba-picks-analysis-against-the-spread-v64.html", title: "NBA November 24, 2025 Preview" },
-];
-
-const dateMap = {};
-ARCHIVE_DATA.forEach(item => { if (!dateMap[item.date]) dateMap[item.date] = item; });
-
-const pageToDateMap = {};
-ARCHIVE_DATA.forEach(item => { pageToDateMap[item.page] = item.date; });
-
-const SPORT_HUB_PAGE = 'nba-previews.html';
-const SPORT_LABEL = 'NBA';
-const MAIN_PAGES = ['nba.html', 'nhl.html', 'ncaab.html', 'ncaaf.html', 'nfl.html', 'mlb.html', 'soccer.html', 'nba-previews.html', 'nhl-previews.html', 'mlb-previews.html', 'soccer-previews.html', 'college-basketball-previews.html'];
-function isConcreteContentPage(page) {
-    // Pick pages use their own template (no archive calendar sidebar); a stale
-    // hub must never redirect to one as the day's board (soccer hub, June 3 2026).
-    // Featured-game (*-analysis-stats-preview) pages load featured-games-calendar.js
-    // (the all-sports marquee calendar) and have their own Featured hub; a SPORT hub
-    // must never redirect to one, or it swaps in the featured calendar and drops
-    // sport-only dates (MLB June 4 went blank when the MLB hub redirected there, June 22 2026).
-    // The combined season 'picks-predictions-analysis-<month>-<year>' pages are blog/Pick
-    // Archive indexes, not a day's preview; a hub must not redirect to one (NCAAB July 7 2026).
-    return !!page && !MAIN_PAGES.includes(page) && !page.includes('#') && !page.includes('-archive-') && !/-analysis-stats-preview\.html$/.test(page) && !/-picks?(?:-v\d+)?\.html$/.test(page) && !/picks-predictions-analysis-[a-z]+-\d{4}\.html$/.test(page);
-}
-const latestContentEntry = ARCHIVE_DATA.find(item => item.page && item.page !== SPORT_HUB_PAGE);
-const latestConcreteEntry = ARCHIVE_DATA.find(item => isConcreteContentPage(item.page));
-window.LATEST_CONTENT_PAGE = latestConcreteEntry ? latestConcreteEntry.page : (latestContentEntry ? latestContentEntry.page : null);
-
-function getLocalDateString(date) {
-    const parts = new Intl.DateTimeFormat('en-US', {
-        timeZone: 'America/Los_Angeles',
-        year: 'numeric',
-        month: '2-digit',
-        day: '2-digit'
-    }).formatToParts(date).reduce((acc, part) => {
-        acc[part.type] = part.value;
-        return acc;
-    }, {});
-    return parts.year + '-' + parts.month + '-' + parts.day;
-}
-
-// Current real date is separate from the active article/page date.
-const todayStr = getLocalDateString(new Date());
-
-const todayMonth = todayStr.substring(0, 7);
-const latestAvailableDate = latestConcreteEntry ? latestConcreteEntry.date : (ARCHIVE_DATA.length > 0 ? ARCHIVE_DATA[0].date : todayStr);
-const todayHasData = ARCHIVE_DATA.some(item => item.date === todayStr && isConcreteContentPage(item.page));
-
-// Handle both root pages and archive pages
-const pathname = window.location.pathname;
-let currentPage;
-if (pathname.includes('/archives/')) {
-    // For archive pages, get the full relative path from archives/
-    currentPage = pathname.replace(/^\//, '');
-} else {
-    // For root pages, just get the filename
-    currentPage = pathname.split('/').pop() || 'index.html';
-}
-
-const isMainPage = MAIN_PAGES.includes(currentPage);
-const forcedDate = window.FORCED_PAGE_DATE || null;
-// Hub/main pages never get a current-page "Article" highlight, even if a
-// stale window.FORCED_PAGE_DATE is left in the hub HTML.
-const activeArticleDate = isMainPage ? null : (forcedDate || pageToDateMap[currentPage] || null);
-const currentPageDate = activeArticleDate;
-
-const months = new Set();
-ARCHIVE_DATA.forEach(item => { const [y, m] = item.date.split('-'); months.add(y + '-' + m); });
-// Always include the current month so the hub calendar can point at today.
-months.add(todayMonth);
-
-// Main/hub pages show today's month; archive pages show their month
-const sortedMonths = Array.from(months).sort().reverse();
-const monthNames = ['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September', 'October', 'November', 'December'];
-
-// Dated preview pages should open on the article month; undated hubs open on the current month.
-let displayMonth = activeArticleDate ? activeArticleDate.substring(0, 7) : (isMainPage ? todayMonth : sortedMonths[0]);
-
-function installCalendarStateStyles() {
-    if (document.getElementById('mlb-calendar-state-styles')) return;
-    const style = document.createElement('style');
-    style.id = 'mlb-calendar-state-styles';
-    style.textContent = `
-.calendar-days .cal-day,.calendar-grid .calendar-day{position:relative}
-.calendar-days .cal-day.is-linked,.calendar-days .cal-day.has-content{cursor:pointer;background:rgba(0,229,255,.15);color:#00e5ff;font-weight:700;border:1px solid rgba(0,229,255,.32)}
-.calendar-days .cal-day.is-linked:hover,.calendar-days .cal-day.has-content:hover{background:rgba(0,229,255,.25);box-shadow:0 0 12px rgba(0,229,255,.28)}
-.calendar-days .cal-day.is-disabled{opacity:.82}
-.calendar-days .cal-day.is-past:not(.current-page):not(.today){color:#9aa3af}
-.calendar-days .cal-day.is-future:not(.current-page):not(.today){color:#c7ced8}
-.calendar-days .cal-day.today{border:2px solid #ffd54f!important;box-shadow:0 0 0 1px rgba(255,213,79,.34),0 0 12px rgba(255,213,79,.28)!important}
-.calendar-days .cal-day.current-page{background:rgba(0,229,255,.72)!important;color:#fff!important;border:2px solid #00e5ff!important;font-weight:900!important;box-shadow:0 0 12px rgba(0,229,255,.45)!important}
-.calendar-days .cal-day.today.current-page{background:linear-gradient(135deg,rgba(0,229,255,.72),rgba(255,213,79,.42))!important;border-color:#ffd54f!important}
-`;
-    document.head.appendChild(style);
-}
-
-function navigateToCalendarPage(page) {
-    if (page) window.location.href = '/' + page;
-}
-
-// Multi-post dates go straight to that day's main slate/preview page (no chooser popup).
-// Falls back to the first/newest post if no slate-style page is found.
-function pickPrimaryPostForDate(postsForDate) {
-    const slate = postsForDate.find(item => {
-        const t = (item.title || '').toLowerCase();
-        const p = (item.page || '').toLowerCase();
-        return /\banalysis\b|\bpreview\b|\bslate\b|\bboard\b|\bfull card\b/.test(t)
-            || /-game-|-slate-|-board-|-previews|full-card/.test(p);
-    });
-    return slate || postsForDate[0];
-}
-
-// Popup chooser fully removed (Nima): clicking a date opens the page directly.
-
-function renderCalendar(yearMonth) {
-    const [year, month] = yearMonth.split('-').map(Number);
-    const yearEl = document.getElementById('cal-year') || document.querySelector('.year-display');
-    if (yearEl) yearEl.textContent = year;
-    const firstDay = new Date(year, month - 1, 1).getDay();
-    const daysInMonth = new Date(year, month, 0).getDate();
-    const container = document.getElementById('calendar-days') || document.getElementById('calendarDays');
-    if (!container) return;
-    container.innerHTML = '';
-    for (let i = 0; i < firstDay; i++) { const cell = document.createElement('div'); cell.className = 'cal-day empty'; container.appendChild(cell); }
-    for (let d = 1; d <= daysInMonth; d++) {
-        const dateStr = year + '-' + String(month).padStart(2, '0') + '-' + String(d).padStart(2, '0');
-        const postsForDate = ARCHIVE_DATA.filter(item => item.date === dateStr && item.page);
-        const hasData = postsForDate.length > 0 ? postsForDate[0] : null;
-        let classes = 'cal-day';
-        if (dateStr === currentPageDate) classes += ' current-page';
-        // NO 'today' marker (Nima, June 24 2026): the calendar highlights ONLY the
-        // date of the article being viewed (current-page). A separate gold 'today'
-        // cell was a wrong second highlight - on out-of-season sports (NHL/NBA) it lit
-        // a day with no article, and it fought the article's own date. Removed for good.
-        if (hasData) classes += ' has-content is-linked';
-        else classes += ' is-disabled';
-        if (dateStr < todayStr) classes += ' is-past';
-        if (dateStr > todayStr) classes += ' is-future';
-        const cell = document.createElement('div');
-        cell.className = classes;
-        if (!cell.dataset) cell.dataset = {};
-        cell.dataset.date = dateStr;
-        cell.dataset.currentDate = todayStr;
-        if (dateStr === currentPageDate) cell.dataset.activeArticleDate = currentPageDate;
-        if (hasData) cell.dataset.linked = 'true';
-        cell.textContent = d;
-        if (hasData) {
-            cell.title = postsForDate.map(item => item.title).join('\n');
-            cell.onclick = () => {
-                if (postsForDate.length === 1) navigateToCalendarPage(hasData.page);
-                else navigateToCalendarPage(pickPrimaryPostForDate(postsForDate).page);
-            };
-        }
-        container.appendChild(cell);
-    }
-}
-
-// Hub guard: a `*-previews.html` hub page bakes in the last published dated
-// slate/article. When that baked article is out of date (its FORCED_PAGE_DATE
-// is not today), it must not be presented as the current board. If a current/
-// upcoming concrete preview exists we redirect to it. Otherwise the baked
-// board STAYS VISIBLE (STALE_GUARD_BANNER_20260606, Nima June 6 2026: a
-// near-empty hub is worse for visitors and Googlebot than a clearly-dated
-// older board) and is labeled with its real date plus a link to the latest
-// available preview. It is never presented as today\u2019s board. No fabricated data.
-function renderPreviewHub() {
-    if (currentPage !== SPORT_HUB_PAGE || !SPORT_HUB_PAGE) return;
-    const baked = window.FORCED_PAGE_DATE || null;
-    // ALWAYS-LATEST HUB (Nima, July 7 2026): the nav "<Sport> Preview" link must land
-    // on the most recent published preview for that sport - NEVER a stale/offseason
-    // archive landing screen. Leave the hub as-is ONLY when today actually has a fresh
-    // concrete board (in-season daily slate baked in). Otherwise - offseason, a hand-
-    // built archive page with no FORCED_PAGE_DATE, or an in-season gap/off-day - fall
-    // through and redirect to the newest published concrete preview below. Keyed on real
-    // content presence (todayHasData), not on whether a baked date happens to exist, so
-    // a dead offseason archive page (e.g. college-basketball-previews.html in July) can
-    // never be the primary click target while published previews exist.
-    if (todayHasData) return;
-    // UNIFIED STALE-HUB POLICY (Nima, June 1 2026): redirect to the newest
-    // valid concrete preview so stale baked content can never stand in as
-    // today\u2019s board. Strip the stale articles first (belt-and-suspenders
-    // with the pre-paint head guard). Clean empty-state below is the fallback
-    // when no concrete entry exists. Same policy as the Featured Game hub.
-    // FALLBACK-TO-LATEST (Nima, June 16 2026): redirect to the newest published
-    // preview for this sport whenever today has none. Prefer a current/upcoming
-    // preview; otherwise load the most recent past one rather than showing an
-    // empty/near-empty board. Only a sport with zero concrete entries falls
-    // through to the labeled state below. Flag past-dated loads so the target
-    // can show a subtle "latest available" note.
-    const _latest = latestConcreteEntry || latestContentEntry || null;
-    if (_latest && _latest.page && _latest.page !== currentPage && _latest.page !== SPORT_HUB_PAGE) {
-        const _m = document.querySelector('.main-content');
-        if (_m) _m.querySelectorAll('.game-preview').forEach(function(el){ el.remove(); });
-        if (_latest.date < todayStr) { try { sessionStorage.setItem('bl_showing_latest', '1'); } catch (e) {} }
-        window.location.replace('/' + _latest.page);
-        return;
-    }
-    const main = document.querySelector('.main-content');
-    if (!main) return;
-
-    const hero = document.querySelector('header.hero');
-    if (hero) {
-        const badge = hero.querySelector('.hero-badge');
-        const h1 = hero.querySelector('h1');
-        const p = hero.querySelector('p');
-        if (badge) badge.textContent = SPORT_LABEL + ' Previews';
-        if (h1) h1.textContent = SPORT_LABEL + ' Game Preview Archive';
-        if (p) p.textContent = 'Browse the latest ' + SPORT_LABEL + ' previews and the full dated archive below. This page does not present older previews as today\u2019s board.';
-    }
-
-    // STALE_GUARD_BANNER_20260606: keep the baked articles visible - only label them.
-    const latest = latestConcreteEntry || latestContentEntry || null;
-    const block = document.createElement('div');
-    block.id = 'hub-state';
-    let html = '';
-    if (baked && !document.getElementById('board-date-note')) {
-        const bakedLabel = new Date(baked + 'T12:00:00').toLocaleDateString('en-US', { weekday: 'long', month: 'long', day: 'numeric', year: 'numeric' });
-        html += '<div style="text-align:center;padding:20px 24px;background:linear-gradient(145deg,#14171f,#0f1218);border:1px solid rgba(255,213,79,0.3);border-radius:12px;margin-bottom:24px;">'
-              + '<p style="font-size:12px;font-weight:700;letter-spacing:2px;text-transform:uppercase;color:#ffd54f;margin-bottom:8px;">Board From</p>'
-              + '<p style="font-size:18px;color:#fff;margin:0;">' + bakedLabel + '</p>'
-              + '</div>';
-    }
-    if (latest && latest.page !== SPORT_HUB_PAGE) {
-        const d = new Date(latest.date + 'T12:00:00').toLocaleDateString('en-US', { weekday: 'long', month: 'long', day: 'numeric', year: 'numeric' });
-        html += '<a href="/' + latest.page + '" style="display:block;text-decoration:none;background:linear-gradient(145deg,#14171f,#0f1218);border:1px solid rgba(255,213,79,0.3);border-radius:12px;padding:28px 32px;">'
-              + '<p style="font-size:12px;font-weight:700;letter-spacing:2px;text-transform:uppercase;color:#fd5000;margin-bottom:10px;">Latest ' + SPORT_LABEL + ' Preview</p>'
-              + '<p style="font-family:Orbitron,sans-serif;font-size:22px;color:#fff;margin:0 0 8px;line-height:1.25;">' + latest.title + '</p>'
-              + '<p style="color:#b0b8c4;font-size:14px;margin:0;">' + d + ' &nbsp;&rarr;</p>'
-              + '</a>';
-    }
-    block.innerHTML = html;
-    const mobile = main.querySelector('.mobile-archive');
-    if (mobile && mobile.nextSibling) main.insertBefore(block, mobile.nextSibling);
-    else if (mobile) main.appendChild(block);
-    else main.insertBefore(block, main.firstChild);
-}
-
-function initSportCalendar() {
-
-    installCalendarStateStyles();
-    renderPreviewHub();
-
-    const monthSelect = document.getElementById('month-select') || document.getElementById('monthSelect');
-    if (monthSelect) {
-        monthSelect.innerHTML = '';
-        sortedMonths.forEach(m => {
-            const [year, month] = m.split('-');
-            const opt = document.createElement('option');
-            opt.value = m;
-            opt.textContent = monthNames[parseInt(month) - 1] + ' ' + year;
-            if (m === displayMonth) opt.selected = true;
-            monthSelect.appendChild(opt);
-        });
-        monthSelect.addEventListener('change', function() { renderCalendar(this.value); });
-    }
-    renderCalendar(displayMonth);
-    const mobileSelect = document.getElementById('mobile-archive-select') || document.getElementById('mobileArchiveSelect');
-    if (mobileSelect) {
-        mobileSelect.innerHTML = '<option value="">Select a date...</option>';
-        ARCHIVE_DATA.forEach(item => {
-            const opt = document.createElement('option');
-            opt.value = item.page;
-            const dateObj = new Date(item.date + 'T12:00:00');
-            const dateLabel = dateObj.toLocaleDateString('en-US', { weekday: 'short', month: 'short', day: 'numeric' });
-            opt.textContent = dateLabel + ' - ' + item.title;
-            if (item.page === currentPage) opt.selected = true;
-            mobileSelect.appendChild(opt);
-        });
-        mobileSelect.addEventListener('change', (e) => { if (e.target.value) window.location.href = '/' + e.target.value; });
-    }
-}
-
-if (document.readyState === 'loading') { document.addEventListener('DOMContentLoaded', initSportCalendar); } else { initSportCalendar(); }
-
-/* SHOWING-LATEST NOTE (Nima, June 16 2026): when a hub fell back to the most
-   recent published item (no entry for today), show a subtle one-line note on the
-   destination article. Flag is set by the hub before redirect; cleared after use. */
-(function showLatestAvailableNote() {
-    function run() {
-        var flag;
-        try { flag = sessionStorage.getItem('bl_showing_latest'); } catch (e) { return; }
-        if (!flag) return;
-        try { sessionStorage.removeItem('bl_showing_latest'); } catch (e) {}
-        if (document.getElementById('bl-latest-note')) return;
-        var host = document.querySelector('.main-content') || document.querySelector('.page-wrapper') || document.body;
-        if (!host) return;
-        var note = document.createElement('div');
-        note.id = 'bl-latest-note';
-        note.setAttribute('style', 'max-width:900px;margin:90px auto 0;padding:10px 16px;border:1px solid rgba(0,229,255,0.3);border-radius:10px;background:rgba(0,229,255,0.06);color:#9fe9f5;font-size:13px;line-height:1.5;text-align:center;font-family:Inter,system-ui,sans-serif;');
-        note.textContent = 'Showing the latest available preview. No new post has been published for today yet.';
-        host.insertBefore(note, host.firstChild);
-    }
-    if (document.readyState === 'loading') { document.addEventListener('DOMContentLoaded', run); } else { run(); }
+// Entries: data/calendar/nba/<YYYY-MM>.json; engine: scripts/calendar-runtime.js
+
+window.BL_SPORT_CALENDAR = {"sport": "nba", "hubPage": "nba-previews.html", "label": "NBA", "mainPages": ["nba.html", "nhl.html", "ncaab.html", "ncaaf.html", "nfl.html", "mlb.html", "soccer.html", "nba-previews.html", "nhl-previews.html", "mlb-previews.html", "soccer-previews.html", "college-basketball-previews.html"], "dataBase": "/data/calendar/nba/", "latestContent": {"date": "2026-06-13", "page": "knicks-clinch-bid-spurs-elimination-game-5-nba.html", "title": "NBA Finals Game 5 Analysis: Knicks At Spurs"}, "latestConcrete": {"date": "2026-06-13", "page": "knicks-clinch-bid-spurs-elimination-game-5-nba.html", "title": "NBA Finals Game 5 Analysis: Knicks At Spurs"}, "months": {"2025-11": {"n": 3, "v": "90afa01d65"}, "2025-12": {"n": 33, "v": "b68ea8ffa8"}, "2026-01": {"n": 36, "v": "12e3b739fb"}, "2026-02": {"n": 23, "v": "650ff76d77"}, "2026-03": {"n": 41, "v": "3a089c5f6c"}, "2026-04": {"n": 40, "v": "f7c08c77cb"}, "2026-05": {"n": 36, "v": "32a62a1e07"}, "2026-06": {"n": 11, "v": "2033b25ccd"}}, "pages": {"0": "e75c6c1e2f", "1": "2e6f8c3d52", "2": "5911402b77", "3": "f83d3b468a", "4": "26ee3079d8", "5": "77d5eb1aa2", "6": "fceff5fb89", "7": "dff9f1b865", "8": "a31809a5ad", "9": "3df86fed3b", "10": "70c6488369", "11": "769326b1af", "12": "2666863e89", "13": "f8fe10f7f4", "14": "f965e62fb6", "15": "23cb3e96f6"}, "current": {"month": "2026-10", "entries": []}};
+(function loadCalendarRuntime() {
+    var me = document.currentScript && document.currentScript.src;
+    var base = me ? me.slice(0, me.lastIndexOf('/') + 1) : '/scripts/';
+    var s = document.createElement('script');
+    s.src = base + 'calendar-runtime.js?v=c5c93250003';
+    s.async = false;
+    (document.head || document.documentElement).appendChild(s);
 })();
@@ -1,416 +1,14 @@
-// NCAAB Archive Calendar Data
-// Last updated: August 22, 2026
+// NCAAB Archive Calendar Index
+// Last updated: October 19, 2026
 // Auto-generated by sync_calendars.py - DO NOT EDIT MANUALLY
-
-const ARCHIVE_DATA = [
-    { date: "2026-04-20", page: "nba-college-basketball-picks-predictions-analysis-february-2026.html", title: "NBA College Basketball Picks Predictions Feb 2026" },
-    { date: "2026-03-31", page: "college-basketball-previews-archive-march-2026.html#2026-03-31", title: "NCAAB Analysis - 2026-03-31" },
-    { date: "2026-03-30", page: "college-basketball-previews-archive-march-2026.html#2026-03-30", title: "NCAAB Analysis - 2026-03-30" },
-    { date: "2026-03-29", page: "college-basketball-previews-archive-march-2026.html#2026-03-29", title: "NCAAB Analysis - 2026-03-29" },
-    { date: "2026-03-28", page: "ncaab-march28-content.html", title: "College Basketball Analysis - Saturday, March 28, 2026" },
-    { date: "2026-03-27", page: "college-basketball-previews-archive-march-2026.html#2026-03-27", title: "NCAAB Analysis - 2026-03-27" },
-    { date: "2026-03-25", page: "college-basketball-previews-archive-march-2026.html#2026-03-25", title: "NCAAB Analysis - 2026-03-25" },
-    { date: "2026-03-24", page: "college-basketball-previews-archive-march-2026.html#2026-03-24", title: "NCAAB Analysis - 2026-03-24" },
-    { date: "2026-03-23", page: "college-basketball-previews-archive-march-2026.html", title: "NCAAB Analysis - 2026-03-23" },
-    { date: "2026-03-22", page: "college-basketball-previews-archive-march-2026.html", title: "NCAAB Analysis - 2026-03-22" },
-    { date: "2026-03-21", page: "college-basketball-previews-archive-march-2026.html#2026-03-21", title: "NCAAB Analysis - 2026-03-21" },
-    { date: "2026-03-20", page: "ncaab.html", title: "NCAAB Analysis - March 20, 2026" },
-    { date: "2026-03-19", page: "college-basketball-previews-archive-march-2026.html#2026-03-19", title: "NCAAB Analysis - 2026-03-19" },
-    { date: "2026-03-17", page: "march-madness-first-four-tipoff-umbc-howard-texas-nc-state-ncaab.html", title: "NCAAB Analysis - March 17, 2026" },
-    { date: "2026-03-14", page: "conference-championship-saturday-duke-arizona-michigan-florida-ncaab.html", title: "NCAAB Conference Championship Saturday Analysis March 14 2026" },
-    { date: "2026-03-13", page: "conference-tournament-friday-acc-big-ten-sec-quarterfinals-ncaab.html", title: "NCAAB Conference Tournament Quarterfinals Analysis Friday March 13 2026" },
-    { date: "2026-03-09", page: "gonzaga-wcc-tournament-conference-championship-week-ncaab.html", title: "NCAAB WCC Tournament Analysis March 9 2026" },
-    { date: "2026-03-08", page: "michigan-state-michigan-big-ten-finale-ncaab.html", title: "MSU Michigan Big Ten Finale NCAAB March 8 2026" },
-    { date: "2026-03-07", page: "duke-unc-rivalry-uconn-at-marquette-final-regular-season-ncaab.html", title: "Duke UNC Rivalry NCAAB Previews March 7 2026" },
-    { date: "2026-03-06", page: "miami-ohio-perfect-season-on-the-line-ncaab.html", title: "College Basketball Game Previews Friday March 6 2026" },
-    { date: "2026-03-05", page: "michigan-iowa-big-ten-march-madness-push-ncaab.html", title: "College Basketball Game Previews Thursday March 5 2026" },
-    { date: "2026-03-04", page: "baylor-houston-big-12-purdue-northwestern-ncaab.html", title: "College Basketball Game Previews Wednesday March 4 2026" },
-    { date: "2026-03-03", page: "north-carolina-hosts-clemson-alabama-georgia-ncaab.html", title: "College Basketball Game Previews Tuesday March 3 2026" },
-    { date: "2026-03-02", page: "duke-at-nc-state-ncaab-analysis-stats-preview.html", title: "Duke at NC State NCAAB Analysis Stats Preview March 2 2026" },
-    { date: "2026-03-02", page: "duke-nc-state-iowa-state-arizona-marquee-ncaab.html", title: "College Basketball Game Previews Big Monday March 2 2026" },
-    { date: "2026-03-01", page: "purdue-ohio-state-michigan-state-indiana-big-ten-ncaab.html", title: "College Basketball Game Previews Sunday March 1 2026" },
-    { date: "2026-02-27", page: "michigan-illinois-big-ten-rivalry-ncaab.html", title: "College Basketball Game Previews Friday February 27 2026" },
-    { date: "2026-02-26", page: "michigan-state-purdue-big-ten-showdown-ncaab.html", title: "College Basketball Game Previews Thursday February 26 2026" },
-    { date: "2026-02-25", page: "st-johns-uconn-big-east-battle-ncaab.html", title: "NCAAB Game Previews Analysis February 25 2026" },
-    { date: "2026-02-24", page: "duke-visits-notre-dame-michigan-hosts-minnesota-ncaab.html", title: "College Basketball Previews February 24 2026" },
-    { date: "2026-02-23", page: "college-basketball-picks-predictions-best-bets.html", title: "NCAAB Picks Best Bets February 23 2026" },
-    { date: "2026-02-22", page: "college-basketball-picks-predictions-best-bets-v2.html", title: "NCAAB Picks Best Bets February 22 2026" },
-    { date: "2026-02-21", page: "duke-michigan-number-one-showdown-ncaab.html", title: "College Basketball Game Previews Saturday February 21 2026" },
-    { date: "2026-02-20", page: "college-basketball-picks-predictions-best-bets-v3.html", title: "NCAAB Picks Best Bets February 20 2026" },
-    { date: "2026-02-19", page: "college-basketball-picks-predictions-best-bets-v4.html", title: "NCAAB Picks Best Bets February 19 2026" },
-    { date: "2026-02-18", page: "college-basketball-picks-predictions-best-bets-v5.html", title: "NCAAB Picks Best Bets February 18 2026" },
-    { date: "2026-02-17", page: "college-basketball-picks-predictions-best-bets-v6.html", title: "NCAAB Picks Best Bets February 17 2026" },
-    { date: "2026-02-16", page: "college-basketball-picks-predictions-best-bets-v7.html", title: "NCAAB Picks Best Bets Monday February 16 2026" },
-    { date: "2026-02-15", page: "college-basketball-picks-predictions-best-bets-v8.html", title: "NCAAB Analysis - February 15, 2026" },
-    { date: "2026-02-14", page: "college-basketball-picks-predictions-best-bets-v9.html", title: "NCAAB Analysis - February 14, 2026" },
-    { date: "2026-02-13", page: "college-basketball-picks-predictions-best-bets-v10.html", title: "NCAAB Analysis - February 13, 2026" },
-    { date: "2026-02-12", page: "college-basketball-picks-predictions-best-bets-v11.html", title: "NCAAB Analysis - February 12, 2026" },
-    { date: "2026-02-11", page: "college-basketball-picks-predictions-best-bets-v12.html", title: "NCAAB Analysis - February 11, 2026" },
-    { date: "2026-02-10", page: "college-basketball-picks-predictions-best-bets-v13.html", title: "NCAAB Analysis - February 10, 2026" },
-    { date: "2026-02-09", page: "college-basketball-picks-predictions-best-bets-v14.html", title: "NCAAB Analysis - February 9, 2026" },
-    { date: "2026-02-08", page: "college-basketball-picks-predictions-best-bets-v15.html", title: "NCAAB Analysis - February 8, 2026" },
-    { date: "2026-02-07", page: "college-basketball-picks-predictions-best-bets-v16.html", title: "NCAAB Analysis - February 7, 2026" },
-    { date: "2026-02-06", page: "college-basketball-picks-predictions-best-bets-v17.html", title: "NCAAB Analysis - February 6, 2026" },
-    { date: "2026-02-05", page: "college-basketball-picks-predictions-best-bets-v18.html", title: "NCAAB Analysis - February 5, 2026" },
-    { date: "2026-02-04", page: "college-basketball-picks-predictions-best-bets-v19.html", title: "NCAAB Analysis - February 4, 2026" },
-    { date: "2026-02-03", page: "college-basketball-picks-predictions-best-bets-v20.html", title: "NCAAB Analysis - February 3, 2026" },
-    { date: "2026-02-02", page: "college-basketball-picks-predictions-best-bets-v21.html", title: "NCAAB Analysis - February 2, 2026" },
-    { date: "2026-02-01", page: "college-basketball-picks-predictions-best-bets-v22.html", title: "NCAAB Analysis - February 1, 2026" },
-    { date: "2026-01-30", page: "college-basketball-picks-predictions-best-bets-v23.html", title: "NCAAB Analysis - January 30, 2026" },
-    { date: "2026-01-29", page: "college-basketball-picks-predictions-best-bets-v24.html", title: "NCAAB Analysis - January 29, 2026" },
-    { date: "2026-01-28", page: "college-basketball-picks-predictions-best-bets-v25.html", title: "NCAAB Analysis - January 28, 2026" },
-    { date: "2026-01-27", page: "college-basketball-picks-predictions-best-bets-v26.html", title: "NCAAB Analysis - January 27, 2026" },
-    { date: "2026-01-26", page: "college-basketball-picks-predictions-best-bets-v27.html", title: "NCAAB Analysis - January 26, 2026" },
-    { date: "2026-01-25", page: "college-basketball-picks-predictions-best-bets-v28.html", title: "NCAAB Analysis - January 25, 2026" },
-    { date: "2026-01-24", page: "college-basketball-picks-predictions-best-bets-v29.html", title: "NCAAB Analysis - January 24, 2026" },
-    { date: "2026-01-23", page: "college-basketball-picks-predictions-best-bets-v30.html", title: "NCAAB Analysis - January 23, 2026" },
-    { date: "2026-01-22", page: "college-basketball-picks-predictions-best-bets-v31.html", title: "NCAAB Analysis - January 22, 2026" },
-    { date: "2026-01-21", page: "college-basketball-picks-predictions-best-bets-v32.html", title: "NCAAB Analysis - January 21, 2026" },
-    { date: "2026-01-20", page: "college-basketball-picks-predictions-best-bets-v33.html", title: "NCAAB Analysis - January 20, 2026" },
-    { date: "2026-01-19", page: "college-basketball-picks-predictions-best-bets-v34.html", title: "NCAAB Analysis - January 19, 2026" },
-    { date: "2026-01-18", page: "college-basketball-picks-predictions-best-bets-january-18-2026-part-2.html", title: "NCAAB Analysis - January 18, 2026 Part 2" },
-    { date: "2026-01-18", page: "college-basketball-picks-predictions-best-bets-v35.html", title: "NCAAB Analysis - January 18, 2026" },
-    { date: "2026-01-17", page: "college-basketball-picks-predictions-best-bets-v36.html", title: "NCAAB Analysis - January 17, 2026" },
-    { date: "2026-01-16", page: "college-basketball-picks-predictions-best-bets-v37.html", title: "NCAAB Analysis - January 16, 2026" },
-    { date: "2026-01-15", page: "college-basketball-picks-predictions-best-bets-v38.html", title: "NCAAB Analysis - January 15, 2026" },
-    { date: "2026-01-14", page: "college-basketball-picks-predictions-best-bets-v39.html", title: "NCAAB Analysis - January 14, 2026" },
-    { date: "2026-01-13", page: "college-basketball-picks-predictions-best-bets-v40.html", title: "NCAAB Analysis - January 13, 2026" },
-    { date: "2026-01-12", page: "college-basketball-picks-predictions-best-bets-v41.html", title: "NCAAB Analysis - January 12, 2026" },
-    { date: "2026-01-11", page: "college-basketball-picks-predictions-best-bets-v42.html", title: "NCAAB Analysis - January 11, 2026" },
-    { date: "2026-01-10", page: "college-basketball-picks-predictions-best-bets-v43.html", title: "NCAAB Analysis - January 10, 2026" },
-    { date: "2026-01-09", page: "college-basketball-picks-predictions-best-bets-v44.html", title: "NCAAB Analysis - January 09, 2026" },
-    { date: "2026-01-08", page: "college-basketball-picks-predictions-best-bets-v45.html", title: "NCAAB Analysis - January 08, 2026" },
-    { date: "2026-01-07", page: "college-basketball-picks-predictions-best-bets-v46.html", title: "NCAAB Analysis - January 07, 2026" },
-    { date: "2026-01-06", page: "college-basketball-picks-predictions-best-bets-v47.html", title: "NCAAB Analysis - January 06, 2026" },
-    { date: "2026-01-04", page: "college-basketball-picks-predictions-best-bets-january-04-2026-part-2.html", title: "NCAAB Analysis - January 04, 2026 Part 2" },
-    { date: "2026-01-04", page: "college-basketball-picks-predictions-best-bets-v48.html", title: "NCAAB Analysis - January 04, 2026" },
-    { date: "2026-01-03", page: "college-basketball-picks-predictions-best-bets-v49.html", title: "NCAAB Analysis - January 03, 2026" },
-    { date: "2026-01-02", page: "archives/ncaab/2026-01-02.html", title: "NCAAB Archive - 2026-01-02" },
-    { date: "2026-01-01", page: "college-basketball-picks-predictions-best-bets-january-01-2026-part-2.html", title: "NCAAB Analysis - January 01, 2026 Part 2" },
-    { date: "2026-01-01", page: "college-basketball-picks-predictions-best-bets-v50.html", title: "NCAAB Analysis - January 1, 2026" },
-    { date: "2025-12-31", page: "college-basketball-picks-predictions-best-bets-december-31-2025-part-2.html", title: "NCAAB Analysis - December 31, 2025 Part 2" },
-    { date: "2025-12-31", page: "college-basketball-picks-predictions-best-bets-v51.html", title: "NCAAB Analysis - December 31, 2025" },
-    { date: "2025-12-28", page: "college-basketball-picks-predictions-best-bets-december-28-2025-part-2.html", title: "NCAAB Analysis - December 28, 2025 Part 2" },
-    { date: "2025-12-28", page: "college-basketball-picks-predictions-best-bets-v52.html", title: "NCAAB Analysis - December 28, 2025" },
-    { date: "2025-12-27", page: "college-basketball-picks-predictions-best-bets-december-27-2025-part-2.html", title: "NCAAB Analysis - December 27, 2025 Part 2" },
-    { date: "2025-12-27", page: "college-basketball-picks-predictions-best-bets-v53.html", title: "NCAAB Analysis - December 27, 2025" },
-    { date: "2025-12-23", page: "college-basketball-picks-predictions-best-bets-v54.html", title: "NCAAB Analysis - December 23, 2025" },
-    { date: "2025-12-22", page: "college-basketball-picks-predictions-best-bets-v55.html", title: "NCAAB Analysis - December 22, 2025" },
-    { date: "2025-12-21", page: "college-basketball-picks-predictions-best-bets-v56.html", title: "NCAAB Analysis - December 21, 2025" },
-    { date: "2025-12-20", page: "college-basketball-picks-predictions-best-bets-december-20-2025-part-2.html", title: "NCAAB Analysis - December 20, 2025 Part 2" },
-    { date: "2025-12-20", page: "college-basketball-picks-predictions-best-bets-december-20-2025-part-3.html", title: "NCAAB Analysis - December 20, 2025 Part 3" },
-    { date: "2025-12-20", page: "college-basketball-picks-predictions-best-bets-december-20-2025-part-4.html", title: "NCAAB Analysis - December 20, 2025 Part 4" },
-    { date: "2025-12-20", page: "college-basketball-picks-predictions-best-bets-december-20-2025-part-5.html", title: "NCAAB Analysis - December 20, 2025 Part 5" },
-    { date: "2025-12-20", page: "college-basketball-picks-predictions-best-bets-v57.html", title: "NCAAB Analysis - December 20, 2025" },
-    { date: "2025-12-19", page: "college-basketball-picks-predictions-best-bets-december-19-2025-part-2.html", title: "NCAAB Analysis - December 19, 2025 Part 2" },
-    { date: "2025-12-19", page: "college-basketball-picks-predictions-best-bets-v58.html", title: "NCAAB Analysis - December 19, 2025" },
-    { date: "2025-12-18", page: "college-basketball-picks-predictions-best-bets-v59.html", title: "NCAAB Analysis - December 18, 2025" },
-    { date: "2025-12-17", page: "college-basketball-picks-predictions-best-bets-v60.html", title: "NCAAB Analysis - December 17, 2025" },
-    { date: "2025-12-16", page: "college-basketball-picks-predictions-best-bets-v61.html", title: "NCAAB Analysis - December 16, 2025" },
-    { date: "2025-12-15", page: "college-basketball-picks-predictions-best-bets-december-15-2025-part-2.html", title: "NCAAB Analysis - December 15, 2025 Part 2" },
-    { date: "2025-12-15", page: "college-basketball-picks-predictions-best-bets-v62.html", title: "NCAAB Analysis - December 15, 2025" },
-    { date: "2025-12-09", page: "college-basketball-picks-predictions-best-bets-december-09-2025-part-2.html", title: "NCAAB Analysis - December 09, 2025 Part 2" },
-    { date: "2025-12-09", page: "college-basketball-picks-predictions-best-bets-v63.html", title: "NCAAB Analysis - December 09, 2025" },
-    { date: "2025-12-08", page: "college-basketball-picks-predictions-best-bets-v64.html", title: "NCAAB Analysis - December 08, 2025" },
-    { date: "2025-12-07", page: "college-basketball-picks-predictions-best-bets-december-07-2025-part-2.html", title: "NCAAB Analysis - December 07, 2025 Part 2" },
-    { date: "2025-12-07", page: "college-basketball-picks-predictions-best-bets-v65.html", title: "NCAAB Analysis - December 07, 2025" },
-    { date: "2025-12-05", page: "college-basketball-picks-predictions-best-bets-december-05-2025-part-2.html", title: "NCAAB Analysis - December 05, 2025 Part 2" },
-    { date: "2025-12-05", page: "college-basketball-picks-predictions-best-bets-v66.html", title: "NCAAB Analysis - December 05, 2025" },
-    { date: "2025-12-04", page: "college-basketball-picks-predictions-best-bets-v67.html", title: "NCAAB Analysis - December 04, 2025" },
-    { date: "2025-12-03", page: "college-basketball-picks-predictions-best-bets-v68.html", title: "NCAAB Analysis - December 03, 2025" },
-    { date: "2025-12-01", page: "archives/ncaab/2025-12-01.html", title: "NCAAB Archive - 2025-12-01" },
-    { date: "2025-11-30", page: "archives/ncaab/2025-11-30.html", title: "NCAAB Archive - 2025-11-30" },
-    { date: "2025-11-29", page: "archives/ncaab/2025-11-29.html", title: "NCAAB Archive - 2025-11-29" },
-    { date: "2025-11-27", page: "college-basketball-picks-predictions-best-bets-v69.html", title: "College Basketball Picks - Thanksgiving Day, November 27, 2025" },
-];
-
-const dateMap = {};
-ARCHIVE_DATA.forEach(item => { if (!dateMap[item.date]) dateMap[item.date] = item; });
-
-const pageToDateMap = {};
-ARCHIVE_DATA.forEach(item => { pageToDateMap[item.page] = item.date; });
-
-const SPORT_HUB_PAGE = 'college-basketball-previews.html';
-const SPORT_LABEL = 'NCAAB';
-const MAIN_PAGES = ['nba.html', 'nhl.html', 'ncaab.html', 'ncaaf.html', 'nfl.html', 'mlb.html', 'soccer.html', 'nba-previews.html', 'nhl-previews.html', 'mlb-previews.html', 'soccer-previews.html', 'college-basketball-previews.html'];
-function isConcreteContentPage(page) {
-    // Pick pages use their own template (no archive calendar sidebar); a stale
-    // hub must never redirect to one as the day's board (soccer hub, June 3 2026).
-    // Featured-game (*-analysis-stats-preview) pages load featured-games-calendar.js
-    // (the all-sports marquee calendar) and have their own Featured hub; a SPORT hub
-    // must never redirect to one, or it swaps in the featured calendar and drops
-    // sport-only dates (MLB June 4 went blank when the MLB hub redirected there, June 22 2026).
-    // The combined season 'picks-predictions-analysis-<month>-<year>' pages are blog/Pick
-    // Archive indexes, not a day's preview; a hub must not redirect to one (NCAAB July 7 2026).
-    return !!page && !MAIN_PAGES.includes(page) && !page.includes('#') && !page.includes('-archive-') && !/-analysis-stats-preview\.html$/.test(page) && !/-picks?(?:-v\d+)?\.html$/.test(page) && !/picks-predictions-analysis-[a-z]+-\d{4}\.html$/.test(page);
-}
-const latestContentEntry = ARCHIVE_DATA.find(item => item.page && item.page !== SPORT_HUB_PAGE);
-const latestConcreteEntry = ARCHIVE_DATA.find(item => isConcreteContentPage(item.page));
-window.LATEST_CONTENT_PAGE = latestConcreteEntry ? latestConcreteEntry.page : (latestContentEntry ? latestContentEntry.page : null);
-
-function getLocalDateString(date) {
-    const parts = new Intl.DateTimeFormat('en-US', {
-        timeZone: 'America/Los_Angeles',
-        year: 'numeric',
-        month: '2-digit',
-        day: '2-digit'
-    }).formatToParts(date).reduce((acc, part) => {
-        acc[part.type] = part.value;
-        return acc;
-    }, {});
-    return parts.year + '-' + parts.month + '-' + parts.day;
-}
-
-// Current real date is separate from the active article/page date.
-const todayStr = getLocalDateString(new Date());
-
-const todayMonth = todayStr.substring(0, 7);
-const latestAvailableDate = latestConcreteEntry ? latestConcreteEntry.date : (ARCHIVE_DATA.length > 0 ? ARCHIVE_DATA[0].date : todayStr);
-const todayHasData = ARCHIVE_DATA.some(item => item.date === todayStr && isConcreteContentPage(item.page));
-
-// Handle both root pages and archive pages
-const pathname = window.location.pathname;
-let currentPage;
-if (pathname.includes('/archives/')) {
-    // For archive pages, get the full relative path from archives/
-    currentPage = pathname.replace(/^\//, '');
-} else {
-    // For root pages, just get the filename
-    currentPage = pathname.split('/').pop() || 'index.html';
-}
-
-const isMainPage = MAIN_PAGES.includes(currentPage);
-const forcedDate = window.FORCED_PAGE_DATE || null;
-// Hub/main pages never get a current-page "Article" highlight, even if a
-// stale window.FORCED_PAGE_DATE is left in the hub HTML.
-const activeArticleDate = isMainPage ? null : (forcedDate || pageToDateMap[currentPage] || null);
-const currentPageDate = activeArticleDate;
-
-const months = new Set();
-ARCHIVE_DATA.forEach(item => { const [y, m] = item.date.split('-'); months.add(y + '-' + m); });
-// Always include the current month so the hub calendar can point at today.
-months.add(todayMonth);
-
-// Main/hub pages show today's month; archive pages show their month
-const sortedMonths = Array.from(months).sort().reverse();
-const monthNames = ['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September', 'October', 'November', 'December'];
-
-// Dated preview pages should open on the article month; undated hubs open on the current month.
-let displayMonth = activeArticleDate ? activeArticleDate.substring(0, 7) : (isMainPage ? todayMonth : sortedMonths[0]);
-
-function installCalendarStateStyles() {
-    if (document.getElementById('mlb-calendar-state-styles')) return;
-    const style = document.createElement('style');
-    style.id = 'mlb-calendar-state-styles';
-    style.textContent = `
-.calendar-days .cal-day,.calendar-grid .calendar-day{position:relative}
-.calendar-days .cal-day.is-linked,.calendar-days .cal-day.has-content{cursor:pointer;background:rgba(0,229,255,.15);color:#00e5ff;font-weight:700;border:1px solid rgba(0,229,255,.32)}
-.calendar-days .cal-day.is-linked:hover,.calendar-days .cal-day.has-content:hover{background:rgba(0,229,255,.25);box-shadow:0 0 12px rgba(0,229,255,.28)}
-.calendar-days .cal-day.is-disabled{opacity:.82}
-.calendar-days .cal-day.is-past:not(.current-page):not(.today){color:#9aa3af}
-.calendar-days .cal-day.is-future:not(.current-page):not(.today){color:#c7ced8}
-.calendar-days .cal-day.today{border:2px solid #ffd54f!important;box-shadow:0 0 0 1px rgba(255,213,79,.34),0 0 12px rgba(255,213,79,.28)!important}
-.calendar-days .cal-day.current-page{background:rgba(0,229,255,.72)!important;color:#fff!important;border:2px solid #00e5ff!important;font-weight:900!important;box-shadow:0 0 12px rgba(0,229,255,.45)!important}
-.calendar-days .cal-day.today.current-page{background:linear-gradient(135deg,rgba(0,229,255,.72),rgba(255,213,79,.42))!important;border-color:#ffd54f!important}
-`;
-    document.head.appendChild(style);
-}
-
-function navigateToCalendarPage(page) {
-    if (page) window.location.href = '/' + page;
-}
-
-// Multi-post dates go straight to that day's main slate/preview page (no chooser popup).
-// Falls back to the first/newest post if no slate-style page is found.
-function pickPrimaryPostForDate(postsForDate) {
-    const slate = postsForDate.find(item => {
-        const t = (item.title || '').toLowerCase();
-        const p = (item.page || '').toLowerCase();
-        return /\banalysis\b|\bpreview\b|\bslate\b|\bboard\b|\bfull card\b/.test(t)
-            || /-game-|-slate-|-board-|-previews|full-card/.test(p);
-    });
-    return slate || postsForDate[0];
-}
-
-// Popup chooser fully removed (Nima): clicking a date opens the page directly.
-
-function renderCalendar(yearMonth) {
-    const [year, month] = yearMonth.split('-').map(Number);
-    const yearEl = document.getElementById('cal-year') || document.querySelector('.year-display');
-    if (yearEl) yearEl.textContent = year;
-    const firstDay = new Date(year, month - 1, 1).getDay();
-    const daysInMonth = new Date(year, month, 0).getDate();
-    const container = document.getElementById('calendar-days') || document.getElementById('calendarDays');
-    if (!container) return;
-    container.innerHTML = '';
-    for (let i = 0; i < firstDay; i++) { const cell = document.createElement('div'); cell.className = 'cal-day empty'; container.appendChild(cell); }
-    for (let d = 1; d <= daysInMonth; d++) {
-        const dateStr = year + '-' + String(month).padStart(2, '0') + '-' + String(d).padStart(2, '0');
-        const postsForDate = ARCHIVE_DATA.filter(item => item.date === dateStr && item.page);
-        const hasData = postsForDate.length > 0 ? postsForDate[0] : null;
-        let classes = 'cal-day';
-        if (dateStr === currentPageDate) classes += ' current-page';
-        // NO 'today' marker (Nima, June 24 2026): the calendar highlights ONLY the
-        // date of the article being viewed (current-page). A separate gold 'today'
-        // cell was a wrong second highlight - on out-of-season sports (NHL/NBA) it lit
-        // a day with no article, and it fought the article's own date. Removed for good.
-        if (hasData) classes += ' has-content is-linked';
-        else classes += ' is-disabled';
-        if (dateStr < todayStr) classes += ' is-past';
-        if (dateStr > todayStr) classes += ' is-future';
-        const cell = document.createElement('div');
-        cell.className = classes;
-        if (!cell.dataset) cell.dataset = {};
-        cell.dataset.date = dateStr;
-        cell.dataset.currentDate = todayStr;
-        if (dateStr === currentPageDate) cell.dataset.activeArticleDate = currentPageDate;
-        if (hasData) cell.dataset.linked = 'true';
-        cell.textContent = d;
-        if (hasData) {
-            cell.title = postsForDate.map(item => item.title).join('\n');
-            cell.onclick = () => {
-                if (postsForDate.length === 1) navigateToCalendarPage(hasData.page);
-                else navigateToCalendarPage(pickPrimaryPostForDate(postsForDate).page);
-            };
-        }
-        container.appendChild(cell);
-    }
-}
-
-// Hub guard: a `*-previews.html` hub page bakes in the last published dated
-// slate/article. When that baked article is out of date (its FORCED_PAGE_DATE
-// is not today), it must not be presented as the current board. If a current/
-// upcoming concrete preview exists we redirect to it. Otherwise the baked
-// board STAYS VISIBLE (STALE_GUARD_BANNER_20260606, Nima June 6 2026: a
-// near-empty hub is worse for visitors and Googlebot than a clearly-dated
-// older board) and is labeled with its real date plus a link to the latest
-// available preview. It is never presented as today\u2019s board. No fabricated data.
-function renderPreviewHub() {
-    if (currentPage !== SPORT_HUB_PAGE || !SPORT_HUB_PAGE) return;
-    const baked = window.FORCED_PAGE_DATE || null;
-    // ALWAYS-LATEST HUB (Nima, July 7 2026): the nav "<Sport> Preview" link must land
-    // on the most recent published preview for that sport - NEVER a stale/offseason
-    // archive landing screen. Leave the hub as-is ONLY when today actually has a fresh
-    // concrete board (in-season daily slate baked in). Otherwise - offseason, a hand-
-    // built archive page with no FORCED_PAGE_DATE, or an in-season gap/off-day - fall
-    // through and redirect to the newest published concrete preview below. Keyed on real
-    // content presence (todayHasData), not on whether a baked date happens to exist, so
-    // a dead offseason archive page (e.g. college-basketball-previews.html in July) can
-    // never be the primary click target while published previews exist.
-    if (todayHasData) return;
-    // UNIFIED STALE-HUB POLICY (Nima, June 1 2026): redirect to the newest
-    // valid concrete preview so stale baked content can never stand in as
-    // today\u2019s board. Strip the stale articles first (belt-and-suspenders
-    // with the pre-paint head guard). Clean empty-state below is the fallback
-    // when no concrete entry exists. Same policy as the Featured Game hub.
-    // FALLBACK-TO-LATEST (Nima, June 16 2026): redirect to the newest published
-    // preview for this sport whenever today has none. Prefer a current/upcoming
-    // preview; otherwise load the most recent past one rather than showing an
-    // empty/near-empty board. Only a sport with zero concrete entries falls
-    // through to the labeled state below. Flag past-dated loads so the target
-    // can show a subtle "latest available" note.
-    const _latest = latestConcreteEntry || latestContentEntry || null;
-    if (_latest && _latest.page && _latest.page !== currentPage && _latest.page !== SPORT_HUB_PAGE) {
-        const _m = document.querySelector('.main-content');
-        if (_m) _m.querySelectorAll('.game-preview').forEach(function(el){ el.remove(); });
-        if (_latest.date < todayStr) { try { sessionStorage.setItem('bl_showing_latest', '1'); } catch (e) {} }
-        window.location.replace('/' + _latest.page);
-        return;
-    }
-    const main = document.querySelector('.main-content');
-    if (!main) return;
-
-    const hero = document.querySelector('header.hero');
-    if (hero) {
-        const badge = hero.querySelector('.hero-badge');
-        const h1 = hero.querySelector('h1');
-        const p = hero.querySelector('p');
-        if (badge) badge.textContent = SPORT_LABEL + ' Previews';
-        if (h1) h1.textContent = SPORT_LABEL + ' Game Preview Archive';
-        if (p) p.textContent = 'Browse the latest ' + SPORT_LABEL + ' previews and the full dated archive below. This page does not present older previews as today\u2019s board.';
-    }
-
-    // STALE_GUARD_BANNER_20260606: keep the baked articles visible - only label them.
-    const latest = latestConcreteEntry || latestContentEntry || null;
-    const block = document.createElement('div');
-    block.id = 'hub-state';
-    let html = '';
-    if (baked && !document.getElementById('board-date-note')) {
-        const bakedLabel = new Date(baked + 'T12:00:00').toLocaleDateString('en-US', { weekday: 'long', month: 'long', day: 'numeric', year: 'numeric' });
-        html += '<div style="text-align:center;padding:20px 24px;background:linear-gradient(145deg,#14171f,#0f1218);border:1px solid rgba(255,213,79,0.3);border-radius:12px;margin-bottom:24px;">'
-              + '<p style="font-size:12px;font-weight:700;letter-spacing:2px;text-transform:uppercase;color:#ffd54f;margin-bottom:8px;">Board From</p>'
-              + '<p style="font-size:18px;color:#fff;margin:0;">' + bakedLabel + '</p>'
-              + '</div>';
-    }
-    if (latest && latest.page !== SPORT_HUB_PAGE) {
-        const d = new Date(latest.date + 'T12:00:00').toLocaleDateString('en-US', { weekday: 'long', month: 'long', day: 'numeric', year: 'numeric' });
-        html += '<a href="/' + latest.page + '" style="display:block;text-decoration:none;background:linear-gradient(145deg,#14171f,#0f1218);border:1px solid rgba(255,213,79,0.3);border-radius:12px;padding:28px 32px;">'
-              + '<p style="font-size:12px;font-weight:700;letter-spacing:2px;text-transform:uppercase;color:#fd5000;margin-bottom:10px;">Latest ' + SPORT_LABEL + ' Preview</p>'
-              + '<p style="font-family:Orbitron,sans-serif;font-size:22px;color:#fff;margin:0 0 8px;line-height:1.25;">' + latest.title + '</p>'
-              + '<p style="color:#b0b8c4;font-size:14px;margin:0;">' + d + ' &nbsp;&rarr;</p>'
-              + '</a>';
-    }
-    block.innerHTML = html;
-    const mobile = main.querySelector('.mobile-archive');
-    if (mobile && mobile.nextSibling) main.insertBefore(block, mobile.nextSibling);
-    else if (mobile) main.appendChild(block);
-    else main.insertBefore(block, main.firstChild);
-}
-
-function initSportCalendar() {
-
-    installCalendarStateStyles();
-    renderPreviewHub();
-
-    const monthSelect = document.getElementById('month-select') || document.getElementById('monthSelect');
-    if (monthSelect) {
-        monthSelect.innerHTML = '';
-        sortedMonths.forEach(m => {
-            const [year, month] = m.split('-');
-            const opt = document.createElement('option');
-            opt.value = m;
-            opt.textContent = monthNames[parseInt(month) - 1] + ' ' + year;
-            if (m === displayMonth) opt.selected = true;
-            monthSelect.appendChild(opt);
-        });
-        monthSelect.addEventListener('change', function() { renderCalendar(this.value); });
-    }
-    renderCalendar(displayMonth);
-    const mobileSelect = document.getElementById('mobile-archive-select') || document.getElementById('mobileArchiveSelect');
-    if (mobileSelect) {
-        mobileSelect.innerHTML = '<option value="">Select a date...</option>';
-        ARCHIVE_DATA.forEach(item => {
-            const opt = document.createElement('option');
-            opt.value = item.page;
-            const dateObj = new Date(item.date + 'T12:00:00');
-            const dateLabel = dateObj.toLocaleDateString('en-US', { weekday: 'short', month: 'short', day: 'numeric' });
-            opt.textContent = dateLabel + ' - ' + item.title;
-            if (item.page === currentPage) opt.selected = true;
-            mobileSelect.appendChild(opt);
-        });
-        mobileSelect.addEventListener('change', (e) => { if (e.target.value) window.location.href = '/' + e.target.value; });
-    }
-}
-
-if (document.readyState === 'loading') { document.addEventListener('DOMContentLoaded', initSportCalendar); } else { initSportCalendar(); }
-
-/* SHOWING-LATEST NOTE (Nima, June 16 2026): when a hub fell back to the most
-   recent published item (no entry for today), show a subtle one-line note on the
-   destination article. Flag is set by the hub before redirect; cleared after use. */
-(function showLatestAvailableNote() {
-    function run() {
-        var flag;
-        try { flag = sessionStorage.getItem('bl_showing_latest'); } catch (e) { return; }
-        if (!flag) return;
-        try { sessionStorage.removeItem('bl_showing_latest'); } catch (e) {}
-        if (document.getElementById('bl-latest-note')) return;
-        var host = document.querySelector('.main-content') || document.querySelector('.page-wrapper') || document.body;
-        if (!host) return;
-        var note = document.createElement('div');
-        note.id = 'bl-latest-note';
-        note.setAttribute('style', 'max-width:900px;margin:90px auto 0;padding:10px 16px;border:1px solid rgba(0,229,255,0.3);border-radius:10px;background:rgba(0,229,255,0.06);color:#9fe9f5;font-size:13px;line-height:1.5;text-align:center;font-family:Inter,system-ui,sans-serif;');
-        note.textContent = 'Showing the latest available preview. No new post has been published for today yet.';
-        host.insertBefore(note, host.firstChild);
-    }
-    if (document.readyState === 'loading') { document.addEventListener('DOMContentLoaded', run); } else { run(); }
+// Entries: data/calendar/ncaab/<YYYY-MM>.json; engine: scripts/calendar-runtime.js
+
+window.BL_SPORT_CALENDAR = {"sport": "ncaab", "hubPage": "college-basketball-previews.html", "label": "NCAAB", "mainPages": ["nba.html", "nhl.html", "ncaab.html", "ncaaf.html", "nfl.html", "mlb.html", "soccer.html", "nba-previews.html", "nhl-previews.html", "mlb-previews.html", "soccer-previews.html", "college-basketball-previews.html"], "dataBase": "/data/calendar/ncaab/", "latestContent": {"date": "2026-04-20", "page": "nba-college-basketball-picks-predictions-analysis-february-2026.html", "title": "NBA College Basketball Picks Predictions Feb 2026"}, "latestConcrete": {"date": "2026-03-28", "page": "ncaab-march28-content.html", "title": "College Basketball Analysis - Saturday, March 28, 2026"}, "months": {"2025-11": {"n": 3, "v": "211d34c9c6"}, "2025-12": {"n": 31, "v": "04737a779d"}, "2026-01": {"n": 32, "v": "bc3e29c64b"}, "2026-02": {"n": 27, "v": "abfbf4ccd2"}, "2026-03": {"n": 25, "v": "92effa1b0c"}, "2026-04": {"n": 1, "v": "67497d0c1f"}}, "pages": {"0": "0a9ed51fee", "1": "f169a51075", "2": "83b23bd41a", "3": "562da2b6f2", "4": "b3969b9d87", "5": "5036075bee", "6": "f11a6e0324", "7": "11b7e8e448", "8": "d502f694ad", "9": "bb0b5c9a68", "10": "4749f057ae", "11": "b644b3b145", "12": "399be299d5", "13": "0190ce7732", "14": "0fc3205669", "15": "a89facf074"}, "current": {"month": "2026-10", "entries": []}};
+(function loadCalendarRuntime() {
+    var me = document.currentScript && document.currentScript.src;
+    var base = me ? me.slice(0, me.lastIndexOf('/') + 1) : '/scripts/';
+    var s = document.createElement('script');
+    s.src = base + 'calendar-runtime.js?v=c5c93250003';
+    s.async = false;
+    (document.head || document.documentElement).appendChild(s);
 })();
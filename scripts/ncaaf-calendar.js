@@ -1,320 +1,14 @@
-// NCAAF Archive Calendar Data
-// Last updated: August 22, 2026
+// NCAAF Archive Calendar Index
+// Last updated: October 19, 2026
 // Auto-generated by sync_calendars.py - DO NOT EDIT MANUALLY
-
-const ARCHIVE_DATA = [
-    { date: "2026-01-19", page: "college-football-picks-predictions-against-the-spread.html", title: "NCAAF Analysis - January 19, 2026" },
-    { date: "2026-01-19", page: "ncaaf.html", title: "NCAAF Analysis - January 19, 2026" },
-    { date: "2026-01-09", page: "college-football-picks-predictions-against-the-spread-v2.html", title: "NCAAF Analysis - January 09, 2026" },
-    { date: "2026-01-08", page: "college-football-picks-predictions-against-the-spread-v3.html", title: "NCAAF Analysis - January 08, 2026" },
-    { date: "2026-01-06", page: "college-football-picks-predictions-against-the-spread-v4.html", title: "FCS Championship - January 6, 2026" },
-    { date: "2026-01-02", page: "archives/ncaaf/2026-01-02.html", title: "NCAAF Archive - 2026-01-02" },
-    { date: "2026-01-02", page: "college-football-picks-predictions-against-the-spread-v5.html", title: "NCAAF Bowl Games - January 2, 2026" },
-    { date: "2026-01-01", page: "college-football-picks-predictions-against-the-spread-v6.html", title: "CFP Quarterfinals - January 1, 2026" },
-    { date: "2025-12-31", page: "college-football-picks-predictions-against-the-spread-v7.html", title: "Bowl Games - December 31, 2025" },
-    { date: "2025-12-30", page: "college-football-picks-predictions-against-the-spread-v8.html", title: "NCAAF Bowl Games - December 30, 2025" },
-    { date: "2025-12-29", page: "college-football-picks-predictions-against-the-spread-v9.html", title: "NCAAF Bowl Games - December 29, 2025" },
-    { date: "2025-12-27", page: "college-football-picks-predictions-against-the-spread-v10.html", title: "NCAAF Bowl Games - December 27, 2025" },
-    { date: "2025-12-23", page: "college-football-picks-predictions-against-the-spread-v11.html", title: "NCAAF Bowl Games - December 23, 2025" },
-    { date: "2025-12-19", page: "college-football-picks-predictions-against-the-spread-v12.html", title: "NCAAF Bowl Games - December 19, 2025" },
-    { date: "2025-12-10", page: "college-football-picks-predictions-against-the-spread-v13.html", title: "NCAAF Analysis - December 10, 2025" },
-    { date: "2025-12-08", page: "college-football-picks-predictions-against-the-spread-v14.html", title: "NCAAF Analysis - December 8, 2025" },
-    { date: "2025-12-06", page: "college-football-picks-predictions-against-the-spread-v15.html", title: "NCAAF Analysis - December 6, 2025" },
-    { date: "2025-12-04", page: "college-football-picks-predictions-against-the-spread-v16.html", title: "NCAAF Analysis - December 4, 2025" },
-    { date: "2025-12-01", page: "archives/ncaaf/2025-12-01.html", title: "NCAAF Archive - 2025-12-01" },
-    { date: "2025-11-30", page: "archives/ncaaf/2025-11-30.html", title: "NCAAF Archive - 2025-11-30" },
-    { date: "2025-11-29", page: "archives/ncaaf/2025-11-29.html", title: "NCAAF Archive - 2025-11-29" },
-    { date: "2025-11-28", page: "college-football-picks-predictions-against-the-spread-v17.html", title: "NCAAF Rivalry Week - November 28, 2025" },
-    { date: "2025-11-01", page: "college-football-picks-predictions-against-the-spread-v18.html", title: "College Football Picks - Week 1, November 1, 2025" },
-];
-
-const dateMap = {};
-ARCHIVE_DATA.forEach(item => { if (!dateMap[item.date]) dateMap[item.date] = item; });
-
-const pageToDateMap = {};
-ARCHIVE_DATA.forEach(item => { pageToDateMap[item.page] = item.date; });
-
-const SPORT_HUB_PAGE = '';
-const SPORT_LABEL = 'NCAAF';
-const MAIN_PAGES = ['nba.html', 'nhl.html', 'ncaab.html', 'ncaaf.html', 'nfl.html', 'mlb.html', 'soccer.html', 'nba-previews.html', 'nhl-previews.html', 'mlb-previews.html', 'soccer-previews.html', 'college-basketball-previews.html'];
-function isConcreteContentPage(page) {
-    // Pick pages use their own template (no archive calendar sidebar); a stale
-    // hub must never redirect to one as the day's board (soccer hub, June 3 2026).
-    // Featured-game (*-analysis-stats-preview) pages load featured-games-calendar.js
-    // (the all-sports marquee calendar) and have their own Featured hub; a SPORT hub
-    // must never redirect to one, or it swaps in the featured calendar and drops
-    // sport-only dates (MLB June 4 went blank when the MLB hub redirected there, June 22 2026).
-    // The combined season 'picks-predictions-analysis-<month>-<year>' pages are blog/Pick
-    // Archive indexes, not a day's preview; a hub must not redirect to one (NCAAB July 7 2026).
-    return !!page && !MAIN_PAGES.includes(page) && !page.includes('#') && !page.includes('-archive-') && !/-analysis-stats-preview\.html$/.test(page) && !/-picks?(?:-v\d+)?\.html$/.test(page) && !/picks-predictions-analysis-[a-z]+-\d{4}\.html$/.test(page);
-}
-const latestContentEntry = ARCHIVE_DATA.find(item => item.page && item.page !== SPORT_HUB_PAGE);
-const latestConcreteEntry = ARCHIVE_DATA.find(item => isConcreteContentPage(item.page));
-window.LATEST_CONTENT_PAGE = latestConcreteEntry ? latestConcreteEntry.page : (latestContentEntry ? latestContentEntry.page : null);
-
-function getLocalDateString(date) {
-    const parts = new Intl.DateTimeFormat('en-US', {
-        timeZone: 'America/Los_Angeles',
-        year: 'numeric',
-        month: '2-digit',
-        day: '2-digit'
-    }).formatToParts(date).reduce((acc, part) => {
-        acc[part.type] = part.value;
-        return acc;
-    }, {});
-    return parts.year + '-' + parts.month + '-' + parts.day;
-}
-
-// Current real date is separate from the active article/page date.
-const todayStr = getLocalDateString(new Date());
-
-const todayMonth = todayStr.substring(0, 7);
-const latestAvailableDate = latestConcreteEntry ? latestConcreteEntry.date : (ARCHIVE_DATA.length > 0 ? ARCHIVE_DATA[0].date : todayStr);
-const todayHasData = ARCHIVE_DATA.some(item => item.date === todayStr && isConcreteContentPage(item.page));
-
-// Handle both root pages and archive pages
-const pathname = window.location.pathname;
-let currentPage;
-if (pathname.includes('/archives/')) {
-    // For archive pages, get the full relative path from archives/
-    currentPage = pathname.replace(/^\//, '');
-} else {
-    // For root pages, just get the filename
-    currentPage = pathname.split('/').pop() || 'index.html';
-}
-
-const isMainPage = MAIN_PAGES.includes(currentPage);
-const forcedDate = window.FORCED_PAGE_DATE || null;
-// Hub/main pages never get a current-page "Article" highlight, even if a
-// stale window.FORCED_PAGE_DATE is left in the hub HTML.
-const activeArticleDate = isMainPage ? null : (forcedDate || pageToDateMap[currentPage] || null);
-const currentPageDate = activeArticleDate;
-
-const months = new Set();
-ARCHIVE_DATA.forEach(item => { const [y, m] = item.date.split('-'); months.add(y + '-' + m); });
-// Always include the current month so the hub calendar can point at today.
-months.add(todayMonth);
-
-// Main/hub pages show today's month; archive pages show their month
-const sortedMonths = Array.from(months).sort().reverse();
-const monthNames = ['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September', 'October', 'November', 'December'];
-
-// Dated preview pages should open on the article month; undated hubs open on the current month.
-let displayMonth = activeArticleDate ? activeArticleDate.substring(0, 7) : (isMainPage ? todayMonth : sortedMonths[0]);
-
-function installCalendarStateStyles() {
-    if (document.getElementById('mlb-calendar-state-styles')) return;
-    const style = document.createElement('style');
-    style.id = 'mlb-calendar-state-styles';
-    style.textContent = `
-.calendar-days .cal-day,.calendar-grid .calendar-day{position:relative}
-.calendar-days .cal-day.is-linked,.calendar-days .cal-day.has-content{cursor:pointer;background:rgba(0,229,255,.15);color:#00e5ff;font-weight:700;border:1px solid rgba(0,229,255,.32)}
-.calendar-days .cal-day.is-linked:hover,.calendar-days .cal-day.has-content:hover{background:rgba(0,229,255,.25);box-shadow:0 0 12px rgba(0,229,255,.28)}
-.calendar-days .cal-day.is-disabled{opacity:.82}
-.calendar-days .cal-day.is-past:not(.current-page):not(.today){color:#9aa3af}
-.calendar-days .cal-day.is-future:not(.current-page):not(.today){color:#c7ced8}
-.calendar-days .cal-day.today{border:2px solid #ffd54f!important;box-shadow:0 0 0 1px rgba(255,213,79,.34),0 0 12px rgba(255,213,79,.28)!important}
-.calendar-days .cal-day.current-page{background:rgba(0,229,255,.72)!important;color:#fff!important;border:2px solid #00e5ff!important;font-weight:900!important;box-shadow:0 0 12px rgba(0,229,255,.45)!important}
-.calendar-days .cal-day.today.current-page{background:linear-gradient(135deg,rgba(0,229,255,.72),rgba(255,213,79,.42))!important;border-color:#ffd54f!important}
-`;
-    document.head.appendChild(style);
-}
-
-function navigateToCalendarPage(page) {
-    if (page) window.location.href = '/' + page;
-}
-
-// Multi-post dates go straight to that day's main slate/preview page (no chooser popup).
-// Falls back to the first/newest post if no slate-style page is found.
-function pickPrimaryPostForDate(postsForDate) {
-    const slate = postsForDate.find(item => {
-        const t = (item.title || '').toLowerCase();
-        const p = (item.page || '').toLowerCase();
-        return /\banalysis\b|\bpreview\b|\bslate\b|\bboard\b|\bfull card\b/.test(t)
-            || /-game-|-slate-|-board-|-previews|full-card/.test(p);
-    });
-    return slate || postsForDate[0];
-}
-
-// Popup chooser fully removed (Nima): clicking a date opens the page directly.
-
-function renderCalendar(yearMonth) {
-    const [year, month] = yearMonth.split('-').map(Number);
-    const yearEl = document.getElementById('cal-year') || document.querySelector('.year-display');
-    if (yearEl) yearEl.textContent = year;
-    const firstDay = new Date(year, month - 1, 1).getDay();
-    const daysInMonth = new Date(year, month, 0).getDate();
-    const container = document.getElementById('calendar-days') || document.getElementById('calendarDays');
-    if (!container) return;
-    container.innerHTML = '';
-    for (let i = 0; i < firstDay; i++) { const cell = document.createElement('div'); cell.className = 'cal-day empty'; container.appendChild(cell); }
-    for (let d = 1; d <= daysInMonth; d++) {
-        const dateStr = year + '-' + String(month).padStart(2, '0') + '-' + String(d).padStart(2, '0');
-        const postsForDate = ARCHIVE_DATA.filter(item => item.date === dateStr && item.page);
-        const hasData = postsForDate.length > 0 ? postsForDate[0] : null;
-        let classes = 'cal-day';
-        if (dateStr === currentPageDate) classes += ' current-page';
-        // NO 'today' marker (Nima, June 24 2026): the calendar highlights ONLY the
-        // date of the article being viewed (current-page). A separate gold 'today'
-        // cell was a wrong second highlight - on out-of-season sports (NHL/NBA) it lit
-        // a day with no article, and it fought the article's own date. Removed for good.
-        if (hasData) classes += ' has-content is-linked';
-        else classes += ' is-disabled';
-        if (dateStr < todayStr) classes += ' is-past';
-        if (dateStr > todayStr) classes += ' is-future';
-        const cell = document.createElement('div');
-        cell.className = classes;
-        if (!cell.dataset) cell.dataset = {};
-        cell.dataset.date = dateStr;
-        cell.dataset.currentDate = todayStr;
-        if (dateStr === currentPageDate) cell.dataset.activeArticleDate = currentPageDate;
-        if (hasData) cell.dataset.linked = 'true';
-        cell.textContent = d;
-        if (hasData) {
-            cell.title = postsForDate.map(item => item.title).join('\n');
-            cell.onclick = () => {
-                if (postsForDate.length === 1) navigateToCalendarPage(hasData.page);
-                else navigateToCalendarPage(pickPrimaryPostForDate(postsForDate).page);
-            };
-        }
-        container.appendChild(cell);
-    }
-}
-
-// Hub guard: a `*-previews.html` hub page bakes in the last published dated
-// slate/article. When that baked article is out of date (its FORCED_PAGE_DATE
-// is not today), it must not be presented as the current board. If a current/
-// upcoming concrete preview exists we redirect to it. Otherwise the baked
-// board STAYS VISIBLE (STALE_GUARD_BANNER_20260606, Nima June 6 2026: a
-// near-empty hub is worse for visitors and Googlebot than a clearly-dated
-// older board) and is labeled with its real date plus a link to the latest
-// available preview. It is never presented as today\u2019s board. No fabricated data.
-function renderPreviewHub() {
-    if (currentPage !== SPORT_HUB_PAGE || !SPORT_HUB_PAGE) return;
-    const baked = window.FORCED_PAGE_DATE || null;
-    // ALWAYS-LATEST HUB (Nima, July 7 2026): the nav "<Sport> Preview" link must land
-    // on the most recent published preview for that sport - NEVER a stale/offseason
-    // archive landing screen. Leave the hub as-is ONLY when today actually has a fresh
-    // concrete board (in-season daily slate baked in). Otherwise - offseason, a hand-
-    // built archive page with no FORCED_PAGE_DATE, or an in-season gap/off-day - fall
-    // through and redirect to the newest published concrete preview below. Keyed on real
-    // content presence (todayHasData), not on whether a baked date happens to exist, so
-    // a dead offseason archive page (e.g. college-basketball-previews.html in July) can
-    // never be the primary click target while published previews exist.
-    if (todayHasData) return;
-    // UNIFIED STALE-HUB POLICY (Nima, June 1 2026): redirect to the newest
-    // valid concrete preview so stale baked content can never stand in as
-    // today\u2019s board. Strip the stale articles first (belt-and-suspenders
-    // with the pre-paint head guard). Clean empty-state below is the fallback
-    // when no concrete entry exists. Same policy as the Featured Game hub.
-    // FALLBACK-TO-LATEST (Nima, June 16 2026): redirect to the newest published
-    // preview for this sport whenever today has none. Prefer a current/upcoming
-    // preview; otherwise load the most recent past one rather than showing an
-    // empty/near-empty board. Only a sport with zero concrete entries falls
-    // through to the labeled state below. Flag past-dated loads so the target
-    // can show a subtle "latest available" note.
-    const _latest = latestConcreteEntry || latestContentEntry || null;
-    if (_latest && _latest.page && _latest.page !== currentPage && _latest.page !== SPORT_HUB_PAGE) {
-        const _m = document.querySelector('.main-content');
-        if (_m) _m.querySelectorAll('.game-preview').forEach(function(el){ el.remove(); });
-        if (_latest.date < todayStr) { try { sessionStorage.setItem('bl_showing_latest', '1'); } catch (e) {} }
-        window.location.replace('/' + _latest.page);
-        return;
-    }
-    const main = document.querySelector('.main-content');
-    if (!main) return;
-
-    const hero = document.querySelector('header.hero');
-    if (hero) {
-        const badge = hero.querySelector('.hero-badge');
-        const h1 = hero.querySelector('h1');
-        const p = hero.querySelector('p');
-        if (badge) badge.textContent = SPORT_LABEL + ' Previews';
-        if (h1) h1.textContent = SPORT_LABEL + ' Game Preview Archive';
-        if (p) p.textContent = 'Browse the latest ' + SPORT_LABEL + ' previews and the full dated archive below. This page does not present older previews as today\u2019s board.';
-    }
-
-    // STALE_GUARD_BANNER_20260606: keep the baked articles visible - only label them.
-    const latest = latestConcreteEntry || latestContentEntry || null;
-    const block = document.createElement('div');
-    block.id = 'hub-state';
-    let html = '';
-    if (baked && !document.getElementById('board-date-note')) {
-        const bakedLabel = new Date(baked + 'T12:00:00').toLocaleDateString('en-US', { weekday: 'long', month: 'long', day: 'numeric', year: 'numeric' });
-        html += '<div style="text-align:center;padding:20px 24px;background:linear-gradient(145deg,#14171f,#0f1218);border:1px solid rgba(255,213,79,0.3);border-radius:12px;margin-bottom:24px;">'
-              + '<p style="font-size:12px;font-weight:700;letter-spacing:2px;text-transform:uppercase;color:#ffd54f;margin-bottom:8px;">Board From</p>'
-              + '<p style="font-size:18px;color:#fff;margin:0;">' + bakedLabel + '</p>'
-              + '</div>';
-    }
-    if (latest && latest.page !== SPORT_HUB_PAGE) {
-        const d = new Date(latest.date + 'T12:00:00').toLocaleDateString('en-US', { weekday: 'long', month: 'long', day: 'numeric', year: 'numeric' });
-        html += '<a href="/' + latest.page + '" style="display:block;text-decoration:none;background:linear-gradient(145deg,#14171f,#0f1218);border:1px solid rgba(255,213,79,0.3);border-radius:12px;padding:28px 32px;">'
-              + '<p style="font-size:12px;font-weight:700;letter-spacing:2px;text-transform:uppercase;color:#fd5000;margin-bottom:10px;">Latest ' + SPORT_LABEL + ' Preview</p>'
-              + '<p style="font-family:Orbitron,sans-serif;font-size:22px;color:#fff;margin:0 0 8px;line-height:1.25;">' + latest.title + '</p>'
-              + '<p style="color:#b0b8c4;font-size:14px;margin:0;">' + d + ' &nbsp;&rarr;</p>'
-              + '</a>';
-    }
-    block.innerHTML = html;
-    const mobile = main.querySelector('.mobile-archive');
-    if (mobile && mobile.nextSibling) main.insertBefore(block, mobile.nextSibling);
-    else if (mobile) main.appendChild(block);
-    else main.insertBefore(block, main.firstChild);
-}
-
-function initSportCalendar() {
-
-    installCalendarStateStyles();
-    renderPreviewHub();
-
-    const monthSelect = document.getElementById('month-select') || document.getElementById('monthSelect');
-    if (monthSelect) {
-        monthSelect.innerHTML = '';
-        sortedMonths.forEach(m => {
-            const [year, month] = m.split('-');
-            const opt = document.createElement('option');
-            opt.value = m;
-            opt.textContent = monthNames[parseInt(month) - 1] + ' ' + year;
-            if (m === displayMonth) opt.selected = true;
-            monthSelect.appendChild(opt);
-        });
-        monthSelect.addEventListener('change', function() { renderCalendar(this.value); });
-    }
-    renderCalendar(displayMonth);
-    const mobileSelect = document.getElementById('mobile-archive-select') || document.getElementById('mobileArchiveSelect');
-    if (mobileSelect) {
-        mobileSelect.innerHTML = '<option value="">Select a date...</option>';
-        ARCHIVE_DATA.forEach(item => {
-            const opt = document.createElement('option');
-            opt.value = item.page;
-            const dateObj = new Date(item.date + 'T12:00:00');
-            const dateLabel = dateObj.toLocaleDateString('en-US', { weekday: 'short', month: 'short', day: 'numeric' });
-            opt.textContent = dateLabel + ' - ' + item.title;
-            if (item.page === currentPage) opt.selected = true;
-            mobileSelect.appendChild(opt);
-        });
-        mobileSelect.addEventListener('change', (e) => { if (e.target.value) window.location.href = '/' + e.target.value; });
-    }
-}
-
-if (document.readyState === 'loading') { document.addEventListener('DOMContentLoaded', initSportCalendar); } else { initSportCalendar(); }
-
-/* SHOWING-LATEST NOTE (Nima, June 16 2026): when a hub fell back to the most
-   recent published item (no entry for today), show a subtle one-line note on the
-   destination article. Flag is set by the hub before redirect; cleared after use. */
-(function showLatestAvailableNote() {
-    function run() {
-        var flag;
-        try { flag = sessionStorage.getItem('bl_showing_latest'); } catch (e) { return; }
-        if (!flag) return;
-        try { sessionStorage.removeItem('bl_showing_latest'); } catch (e) {}
-        if (document.getElementById('bl-latest-note')) return;
-        var host = document.querySelector('.main-content') || document.querySelector('.page-wrapper') || document.body;
-        if (!host) return;
-        var note = document.createElement('div');
-        note.id = 'bl-latest-note';
-        note.setAttribute('style', 'max-width:900px;margin:90px auto 0;padding:10px 16px;border:1px solid rgba(0,229,255,0.3);border-radius:10px;background:rgba(0,229,255,0.06);color:#9fe9f5;font-size:13px;line-height:1.5;text-align:center;font-family:Inter,system-ui,sans-serif;');
-        note.textContent = 'Showing the latest available preview. No new post has been published for today yet.';
-        host.insertBefore(note, host.firstChild);
-    }
-    if (document.readyState === 'loading') { document.addEventListener('DOMContentLoaded', run); } else { run(); }
+// Entries: data/calendar/ncaaf/<YYYY-MM>.json; engine: scripts/calendar-runtime.js
+
+window.BL_SPORT_CALENDAR = {"sport": "ncaaf", "hubPage": "", "label": "NCAAF", "mainPages": ["nba.html", "nhl.html", "ncaab.html", "ncaaf.html", "nfl.html", "mlb.html", "soccer.html", "nba-previews.html", "nhl-previews.html", "mlb-previews.html", "soccer-previews.html", "college-basketball-previews.html"], "dataBase": "/data/calendar/ncaaf/", "latestContent": {"date": "2026-01-19", "page": "college-football-picks-predictions-against-the-spread.html", "title": "NCAAF Analysis - January 19, 2026"}, "latestConcrete": {"date": "2026-01-19", "page": "college-football-picks-predictions-against-the-spread.html", "title": "NCAAF Analysis - January 19, 2026"}, "months": {"2025-11": {"n": 4, "v": "e664d1b052"}, "2025-12": {"n": 11, "v": "c6ebcfe409"}, "2026-01": {"n": 8, "v": "4d6234665d"}}, "pages": {"0": "5612110d10", "1": "41c2111321", "2": "a6fe5b62cb", "3": "d2d65de758", "5": "5dbee96cc2", "6": "5d6466126a", "8": "82e74b571f", "9": "e84c8755cf", "10": "53c06cdbda", "12": "303644ab4b", "13": "23132f3ec4", "15": "28cf29757e"}, "current": {"month": "2026-10", "entries": []}};
+(function loadCalendarRuntime() {
+    var me = document.currentScript && document.currentScript.src;
+    var base = me ? me.slice(0, me.lastIndexOf('/') + 1) : '/scripts/';
+    var s = document.createElement('script');
+    s.src = base + 'calendar-runtime.js?v=c5c93250003';
+    s.async = false;
+    (document.head || document.documentElement).appendChild(s);
 })();
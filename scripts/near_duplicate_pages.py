@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""Near-duplicate page detector: word shingles + MinHash + LSH.
+
+detect_duplicate_games.py catches the same matchup <h2> on two date pages, but
+only for exact (normalized) titles. A preview regenerated with slightly
+different wording, or an archive page copied forward with a few edits, passes
+it and ends up as two near-identical URLs competing for the same query and
+burning crawl budget.
+
+Each page's visible article text (head, scripts, styles, nav, header, footer
+and aside stripped) is cut into overlapping 5-word shingles. The shingle set is
+summarised by a 128-slot one-permutation MinHash signature: every shingle is
+hashed once and each slot keeps the smallest hash that falls into it, with
+empty slots filled from their right-hand neighbour. The fraction of slots two
+signatures share estimates the Jaccard similarity of the shingle sets.
+
+Signatures are grouped by LSH: 32 bands of 4 slots, and pages that agree on a
+whole band are candidates. Only candidates get their similarity estimated, so
+one page is checked against the site in milliseconds and the whole site
+without comparing every pair.
+
+Signatures are stored per page at data/cache/page-signatures.json with the
+sha1 of the page bytes; a run only re-shingles pages whose bytes changed.
+The store is gitignored. The pre-commit check only reads it and skips itself
+when it is missing; running this script builds or refreshes it.
+
+Usage:
+  python scripts/near_duplicate_pages.py                      # clusters across the site
+  python scripts/near_duplicate_pages.py --threshold 0.9
+  python scripts/near_duplicate_pages.py --page nba-x.html    # near matches for one page
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import hashlib
+import html
+import json
+import multiprocessing
+import os
+import re
+import sys
+from array import array
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO = os.path.dirname(SCRIPT_DIR)
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+STORE_PATH = os.path.join(REPO, 'data', 'cache', 'page-signatures.json')
+# Bump when text extraction, shingling or the signature layout changes.
+STORE_VERSION = 1
+
+SHINGLE_WORDS = 5
+NUM_SLOTS = 128
+BANDS = 32
+ROWS = NUM_SLOTS // BANDS
+# Estimated Jaccard similarity at or above which two pages are reported.
+SIMILARITY_THRESHOLD = 0.8
+# Pages with fewer shingles than this (redirect stubs, empty hubs) are stored
+# but never reported: a handful of shared sentences is not a duplicate.
+MIN_SHINGLES = 40
+# Fewer changed pages than this are fingerprinted in-process (the usual daily
+# run); a cold build goes over a process pool. NEAR_DUPES_WORKERS overrides
+# the pool size.
+PARALLEL_MIN_PAGES = 64
+
+_MASK32 = 0xFFFFFFFF
+_EMPTY = 1 << 64
+
+BOILERPLATE_RE = re.compile(
+    r'<(head|script|style|noscript|svg|nav|header|footer|aside|form)\b.*?</\1\s*>',
+    re.DOTALL | re.IGNORECASE)
+COMMENT_RE = re.compile(r'<!--.*?-->', re.DOTALL)
+TAG_RE = re.compile(r'<[^>]+>')
+WORD_RE = re.compile(r"[a-z0-9]+(?:'[a-z0-9]+)*")
+
+
+def page_words(text: str) -> list[str]:
+    """Lower-cased words of the page's visible article text."""
+    text = COMMENT_RE.sub(' ', text)
+    text = BOILERPLATE_RE.sub(' ', text)
+    text = html.unescape(TAG_RE.sub(' ', text))
+    return WORD_RE.findall(text.lower())
+
+
+def shingle_hashes(words: list[str]) -> set[int]:
+    shingles = {' '.join(t) for t in zip(*(words[i:] for i in range(SHINGLE_WORDS)))}
+    return {int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), 'little')
+            for s in shingles}
+
+
+def signature(hashes: set[int]) -> array:
+    """One-permutation MinHash of a shingle-hash set (NUM_SLOTS 32-bit values)."""
+    slots = [_EMPTY] * NUM_SLOTS
+    for h in hashes:
+        slot, value = h % NUM_SLOTS, h // NUM_SLOTS
+        if value < slots[slot]:
+            slots[slot] = value
+    filled = [i for i, v in enumerate(slots) if v != _EMPTY]
+    sig = array('I', [0] * NUM_SLOTS)
+    if not filled:
+        return sig
+    # Densify: an empty slot borrows the next filled slot's value, offset by
+    # the distance so borrowed and native values do not collide by accident.
+    nxt = filled[0] + NUM_SLOTS
+    for i in range(NUM_SLOTS - 1, -1, -1):
+        if slots[i] != _EMPTY:
+            nxt = i
+        value = slots[nxt % NUM_SLOTS] + (nxt - i) * 0x9E3779B1
+        sig[i] = value & _MASK32
+    return sig
+
+
+def similarity(a: array, b: array) -> float:
+    return sum(x == y for x, y in zip(a, b)) / NUM_SLOTS
+
+
+def band_keys(sig: array) -> list[tuple]:
+    return [(band, tuple(sig[band * ROWS:(band + 1) * ROWS])) for band in range(BANDS)]
+
+
+def fingerprint(text: str) -> dict:
+    hashes = shingle_hashes(page_words(text))
+    return {'shingles': len(hashes), 'sig': signature(hashes)}
+
+
+def _encode(sig: array) -> str:
+    data = array('I', sig)
+    if sys.byteorder != 'little':
+        data.byteswap()
+    return base64.b64encode(data.tobytes()).decode('ascii')
+
+
+def _decode(text: str) -> array:
+    sig = array('I')
+    sig.frombytes(base64.b64decode(text))
+    if sys.byteorder != 'little':
+        sig.byteswap()
+    return sig
+
+
+def _fingerprint_job(rel: str) -> tuple[str, dict | None]:
+    try:
+        with open(os.path.join(REPO, rel), encoding='utf-8', errors='replace') as f:
+            return rel, fingerprint(f.read())
+    except OSError:
+        return rel, None
+
+
+def fingerprint_pages(pages: list[str], workers: int | None = None) -> list[tuple[str, dict | None]]:
+    """(page, fingerprint) for each page, over a process pool when there are many."""
+    if workers is None:
+        workers = int(os.environ.get('NEAR_DUPES_WORKERS') or os.cpu_count() or 1)
+    workers = max(1, min(workers, len(pages)))
+    if workers == 1 or len(pages) < PARALLEL_MIN_PAGES:
+        return [_fingerprint_job(rel) for rel in pages]
+    if 'fork' in multiprocessing.get_all_start_methods():
+        pool = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('fork'))
+    else:
+        pool = ProcessPoolExecutor(workers)
+    with pool:
+        return list(pool.map(_fingerprint_job, pages, chunksize=max(1, len(pages) // (workers * 4))))
+
+
+def content_pages() -> list[str]:
+    from html_rewrite import html_pages
+    return [p for p in html_pages() if not p.startswith('archives/audit_reports/')]
+
+
+class PageSignatures:
+    """sha1-keyed MinHash store for every page, with an in-memory LSH index."""
+
+    def __init__(self, path: str = STORE_PATH) -> None:
+        self.path = path
+        self.pages: dict[str, dict] = {}
+        self.dirty = False
+        self._lsh: dict[tuple, list[str]] | None = None
+        try:
+            with open(path, encoding='utf-8') as f:
+                raw = json.load(f)
+            if raw.get('version') == STORE_VERSION:
+                self.pages = {rel: {**e, 'sig': _decode(e['sig'])} for rel, e in raw.get('pages', {}).items()}
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write('{"version": %d, "pages": {\n' % STORE_VERSION)
+            rows = [f'{json.dumps(rel)}: {json.dumps({**e, "sig": _encode(e["sig"])})}'
+                    for rel, e in sorted(self.pages.items())]
+            f.write(',\n'.join(rows))
+            f.write('\n}}\n')
+        os.replace(tmp, self.path)
+        self.dirty = False
+
+    def update(self, pages: list[str] | None = None) -> int:
+        """Re-fingerprint pages whose bytes changed and drop deleted ones.
+
+        Returns the number of pages (re)fingerprinted.
+        """
+        pages = content_pages() if pages is None else pages
+        stale = {}
+        for rel in pages:
+            try:
+                with open(os.path.join(REPO, rel), 'rb') as f:
+                    sha = hashlib.sha1(f.read()).hexdigest()
+            except OSError:
+                continue
+            entry = self.pages.get(rel)
+            if not entry or entry['sha'] != sha:
+                stale[rel] = sha
+        changed = 0
+        for rel, fp in fingerprint_pages(list(stale)):
+            if fp is not None:
+                self.pages[rel] = {'sha': stale[rel], **fp}
+                changed += 1
+        for rel in [r for r in self.pages if not os.path.exists(os.path.join(REPO, r))]:
+            del self.pages[rel]
+            changed += 1
+        if changed:
+            self.dirty = True
+            self._lsh = None
+        return changed
+
+    def lsh(self) -> dict[tuple, list[str]]:
+        if self._lsh is None:
+            buckets = defaultdict(list)
+            for rel, entry in self.pages.items():
+                if entry['shingles'] >= MIN_SHINGLES:
+                    for key in band_keys(entry['sig']):
+                        buckets[key].append(rel)
+            self._lsh = buckets
+        return self._lsh
+
+    def near(self, fp: dict, threshold: float = SIMILARITY_THRESHOLD,
+             exclude: str | None = None) -> list[tuple[float, str]]:
+        """(similarity, page) for stored pages at or above `threshold`, best first."""
+        if fp['shingles'] < MIN_SHINGLES:
+            return []
+        buckets = self.lsh()
+        candidates = {rel for key in band_keys(fp['sig']) for rel in buckets.get(key, ())}
+        candidates.discard(exclude)
+        out = [(round(similarity(fp['sig'], self.pages[rel]['sig']), 3), rel) for rel in candidates]
+        return sorted((s, rel) for s, rel in out if s >= threshold)[::-1]
+
+    def clusters(self, threshold: float = SIMILARITY_THRESHOLD) -> list[list[tuple[str, str, float]]]:
+        """Groups of near-duplicate pages, each as its (a, b, similarity) edges."""
+        parent: dict[str, str] = {}
+
+        def find(x):
+            while parent.setdefault(x, x) != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        edges = {}
+        for rels in self.lsh().values():
+            if len(rels) < 2:
+                continue
+            for i, a in enumerate(rels):
+                for b in rels[i + 1:]:
+                    pair = (a, b) if a < b else (b, a)
+                    if pair in edges:
+                        continue
+                    edges[pair] = similarity(self.pages[a]['sig'], self.pages[b]['sig'])
+        groups = defaultdict(list)
+        for (a, b), s in edges.items():
+            if s >= threshold:
+                parent[find(a)] = find(b)
+        for (a, b), s in sorted(edges.items()):
+            if s >= threshold:
+                groups[find(a)].append((a, b, round(s, 3)))
+        return sorted(groups.values(), key=lambda g: (-len(g), g[0]))
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description='Find near-duplicate pages with MinHash + LSH.')
+    ap.add_argument('--threshold', type=float, default=SIMILARITY_THRESHOLD,
+                    help=f'Minimum estimated similarity to report (default {SIMILARITY_THRESHOLD}).')
+    ap.add_argument('--page', nargs='+', help='Only report near matches for these repo-relative pages.')
+    args = ap.parse_args(argv)
+
+    store = PageSignatures()
+    refreshed = store.update()
+    store.save()
+
+    if args.page:
+        found = 0
+        for rel in args.page:
+            rel = os.path.relpath(os.path.abspath(rel), REPO).replace('\\', '/')
+            try:
+                with open(os.path.join(REPO, rel), encoding='utf-8', errors='replace') as f:
+                    fp = fingerprint(f.read())
+            except OSError as e:
+                print(f'  [ERROR] {rel}: {e}')
+                found += 1
+                continue
+            matches = store.near(fp, args.threshold, exclude=rel)
+            found += len(matches)
+            if not matches:
+                print(f'  [OK] {rel}: no page at or above {args.threshold:.0%} similar')
+            for s, other in matches:
+                print(f'  [X] {rel} ~ {other} ({s:.0%} similar)')
+        return 1 if found else 0
+
+    clusters = store.clusters(args.threshold)
+    print(f'[near-dupes] {len(store.pages)} page(s) indexed, {refreshed} refreshed')
+    for group in clusters:
+        pages = sorted({p for a, b, _ in group for p in (a, b)})
+        print(f'\n  Cluster of {len(pages)} page(s):')
+        for a, b, s in group:
+            print(f'    {s:.0%}  {a}  ~  {b}')
+    print(f'\n[near-dupes] {len(clusters)} cluster(s) at or above {args.threshold:.0%} similarity')
+    return 1 if clusters else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,512 +1,14 @@
-// NHL Archive Calendar Data
-// Last updated: August 22, 2026
+// NHL Archive Calendar Index
+// Last updated: October 19, 2026
 // Auto-generated by sync_calendars.py - DO NOT EDIT MANUALLY
-
-const ARCHIVE_DATA = [
-    { date: "2026-06-14", page: "hurricanes-golden-knights-cup-final-game-6-vegas-closeout-nhl.html", title: "NHL Stanley Cup Final Game 6 Analysis - June 14, 2026" },
-    { date: "2026-06-14", page: "hurricanes-golden-knights-stanley-cup-final-game-6-over-nhl-pick.html", title: "Hurricanes and Golden Knights Game 6 Over Pick" },
-    { date: "2026-06-14", page: "hurricanes-moneyline-stanley-cup-final-game-6-clinch-nhl-pick.html", title: "Hurricanes Moneyline Game 6 Pick (-115)" },
-    { date: "2026-06-13", page: "hurricanes-golden-knights-stanley-cup-final-game-6-nhl.html", title: "NHL Stanley Cup Final Game 6 Analysis" },
-    { date: "2026-06-11", page: "hurricanes-golden-knights-stanley-cup-final-game-5-nhl.html", title: "NHL Stanley Cup Final Game 5 Analysis - June 11, 2026" },
-    { date: "2026-06-09", page: "hurricanes-golden-knights-stanley-cup-final-game-4-nhl.html", title: "NHL Stanley Cup Final Game 4 Analysis - June 09, 2026" },
-    { date: "2026-06-06", page: "hurricanes-golden-knights-stanley-cup-final-game-3-nhl.html", title: "NHL Analysis: Stanley Cup Final Game 3 Preview" },
-    { date: "2026-06-02", page: "golden-knights-hurricanes-stanley-cup-final-game-1-nhl.html", title: "NHL Analysis" },
-    { date: "2026-06-02", page: "golden-knights-vs-hurricanes-stanley-cup-final-game-1-nhl-analysis-stats-preview.html", title: "Golden Knights vs Hurricanes Game 1 Preview" },
-    { date: "2026-06-01", page: "hurricanes-reach-stanley-cup-final-golden-knights-await-nhl.html", title: "Hurricanes vs Golden Knights Stanley Cup Final" },
-    { date: "2026-05-29", page: "canadiens-vs-hurricanes-eastern-conference-final-game-5-nhl-analysis-stats-preview.html", title: "Canadiens vs Hurricanes Game 5 Analysis, Stats, Preview - May 29, 2026" },
-    { date: "2026-05-29", page: "hurricanes-chase-cup-final-vegas-waits-nhl.html", title: "NHL Analysis - Hurricanes Chase the Cup Final, Vegas Waits - May 29, 2026" },
-    { date: "2026-05-27", page: "hurricanes-canadiens-eastern-conference-final-game-4-montreal-nhl.html", title: "NHL Analysis - May 27, 2026" },
-    { date: "2026-05-27", page: "hurricanes-vs-canadiens-eastern-conference-final-game-4-nhl-analysis-stats-preview.html", title: "Hurricanes vs Canadiens Game 4 Preview - May 27, 2026" },
-    { date: "2026-05-26", page: "avalanche-golden-knights-game-4-elimination-vegas-sweep-bid-nhl.html", title: "NHL Analysis - May 26, 2026" },
-    { date: "2026-05-25", page: "canadiens-moneyline-hurricanes-game-3-eastern-conference-final-bell-centre-nhl-pick.html", title: "Canadiens Moneyline vs Hurricanes Game 3 Bell Centre Pick" },
-    { date: "2026-05-25", page: "hurricanes-canadiens-game-3-andersen-dobes-bell-centre-nhl.html", title: "NHL Analysis - May 25, 2026" },
-    { date: "2026-05-24", page: "avalanche-golden-knights-game-3-makar-out-nhl.html", title: "NHL Analysis - May 24, 2026" },
-    { date: "2026-05-23", page: "canadiens-hurricanes-eastern-conference-final-game-2-nhl.html", title: "NHL Preview: Canadiens at Hurricanes ECF Game 2 - May 23, 2026" },
-    { date: "2026-05-23", page: "canadiens-puck-line-plus-1-5-hurricanes-game-2-eastern-conference-final-nhl-pick.html", title: "Canadiens +1.5 vs Hurricanes Game 2: Montreal Covers The Puck Line" },
-    { date: "2026-05-22", page: "makar-questionable-avalanche-golden-knights-game-2-nhl.html", title: "NHL Preview: Golden Knights at Avalanche WCF Game 2 - May 22, 2026" },
-    { date: "2026-05-21", page: "andersen-canadiens-hurricanes-eastern-conference-finals-game-1-nhl.html", title: "NHL: Canadiens at Hurricanes ECF Game 1 - May 21, 2026" },
-    { date: "2026-05-21", page: "canadiens-team-total-under-2-5-hurricanes-game-1-nhl-pick.html", title: "Canadiens Team Total Under 2.5 vs Hurricanes ECF Game 1 Pick" },
-    { date: "2026-05-20", page: "mackinnon-eichel-knights-avalanche-western-conference-finals-game-1-nhl.html", title: "NHL Preview: MacKinnon vs Eichel - Western Conference Finals Game 1 - May 20, 2026" },
-    { date: "2026-05-18", page: "canadiens-sabres-game-seven-east-final-berth-nhl.html", title: "Canadiens at Sabres Game 7 Preview for East Final Berth" },
-    { date: "2026-05-16", page: "nhl-may-16-2026-recovery.html", title: "NHL Playoff Archive - May 16, 2026" },
-    { date: "2026-05-14", page: "canadiens-sabres-golden-knights-ducks-nhl-playoff-preview.html", title: "Canadiens vs Sabres Game 5 and Golden Knights vs Ducks Game 6 NHL Playoff Preview" },
-    { date: "2026-05-14", page: "ducks-team-total-under-3-5-golden-knights-game-6-nhl-pick.html", title: "Ducks Team Total Under 3.5 vs Golden Knights Game 6 Pick" },
-    { date: "2026-05-13", page: "nhl-previews-archive-may-2026.html#2026-05-13", title: "NHL Analysis - 2026-05-13" },
-    { date: "2026-05-12", page: "sabres-canadiens-ducks-golden-knights-playoff-pivots-nhl.html", title: "NHL Preview: Sabres Canadiens Ducks Knights" },
-    { date: "2026-05-12", page: "vegas-golden-knights-moneyline-minus-150-ducks-game-5-nhl-pick.html", title: "Vegas Golden Knights Moneyline -150 vs Ducks Game 5 Pick" },
-    { date: "2026-05-11", page: "avalanche-vs-wild-nhl-western-semis-game-4-analysis-stats-preview.html", title: "Avalanche vs Wild Game 4 Analysis - May 11, 2026" },
-    { date: "2026-05-11", page: "avalanche-wild-game-4-pivot-second-round-monday-nhl.html", title: "NHL Analysis - May 11, 2026" },
-    { date: "2026-05-10", page: "sabres-canadiens-knights-ducks-game-3-4-nhl.html", title: "NHL Playoff Preview: Sabres vs Canadiens and Golden Knights vs Ducks for May 10, 2026" },
-    { date: "2026-05-09", page: "hurricanes-flyers-avalanche-wild-nhl.html", title: "NHL Playoff Preview: Hurricanes vs Flyers and Avalanche vs Wild for May 9, 2026" },
-    { date: "2026-05-08", page: "ducks-golden-knights-game-3-under-6-5-honda-center-stanley-cup-playoffs-nhl-pick.html", title: "Ducks vs Golden Knights Game 3 Under 6.5 NHL Free Pick" },
-    { date: "2026-05-08", page: "sabres-canadiens-knights-ducks-second-round-game-fest-nhl.html", title: "NHL Analysis - May 08, 2026" },
-    { date: "2026-05-07", page: "hurricanes-flyers-game-3-second-round-nhl.html", title: "NHL Analysis - May 07, 2026" },
-    { date: "2026-05-07", page: "hurricanes-flyers-game-3-under-5-5-andersen-vladar-xfinity-mobile-arena-nhl-pick.html", title: "Hurricanes/Flyers Game 3 Under 5.5 NHL Free Pick" },
-    { date: "2026-05-06", page: "sabres-canadiens-under-6-5-game-1-second-round-keybank-center-nhl-pick.html", title: "Sabres vs Canadiens Pick: Under 6.5 in Game 1" },
-    { date: "2026-05-06", page: "sabres-host-canadiens-game-1-knights-host-ducks-game-2-nhl.html", title: "NHL Playoff Preview: Canadiens vs Sabres and Ducks vs Golden Knights for May 6, 2026" },
-    { date: "2026-05-05", page: "wild-avalanche-game-2-second-round-nhl.html", title: "NHL Analysis - May 05, 2026" },
-    { date: "2026-05-05", page: "wild-avalanche-over-6-5-game-2-ball-arena-stanley-cup-playoffs-nhl-pick.html", title: "Wild/Avalanche Over 6.5 Game 2 Ball Arena NHL Free Pick" },
-    { date: "2026-05-04", page: "flyers-hurricanes-game-2-ducks-knights-game-1-nhl.html", title: "NHL Analysis - May 04, 2026" },
-    { date: "2026-05-03", page: "lightning-canadiens-game-7-wild-avalanche-nhl.html", title: "NHL Analysis - May 03, 2026" },
-    { date: "2026-05-02", page: "hurricanes-flyers-round-two-opener-saturday-nhl.html", title: "NHL Analysis - May 02, 2026" },
-    { date: "2026-05-01", page: "sabres-bruins-over-5-5-game-6-td-garden-stanley-cup-playoffs-nhl.html", title: "Sabres vs Bruins Game 6 Pick: Over 5.5 at TD Garden" },
-    { date: "2026-05-01", page: "three-friday-game-6s-canadiens-sabres-knights-elimination-night-nhl.html", title: "NHL Analysis - May 01, 2026" },
-    { date: "2026-04-30", page: "stars-wild-game-6-elimination-night-saint-paul-nhl.html", title: "NHL Analysis - April 30, 2026" },
-    { date: "2026-04-30", page: "stars-wild-over-5-5-game-6-grand-casino-arena-nhl.html", title: "Stars/Wild Over 5.5 Game 6 Free Pick at Grand Casino Arena NHL" },
-    { date: "2026-04-29", page: "playoff-elimination-wednesday-three-game-5s-flyers-clincher-nhl.html", title: "NHL Analysis - April 29, 2026" },
-    { date: "2026-04-28", page: "bruins-elimination-night-wild-stars-tied-ducks-oilers-tuesday-nhl.html", title: "NHL Analysis - April 28, 2026" },
-    { date: "2026-04-28", page: "ducks-oilers-under-7-game-5-rogers-place-stanley-cup-playoffs-nhl.html", title: "Ducks/Oilers Under 7 Game 5 Free Pick Rogers Place NHL" },
-    { date: "2026-04-27", page: "flyers-clinch-bid-knights-mammoth-monday-nhl.html", title: "NHL Analysis - April 27, 2026" },
-    { date: "2026-04-27", page: "flyers-puck-line-plus-1-5-penguins-game-5-stanley-cup-playoffs-nhl.html", title: "Flyers +1.5 -210 Free Pick vs Penguins Game 5 NHL Playoffs" },
-    { date: "2026-04-26", page: "avs-clinch-canadiens-bruins-oilers-game-four-sunday-nhl.html", title: "NHL Analysis - April 26, 2026" },
-    { date: "2026-04-26", page: "ducks-puck-line-plus-1-5-game-4-oilers-honda-center-nhl.html", title: "Ducks Puck Line +1.5 Free Pick Game 4 vs Oilers Honda Center April 26 2026" },
-    { date: "2026-04-25", page: "canes-sweep-watch-flyers-clinch-stars-wild-saturday-nhl.html", title: "NHL Analysis - April 25, 2026" },
-    { date: "2026-04-25", page: "stars-moneyline-plus-115-game-4-wild-grand-casino-arena-nhl.html", title: "Stars ML +115 Game 4 at Wild Free Pick April 25 2026" },
-    { date: "2026-04-24", page: "lightning-mammoth-ducks-three-game-three-friday-nhl.html", title: "NHL Analysis - April 24, 2026" },
-    { date: "2026-04-24", page: "mammoth-moneyline-minus-110-home-ice-golden-knights-game-3-delta-center-nhl.html", title: "Mammoth ML -110 vs Golden Knights Game 3 Free Pick April 24 2026" },
-    { date: "2026-04-23", page: "sabres-bruins-canes-sens-avs-kings-three-game-three-nhl.html", title: "NHL Analysis - April 23, 2026" },
-    { date: "2026-04-23", page: "sabres-moneyline-minus-110-bruins-game-3-td-garden-nhl.html", title: "Sabres ML -110 Free Pick vs Bruins Game 3 April 23 2026" },
-    { date: "2026-04-22", page: "flyers-try-three-oh-stars-wild-oilers-ducks-nhl.html", title: "NHL Analysis - April 22, 2026" },
-    { date: "2026-04-21", page: "sabres-stun-bruins-avalanche-lightning-mammoth-four-game-two-nhl.html", title: "NHL Analysis - April 21, 2026" },
-    { date: "2026-04-21", page: "sabres-team-total-under-3-5-bruins-game-2-stanley-cup-playoffs-nhl.html", title: "Sabres Team Total Under 3.5 (-140) vs Bruins Game 2 NHL Free Pick April 21 2026" },
-    { date: "2026-04-20", page: "ducks-moneyline-plus-160-puck-line-oilers-game-1-stanley-cup-playoffs-nhl.html", title: "Ducks ML +160 & +1.5 -155 at Oilers Free NHL Pick Game 1 April 20 2026" },
-    { date: "2026-04-20", page: "oilers-open-penguins-hurricanes-wild-four-game-nhl.html", title: "NHL Analysis - April 20, 2026" },
-    { date: "2026-04-19", page: "stanley-cup-playoffs-bruins-sabres-mammoth-knights-nhl.html", title: "NHL Analysis - April 19, 2026" },
-    { date: "2026-04-18", page: "kings-plus-1-5-puck-line-avalanche-game-1-stanley-cup-playoffs-nhl.html", title: "LA Kings +1.5 Puck Line vs Avalanche Free NHL Pick Game 1 April 18" },
-    { date: "2026-04-18", page: "playoffs-tip-off-hurricanes-stars-penguins-nhl.html", title: "NHL Analysis - April 18, 2026" },
-    { date: "2026-04-16", page: "canucks-oilers-over-6-5-total-edmonton-powerplay-rogers-place-nhl.html", title: "Canucks Oilers Over 6.5 NHL Total Pick April 16" },
-    { date: "2026-04-15", page: "kraken-plus-1-5-puck-line-daccord-tortorella-vegas-nhl.html", title: "Kraken +1.5 at Golden Knights NHL Pick April 15" },
-    { date: "2026-04-15", page: "maple-leafs-plus-1-5-puck-line-battle-of-ontario-senators-nhl.html", title: "Maple Leafs +1.5 at Senators NHL Pick April 15" },
-    { date: "2026-04-15", page: "sabres-division-title-celebrini-chases-history-season-finale-nhl.html", title: "NHL Analysis - April 15, 2026" },
-    { date: "2026-04-14", page: "avalanche-presidents-trophy-bruins-playoff-clinch-9-game-tuesday-nhl.html", title: "NHL Analysis - April 14, 2026" },
-    { date: "2026-04-14", page: "capitals-blue-jackets-under-6-5-thompson-greaves-nationwide-arena-nhl.html", title: "Capitals Blue Jackets Under 6.5 NHL Free Pick April 14" },
-    { date: "2026-04-13", page: "avalanche-oilers-showdown-kings-playoff-push-10-game-monday-nhl.html", title: "NHL Analysis - April 13, 2026" },
-    { date: "2026-04-13", page: "wild-blues-under-5-5-gustavsson-hofer-enterprise-center-nhl.html", title: "Wild Blues Under 5.5 NHL Free Pick April 13" },
-    { date: "2026-04-12", page: "mammoth-flames-under-6-saddledome-calgary-nhl.html", title: "Mammoth at Flames Under 6 Free Pick April 12 2026" },
-    { date: "2026-04-12", page: "penguins-capitals-home-and-home-bruins-streak-playoff-push-nhl.html", title: "NHL Analysis - April 12, 2026" },
-    { date: "2026-04-11", page: "final-saturday-playoff-race-fifteen-game-nhl.html", title: "NHL Analysis - April 11, 2026" },
-    { date: "2026-04-09", page: "atlantic-playoff-race-lightning-canadiens-wild-stars-14-game-nhl.html", title: "NHL Analysis - April 9, 2026" },
-    { date: "2026-04-08", page: "sabres-surge-capitals-oilers-playoff-push-nhl.html", title: "NHL Analysis - April 8, 2026" },
-    { date: "2026-04-07", page: "blues-puck-line-moneyline-avalanche-enterprise-center-nhl.html", title: "Blues +1.5 and ML Free Pick vs Avalanche April 7" },
-    { date: "2026-04-07", page: "playoff-push-bruins-hurricanes-avalanche-oilers-wild-card-nhl.html", title: "NHL Analysis - April 7, 2026" },
-    { date: "2026-04-06", page: "lightning-sabres-atlantic-clash-predators-kings-wild-card-nhl.html", title: "NHL Analysis - April 6, 2026" },
-    { date: "2026-04-05", page: "caps-rangers-espn-showdown-wild-card-chaos-nhl.html", title: "NHL Analysis - April 5, 2026" },
-    { date: "2026-04-04", page: "15-game-playoff-push-rangers-stars-hurricanes-nhl.html", title: "NHL Analysis - April 4, 2026" },
-    { date: "2026-04-03", page: "blues-ducks-under-6-honda-center-nhl.html", title: "Blues at Ducks Under 6 Free Pick April 3 2026" },
-    { date: "2026-04-03", page: "flyers-upset-islanders-blues-surge-nhl.html", title: "NHL Analysis - April 3, 2026" },
-    { date: "2026-04-02", page: "bruins-panthers-jets-stars-wild-card-chaos-nhl.html", title: "NHL Analysis - April 2, 2026" },
-    { date: "2026-04-01", page: "avalanche-canucks-blues-kings-wild-card-race-nhl.html", title: "NHL Analysis - April 1, 2026" },
-    { date: "2026-03-31", page: "devils-rangers-hudson-river-rivalry-stars-bruins-clash-nhl.html", title: "NHL Analysis - March 31, 2026" },
-    { date: "2026-03-30", page: "penguins-stun-islanders-avalanche-dominate-flames-nhl.html", title: "NHL Analysis - March 30, 2026" },
-    { date: "2026-03-29", page: "nhl-previews-archive-march-2026.html#2026-03-29", title: "NHL Analysis - 2026-03-29" },
-    { date: "2026-03-28", page: "nhl-march28-content.html", title: "NHL Analysis - Saturday, March 28, 2026" },
-    { date: "2026-03-27", page: "nhl-previews-archive-march-2026.html#2026-03-27", title: "NHL Analysis - 2026-03-27" },
-    { date: "2026-03-26", page: "thirteen-game-thursday-playoff-race-nhl.html", title: "NHL Analysis - March 26, 2026" },
-    { date: "2026-03-25", page: "nhl-previews-archive-march-2026.html#2026-03-25", title: "NHL Analysis - 2026-03-25" },
-    { date: "2026-03-24", page: "blackhawks-puck-line-moneyline-at-islanders-nhl.html", title: "Blackhawks +1.5 and Moneyline at Islanders NHL Pick" },
-    { date: "2026-03-23", page: "nhl-previews-archive-march-2026.html", title: "NHL Analysis - 2026-03-23" },
-    { date: "2026-03-22", page: "penguins-team-total-over-2-5-hurricanes-nhl.html", title: "Penguins Team Total Over 2.5 Goals NHL Pick" },
-    { date: "2026-03-21", page: "kraken-blue-jackets-under-6-5-nhl.html", title: "Kraken vs Blue Jackets Under 6.5 Goals NHL Pick" },
-    { date: "2026-03-20", page: "devils-moneyline-plus-110-at-capitals-nhl.html", title: "Devils Moneyline +110 at Capitals NHL Pick" },
-    { date: "2026-03-20", page: "hurricanes-leafs-avalanche-roll-panthers-west-nhl.html", title: "NHL Analysis - March 20, 2026" },
-    { date: "2026-03-20", page: "nhl.html", title: "NHL Analysis - April 9, 2026" },
-    { date: "2026-03-19", page: "bruins-team-total-under-3-5-jets-nhl.html", title: "Bruins Team Total Under 3.5 Goals vs Jets NHL Pick" },
-    { date: "2026-03-18", page: "hudson-river-rivalry-stars-avalanche-elite-showdown-nhl.html", title: "NHL Analysis - March 18, 2026" },
-    { date: "2026-03-18", page: "senators-team-total-under-3-5-at-capitals-nhl.html", title: "Senators Team Total Under 3.5 Goals at Capitals NHL Pick" },
-    { date: "2026-03-18", page: "stars-vs-avalanche-nhl-analysis-stats-preview.html", title: "Dallas Stars vs Colorado Avalanche NHL Analysis Stats Preview March 18 2026" },
-    { date: "2026-03-17", page: "bruins-canadiens-rivalry-sabres-surge-wild-streak-nhl.html", title: "NHL Analysis - March 17, 2026" },
-    { date: "2026-03-17", page: "panthers-team-total-under-3-5-at-canucks-nhl.html", title: "Panthers Team Total Under 3.5 Goals at Canucks NHL Pick" },
-    { date: "2026-03-16", page: "bruins-devils-playoff-push-avs-best-in-hockey-nhl.html", title: "NHL Analysis - March 16, 2026" },
-    { date: "2026-03-16", page: "penguins-avalanche-over-6-5-nhl.html", title: "Penguins vs Avalanche Over 6.5 Goals NHL Pick" },
-    { date: "2026-03-15", page: "sharks-moneyline-puck-line-value-at-canadiens-nhl.html", title: "Sharks Moneyline Puck Line Pick at Canadiens March 15 2026" },
-    { date: "2026-03-15", page: "wild-host-maple-leafs-panthers-visit-kraken-nhl.html", title: "NHL Game Previews Analysis Sunday March 15 2026" },
-    { date: "2026-03-14", page: "avalanche-jets-bruins-capitals-14-game-saturday-nhl.html", title: "NHL Game Previews Analysis Saturday March 14 2026" },
-    { date: "2026-03-14", page: "rangers-hot-streak-moneyline-puck-line-value-at-wild-nhl.html", title: "Rangers Moneyline Puck Line Pick at Wild March 14 2026" },
-    { date: "2026-03-13", page: "mcdavid-oilers-visit-blues-kings-islanders-nhl.html", title: "NHL Game Previews Analysis Friday March 13 2026" },
-    { date: "2026-03-12", page: "oilers-stars-western-showdown-sabres-lead-atlantic-nhl.html", title: "NHL Analysis - March 12, 2026" },
-    { date: "2026-03-11", page: "battle-of-ontario-capitals-flyers-metro-showdown-nhl.html", title: "NHL Analysis - March 11, 2026" },
-    { date: "2026-03-10", page: "mcdavid-mackinnon-showdown-leafs-canadiens-rivalry-nhl.html", title: "NHL March 10 2026: McDavid vs MacKinnon, TOR-MTL" },
-    { date: "2026-03-09", page: "blue-jackets-surge-rangers-flyers-rivalry-nhl.html", title: "NHL Game Previews Analysis Monday March 9 2026" },
-    { date: "2026-03-08", page: "lightning-sabres-tied-at-82-avalanche-dominant-run-nhl.html", title: "NHL Game Previews Analysis Sunday March 8 2026" },
-    { date: "2026-03-07", page: "capitals-bruins-rangers-devils-abc-doubleheader-nhl.html", title: "NHL Game Previews Analysis Saturday March 7 2026" },
-    { date: "2026-03-07", page: "kings-team-total-under-nhl-pick.html", title: "Kings vs Canadiens Team Total Under 3.5 NHL Free Pick March 7 2026" },
-    { date: "2026-03-06", page: "avalanche-vs-stars-nhl-analysis-stats-preview.html", title: "Avalanche at Stars NHL Analysis Stats Preview March 6 2026" },
-    { date: "2026-03-06", page: "nhl-trade-deadline-day-avalanche-stars-showdown.html", title: "NHL Game Previews Analysis Friday March 6 2026" },
-    { date: "2026-03-05", page: "maple-leafs-rangers-original-six-rivalry-nhl.html", title: "NHL Game Previews Analysis Thursday March 5 2026" },
-    { date: "2026-03-04", page: "hurricanes-canucks-cross-conference-showdown-nhl.html", title: "NHL Game Previews Analysis Wednesday March 4 2026" },
-    { date: "2026-03-03", page: "lightning-vs-wild-nhl-analysis-stats-preview.html", title: "Lightning at Wild NHL Analysis Stats Preview March 3 2026" },
-    { date: "2026-03-03", page: "panthers-devils-defending-champs-visit-jersey-nhl.html", title: "NHL Game Previews Analysis Tuesday March 3 2026" },
-    { date: "2026-03-02", page: "stars-canucks-pacific-division-nhl.html", title: "NHL Game Previews Analysis Monday March 2 2026" },
-    { date: "2026-03-01", page: "golden-knights-penguins-cross-conference-nhl.html", title: "NHL Game Previews Analysis Sunday March 1 2026" },
-    { date: "2026-02-27", page: "golden-knights-marner-visits-capitals-nhl.html", title: "NHL Game Previews Analysis Friday February 27 2026" },
-    { date: "2026-02-26", page: "wild-avalanche-central-division-battle-nhl.html", title: "NHL Game Previews Analysis Thursday February 26 2026" },
-    { date: "2026-02-25", page: "maple-leafs-lightning-atlantic-division-nhl.html", title: "NHL Game Previews Analysis Wednesday February 25 2026" },
-    { date: "2026-02-25", page: "maple-leafs-vs-lightning-nhl-analysis-stats-preview.html", title: "Maple Leafs vs Lightning Analysis Preview Feb 25 2026" },
-    { date: "2026-02-05", page: "nhl-predictions-best-bets-tonight.html", title: "NHL Analysis - February 5, 2026" },
-    { date: "2026-02-04", page: "nhl-predictions-best-bets-tonight-v2.html", title: "NHL Analysis - February 4, 2026" },
-    { date: "2026-02-03", page: "nhl-predictions-best-bets-tonight-v3.html", title: "NHL Analysis - February 3, 2026" },
-    { date: "2026-02-02", page: "nhl-predictions-best-bets-tonight-v4.html", title: "NHL Analysis - February 2, 2026" },
-    { date: "2026-02-01", page: "nhl-predictions-best-bets-tonight-v5.html", title: "NHL Analysis - February 1, 2026" },
-    { date: "2026-01-30", page: "nhl-predictions-best-bets-tonight-v6.html", title: "NHL Analysis - January 30, 2026" },
-    { date: "2026-01-29", page: "nhl-predictions-best-bets-tonight-v7.html", title: "NHL Analysis - January 29, 2026" },
-    { date: "2026-01-28", page: "nhl-predictions-best-bets-tonight-v8.html", title: "NHL Analysis - January 28, 2026" },
-    { date: "2026-01-27", page: "nhl-predictions-best-bets-tonight-v9.html", title: "NHL Analysis - January 27, 2026" },
-    { date: "2026-01-26", page: "nhl-predictions-best-bets-tonight-v10.html", title: "NHL Analysis - January 26, 2026" },
-    { date: "2026-01-25", page: "nhl-predictions-best-bets-tonight-v11.html", title: "NHL Analysis - January 25, 2026" },
-    { date: "2026-01-24", page: "nhl-predictions-best-bets-tonight-v12.html", title: "NHL Analysis - January 24, 2026" },
-    { date: "2026-01-23", page: "nhl-predictions-best-bets-tonight-v13.html", title: "NHL Analysis - January 23, 2026" },
-    { date: "2026-01-22", page: "nhl-predictions-best-bets-tonight-v14.html", title: "NHL Analysis - January 22, 2026" },
-    { date: "2026-01-21", page: "nhl-predictions-best-bets-tonight-v15.html", title: "NHL Analysis - January 21, 2026" },
-    { date: "2026-01-20", page: "nhl-predictions-best-bets-tonight-v16.html", title: "NHL Analysis - January 20, 2026" },
-    { date: "2026-01-19", page: "nhl-predictions-best-bets-tonight-v17.html", title: "NHL Analysis - January 19, 2026" },
-    { date: "2026-01-18", page: "nhl-predictions-best-bets-tonight-january-18-2026-part-2.html", title: "NHL Analysis - January 18, 2026 Part 2" },
-    { date: "2026-01-18", page: "nhl-predictions-best-bets-tonight-v18.html", title: "NHL Analysis - January 18, 2026" },
-    { date: "2026-01-17", page: "nhl-predictions-best-bets-tonight-january-17-2026-part-2.html", title: "NHL Analysis - January 17, 2026 Part 2" },
-    { date: "2026-01-17", page: "nhl-predictions-best-bets-tonight-v19.html", title: "NHL Analysis - January 17, 2026" },
-    { date: "2026-01-16", page: "nhl-predictions-best-bets-tonight-v20.html", title: "NHL Analysis - January 16, 2026" },
-    { date: "2026-01-15", page: "nhl-predictions-best-bets-tonight-v21.html", title: "NHL Analysis - January 15, 2026" },
-    { date: "2026-01-14", page: "nhl-predictions-best-bets-tonight-v22.html", title: "NHL Analysis - January 14, 2026" },
-    { date: "2026-01-13", page: "nhl-predictions-best-bets-tonight-v23.html", title: "NHL Analysis - January 13, 2026" },
-    { date: "2026-01-12", page: "nhl-predictions-best-bets-tonight-v24.html", title: "NHL Analysis - January 12, 2026" },
-    { date: "2026-01-11", page: "nhl-predictions-best-bets-tonight-january-11-2026-part-2.html", title: "NHL Analysis - January 11, 2026 Part 2" },
-    { date: "2026-01-11", page: "nhl-predictions-best-bets-tonight-v25.html", title: "NHL Analysis - January 11, 2026" },
-    { date: "2026-01-10", page: "nhl-predictions-best-bets-tonight-v26.html", title: "NHL Analysis - January 10, 2026" },
-    { date: "2026-01-09", page: "nhl-predictions-best-bets-tonight-v27.html", title: "NHL Analysis - January 09, 2026" },
-    { date: "2026-01-08", page: "nhl-predictions-best-bets-tonight-v28.html", title: "NHL Analysis - January 08, 2026" },
-    { date: "2026-01-07", page: "nhl-predictions-best-bets-tonight-v29.html", title: "NHL Analysis - January 07, 2026" },
-    { date: "2026-01-07", page: "stars-vs-capitals-nhl-picks-and-prediction.html", title: "Stars vs Capitals NHL Picks & Prediction - January 7, 2026" },
-    { date: "2026-01-06", page: "nhl-predictions-best-bets-tonight-v30.html", title: "NHL Analysis - January 06, 2026" },
-    { date: "2026-01-05", page: "nhl-predictions-best-bets-tonight-v31.html", title: "NHL Analysis - January 05, 2026" },
-    { date: "2026-01-04", page: "nhl-predictions-best-bets-tonight-v32.html", title: "NHL Analysis - January 04, 2026" },
-    { date: "2026-01-03", page: "nhl-predictions-best-bets-tonight-january-03-2026-part-2.html", title: "NHL Analysis - January 03, 2026 Part 2" },
-    { date: "2026-01-03", page: "nhl-predictions-best-bets-tonight-v33.html", title: "NHL Analysis - January 3, 2026" },
-    { date: "2026-01-02", page: "archives/nhl/2026-01-02.html", title: "NHL Archive - 2026-01-02" },
-    { date: "2026-01-01", page: "nhl-predictions-best-bets-tonight-january-01-2026-part-2.html", title: "NHL Analysis - January 01, 2026 Part 2" },
-    { date: "2026-01-01", page: "nhl-predictions-best-bets-tonight-january-01-2026-part-3.html", title: "NHL Analysis - January 01, 2026 Part 3" },
-    { date: "2026-01-01", page: "nhl-predictions-best-bets-tonight-v34.html", title: "NHL Analysis - January 1, 2026" },
-    { date: "2025-12-31", page: "nhl-predictions-best-bets-tonight-december-31-2025-part-2.html", title: "NHL Analysis - December 31, 2025 Part 2" },
-    { date: "2025-12-31", page: "nhl-predictions-best-bets-tonight-v35.html", title: "NHL Analysis - December 31, 2025" },
-    { date: "2025-12-29", page: "nhl-predictions-best-bets-tonight-v36.html", title: "NHL Analysis - December 29, 2025" },
-    { date: "2025-12-28", page: "nhl-predictions-best-bets-tonight-december-28-2025-part-2.html", title: "NHL Analysis - December 28, 2025 Part 2" },
-    { date: "2025-12-28", page: "nhl-predictions-best-bets-tonight-v37.html", title: "NHL Analysis - December 28, 2025" },
-    { date: "2025-12-27", page: "nhl-predictions-best-bets-tonight-december-27-2025-part-2.html", title: "NHL Analysis - December 27, 2025 Part 2" },
-    { date: "2025-12-27", page: "nhl-predictions-best-bets-tonight-v38.html", title: "NHL Analysis - December 27, 2025" },
-    { date: "2025-12-23", page: "nhl-predictions-best-bets-tonight-december-23-2025-part-2.html", title: "NHL Analysis - December 23, 2025 Part 2" },
-    { date: "2025-12-23", page: "nhl-predictions-best-bets-tonight-v39.html", title: "NHL Analysis - December 23, 2025" },
-    { date: "2025-12-22", page: "nhl-predictions-best-bets-tonight-v40.html", title: "NHL Analysis - December 22, 2025" },
-    { date: "2025-12-21", page: "nhl-predictions-best-bets-tonight-v41.html", title: "NHL Analysis - December 21, 2025" },
-    { date: "2025-12-20", page: "nhl-predictions-best-bets-tonight-december-20-2025-part-2.html", title: "NHL Analysis - December 20, 2025 Part 2" },
-    { date: "2025-12-20", page: "nhl-predictions-best-bets-tonight-december-20-2025-part-3.html", title: "NHL Analysis - December 20, 2025 Part 3" },
-    { date: "2025-12-20", page: "nhl-predictions-best-bets-tonight-v42.html", title: "NHL Analysis - December 20, 2025" },
-    { date: "2025-12-19", page: "nhl-dec19.html", title: "NHL Results - December 19, 2025" },
-    { date: "2025-12-19", page: "nhl-predictions-best-bets-tonight-december-19-2025-part-2.html", title: "NHL Analysis - December 19, 2025 Part 2" },
-    { date: "2025-12-19", page: "nhl-predictions-best-bets-tonight-v43.html", title: "NHL Analysis - December 19, 2025" },
-    { date: "2025-12-18", page: "nhl-predictions-best-bets-tonight-december-18-2025-part-2.html", title: "NHL December 18, 2025 - 8-Game Slate Part 2" },
-    { date: "2025-12-18", page: "nhl-predictions-best-bets-tonight-december-18-2025-part-3.html", title: "NHL Analysis - December 18, 2025 Part 3" },
-    { date: "2025-12-18", page: "nhl-predictions-best-bets-tonight-v44.html", title: "NHL Analysis - December 18, 2025" },
-    { date: "2025-12-17", page: "nhl-predictions-best-bets-tonight-december-17-2025-part-2.html", title: "NHL December 17, 2025 - 4-Game Slate Part 2" },
-    { date: "2025-12-17", page: "nhl-predictions-best-bets-tonight-december-17-2025-part-3.html", title: "NHL Analysis - December 17, 2025 Part 3" },
-    { date: "2025-12-17", page: "nhl-predictions-best-bets-tonight-v45.html", title: "NHL Analysis - December 17, 2025" },
-    { date: "2025-12-16", page: "nhl-predictions-best-bets-tonight-v46.html", title: "NHL Analysis - December 16, 2025" },
-    { date: "2025-12-15", page: "nhl-predictions-best-bets-tonight-v47.html", title: "NHL Analysis - December 15, 2025" },
-    { date: "2025-12-13", page: "nhl-predictions-best-bets-tonight-v48.html", title: "NHL December 13, 2025" },
-    { date: "2025-12-12", page: "nhl-predictions-best-bets-tonight-v49.html", title: "NHL December 12, 2025" },
-    { date: "2025-12-11", page: "nhl-predictions-best-bets-tonight-v50.html", title: "NHL December 11, 2025" },
-    { date: "2025-12-10", page: "nhl-predictions-best-bets-tonight-v51.html", title: "NHL December 10, 2025" },
-    { date: "2025-12-09", page: "nhl-predictions-best-bets-tonight-v52.html", title: "NHL Analysis - December 09, 2025" },
-    { date: "2025-12-01", page: "archives/nhl/2025-12-01.html", title: "NHL Archive - 2025-12-01" },
-    { date: "2025-11-30", page: "archives/nhl/2025-11-30.html", title: "NHL Archive - 2025-11-30" },
-    { date: "2025-11-29", page: "archives/nhl/2025-11-29.html", title: "NHL Archive - 2025-11-29" },
-    { date: "2025-11-24", page: "nhl-predictions-best-bets-tonight-v53.html", title: "NHL November 24, 2025 - 7-Game Slate" },
-];
-
-const dateMap = {};
-ARCHIVE_DATA.forEach(item => { if (!dateMap[item.date]) dateMap[item.date] = item; });
-
-const pageToDateMap = {};
-ARCHIVE_DATA.forEach(item => { pageToDateMap[item.page] = item.date; });
-
-const SPORT_HUB_PAGE = 'nhl-previews.html';
-const SPORT_LABEL = 'NHL';
-const MAIN_PAGES = ['nba.html', 'nhl.html', 'ncaab.html', 'ncaaf.html', 'nfl.html', 'mlb.html', 'soccer.html', 'nba-previews.html', 'nhl-previews.html', 'mlb-previews.html', 'soccer-previews.html', 'college-basketball-previews.html'];
-function isConcreteContentPage(page) {
-    // Pick pages use their own template (no archive calendar sidebar); a stale
-    // hub must never redirect to one as the day's board (soccer hub, June 3 2026).
-    // Featured-game (*-analysis-stats-preview) pages load featured-games-calendar.js
-    // (the all-sports marquee calendar) and have their own Featured hub; a SPORT hub
-    // must never redirect to one, or it swaps in the featured calendar and drops
-    // sport-only dates (MLB June 4 went blank when the MLB hub redirected there, June 22 2026).
-    // The combined season 'picks-predictions-analysis-<month>-<year>' pages are blog/Pick
-    // Archive indexes, not a day's preview; a hub must not redirect to one (NCAAB July 7 2026).
-    return !!page && !MAIN_PAGES.includes(page) && !page.includes('#') && !page.includes('-archive-') && !/-analysis-stats-preview\.html$/.test(page) && !/-picks?(?:-v\d+)?\.html$/.test(page) && !/picks-predictions-analysis-[a-z]+-\d{4}\.html$/.test(page);
-}
-const latestContentEntry = ARCHIVE_DATA.find(item => item.page && item.page !== SPORT_HUB_PAGE);
-const latestConcreteEntry = ARCHIVE_DATA.find(item => isConcreteContentPage(item.page));
-window.LATEST_CONTENT_PAGE = latestConcreteEntry ? latestConcreteEntry.page : (latestContentEntry ? latestContentEntry.page : null);
-
-function getLocalDateString(date) {
-    const parts = new Intl.DateTimeFormat('en-US', {
-        timeZone: 'America/Los_Angeles',
-        year: 'numeric',
-        month: '2-digit',
-        day: '2-digit'
-    }).formatToParts(date).reduce((acc, part) => {
-        acc[part.type] = part.value;
-        return acc;
-    }, {});
-    return parts.year + '-' + parts.month + '-' + parts.day;
-}
-
-// Current real date is separate from the active article/page date.
-const todayStr = getLocalDateString(new Date());
-
-const todayMonth = todayStr.substring(0, 7);
-const latestAvailableDate = latestConcreteEntry ? latestConcreteEntry.date : (ARCHIVE_DATA.length > 0 ? ARCHIVE_DATA[0].date : todayStr);
-const todayHasData = ARCHIVE_DATA.some(item => item.date === todayStr && isConcreteContentPage(item.page));
-
-// Handle both root pages and archive pages
-const pathname = window.location.pathname;
-let currentPage;
-if (pathname.includes('/archives/')) {
-    // For archive pages, get the full relative path from archives/
-    currentPage = pathname.replace(/^\//, '');
-} else {
-    // For root pages, just get the filename
-    currentPage = pathname.split('/').pop() || 'index.html';
-}
-
-const isMainPage = MAIN_PAGES.includes(currentPage);
-const forcedDate = window.FORCED_PAGE_DATE || null;
-// Hub/main pages never get a current-page "Article" highlight, even if a
-// stale window.FORCED_PAGE_DATE is left in the hub HTML.
-const activeArticleDate = isMainPage ? null : (forcedDate || pageToDateMap[currentPage] || null);
-const currentPageDate = activeArticleDate;
-
-const months = new Set();
-ARCHIVE_DATA.forEach(item => { const [y, m] = item.date.split('-'); months.add(y + '-' + m); });
-// Always include the current month so the hub calendar can point at today.
-months.add(todayMonth);
-
-// Main/hub pages show today's month; archive pages show their month
-const sortedMonths = Array.from(months).sort().reverse();
-const monthNames = ['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September', 'October', 'November', 'December'];
-
-// Dated preview pages should open on the article month; undated hubs open on the current month.
-let displayMonth = activeArticleDate ? activeArticleDate.substring(0, 7) : (isMainPage ? todayMonth : sortedMonths[0]);
-
-function installCalendarStateStyles() {
-    if (document.getElementById('mlb-calendar-state-styles')) return;
-    const style = document.createElement('style');
-    style.id = 'mlb-calendar-state-styles';
-    style.textContent = `
-.calendar-days .cal-day,.calendar-grid .calendar-day{position:relative}
-.calendar-days .cal-day.is-linked,.calendar-days .cal-day.has-content{cursor:pointer;background:rgba(0,229,255,.15);color:#00e5ff;font-weight:700;border:1px solid rgba(0,229,255,.32)}
-.calendar-days .cal-day.is-linked:hover,.calendar-days .cal-day.has-content:hover{background:rgba(0,229,255,.25);box-shadow:0 0 12px rgba(0,229,255,.28)}
-.calendar-days .cal-day.is-disabled{opacity:.82}
-.calendar-days .cal-day.is-past:not(.current-page):not(.today){color:#9aa3af}
-.calendar-days .cal-day.is-future:not(.current-page):not(.today){color:#c7ced8}
-.calendar-days .cal-day.today{border:2px solid #ffd54f!important;box-shadow:0 0 0 1px rgba(255,213,79,.34),0 0 12px rgba(255,213,79,.28)!important}
-.calendar-days .cal-day.current-page{background:rgba(0,229,255,.72)!important;color:#fff!important;border:2px solid #00e5ff!important;font-weight:900!important;box-shadow:0 0 12px rgba(0,229,255,.45)!important}
-.calendar-days .cal-day.today.current-page{background:linear-gradient(135deg,rgba(0,229,255,.72),rgba(255,213,79,.42))!important;border-color:#ffd54f!important}
-`;
-    document.head.appendChild(style);
-}
-
-function navigateToCalendarPage(page) {
-    if (page) window.location.href = '/' + page;
-}
-
-// Multi-post dates go straight to that day's main slate/preview page (no chooser popup).
-// Falls back to the first/newest post if no slate-style page is found.
-function pickPrimaryPostForDate(postsForDate) {
-    const slate = postsForDate.find(item => {
-        const t = (item.title || '').toLowerCase();
-        const p = (item.page || '').toLowerCase();
-        return /\banalysis\b|\bpreview\b|\bslate\b|\bboard\b|\bfull card\b/.test(t)
-            || /-game-|-slate-|-board-|-previews|full-card/.test(p);
-    });
-    return slate || postsForDate[0];
-}
-
-// Popup chooser fully removed (Nima): clicking a date opens the page directly.
-
-function renderCalendar(yearMonth) {
-    const [year, month] = yearMonth.split('-').map(Number);
-    const yearEl = document.getElementById('cal-year') || document.querySelector('.year-display');
-    if (yearEl) yearEl.textContent = year;
-    const firstDay = new Date(year, month - 1, 1).getDay();
-    const daysInMonth = new Date(year, month, 0).getDate();
-    const container = document.getElementById('calendar-days') || document.getElementById('calendarDays');
-    if (!container) return;
-    container.innerHTML = '';
-    for (let i = 0; i < firstDay; i++) { const cell = document.createElement('div'); cell.className = 'cal-day empty'; container.appendChild(cell); }
-    for (let d = 1; d <= daysInMonth; d++) {
-        const dateStr = year + '-' + String(month).padStart(2, '0') + '-' + String(d).padStart(2, '0');
-        const postsForDate = ARCHIVE_DATA.filter(item => item.date === dateStr && item.page);
-        const hasData = postsForDate.length > 0 ? postsForDate[0] : null;
-        let classes = 'cal-day';
-        if (dateStr === currentPageDate) classes += ' current-page';
-        // NO 'today' marker (Nima, June 24 2026): the calendar highlights ONLY the
-        // date of the article being viewed (current-page). A separate gold 'today'
-        // cell was a wrong second highlight - on out-of-season sports (NHL/NBA) it lit
-        // a day with no article, and it fought the article's own date. Removed for good.
-        if (hasData) classes += ' has-content is-linked';
-        else classes += ' is-disabled';
-        if (dateStr < todayStr) classes += ' is-past';
-        if (dateStr > todayStr) classes += ' is-future';
-        const cell = document.createElement('div');
-        cell.className = classes;
-        if (!cell.dataset) cell.dataset = {};
-        cell.dataset.date = dateStr;
-        cell.dataset.currentDate = todayStr;
-        if (dateStr === currentPageDate) cell.dataset.activeArticleDate = currentPageDate;
-        if (hasData) cell.dataset.linked = 'true';
-        cell.textContent = d;
-        if (hasData) {
-            cell.title = postsForDate.map(item => item.title).join('\n');
-            cell.onclick = () => {
-                if (postsForDate.length === 1) navigateToCalendarPage(hasData.page);
-                else navigateToCalendarPage(pickPrimaryPostForDate(postsForDate).page);
-            };
-        }
-        container.appendChild(cell);
-    }
-}
-
-// Hub guard: a `*-previews.html` hub page bakes in the last published dated
-// slate/article. When that baked article is out of date (its FORCED_PAGE_DATE
-// is not today), it must not be presented as the current board. If a current/
-// upcoming concrete preview exists we redirect to it. Otherwise the baked
-// board STAYS VISIBLE (STALE_GUARD_BANNER_20260606, Nima June 6 2026: a
-// near-empty hub is worse for visitors and Googlebot than a clearly-dated
-// older board) and is labeled with its real date plus a link to the latest
-// available preview. It is never presented as today\u2019s board. No fabricated data.
-function renderPreviewHub() {
-    if (currentPage !== SPORT_HUB_PAGE || !SPORT_HUB_PAGE) return;
-    const baked = window.FORCED_PAGE_DATE || null;
-    // ALWAYS-LATEST HUB (Nima, July 7 2026): the nav "<Sport> Preview" link must land
-    // on the most recent published preview for that sport - NEVER a stale/offseason
-    // archive landing screen. Leave the hub as-is ONLY when today actually has a fresh
-    // concrete board (in-season daily slate baked in). Otherwise - offseason, a hand-
-    // built archive page with no FORCED_PAGE_DATE, or an in-season gap/off-day - fall
-    // through and redirect to the newest published concrete preview below. Keyed on real
-    // content presence (todayHasData), not on whether a baked date happens to exist, so
-    // a dead offseason archive page (e.g. college-basketball-previews.html in July) can
-    // never be the primary click target while published previews exist.
-    if (todayHasData) return;
-    // UNIFIED STALE-HUB POLICY (Nima, June 1 2026): redirect to the newest
-    // valid concrete preview so stale baked content can never stand in as
-    // today\u2019s board. Strip the stale articles first (belt-and-suspenders
-    // with the pre-paint head guard). Clean empty-state below is the fallback
-    // when no concrete entry exists. Same policy as the Featured Game hub.
-    // FALLBACK-TO-LATEST (Nima, June 16 2026): redirect to the newest published
-    // preview for this sport whenever today has none. Prefer a current/upcoming
-    // preview; otherwise load the most recent past one rather than showing an
-    // empty/near-empty board. Only a sport with zero concrete entries falls
-    // through to the labeled state below. Flag past-dated loads so the target
-    // can show a subtle "latest available" note.
-    const _latest = latestConcreteEntry || latestContentEntry || null;
-    if (_latest && _latest.page && _latest.page !== currentPage && _latest.page !== SPORT_HUB_PAGE) {
-        const _m = document.querySelector('.main-content');
-        if (_m) _m.querySelectorAll('.game-preview').forEach(function(el){ el.remove(); });
-        if (_latest.date < todayStr) { try { sessionStorage.setItem('bl_showing_latest', '1'); } catch (e) {} }
-        window.location.replace('/' + _latest.page);
-        return;
-    }
-    const main = document.querySelector('.main-content');
-    if (!main) return;
-
-    const hero = document.querySelector('header.hero');
-    if (hero) {
-        const badge = hero.querySelector('.hero-badge');
-        const h1 = hero.querySelector('h1');
-        const p = hero.querySelector('p');
-        if (badge) badge.textContent = SPORT_LABEL + ' Previews';
-        if (h1) h1.textContent = SPORT_LABEL + ' Game Preview Archive';
-        if (p) p.textContent = 'Browse the latest ' + SPORT_LABEL + ' previews and the full dated archive below. This page does not present older previews as today\u2019s board.';
-    }
-
-    // STALE_GUARD_BANNER_20260606: keep the baked articles visible - only label them.
-    const latest = latestConcreteEntry || latestContentEntry || null;
-    const block = document.createElement('div');
-    block.id = 'hub-state';
-    let html = '';
-    if (baked && !document.getElementById('board-date-note')) {
-        const bakedLabel = new Date(baked + 'T12:00:00').toLocaleDateString('en-US', { weekday: 'long', month: 'long', day: 'numeric', year: 'numeric' });
-        html += '<div style="text-align:center;padding:20px 24px;background:linear-gradient(145deg,#14171f,#0f1218);border:1px solid rgba(255,213,79,0.3);border-radius:12px;margin-bottom:24px;">'
-              + '<p style="font-size:12px;font-weight:700;letter-spacing:2px;text-transform:uppercase;color:#ffd54f;margin-bottom:8px;">Board From</p>'
-              + '<p style="font-size:18px;color:#fff;margin:0;">' + bakedLabel + '</p>'
-              + '</div>';
-    }
-    if (latest && latest.page !== SPORT_HUB_PAGE) {
-        const d = new Date(latest.date + 'T12:00:00').toLocaleDateString('en-US', { weekday: 'long', month: 'long', day: 'numeric', year: 'numeric' });
-        html += '<a href="/' + latest.page + '" style="display:block;text-decoration:none;background:linear-gradient(145deg,#14171f,#0f1218);border:1px solid rgba(255,213,79,0.3);border-radius:12px;padding:28px 32px;">'
-              + '<p style="font-size:12px;font-weight:700;letter-spacing:2px;text-transform:uppercase;color:#fd5000;margin-bottom:10px;">Latest ' + SPORT_LABEL + ' Preview</p>'
-              + '<p style="font-family:Orbitron,sans-serif;font-size:22px;color:#fff;margin:0 0 8px;line-height:1.25;">' + latest.title + '</p>'
-              + '<p style="color:#b0b8c4;font-size:14px;margin:0;">' + d + ' &nbsp;&rarr;</p>'
-              + '</a>';
-    }
-    block.innerHTML = html;
-    const mobile = main.querySelector('.mobile-archive');
-    if (mobile && mobile.nextSibling) main.insertBefore(block, mobile.nextSibling);
-    else if (mobile) main.appendChild(block);
-    else main.insertBefore(block, main.firstChild);
-}
-
-function initSportCalendar() {
-
-    installCalendarStateStyles();
-    renderPreviewHub();
-
-    const monthSelect = document.getElementById('month-select') || document.getElementById('monthSelect');
-    if (monthSelect) {
-        monthSelect.innerHTML = '';
-        sortedMonths.forEach(m => {
-            const [year, month] = m.split('-');
-            const opt = document.createElement('option');
-            opt.value = m;
-            opt.textContent = monthNames[parseInt(month) - 1] + ' ' + year;
-            if (m === displayMonth) opt.selected = true;
-            monthSelect.appendChild(opt);
-        });
-        monthSelect.addEventListener('change', function() { renderCalendar(this.value); });
-    }
-    renderCalendar(displayMonth);
-    const mobileSelect = document.getElementById('mobile-archive-select') || document.getElementById('mobileArchiveSelect');
-    if (mobileSelect) {
-        mobileSelect.innerHTML = '<option value="">Select a date...</option>';
-        ARCHIVE_DATA.forEach(item => {
-            const opt = document.createElement('option');
-            opt.value = item.page;
-            const dateObj = new Date(item.date + 'T12:00:00');
-            const dateLabel = dateObj.toLocaleDateString('en-US', { weekday: 'short', month: 'short', day: 'numeric' });
-            opt.textContent = dateLabel + ' - ' + item.title;
-            if (item.page === currentPage) opt.selected = true;
-            mobileSelect.appendChild(opt);
-        });
-        mobileSelect.addEventListener('change', (e) => { if (e.target.value) window.location.href = '/' + e.target.value; });
-    }
-}
-
-if (document.readyState === 'loading') { document.addEventListener('DOMContentLoaded', initSportCalendar); } else { initSportCalendar(); }
-
-/* SHOWING-LATEST NOTE (Nima, June 16 2026): when a hub fell back to the most
-   recent published item (no entry for today), show a subtle one-line note on the
-   destination article. Flag is set by the hub before redirect; cleared after use. */
-(function showLatestAvailableNote() {
-    function run() {
-        var flag;
-        try { flag = sessionStorage.getItem('bl_showing_latest'); } catch (e) { return; }
-        if (!flag) return;
-        try { sessionStorage.removeItem('bl_showing_latest'); } catch (e) {}
-        if (document.getElementById('bl-latest-note')) return;
-        var host = document.querySelector('.main-content') || document.querySelector('.page-wrapper') || document.body;
-        if (!host) return;
-        var note = document.createElement('div');
-        note.id = 'bl-latest-note';
-        note.setAttribute('style', 'max-width:900px;margin:90px auto 0;padding:10px 16px;border:1px solid rgba(0,229,255,0.3);border-radius:10px;background:rgba(0,229,255,0.06);color:#9fe9f5;font-size:13px;line-height:1.5;text-align:center;font-family:Inter,system-ui,sans-serif;');
-        note.textContent = 'Showing the latest available preview. No new post has been published for today yet.';
-        host.insertBefore(note, host.firstChild);
-    }
-    if (document.readyState === 'loading') { document.addEventListener('DOMContentLoaded', run); } else { run(); }
+// Entries: data/calendar/nhl/<YYYY-MM>.json; engine: scripts/calendar-runtime.js
+
+window.BL_SPORT_CALENDAR = {"sport": "nhl", "hubPage": "nhl-previews.html", "label": "NHL", "mainPages": ["nba.html", "nhl.html", "ncaab.html", "ncaaf.html", "nfl.html", "mlb.html", "soccer.html", "nba-previews.html", "nhl-previews.html", "mlb-previews.html", "soccer-previews.html", "college-basketball-previews.html"], "dataBase": "/data/calendar/nhl/", "latestContent": {"date": "2026-06-14", "page": "hurricanes-golden-knights-cup-final-game-6-vegas-closeout-nhl.html", "title": "NHL Stanley Cup Final Game 6 Analysis - June 14, 2026"}, "latestConcrete": {"date": "2026-06-14", "page": "hurricanes-golden-knights-cup-final-game-6-vegas-closeout-nhl.html", "title": "NHL Stanley Cup Final Game 6 Analysis - June 14, 2026"}, "months": {"2025-11": {"n": 3, "v": "b1520733a0"}, "2025-12": {"n": 31, "v": "df14c0b55e"}, "2026-01": {"n": 37, "v": "578c04500f"}, "2026-02": {"n": 9, "v": "2ad73e72dc"}, "2026-03": {"n": 42, "v": "72cbbf6216"}, "2026-04": {"n": 45, "v": "4ce54cfa80"}, "2026-05": {"n": 38, "v": "17f2cf5a33"}, "2026-06": {"n": 10, "v": "0ac46100e3"}}, "pages": {"0": "a5c3597f5f", "1": "9cc7016778", "2": "9d5fd778bd", "3": "7a10c73bc7", "4": "78fe4264df", "5": "90a40e6f31", "6": "c52ac0bca3", "7": "335167b279", "8": "6bbee77eb7", "9": "0e98c1d376", "10": "a15a74181b", "11": "469ee8d6a0", "12": "4fb42d526a", "13": "f51483b9ad", "14": "a225d55df3", "15": "1289aa58ea"}, "current": {"month": "2026-10", "entries": []}};
+(function loadCalendarRuntime() {
+    var me = document.currentScript && document.currentScript.src;
+    var base = me ? me.slice(0, me.lastIndexOf('/') + 1) : '/scripts/';
+    var s = document.createElement('script');
+    s.src = base + 'calendar-runtime.js?v=c5c93250003';
+    s.async = false;
+    (document.head || document.documentElement).appendChild(s);
 })();
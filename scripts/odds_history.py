@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""
+Append-only odds history, partitioned by sport and month.
+
+Every odds fetcher used to keep only its latest snapshot, so "opening vs
+current" line movement had nothing to be computed from. Fetchers now hand
+their normalized quotes to OddsHistory.record(), and movement queries read
+local SQLite instead of an API.
+
+Layout:
+  data/cache/odds-history/<sport>/<YYYY-MM>.sqlite    (month of the GAME date)
+  data/cache/odds-history/<sport>/<YYYY-MM>.sqlite.gz (archived month)
+
+The store is a cache, not site content: it is gitignored, and CI carries it
+from run to run with actions/cache (daily-handicapping-hub.yml) instead of
+committing binary partitions that conflict in the push retry's rebase.
+
+Storage is change-only: a quote is written when its (event, market,
+selection, book) line or price differs from the last stored value, so a line
+that sits still through 30 fetches costs one row, not 30. Rows are never
+updated in place.
+
+Indexed queries (idx_quote_key covers event/market/selection/time):
+  line_summary(event_id, market)   -> open / current / min / max per selection
+  movement(event_id, market, sel)  -> (open_line, current_line) shortcut
+Both take `book`; without it open and current may come from different books.
+
+Retention (compact()):
+  - partitions older than COMPACT_AFTER_DAYS are collapsed to the open,
+    close, min-line and max-line rows of each quote key, then VACUUMed;
+  - a month whose games are all past that horizon is then gzipped; reads
+    open it in memory, a late write unpacks it again;
+  - partitions older than RETENTION_DAYS are deleted.
+
+CLI:
+  python scripts/odds_history.py --compact
+  python scripts/odds_history.py --summary baseball_mlb <event_id> [market]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import os
+import shutil
+import sqlite3
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HISTORY_DIR = os.path.join(REPO, 'data', 'cache', 'odds-history')
+
+COMPACT_AFTER_DAYS = 14
+RETENTION_DAYS = 400
+# How many monthly partitions back a query searches when no date is given.
+DEFAULT_LOOKBACK_MONTHS = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS quotes (
+    event_id    TEXT NOT NULL,
+    game_date   TEXT NOT NULL,
+    market      TEXT NOT NULL,
+    selection   TEXT NOT NULL,
+    book        TEXT NOT NULL,
+    line        REAL,
+    price       INTEGER,
+    captured_at INTEGER NOT NULL,
+    source      TEXT NOT NULL,
+    away        TEXT,
+    home        TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_quote_key ON quotes (event_id, market, selection, book, captured_at);
+CREATE INDEX IF NOT EXISTS idx_quote_date ON quotes (game_date);
+CREATE TABLE IF NOT EXISTS fetches (
+    captured_at INTEGER NOT NULL,
+    source      TEXT NOT NULL,
+    quotes_seen INTEGER NOT NULL,
+    quotes_written INTEGER NOT NULL
+);
+"""
+
+QUOTE_FIELDS = ('event_id', 'game_date', 'market', 'selection', 'book', 'line', 'price', 'away', 'home')
+
+
+def _game_date(value: str) -> str:
+    """YYYY-MM-DD from an ISO timestamp or date string; today (UTC) if missing."""
+    if value:
+        return str(value)[:10]
+    return datetime.now(timezone.utc).date().isoformat()
+
+
+def _month(game_date: str) -> str:
+    return game_date[:7]
+
+
+def _next_month(month: str) -> str:
+    """First day (YYYY-MM-DD) of the month after YYYY-MM."""
+    year, mon = int(month[:4]), int(month[5:7])
+    return f'{year + mon // 12:04d}-{mon % 12 + 1:02d}-01'
+
+
+class OddsHistory:
+    """Odds history for one sport (partition directory per sport)."""
+
+    def __init__(self, sport: str, root: str = HISTORY_DIR):
+        self.sport = sport
+        self.dir = os.path.join(root, sport)
+        self._conns: Dict[str, sqlite3.Connection] = {}
+        self._in_memory: set = set()    # archived months opened read-only
+
+    def _path(self, month: str) -> str:
+        return os.path.join(self.dir, f'{month}.sqlite')
+
+    def _connect(self, month: str, create: bool = True) -> Optional[sqlite3.Connection]:
+        """A month's partition. With create=False a missing month is None and an
+        archived one is read into memory; with create=True an archived month is
+        unpacked back to a plain file first."""
+        conn = self._conns.get(month)
+        if conn is not None and not (create and month in self._in_memory):
+            return conn
+        self._release(month)
+        path = self._path(month)
+        if not os.path.exists(path) and os.path.exists(path + '.gz'):
+            with gzip.open(path + '.gz', 'rb') as f:
+                data = f.read()
+            if not create:
+                conn = sqlite3.connect(':memory:')
+                conn.deserialize(data)
+                conn.row_factory = sqlite3.Row
+                self._conns[month] = conn
+                self._in_memory.add(month)
+                return conn
+            with open(path + '.tmp', 'wb') as f:
+                f.write(data)
+            os.replace(path + '.tmp', path)
+            os.remove(path + '.gz')
+        if not create and not os.path.exists(path):
+            return None
+        os.makedirs(self.dir, exist_ok=True)
+        conn = sqlite3.connect(path)
+        conn.row_factory = sqlite3.Row
+        conn.executescript(SCHEMA)
+        self._conns[month] = conn
+        return conn
+
+    def _release(self, month: str) -> None:
+        conn = self._conns.pop(month, None)
+        self._in_memory.discard(month)
+        if conn is not None:
+            conn.close()
+
+    def close(self) -> None:
+        for month in list(self._conns):
+            self._release(month)
+
+    def __enter__(self) -> 'OddsHistory':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def partitions(self) -> List[str]:
+        if not os.path.isdir(self.dir):
+            return []
+        return sorted({name.split('.', 1)[0] for name in os.listdir(self.dir)
+                       if name.endswith(('.sqlite', '.sqlite.gz'))})
+
+    # -- writes -------------------------------------------------------------
+
+    def record(self, quotes: Iterable[dict], source: str, captured_at: int = None) -> int:
+        """Append quotes whose line/price changed since the last stored one.
+
+        Each quote needs event_id, market, selection, book, line and/or price;
+        game_date (or commence_time), away and home are optional. Returns the
+        number of rows written.
+        """
+        captured_at = int(captured_at or time.time())
+        by_month: Dict[str, List[dict]] = {}
+        seen = 0
+        for q in quotes:
+            if not q.get('event_id') or (q.get('line') is None and q.get('price') is None):
+                continue
+            seen += 1
+            row = {field: q.get(field) for field in QUOTE_FIELDS}
+            row['game_date'] = _game_date(q.get('game_date') or q.get('commence_time'))
+            row['event_id'] = str(row['event_id'])
+            row['book'] = str(row['book'] or '')
+            row['selection'] = str(row['selection'] or '')
+            by_month.setdefault(_month(row['game_date']), []).append(row)
+
+        written = 0
+        for month, rows in by_month.items():
+            conn = self._connect(month)
+            with conn:
+                for row in rows:
+                    last = conn.execute(
+                        'SELECT line, price FROM quotes WHERE event_id=? AND market=? AND selection=? AND book=? '
+                        'ORDER BY captured_at DESC LIMIT 1',
+                        (row['event_id'], row['market'], row['selection'], row['book']),
+                    ).fetchone()
+                    if last is not None and last['line'] == row['line'] and last['price'] == row['price']:
+                        continue
+                    conn.execute(
+                        'INSERT INTO quotes (event_id, game_date, market, selection, book, line, price, '
+                        'captured_at, source, away, home) VALUES (?,?,?,?,?,?,?,?,?,?,?)',
+                        (row['event_id'], row['game_date'], row['market'], row['selection'], row['book'],
+                         row['line'], row['price'], captured_at, source, row['away'], row['home']),
+                    )
+                    written += 1
+                conn.execute('INSERT INTO fetches VALUES (?,?,?,?)', (captured_at, source, len(rows), written))
+        return written
+
+    # -- reads --------------------------------------------------------------
+
+    def _search_months(self, game_date: str = None) -> List[str]:
+        if game_date:
+            return [_month(game_date)]
+        return self.partitions()[-DEFAULT_LOOKBACK_MONTHS:][::-1]
+
+    def line_summary(self, event_id: str, market: str, game_date: str = None, book: str = None) -> Dict[str, dict]:
+        """{selection: {open, current, min, max, open_price, current_price, updates, first_seen, last_seen}}."""
+        for month in self._search_months(game_date):
+            conn = self._connect(month, create=False)
+            if conn is None:
+                continue
+            params = [str(event_id), market]
+            book_sql = ''
+            if book is not None:
+                book_sql = ' AND book=?'
+                params.append(book)
+            rows = conn.execute(
+                'SELECT selection, line, price, captured_at FROM quotes '
+                'WHERE event_id=? AND market=?' + book_sql + ' ORDER BY captured_at, rowid',
+                params,
+            ).fetchall()
+            if not rows:
+                continue
+            out: Dict[str, dict] = {}
+            for r in rows:
+                s = out.get(r['selection'])
+                if s is None:
+                    s = out[r['selection']] = {
+                        'open': r['line'], 'open_price': r['price'], 'min': r['line'], 'max': r['line'],
+                        'updates': 0, 'first_seen': r['captured_at'],
+                    }
+                s['current'] = r['line']
+                s['current_price'] = r['price']
+                s['last_seen'] = r['captured_at']
+                s['updates'] += 1
+                if r['line'] is not None:
+                    s['min'] = r['line'] if s['min'] is None else min(s['min'], r['line'])
+                    s['max'] = r['line'] if s['max'] is None else max(s['max'], r['line'])
+            return out
+        return {}
+
+    def movement(self, event_id: str, market: str, selection: str, game_date: str = None,
+                 book: str = None) -> Optional[tuple]:
+        summary = self.line_summary(event_id, market, game_date, book).get(selection)
+        if not summary:
+            return None
+        return summary['open'], summary['current']
+
+    # -- retention ----------------------------------------------------------
+
+    def compact(self, now: datetime = None) -> Dict[str, str]:
+        """Apply the retention policy; returns {month: action}."""
+        now = now or datetime.now(timezone.utc)
+        compact_before = (now - timedelta(days=COMPACT_AFTER_DAYS)).date().isoformat()
+        drop_before = (now - timedelta(days=RETENTION_DAYS)).date().isoformat()[:7]
+        actions: Dict[str, str] = {}
+        for month in self.partitions():
+            path = self._path(month)
+            if month < drop_before:
+                self._release(month)
+                for name in (path, path + '.gz'):
+                    if os.path.exists(name):
+                        os.remove(name)
+                actions[month] = 'dropped'
+                continue
+            if not os.path.exists(path):
+                continue    # archived, and compacted before it was
+            conn = self._connect(month)
+            with conn:
+                # Keep open, close, and the extreme lines of each quote key for
+                # games older than the compaction horizon.
+                removed = conn.execute(
+                    """
+                    DELETE FROM quotes WHERE game_date < ? AND rowid NOT IN (
+                        SELECT rowid FROM (
+                            SELECT rowid,
+                                   ROW_NUMBER() OVER (PARTITION BY event_id, market, selection, book ORDER BY captured_at, rowid) AS first_n,
+                                   ROW_NUMBER() OVER (PARTITION BY event_id, market, selection, book ORDER BY captured_at DESC, rowid DESC) AS last_n,
+                                   ROW_NUMBER() OVER (PARTITION BY event_id, market, selection, book ORDER BY line, captured_at) AS min_n,
+                                   ROW_NUMBER() OVER (PARTITION BY event_id, market, selection, book ORDER BY line DESC, captured_at) AS max_n
+                            FROM quotes WHERE game_date < ?
+                        ) WHERE first_n = 1 OR last_n = 1 OR min_n = 1 OR max_n = 1
+                    )
+                    """,
+                    (compact_before, compact_before),
+                ).rowcount
+            if removed:
+                conn.execute('VACUUM')
+                actions[month] = f'compacted ({removed} rows removed)'
+            if _next_month(month) <= compact_before:
+                self._release(month)
+                with open(path, 'rb') as src, gzip.open(path + '.gz.tmp', 'wb') as dst:
+                    shutil.copyfileobj(src, dst)
+                os.replace(path + '.gz.tmp', path + '.gz')
+                os.remove(path)
+                actions[month] = ', '.join(filter(None, (actions.get(month), 'archived')))
+        return actions
+
+
+# -- normalizers for the repo's fetchers ----------------------------------------
+
+def quotes_from_odds_rows(rows: Iterable[dict], book: str = '') -> List[dict]:
+    """Game-line quotes from odds_ingest rows (spread is the home line)."""
+    out = []
+    for r in rows:
+        base = {
+            'event_id': r.get('event_id'), 'commence_time': r.get('commence_time'),
+            'away': r.get('away_team'), 'home': r.get('home_team'),
+            'book': book or r.get('provider') or '',
+        }
+        if r.get('spread') is not None:
+            out.append({**base, 'market': 'spread', 'selection': 'home', 'line': r['spread'], 'price': r.get('home_spread_price')})
+            out.append({**base, 'market': 'spread', 'selection': 'away', 'line': -r['spread'], 'price': r.get('away_spread_price')})
+        if r.get('total') is not None:
+            out.append({**base, 'market': 'total', 'selection': 'over', 'line': r['total'], 'price': r.get('over_price')})
+            out.append({**base, 'market': 'total', 'selection': 'under', 'line': r['total'], 'price': r.get('under_price')})
+        if r.get('away_ml') is not None:
+            out.append({**base, 'market': 'moneyline', 'selection': 'away', 'line': None, 'price': r['away_ml']})
+        if r.get('home_ml') is not None:
+            out.append({**base, 'market': 'moneyline', 'selection': 'home', 'line': None, 'price': r['home_ml']})
+    return out
+
+
+def quotes_from_prop_rows(rows: Iterable[dict]) -> List[dict]:
+    """Player-prop / first-inning quotes from the desktop props and NRFI scrapers."""
+    out = []
+    for r in rows:
+        player = r.get('player')
+        side = r.get('side') or ''
+        selection = f"{player}|{side}" if player and player != side else side
+        out.append({
+            'event_id': r.get('event_id') or r.get('metabet_game_id') or r.get('sr_game_id') or r.get('game'),
+            'game_date': r.get('date') or r.get('commence_time'),
+            'market': r.get('market'),
+            'selection': selection,
+            'book': r.get('bookmaker_key') or r.get('bookmaker') or '',
+            'line': r.get('line'),
+            'price': r.get('odds_american'),
+            'away': r.get('away_team') or r.get('away'),
+            'home': r.get('home_team') or r.get('home'),
+        })
+    return out
+
+
+def record_safely(sport: str, quotes: List[dict], source: str) -> int:
+    """record() that never takes a fetcher down with it."""
+    try:
+        with OddsHistory(sport) as history:
+            return history.record(quotes, source)
+    except (sqlite3.Error, OSError) as e:
+        print(f"  [ODDS-HISTORY] not recorded for {sport}: {e}")
+        return 0
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description='Odds history store maintenance and queries.')
+    ap.add_argument('--compact', action='store_true', help='Apply compaction/retention to every sport.')
+    ap.add_argument('--summary', nargs='+', metavar=('SPORT', 'EVENT_ID'),
+                    help='SPORT EVENT_ID [MARKET] - print open/current/min/max lines.')
+    args = ap.parse_args()
+
+    if args.compact:
+        sports = sorted(os.listdir(HISTORY_DIR)) if os.path.isdir(HISTORY_DIR) else []
+        for sport in sports:
+            with OddsHistory(sport) as history:
+                for month, action in history.compact().items():
+                    print(f"  [ODDS-HISTORY] {sport}/{month}: {action}")
+    if args.summary:
+        sport, event_id = args.summary[0], args.summary[1]
+        markets = args.summary[2:] or ['spread', 'total', 'moneyline']
+        started = time.perf_counter()
+        with OddsHistory(sport) as history:
+            for market in markets:
+                for selection, s in history.line_summary(event_id, market).items():
+                    print(f"  {market:10s} {selection:20s} open={s['open']} ({s['open_price']}) "
+                          f"current={s['current']} ({s['current_price']}) min={s['min']} max={s['max']} "
+                          f"updates={s['updates']}")
+        print(f"  [{(time.perf_counter() - started) * 1000:.1f} ms]")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+Shared odds ingestion for the hub, classic-odds and preview generators.
+
+Before this module every generator fetched and walked its odds payload on its
+own, and handicapping_hub_production.match_game_odds scanned the whole odds
+list (with a word-overlap test per entry) for every game on the slate.
+
+Here each league is fetched ONCE per run into an OddsTable:
+
+  - column-oriented storage (one list per field, see COLUMNS), so a snapshot
+    is a few KB of JSON instead of the nested bookmaker/market/outcome tree;
+  - O(1) lookups by ESPN event id and by normalized (away, home) team pair,
+    plus a token index that keeps the old "any shared word" fallback without
+    scanning every row;
+  - the hub's display dict (spread_away / ml_home / total ...) precomputed per
+    row, so match_game_odds and has_valid_odds are dictionary reads.
+
+Every fetch is persisted as a timestamped snapshot in
+data/cache/odds/<source>/<sport_key>.json. Any generator that runs later in
+the same workflow (or within ODDS_SNAPSHOT_MAX_AGE seconds, default 1800)
+reads that snapshot instead of calling the API again, so the hub and the
+classic-odds page always show the same numbers.
+
+Each network fetch is also appended to the odds history store
+(odds_history.py), which is what opening-vs-current movement is read from.
+
+Sources:
+  espn          ESPN scoreboard-header odds (DraftKings, free, no key)
+  the-odds-api  The Odds API v4 (first bookmaker, needs ODDS_API_KEY)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterator, List, Optional
+
+import telemetry
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SNAPSHOT_DIR = os.path.join(REPO, 'data', 'cache', 'odds')
+SNAPSHOT_MAX_AGE = int(os.environ.get('ODDS_SNAPSHOT_MAX_AGE', '1800'))
+
+ESPN_ODDS_ENDPOINTS = {
+    'basketball_nba': 'https://site.api.espn.com/apis/v2/scoreboard/header?sport=basketball&league=nba',
+    'icehockey_nhl': 'https://site.api.espn.com/apis/v2/scoreboard/header?sport=hockey&league=nhl',
+    'americanfootball_nfl': 'https://site.api.espn.com/apis/v2/scoreboard/header?sport=football&league=nfl',
+    'baseball_mlb': 'https://site.api.espn.com/apis/v2/scoreboard/header?sport=baseball&league=mlb',
+    'basketball_ncaab': 'https://site.api.espn.com/apis/v2/scoreboard/header?sport=basketball&league=mens-college-basketball',
+    'americanfootball_ncaaf': 'https://site.api.espn.com/apis/v2/scoreboard/header?sport=football&league=college-football',
+}
+ODDS_API_URL = 'https://api.the-odds-api.com/v4/sports/{}/odds'
+
+# spread is the HOME line; away is its negation.
+COLUMNS = (
+    'event_id', 'commence_time', 'away_team', 'home_team', 'provider',
+    'spread', 'away_spread_price', 'home_spread_price',
+    'away_ml', 'home_ml',
+    'total', 'over_price', 'under_price',
+)
+
+_NON_WORD = re.compile(r'[^a-z0-9&]+')
+
+# One table per (source, sport_key) per process.
+_RUN_CACHE: Dict[tuple, 'OddsTable'] = {}
+
+
+def normalize_team(name: str) -> str:
+    return _NON_WORD.sub(' ', (name or '').lower()).strip()
+
+
+def team_pair(away: str, home: str) -> tuple:
+    return normalize_team(away), normalize_team(home)
+
+
+def _fmt_point(point) -> str:
+    return f"{point:+.1f}" if point else '-'
+
+
+def _fmt_price(price) -> str:
+    try:
+        return f"{int(price):+d}" if price else '-'
+    except (TypeError, ValueError):
+        return '-'
+
+
+class OddsTable:
+    """Column-oriented odds for one league, indexed for constant-time matching."""
+
+    def __init__(self, sport_key: str, source: str, columns: Dict[str, list], fetched_at: float):
+        self.sport_key = sport_key
+        self.source = source
+        self.fetched_at = fetched_at
+        self.columns = {name: list(columns.get(name, [])) for name in COLUMNS}
+        self._n = len(self.columns['event_id'])
+        self.by_event: Dict[str, int] = {}
+        self.by_pair: Dict[tuple, int] = {}
+        self._away_tokens: Dict[str, List[int]] = {}
+        self._home_tokens: Dict[str, List[int]] = {}
+        self._display: List[dict] = []
+        for i in range(self._n):
+            event_id = str(self.columns['event_id'][i] or '')
+            if event_id:
+                self.by_event.setdefault(event_id, i)
+            away, home = team_pair(self.columns['away_team'][i], self.columns['home_team'][i])
+            self.by_pair.setdefault((away, home), i)
+            for token in set(away.split()):
+                self._away_tokens.setdefault(token, []).append(i)
+            for token in set(home.split()):
+                self._home_tokens.setdefault(token, []).append(i)
+            self._display.append(self._build_display(i))
+
+    # -- construction -----------------------------------------------------
+
+    @classmethod
+    def from_rows(cls, sport_key: str, source: str, rows: List[dict], fetched_at: float = None) -> 'OddsTable':
+        columns = {name: [row.get(name) for row in rows] for name in COLUMNS}
+        return cls(sport_key, source, columns, fetched_at or time.time())
+
+    @classmethod
+    def from_snapshot(cls, payload: dict) -> 'OddsTable':
+        return cls(payload['sport_key'], payload['source'], payload['columns'], payload['fetched_at'])
+
+    def to_snapshot(self) -> dict:
+        return {
+            'sport_key': self.sport_key,
+            'source': self.source,
+            'fetched_at': self.fetched_at,
+            'fetched_at_iso': datetime.fromtimestamp(self.fetched_at, timezone.utc).isoformat(timespec='seconds'),
+            'rows': self._n,
+            'columns': self.columns,
+        }
+
+    # -- access -----------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._n
+
+    def row(self, i: int) -> dict:
+        return {name: self.columns[name][i] for name in COLUMNS}
+
+    def rows(self) -> Iterator[dict]:
+        for i in range(self._n):
+            yield self.row(i)
+
+    def __iter__(self) -> Iterator[dict]:
+        """Iterate in the legacy Odds-API game shape (bookmakers/markets/outcomes)."""
+        for i in range(self._n):
+            yield self.legacy_game(i)
+
+    def legacy_game(self, i: int) -> dict:
+        r = self.row(i)
+        markets = []
+        if r['spread'] is not None:
+            markets.append({'key': 'spreads', 'outcomes': [
+                {'name': r['home_team'], 'point': r['spread'], 'price': r['home_spread_price']},
+                {'name': r['away_team'], 'point': -r['spread'], 'price': r['away_spread_price']},
+            ]})
+        if r['home_ml'] is not None and r['away_ml'] is not None:
+            markets.append({'key': 'h2h', 'outcomes': [
+                {'name': r['home_team'], 'price': r['home_ml']},
+                {'name': r['away_team'], 'price': r['away_ml']},
+            ]})
+        if r['total'] is not None:
+            markets.append({'key': 'totals', 'outcomes': [
+                {'name': 'Over', 'point': r['total'], 'price': r['over_price']},
+                {'name': 'Under', 'point': r['total'], 'price': r['under_price']},
+            ]})
+        return {
+            'id': r['event_id'],
+            'commence_time': r['commence_time'],
+            'home_team': r['home_team'],
+            'away_team': r['away_team'],
+            'bookmakers': [{'key': 'draftkings' if self.source == 'espn' else normalize_team(r['provider']).replace(' ', ''),
+                            'title': r['provider'], 'markets': markets}],
+        }
+
+    def find(self, away: str, home: str, event_id: str = None) -> Optional[int]:
+        """Row index for a game: event id, then exact team pair, then shared-word match."""
+        if event_id and str(event_id) in self.by_event:
+            return self.by_event[str(event_id)]
+        away_n, home_n = team_pair(away, home)
+        hit = self.by_pair.get((away_n, home_n))
+        if hit is not None:
+            return hit
+        # Same rule the old nested loop used (any shared word on each side),
+        # resolved through the token index; first row in feed order wins.
+        away_rows = {i for token in away_n.split() for i in self._away_tokens.get(token, ())}
+        if not away_rows:
+            return None
+        home_rows = {i for token in home_n.split() for i in self._home_tokens.get(token, ())}
+        both = away_rows & home_rows
+        return min(both) if both else None
+
+    def _build_display(self, i: int) -> dict:
+        c = self.columns
+        spread = c['spread'][i]
+        away_point = -spread if spread is not None else None
+        return {
+            'spread_away': _fmt_point(away_point) if away_point is not None else '-',
+            'spread_home': _fmt_point(-away_point) if away_point else '-',
+            'ml_away': _fmt_price(c['away_ml'][i]) if c['home_ml'][i] is not None else '-',
+            'ml_home': _fmt_price(c['home_ml'][i]) if c['away_ml'][i] is not None else '-',
+            'total': c['total'][i] if c['total'][i] is not None else '-',
+        }
+
+    def display(self, i: Optional[int]) -> dict:
+        if i is None:
+            return {'spread_away': '-', 'spread_home': '-', 'ml_away': '-', 'ml_home': '-', 'total': '-'}
+        return dict(self._display[i])
+
+    def has_valid(self, i: Optional[int]) -> bool:
+        if i is None:
+            return False
+        d = self._display[i]
+        return d['spread_away'] != '-' and d['ml_away'] != '-' and d['total'] != '-'
+
+
+# -- payload parsers ---------------------------------------------------------
+
+def parse_espn_header(data: dict) -> List[dict]:
+    """Rows from an ESPN scoreboard-header payload (events that carry odds)."""
+    rows = []
+    for sport in data.get('sports', []):
+        for league in sport.get('leagues', []):
+            for event in league.get('events', []):
+                odds = event.get('odds', {})
+                if not odds:
+                    continue
+                away = odds.get('awayTeamOdds', {})
+                home = odds.get('homeTeamOdds', {})
+                spread = odds.get('spread')
+                total = odds.get('overUnder')
+                rows.append({
+                    'event_id': str(event.get('id', '')),
+                    'commence_time': event.get('date', ''),
+                    'away_team': away.get('team', {}).get('displayName', ''),
+                    'home_team': home.get('team', {}).get('displayName', ''),
+                    'provider': odds.get('provider', {}).get('name', 'DraftKings'),
+                    'spread': spread,
+                    'away_spread_price': away.get('spreadOdds', -110) if spread is not None else None,
+                    'home_spread_price': home.get('spreadOdds', -110) if spread is not None else None,
+                    'away_ml': away.get('moneyLine'),
+                    'home_ml': home.get('moneyLine'),
+                    'total': total,
+                    'over_price': odds.get('overOdds', -110) if total is not None else None,
+                    'under_price': odds.get('underOdds', -110) if total is not None else None,
+                })
+    return rows
+
+
+def parse_odds_api(data: list) -> List[dict]:
+    """Rows from a The Odds API v4 /odds payload, first bookmaker per game."""
+    rows = []
+    for game in data or []:
+        books = game.get('bookmakers', [])
+        if not books:
+            continue
+        book = books[0]
+        away_team = game.get('away_team', '')
+        home_team = game.get('home_team', '')
+        row = {name: None for name in COLUMNS}
+        row.update({
+            'event_id': str(game.get('id', '')),
+            'commence_time': game.get('commence_time', ''),
+            'away_team': away_team,
+            'home_team': home_team,
+            'provider': book.get('title', 'Unknown'),
+        })
+        for market in book.get('markets', []):
+            for outcome in market.get('outcomes', []):
+                name = outcome.get('name')
+                if market.get('key') == 'spreads':
+                    if name == home_team:
+                        row['spread'] = outcome.get('point', 0)
+                        row['home_spread_price'] = outcome.get('price', -110)
+                    elif name == away_team:
+                        row['away_spread_price'] = outcome.get('price', -110)
+                elif market.get('key') == 'totals':
+                    if name == 'Over':
+                        row['total'] = outcome.get('point', 0)
+                        row['over_price'] = outcome.get('price', -110)
+                    elif name == 'Under':
+                        row['under_price'] = outcome.get('price', -110)
+                elif market.get('key') == 'h2h':
+                    if name == away_team:
+                        row['away_ml'] = outcome.get('price', 0)
+                    elif name == home_team:
+                        row['home_ml'] = outcome.get('price', 0)
+        rows.append(row)
+    return rows
+
+
+# -- snapshot store ----------------------------------------------------------
+
+def snapshot_path(source: str, sport_key: str) -> str:
+    return os.path.join(SNAPSHOT_DIR, source, f'{sport_key}.json')
+
+
+def read_snapshot(source: str, sport_key: str, max_age: int = SNAPSHOT_MAX_AGE) -> Optional[OddsTable]:
+    path = snapshot_path(source, sport_key)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            payload = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if max_age is not None and time.time() - payload.get('fetched_at', 0) > max_age:
+        return None
+    try:
+        return OddsTable.from_snapshot(payload)
+    except (KeyError, TypeError):
+        return None
+
+
+def write_snapshot(table: OddsTable) -> str:
+    path = snapshot_path(table.source, table.sport_key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(table.to_snapshot(), f, separators=(',', ':'))
+    os.replace(tmp, path)
+    return path
+
+
+def get_odds(sport_key: str, source: str = 'espn', fetch: Callable = None,
+             max_age: int = SNAPSHOT_MAX_AGE, refresh: bool = False, api_key: str = None) -> OddsTable:
+    """The run's OddsTable for a league: process cache, then fresh snapshot, then network.
+
+    fetch(url, params) -> response-like with .json(), or None on failure. It
+    defaults to a plain requests.get; generators pass their own
+    fetch_with_retry so retry/backoff behaviour is unchanged.
+    """
+    key = (source, sport_key)
+    if not refresh:
+        if key in _RUN_CACHE:
+            telemetry.cache_hit('odds_run')
+            return _RUN_CACHE[key]
+        cached = read_snapshot(source, sport_key, max_age)
+        if cached is not None:
+            telemetry.cache_hit('odds_snapshot')
+            print(f"  [ODDS] Using {source} snapshot for {sport_key} "
+                  f"({int(time.time() - cached.fetched_at)}s old, {len(cached)} games)")
+            _RUN_CACHE[key] = cached
+            return cached
+
+    telemetry.cache_miss('odds_snapshot')
+    fetch = fetch or _default_fetch
+    if source == 'espn':
+        url, params = ESPN_ODDS_ENDPOINTS.get(sport_key), None
+        if not url:
+            print(f"  [ODDS] Unknown sport key: {sport_key}")
+            return OddsTable.from_rows(sport_key, source, [])
+    elif source == 'the-odds-api':
+        url = ODDS_API_URL.format(sport_key)
+        params = {
+            'apiKey': api_key or os.environ.get('ODDS_API_KEY', ''),
+            'regions': 'us',
+            'markets': 'spreads,totals,h2h',
+            'oddsFormat': 'american',
+        }
+    else:
+        raise ValueError(f'unknown odds source: {source}')
+
+    resp = fetch(url, params)
+    if not resp:
+        print(f"  [ODDS] Failed to fetch {source} odds for {sport_key}")
+        # A failed fetch is not cached: a later generator may retry.
+        return OddsTable.from_rows(sport_key, source, [])
+    try:
+        data = resp.json()
+        rows = parse_espn_header(data) if source == 'espn' else parse_odds_api(data)
+    except (ValueError, AttributeError, TypeError) as e:
+        print(f"  [ODDS] Could not parse {source} odds for {sport_key}: {e}")
+        return OddsTable.from_rows(sport_key, source, [])
+
+    table = OddsTable.from_rows(sport_key, source, rows)
+    try:
+        write_snapshot(table)
+    except OSError as e:
+        print(f"  [ODDS] Snapshot not written: {e}")
+    from odds_history import quotes_from_odds_rows, record_safely
+    record_safely(sport_key, quotes_from_odds_rows(rows), source)
+    _RUN_CACHE[key] = table
+    return table
+
+
+def _default_fetch(url: str, params: dict = None):
+    import requests
+    try:
+        resp = requests.get(url, params=params, timeout=15)
+    except requests.exceptions.RequestException as e:
+        print(f"  [ODDS] {e}")
+        return None
+    return resp if resp.status_code == 200 else None
@@ -0,0 +1,631 @@
+#!/usr/bin/env python3
+"""
+Append-only ledger of graded picks, with incrementally maintained aggregates.
+
+Pick results used to be re-parsed from scratch by every script that needed
+them: generate_transparency_data.py regex-scanned the records pages and
+sheets, sync_records_from_tracker.py re-read the tables it was about to
+rewrite, build_all_records_json.py parsed the same tables again, and
+verify_records_sync.py had its own parsers on top. Each run rebuilt every
+stat from nothing. They now all go through this ledger, except that
+build_all_records_json.py only shares its parsers: all-records.json keeps
+every row whose odds are written differently (see make_pick_key below).
+
+Layout:
+  data/cache/picks-ledger.sqlite
+
+The file is gitignored. The workflows that ingest (daily-transparency-update,
+auto-fix-content) carry it between runs with actions/cache; a checkout
+without it rebuilds it on the first ingest.
+
+Sources are the places a pick can be read from:
+  html     the <tbody id="picks-table-body"> table of a *-records.html page
+  archive  a per-sport *-records.json file
+  sheet    a sport's published Google Sheet CSV
+  tracker  the Pick Tracker CSV (one download, split by sport)
+
+ingest() hands a source's full text to one of the parsers below. If the text
+has the same digest as last time nothing is parsed at all; otherwise the
+parsed rows are diffed against that source's current picks and only the
+differences are written. A pick is identified by (sport, source,
+make_pick_key(date, pick)); a repeated key within one snapshot keeps the last
+row, like the old pick-map dicts did.
+
+Storage is change-only: `entries` gets a 'put' row when a pick is new or its
+date/line/result/units changed, and a 'drop' row when it disappears from its
+source. Entries are never updated or deleted. `picks` is the current state
+derived from them.
+
+Aggregates (wins/losses/pushes, units, implied-probability odds sum) are
+kept per scope, sport and bucket:
+  dim 'all'       bucket ''
+  dim 'month'     bucket 'YYYY-MM' ('' when the date does not parse)
+  dim 'bet_type'  bucket from records_aggregate.BET_TYPES, else 'Other'
+Every put/drop adjusts them by the old row's contribution out and the new
+row's in, so nothing is recounted. A scope is either a source name or a
+view: a per-sport source priority list (define_view) that resolves each pick
+key to the first source holding it. Views are maintained the same way, per
+changed key. Like the records pages, W/L/P in the aggregates follows the
+sign of the units, and cross-sport parlays are left out of them.
+
+CLI:
+  python scripts/picks_ledger.py --sync                  # records pages + JSON
+  python scripts/picks_ledger.py --summary NHL [--scope html] [--by month]
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import hashlib
+import io
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+from generate_transparency_data import (
+    ALL_SPORTS,
+    SPORT_DEFAULT_STAKES,
+    calculate_unit_result,
+    date_sort_key,
+    detect_tracker_sport,
+    is_cross_sport_parlay,
+    make_pick_key,
+    normalize_date,
+    normalize_result,
+    safe_float,
+)
+from records_aggregate import BET_TYPES
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LEDGER_PATH = os.path.join(REPO, 'data', 'cache', 'picks-ledger.sqlite')
+
+# Repo files behind the 'html' and 'archive' sources.
+RECORDS_FILES = {
+    'NHL': ('nhl-records.html', 'nhl-records.json'),
+    'NFL': ('nfl-records.html', 'nfl-records.json'),
+    'NCAAF': ('ncaaf-records.html', 'ncaaf-records.json'),
+    'NCAAB': ('ncaab-records.html', 'ncaab-records.json'),
+    'MLB': ('mlb-records.html', 'mlb-records.json'),
+    'NBA': ('nba-records.html', 'nba-records.json'),
+    'Soccer': ('soccer-records.html', 'soccer-records.json'),
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    seq         INTEGER PRIMARY KEY AUTOINCREMENT,
+    sport       TEXT NOT NULL,
+    source      TEXT NOT NULL,
+    pick_key    TEXT NOT NULL,
+    op          TEXT NOT NULL,
+    date        TEXT NOT NULL,
+    pick        TEXT NOT NULL,
+    line        TEXT NOT NULL,
+    result      TEXT NOT NULL,
+    units       REAL NOT NULL,
+    units_text  TEXT NOT NULL,
+    odds        REAL NOT NULL,
+    extra       TEXT NOT NULL,
+    recorded_at INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entry_key ON entries (sport, source, pick_key, seq);
+CREATE TABLE IF NOT EXISTS picks (
+    sport       TEXT NOT NULL,
+    source      TEXT NOT NULL,
+    pick_key    TEXT NOT NULL,
+    seq         INTEGER NOT NULL,
+    pos         INTEGER NOT NULL,
+    date        TEXT NOT NULL,
+    pick        TEXT NOT NULL,
+    line        TEXT NOT NULL,
+    result      TEXT NOT NULL,
+    units       REAL NOT NULL,
+    units_text  TEXT NOT NULL,
+    odds        REAL NOT NULL,
+    extra       TEXT NOT NULL,
+    day         TEXT NOT NULL,
+    month       TEXT NOT NULL,
+    bet_type    TEXT NOT NULL,
+    counted     INTEGER NOT NULL,
+    PRIMARY KEY (sport, source, pick_key)
+);
+CREATE TABLE IF NOT EXISTS aggregates (
+    scope       TEXT NOT NULL,
+    sport       TEXT NOT NULL,
+    dim         TEXT NOT NULL,
+    bucket      TEXT NOT NULL,
+    picks       INTEGER NOT NULL,
+    wins        INTEGER NOT NULL,
+    losses      INTEGER NOT NULL,
+    pushes      INTEGER NOT NULL,
+    units       REAL NOT NULL,
+    odds_n      INTEGER NOT NULL,
+    prob_sum    REAL NOT NULL,
+    PRIMARY KEY (scope, sport, dim, bucket)
+);
+CREATE TABLE IF NOT EXISTS views (
+    view        TEXT NOT NULL,
+    sport       TEXT NOT NULL,
+    sources     TEXT NOT NULL,
+    PRIMARY KEY (view, sport)
+);
+CREATE TABLE IF NOT EXISTS view_picks (
+    view        TEXT NOT NULL,
+    sport       TEXT NOT NULL,
+    pick_key    TEXT NOT NULL,
+    source      TEXT NOT NULL,
+    PRIMARY KEY (view, sport, pick_key)
+);
+CREATE TABLE IF NOT EXISTS digests (
+    source      TEXT NOT NULL,
+    sport       TEXT NOT NULL,
+    digest      TEXT NOT NULL,
+    ingested_at INTEGER NOT NULL,
+    PRIMARY KEY (source, sport)
+);
+"""
+
+# Fields a parser row carries; a change in any of them is a new entry.
+ROW_FIELDS = ('date', 'pick', 'line', 'result', 'units', 'units_text', 'odds', 'extra')
+PICK_COLUMNS = ('sport', 'source', 'pick_key', 'seq', 'pos') + ROW_FIELDS + ('day', 'month', 'bet_type', 'counted')
+
+
+# ---- Parsers: source text -> rows ----
+
+TBODY_RE = re.compile(r'<tbody id="picks-table-body">(.*?)</tbody>', re.IGNORECASE | re.DOTALL)
+ROW_RE = re.compile(
+    r'<tr>\s*<td[^>]*>([^<]*)</td>'   # date
+    r'\s*<td[^>]*>([^<]*)</td>'       # pick
+    r'\s*<td[^>]*>([^<]*)</td>'       # line/odds
+    r'\s*<td[^>]*>([^<]*)</td>'       # result (W/L/P)
+    r'\s*<td[^>]*>([^<]*)</td>'       # units
+    r'\s*</tr>',
+    re.IGNORECASE,
+)
+
+
+def _row(date, pick, line='', result='', units=0.0, units_text='', odds=0.0, extra=None):
+    return {
+        'date': (date or '').strip(),
+        'pick': (pick or '').strip(),
+        'line': (line or '').strip(),
+        'result': normalize_result(result),
+        'units': float(units),
+        'units_text': (units_text or '').strip(),
+        'odds': float(odds),
+        'extra': json.dumps(extra or {}, sort_keys=True),
+    }
+
+
+def html_table_rows(html: str) -> List[dict]:
+    """Rows of a records page's picks table, in page order."""
+    m = TBODY_RE.search(html)
+    if not m:
+        return []
+    rows = []
+    for date, pick, line, result, units in ROW_RE.findall(m.group(1)):
+        if not date.strip() or not pick.strip():
+            continue
+        rows.append(_row(date, pick, line, result, safe_float(units), units, safe_float(line)))
+    return rows
+
+
+def archive_rows(text: str) -> List[dict]:
+    """Rows of a per-sport *-records.json archive."""
+    rows = []
+    for r in json.loads(text or '[]'):
+        pl = r.get('ProfitLoss') or ''
+        line = r.get('Odds') or r.get('Line') or ''
+        extra = {k: r.get(k, '') for k in ('League', 'Units', 'GradedAt')}
+        rows.append(_row(r.get('Date', ''), r.get('Picks') or r.get('Pick') or '', line,
+                         r.get('Result'), safe_float(pl), pl, safe_float(line), extra))
+    return rows
+
+
+def sheet_pick_rows(text: str) -> List[dict]:
+    """Rows of a sport's Google Sheet CSV.
+
+    Ungraded rows are kept (the records pages count a zero-unit row as a
+    push); the Units/ProfitLoss column is the row's P/L.
+    """
+    rows = []
+    for row in csv.DictReader(io.StringIO(text)):
+        date = row.get('Date', '')
+        pick = row.get('Pick') or row.get('Picks') or row.get('pick') or ''
+        if not date or not pick.strip():
+            continue
+        pl = (row.get('Units') or row.get('ProfitLoss') or row.get('Profit/Loss')
+              or row.get('P/L') or row.get('UNIT_RESULT') or '')
+        line = row.get('Line') or row.get('Odds') or row.get('odds') or ''
+        rows.append(_row(date, pick, line, row.get('Result') or row.get('result'),
+                         safe_float(pl), pl, safe_float(line or '0')))
+    return rows
+
+
+def tracker_pick_rows(text: str) -> Dict[str, List[dict]]:
+    """Graded Pick Tracker rows split by sport (every sport present, maybe empty).
+
+    Tracker Units is the STAKE, so P/L is calculated from it and the line.
+    Rows whose sport is ambiguous are skipped.
+    """
+    by_sport: Dict[str, List[dict]] = {sport: [] for sport in ALL_SPORTS}
+    for row in csv.DictReader(io.StringIO(text)):
+        sport = detect_tracker_sport(row)
+        if not sport:
+            continue
+        result = normalize_result(row.get('Result'))
+        date = row.get('Date', '')
+        pick = row.get('Pick') or row.get('Picks') or ''
+        if not result or not date or not pick.strip():
+            continue
+        line = row.get('Line') or row.get('Odds') or '-110'
+        stake = row.get('Units') or SPORT_DEFAULT_STAKES.get(sport, '1')
+        units = calculate_unit_result(stake, line, result)
+        extra = {'League': row.get('League', ''), 'Units': row.get('Units', '')}
+        by_sport[sport].append(_row(date, pick, line, result, units, f'{units:.2f}',
+                                    safe_float(line), extra))
+    return by_sport
+
+
+# ---- Derived columns and aggregate contributions ----
+
+def bet_type(pick: str) -> str:
+    text = (pick or '').lower() + ' '
+    for name, matches in BET_TYPES:
+        if matches(text):
+            return name
+    return 'Other'
+
+
+def _derived(row: dict) -> dict:
+    dt = date_sort_key(row['date'])
+    day = dt.strftime('%Y-%m-%d') if dt.year > 1 else ''
+    return {
+        'day': day,
+        'month': day[:7],
+        'bet_type': bet_type(row['pick']),
+        'counted': 0 if is_cross_sport_parlay(row['pick']) else 1,
+    }
+
+
+def implied_probability(odds: float) -> float:
+    if odds < 0:
+        return abs(odds) / (abs(odds) + 100)
+    return 100 / (odds + 100)
+
+
+def _contribution(row) -> Optional[tuple]:
+    """(picks, wins, losses, pushes, units, odds_n, prob_sum) of one pick."""
+    if row is None or not row['counted']:
+        return None
+    units = row['units']
+    odds = row['odds']
+    return (1, int(units > 0), int(units < 0), int(units == 0), units,
+            int(odds != 0), implied_probability(odds) if odds else 0.0)
+
+
+def stats_from_totals(picks, wins, losses, pushes, units, odds_n, prob_sum, last_date='') -> dict:
+    """Stored totals as the transparency widget's per-sport stats dict."""
+    win_pct = round((wins / (wins + losses) * 100) if (wins + losses) else 0.0, 1)
+    if odds_n:
+        avg_prob = prob_sum / odds_n
+        if avg_prob >= 0.5:
+            avg_odds = round(-(avg_prob / (1 - avg_prob)) * 100)
+        else:
+            avg_odds = round(((1 - avg_prob) / avg_prob) * 100)
+    else:
+        avg_odds = -110
+    return {
+        'wins': wins,
+        'losses': losses,
+        'pushes': pushes,
+        'totalPicks': picks,
+        'totalUnits': round(units, 2),
+        'winPct': win_pct,
+        'avgOdds': avg_odds,
+        'lastDate': last_date,
+    }
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha1(text.encode('utf-8', 'surrogateescape')).hexdigest()
+
+
+# ---- Ledger ----
+
+class PicksLedger:
+    """The picks ledger (one SQLite file)."""
+
+    def __init__(self, path: str = LEDGER_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.row_factory = sqlite3.Row
+        self.db.executescript(SCHEMA)
+        self._views: Dict[str, Dict[str, List[str]]] = {}
+        for r in self.db.execute('SELECT view, sport, sources FROM views'):
+            self._views.setdefault(r['view'], {})[r['sport']] = r['sources'].split(',')
+
+    def close(self) -> None:
+        self.db.close()
+
+    def __enter__(self) -> 'PicksLedger':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # -- writes -------------------------------------------------------------
+
+    def ingest(self, source: str, text: str, parse: Callable, sport: str = None) -> Optional[dict]:
+        """Bring `source` up to date with its latest full text.
+
+        With `sport`, parse(text) returns that sport's rows; without it,
+        parse(text) returns {sport: rows} (the tracker). Returns
+        {sport: (added, changed, dropped)}, or None when the text is
+        unchanged since the last ingest and was not parsed.
+        """
+        label = sport or '*'
+        digest = _digest(text)
+        row = self.db.execute('SELECT digest FROM digests WHERE source = ? AND sport = ?',
+                              (source, label)).fetchone()
+        if row and row['digest'] == digest:
+            return None
+        parsed = {sport: parse(text)} if sport else parse(text)
+        with self.db:
+            changes = {s: self._sync(s, source, rows) for s, rows in parsed.items()}
+            self.db.execute('INSERT OR REPLACE INTO digests VALUES (?, ?, ?, ?)',
+                            (source, label, digest, int(time.time())))
+        return changes
+
+    def _sync(self, sport: str, source: str, rows: Iterable[dict]) -> tuple:
+        incoming: Dict[str, tuple] = {}
+        for pos, row in enumerate(rows):
+            key = make_pick_key(row['date'], row['pick'])
+            first = incoming.get(key)
+            incoming[key] = (first[0] if first else pos, row)
+
+        current = {r['pick_key']: r for r in self.db.execute(
+            'SELECT * FROM picks WHERE sport = ? AND source = ?', (sport, source))}
+        now = int(time.time())
+        added = changed = dropped = 0
+        for key, (pos, row) in incoming.items():
+            old = current.pop(key, None)
+            if old is not None and all(old[f] == row[f] for f in ROW_FIELDS):
+                if old['pos'] != pos:
+                    self.db.execute('UPDATE picks SET pos = ? WHERE sport = ? AND source = ? AND pick_key = ?',
+                                    (pos, sport, source, key))
+                continue
+            seq = self._append(sport, source, key, 'put', row, now)
+            new = dict(row, sport=sport, source=source, pick_key=key, seq=seq, pos=pos, **_derived(row))
+            self.db.execute(f"INSERT OR REPLACE INTO picks ({', '.join(PICK_COLUMNS)}) "
+                            f"VALUES ({', '.join('?' * len(PICK_COLUMNS))})",
+                            [new[c] for c in PICK_COLUMNS])
+            self._changed(sport, source, key, old, new)
+            if old is None:
+                added += 1
+            else:
+                changed += 1
+        for key, old in current.items():
+            self._append(sport, source, key, 'drop', old, now)
+            self.db.execute('DELETE FROM picks WHERE sport = ? AND source = ? AND pick_key = ?',
+                            (sport, source, key))
+            self._changed(sport, source, key, old, None)
+            dropped += 1
+        if added or changed or dropped:
+            self.db.execute('DELETE FROM aggregates WHERE sport = ? AND picks = 0', (sport,))
+        return added, changed, dropped
+
+    def _append(self, sport, source, key, op, row, now) -> int:
+        cur = self.db.execute(
+            'INSERT INTO entries (sport, source, pick_key, op, date, pick, line, result, units, '
+            'units_text, odds, extra, recorded_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (sport, source, key, op) + tuple(row[f] for f in ROW_FIELDS) + (now,))
+        return cur.lastrowid
+
+    def _changed(self, sport, source, key, old, new) -> None:
+        """Move `old`'s contribution out and `new`'s in, for the source and
+        for every view whose winner for `key` this affects."""
+        self._apply(source, sport, old, -1)
+        self._apply(source, sport, new, +1)
+        for view, spec in self._views.items():
+            sources = spec.get(sport)
+            if sources and source in sources:
+                self._resolve(view, sport, key, sources, source, old)
+
+    def _resolve(self, view, sport, key, sources, changed_source=None, old=None) -> None:
+        row = self.db.execute('SELECT source FROM view_picks WHERE view = ? AND sport = ? AND pick_key = ?',
+                              (view, sport, key)).fetchone()
+        before_source = row['source'] if row else None
+        winner = None
+        for src in sources:
+            winner = self._pick(sport, src, key)
+            if winner is not None:
+                break
+        winner_source = winner['source'] if winner is not None else None
+        if before_source == winner_source and before_source != changed_source:
+            return
+        if before_source == changed_source:
+            before = old
+        else:
+            before = self._pick(sport, before_source, key) if before_source else None
+        self._apply(view, sport, before, -1)
+        self._apply(view, sport, winner, +1)
+        if winner_source:
+            self.db.execute('INSERT OR REPLACE INTO view_picks VALUES (?, ?, ?, ?)',
+                            (view, sport, key, winner_source))
+        else:
+            self.db.execute('DELETE FROM view_picks WHERE view = ? AND sport = ? AND pick_key = ?',
+                            (view, sport, key))
+
+    def _pick(self, sport, source, key):
+        return self.db.execute('SELECT * FROM picks WHERE sport = ? AND source = ? AND pick_key = ?',
+                               (sport, source, key)).fetchone()
+
+    def _apply(self, scope, sport, row, sign) -> None:
+        c = _contribution(row)
+        if c is None:
+            return
+        vals = [sign * v for v in c]
+        for dim, bucket in (('all', ''), ('month', row['month']), ('bet_type', row['bet_type'])):
+            self.db.execute(
+                'INSERT INTO aggregates VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT (scope, sport, dim, bucket) DO UPDATE SET '
+                'picks = picks + excluded.picks, wins = wins + excluded.wins, '
+                'losses = losses + excluded.losses, pushes = pushes + excluded.pushes, '
+                'units = units + excluded.units, odds_n = odds_n + excluded.odds_n, '
+                'prob_sum = prob_sum + excluded.prob_sum',
+                [scope, sport, dim, bucket] + vals)
+
+    def define_view(self, view: str, spec: Dict[str, List[str]]) -> None:
+        """Declare `view`: for each sport, sources in priority order.
+
+        A sport whose spec changed is rebuilt from `picks`; an unchanged spec
+        costs nothing.
+        """
+        current = self._views.setdefault(view, {})
+        with self.db:
+            for sport, sources in spec.items():
+                sources = list(sources)
+                if current.get(sport) == sources:
+                    continue
+                current[sport] = sources
+                self.db.execute('INSERT OR REPLACE INTO views VALUES (?, ?, ?)',
+                                (view, sport, ','.join(sources)))
+                self.db.execute('DELETE FROM view_picks WHERE view = ? AND sport = ?', (view, sport))
+                self.db.execute('DELETE FROM aggregates WHERE scope = ? AND sport = ?', (view, sport))
+                marks = ', '.join('?' * len(sources))
+                keys = [r['pick_key'] for r in self.db.execute(
+                    f'SELECT DISTINCT pick_key FROM picks WHERE sport = ? AND source IN ({marks})',
+                    [sport] + sources)]
+                for key in keys:
+                    self._resolve(view, sport, key, sources)
+                self.db.execute('DELETE FROM aggregates WHERE sport = ? AND picks = 0', (sport,))
+
+    # -- reads --------------------------------------------------------------
+
+    def _is_view(self, scope: str) -> bool:
+        return scope in self._views
+
+    def last_date(self, scope: str, sport: str) -> str:
+        if self._is_view(scope):
+            row = self.db.execute(
+                'SELECT p.date FROM view_picks v JOIN picks p ON p.sport = v.sport '
+                'AND p.source = v.source AND p.pick_key = v.pick_key '
+                'WHERE v.view = ? AND v.sport = ? ORDER BY p.day DESC, p.seq LIMIT 1',
+                (scope, sport)).fetchone()
+        else:
+            row = self.db.execute('SELECT date FROM picks WHERE source = ? AND sport = ? '
+                                  'ORDER BY day DESC, seq LIMIT 1', (scope, sport)).fetchone()
+        return normalize_date(row['date']) if row else ''
+
+    def stats(self, scope: str, sport: str) -> dict:
+        """Widget-shaped totals (see stats_from_totals) for a source or view."""
+        row = self.db.execute('SELECT * FROM aggregates WHERE scope = ? AND sport = ? AND dim = ?',
+                              (scope, sport, 'all')).fetchone()
+        totals = [row[c] for c in ('picks', 'wins', 'losses', 'pushes', 'units', 'odds_n', 'prob_sum')] \
+            if row else [0, 0, 0, 0, 0.0, 0, 0.0]
+        return stats_from_totals(*totals, last_date=self.last_date(scope, sport))
+
+    def breakdown(self, scope: str, sport: str, dim: str) -> Dict[str, dict]:
+        """{bucket: stats} for dim 'month' or 'bet_type' (lastDate left blank)."""
+        return {
+            r['bucket']: stats_from_totals(r['picks'], r['wins'], r['losses'], r['pushes'],
+                                           r['units'], r['odds_n'], r['prob_sum'])
+            for r in self.db.execute('SELECT * FROM aggregates WHERE scope = ? AND sport = ? '
+                                     'AND dim = ? ORDER BY bucket', (scope, sport, dim))
+        }
+
+    def rows(self, scope: str, sport: str) -> List[sqlite3.Row]:
+        """Current picks of a source in source order, or of a view.
+
+        A view lists its lowest-priority source's order first, then each
+        higher-priority source's additions; every key is its winning row.
+        """
+        if not self._is_view(scope):
+            return self.db.execute('SELECT * FROM picks WHERE sport = ? AND source = ? ORDER BY pos',
+                                   (sport, scope)).fetchall()
+        winners = {r['pick_key']: r for r in self.db.execute(
+            'SELECT p.* FROM view_picks v JOIN picks p ON p.sport = v.sport '
+            'AND p.source = v.source AND p.pick_key = v.pick_key WHERE v.view = ? AND v.sport = ?',
+            (scope, sport))}
+        ordered = {}
+        for source in reversed(self._views[scope][sport]):
+            for r in self.db.execute('SELECT pick_key FROM picks WHERE sport = ? AND source = ? ORDER BY pos',
+                                     (sport, source)):
+                if r['pick_key'] not in ordered and r['pick_key'] in winners:
+                    ordered[r['pick_key']] = winners[r['pick_key']]
+        return list(ordered.values())
+
+    def view_sources(self, view: str, sport: str) -> Dict[str, int]:
+        """How many of a view's picks each source won."""
+        return {r['source']: r['n'] for r in self.db.execute(
+            'SELECT source, COUNT(*) AS n FROM view_picks WHERE view = ? AND sport = ? GROUP BY source',
+            (view, sport))}
+
+    def keys(self, source: str, sport: str) -> set:
+        return {r['pick_key'] for r in self.db.execute(
+            'SELECT pick_key FROM picks WHERE sport = ? AND source = ?', (sport, source))}
+
+
+def read_text(path: str) -> str:
+    """A repo file's text for ingest(); '' if it is missing."""
+    try:
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            return f.read()
+    except OSError:
+        return ''
+
+
+def sync_records_files(ledger: PicksLedger, sports: Iterable[str] = None, sources=('archive', 'html')) -> Dict[str, dict]:
+    """Ingest the records pages and/or JSON archives for `sports`."""
+    out: Dict[str, dict] = {}
+    for sport in sports or RECORDS_FILES:
+        html_file, json_file = RECORDS_FILES[sport]
+        if 'archive' in sources:
+            out.setdefault(sport, {})['archive'] = ledger.ingest(
+                'archive', read_text(os.path.join(REPO, json_file)), archive_rows, sport)
+        if 'html' in sources:
+            out.setdefault(sport, {})['html'] = ledger.ingest(
+                'html', read_text(os.path.join(REPO, html_file)), html_table_rows, sport)
+    return out
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Picks ledger maintenance and queries.')
+    ap.add_argument('--sync', action='store_true', help='Ingest the records pages and JSON archives.')
+    ap.add_argument('--summary', metavar='SPORT', help='Print totals for one sport.')
+    ap.add_argument('--scope', default='html', help='Source or view for --summary (default: html).')
+    ap.add_argument('--by', choices=('month', 'bet_type'), help='Break --summary down.')
+    ap.add_argument('--path', default=LEDGER_PATH)
+    args = ap.parse_args(argv)
+    if not args.sync and not args.summary:
+        ap.error('nothing to do (use --sync and/or --summary)')
+
+    with PicksLedger(args.path) as ledger:
+        if args.sync:
+            for sport, results in sync_records_files(ledger).items():
+                for source, changes in results.items():
+                    if changes is None:
+                        print(f'[ledger] {sport:6s} {source:7s} unchanged')
+                    else:
+                        added, changed, dropped = changes[sport]
+                        print(f'[ledger] {sport:6s} {source:7s} +{added} ~{changed} -{dropped}')
+        if args.summary:
+            s = ledger.stats(args.scope, args.summary)
+            print(f"[ledger] {args.summary} {args.scope}: {s['wins']}-{s['losses']}-{s['pushes']} | "
+                  f"{s['totalUnits']:+.2f}u | {s['totalPicks']} picks | avg {s['avgOdds']} | "
+                  f"last {s['lastDate'] or '-'}")
+            if args.by:
+                for bucket, b in ledger.breakdown(args.scope, args.summary, args.by).items():
+                    print(f"  {bucket or '(none)':16s} {b['wins']}-{b['losses']}-{b['pushes']} | "
+                          f"{b['totalUnits']:+.2f}u")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
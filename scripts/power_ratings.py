@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Incrementally updated power ratings behind the classic-odds true line.
+
+calculate_true_line() in generate_classic_odds.py turned each day's W-L
+records into a line from scratch: a 9-3 team that beat nobody rated the same
+as a 9-3 team that beat everybody, and nothing carried over between runs. This
+keeps one margin-based rating per team and sport, in points (goals, runs):
+
+  expected home margin = home rating - away rating + home advantage
+  after a final:         both teams move K x (capped margin - expected)
+
+so a rating is the team's margin against an average team on a neutral field,
+and a true line is one subtraction away (true_line(), O(1)). A team returning
+from an offseason gap has its rating pulled back toward 0 before its first game.
+
+The ratings live at data/cache/power-ratings.json. Each sport records the last
+date it has fully absorbed (`through`) and the ESPN event ids already counted
+on later dates, so a run absorbs only games that finished since the previous
+one: pending_dates() names the scoreboard dates to fetch, absorb_events()
+counts the finals on them. A backfill rebuilds every sport from
+universal_games.pkl (the trends database on the Windows box) in a few seconds.
+A sport that has never been backfilled has no dates pending and no lines: a
+handful of recent finals starting every team at 0 is not a rating.
+
+Teams are keyed the way hub_trends_engine.TEAM_NAMES abbreviates them, so the
+pickle's full names and ESPN's abbreviations (GS, NY, UTAH ...) meet on one
+key (team_key()). Sports without a TEAM_NAMES table are keyed by full name,
+which the pickle and ESPN's displayName share.
+
+Usage:
+  python scripts/power_ratings.py                         # ratings table per sport
+  python scripts/power_ratings.py --sport NBA --top 10
+  python scripts/power_ratings.py --backfill [PATH.pkl]   # rebuild from the pickle
+  python scripts/power_ratings.py --line NBA BOS NY       # true line, home team first
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import pickle
+import sys
+from datetime import date, datetime, timedelta
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO = os.path.dirname(SCRIPT_DIR)
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+from hub_trends_engine import TEAM_NAMES
+
+STORE_PATH = os.path.join(REPO, 'data', 'cache', 'power-ratings.json')
+# Bump when the model or the parameters below change (the store is then rebuilt).
+STORE_VERSION = 2
+GAMES_PKL = r"C:\Users\Nima\universal_games.pkl"
+
+# Per sport: home advantage and margin cap in points, update rate K, and the
+# share of a rating kept across an offseason (a gap of OFFSEASON_DAYS or more).
+SPORTS = {
+    'NFL':   {'hfa': 2.0, 'k': 0.10, 'cap': 21, 'keep': 0.67},
+    'NCAAF': {'hfa': 2.5, 'k': 0.10, 'cap': 28, 'keep': 0.6},
+    'NBA':   {'hfa': 2.5, 'k': 0.05, 'cap': 25, 'keep': 0.75},
+    'NCAAB': {'hfa': 3.0, 'k': 0.06, 'cap': 25, 'keep': 0.6},
+    'NHL':   {'hfa': 0.25, 'k': 0.03, 'cap': 4, 'keep': 0.67},
+    'MLB':   {'hfa': 0.2, 'k': 0.02, 'cap': 6, 'keep': 0.67},
+}
+OFFSEASON_DAYS = 90
+# A team's rating is not trusted for a line until it has this many games.
+MIN_GAMES = 5
+# A scoreboard date is closed once it is this many days old, even if some of
+# its games never went final (postponed, suspended).
+CLOSE_AFTER_DAYS = 2
+# Dates further back than this are not fetched after a long gap.
+MAX_CATCHUP_DAYS = 10
+
+# ESPN abbreviations that differ from TEAM_NAMES.
+ESPN_ABBRS = {
+    'NBA': {'GS': 'GSW', 'NO': 'NOP', 'NY': 'NYK', 'SA': 'SAS', 'UTAH': 'UTA', 'WSH': 'WAS'},
+    'NHL': {'LA': 'LAK', 'SJ': 'SJS', 'TB': 'TBL'},
+}
+
+_TEAM_KEYS: dict[str, dict[str, str]] = {}
+
+
+def _day(value) -> str:
+    return str(value)[:10]
+
+
+def team_key(sport: str, abbr: str = '', name: str = '') -> str:
+    """Ratings key for a team given its abbreviation and/or full name."""
+    if sport not in TEAM_NAMES:
+        return name or abbr
+    keys = _TEAM_KEYS.get(sport)
+    if keys is None:
+        keys = _TEAM_KEYS[sport] = {}
+        for a, full in TEAM_NAMES[sport].items():
+            keys[a] = keys.setdefault(full, a)    # OAK and ATH are both the A's
+        for a, canonical in ESPN_ABBRS.get(sport, {}).items():
+            keys.setdefault(a, canonical)
+    return keys.get(abbr) or keys.get(name) or abbr or name
+
+
+class PowerRatings:
+    """Per-sport team ratings with an absorbed-through watermark."""
+
+    def __init__(self, path: str = STORE_PATH) -> None:
+        self.path = path
+        self.sports: dict[str, dict] = {}
+        self.dirty = False
+        try:
+            with open(path, encoding='utf-8') as f:
+                raw = json.load(f)
+            if raw.get('version') == STORE_VERSION:
+                self.sports = raw.get('sports', {})
+        except (OSError, ValueError):
+            pass
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write('{"version": %d, "sports": {\n' % STORE_VERSION)
+            f.write(',\n'.join(f'{json.dumps(s)}: {json.dumps(st, sort_keys=True)}'
+                               for s, st in sorted(self.sports.items())))
+            f.write('\n}}\n')
+        os.replace(tmp, self.path)
+        self.dirty = False
+
+    def sport(self, sport: str) -> dict:
+        st = self.sports.get(sport)
+        if st is None:
+            st = self.sports[sport] = {'through': '', 'seen': {}, 'teams': {}}
+        return st
+
+    # -- updates ------------------------------------------------------------
+
+    def absorb(self, sport: str, day: str, home: str, away: str,
+               home_score: float, away_score: float, neutral: bool = False) -> None:
+        """Count one final. Games must be absorbed in date order per team."""
+        p = SPORTS[sport]
+        teams = self.sport(sport)['teams']
+        ratings = []
+        for team in (home, away):
+            entry = teams.get(team)
+            if entry is None:
+                entry = teams[team] = [0.0, 0, day]
+            elif entry[2] and (date.fromisoformat(day) - date.fromisoformat(entry[2])).days >= OFFSEASON_DAYS:
+                entry[0] *= p['keep']
+            ratings.append(entry)
+        h, a = ratings
+        expected = h[0] - a[0] + (0 if neutral else p['hfa'])
+        margin = max(-p['cap'], min(p['cap'], home_score - away_score))
+        delta = p['k'] * (margin - expected)
+        h[0] += delta
+        a[0] -= delta
+        for entry in ratings:
+            entry[1] += 1
+            entry[2] = day
+        self.dirty = True
+
+    def pending_dates(self, sport: str, today: date | None = None) -> list[str]:
+        """Scoreboard dates (YYYYMMDD) that may hold finals not absorbed yet."""
+        today = today or date.today()
+        if not self.backfilled(sport):
+            return []
+        through = self.sports[sport]['through']
+        first = today - timedelta(days=MAX_CATCHUP_DAYS)
+        if through:
+            first = max(first, date.fromisoformat(through) + timedelta(days=1))
+        return [(first + timedelta(days=i)).strftime('%Y%m%d')
+                for i in range((today - first).days + 1)]
+
+    def absorb_events(self, sport: str, day: str, events: list[dict], today: date | None = None) -> int:
+        """Absorb the completed games of one ESPN scoreboard date.
+
+        `day` is the scoreboard date (YYYYMMDD). Events already counted are
+        skipped by id. The date is closed (and its ids forgotten) once every
+        event on it is final or it is CLOSE_AFTER_DAYS old. Returns the number
+        of games absorbed (0 for a sport that has not been backfilled).
+        """
+        if not self.backfilled(sport):
+            return 0
+        today = today or date.today()
+        st = self.sport(sport)
+        iso = f'{day[:4]}-{day[4:6]}-{day[6:8]}'
+        seen = set(st['seen'].get(iso, ()))
+        absorbed = 0
+        open_games = 0
+        for event in events:
+            comp = (event.get('competitions') or [{}])[0]
+            status = (event.get('status') or comp.get('status') or {}).get('type', {})
+            if not status.get('completed'):
+                if status.get('state') != 'post':
+                    open_games += 1
+                continue
+            eid = str(event.get('id', ''))
+            if eid in seen:
+                continue
+            sides = {c.get('homeAway'): c for c in comp.get('competitors', [])}
+            home, away = sides.get('home'), sides.get('away')
+            try:
+                hs, as_ = float(home['score']), float(away['score'])
+                home_key, away_key = (team_key(sport, t['team'].get('abbreviation', ''), t['team'].get('displayName', ''))
+                                      for t in (home, away))
+            except (TypeError, KeyError, ValueError):
+                continue
+            self.absorb(sport, iso, home_key, away_key, hs, as_, bool(comp.get('neutralSite')))
+            seen.add(eid)
+            absorbed += 1
+        if not open_games or (today - date.fromisoformat(iso)).days >= CLOSE_AFTER_DAYS:
+            if iso > st['through']:
+                st['through'] = iso
+            st['seen'] = {d: ids for d, ids in st['seen'].items() if d > st['through']}
+            self.dirty = True
+        elif seen:
+            st['seen'][iso] = sorted(seen)
+            self.dirty = True
+        return absorbed
+
+    def backfill(self, games: list[dict]) -> dict[str, int]:
+        """Rebuild every sport in SPORTS from universal_games.pkl rows."""
+        rows = [g for g in games if g.get('Sport') in SPORTS and g.get('HomeTeam') and g.get('AwayTeam')
+                and g.get('HomeScore') is not None and g.get('AwayScore') is not None and g.get('Date')]
+        rows.sort(key=lambda g: _day(g['Date']))
+        for sport in {g['Sport'] for g in rows}:
+            self.sports[sport] = {'through': '', 'seen': {}, 'teams': {}, 'backfilled': date.today().isoformat()}
+        counts = {}
+        for g in rows:
+            try:
+                hs, as_ = float(g['HomeScore']), float(g['AwayScore'])
+            except (TypeError, ValueError):
+                continue
+            sport, day = g['Sport'], _day(g['Date'])
+            self.absorb(sport, day, team_key(sport, name=g['HomeTeam']), team_key(sport, name=g['AwayTeam']), hs, as_)
+            self.sports[sport]['through'] = day
+            counts[sport] = counts.get(sport, 0) + 1
+        self.dirty = True
+        return counts
+
+    # -- queries ------------------------------------------------------------
+
+    def backfilled(self, sport: str) -> bool:
+        return bool(self.sports.get(sport, {}).get('backfilled'))
+
+    def rating(self, sport: str, team: str) -> float | None:
+        """Rating of `team` (abbreviation or full name); None until the sport
+        is backfilled and the team has MIN_GAMES."""
+        if not self.backfilled(sport):
+            return None
+        entry = self.sports[sport]['teams'].get(team_key(sport, team, team))
+        if entry is None or entry[1] < MIN_GAMES:
+            return None
+        return entry[0]
+
+    def true_line(self, sport: str, home: str, away: str, neutral: bool = False) -> float | None:
+        """Fair home spread (negative = home favoured), or None if the sport
+        has not been backfilled or either team has too few games rated."""
+        h, a = self.rating(sport, home), self.rating(sport, away)
+        if h is None or a is None:
+            return None
+        return round(-(h - a + (0 if neutral else SPORTS[sport]['hfa'])), 1)
+
+
+def load_games(path: str = GAMES_PKL) -> list[dict]:
+    with open(path, 'rb') as f:
+        return pickle.load(f)[0]
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description='Team power ratings behind the classic-odds true line.')
+    ap.add_argument('--backfill', nargs='?', const=GAMES_PKL, metavar='PKL',
+                    help=f'Rebuild from universal_games.pkl (default {GAMES_PKL}).')
+    ap.add_argument('--sport', choices=sorted(SPORTS), help='Only this sport.')
+    ap.add_argument('--top', type=int, default=None, help='Show only the top N teams.')
+    ap.add_argument('--line', nargs=3, metavar=('SPORT', 'HOME', 'AWAY'), help='True line for one matchup.')
+    args = ap.parse_args(argv)
+
+    ratings = PowerRatings()
+    if args.backfill:
+        if not os.path.exists(args.backfill):
+            print(f'[ratings] {args.backfill} not found')
+            return 1
+        started = datetime.now()
+        counts = ratings.backfill(load_games(args.backfill))
+        ratings.save()
+        secs = (datetime.now() - started).total_seconds()
+        print(f'[ratings] backfilled {sum(counts.values()):,} games in {secs:.1f}s: '
+              + ', '.join(f'{s} {n:,}' for s, n in sorted(counts.items())))
+
+    if args.line:
+        sport, home, away = args.line
+        sport = sport.upper()
+        line = ratings.true_line(sport, home, away)
+        why = 'not enough games rated' if ratings.backfilled(sport) else f'{sport} not backfilled (run --backfill)'
+        print(f'[ratings] {away} @ {home}: ' + (f'{home} {line:+g}' if line is not None else why))
+        return 0 if line is not None else 1
+
+    for sport in [args.sport] if args.sport else sorted(ratings.sports):
+        st = ratings.sports.get(sport)
+        if not st:
+            print(f'[ratings] {sport}: no ratings (run --backfill)')
+            continue
+        teams = sorted(st['teams'].items(), key=lambda kv: -kv[1][0])
+        print(f"\n[ratings] {sport}: {len(teams)} teams, through {st['through'] or '-'}, "
+              f"backfilled {st.get('backfilled') or 'never'}")
+        for team, (rating, games, last) in teams[:args.top]:
+            print(f'  {team:8s} {rating:+6.1f}  {games:5d} games  last {last}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
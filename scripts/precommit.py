@@ -0,0 +1,848 @@
+#!/usr/bin/env python3
+"""
+Git-diff-scoped pre-commit pipeline.
+
+hooks/pre-commit (and the older scripts/pre-commit-hook.sh) used to run every
+guard as its own shell loop or Python process, and several of them rescanned
+every sport page in the repo whatever was staged. This runner reads the
+staged set once (`git diff --cached --name-status`) and runs each guard only
+when a staged path affects it, over only the affected files:
+
+  1. Fixers run first, one at a time. They regenerate derived files (calendar
+     JS + shards + hub pages when a sport page is staged, the static crawl
+     links on index.html) and stage them. The staged set is then re-read, so
+     those dependants are checked like any other staged file.
+  2. Checks run in-process on a thread pool. Each check's output is buffered
+     and printed in registration order, so the report reads the same on
+     every run.
+
+Guards register with the @check / @fixer decorators below:
+
+    @check('noindex', html_files)
+    def noindex(files, staged, report):
+        report.block('...')   # fails the commit
+        report.warn('...')    # printed, does not fail
+
+`select(staged)` returns the affected paths; an empty result skips the guard.
+A per-guard timing table closes the report.
+
+Usage:
+  python scripts/precommit.py              # what the git hook runs
+  python scripts/precommit.py --workers 1  # run checks serially
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO = os.path.dirname(SCRIPT_DIR)
+for _path in (SCRIPT_DIR, REPO):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+Guard = namedtuple('Guard', 'name select fn')
+Outcome = namedtuple('Outcome', 'name files blocked output seconds')
+
+FIXERS = []
+CHECKS = []
+
+SPORTS = ('nba', 'nhl', 'nfl', 'ncaab', 'ncaaf', 'mlb', 'soccer')
+MONTHS = 'january|february|march|april|may|june|july|august|september|october|november|december'
+
+
+# =============================================================================
+# STAGED SET
+# =============================================================================
+
+class Staged:
+    """The index as of one `git diff --cached --name-status --no-renames`.
+
+    Renames count as a delete plus an add, so a calendar JS moved away or a
+    page renamed onto a dated slug is caught like the plain case.
+    """
+
+    def __init__(self):
+        out = git('diff', '--cached', '--name-status', '--no-renames', '-z')
+        fields = out.split('\0')
+        self.status = {}
+        for i in range(0, len(fields) - 1, 2):
+            self.status[fields[i + 1]] = fields[i][0]
+        self.present = sorted(p for p, s in self.status.items() if s != 'D')
+        self.added = sorted(p for p, s in self.status.items() if s == 'A')
+        self.deleted = sorted(p for p, s in self.status.items() if s == 'D')
+        self.html = [p for p in self.present if re.search(r'\.html?$', p, re.I)]
+        self._numstat = None
+        self._blobs = {}
+        self._lock = threading.Lock()
+
+    def added_lines(self, path):
+        """Lines added to `path` by the staged diff (git diff --cached --numstat)."""
+        with self._lock:
+            if self._numstat is None:
+                self._numstat = {}
+                for line in git('diff', '--cached', '--numstat', '--no-renames').splitlines():
+                    added, _, name = line.split('\t', 2)
+                    self._numstat[name] = int(added) if added.isdigit() else 0
+        return self._numstat.get(path, 0)
+
+    def blob(self, path):
+        """Staged (index) content of `path`, read for all staged files in one git call."""
+        with self._lock:
+            if not self._blobs:
+                self._blobs = read_index_blobs(self.present)
+        return self._blobs.get(path, '')
+
+    def diff(self, path):
+        return git('diff', '--cached', '--', path)
+
+
+def git(*args):
+    try:
+        return subprocess.run(['git', *args], cwd=REPO, capture_output=True,
+                              text=True, encoding='utf-8', errors='replace').stdout
+    except OSError:
+        return ''
+
+
+def worktree_changes():
+    """Paths with unstaged changes, untracked (not ignored) files included."""
+    out = git('diff', '--name-only', '-z') + git('ls-files', '--others', '--exclude-standard', '-z')
+    return {p for p in out.split('\0') if p}
+
+
+def read_index_blobs(paths):
+    """{path: staged content} via one `git cat-file --batch` process."""
+    if not paths:
+        return {}
+    request = ''.join(f':{p}\n' for p in paths).encode('utf-8')
+    out = subprocess.run(['git', 'cat-file', '--batch'], cwd=REPO, input=request,
+                         capture_output=True).stdout
+    blobs = {}
+    pos = 0
+    for path in paths:
+        end = out.index(b'\n', pos)
+        header = out[pos:end].split()
+        pos = end + 1
+        if len(header) < 3 or header[1] != b'blob':
+            continue
+        size = int(header[2])
+        blobs[path] = out[pos:pos + size].decode('utf-8', 'replace')
+        pos += size + 1
+    return blobs
+
+
+def read(path):
+    try:
+        with open(os.path.join(REPO, path), 'r', encoding='utf-8', errors='ignore') as f:
+            return f.read()
+    except OSError:
+        return ''
+
+
+# =============================================================================
+# REGISTRY
+# =============================================================================
+
+class Report:
+    def __init__(self):
+        self.blocked = False
+        self.lines = []
+
+    def say(self, msg=''):
+        self.lines.append(msg)
+
+    def warn(self, msg):
+        self.lines.append(msg)
+
+    def block(self, msg):
+        self.blocked = True
+        self.lines.append(msg)
+
+
+def check(name, select):
+    """Register `fn(files, staged, report)` to run on select(staged)."""
+    def register(fn):
+        CHECKS.append(Guard(name, select, fn))
+        return fn
+    return register
+
+
+def fixer(name, select):
+    """Register a fixer: regenerates + stages derived files before the checks."""
+    def register(fn):
+        FIXERS.append(Guard(name, select, fn))
+        return fn
+    return register
+
+
+def html_files(staged):
+    return staged.html
+
+
+def staged_exactly(*names):
+    return lambda staged: [p for p in staged.present if p in names]
+
+
+def sport_pages(staged):
+    """Staged pages the sport calendars are built from."""
+    return [p for p in staged.html if re.search(
+        r'(-(nba|nhl|mlb|soccer|ncaab|ncaaf|nfl|college-basketball)([-.]|$))|(-picks?[-.])'
+        r'|^(nba|nhl|mlb|soccer|nfl|ncaaf)\.html$|previews\.html$', p, re.I)]
+
+
+def root_sport_pages(staged):
+    """Staged root pages named <sport>*.html (the old pre-commit-hook.sh scope)."""
+    return [p for p in staged.html if '/' not in p and p.startswith(SPORTS)]
+
+
+# =============================================================================
+# FIXERS (sequential, before the checks)
+# =============================================================================
+
+CALENDAR_OUTPUTS = [
+    'scripts/nba-calendar.js', 'scripts/nhl-calendar.js', 'scripts/mlb-calendar.js',
+    'scripts/soccer-calendar.js', 'scripts/ncaab-calendar.js', 'scripts/ncaaf-calendar.js',
+    'scripts/nfl-calendar.js', 'scripts/calendar-runtime.js', 'data/calendar',
+    'nba-previews.html', 'nhl-previews.html', 'mlb-previews.html', 'soccer-previews.html',
+    'college-basketball-previews.html', 'nfl.html', 'ncaaf.html',
+]
+
+
+# PERMANENT CALENDAR GATE (May 28, 2026): a published sport/preview/pick page
+# is not complete until its date is on the correct calendar. Calendars are
+# generated data and go stale the moment a page is published without a sync,
+# so any staged sport page regenerates (and stages) every calendar.
+# The ?v= stamp is limited to the staged pages and the calendar pages (the
+# site-wide restamp is CI's job: auto-fix-content runs the full sync), and
+# everything the sync wrote is staged, not just CALENDAR_OUTPUTS.
+@fixer('calendars', sport_pages)
+def regenerate_calendars(files, staged, report):
+    import sync_calendars
+    dirty_before = worktree_changes()
+    stamp_pages = sorted(set(staged.html) | {p for p in CALENDAR_OUTPUTS if p.endswith('.html')})
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            sync_calendars.main(stamp_pages=stamp_pages)
+    except Exception as e:
+        report.block(f'  [BLOCKED] sync_calendars.py failed ({e}). Calendars could not be regenerated.')
+        return
+    written = {p for p in worktree_changes() - dirty_before if not p.startswith('data/cache/')}
+    written.update(p for p in CALENDAR_OUTPUTS if os.path.exists(os.path.join(REPO, p)))
+    git('add', '--', *sorted(written))
+    report.say(f'  [OK] Calendars regenerated; {len(written)} path(s) staged.')
+
+
+def crawl_link_sources(staged):
+    return [p for p in staged.present
+            if re.match(r'^(index\.html|homepage-picks-data\.js|featured-games-data\.js|scripts/.*-calendar\.js)$', p)
+            or p.lower().endswith('.html')]
+
+
+# STATIC CRAWL-LINK FRESHNESS (June 30, 2026). The daily cards are injected
+# client-side, so the raw HTML Googlebot crawls had no links to new pages.
+# Regenerate the static links on index.html whenever a source changes.
+@fixer('crawl-links', crawl_link_sources)
+def refresh_crawl_links(files, staged, report):
+    import sync_homepage_crawl_links
+    if sync_homepage_crawl_links.main() == 0:
+        git('add', '--', 'index.html')
+
+
+# =============================================================================
+# CHECKS (parallel, over the affected files only)
+# =============================================================================
+
+NOINDEX_RE = re.compile(r'''<meta[^>]+name=["']robots["'][^>]*content=["'][^"']*noindex''', re.I)
+
+
+# ZERO-TOLERANCE NOINDEX GATE (Nima directive June 2026): no public page may
+# ever be noindexed. If a generator emits noindex, fix the GENERATOR.
+@check('noindex', html_files)
+def noindex(files, staged, report):
+    hits = [f for f in files if NOINDEX_RE.search(staged.blob(f))]
+    if hits:
+        report.block('  [BLOCKED] noindex robots meta found in staged HTML (zero-tolerance gate):')
+        for f in hits:
+            report.block(f'    {f}')
+        report.block("  No page on betlegendpicks.com may be noindexed. Change the robots meta to\n"
+                     "  'index, follow' AND fix the generator that produced it (e.g. strikeout_dashboard.py,\n"
+                     "  strip_dates_from_urls.py, restore_dateless_urls.py) so it cannot regress.")
+
+
+# PREVIEW TEMPLATE GATE (Nima directive July 5, 2026): every NEW preview/board/
+# featured page must match PREVIEW_PAGE_STANDARD.md.
+@check('preview-template', lambda staged: [p for p in staged.added if p.lower().endswith('.html')])
+def preview_template(files, staged, report):
+    import validate_preview_template as vpt
+    failed = checked = 0
+    for f in files:
+        family = vpt.classify(f)
+        if not family or not os.path.exists(os.path.join(REPO, f)):
+            continue
+        checked += 1
+        problems = vpt.check(os.path.join(REPO, f), family)
+        if problems:
+            failed += 1
+            report.block(f'  [TEMPLATE VIOLATION] {f} ({family})')
+            for p in problems:
+                report.block(f'     - {p}')
+    if failed:
+        report.block('  [BLOCKED] New preview page does not match the locked template.\n'
+                     '  Copy docs/templates/daily-board.template or featured-preview.template.')
+    elif checked:
+        report.say(f'  [OK] {checked} preview page(s) match the locked template.')
+
+
+# Hard gate that keeps bad graphic-template images off the live homepage.
+@check('pick-card-images', staged_exactly('homepage-picks-data.js'))
+def pick_card_images(files, staged, report):
+    import validate_pick_card_images
+    if validate_pick_card_images.main(['--mode', 'new-only']) != 0:
+        report.block('  [BLOCKED] Pick card image validator rejected one or more images.\n'
+                     '  Self-host the image under images/<slug>.{jpg,jpeg,png,webp} and verify it is a\n'
+                     '  real centered action photo - not a post-game graphic, score card, or logo tile.')
+    else:
+        report.say('  [OK] Pick card images pass.')
+
+
+@check('calendar-continuity', sport_pages)
+def calendar_continuity(files, staged, report):
+    import validate_calendar_continuity
+    if validate_calendar_continuity.main([]) != 0:
+        report.block('  [BLOCKED] Calendar continuity failed - a published date is missing from a calendar.\n'
+                     '  A page is not done until its date appears on the correct calendar.\n'
+                     '  Fix the missing date(s) above, then re-stage and commit.')
+    else:
+        report.say('  [OK] Calendar continuity intact.')
+
+
+@check('homepage-crawl-links', crawl_link_sources)
+def homepage_crawl_links(files, staged, report):
+    import validate_homepage_crawl_links
+    if validate_homepage_crawl_links.main() != 0:
+        report.block('  [BLOCKED] index.html static crawl links are STALE - Googlebot cannot\n'
+                     "  discover today's daily pages. Run: python scripts/sync_homepage_crawl_links.py\n"
+                     "  then 'git add index.html' and re-commit.")
+
+
+# CRITICAL: NO DATES IN URLS (Nima directive May 3, 2026; re-enforced June 3,
+# 2026). Redirect stubs at old dated URLs are exempt.
+@check('dated-url', lambda staged: [p for p in staged.added if re.match(
+    rf'^[^/]+-({MONTHS})-[0-9]{{1,2}}-(202[4-9])\.html$', p, re.I)])
+def dated_url(files, staged, report):
+    dated = [f for f in files if 'http-equiv="refresh"' not in staged.blob(f)[:3000]]
+    if dated:
+        report.block('  [BLOCKED] New HTML file(s) with a DATE in the URL:')
+        for f in dated:
+            report.block(f'    {f}')
+        report.block('  Per the May 3, 2026 directive there are NO dates in URLs on betlegendpicks.com.\n'
+                     '  Name the page with a dateless storyline slug and set window.FORCED_PAGE_DATE instead.')
+
+
+# CRITICAL: removing a sport-calendar JS silently kills every sidebar that
+# references it.
+@check('calendar-delete', lambda staged: [p for p in staged.deleted if re.match(r'^scripts/[a-z-]*calendar[a-z-]*\.js$', p)])
+def calendar_delete(files, staged, report):
+    report.block('  [BLOCKED] You are deleting a calendar JS file:')
+    for f in files:
+        report.block(f'    {f}')
+    report.block('  Removing this kills the sidebar on every page that references it.\n'
+                 '  If this is intentional, ask Nima first and stage a replacement.')
+
+
+@check('content-validator', html_files)
+def content_validator(files, staged, report):
+    from betlegend_validator import BetLegendValidator
+    validator = BetLegendValidator(REPO, specific_files=files, errors_only=True, diff_only=True)
+    validator.run()
+    if validator.summary['errors'] > 0:
+        report.block('Commit blocked by validator. Fix errors above before committing.')
+
+
+UCV_SCRIPT = 'C:/Users/Nima/universal_content_validator.py'
+
+
+# Only new or significantly modified files (not just link updates).
+@check('universal-content-validator', html_files)
+def universal_content_validator(files, staged, report):
+    if not os.path.isfile(UCV_SCRIPT):
+        report.say('  [WARNING] universal_content_validator.py not found - skipping')
+        return
+    failed = False
+    for f in files:
+        if staged.added_lines(f) <= 50:
+            continue
+        report.say(f'  Validating: {f}')
+        out = subprocess.run([sys.executable, UCV_SCRIPT, '--file', f], cwd=REPO,
+                             capture_output=True, text=True, errors='replace')
+        text = out.stdout + out.stderr
+        if 'RESULT: FAIL' in text and 'Errors: 0' not in text:
+            failed = True
+            for line in text.splitlines():
+                if re.search(r'ERROR|FAIL|Errors:', line):
+                    report.block(line)
+    if failed:
+        report.block('  [BLOCKED] Universal Content Validator found errors.\n  Fix all errors before committing.')
+    else:
+        report.say('  [OK] Universal Content Validator passed.')
+
+
+# Nav/calendar overlap guard (June 24 2026): old fixed-nav pages carry
+# body{padding-top:140px}, which pushes the sticky header onto the calendar.
+@check('nav-calendar-overlap', html_files)
+def nav_calendar_overlap(files, staged, report):
+    from validate_nav_calendar_overlap import is_broken
+    bad = [f for f in files if os.path.isfile(os.path.join(REPO, f)) and is_broken(read(f))]
+    if bad:
+        report.block(f"  [BLOCKED] nav/calendar overlap guard failed for: {' '.join(bad)}\n"
+                     "  Remove 'padding-top:140px' from the body rule and set .calendar-sidebar{top:120px}\n"
+                     '  (match the canonical featured pages). See scripts/validate_nav_calendar_overlap.py.')
+    else:
+        report.say('  [OK] Nav/calendar overlap guard passed.')
+
+
+SPORT_LANDING_PAGES = ('nba.html', 'nhl.html', 'mlb.html', 'ncaab.html', 'soccer.html', 'nfl.html', 'ncaaf.html')
+
+
+# Rolling Hub is fully retired (re-executed in error April 19, 2026): every
+# sport landing page must be self-canonical.
+@check('sport-canonicals', staged_exactly(*SPORT_LANDING_PAGES))
+def sport_canonicals(files, staged, report):
+    for page in files:
+        lines = read(page).splitlines()
+        hrefs = [h for line in lines if 'rel="canonical"' in line for h in re.findall(r'href="([^"]*)"', line)]
+        if not hrefs:
+            hrefs = [h for line in lines if 'canonical' in line for h in re.findall(r'href="([^"]*)"', line)][:1]
+        if hrefs and not any(h.endswith('/' + page) for h in hrefs):
+            report.block(f"  [BLOCKED] {page} canonical points to wrong URL: {' '.join(hrefs)}\n"
+                         f'  Expected canonical target: /{page}\n'
+                         '  Rolling Hub is retired -- sport pages MUST be self-canonical.')
+    if report.blocked:
+        report.block('Commit blocked: main sport page canonical targets incorrect.\n'
+                     'Every sport landing page must canonical to itself (Rolling Hub retired).')
+
+
+@check('forced-page-date', lambda staged: [p for p in staged.html if re.search(r'featured-game|analysis-stats-preview', p, re.I)])
+def forced_page_date(files, staged, report):
+    today = date.today().isoformat()
+    for f in files:
+        m = re.search(r"FORCED_PAGE_DATE\s*=\s*'(\d{4}-\d{2}-\d{2})'", read(f))
+        if m and m.group(1) > today:
+            report.warn(f"  [WARNING] {f} has FORCED_PAGE_DATE='{m.group(1)}' which is AFTER today ({today})\n"
+                        '  FORCED_PAGE_DATE should be the POST date (today), not the game date.\n'
+                        '  If this is intentional (posting ahead), ignore this warning.')
+
+
+# CRITICAL: broken featured game preview on index.html (numeric team names,
+# college team IDs in NBA logo paths).
+@check('homepage-featured-preview', staged_exactly('index.html'))
+def homepage_featured_preview(files, staged, report):
+    lines = read('index.html').splitlines()
+    numeric = [m for line in lines for m in re.findall(r'font-weight: 700[^>]*>\s*\d+\s*</div>', line)]
+    if numeric:
+        report.block('  [BLOCKED] index.html Featured Game preview has RAW NUMBERS as team names!\n'
+                     '  This means the sync script failed to convert ESPN numeric IDs to team names.\n'
+                     '  FIX: Run python scripts/sync_featured_game_preview.py\n'
+                     '  The NCAAB_TEAM_MAP in the script may be missing team IDs.')
+        report.block('\n'.join(numeric))
+        return
+    college = [m for line in lines for m in re.findall(r'teamlogos/nba/500/\d{2,4}\.png', line)]
+    if college:
+        report.block('  [BLOCKED] index.html has NCAA team IDs in NBA logo paths!\n'
+                     '  College logos use teamlogos/ncaa/500/ID.png, not teamlogos/nba/500/ID.png\n'
+                     '  FIX: Run python scripts/sync_featured_game_preview.py')
+        report.block('\n'.join(college))
+
+
+HUB_PAGES = ('nba-previews.html', 'nhl-previews.html', 'mlb-previews.html',
+             'college-basketball-previews.html', 'soccer-previews.html')
+
+
+# Guard hub pages (March 24, 2026): warn when a hub's daily content is
+# overwritten before yesterday was archived.
+@check('hub-archive', staged_exactly(*HUB_PAGES))
+def hub_archive(files, staged, report):
+    import json
+    try:
+        with open(os.path.join(REPO, 'scripts', 'hub-archive-manifest.json'), encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return
+    yesterday = (date.today() - timedelta(days=1)).isoformat()
+    for hub in files:
+        if 'DAILY CONTENT' not in staged.diff(hub):
+            continue
+        sport = hub.replace('-previews.html', '').replace('college-basketball', 'ncaab')
+        if yesterday in manifest.get(sport, []):
+            continue
+        report.warn(f'  [WARNING] {hub} daily content is being overwritten!\n'
+                    f'  Yesterday ({yesterday}) is NOT in the archive manifest for {sport}.\n'
+                    "  This means yesterday's content may be LOST if you haven't run:\n"
+                    '    python scripts/rotate_all_hubs.py\n'
+                    '  If you already archived, or this is the first content for this hub, proceed.\n'
+                    '  (This is a warning, not a block - commit will continue)')
+
+
+# CRITICAL: featured-games-calendar.js must highlight the viewed page's date
+# (March 6, 2026): activeDate = pageDate || newestDate.
+@check('featured-calendar-active-date', lambda staged: [p for p in staged.present if p.lower().endswith('featured-games-calendar.js')])
+def featured_calendar_active_date(files, staged, report):
+    js = read('scripts/featured-games-calendar.js')
+    if not js:
+        return
+    if 'const activeDate = newestDate' in js:
+        report.block('  [BLOCKED] featured-games-calendar.js has broken activeDate logic!\n'
+                     '  activeDate is set to newestDate alone - this means the calendar\n'
+                     '  will ALWAYS highlight the newest date, not the page being viewed.\n\n'
+                     '  REQUIRED: const activeDate = pageDate || newestDate;\n'
+                     '  See the March 6, 2026 fix. DO NOT revert this.')
+        return
+    lines = js.splitlines()
+    page_line = next((i for i, l in enumerate(lines) if 'const pageDate' in l), None)
+    active_line = next((i for i, l in enumerate(lines) if 'const activeDate' in l), None)
+    if page_line is not None and active_line is not None and active_line < page_line:
+        report.block('  [BLOCKED] featured-games-calendar.js: activeDate defined BEFORE pageDate!\n'
+                     '  pageDate must be declared first so activeDate can reference it.\n'
+                     '  This would cause a JavaScript ReferenceError.')
+        return
+    report.say('  Calendar activeDate logic: OK (highlights current page)')
+
+
+# CRITICAL: Calendar ENGINE integrity gate (June 24 2026). Bans a 'today'
+# class and requires state CSS + current-page + has-content in every engine.
+# Also fires on calendars the calendar fixer just regenerated.
+@check('calendar-integrity', lambda staged: [p for p in staged.present if re.match(
+    r'^scripts/([a-z-]*calendar[a-z-]*\.js|sync_calendars\.py)$', p)])
+def calendar_integrity(files, staged, report):
+    import validate_calendar_integrity
+    if validate_calendar_integrity.main() != 0:
+        report.block('  [BLOCKED] Calendar engine integrity check FAILED (see above).\n'
+                     "  The calendar must highlight ONLY the viewed article's date - no 'today' marker.\n"
+                     '  Fix the GENERATOR (scripts/sync_calendars.py) + featured-games-calendar.js, re-sync, re-stage.')
+
+
+CALENDAR_REF_RE = re.compile(r'"(scripts/[a-zA-Z0-9_.-]*calendar[a-zA-Z0-9_.?=-]*\.js)')
+EXPECTED_CALENDAR = [
+    (r'analysis-stats-preview', 'scripts/featured-games-calendar.js'),
+    (r'-nba-|^nba\.html$|^nba-previews\.html$', 'scripts/nba-calendar.js'),
+    (r'-nhl-|^nhl\.html$|^nhl-previews\.html$', 'scripts/nhl-calendar.js'),
+    (r'-mlb-|^mlb\.html$|^mlb-previews\.html$', 'scripts/mlb-calendar.js'),
+    (r'-college-basketball-|-ncaab-|^ncaab\.html$|^college-basketball-previews\.html$', 'scripts/ncaab-calendar.js'),
+    (r'-ncaaf-|-college-football-|^ncaaf\.html$', 'scripts/ncaaf-calendar.js'),
+    (r'-nfl-|^nfl\.html$', 'scripts/nfl-calendar.js'),
+    (r'-soccer-|^soccer\.html$|^soccer-previews\.html$', 'scripts/soccer-calendar.js'),
+]
+
+
+# CRITICAL (April 25, 2026): a page linking a missing or another sport's
+# calendar JS silently kills its sidebar.
+@check('calendar-script-refs', html_files)
+def calendar_script_refs(files, staged, report):
+    featured_data = None
+    for f in files:
+        if not os.path.isfile(os.path.join(REPO, f)):
+            continue
+        m = CALENDAR_REF_RE.search(read(f))
+        if not m:
+            continue
+        ref = m.group(1).split('?')[0]
+        if not os.path.isfile(os.path.join(REPO, ref)):
+            report.block(f'  [BLOCKED] {f} references missing calendar JS: {ref}\n'
+                         '  Valid options:\n'
+                         '    scripts/nba-calendar.js     scripts/nhl-calendar.js\n'
+                         '    scripts/mlb-calendar.js     scripts/soccer-calendar.js\n'
+                         '    scripts/ncaab-calendar.js   scripts/ncaaf-calendar.js\n'
+                         '    scripts/nfl-calendar.js     scripts/featured-games-calendar.js')
+            continue
+        # Registered Featured Game pages (or a date-stamped sibling) correctly
+        # use featured-games-calendar.js whatever sport token their slug has.
+        if ref == 'scripts/featured-games-calendar.js':
+            if featured_data is None:
+                featured_data = read('featured-games-data.js')
+            stem = re.escape(os.path.basename(f)[:-len('.html')])
+            if re.search(rf'page: "{stem}(-[a-z0-9-]+)?\.html"', featured_data):
+                continue
+        expected = next((js for pattern, js in EXPECTED_CALENDAR if re.search(pattern, f)), None)
+        if expected and ref != expected:
+            report.block(f'  [BLOCKED] {f} references the wrong sport calendar JS.\n'
+                         f'  has={ref}  expected={expected}\n'
+                         '  Page slug indicates a different sport. Use the matching scripts/<sport>-calendar.js.')
+    if report.blocked:
+        report.block('Commit blocked: calendar script reference is broken on at least one file.\n'
+                     "See CLAUDE.md 'Calendar JS lookup table' for the canonical mapping.")
+
+
+# A page that links a calendar JS needs its markup (either ID spelling).
+@check('calendar-markup', html_files)
+def calendar_markup(files, staged, report):
+    for f in files:
+        html = read(f)
+        if not CALENDAR_REF_RE.search(html):
+            continue
+        if not re.search(r'id="(calendar-days|calendarDays)"', html):
+            report.block(f'  [BLOCKED] {f} links a calendar JS but is missing <div id="calendar-days">\n'
+                         '  The sidebar will be empty. Copy the calendar-sidebar block from a working page.')
+        if not re.search(r'id="(month-select|monthSelect)"', html):
+            report.block(f'  [BLOCKED] {f} links a calendar JS but is missing <select id="month-select">\n'
+                         '  The month dropdown will not render. Copy the calendar-sidebar block from a working page.')
+
+
+ARCHIVE_PAGE = 'nba-college-basketball-picks-predictions-analysis-february-2026.html'
+
+
+# CRITICAL (March 30, 2026): picks are standalone pages only; the blog
+# archive page is frozen.
+@check('frozen-archive', staged_exactly(ARCHIVE_PAGE))
+def frozen_archive(files, staged, report):
+    added = [l for l in staged.diff(ARCHIVE_PAGE).splitlines()
+             if l.startswith('+') and not l.startswith('+++') and 'class="blog-post"' in l]
+    if added:
+        report.block('  [BLOCKED] NEW PICK ADDED TO BLOG ARCHIVE PAGE!\n'
+                     f'  You are adding a new blog-post entry to:\n    {ARCHIVE_PAGE}\n'
+                     '  THIS IS BANNED. Picks are STANDALONE PAGES ONLY.\n'
+                     '  The archive page is FROZEN (historical picks only).\n'
+                     '  CORRECT WORKFLOW:\n'
+                     '    1. Create a standalone HTML page for the pick\n'
+                     '    2. Add a card entry to homepage-picks-data.js\n'
+                     '    3. DO NOT touch the archive page')
+
+
+# The checks below come from scripts/pre-commit-hook.sh, which ran them over
+# every sport page in the repo; they now look at the staged pages only.
+
+@check('placeholders', lambda staged: [p for p in root_sport_pages(staged)
+                                       if 'records' not in p and 'calendar' not in p])
+def placeholders(files, staged, report):
+    pattern = re.compile(r'coming soon|analysis coming|matchup analysis coming|preview coming|\bTBD\b|\bTBA\b', re.I)
+    found = [f for f in files if pattern.search(read(f))]
+    if found:
+        report.block('[X] COMMIT BLOCKED - PLACEHOLDER CONTENT FOUND:')
+        for f in found:
+            report.block(f)
+        report.block('Fix these files before committing!')
+
+
+@check('college-logos', html_files)
+def college_logos(files, staged, report):
+    bad = [f for f in files if re.search(r'teamlogos/ncaa/500/[a-zA-Z][a-zA-Z0-9-]+\.png', read(f))][:5]
+    if bad:
+        report.block('[X] COMMIT BLOCKED - BAD COLLEGE LOGOS:')
+        for f in bad:
+            report.block(f)
+        report.block('Run: python scripts/college_logo_ids.py')
+
+
+BROKEN_SOCCER_IDS = {'355': '397 (Barnsley)', '3199': '3263 (Genoa)', '3282': '4050 (Cremonese)',
+                     '5168': '6851 (Paris FC)', '108': '2925 (Cagliari)'}
+
+
+@check('soccer-logos', lambda staged: [p for p in root_sport_pages(staged) if p.startswith('soccer')
+                                       and 'calendar' not in p and 'records' not in p])
+def soccer_logos(files, staged, report):
+    hits = [f'  {f}: Uses broken ID {bad}' for f in files for bad in BROKEN_SOCCER_IDS
+            if f'teamlogos/soccer/500/{bad}.png' in read(f)]
+    if hits:
+        report.block('[X] COMMIT BLOCKED - BROKEN SOCCER LOGOS:')
+        for h in hits:
+            report.block(h)
+        report.block('Run: python scripts/soccer_logo_ids.py\nKnown corrections:')
+        for bad, good in BROKEN_SOCCER_IDS.items():
+            report.block(f'  {bad} -> {good}')
+
+
+@check('nav-text', html_files)
+def nav_text(files, staged, report):
+    bad = [f for f in files if '>Overview<' in read(f)]
+    if bad:
+        report.block('[X] COMMIT BLOCKED - BAD NAV TEXT (Overview instead of Detailed Breakdown):')
+        for f in bad:
+            report.block(f)
+
+
+def paginated_pages(staged):
+    return [p for p in staged.html if '/' not in p and 'records' not in p and (
+        re.match(rf'^({"|".join(SPORTS)})(\.html|-page.*\.html)$', p) or p.startswith('featured-game'))]
+
+
+# Sports and featured game pages use the calendar sidebar only (January 8, 2026).
+@check('pagination', paginated_pages)
+def pagination(files, staged, report):
+    found = [f for f in files if 'class="archive-link"' in read(f)]
+    if found:
+        report.block('[X] COMMIT BLOCKED - PAGINATION FOUND:')
+        report.block(' '.join(found))
+        report.block('These pages use calendar sidebar only, not pagination!\n'
+                     'Remove the archive-link divs before committing.')
+
+
+@check('sport-page-titles', lambda staged: [p for p in paginated_pages(staged) if not p.startswith('featured-game')
+                                            and 'calendar' not in p and 'archive' not in p])
+def sport_page_titles(files, staged, report):
+    generic, undated = [], []
+    for f in files:
+        html = read(f)
+        if re.search(r'<title>.*Archive - Page [0-9]+', html):
+            generic.append(f)
+        if not re.search(rf'<title>.*(({MONTHS.title()})[^<]*20[0-9]{{2}})', html) \
+                and not re.search(r'<title>.*20[0-9]{2}-[0-9]{2}-[0-9]{2}', html):
+            undated.append(f)
+    if generic:
+        report.block('[X] COMMIT BLOCKED - GENERIC PAGE TITLES FOUND:\n' + ' '.join(generic) + '\n'
+                     "These pages have 'Archive - Page X' titles which break the calendar!\n"
+                     'FIX: Change each title to include the date:\n'
+                     '  <title>NBA Analysis - January 12, 2026 | BetLegend</title>')
+    if undated:
+        report.warn('[!] WARNING: These sports pages may be missing dates in titles:\n' + ' '.join(undated) + '\n'
+                    'Run: python scripts/sync_calendars.py after fixing.')
+
+
+# Same matchup on two date pages (January 13, 2026). Only duplicates that
+# involve a staged page are reported.
+@check('duplicate-games', root_sport_pages)
+def duplicate_games(files, staged, report):
+    import detect_duplicate_games
+    staged_pages = set(files)
+    for sport in SPORTS:
+        if not any(f.startswith(sport) for f in files):
+            continue
+        duplicates, _ = detect_duplicate_games.check_sport_duplicates(sport)
+        for matchup, pages in sorted(duplicates.items()):
+            if staged_pages & {page for page, _ in pages}:
+                report.warn(f"[!] WARNING: Possible duplicate game in {sport} pages: {pages[0][1]['matchup_original']}"
+                            f" ({', '.join(page for page, _ in pages)})\n"
+                            f'    Run: python scripts/detect_duplicate_games.py {sport}')
+
+
+# A new page whose article text is a near copy of an existing one (a preview
+# regenerated under a new slug). Only the staged pages are fingerprinted; the
+# rest of the site is read from the stored MinHash signatures as they are, and
+# the check is skipped when there is no store (building one reads every page).
+@check('near-duplicate-pages', lambda staged: [p for p in staged.added if p.lower().endswith('.html')])
+def near_duplicate_pages(files, staged, report):
+    import near_duplicate_pages as ndp
+    store = ndp.PageSignatures()
+    if not store.pages:
+        report.warn('[!] WARNING: near-duplicate check skipped: no page signature store\n'
+                    '    Run: python scripts/near_duplicate_pages.py')
+        return
+    for f in files:
+        for similarity, other in store.near(ndp.fingerprint(staged.blob(f)), exclude=f):
+            report.warn(f'[!] WARNING: {f} is {similarity:.0%} similar to {other}\n'
+                        f'    Run: python scripts/near_duplicate_pages.py --page {f}')
+
+
+# Deleting a page leaves every internal link to it broken. Looked up in the
+# stored link graph instead of re-parsing the site.
+@check('dangling-links', lambda staged: [p for p in staged.deleted if p.lower().endswith('.html')])
+def dangling_links(files, staged, report):
+    import link_graph
+    graph = link_graph.load()
+    for f in files:
+        linkers = graph.linking_to(f)
+        if linkers:
+            shown = ', '.join(linkers[:5]) + (f' (+{len(linkers) - 5} more)' if len(linkers) > 5 else '')
+            report.warn(f'[!] WARNING: {f} is deleted but {len(linkers)} page(s) still link to it: {shown}\n'
+                        f'    Run: python scripts/link_graph.py --inbound {f}')
+
+
+# =============================================================================
+# RUNNER
+# =============================================================================
+
+class _ThreadOutput(io.TextIOBase):
+    """sys.stdout/stderr stand-in: a thread with a buffer set writes there."""
+
+    def __init__(self, real, local):
+        self.real = real
+        self.local = local
+
+    def write(self, s):
+        buf = getattr(self.local, 'buf', None)
+        return (buf if buf is not None else self.real).write(s)
+
+    def flush(self):
+        self.real.flush()
+
+
+def run_guard(guard, files, staged, local):
+    report = Report()
+    buf = io.StringIO()
+    local.buf = buf
+    start = time.perf_counter()
+    try:
+        guard.fn(files, staged, report)
+    except Exception as e:
+        report.block(f'  [BLOCKED] {guard.name} crashed: {type(e).__name__}: {e}')
+    finally:
+        local.buf = None
+    output = buf.getvalue().rstrip('\n')
+    lines = ([output] if output else []) + report.lines
+    return Outcome(guard.name, len(files), report.blocked, '\n'.join(lines), time.perf_counter() - start)
+
+
+def run(workers=None):
+    """Run the fixers, then the checks. Returns (outcomes, staged)."""
+    local = threading.local()
+    real_out, real_err = sys.stdout, sys.stderr
+    sys.stdout = _ThreadOutput(real_out, local)
+    sys.stderr = _ThreadOutput(real_err, local)
+    try:
+        staged = Staged()
+        outcomes = []
+        for guard in FIXERS:
+            files = guard.select(staged)
+            if files:
+                outcomes.append(run_guard(guard, files, staged, local))
+        if outcomes:
+            staged = Staged()  # pick up the files the fixers staged
+        jobs = [(guard, guard.select(staged)) for guard in CHECKS]
+        jobs = [(guard, files) for guard, files in jobs if files]
+        workers = max(1, min(workers or 8, len(jobs) or 1))
+        with ThreadPoolExecutor(workers) as pool:
+            outcomes += list(pool.map(lambda job: run_guard(job[0], job[1], staged, local), jobs))
+    finally:
+        sys.stdout, sys.stderr = real_out, real_err
+    return outcomes, staged
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Run the pre-commit guards affected by the staged paths.')
+    ap.add_argument('--workers', type=int, default=None, help='Checks run at once (default 8).')
+    args = ap.parse_args(argv)
+
+    start = time.perf_counter()
+    outcomes, staged = run(args.workers)
+    print(f'[pre-commit] {len(staged.present)} staged path(s), {len(staged.html)} HTML, '
+          f'{len(staged.deleted)} deleted')
+    for o in outcomes:
+        if o.output:
+            print(f'\n[{o.name}]')
+            print(o.output)
+
+    print('\n[pre-commit] timings')
+    for o in sorted(outcomes, key=lambda o: -o.seconds):
+        status = 'BLOCKED' if o.blocked else 'ok'
+        print(f'  {o.name:30s} {o.seconds:6.2f}s  {o.files:4d} file(s)  {status}')
+    print(f'  {"total (wall)":30s} {time.perf_counter() - start:6.2f}s')
+
+    blocked = [o.name for o in outcomes if o.blocked]
+    if blocked:
+        print(f"\n[pre-commit] Commit blocked by: {', '.join(blocked)}")
+        return 1
+    print('\n[pre-commit] All affected checks passed.')
+    return 0
+
+
+if __name__ == '__main__':
+    os.chdir(REPO)
+    sys.exit(main())
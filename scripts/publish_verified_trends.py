@@ -41,7 +41,7 @@ REPO_DIR = os.path.dirname(SCRIPT_DIR)
 sys.path.insert(0, SCRIPT_DIR)
 sys.path.insert(0, os.path.join(os.path.dirname(REPO_DIR), 'handicapping_tool'))
 
-from hub_trends_engine import get_trends_for_game, get_trends_css, _load_games
+from hub_trends_engine import get_trends_for_game, get_trends_css, scan_slate
 
 # =============================================================================
 # CONFIGURATION
@@ -246,18 +246,30 @@ def parse_game_data(event, sport, odds_map):
     }
 
 
+def trend_inputs(game):
+    """Engine keyword arguments for one parsed game."""
+    return {
+        'home_abbr': game['home_abbr'],
+        'away_abbr': game['away_abbr'],
+        'home_spread': game['spread'],
+        'total': game['total'],
+        'home_wpct': game['home_wpct'],
+        'away_wpct': game['away_wpct'],
+    }
+
+
 def run_trends_for_game(game, sport):
     """Run the combinatorial trend engine for a single game."""
-    results = get_trends_for_game(
-        sport=sport,
-        home_abbr=game['home_abbr'],
-        away_abbr=game['away_abbr'],
-        home_spread=game['spread'],
-        total=game['total'],
-        home_wpct=game['home_wpct'],
-        away_wpct=game['away_wpct'],
-    )
-    return results
+    return get_trends_for_game(sport=sport, **trend_inputs(game))
+
+
+def run_trends_for_slate(games, sport):
+    """Run the trend engine for every game on a slate, in parallel.
+
+    Returns one result list per game, in slate order.
+    """
+    results = scan_slate(sport, [trend_inputs(g) for g in games], get_trends_for_game)
+    return [r or [] for r in results]
 
 
 def classify_trends(results):
@@ -832,14 +844,13 @@ def main():
         print(f"[{sport}] Fetching odds...")
         odds_map = fetch_espn_odds(config['espn_path'])
 
-        games_data = []
-        for event in events:
-            game = parse_game_data(event, sport, odds_map)
-            if not game:
-                continue
+        slate = [g for g in (parse_game_data(event, sport, odds_map) for event in events) if g]
+        print(f"[{sport}] Scanning {len(slate)} games...")
+        slate_trends = run_trends_for_slate(slate, sport)
 
-            print(f"  Scanning {game['away_abbr']} @ {game['home_abbr']}...")
-            trends = run_trends_for_game(game, sport)
+        games_data = []
+        for game, trends in zip(slate, slate_trends):
+            print(f"  {game['away_abbr']} @ {game['home_abbr']}")
 
             if trends:
                 html, trend_count = generate_game_trends_html(game, trends, config)
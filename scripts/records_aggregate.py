@@ -0,0 +1,949 @@
+#!/usr/bin/env python3
+"""
+Python port of the records.html / upcomingpicks.html client-side aggregation.
+
+bake_seo_static_data.py used to boot headless Chromium just so the two pages'
+own JavaScript could hydrate from the Google Sheets CSVs, then scraped the
+rendered regions back into the static HTML. This module computes the same
+regions directly from the CSVs:
+
+  records.html        fetchAllData() -> calculateOverallStats() and the nine
+                      breakdown tables (sport, bet type, month, unit sizing,
+                      teasers, parlays, 5-inning, totals, team totals)
+  upcomingpicks.html  the Papa.parse() table body with WIN/LOSS/PUSH/Pending
+
+The output is byte-for-byte what the browser serializes (innerHTML, trimmed),
+including the JS quirks that decide the numbers: the hub's naive parseCSV,
+tracker-first dedup keys, the canonical NCAAF swap, Number.toFixed rounding
+and V8's Date parsing. Any change to the page JS must be mirrored here;
+`bake_seo_static_data.py --check FIXTURES` diffs this module against the
+page's own JS in Chromium on recorded sheet snapshots
+(`--record-fixtures FIXTURES` records them).
+
+Dates resolve in UTC, like the Actions runner the bake runs on.
+
+Usage:
+  from records_aggregate import fetch_sources, aggregate
+  records, picks_html = aggregate(fetch_sources())
+"""
+
+import csv
+import html
+import io
+import json
+import math
+import re
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from decimal import ROUND_HALF_UP, Decimal
+from pathlib import Path
+
+from generate_transparency_data import PICK_TRACKER_URL, SPORT_DEFAULT_STAKES, calculate_unit_result
+
+ROOT = Path(__file__).resolve().parent.parent
+NCAAF_RECORDS_PAGE = 'ncaaf-records.html'
+
+# SHEET_URLS in records.html, in its order: sheet rows are concatenated in
+# this order behind the tracker rows, and dedup keeps the first copy.
+RECORDS_SHEET_URLS = {
+    'NFL': 'https://docs.google.com/spreadsheets/d/e/2PACX-1vQgB4WcyyEpMBp_XI_ya6hC7Y8kRaHzrOvuLMq9voGF0nzfqi4lkmAWVb92nDkxUhLVhzr4RTWtZRxq/pub?output=csv',
+    'NBA': 'https://docs.google.com/spreadsheets/d/e/2PACX-1vSBoPl-dhj7ZAVpRIafqrFBf10r6sg3jpEKxmuymugAckdoMp-czkj1hscpDnV42GGJsIvNx5EniLVz/pub?output=csv',
+    'NHL': 'https://docs.google.com/spreadsheets/d/e/2PACX-1vRaRwsGOmbXrqAX0xqrDc9XwRCSaAOkuW68TArz3XQp7SMmLirKbdYqU5-zSM_A-MDNKG6sbdwZac6I/pub?output=csv',
+    'MLB': 'https://docs.google.com/spreadsheets/d/e/2PACX-1vQE9RjSNABgl0SxSA1ghp9soUs4gq7teoncN5GLmG5faXmH-sDwXgg0mrk0iQwmSEYExtx6xwFMflXv/pub?output=csv',
+    'NCAAF': 'https://docs.google.com/spreadsheets/d/e/2PACX-1vQ9c45xiuXWNe-fAXYMoNb00kCBHfMf4Yn-Xr2LUqdCIiuoiXXDgrDa5mq1PZqxjg8hx-5KnS0L4uVU/pub?output=csv',
+    'NCAAB': 'https://docs.google.com/spreadsheets/d/e/2PACX-1vQrFb66HE90gCwliIBQlZ5cNBApJWtGuUV1WbS4pd12SMrs_3qlmSFZCLJ9vBmfgZKcaaGyg4G15J3Y/pub?output=csv',
+    'Soccer': 'https://docs.google.com/spreadsheets/d/e/2PACX-1vQy0EQskvixsVQb1zzYtCKDa4F1Wl6WU5QuAFMit32vms-c4DxlhLik-k7U_EhuYntQrpw4BI6r0rns/pub?output=csv',
+}
+UPCOMING_PICKS_URL = 'https://docs.google.com/spreadsheets/d/e/2PACX-1vQxskwayMha-DRtU9w-UXiRzy4e5uAjJsHoUfoW2edQUv__Svh6B_Wf3oyWwQFCGPCSl8BUT3qA_LJB/pub?gid=0&single=true&output=csv'
+
+# Source name -> URL, as stored in a fixture manifest.
+SOURCE_URLS = dict(RECORDS_SHEET_URLS, tracker=PICK_TRACKER_URL, upcoming=UPCOMING_PICKS_URL)
+
+RECORDS_STATS = ['total-record', 'win-rate', 'avg-odds', 'total-picks']
+RECORDS_TBODIES = [
+    'sport-breakdown', 'bet-type-breakdown', 'monthly-breakdown',
+    'unit-sizing-breakdown', 'teaser-breakdown', 'parlay-breakdown',
+    'five-inning-breakdown', 'total-bets-breakdown', 'team-totals-by-sport',
+]
+
+BREAKDOWN_SPORTS = ['NFL', 'NBA', 'NHL', 'MLB', 'NCAAF', 'NCAAB', 'Soccer']
+NO_PICKS_MSG = 'No upcoming picks at this time. Check back soon!'
+
+
+# ---- JS semantics ----
+
+_JS_FLOAT_RE = re.compile(r'[+-]?(?:Infinity|(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?)')
+_JS_INT_RE = re.compile(r'[+-]?[0-9]+')
+
+
+def js_parse_float(value):
+    """parseFloat(): the longest numeric prefix, else NaN."""
+    m = _JS_FLOAT_RE.match(str(value).lstrip())
+    if not m:
+        return math.nan
+    try:
+        return float(m.group(0).replace('Infinity', 'inf'))
+    except ValueError:
+        return math.nan
+
+
+def js_parse_int(value):
+    """parseInt(value, 10), with None for NaN."""
+    m = _JS_INT_RE.match(str(value).lstrip())
+    return int(m.group(0)) if m else None
+
+
+def js_round(x):
+    """Math.round()."""
+    return math.floor(x + 0.5)
+
+
+def js_to_fixed(x, digits):
+    """Number.prototype.toFixed(): exact binary value, ties away from zero."""
+    if math.isnan(x):
+        return 'NaN'
+    if math.isinf(x):
+        return 'Infinity' if x > 0 else '-Infinity'
+    if x == 0:
+        x = 0.0  # (-0).toFixed() has no sign
+    q = Decimal(x).quantize(Decimal(1).scaleb(-digits), rounding=ROUND_HALF_UP)
+    return format(q, 'f')
+
+
+def js_str(n):
+    """`${n}` for the integers the tables print."""
+    if isinstance(n, float) and n.is_integer():
+        return str(int(n))
+    return str(n)
+
+
+def _js_date(year, month0, day):
+    """new Date(year, monthIndex, day) with JS rollover; None if out of range."""
+    if 0 <= year <= 99:
+        year += 1900
+    year += month0 // 12
+    month0 %= 12
+    try:
+        return date(year, month0 + 1, 1) + timedelta(days=day - 1)
+    except (ValueError, OverflowError):
+        return None
+
+
+_MONTHS = ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec']
+_MONTH_NAMES = ['January', 'February', 'March', 'April', 'May', 'June', 'July',
+                'August', 'September', 'October', 'November', 'December']
+_ISO_RE = re.compile(
+    r'^(\d{4})(?:-(\d\d)(?:-(\d\d))?)?'
+    r'(?:T(\d\d):(\d\d)(?::(\d\d)(?:\.\d+)?)?(Z|[+-]\d\d:\d\d)?)?$', re.A)
+_TIME = r'(?:\s+\d{1,2}:\d{2}(?::\d{2})?(?:\s*[ap]\.?m\.?)?)?'
+_NUMERIC_RE = re.compile(r'^(\d+)[/.-](\d+)(?:[/.-](\d+))?' + _TIME + r'$', re.A | re.I)
+_NAMED_RE = re.compile(
+    r'^(?:[a-z]+,?\s+)?([a-z]{3,})\.?\s+(\d{1,2}),?(?:\s+(\d{1,4}))?' + _TIME + r'$', re.A | re.I)
+_DAY_FIRST_RE = re.compile(r'^(\d{1,2})\s+([a-z]{3,})\.?,?\s+(\d{1,4})' + _TIME + r'$', re.A | re.I)
+
+
+def _month_index(word):
+    word = word.lower()
+    for i, name in enumerate(_MONTHS):
+        if _MONTH_NAMES[i].lower().startswith(word) and word.startswith(name):
+            return i
+    return None
+
+
+def _legacy_year(year):
+    if 0 <= year <= 49:
+        return year + 2000
+    if 50 <= year <= 99:
+        return year + 1900
+    return year
+
+
+def js_new_date(text):
+    """The calendar date of `new Date(text)` (V8), or None for Invalid Date.
+
+    Covers what the sheets actually hold: ISO dates, M/D/YYYY and M-D-YYYY
+    (optionally with a time), and "Oct 5, 2025" style month names. A missing
+    year is 2001 and out-of-range days roll over, as in V8.
+    """
+    if text is None:
+        return None
+    s = re.sub(r'\([^)]*\)', ' ', str(text)).strip()  # V8 skips (comments)
+    m = _ISO_RE.match(s)
+    if m:
+        year, month, day = int(m.group(1)), int(m.group(2) or 1), int(m.group(3) or 1)
+        if not (1 <= month <= 12 and 1 <= day <= 31):
+            return None
+        try:
+            dt = datetime(year, month, 1) + timedelta(days=day - 1, hours=int(m.group(4) or 0),
+                                                      minutes=int(m.group(5) or 0))
+        except (ValueError, OverflowError):
+            return None
+        zone = m.group(7)
+        if zone and zone != 'Z':
+            sign = 1 if zone[0] == '+' else -1
+            dt -= sign * timedelta(hours=int(zone[1:3]), minutes=int(zone[4:6]))
+        return dt.date()
+    month = day = year = None
+    m = _NUMERIC_RE.match(s)
+    if m:
+        month, day = int(m.group(1)), int(m.group(2))
+        year = int(m.group(3)) if m.group(3) else None
+        if len(m.group(1)) >= 3 and year is not None:  # 2025/10/5
+            year, month, day = month, day, year
+    else:
+        m = _NAMED_RE.match(s)
+        if m:
+            month = _month_index(m.group(1))
+            month = None if month is None else month + 1
+            day = int(m.group(2))
+            year = int(m.group(3)) if m.group(3) else None
+        else:
+            m = _DAY_FIRST_RE.match(s)
+            if m:
+                month = _month_index(m.group(2))
+                month = None if month is None else month + 1
+                day, year = int(m.group(1)), int(m.group(3))
+    if month is None or not (1 <= month <= 12 and 1 <= day <= 31):
+        return None
+    year = 2001 if year is None else _legacy_year(year)
+    return _js_date(year, month - 1, day)
+
+
+def _text(value):
+    """A string as the browser re-serializes it after innerHTML parsing."""
+    s = html.unescape(value)
+    return s.replace('&', '&amp;').replace('\xa0', '&nbsp;').replace('<', '&lt;').replace('>', '&gt;')
+
+
+def _get(row, *keys):
+    """`row.A || row.b || ''`."""
+    for key in keys:
+        value = row.get(key)
+        if value:
+            return value
+    return ''
+
+
+def _search_text(row):
+    pick = _get(row, 'Pick', 'pick').lower()
+    bet_type = _get(row, 'Bet Type', 'bet type', 'BetType', 'betType').lower()
+    return pick + ' ' + bet_type
+
+
+def _graded(row, trim=True):
+    result = _get(row, 'Result', 'result').lower()
+    if trim:
+        result = result.strip()
+    return bool(result) and result != 'pending'
+
+
+# ---- records.html: loading ----
+
+def parse_csv(text):
+    """parseCSV() from records.html: naive comma split, header fixes,
+    rows of at least four values, Result filled from any W/L/P cell."""
+    lines = text.split('\n')
+    headers = [h.strip().replace('"', '') for h in lines[0].split(',')]
+    has_result = any('result' in h.lower() for h in headers)
+    fixed = []
+    for idx, h in enumerate(headers):
+        if h.lower() == 'odds':
+            fixed.append('Line')
+        elif h == '':
+            if not has_result:
+                has_result = True
+                fixed.append('Result')
+            else:
+                fixed.append(f'Column{idx}')
+        else:
+            fixed.append(h)
+
+    data = []
+    for line in lines[1:]:
+        if line.strip() == '':
+            continue
+        values = parse_csv_line(line)
+        if len(values) < 4:
+            continue
+        row = {}
+        for idx, header in enumerate(fixed):
+            if header and idx < len(values):
+                row[header] = values[idx] or ''
+        if not row.get('Result'):
+            for value in values:
+                v = value.strip().upper()
+                if v in ('W', 'L', 'P', 'WIN', 'LOSS', 'PUSH'):
+                    row['Result'] = v
+                    break
+        data.append(row)
+    return data
+
+
+def parse_csv_line(line):
+    values = []
+    current = ''
+    in_quotes = False
+    for ch in line:
+        if ch == '"':
+            in_quotes = not in_quotes
+        elif ch == ',' and not in_quotes:
+            values.append(current.strip())
+            current = ''
+        else:
+            current += ch
+    values.append(current.strip())
+    return values
+
+
+def detect_sport(row):
+    """detectSportFromPick(): League column first, then Sport."""
+    league = (row.get('League') or '').lower().strip()
+    sport = (row.get('Sport') or '').lower().strip()
+    if league == 'cross-sport':
+        return None
+    leagues = {'nfl': 'NFL', 'nba': 'NBA', 'nhl': 'NHL', 'mlb': 'MLB',
+               'ncaaf': 'NCAAF', 'cfb': 'NCAAF', 'ncaab': 'NCAAB', 'cbb': 'NCAAB',
+               'soccer': 'Soccer', 'mls': 'Soccer'}
+    if league in leagues:
+        return leagues[league]
+    return {'football': 'NFL', 'basketball': 'NBA', 'hockey': 'NHL', 'baseball': 'MLB'}.get(sport)
+
+
+def unit_result(stake, odds, result):
+    """calculateUnitResult(): 0 when the stake or odds do not parse."""
+    stake, odds = js_parse_float(stake), js_parse_float(odds)
+    if math.isnan(stake) or math.isnan(odds):
+        return 0
+    return calculate_unit_result(stake, odds, result)
+
+
+def parse_sheet_date(value):
+    if not value:
+        return None
+    raw = str(value).strip()
+    parts = re.split(r'[-/]', raw)
+    if len(parts) >= 3:
+        month, day = js_parse_int(parts[0]), js_parse_int(parts[1])
+        year_part = re.search(r'\d{2,4}', parts[2], re.A)
+        year = int('20' + year_part.group(0) if len(year_part.group(0)) == 2 else year_part.group(0)) if year_part else None
+        if month is not None and day is not None and year is not None:
+            parsed = _js_date(year, month - 1, day)
+            if parsed and (parsed.year, parsed.month, parsed.day) == (year, month, day):
+                return parsed
+    return js_new_date(raw)
+
+
+def correct_tracker_date(row):
+    """correctTrackerDateFromPostedAt(): a pick dated in the wrong year takes
+    the PostedAt year when month and day agree."""
+    pick_date = parse_sheet_date(_get(row, 'Date', 'date'))
+    posted = parse_sheet_date(_get(row, 'PostedAt', 'postedAt', 'Posted At'))
+    if not pick_date or not posted:
+        return row
+    if (pick_date.month, pick_date.day) != (posted.month, posted.day) or pick_date.year == posted.year:
+        return row
+    return dict(row, Date=f'{posted.month}/{posted.day}/{posted.year}',
+                originalTrackerDate=_get(row, 'Date', 'date'))
+
+
+def sheet_rows(sport, text):
+    rows = []
+    for row in parse_csv(text):
+        result = _get(row, 'Result', 'result').upper().strip()
+        has_result = result in ('W', 'WIN', 'L', 'LOSS', 'P', 'PUSH')
+        units = js_parse_float(_get(row, 'Units', 'units') or 0)
+        rows.append(dict(row, sport=sport, unitPL=units if has_result and not math.isnan(units) else None))
+    return rows
+
+
+def tracker_rows(text):
+    rows = []
+    for row in parse_csv(text):
+        row = correct_tracker_date(row)
+        sport = detect_sport(row)
+        if not sport:
+            continue
+        odds = row.get('Odds') or row.get('Line') or '-110'
+        result = row.get('Result') or ''
+        stake = row.get('Units') or SPORT_DEFAULT_STAKES.get(sport) or '1'
+        rows.append(dict(row, sport=sport, Line=odds, fromPickTracker=True,
+                         unitPL=unit_result(stake, odds, result) if result else None))
+    return rows
+
+
+def _date_key(value):
+    if not value:
+        return ''
+    s = str(value).strip()
+    parts = re.split(r'[-/]', s)
+    if len(parts) != 3:
+        return s
+    m, d = js_parse_int(parts[0]), js_parse_int(parts[1])
+    y_str = parts[2].strip()
+    y = js_parse_int(y_str)
+    if re.match(r'^0\d+$', y_str, re.A):
+        y = js_parse_int(y_str.lstrip('0'))
+    if re.match(r'^\d{3}$', y_str, re.A) and y_str.startswith('20'):
+        y = int(y_str[:2] + '2' + y_str[2:])
+    if y is not None and 2030 < y < 3000:
+        y = int('20' + str(y)[-2:])
+    if m is not None and d is not None and y is not None and 2020 <= y <= 2030:
+        return f'{m}/{d}/{y}'
+    return s
+
+
+def dedup_key(row):
+    """Date|sport|pick|line, normalized exactly like records-engine.js."""
+    pick = re.sub(r'\s+', ' ', _get(row, 'Pick', 'pick')).strip().lower()
+    line = _get(row, 'Line', 'line').replace(',', '').strip()
+    if line.startswith('+'):
+        line = line[1:]
+    return f"{_date_key(_get(row, 'Date', 'date'))}|{row.get('sport') or ''}|{pick}|{line}"
+
+
+_NCAAF_ROW_RE = re.compile(
+    r'<tr>\s*' + r'\s*'.join([r'<td[^>]*>([^<]*)</td>'] * 5) + r'\s*</tr>', re.I)
+
+
+def canonical_ncaaf_rows(page_html):
+    """fetchCanonicalNcaafRows(): the season log table in ncaaf-records.html."""
+    rows = []
+    for m in _NCAAF_ROW_RE.finditer(page_html):
+        date_text, pick, line = m.group(1).strip(), m.group(2).strip(), m.group(3).strip()
+        result = m.group(4).strip().upper()
+        units_text = m.group(5).strip().replace(',', '')
+        if units_text.startswith('+'):
+            units_text = units_text[1:]
+        unit_pl = js_parse_float(units_text)
+        if not date_text or not pick or result not in ('W', 'L', 'P') or math.isnan(unit_pl):
+            continue
+        rows.append({'Date': date_text, 'Pick': pick, 'Line': line, 'Result': result,
+                     'Units': js_to_fixed(unit_pl, 2), 'sport': 'NCAAF', 'unitPL': unit_pl,
+                     'canonicalSource': NCAAF_RECORDS_PAGE})
+    return rows
+
+
+def load_records(sources, ncaaf_html):
+    """allData from fetchAllData(): tracker rows first, then each sport sheet,
+    deduplicated, with NCAAF swapped for the canonical page rows."""
+    raw = tracker_rows(sources['tracker'])
+    for sport in RECORDS_SHEET_URLS:
+        raw.extend(sheet_rows(sport, sources[sport]))
+    seen = set()
+    rows = []
+    for row in raw:
+        key = dedup_key(row)
+        if key not in seen:
+            seen.add(key)
+            rows.append(row)
+    ncaaf = canonical_ncaaf_rows(ncaaf_html)
+    if ncaaf:
+        rows = [r for r in rows if r.get('sport') != 'NCAAF'] + ncaaf
+    return rows
+
+
+# ---- records.html: stats ----
+
+_SIGNED_RE = re.compile(r'[+-]\d+', re.A)
+_PLAIN_RE = re.compile(r'\b\d{3,}\b', re.A)
+_UNIT_RE = re.compile(r'(\d+\.?\d*)\s*u(?!n)', re.A | re.I)
+_CONFIDENCE_UNITS = {1: 0.5, 2: 1, 3: 1.5, 4: 2, 5: 2.5, 6: 3}
+
+
+def extract_odds(line):
+    if not line:
+        return None
+    signed = _SIGNED_RE.findall(line)
+    if signed:
+        return int(signed[-1])
+    plain = _PLAIN_RE.findall(line)
+    if plain and int(plain[-1]) >= 100:
+        return int(plain[-1])
+    return None
+
+
+def _line(row):
+    return _get(row, 'Line', 'line', 'Odds', 'odds')
+
+
+def extract_bet_size(row):
+    """extractBetSize(): tracker stake, "2u" in the text, confidence, then the
+    stake implied by a sheet's P/L."""
+    if row.get('fromPickTracker'):
+        units = js_parse_float(_get(row, 'Units', 'units') or 0)
+        if units > 0:
+            return units
+    m = _UNIT_RE.search(_search_text(row))
+    if m:
+        size = js_parse_float(m.group(1))
+        if size > 0:
+            return size
+    confidence = _get(row, 'Confidence', 'confidence')
+    if confidence:
+        level = js_parse_int(confidence)
+        if level in _CONFIDENCE_UNITS:
+            return _CONFIDENCE_UNITS[level]
+
+    result = _get(row, 'Result', 'result').upper()
+    units = js_parse_float(_get(row, 'Units', 'units') or 0)
+    odds = extract_odds(_line(row))
+    if result in ('L', 'LOSS') and units < 0 and odds:
+        loss = abs(units)
+        if odds >= 0:
+            return loss
+        stake = loss / (abs(odds) / 100)
+        if 0 < stake <= 10:
+            return js_round(stake * 2) / 2
+    if result in ('W', 'WIN') and units > 0 and odds:
+        if odds < 0:
+            return units
+        stake = units / (odds / 100)
+        if 0 < stake <= 10:
+            return js_round(stake * 2) / 2
+    return 1
+
+
+def calculate_stats(rows):
+    """calculateStats(data, true)."""
+    wins = losses = pushes = 0
+    units = risked = decimal_odds = 0
+    odds_count = 0
+    for row in rows:
+        result = _get(row, 'Result', 'result').lower().strip()
+        if not result or result == 'pending':
+            continue
+        line = _line(row)
+        odds = extract_odds(line) or -110
+        result = result.upper()
+        pl = row.get('unitPL')
+        has_pl = pl is not None and not math.isnan(pl)
+        if result in ('W', 'WIN'):
+            wins += 1
+            if has_pl:
+                units += pl
+                risked += pl * (abs(odds) / 100) if odds < 0 else (pl / (odds / 100) if odds > 0 else pl)
+            else:
+                size = extract_bet_size(row)
+                risked += size * (abs(odds) / 100) if odds < 0 else size
+                units += size if odds < 0 else size * (odds / 100)
+        elif result in ('L', 'LOSS'):
+            losses += 1
+            if has_pl:
+                units += pl
+                risked += abs(pl)
+            else:
+                size = extract_bet_size(row)
+                risked += size * (abs(odds) / 100) if odds < 0 else size
+                units -= size * (abs(odds) / 100) if odds < 0 else size
+        elif result in ('P', 'PUSH'):
+            pushes += 1
+            size = extract_bet_size(row)
+            risked += size * (abs(odds) / 100) if odds < 0 else size
+
+        text = _search_text(row)
+        if 'parlay' not in text and 'teaser' not in text:
+            odds = extract_odds(line)
+            if odds:
+                decimal_odds += (odds / 100) + 1 if odds > 0 else (100 / abs(odds)) + 1
+                odds_count += 1
+
+    decided = wins + losses
+    win_rate = (wins / decided) * 100 if decided > 0 else 0
+    roi = (units / risked) * 100 if risked > 0 else 0
+    avg_odds = -110
+    if odds_count > 0:
+        avg = decimal_odds / odds_count
+        avg_odds = js_round((avg - 1) * 100) if avg >= 2.0 else js_round(-100 / (avg - 1))
+    return {
+        'record': f'{wins}-{losses}' + (f'-{pushes}' if pushes > 0 else ''),
+        'wins': wins,
+        'losses': losses,
+        'pushes': pushes,
+        'winRate': win_rate,
+        'units': units,
+        'roi': roi,
+        'avgOdds': avg_odds,
+        'totalRisked': risked,
+    }
+
+
+def find_best_sport(rows):
+    best, best_rate = '', 0
+    for sport in BREAKDOWN_SPORTS:
+        sport_rows = [r for r in rows if r.get('sport') == sport]
+        if not sport_rows:
+            continue
+        rate = calculate_stats(sport_rows)['winRate']
+        if rate > best_rate:
+            best_rate = rate
+            best = f'{sport} ({js_to_fixed(rate, 1)}%)'
+    return best
+
+
+# ---- records.html: table rows ----
+
+def _sign_class(x):
+    """records-color.js unitsClass()/roiClass()."""
+    if not math.isfinite(x) or x == 0:
+        return ''
+    return 'win' if x > 0 else 'loss'
+
+
+def _metric_cells(stats):
+    """Record, Win %, Units, ROI with their records-color.js classes."""
+    w, l = stats['wins'], stats['losses']
+    rate = stats['winRate']
+    rate_cls = '' if not math.isfinite(rate) or rate == 50 else ('win' if rate > 50 else 'loss')
+    units, roi = stats['units'], stats['roi']
+    return [
+        f'<td class="{"win" if w > l else "loss" if l > w else ""}">{stats["record"]}</td>',
+        f'<td class="{rate_cls}">{js_to_fixed(rate, 1)}%</td>',
+        f'<td class="{_sign_class(units)}">{"+" if units >= 0 else ""}{js_to_fixed(units, 2)}u</td>',
+        f'<td class="{_sign_class(roi)}">{"+" if roi >= 0 else ""}{js_to_fixed(roi, 2)}%</td>',
+    ]
+
+
+def _tr(cells, style=None):
+    """A <tr> filled from the pages' template literal, as innerHTML serializes it."""
+    attr = f' style="{style}"' if style else ''
+    return f'<tr{attr}>\n ' + '\n '.join(cells) + '\n </tr>'
+
+
+def _stat_row(label, rows, style=None, label_cell=None, last=None):
+    stats = calculate_stats(rows)
+    if last is None:
+        last = find_best_sport(rows)
+    first = label_cell or f'<td><strong>{label}</strong></td>'
+    return _tr([first] + _metric_cells(stats) + [f'<td>{last}</td>'], style)
+
+
+def _avg_odds_text(stats):
+    return ('+' if stats['avgOdds'] > 0 else '') + js_str(stats['avgOdds'])
+
+
+def _sport_badge(sport):
+    return f'<td><span class="badge badge-{sport.lower()}">{sport}</span></td>'
+
+
+def _empty(what):
+    return f'<tr><td colspan="6" style="text-align: center; color: var(--muted);">No {what} data available</td></tr>'
+
+
+def sport_breakdown(rows):
+    out = []
+    for sport in BREAKDOWN_SPORTS + ['Cross-Sport']:
+        sport_rows = [r for r in rows if r.get('sport') == sport]
+        if sport_rows:
+            stats = calculate_stats(sport_rows)
+            out.append(_stat_row(sport, sport_rows, label_cell=_sport_badge(sport),
+                                 last=_avg_odds_text(stats)))
+    return ''.join(out)
+
+
+BET_TYPES = [
+    ('Teasers', lambda t: 'teaser' in t or 'tsr' in t or 'teas' in t),
+    ('5-Inning Bets', lambda t: '5 inn' in t or '5-inn' in t or 'first 5' in t or 'f5' in t),
+    ('Over', lambda t: 'over' in t),
+    ('Under', lambda t: 'under' in t),
+    ('Moneyline', lambda t: 'ml' in t or 'moneyline' in t),
+    ('Spread', lambda t: '+' in t or '-' in t),
+]
+
+
+def bet_type_breakdown(rows):
+    taken = set()
+    groups = []
+    for name, matches in BET_TYPES:
+        group = []
+        for idx, row in enumerate(rows):
+            if idx in taken or not _graded(row):
+                continue
+            if matches(_search_text(row)):
+                taken.add(idx)
+                group.append(row)
+        if group:
+            groups.append((name, group))
+    other = [r for idx, r in enumerate(rows) if idx not in taken and _graded(r)]
+    if other:
+        groups.append(('Other', other))
+    return ''.join(_stat_row(name, group) for name, group in groups)
+
+
+# customOrder in calculateMonthlyBreakdown(); other months sort last.
+MONTH_ORDER = {f'{y}-{m:02d}': i for i, (y, m) in enumerate(
+    [(2025, m) for m in range(5, 13)] + [(2026, m) for m in range(1, 13)], start=1)}
+
+
+def monthly_breakdown(rows):
+    months = {}
+    for row in rows:
+        d = js_new_date(_get(row, 'Date', 'date'))
+        if d is None:
+            continue
+        key = f'{d.year}-{d.month:02d}'
+        months.setdefault(key, (f'{_MONTH_NAMES[d.month - 1]} {d.year}', []))[1].append(row)
+    ordered = sorted(months.items(), key=lambda kv: MONTH_ORDER.get(kv[0], 999))
+    return ''.join(_stat_row(name, month_rows) for _, (name, month_rows) in ordered)
+
+
+UNIT_LEVELS = [
+    ('🔥 MAX PLAY (3u+)', 3, math.inf),
+    ('⭐ HIGH (2u)', 2, 3),
+    ('✓ STANDARD (1u)', 1, 2),
+    ('📉 SMALL (0.5u)', 0, 1),
+]
+
+
+def unit_sizing_breakdown(rows):
+    out = []
+    for name, low, high in UNIT_LEVELS:
+        level = [r for r in rows if _graded(r, trim=False) and low <= extract_bet_size(r) < high]
+        if level:
+            stats = calculate_stats(level)
+            out.append(_tr([f'<td><strong>{name}</strong></td>', f'<td>{len(level)}</td>']
+                           + _metric_cells(stats)))
+    return ''.join(out)
+
+
+TEASER_TYPES = [
+    ('6.5-Point Teaser', re.compile(r'(6\.5|6\s*1/2)\s*-?\s*p', re.A | re.I)),
+    ('6-Point Teaser', re.compile(r'\b6(?!\.5|\s*1/2)\s*-?\s*p', re.A | re.I)),
+    ('7-Point Teaser', re.compile(r'\b7\s*-?\s*p', re.A | re.I)),
+]
+
+
+def teaser_breakdown(rows):
+    teasers = [r for r in rows if _graded(r) and BET_TYPES[0][1](_search_text(r))]
+    out = []
+    if teasers:
+        out.append(_stat_row('📊 TOTAL TEASERS', teasers,
+                             style='font-weight: bold; background-color: rgba(0, 224, 255, 0.1);'))
+    for name, pattern in TEASER_TYPES:
+        group = [r for r in teasers if pattern.search(_search_text(r))]
+        if group:
+            out.append(_stat_row(name, group))
+    return ''.join(out) or _empty('teaser')
+
+
+PARLAY_TYPES = [(f'{n}-Team Parlay', [str(n)]) for n in range(2, 7)] + [('7+ Team Parlay', ['7', '8', '9', '10'])]
+
+
+def _is_parlay(row):
+    text = _search_text(row)
+    return 'parlay' in text or 'parl' in text
+
+
+def parlay_breakdown(rows):
+    parlays = [r for r in rows if _is_parlay(r)]
+    out = []
+    for name, counts in PARLAY_TYPES:
+        patterns = [re.compile(c + r'\s*(team|leg)', re.I) for c in counts]
+        group = [r for r in parlays if any(p.search(_search_text(r)) for p in patterns)]
+        if group:
+            out.append(_stat_row(name, group))
+    if parlays:
+        out.append(_stat_row('', parlays,
+                             style='background-color: rgba(0, 224, 255, 0.1); font-weight: bold;',
+                             label_cell='<td style="color: var(--accent);"><strong>TOTAL PARLAYS</strong></td>'))
+    return ''.join(out) or _empty('parlay')
+
+
+FIVE_INNING_TYPES = [
+    ('Spread/Run Line', lambda p: ('+' in p or '-' in p) and 'over' not in p and 'under' not in p
+     and 'ml' not in p and 'moneyline' not in p),
+    ('Moneyline', lambda p: 'ml' in p or 'moneyline' in p),
+    ('Over', lambda p: 'over' in p),
+    ('Under', lambda p: 'under' in p),
+]
+
+
+def five_inning_breakdown(rows):
+    five = [r for r in rows if BET_TYPES[1][1](_search_text(r))]
+    if not five:
+        return _empty('5-inning')
+    out = []
+    for name, matches in FIVE_INNING_TYPES:
+        group = [r for r in five if matches(_get(r, 'Pick', 'pick').lower())]
+        if group:
+            out.append(_stat_row(name, group, last=_avg_odds_text(calculate_stats(group))))
+    return ''.join(out)
+
+
+def total_bets_breakdown(rows):
+    totals = [r for r in rows if any(w in _search_text(r) for w in ('over', 'under', 'total'))]
+    if not totals:
+        return _empty('total bets')
+    pick = lambda r: _get(r, 'Pick', 'pick').lower()
+    groups = [
+        ('All Total Bets', totals),
+        ('Over Bets', [r for r in totals if 'over' in pick(r)]),
+        ('Under Bets', [r for r in totals if 'under' in pick(r)]),
+        ('Team Totals', [r for r in totals if 'team total' in _search_text(r)]),
+        ('Game Totals', [r for r in totals if 'tt' not in _search_text(r) and 'team total' not in _search_text(r)]),
+        ('First Half Totals', [r for r in totals
+                               if any(w in _search_text(r) for w in ('1h', 'first half', '1st half'))]),
+    ]
+    return ''.join(_stat_row(name, group) for name, group in groups if group)
+
+
+def team_totals_by_sport(rows):
+    out = []
+    for sport in BREAKDOWN_SPORTS:
+        group = [r for r in rows if r.get('sport') == sport and 'team total' in _search_text(r)]
+        if group:
+            out.append(_stat_row(sport, group, label_cell=_sport_badge(sport),
+                                 last=_avg_odds_text(calculate_stats(group))))
+    return ''.join(out) or _empty('team total')
+
+
+TBODY_BUILDERS = {
+    'sport-breakdown': sport_breakdown,
+    'bet-type-breakdown': bet_type_breakdown,
+    'monthly-breakdown': monthly_breakdown,
+    'unit-sizing-breakdown': unit_sizing_breakdown,
+    'teaser-breakdown': teaser_breakdown,
+    'parlay-breakdown': parlay_breakdown,
+    'five-inning-breakdown': five_inning_breakdown,
+    'total-bets-breakdown': total_bets_breakdown,
+    'team-totals-by-sport': team_totals_by_sport,
+}
+
+
+def records_regions(rows, stat_classes=None):
+    """The stat divs and breakdown tbodies records.html renders for `rows`,
+    in the shape bake_seo_static_data.py injects. `stat_classes` are the
+    static classes of the stats the JS does not restyle (all but win-rate)."""
+    stat_classes = stat_classes or {}
+    stats = calculate_stats(rows)
+    avg = stats['avgOdds']
+    texts = {
+        'total-record': stats['record'],
+        'win-rate': js_to_fixed(stats['winRate'], 1) + '%',
+        'avg-odds': ('+' + js_str(avg)) if avg > 0 else js_str(avg),
+        'total-picks': str(stats['wins'] + stats['losses'] + stats['pushes']),
+    }
+    classes = {sid: stat_classes.get(sid, 'stat-value') for sid in RECORDS_STATS}
+    classes['win-rate'] = 'stat-value ' + ('positive' if stats['winRate'] >= 50 else 'negative')
+    return {
+        'stats': {sid: {'text': texts[sid], 'class': classes[sid]} for sid in RECORDS_STATS},
+        'tbodies': {tid: TBODY_BUILDERS[tid](rows) for tid in RECORDS_TBODIES},
+    }
+
+
+# ---- upcomingpicks.html ----
+
+def papa_rows(text):
+    """Papa.parse(..., {header: true, skipEmptyLines: 'greedy',
+    transformHeader: trim}).data"""
+    records = [r for r in csv.reader(io.StringIO(text)) if ''.join(r).strip() != '']
+    if not records:
+        return []
+    headers = [h.strip() for h in records[0]]
+    rows = []
+    for record in records[1:]:
+        row = {}
+        for idx, value in enumerate(record):
+            if idx < len(headers):
+                row[headers[idx]] = value
+            else:
+                row.setdefault('__parsed_extra', []).append(value)
+        rows.append(row)
+    return rows
+
+
+_STATUS = {
+    'W': '<span style="color: #39ff14; font-weight: bold;">✓ WIN</span>',
+    'L': '<span style="color: #ff3131; font-weight: bold;">✗ LOSS</span>',
+    'P': '<span style="color: #ffc107; font-weight: bold;">⟳ PUSH</span>',
+}
+_RESULTS = {'W': 'W', 'WIN': 'W', 'L': 'L', 'LOSS': 'L', 'P': 'P', 'PUSH': 'P'}
+
+
+def _game_day(value):
+    """parseDate() in upcomingpicks.html: M/D[/Y], year 2025 when missing."""
+    if not value:
+        return None
+    parts = re.split(r'[-/]', value.strip())
+    if len(parts) < 2:
+        return js_new_date(value)
+    month, day = js_parse_int(parts[0]), js_parse_int(parts[1])
+    year = js_parse_int(parts[2]) if len(parts) > 2 and parts[2] else 2025
+    if month is None or day is None or year is None:
+        return None
+    if year < 100:
+        year += 2000
+    return _js_date(year, month - 1, day)
+
+
+def pick_status(pick, now):
+    result = _RESULTS.get((pick.get('Result') or '').strip().upper())
+    if result:
+        return _STATUS[result]
+    day = _game_day(pick.get('Date'))
+    if day and now > datetime(day.year, day.month, day.day, 23, 59, 59):
+        return '<span style="color: #00e0ff;">⏳ Grading...</span>'
+    return '<span class="status-pending">⏱️ Pending</span>'
+
+
+def upcoming_picks_html(text, now=None):
+    """The #picks-table-body innerHTML upcomingpicks.html renders, trimmed."""
+    now = now or datetime.now(timezone.utc).replace(tzinfo=None)
+    picks = [p for p in papa_rows(text) if p.get('Pick') and p['Pick'].strip()]
+    if not picks:
+        return f'<tr><td colspan="5">{NO_PICKS_MSG}</td></tr>'
+    out = []
+    for pick in picks:
+        cells = [_text(pick.get(col) or '--') for col in ('Date', 'Game', 'Pick', 'Line')]
+        cells.append(pick_status(pick, now))
+        out.append('\n <tr>\n' + ''.join(f' <td>{c}</td>\n' for c in cells) + ' </tr>\n ')
+    return ''.join(out).strip()
+
+
+# ---- sources ----
+
+def fetch_text(url):
+    req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0 (BetLegend SEO bake)'})
+    with urllib.request.urlopen(req, timeout=30) as response:
+        return response.read().decode('utf-8-sig')
+
+
+def fetch_sources(workers=8):
+    """Every CSV the two pages load, keyed like SOURCE_URLS. Raises on any
+    failed fetch: a bake must never publish totals missing a sport."""
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        texts = pool.map(fetch_text, SOURCE_URLS.values())
+        return dict(zip(SOURCE_URLS, texts))
+
+
+def record_fixtures(directory, sources=None):
+    """Snapshot the live CSVs plus ncaaf-records.html into `directory`."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    sources = sources or fetch_sources()
+    manifest = {'recorded': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'), 'sources': {}}
+    for name, text in sources.items():
+        filename = f'{name}.csv'
+        (directory / filename).write_text(text, encoding='utf-8', newline='')
+        manifest['sources'][name] = {'url': SOURCE_URLS[name], 'file': filename}
+    (directory / NCAAF_RECORDS_PAGE).write_bytes((ROOT / NCAAF_RECORDS_PAGE).read_bytes())
+    (directory / 'manifest.json').write_text(json.dumps(manifest, indent=1) + '\n', encoding='utf-8')
+    return manifest
+
+
+def load_fixtures(directory):
+    """(sources, ncaaf_html, manifest) from a record_fixtures() directory."""
+    directory = Path(directory)
+    manifest = json.loads((directory / 'manifest.json').read_text(encoding='utf-8'))
+    sources = {name: (directory / entry['file']).read_bytes().decode('utf-8')
+               for name, entry in manifest['sources'].items()}
+    ncaaf_html = (directory / NCAAF_RECORDS_PAGE).read_bytes().decode('utf-8')
+    return sources, ncaaf_html, manifest
+
+
+def aggregate(sources, ncaaf_html=None, stat_classes=None, now=None):
+    """(records, picks_html) for the bake, from fetch_sources()-style CSVs."""
+    if ncaaf_html is None:
+        ncaaf_html = (ROOT / NCAAF_RECORDS_PAGE).read_text(encoding='utf-8')
+    rows = load_records(sources, ncaaf_html)
+    return records_regions(rows, stat_classes), upcoming_picks_html(sources['upcoming'], now)
@@ -37,6 +37,8 @@ import re
 import subprocess
 import sys
 
+from calendar_shards import read_calendar_js
+
 REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 # sport key -> (hub file, calendar js)
@@ -108,7 +110,7 @@ def source_candidates(cal_path):
     """Newest-first candidate list: primary pick first within each date."""
     entries = [
         {'date': d, 'page': p, 'title': t}
-        for d, p, t in ENTRY_RE.findall(read(cal_path))
+        for d, p, t in ENTRY_RE.findall(read_calendar_js(cal_path))
         if is_concrete(p) and os.path.exists(os.path.join(REPO, p))
     ]
     out = []
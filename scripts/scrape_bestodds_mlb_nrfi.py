@@ -3,6 +3,7 @@ from __future__ import annotations
 import argparse
 import csv
 import json
+import sys
 from datetime import date, datetime
 from pathlib import Path
 from typing import Any
@@ -10,6 +11,9 @@ from zoneinfo import ZoneInfo
 
 import requests
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from odds_history import quotes_from_prop_rows, record_safely  # noqa: E402
+
 
 DESKTOP_ROOT = Path.home() / "Desktop" / "MLB_Props"
 BESTODDS_EDGE_URL = "https://edge.bestodds.com/api/the-base/nrfi-enhanced"
@@ -137,6 +141,7 @@ def main() -> None:
     payload = fetch_bestodds_nrfi()
     rows = normalize_rows(payload, target_date)
     write_outputs(rows, payload, Path(args.output_dir), target_date)
+    record_safely("baseball_mlb", quotes_from_prop_rows(rows), "bestodds")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Screenshot preview/review pages (desktop + mobile) for before/after evidence.
+
+Ported from screenshot_preview_pages.js, which opened a new context per page
+per device and shot them one after another. Shots now run concurrently on the
+shared browser_pool.py browser, and with --local an unchanged page is copied
+from the screenshot cache instead of being rendered again.
+
+Usage:
+  python scripts/screenshot_preview_pages.py <outdir> <label> [--base URL | --local] [--jobs N] [pages...]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+from browser_pool import LIVE_BASE, run
+
+DEFAULT_PAGES = [
+    'padres-at-dodgers-ohtani-king-analysis-stats-preview.html',
+    'canada-vs-morocco-analysis-stats-preview.html',
+    'brewers-braves-padres-rangers-degrom-friday-board-mlb.html',
+    'world-cup-round-of-16-canada-morocco-france-paraguay-saturday-soccer.html',
+    '76ers-vs-celtics-analysis-stats-preview.html',
+    'warriors-vs-thunder-nba-analysis-stats-preview.html',
+    '9-alabama-vs-8-oklahoma-cfp-prediction-picks.html',
+]
+DEVICES = [('desktop', (1440, 1000)), ('mobile', (390, 844))]
+
+
+def shot_path(outdir, label, device, page):
+    slug = (page[:-len('.html')] if page.endswith('.html') else page)[:60]
+    return os.path.join(outdir, f'{label}-{device}-{slug}.png')
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Full-page desktop + mobile screenshots of preview pages.')
+    ap.add_argument('outdir')
+    ap.add_argument('label')
+    ap.add_argument('pages', nargs='*', help='Pages to shoot (default: a fixed preview sample).')
+    where = ap.add_mutually_exclusive_group()
+    where.add_argument('--base', default=LIVE_BASE, help=f'Site to shoot (default {LIVE_BASE}).')
+    where.add_argument('--local', action='store_true', help='Shoot the working tree from a local server.')
+    ap.add_argument('--jobs', type=int, default=None, help='Concurrent pages (default: one per core).')
+    args = ap.parse_args(argv)
+    os.makedirs(args.outdir, exist_ok=True)
+    targets = args.pages or DEFAULT_PAGES
+
+    async def shoot(pool):
+        shots = [(p, device, vp, shot_path(args.outdir, args.label, device, p))
+                 for p in targets for device, vp in DEVICES]
+        records = await asyncio.gather(*(pool.screenshot(p, vp, path, full_page=True, wait_until='networkidle',
+                                                         settle_ms=1200)
+                                         for p, device, vp, path in shots))
+        return list(zip(shots, records))
+
+    failed = 0
+    for (p, device, vp, path), rec in run(shoot, jobs=args.jobs, base=None if args.local else args.base):
+        if rec['status'] == 'OK':
+            print(f"OK {path}{' (cached)' if rec.get('cached') else ''}")
+        else:
+            failed += 1
+            print(f"FAIL {p} {device}: {rec['status']}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
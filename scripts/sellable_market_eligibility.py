@@ -3,14 +3,30 @@
 
 These rules do not repair source data. They fail closed so unresolved identity
 or market gaps cannot grade or surface public betting trend records.
+
+Loaders filtering a whole history use PublicTrendGuardrails rather than calling
+public_trend_exclusion_reason per row: the public decision only depends on the
+sport, the two team names and which moneylines are missing, so it is evaluated
+once per distinct combination and the decision table is kept in
+data/cache/public-trend-guardrails.json between loads.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
 
+GUARDRAIL_CACHE = Path(__file__).resolve().parent.parent / "data" / "cache" / "public-trend-guardrails.json"
+
+# Bump when public_trend_exclusion_reason starts reading a new game field, so
+# cached decision tables keyed on the old inputs are discarded.
+PUBLIC_TREND_RULES_VERSION = 1
+
+
 APPROVED_NHL_TEAMS = {
     "Anaheim Ducks",
     "Anaheim Mighty Ducks",
@@ -160,3 +176,82 @@ def public_trend_exclusion_reason(game: dict[str, Any], sport: str | None) -> st
         return "blocked_unresolved_nhl_one_sided_moneyline"
     return None
 
+
+
+def _rules_digest() -> str:
+    rules = {
+        "version": PUBLIC_TREND_RULES_VERSION,
+        "nhl": sorted(APPROVED_NHL_TEAMS),
+        "aliases": UNVERIFIED_PUBLIC_TEAM_ALIASES,
+    }
+    return hashlib.sha1(json.dumps(rules, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+
+
+def public_trend_key(game: dict[str, Any], sport: str | None) -> str:
+    """Everything public_trend_exclusion_reason reads from a row, as one key."""
+    return "|".join((
+        (sport or game.get("Sport") or "").upper(),
+        str(game.get("AwayTeam") or ""),
+        str(game.get("HomeTeam") or ""),
+        "1" if game.get("AwayMoneyline") in (None, "") else "0",
+        "1" if game.get("HomeMoneyline") in (None, "") else "0",
+    ))
+
+
+class PublicTrendGuardrails:
+    """public_trend_exclusion_reason, evaluated once per distinct key.
+
+    With a cache_path the decision table is loaded from / saved to disk, so a
+    reload of an unchanged history never re-runs the rules. The table is
+    discarded when the alias tables, approved-team set or
+    PUBLIC_TREND_RULES_VERSION change.
+    """
+
+    def __init__(self, cache_path: Path | None = None) -> None:
+        self.cache_path = cache_path
+        self.digest = _rules_digest()
+        self.decisions: dict[str, str | None] = {}
+        self.dirty = False
+        if cache_path is not None and cache_path.exists():
+            try:
+                raw = json.loads(cache_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                raw = {}
+            if raw.get("rules") == self.digest:
+                self.decisions = raw.get("decisions", {})
+
+    def reason(self, game: dict[str, Any], sport: str | None) -> str | None:
+        key = public_trend_key(game, sport)
+        try:
+            return self.decisions[key]
+        except KeyError:
+            decision = self.decisions[key] = public_trend_exclusion_reason(game, sport)
+            self.dirty = True
+            return decision
+
+    def mask(self, games: list[dict[str, Any]], sport: str | None) -> list[bool]:
+        """True for every row that may appear in public trend samples."""
+        reason = self.reason
+        return [reason(g, sport) is None for g in games]
+
+    def filter(self, games: list[dict[str, Any]], sport: str | None) -> list[dict[str, Any]]:
+        kept = [g for g, keep in zip(games, self.mask(games, sport)) if keep]
+        self.save()
+        return kept
+
+    def save(self) -> None:
+        if not self.dirty or self.cache_path is None:
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            payload = {"rules": self.digest, "decisions": dict(sorted(self.decisions.items()))}
+            self.cache_path.write_text(json.dumps(payload, indent=1) + "\n", encoding="utf-8")
+        except OSError:
+            return
+        self.dirty = False
+
+
+def filter_public_trend_rows(games: list[dict[str, Any]], sport: str | None,
+                             cache_path: Path | None = GUARDRAIL_CACHE) -> list[dict[str, Any]]:
+    """Rows of `games` allowed into public trend samples, in order."""
+    return PublicTrendGuardrails(cache_path).filter(games, sport)
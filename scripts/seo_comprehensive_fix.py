@@ -10,14 +10,17 @@ This script fixes all identified SEO issues:
 4. Wrong canonical references
 
 Run this script from the repository root.
+
+The page fixes (1, 2, 4) are registered with html_rewrite as "seo-canonicals".
 """
 
 import os
 import re
-import glob
 from datetime import datetime
 
-REPO_ROOT = r'C:\Users\Nima\nimadamus.github.io'
+from html_rewrite import REPO, rewrite, transform
+
+REPO_ROOT = REPO
 CANONICAL_DOMAIN = 'https://www.betlegendpicks.com'
 SITEMAP_DOMAIN = 'https://www.betlegendpicks.com'  # Standardize to www
 
@@ -119,45 +122,30 @@ def fix_wrong_canonical(filepath, content):
     return content, False
 
 
-def process_html_files():
-    """Process all HTML files for SEO fixes."""
-    html_files = glob.glob(os.path.join(REPO_ROOT, '**', '*.html'), recursive=True)
-
-    # Exclude .git directory
-    html_files = [f for f in html_files if '.git' not in f]
-
-    files_modified = 0
-
-    for filepath in html_files:
-        try:
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                original_content = f.read()
+@transform('seo-canonicals')
+def fix_canonicals(rel, content):
+    """Drop wrong/duplicate canonicals and force www canonical URLs."""
+    filepath = os.path.join(REPO_ROOT, rel)
 
-            content = original_content
-            modified = False
+    # Apply fixes in order
+    content, _ = fix_wrong_canonical(filepath, content)
+    content, _ = fix_duplicate_canonicals(filepath, content)
+    content, _ = standardize_www(filepath, content)
+    return content
 
-            # Apply fixes in order
-            content, changed = fix_wrong_canonical(filepath, content)
-            modified = modified or changed
 
-            content, changed = fix_duplicate_canonicals(filepath, content)
-            modified = modified or changed
-
-            content, changed = standardize_www(filepath, content)
-            modified = modified or changed
-
-            if modified:
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                files_modified += 1
-
-        except Exception as e:
+def process_html_files():
+    """Process all HTML files for SEO fixes."""
+    # In-process (workers=1) so fixes_made collects the per-file details
+    # the report lists.
+    results = rewrite(['seo-canonicals'], workers=1)
+    for r in results:
+        if r.error:
             fixes_made['errors'].append({
-                'file': filepath,
-                'error': str(e)
+                'file': r.rel,
+                'error': r.error
             })
-
-    return files_modified
+    return sum(1 for r in results if r.applied)
 
 
 def fix_sitemap():
@@ -1,15 +1,15 @@
 from __future__ import annotations
 
 import argparse
-import csv
 from pathlib import Path
 
 import pandas as pd
 import requests
 
+from mlb_prop_ledger import DAILY_CARD, TRACKER_PATH, PropLedger
+
 
 DESKTOP_ROOT = Path.home() / "Desktop" / "MLB_Props"
-TRACKER_PATH = DESKTOP_ROOT / "MLB_DAILY_PROP_TRACKER.csv"
 MLB_API = "https://statsapi.mlb.com/api/v1"
 
 
@@ -100,19 +100,28 @@ def write_summary(target_date: str, rows: list[dict[str, str]]) -> Path:
 
 def main() -> int:
     args = parse_args()
-    if not TRACKER_PATH.exists():
-        raise SystemExit(f"Missing tracker: {TRACKER_PATH}")
-    with TRACKER_PATH.open("r", newline="", encoding="utf-8") as f:
-        rows = list(csv.DictReader(f))
-        fields = list(rows[0].keys()) if rows else []
-    first_inning_results = fetch_first_inning_results(args.date)
-    updated = [settle_row(row, first_inning_results) for row in rows]
-    with TRACKER_PATH.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fields)
-        writer.writeheader()
-        writer.writerows(updated)
+    with PropLedger() as ledger:
+        ledger.import_csv(DAILY_CARD, TRACKER_PATH)
+        if not ledger.count(DAILY_CARD):
+            raise SystemExit(f"Missing tracker: {TRACKER_PATH}")
+        if ledger.csv_diverged(DAILY_CARD, TRACKER_PATH):
+            # Settling would re-export the CSV over the hand edits.
+            raise SystemExit(f"{TRACKER_PATH} was edited outside the ledger; run "
+                             f"`python scripts/mlb_prop_ledger.py --adopt-csv` first.")
+        # Only this slate's open first-inning plays can be graded from its results.
+        open_rows = ledger.open_rows(DAILY_CARD, date=args.date, family="first_inning")
+        if open_rows:
+            first_inning_results = fetch_first_inning_results(args.date)
+            graded = [(prop_id, settle_row(dict(row), first_inning_results)) for prop_id, row in open_rows]
+            settled = ledger.settle(DAILY_CARD, [(prop_id, row) for prop_id, row in graded
+                                                 if row.get("result") not in {"", "PENDING"}])
+            if settled:
+                ledger.export_csv(DAILY_CARD, TRACKER_PATH)
+        else:
+            settled = 0
+        updated = ledger.rows(DAILY_CARD, date=args.date)
     summary_path = write_summary(args.date, updated)
-    print(f"Updated {TRACKER_PATH}")
+    print(f"Updated {TRACKER_PATH} ({settled} settled, {len(open_rows) - settled} still open)")
     print(f"Saved {summary_path}")
     return 0
 
@@ -8,6 +8,8 @@ from typing import Any
 
 import pandas as pd
 
+from mlb_prop_ledger import EV_PROPS, PropLedger, prop_key
+
 
 DESKTOP_ROOT = Path.home() / "Desktop" / "MLB_Props"
 BOX_ROOT = Path.home() / "endgame" / "cache" / "boxscores"
@@ -23,12 +25,28 @@ def load_json(path: Path) -> list[dict[str, Any]]:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def load_boxscores(season: int) -> tuple[pd.DataFrame, pd.DataFrame]:
-    pitchers = pd.read_parquet(BOX_ROOT / f"pitchers_{season}.parquet")
-    batters = pd.read_parquet(BOX_ROOT / f"batters_{season}.parquet")
+PITCHER_COLUMNS = ["date", "game_pk", "pitcher_name", "is_starter", "k", "outs_recorded"]
+BATTER_COLUMNS = ["date", "game_pk", "batter_name", "h", "d", "t", "hr"]
+
+
+def load_boxscores(season: int, dates: list[str]) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Box score rows for just the given slate dates (pushed down into the parquet read)."""
+    filters = [("date", "in", sorted(set(dates)))]
+    pitchers = pd.read_parquet(BOX_ROOT / f"pitchers_{season}.parquet", columns=PITCHER_COLUMNS, filters=filters)
+    batters = pd.read_parquet(BOX_ROOT / f"batters_{season}.parquet", columns=BATTER_COLUMNS, filters=filters)
     return pitchers, batters
 
 
+def ledger_entry(row: dict[str, Any]) -> dict[str, Any]:
+    """An EV prop row with the ledger key fields filled in."""
+    return {
+        **row,
+        "date": row["game_date"],
+        "family": row["market"],
+        "selection": f"{row['player']} {row['side']} {row['line']} @ {row.get('bookmaker', '')}",
+    }
+
+
 def total_bases_from_row(row: pd.Series) -> int:
     singles = int(row["h"]) - int(row["d"]) - int(row["t"]) - int(row["hr"])
     return singles + 2 * int(row["d"]) + 3 * int(row["t"]) + 4 * int(row["hr"])
@@ -99,8 +117,20 @@ def main() -> int:
     for row in rows:
         row["game_date"] = slate_date
 
-    pitchers, batters = load_boxscores(season)
-    settled = [settle_row(row, pitchers, batters) for row in rows]
+    entries = [ledger_entry(row) for row in rows]
+    current = {prop_key(row) for row in entries}
+    with PropLedger() as ledger:
+        ledger.upsert(EV_PROPS, entries, refresh=True)
+        # Only still-open props are graded; ones settled on an earlier run are
+        # read back from the ledger as they were.
+        open_rows = ledger.open_rows(EV_PROPS, date=slate_date)
+        graded = {}
+        if open_rows:
+            pitchers, batters = load_boxscores(season, [slate_date])
+            graded = {prop_id: settle_row(row, pitchers, batters) for prop_id, row in open_rows}
+            ledger.settle(EV_PROPS, [(prop_id, row) for prop_id, row in graded.items() if row["settled"]])
+        settled = [graded.get(prop_id, row) for prop_id, row in ledger.entries(EV_PROPS, date=slate_date)
+                   if prop_key(row) in current]
     output_path.write_text(json.dumps(settled, indent=2), encoding="utf-8")
 
     graded = [row for row in settled if row["settled"]]
@@ -1,521 +1,14 @@
-// SOCCER Archive Calendar Data
-// Last updated: August 22, 2026
+// SOCCER Archive Calendar Index
+// Last updated: October 19, 2026
 // Auto-generated by sync_calendars.py - DO NOT EDIT MANUALLY
-
-const ARCHIVE_DATA = [
-    { date: "2026-08-22", page: "real-madrid-espanyol-manchester-united-hull-city-saturday-soccer.html", title: "Soccer Saturday: Real Madrid, United At Hull" },
-    { date: "2026-08-20", page: "europa-conference-playoff-first-legs-benfica-ajax-brighton-soccer.html", title: "Soccer Thursday: Europa And Conference Playoff Legs" },
-    { date: "2026-08-18", page: "champions-league-playoff-fenerbahce-lyon-dinamo-zagreb-soccer.html", title: "Champions League Playoff Round: Three First Legs" },
-    { date: "2026-08-16", page: "racing-santander-villarreal-laliga-ajax-eredivisie-sunday-soccer.html", title: "Soccer Sunday: Racing Santander Hosts Villarreal" },
-    { date: "2026-08-15", page: "laliga-opening-day-sevilla-rayo-nashville-inter-miami-soccer.html", title: "Soccer Saturday: LaLiga Opens, Nashville Hosts Miami" },
-    { date: "2026-08-13", page: "leagues-cup-phase-one-finale-timbers-tijuana-libertadores-soccer.html", title: "Soccer Thursday: Leagues Cup Phase One Closes" },
-    { date: "2026-08-11", page: "lyon-sparta-prague-boca-fluminense-libertadores-tuesday-soccer.html", title: "Soccer Tuesday: Lyon Trail Sparta In The Third Round" },
-    { date: "2026-08-10", page: "plymouth-exeter-devon-derby-monday-soccer.html", title: "Soccer Monday: Devon Derby Opens League Cup" },
-    { date: "2026-08-09", page: "leagues-cup-sounders-nashville-rangers-porto-opener-sunday-soccer.html", title: "Soccer Sunday Analysis: Leagues Cup, Rangers, Porto" },
-    { date: "2026-08-07", page: "leagues-cup-second-round-gotham-brugge-friday-soccer.html", title: "Soccer Friday: Leagues Cup, Gotham And Brugge" },
-    { date: "2026-08-06", page: "leagues-cup-america-nycfc-six-match-thursday-soccer.html", title: "Soccer Thursday: Leagues Cup Opens Six Ties" },
-    { date: "2026-08-05", page: "leagues-cup-opens-inter-miami-fenerbahce-bombonera-soccer.html", title: "Soccer: Leagues Cup, Fenerbahce, La Bombonera" },
-    { date: "2026-08-04", page: "leagues-cup-liga-mx-mls-six-match-tuesday-soccer.html", title: "Leagues Cup: Eighteen Matches Against Three" },
-    { date: "2026-08-03", page: "celtic-park-opener-sirius-unbeaten-velez-independiente-soccer.html", title: "Soccer: Celtic Park Opens, Sirius Still Unbeaten" },
-    { date: "2026-08-01", page: "messi-crew-lafc-whitecaps-cascadia-liga-mx-saturday-soccer.html", title: "Messi Hosts The Crew Plus A Cascadia Derby" },
-    { date: "2026-07-30", page: "benfica-on-the-brink-boca-gremio-sudamericana-second-legs-soccer.html", title: "Benfica On The Brink, Sudamericana Second Legs" },
-    { date: "2026-07-29", page: "iraola-liverpool-wrexham-yankee-stadium-mls-all-star-soccer.html", title: "MLS All-Stars, Liverpool-Wrexham Headline Wednesday" },
-    { date: "2026-07-28", page: "alonso-debut-sydney-super-cup-stoke-everton-como-cup-soccer.html", title: "Alonso's Chelsea Debut Headlines Tuesday's Soccer" },
-    { date: "2026-07-25", page: "liverpool-sunderland-inter-miami-lafc-saturday-soccer.html", title: "Soccer: Liverpool's Preseason Opener and MLS Saturday" },
-    { date: "2026-07-24", page: "manchester-united-rosenborg-barcelona-tijuana-leon-friday-soccer.html", title: "Soccer: Man United and Barcelona Preseason Friday" },
-    { date: "2026-07-22", page: "mls-midweek-nashville-vancouver-inter-miami-fifteen-match-wednesday-soccer.html", title: "MLS Midweek Board: Nashville And Vancouver" },
-    { date: "2026-07-21", page: "fenerbahce-red-star-champions-league-qualifiers-cruz-azul-toluca-soccer.html", title: "Fenerbahce, Red Star And A Faroese Champion" },
-    { date: "2026-07-20", page: "allsvenskan-malmo-djurgarden-uruguay-intermedio-monday-soccer.html", title: "Allsvenskan And Uruguay Monday Soccer Analysis" },
-    { date: "2026-07-19", page: "argentina-spain-world-cup-final-day-metlife-soccer.html", title: "Argentina Spain World Cup Final Day Soccer Analysis" },
-    { date: "2026-07-18", page: "world-cup-third-place-france-england-summer-leagues-soccer.html", title: "World Cup Third Place Soccer Analysis" },
-    { date: "2026-07-17", page: "el-trafico-nashville-atlanta-wave-current-friday-night-soccer.html", title: "El Trafico and NWSL: Friday Soccer Analysis" },
-    { date: "2026-07-11", page: "norway-england-argentina-switzerland-world-cup-quarterfinals-soccer.html", title: "Norway vs England, Argentina vs Switzerland - July 11, 2026" },
-    { date: "2026-07-10", page: "spain-vs-belgium-world-cup-quarterfinal-soccer.html", title: "Spain vs Belgium: A World Cup Quarterfinal At SoFi" },
-    { date: "2026-07-09", page: "france-moneyline-morocco-world-cup-quarterfinal-soccer-pick.html", title: "France Moneyline vs Morocco: World Cup QF Pick" },
-    { date: "2026-07-09", page: "world-cup-quarterfinals-begin-france-morocco-last-eight-soccer.html", title: "World Cup Quarterfinals Begin: France vs Morocco" },
-    { date: "2026-07-08", page: "world-cup-quarterfinals-set-france-morocco-argentina-switzerland-preview-soccer.html", title: "World Cup Quarterfinals Are Set: The Last Eight" },
-    { date: "2026-07-07", page: "world-cup-round-of-16-argentina-egypt-switzerland-colombia-tuesday-soccer.html", title: "World Cup Round of 16: Argentina and Colombia Ties" },
-    { date: "2026-07-06", page: "world-cup-round-of-16-spain-portugal-usa-belgium-monday-soccer.html", title: "World Cup Round of 16: Spain-Portugal, USA-Belgium" },
-    { date: "2026-07-05", page: "world-cup-round-of-16-brazil-norway-mexico-england-sunday-soccer.html", title: "World Cup Round of 16: Brazil-Norway, Mexico-England" },
-    { date: "2026-07-04", page: "world-cup-round-of-16-canada-morocco-france-paraguay-saturday-soccer.html", title: "Soccer Analysis - July 4, 2026" },
-    { date: "2026-07-03", page: "world-cup-round-of-32-argentina-cape-verde-colombia-ghana-friday-soccer.html", title: "World Cup Round of 32 Friday Knockout Ties" },
-    { date: "2026-07-02", page: "world-cup-round-of-32-spain-portugal-croatia-switzerland-thursday-soccer.html", title: "Soccer Analysis - July 2, 2026" },
-    { date: "2026-07-01", page: "world-cup-round-of-32-england-usa-switzerland-mexico-wednesday-soccer.html", title: "Soccer Analysis - July 1, 2026" },
-    { date: "2026-06-30", page: "world-cup-round-of-32-france-sweden-mexico-ecuador-tuesday-soccer.html", title: "World Cup Round of 32 Tuesday: France, Mexico, Norway" },
-    { date: "2026-06-29", page: "world-cup-round-of-32-brazil-japan-germany-paraguay-netherlands-morocco-soccer.html", title: "Soccer Analysis - June 29, 2026" },
-    { date: "2026-06-27", page: "world-cup-group-finale-england-argentina-portugal-colombia-soccer.html", title: "World Cup Group Stage Finale Analysis Preview" },
-    { date: "2026-06-26", page: "world-cup-final-group-matchday-france-norway-spain-uruguay-soccer.html", title: "World Cup Final Group Matchday Analysis Preview" },
-    { date: "2026-06-25", page: "world-cup-group-finale-usa-germany-netherlands-soccer.html", title: "World Cup Group Stage Finale Analysis Preview" },
-    { date: "2026-06-24", page: "world-cup-matchday-three-switzerland-canada-brazil-scotland-mexico-soccer.html", title: "Soccer Analysis - June 24, 2026" },
-    { date: "2026-06-23", page: "england-ghana-portugal-uzbekistan-croatia-panama-world-cup-matchday-2-soccer.html", title: "Soccer Analysis - June 23, 2026" },
-    { date: "2026-06-22", page: "argentina-austria-france-iraq-world-cup-matchday-2-monday-soccer.html", title: "Soccer Analysis - June 22, 2026" },
-    { date: "2026-06-21", page: "spain-saudi-arabia-belgium-iran-world-cup-matchday-2-sunday-soccer.html", title: "Soccer Analysis - June 21, 2026" },
-    { date: "2026-06-20", page: "germany-ivory-coast-netherlands-sweden-world-cup-group-stage-saturday-soccer.html", title: "Soccer Analysis - June 20, 2026" },
-    { date: "2026-06-19", page: "usa-australia-brazil-haiti-world-cup-group-stage-friday-soccer.html", title: "Soccer Analysis - June 19, 2026" },
-    { date: "2026-06-18", page: "mexico-south-korea-switzerland-canada-world-cup-group-stage-soccer.html", title: "Soccer Analysis - June 18, 2026" },
-    { date: "2026-06-17", page: "portugal-drc-uzbekistan-colombia-ghana-panama-world-cup-group-stage-soccer.html", title: "Soccer Analysis - June 17, 2026" },
-    { date: "2026-06-16", page: "france-senegal-argentina-algeria-world-cup-group-stage-soccer.html", title: "Soccer Analysis - June 16, 2026" },
-    { date: "2026-06-15", page: "spain-belgium-uruguay-world-cup-group-stage-soccer.html", title: "Soccer Analysis - June 15, 2026" },
-    { date: "2026-06-14", page: "germany-netherlands-world-cup-sunday-group-stage-soccer.html", title: "World Cup Analysis - June 14, 2026" },
-    { date: "2026-06-13", page: "brazil-morocco-qatar-switzerland-world-cup-group-stage-soccer.html", title: "World Cup Analysis: Brazil, Switzerland, Scotland" },
-    { date: "2026-06-12", page: "world-cup-canada-bosnia-usa-paraguay-co-hosts-open-soccer.html", title: "World Cup Soccer Analysis - June 12, 2026" },
-    { date: "2026-06-11", page: "world-cup-opener-mexico-south-africa-korea-czechia-soccer.html", title: "World Cup Opener Soccer Analysis - June 11, 2026" },
-    { date: "2026-06-10", page: "england-costa-rica-portugal-nigeria-world-cup-tuneups-soccer.html", title: "England, Portugal World Cup Tuneups Preview" },
-    { date: "2026-06-09", page: "world-cup-2026-kickoff-mexico-usa-canada-soccer.html", title: "World Cup 2026 Kickoff Preview - June 09, 2026" },
-    { date: "2026-06-08", page: "france-northern-ireland-netherlands-uzbekistan-world-cup-tuneups-soccer.html", title: "France, Netherlands World Cup Tuneups Preview" },
-    { date: "2026-06-07", page: "morocco-norway-greece-italy-world-cup-tuneup-friendlies-soccer.html", title: "Morocco-Norway, Greece-Italy Friendlies Preview" },
-    { date: "2026-06-06", page: "world-cup-warmup-friendlies-usa-germany-brazil-egypt-soccer.html", title: "Soccer Analysis: World Cup Warm-Up Friendlies Preview" },
-    { date: "2026-06-05", page: "canada-ireland-haiti-peru-world-cup-sendoffs-soccer.html", title: "Soccer Analysis: World Cup Send-Off Friendlies" },
-    { date: "2026-06-03", page: "italy-moneyline-luxembourg-baldini-new-era-friendly-soccer-pick.html", title: "Italy Moneyline vs Luxembourg Pick" },
-    { date: "2026-06-03", page: "netherlands-algeria-congo-denmark-world-cup-tuneups-soccer.html", title: "Soccer Analysis" },
-    { date: "2026-06-02", page: "croatia-belgium-wales-ghana-world-cup-tuneups-soccer.html", title: "Soccer Analysis" },
-    { date: "2026-06-01", page: "scandinavian-derby-world-cup-tuneups-soccer.html", title: "Soccer Analysis - June 1, 2026" },
-    { date: "2026-06-01", page: "sweden-vs-norway-scandinavian-derby-world-cup-tuneup-soccer-analysis-stats-preview.html", title: "Sweden vs Norway Analysis and Stats Preview" },
-    { date: "2026-05-31", page: "usa-vs-senegal-world-cup-tuneup-charlotte-soccer.html", title: "Soccer Analysis - USA vs Senegal World Cup Tune-Up in Charlotte - May 31, 2026" },
-    { date: "2026-05-30", page: "psg-arsenal-champions-league-final-soccer.html", title: "Soccer Analysis - PSG vs Arsenal Champions League Final - May 30, 2026" },
-    { date: "2026-05-29", page: "bosnia-north-macedonia-world-cup-warmup-friendlies-soccer.html", title: "Soccer Analysis - World Cup Warmup Friendlies - May 29, 2026" },
-    { date: "2026-05-28", page: "copa-libertadores-group-stage-finale-soccer.html", title: "Soccer Analysis - Copa Libertadores Group Stage Finale - May 28, 2026" },
-    { date: "2026-05-27", page: "crystal-palace-rayo-vallecano-conference-league-final-leipzig-soccer.html", title: "Soccer Analysis - May 27, 2026" },
-    { date: "2026-05-26", page: "crystal-palace-rayo-vallecano-conference-league-final-preview-soccer.html", title: "Soccer Analysis - May 26, 2026" },
-    { date: "2026-05-25", page: "psg-arsenal-champions-league-final-preview-soccer.html", title: "Soccer Analysis - May 25, 2026" },
-    { date: "2026-05-24", page: "tottenham-everton-final-day-survival-soccer.html", title: "Soccer Analysis - May 24, 2026" },
-    { date: "2026-05-23", page: "barcelona-lyon-womens-champions-league-final-soccer.html", title: "Soccer Preview: Women's Champions League Final - May 23, 2026" },
-    { date: "2026-05-22", page: "liga-mx-clausura-final-cruz-azul-pumas-week-soccer.html", title: "Soccer Preview: Liga MX Clausura Final Week - May 22, 2026" },
-    { date: "2026-05-21", page: "conference-league-final-week-copa-libertadores-group-c-soccer.html", title: "Soccer: Libertadores and Final Week - May 21, 2026" },
-    { date: "2026-05-20", page: "aston-villa-freiburg-europa-league-final-istanbul-soccer.html", title: "Soccer Preview: Aston Villa vs Freiburg - Europa League Final - May 20, 2026" },
-    { date: "2026-05-19", page: "europa-league-final-eve-aston-villa-freiburg-istanbul-soccer.html", title: "Soccer Preview: Europa League Final Eve - Aston Villa vs Freiburg - May 19, 2026" },
-    { date: "2026-05-18", page: "arsenal-burnley-title-door-premier-league-soccer.html", title: "Arsenal vs Burnley Premier League Title Race Preview" },
-    { date: "2026-05-17", page: "psg-ajax-galatasaray-sunday-soccer.html", title: "Soccer Sunday Preview: PSG, Ajax, PSV and Galatasaray for May 17, 2026" },
-    { date: "2026-05-16", page: "soccer-may-16-2026-recovery.html", title: "Soccer Archive - May 16, 2026" },
-    { date: "2026-05-15", page: "aston-villa-liverpool-friday-soccer-run-in.html", title: "Soccer Friday Preview: Aston Villa-Liverpool, League Two Playoffs and NWSL May 15, 2026" },
-    { date: "2026-05-14", page: "soccer-previews-archive-may-2026.html#2026-05-14", title: "SOCCER Analysis - 2026-05-14" },
-    { date: "2026-05-13", page: "soccer-midweek-reset-europa-league-nwsl-premier-league.html", title: "Soccer Midweek Reset: Europa League, NWSL and Premier League May 13, 2026" },
-    { date: "2026-05-12", page: "al-nassr-al-hilal-saudi-title-decider-soccer.html", title: "Al Nassr vs Al Hilal Saudi Title Decider Preview" },
-    { date: "2026-05-12", page: "arsenal-sporting-bayern-real-madrid-second-leg-soccer.html", title: "Al Nassr vs Al Hilal Saudi Title Decider Preview" },
-    { date: "2026-05-11", page: "tottenham-leeds-survival-rayo-girona-relegation-soccer.html", title: "Soccer Analysis - May 11, 2026" },
-    { date: "2026-05-10", page: "soccer-previews-archive-may-2026.html", title: "SOCCER Analysis - 2026-05-10" },
-    { date: "2026-05-09", page: "liverpool-chelsea-anfield-premier-league-soccer.html", title: "Soccer Analysis - May 09, 2026" },
-    { date: "2026-05-08", page: "dortmund-frankfurt-bundesliga-levante-osasuna-laliga-soccer.html", title: "Soccer Analysis - May 08, 2026" },
-    { date: "2026-05-07", page: "villa-forest-freiburg-braga-europa-league-semis-soccer.html", title: "Soccer Analysis - May 07, 2026" },
-    { date: "2026-05-06", page: "bayern-psg-allianz-second-leg-uefa-champions-league-soccer.html", title: "Soccer Analysis - May 06, 2026" },
-    { date: "2026-05-05", page: "arsenal-atletico-madrid-emirates-second-leg-soccer.html", title: "Soccer Analysis - May 05, 2026" },
-    { date: "2026-05-04", page: "everton-city-roma-fiorentina-monday-soccer.html", title: "Soccer Analysis - May 04, 2026" },
-    { date: "2026-05-03", page: "liverpool-vs-manchester-united-soccer-analysis-stats-preview.html", title: "Liverpool vs Manchester United Analysis May 03, 2026" },
-    { date: "2026-05-03", page: "man-united-liverpool-real-madrid-sunday-soccer.html", title: "Soccer Analysis - May 03, 2026" },
-    { date: "2026-05-02", page: "arsenal-fulham-osasuna-barcelona-saturday-soccer.html", title: "Soccer Analysis - May 02, 2026" },
-    { date: "2026-05-01", page: "leeds-vs-burnley-elland-road-final-stretch-premier-league-soccer.html", title: "Soccer Analysis - May 01, 2026" },
-    { date: "2026-04-30", page: "europa-league-semifinal-first-legs-forest-villa-braga-freiburg-shakhtar-palace-soccer.html", title: "Soccer Analysis - April 30, 2026" },
-    { date: "2026-04-29", page: "champions-league-semifinal-week-other-fixtures-soccer.html", title: "Soccer Analysis - April 29, 2026" },
-    { date: "2026-04-28", page: "psg-bayern-champions-league-semifinal-tuesday-soccer.html", title: "Soccer Analysis - April 28, 2026" },
-    { date: "2026-04-28", page: "psg-vs-bayern-munich-soccer-analysis-stats-preview.html", title: "PSG vs Bayern Munich Analysis April 28, 2026" },
-    { date: "2026-04-27", page: "manchester-united-brentford-old-trafford-monday-soccer.html", title: "Soccer Analysis - April 27, 2026" },
-    { date: "2026-04-26", page: "chelsea-leeds-fa-cup-milan-juventus-derby-italia-sunday-soccer.html", title: "Soccer Analysis - April 26, 2026" },
-    { date: "2026-04-25", page: "arsenal-newcastle-liverpool-palace-getafe-barca-saturday-soccer.html", title: "Soccer Analysis - April 25, 2026" },
-    { date: "2026-04-24", page: "real-madrid-betis-la-liga-premier-league-friday-soccer.html", title: "Soccer Analysis - April 24, 2026" },
-    { date: "2026-04-23", page: "stuttgart-freiburg-dfb-pokal-semifinal-la-liga-soccer.html", title: "Soccer Analysis - April 23, 2026" },
-    { date: "2026-04-22", page: "leverkusen-bayern-dfb-pokal-semifinal-man-city-burnley-soccer.html", title: "Soccer Analysis - April 22, 2026" },
-    { date: "2026-04-21", page: "inter-como-coppa-italia-semifinal-second-leg-soccer.html", title: "Soccer Analysis - April 21, 2026" },
-    { date: "2026-04-20", page: "palace-west-ham-selhurst-relegation-battle-premier-league-soccer.html", title: "Soccer Analysis - April 20, 2026" },
-    { date: "2026-04-19", page: "man-city-arsenal-merseyside-derby-bayern-soccer.html", title: "Soccer Analysis - April 19, 2026" },
-    { date: "2026-04-18", page: "chelsea-manchester-united-matchweek-33-premier-league-soccer.html", title: "Soccer Analysis - April 18, 2026" },
-    { date: "2026-04-17", page: "st-pauli-koln-relegation-battle-bundesliga-soccer.html", title: "Soccer Analysis - April 17, 2026" },
-    { date: "2026-04-16", page: "soccer-previews-archive-april-2026.html#2026-04-16", title: "SOCCER Analysis - 2026-04-16" },
-    { date: "2026-04-15", page: "bayern-real-madrid-classic-rivalry-arsenal-sporting-ucl-quarterfinals-soccer.html", title: "Soccer Analysis - April 15, 2026" },
-    { date: "2026-04-14", page: "champions-league-quarterfinal-anfield-miracle-atletico-barcelona-soccer.html", title: "Soccer Analysis - April 14, 2026" },
-    { date: "2026-04-13", page: "roses-rivalry-man-united-leeds-premier-league-soccer.html", title: "Soccer Analysis - April 13, 2026" },
-    { date: "2026-04-12", page: "chelsea-man-city-title-race-tottenham-relegation-battle-soccer.html", title: "Soccer Analysis - April 12, 2026" },
-    { date: "2026-04-11", page: "arsenal-bournemouth-liverpool-fulham-premier-league-soccer.html", title: "Soccer Analysis - April 11, 2026" },
-    { date: "2026-04-10", page: "real-madrid-girona-west-ham-wolves-premier-league-la-liga-friday-soccer.html", title: "Soccer Analysis - April 10, 2026" },
-    { date: "2026-04-09", page: "europa-conference-league-quarterfinals-porto-forest-palace-fiorentina-soccer.html", title: "Soccer Analysis - April 9, 2026" },
-    { date: "2026-04-08", page: "champions-league-quarterfinals-psg-liverpool-barcelona-atletico-soccer.html", title: "Soccer Analysis - April 8, 2026" },
-    { date: "2026-04-07", page: "champions-league-quarterfinals-real-madrid-bayern-arsenal-sporting-soccer.html", title: "Soccer Analysis - April 7, 2026" },
-    { date: "2026-04-06", page: "napoli-ac-milan-scudetto-showdown-juventus-serie-a-soccer.html", title: "Soccer Analysis - April 6, 2026" },
-    { date: "2026-04-05", page: "inter-roma-serie-a-derby-la-liga-sunday-soccer.html", title: "Soccer Analysis - April 5, 2026" },
-    { date: "2026-04-04", page: "man-city-liverpool-fa-cup-atletico-barca-freedom-park-soccer.html", title: "Soccer Analysis - April 4, 2026" },
-    { date: "2026-04-02", page: "barcelona-real-madrid-uwcl-boca-juniors-gremio-palmeiras-soccer.html", title: "Soccer Analysis - April 2, 2026" },
-    { date: "2026-04-01", page: "chelsea-arsenal-uwcl-london-derby-bayern-man-united-soccer.html", title: "Soccer Analysis - April 1, 2026" },
-    { date: "2026-03-31", page: "portugal-usa-world-cup-warmup-brazil-croatia-mexico-belgium-soccer.html", title: "Soccer Analysis - March 31, 2026" },
-    { date: "2026-03-30", page: "soccer-previews-archive-march-2026.html#2026-03-30", title: "SOCCER Analysis - 2026-03-30" },
-    { date: "2026-03-29", page: "soccer-previews-archive-march-2026.html#2026-03-29", title: "SOCCER Analysis - 2026-03-29" },
-    { date: "2026-03-28", page: "soccer-march28-content.html", title: "Soccer Analysis - Saturday, March 28, 2026" },
-    { date: "2026-03-27", page: "soccer-previews-archive-march-2026.html#2026-03-27", title: "SOCCER Analysis - 2026-03-27" },
-    { date: "2026-03-26", page: "world-cup-european-playoff-semifinals-soccer.html", title: "Soccer Analysis - March 26, 2026" },
-    { date: "2026-03-25", page: "soccer-previews-archive-march-2026.html#2026-03-25", title: "SOCCER Analysis - 2026-03-25" },
-    { date: "2026-03-24", page: "soccer-previews-archive-march-2026.html#2026-03-24", title: "SOCCER Analysis - 2026-03-24" },
-    { date: "2026-03-22", page: "soccer-previews-archive-march-2026.html", title: "SOCCER Analysis - 2026-03-22" },
-    { date: "2026-03-21", page: "soccer-previews-archive-march-2026.html#2026-03-21", title: "SOCCER Analysis - 2026-03-21" },
-    { date: "2026-03-20", page: "bournemouth-man-united-premier-league-friday-villarreal-sociedad-soccer.html", title: "Soccer Analysis - March 20, 2026" },
-    { date: "2026-03-20", page: "soccer.html", title: "Soccer Analysis - March 20, 2026" },
-    { date: "2026-03-19", page: "soccer-previews-archive-march-2026.html#2026-03-19", title: "SOCCER Analysis - 2026-03-19" },
-    { date: "2026-03-18", page: "champions-league-r16-barcelona-newcastle-liverpool-galatasaray-bayern-soccer.html", title: "Soccer Analysis - March 18, 2026" },
-    { date: "2026-03-17", page: "champions-league-r16-city-madrid-arsenal-leverkusen-chelsea-psg-soccer.html", title: "Soccer Analysis - March 17, 2026" },
-    { date: "2026-03-16", page: "brentford-wolves-relegation-battle-premier-league-soccer.html", title: "Soccer Analysis - March 16, 2026" },
-    { date: "2026-03-15", page: "liverpool-tottenham-anfield-showdown-man-utd-villa-premier-league-soccer.html", title: "Soccer Analysis - March 15, 2026" },
-    { date: "2026-03-14", page: "liverpool-tottenham-leverkusen-bayern-super-saturday-soccer.html", title: "Soccer Game Previews Analysis Saturday March 14 2026" },
-    { date: "2026-03-13", page: "bundesliga-relegation-battle-monchengladbach-st-pauli-soccer.html", title: "Soccer Game Previews Analysis Friday March 13 2026" },
-    { date: "2026-03-12", page: "europa-league-round-of-16-first-legs-roma-villa-soccer.html", title: "Soccer Analysis - March 12, 2026" },
-    { date: "2026-03-11", page: "real-madrid-man-city-psg-chelsea-champions-league-knockout-soccer.html", title: "Soccer Analysis - March 11, 2026" },
-    { date: "2026-03-10", page: "champions-league-knockout-stage-newcastle-barcelona-liverpool-galatasaray-soccer.html", title: "Soccer Analysis - March 10, 2026" },
-    { date: "2026-03-09", page: "fa-cup-west-ham-brentford-la-liga-serie-a-soccer.html", title: "Soccer Game Previews Analysis Monday March 9 2026" },
-    { date: "2026-03-08", page: "fa-cup-fifth-round-leeds-fulham-la-liga-bundesliga-soccer.html", title: "FA Cup Leeds La Liga Bundesliga Soccer March 8 2026" },
-    { date: "2026-03-07", page: "fa-cup-newcastle-man-city-barcelona-la-liga-bundesliga-soccer.html", title: "FA Cup Newcastle Man City Soccer Previews March 7 2026" },
-    { date: "2026-03-06", page: "wolves-liverpool-fa-cup-revenge-psg-monaco-le-classique-soccer.html", title: "Soccer Analysis Friday March 6 2026 Wolves Liverpool FA Cup PSG Monaco Le Classique" },
-    { date: "2026-03-05", page: "spurs-relegation-crisis-crystal-palace-coupe-de-france-lens-soccer.html", title: "Soccer Analysis Thursday March 5 2026 Spurs Relegation Crisis Crystal Palace Coupe de France" },
-    { date: "2026-03-04", page: "brighton-arsenal-man-city-forest-premier-league-soccer.html", title: "Soccer Game Previews Analysis Wednesday March 4 2026" },
-    { date: "2026-03-03", page: "wolves-liverpool-premier-league-title-race-soccer.html", title: "Soccer Game Previews Analysis Tuesday March 3 2026" },
-    { date: "2026-03-02", page: "real-madrid-getafe-serie-a-la-liga-soccer.html", title: "Soccer Game Previews Analysis Monday March 2 2026" },
-    { date: "2026-03-01", page: "arsenal-chelsea-london-derby-premier-league-soccer.html", title: "Soccer Game Previews Analysis Sunday March 1 2026" },
-    { date: "2026-02-27", page: "premier-league-wolves-villa-european-leagues-soccer.html", title: "Soccer Game Previews Analysis Friday February 27 2026" },
-    { date: "2026-02-26", page: "europa-league-forest-fenerbahce-celtic-soccer.html", title: "Soccer Game Previews Analysis Thursday February 26 2026 Europa League" },
-    { date: "2026-02-25", page: "real-madrid-benfica-psg-monaco-ucl-soccer.html", title: "UCL Previews Analysis February 25 2026" },
-    { date: "2026-02-24", page: "champions-league-atletico-inter-newcastle-soccer.html", title: "Soccer Game Previews Analysis Tuesday February 24 2026" },
-    { date: "2026-02-23", page: "soccer-predictions-picks-best-bets.html", title: "Soccer Predictions Picks Best Bets Monday February 23 2026" },
-    { date: "2026-02-22", page: "soccer-predictions-picks-best-bets-v2.html", title: "Soccer Predictions Picks Best Bets Sunday February 22 2026" },
-    { date: "2026-02-20", page: "soccer-predictions-picks-best-bets-v3.html", title: "Soccer Predictions Picks Best Bets Friday February 20 2026" },
-    { date: "2026-02-19", page: "soccer-predictions-picks-best-bets-v4.html", title: "Soccer Predictions Picks Best Bets February 19 2026" },
-    { date: "2026-02-18", page: "soccer-predictions-picks-best-bets-v5.html", title: "Soccer Picks Best Bets February 18 2026" },
-    { date: "2026-02-17", page: "soccer-predictions-picks-best-bets-v6.html", title: "Soccer Picks Best Bets February 17 2026" },
-    { date: "2026-02-16", page: "soccer-predictions-picks-best-bets-v7.html", title: "Soccer Predictions Picks Best Bets Monday February 16 2026" },
-    { date: "2026-02-15", page: "soccer-predictions-picks-best-bets-v8.html", title: "Soccer Analysis - February 15, 2026" },
-    { date: "2026-02-14", page: "soccer-predictions-picks-best-bets-v9.html", title: "Soccer Analysis - February 14, 2026" },
-    { date: "2026-02-13", page: "soccer-predictions-picks-best-bets-v10.html", title: "Soccer Analysis - February 13, 2026" },
-    { date: "2026-02-12", page: "soccer-predictions-picks-best-bets-v11.html", title: "Soccer Analysis - February 12, 2026" },
-    { date: "2026-02-11", page: "soccer-predictions-picks-best-bets-v12.html", title: "Soccer Analysis - February 11, 2026" },
-    { date: "2026-02-10", page: "soccer-predictions-picks-best-bets-v13.html", title: "Soccer Analysis - February 10, 2026" },
-    { date: "2026-02-09", page: "soccer-predictions-picks-best-bets-v14.html", title: "Soccer Analysis - February 9, 2026" },
-    { date: "2026-02-08", page: "soccer-predictions-picks-best-bets-v15.html", title: "Soccer Analysis - February 8, 2026" },
-    { date: "2026-02-07", page: "soccer-predictions-picks-best-bets-v16.html", title: "Soccer Analysis - February 7, 2026" },
-    { date: "2026-02-06", page: "soccer-predictions-picks-best-bets-v17.html", title: "Soccer Analysis - February 6, 2026" },
-    { date: "2026-02-05", page: "soccer-predictions-picks-best-bets-v18.html", title: "Soccer Analysis - February 5, 2026" },
-    { date: "2026-02-04", page: "soccer-predictions-picks-best-bets-v19.html", title: "Soccer Analysis - February 4, 2026" },
-    { date: "2026-02-03", page: "soccer-predictions-picks-best-bets-v20.html", title: "Soccer Analysis - February 3, 2026" },
-    { date: "2026-02-02", page: "soccer-predictions-picks-best-bets-v21.html", title: "Soccer Analysis - February 2, 2026" },
-    { date: "2026-02-01", page: "soccer-predictions-picks-best-bets-v22.html", title: "Soccer Analysis - February 1, 2026" },
-    { date: "2026-01-30", page: "soccer-predictions-picks-best-bets-v23.html", title: "Soccer Analysis - January 30, 2026" },
-    { date: "2026-01-29", page: "soccer-predictions-picks-best-bets-v24.html", title: "Soccer Analysis - January 29, 2026" },
-    { date: "2026-01-27", page: "soccer-predictions-picks-best-bets-v25.html", title: "Soccer Analysis - January 27, 2026" },
-    { date: "2026-01-26", page: "soccer-predictions-picks-best-bets-v26.html", title: "Soccer Analysis - January 26, 2026" },
-    { date: "2026-01-25", page: "soccer-predictions-picks-best-bets-v27.html", title: "SOCCER Analysis - January 25, 2026" },
-    { date: "2026-01-24", page: "soccer-predictions-picks-best-bets-v28.html", title: "Soccer Analysis - January 24, 2026" },
-    { date: "2026-01-23", page: "soccer-predictions-picks-best-bets-v29.html", title: "Soccer Analysis - January 23, 2026" },
-    { date: "2026-01-22", page: "soccer-predictions-picks-best-bets-v30.html", title: "Soccer Analysis - January 22, 2026" },
-    { date: "2026-01-21", page: "soccer-predictions-picks-best-bets-v31.html", title: "Soccer Analysis - January 21, 2026" },
-    { date: "2026-01-20", page: "soccer-predictions-picks-best-bets-v32.html", title: "Soccer Analysis - January 20, 2026" },
-    { date: "2026-01-19", page: "soccer-predictions-picks-best-bets-v33.html", title: "Soccer Analysis - January 19, 2026" },
-    { date: "2026-01-18", page: "soccer-predictions-picks-best-bets-v34.html", title: "Soccer Analysis - January 18, 2026" },
-    { date: "2026-01-17", page: "soccer-predictions-picks-best-bets-v35.html", title: "Soccer Analysis - January 17, 2026" },
-    { date: "2026-01-16", page: "soccer-predictions-picks-best-bets-v36.html", title: "Soccer Analysis - January 16, 2026" },
-    { date: "2026-01-15", page: "soccer-predictions-picks-best-bets-v37.html", title: "Soccer Analysis - January 15, 2026" },
-    { date: "2026-01-14", page: "soccer-predictions-picks-best-bets-v38.html", title: "Soccer Analysis - January 14, 2026" },
-    { date: "2026-01-13", page: "soccer-predictions-picks-best-bets-v39.html", title: "Soccer Analysis - January 13, 2026" },
-    { date: "2026-01-12", page: "soccer-predictions-picks-best-bets-v40.html", title: "Soccer Analysis - January 12, 2026" },
-    { date: "2026-01-11", page: "soccer-predictions-picks-best-bets-v41.html", title: "Soccer Analysis - January 11, 2026" },
-    { date: "2026-01-10", page: "soccer-predictions-picks-best-bets-v42.html", title: "Soccer Analysis - January 10, 2026" },
-    { date: "2026-01-09", page: "soccer-predictions-picks-best-bets-v43.html", title: "Soccer Analysis - January 09, 2026" },
-    { date: "2026-01-08", page: "soccer-predictions-picks-best-bets-v44.html", title: "Soccer Analysis - January 08, 2026" },
-    { date: "2026-01-07", page: "soccer-predictions-picks-best-bets-v45.html", title: "SOCCER Analysis - January 07, 2026" },
-    { date: "2026-01-06", page: "soccer-predictions-picks-best-bets-v46.html", title: "SOCCER Analysis - January 06, 2026" },
-    { date: "2026-01-05", page: "soccer-predictions-picks-best-bets-v47.html", title: "Soccer Analysis - January 05, 2026" },
-    { date: "2026-01-04", page: "soccer-predictions-picks-best-bets-v48.html", title: "SOCCER Analysis - January 04, 2026" },
-    { date: "2026-01-03", page: "soccer-predictions-picks-best-bets-v49.html", title: "Soccer Analysis - January 03, 2026" },
-    { date: "2026-01-02", page: "archives/soccer/2026-01-02.html", title: "SOCCER Archive - 2026-01-02" },
-    { date: "2026-01-02", page: "soccer-predictions-picks-best-bets-v50.html", title: "SOCCER Analysis - January 02, 2026" },
-    { date: "2026-01-01", page: "soccer-predictions-picks-best-bets-january-01-2026-part-2.html", title: "SOCCER Analysis - January 01, 2026 Part 2" },
-    { date: "2026-01-01", page: "soccer-predictions-picks-best-bets-v51.html", title: "SOCCER Analysis - January 01, 2026" },
-    { date: "2025-12-28", page: "soccer-predictions-picks-best-bets-v52.html", title: "SOCCER Analysis - December 28, 2025" },
-    { date: "2025-12-27", page: "soccer-predictions-picks-best-bets-v53.html", title: "SOCCER Analysis - December 27, 2025" },
-    { date: "2025-12-26", page: "soccer-predictions-picks-best-bets-v54.html", title: "SOCCER Analysis - December 26, 2025" },
-    { date: "2025-12-19", page: "soccer-predictions-picks-best-bets-v55.html", title: "Soccer Analysis - December 19, 2025" },
-    { date: "2025-11-28", page: "soccer-predictions-picks-best-bets-v56.html", title: "SOCCER Analysis - November 28, 2025" },
-];
-
-const dateMap = {};
-ARCHIVE_DATA.forEach(item => { if (!dateMap[item.date]) dateMap[item.date] = item; });
-
-const pageToDateMap = {};
-ARCHIVE_DATA.forEach(item => { pageToDateMap[item.page] = item.date; });
-
-const SPORT_HUB_PAGE = 'soccer-previews.html';
-const SPORT_LABEL = 'Soccer';
-const MAIN_PAGES = ['nba.html', 'nhl.html', 'ncaab.html', 'ncaaf.html', 'nfl.html', 'mlb.html', 'soccer.html', 'nba-previews.html', 'nhl-previews.html', 'mlb-previews.html', 'soccer-previews.html', 'college-basketball-previews.html'];
-function isConcreteContentPage(page) {
-    // Pick pages use their own template (no archive calendar sidebar); a stale
-    // hub must never redirect to one as the day's board (soccer hub, June 3 2026).
-    // Featured-game (*-analysis-stats-preview) pages load featured-games-calendar.js
-    // (the all-sports marquee calendar) and have their own Featured hub; a SPORT hub
-    // must never redirect to one, or it swaps in the featured calendar and drops
-    // sport-only dates (MLB June 4 went blank when the MLB hub redirected there, June 22 2026).
-    // The combined season 'picks-predictions-analysis-<month>-<year>' pages are blog/Pick
-    // Archive indexes, not a day's preview; a hub must not redirect to one (NCAAB July 7 2026).
-    return !!page && !MAIN_PAGES.includes(page) && !page.includes('#') && !page.includes('-archive-') && !/-analysis-stats-preview\.html$/.test(page) && !/-picks?(?:-v\d+)?\.html$/.test(page) && !/picks-predictions-analysis-[a-z]+-\d{4}\.html$/.test(page);
-}
-const latestContentEntry = ARCHIVE_DATA.find(item => item.page && item.page !== SPORT_HUB_PAGE);
-const latestConcreteEntry = ARCHIVE_DATA.find(item => isConcreteContentPage(item.page));
-window.LATEST_CONTENT_PAGE = latestConcreteEntry ? latestConcreteEntry.page : (latestContentEntry ? latestContentEntry.page : null);
-
-function getLocalDateString(date) {
-    const parts = new Intl.DateTimeFormat('en-US', {
-        timeZone: 'America/Los_Angeles',
-        year: 'numeric',
-        month: '2-digit',
-        day: '2-digit'
-    }).formatToParts(date).reduce((acc, part) => {
-        acc[part.type] = part.value;
-        return acc;
-    }, {});
-    return parts.year + '-' + parts.month + '-' + parts.day;
-}
-
-// Current real date is separate from the active article/page date.
-const todayStr = getLocalDateString(new Date());
-
-const todayMonth = todayStr.substring(0, 7);
-const latestAvailableDate = latestConcreteEntry ? latestConcreteEntry.date : (ARCHIVE_DATA.length > 0 ? ARCHIVE_DATA[0].date : todayStr);
-const todayHasData = ARCHIVE_DATA.some(item => item.date === todayStr && isConcreteContentPage(item.page));
-
-// Handle both root pages and archive pages
-const pathname = window.location.pathname;
-let currentPage;
-if (pathname.includes('/archives/')) {
-    // For archive pages, get the full relative path from archives/
-    currentPage = pathname.replace(/^\//, '');
-} else {
-    // For root pages, just get the filename
-    currentPage = pathname.split('/').pop() || 'index.html';
-}
-
-const isMainPage = MAIN_PAGES.includes(currentPage);
-const forcedDate = window.FORCED_PAGE_DATE || null;
-// Hub/main pages never get a current-page "Article" highlight, even if a
-// stale window.FORCED_PAGE_DATE is left in the hub HTML.
-const activeArticleDate = isMainPage ? null : (forcedDate || pageToDateMap[currentPage] || null);
-const currentPageDate = activeArticleDate;
-
-const months = new Set();
-ARCHIVE_DATA.forEach(item => { const [y, m] = item.date.split('-'); months.add(y + '-' + m); });
-// Always include the current month so the hub calendar can point at today.
-months.add(todayMonth);
-
-// Main/hub pages show today's month; archive pages show their month
-const sortedMonths = Array.from(months).sort().reverse();
-const monthNames = ['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September', 'October', 'November', 'December'];
-
-// Dated preview pages should open on the article month; undated hubs open on the current month.
-let displayMonth = activeArticleDate ? activeArticleDate.substring(0, 7) : (isMainPage ? todayMonth : sortedMonths[0]);
-
-function installCalendarStateStyles() {
-    if (document.getElementById('mlb-calendar-state-styles')) return;
-    const style = document.createElement('style');
-    style.id = 'mlb-calendar-state-styles';
-    style.textContent = `
-.calendar-days .cal-day,.calendar-grid .calendar-day{position:relative}
-.calendar-days .cal-day.is-linked,.calendar-days .cal-day.has-content{cursor:pointer;background:rgba(0,229,255,.15);color:#00e5ff;font-weight:700;border:1px solid rgba(0,229,255,.32)}
-.calendar-days .cal-day.is-linked:hover,.calendar-days .cal-day.has-content:hover{background:rgba(0,229,255,.25);box-shadow:0 0 12px rgba(0,229,255,.28)}
-.calendar-days .cal-day.is-disabled{opacity:.82}
-.calendar-days .cal-day.is-past:not(.current-page):not(.today){color:#9aa3af}
-.calendar-days .cal-day.is-future:not(.current-page):not(.today){color:#c7ced8}
-.calendar-days .cal-day.today{border:2px solid #ffd54f!important;box-shadow:0 0 0 1px rgba(255,213,79,.34),0 0 12px rgba(255,213,79,.28)!important}
-.calendar-days .cal-day.current-page{background:rgba(0,229,255,.72)!important;color:#fff!important;border:2px solid #00e5ff!important;font-weight:900!important;box-shadow:0 0 12px rgba(0,229,255,.45)!important}
-.calendar-days .cal-day.today.current-page{background:linear-gradient(135deg,rgba(0,229,255,.72),rgba(255,213,79,.42))!important;border-color:#ffd54f!important}
-`;
-    document.head.appendChild(style);
-}
-
-function navigateToCalendarPage(page) {
-    if (page) window.location.href = '/' + page;
-}
-
-// Multi-post dates go straight to that day's main slate/preview page (no chooser popup).
-// Falls back to the first/newest post if no slate-style page is found.
-function pickPrimaryPostForDate(postsForDate) {
-    const slate = postsForDate.find(item => {
-        const t = (item.title || '').toLowerCase();
-        const p = (item.page || '').toLowerCase();
-        return /\banalysis\b|\bpreview\b|\bslate\b|\bboard\b|\bfull card\b/.test(t)
-            || /-game-|-slate-|-board-|-previews|full-card/.test(p);
-    });
-    return slate || postsForDate[0];
-}
-
-// Popup chooser fully removed (Nima): clicking a date opens the page directly.
-
-function renderCalendar(yearMonth) {
-    const [year, month] = yearMonth.split('-').map(Number);
-    const yearEl = document.getElementById('cal-year') || document.querySelector('.year-display');
-    if (yearEl) yearEl.textContent = year;
-    const firstDay = new Date(year, month - 1, 1).getDay();
-    const daysInMonth = new Date(year, month, 0).getDate();
-    const container = document.getElementById('calendar-days') || document.getElementById('calendarDays');
-    if (!container) return;
-    container.innerHTML = '';
-    for (let i = 0; i < firstDay; i++) { const cell = document.createElement('div'); cell.className = 'cal-day empty'; container.appendChild(cell); }
-    for (let d = 1; d <= daysInMonth; d++) {
-        const dateStr = year + '-' + String(month).padStart(2, '0') + '-' + String(d).padStart(2, '0');
-        const postsForDate = ARCHIVE_DATA.filter(item => item.date === dateStr && item.page);
-        const hasData = postsForDate.length > 0 ? postsForDate[0] : null;
-        let classes = 'cal-day';
-        if (dateStr === currentPageDate) classes += ' current-page';
-        // NO 'today' marker (Nima, June 24 2026): the calendar highlights ONLY the
-        // date of the article being viewed (current-page). A separate gold 'today'
-        // cell was a wrong second highlight - on out-of-season sports (NHL/NBA) it lit
-        // a day with no article, and it fought the article's own date. Removed for good.
-        if (hasData) classes += ' has-content is-linked';
-        else classes += ' is-disabled';
-        if (dateStr < todayStr) classes += ' is-past';
-        if (dateStr > todayStr) classes += ' is-future';
-        const cell = document.createElement('div');
-        cell.className = classes;
-        if (!cell.dataset) cell.dataset = {};
-        cell.dataset.date = dateStr;
-        cell.dataset.currentDate = todayStr;
-        if (dateStr === currentPageDate) cell.dataset.activeArticleDate = currentPageDate;
-        if (hasData) cell.dataset.linked = 'true';
-        cell.textContent = d;
-        if (hasData) {
-            cell.title = postsForDate.map(item => item.title).join('\n');
-            cell.onclick = () => {
-                if (postsForDate.length === 1) navigateToCalendarPage(hasData.page);
-                else navigateToCalendarPage(pickPrimaryPostForDate(postsForDate).page);
-            };
-        }
-        container.appendChild(cell);
-    }
-}
-
-// Hub guard: a `*-previews.html` hub page bakes in the last published dated
-// slate/article. When that baked article is out of date (its FORCED_PAGE_DATE
-// is not today), it must not be presented as the current board. If a current/
-// upcoming concrete preview exists we redirect to it. Otherwise the baked
-// board STAYS VISIBLE (STALE_GUARD_BANNER_20260606, Nima June 6 2026: a
-// near-empty hub is worse for visitors and Googlebot than a clearly-dated
-// older board) and is labeled with its real date plus a link to the latest
-// available preview. It is never presented as today\u2019s board. No fabricated data.
-function renderPreviewHub() {
-    if (currentPage !== SPORT_HUB_PAGE || !SPORT_HUB_PAGE) return;
-    const baked = window.FORCED_PAGE_DATE || null;
-    // ALWAYS-LATEST HUB (Nima, July 7 2026): the nav "<Sport> Preview" link must land
-    // on the most recent published preview for that sport - NEVER a stale/offseason
-    // archive landing screen. Leave the hub as-is ONLY when today actually has a fresh
-    // concrete board (in-season daily slate baked in). Otherwise - offseason, a hand-
-    // built archive page with no FORCED_PAGE_DATE, or an in-season gap/off-day - fall
-    // through and redirect to the newest published concrete preview below. Keyed on real
-    // content presence (todayHasData), not on whether a baked date happens to exist, so
-    // a dead offseason archive page (e.g. college-basketball-previews.html in July) can
-    // never be the primary click target while published previews exist.
-    if (todayHasData) return;
-    // UNIFIED STALE-HUB POLICY (Nima, June 1 2026): redirect to the newest
-    // valid concrete preview so stale baked content can never stand in as
-    // today\u2019s board. Strip the stale articles first (belt-and-suspenders
-    // with the pre-paint head guard). Clean empty-state below is the fallback
-    // when no concrete entry exists. Same policy as the Featured Game hub.
-    // FALLBACK-TO-LATEST (Nima, June 16 2026): redirect to the newest published
-    // preview for this sport whenever today has none. Prefer a current/upcoming
-    // preview; otherwise load the most recent past one rather than showing an
-    // empty/near-empty board. Only a sport with zero concrete entries falls
-    // through to the labeled state below. Flag past-dated loads so the target
-    // can show a subtle "latest available" note.
-    const _latest = latestConcreteEntry || latestContentEntry || null;
-    if (_latest && _latest.page && _latest.page !== currentPage && _latest.page !== SPORT_HUB_PAGE) {
-        const _m = document.querySelector('.main-content');
-        if (_m) _m.querySelectorAll('.game-preview').forEach(function(el){ el.remove(); });
-        if (_latest.date < todayStr) { try { sessionStorage.setItem('bl_showing_latest', '1'); } catch (e) {} }
-        window.location.replace('/' + _latest.page);
-        return;
-    }
-    const main = document.querySelector('.main-content');
-    if (!main) return;
-
-    const hero = document.querySelector('header.hero');
-    if (hero) {
-        const badge = hero.querySelector('.hero-badge');
-        const h1 = hero.querySelector('h1');
-        const p = hero.querySelector('p');
-        if (badge) badge.textContent = SPORT_LABEL + ' Previews';
-        if (h1) h1.textContent = SPORT_LABEL + ' Game Preview Archive';
-        if (p) p.textContent = 'Browse the latest ' + SPORT_LABEL + ' previews and the full dated archive below. This page does not present older previews as today\u2019s board.';
-    }
-
-    // STALE_GUARD_BANNER_20260606: keep the baked articles visible - only label them.
-    const latest = latestConcreteEntry || latestContentEntry || null;
-    const block = document.createElement('div');
-    block.id = 'hub-state';
-    let html = '';
-    if (baked && !document.getElementById('board-date-note')) {
-        const bakedLabel = new Date(baked + 'T12:00:00').toLocaleDateString('en-US', { weekday: 'long', month: 'long', day: 'numeric', year: 'numeric' });
-        html += '<div style="text-align:center;padding:20px 24px;background:linear-gradient(145deg,#14171f,#0f1218);border:1px solid rgba(255,213,79,0.3);border-radius:12px;margin-bottom:24px;">'
-              + '<p style="font-size:12px;font-weight:700;letter-spacing:2px;text-transform:uppercase;color:#ffd54f;margin-bottom:8px;">Board From</p>'
-              + '<p style="font-size:18px;color:#fff;margin:0;">' + bakedLabel + '</p>'
-              + '</div>';
-    }
-    if (latest && latest.page !== SPORT_HUB_PAGE) {
-        const d = new Date(latest.date + 'T12:00:00').toLocaleDateString('en-US', { weekday: 'long', month: 'long', day: 'numeric', year: 'numeric' });
-        html += '<a href="/' + latest.page + '" style="display:block;text-decoration:none;background:linear-gradient(145deg,#14171f,#0f1218);border:1px solid rgba(255,213,79,0.3);border-radius:12px;padding:28px 32px;">'
-              + '<p style="font-size:12px;font-weight:700;letter-spacing:2px;text-transform:uppercase;color:#fd5000;margin-bottom:10px;">Latest ' + SPORT_LABEL + ' Preview</p>'
-              + '<p style="font-family:Orbitron,sans-serif;font-size:22px;color:#fff;margin:0 0 8px;line-height:1.25;">' + latest.title + '</p>'
-              + '<p style="color:#b0b8c4;font-size:14px;margin:0;">' + d + ' &nbsp;&rarr;</p>'
-              + '</a>';
-    }
-    block.innerHTML = html;
-    const mobile = main.querySelector('.mobile-archive');
-    if (mobile && mobile.nextSibling) main.insertBefore(block, mobile.nextSibling);
-    else if (mobile) main.appendChild(block);
-    else main.insertBefore(block, main.firstChild);
-}
-
-function initSportCalendar() {
-
-    installCalendarStateStyles();
-    renderPreviewHub();
-
-    const monthSelect = document.getElementById('month-select') || document.getElementById('monthSelect');
-    if (monthSelect) {
-        monthSelect.innerHTML = '';
-        sortedMonths.forEach(m => {
-            const [year, month] = m.split('-');
-            const opt = document.createElement('option');
-            opt.value = m;
-            opt.textContent = monthNames[parseInt(month) - 1] + ' ' + year;
-            if (m === displayMonth) opt.selected = true;
-            monthSelect.appendChild(opt);
-        });
-        monthSelect.addEventListener('change', function() { renderCalendar(this.value); });
-    }
-    renderCalendar(displayMonth);
-    const mobileSelect = document.getElementById('mobile-archive-select') || document.getElementById('mobileArchiveSelect');
-    if (mobileSelect) {
-        mobileSelect.innerHTML = '<option value="">Select a date...</option>';
-        ARCHIVE_DATA.forEach(item => {
-            const opt = document.createElement('option');
-            opt.value = item.page;
-            const dateObj = new Date(item.date + 'T12:00:00');
-            const dateLabel = dateObj.toLocaleDateString('en-US', { weekday: 'short', month: 'short', day: 'numeric' });
-            opt.textContent = dateLabel + ' - ' + item.title;
-            if (item.page === currentPage) opt.selected = true;
-            mobileSelect.appendChild(opt);
-        });
-        mobileSelect.addEventListener('change', (e) => { if (e.target.value) window.location.href = '/' + e.target.value; });
-    }
-}
-
-if (document.readyState === 'loading') { document.addEventListener('DOMContentLoaded', initSportCalendar); } else { initSportCalendar(); }
-
-/* SHOWING-LATEST NOTE (Nima, June 16 2026): when a hub fell back to the most
-   recent published item (no entry for today), show a subtle one-line note on the
-   destination article. Flag is set by the hub before redirect; cleared after use. */
-(function showLatestAvailableNote() {
-    function run() {
-        var flag;
-        try { flag = sessionStorage.getItem('bl_showing_latest'); } catch (e) { return; }
-        if (!flag) return;
-        try { sessionStorage.removeItem('bl_showing_latest'); } catch (e) {}
-        if (document.getElementById('bl-latest-note')) return;
-        var host = document.querySelector('.main-content') || document.querySelector('.page-wrapper') || document.body;
-        if (!host) return;
-        var note = document.createElement('div');
-        note.id = 'bl-latest-note';
-        note.setAttribute('style', 'max-width:900px;margin:90px auto 0;padding:10px 16px;border:1px solid rgba(0,229,255,0.3);border-radius:10px;background:rgba(0,229,255,0.06);color:#9fe9f5;font-size:13px;line-height:1.5;text-align:center;font-family:Inter,system-ui,sans-serif;');
-        note.textContent = 'Showing the latest available preview. No new post has been published for today yet.';
-        host.insertBefore(note, host.firstChild);
-    }
-    if (document.readyState === 'loading') { document.addEventListener('DOMContentLoaded', run); } else { run(); }
+// Entries: data/calendar/soccer/<YYYY-MM>.json; engine: scripts/calendar-runtime.js
+
+window.BL_SPORT_CALENDAR = {"sport": "soccer", "hubPage": "soccer-previews.html", "label": "Soccer", "mainPages": ["nba.html", "nhl.html", "ncaab.html", "ncaaf.html", "nfl.html", "mlb.html", "soccer.html", "nba-previews.html", "nhl-previews.html", "mlb-previews.html", "soccer-previews.html", "college-basketball-previews.html"], "dataBase": "/data/calendar/soccer/", "latestContent": {"date": "2026-08-22", "page": "real-madrid-espanyol-manchester-united-hull-city-saturday-soccer.html", "title": "Soccer Saturday: Real Madrid, United At Hull"}, "latestConcrete": {"date": "2026-08-22", "page": "real-madrid-espanyol-manchester-united-hull-city-saturday-soccer.html", "title": "Soccer Saturday: Real Madrid, United At Hull"}, "months": {"2025-11": {"n": 1, "v": "cdef4146b4"}, "2025-12": {"n": 4, "v": "ed95e9bf93"}, "2026-01": {"n": 31, "v": "57ff57e5eb"}, "2026-02": {"n": 26, "v": "a16eba22d5"}, "2026-03": {"n": 31, "v": "fa80aded97"}, "2026-04": {"n": 30, "v": "5d4a04b991"}, "2026-05": {"n": 33, "v": "99429bd0e0"}, "2026-06": {"n": 30, "v": "bf61e9f113"}, "2026-07": {"n": 23, "v": "52a600575d"}, "2026-08": {"n": 15, "v": "f2fe70b5d4"}}, "pages": {"0": "66dab60ddf", "1": "7183437d70", "2": "c2435281b6", "3": "4e882ffd08", "4": "506f27bdfc", "5": "08d7b4f987", "6": "4f22a33b50", "7": "b45b398fc4", "8": "df99252994", "9": "4e1e5e49b5", "10": "47931c6159", "11": "035bf54cf9", "12": "d6d8081e81", "13": "cc5e4b4ab8", "14": "eabd87542c", "15": "469e6f4727"}, "current": {"month": "2026-10", "entries": []}};
+(function loadCalendarRuntime() {
+    var me = document.currentScript && document.currentScript.src;
+    var base = me ? me.slice(0, me.lastIndexOf('/') + 1) : '/scripts/';
+    var s = document.createElement('script');
+    s.src = base + 'calendar-runtime.js?v=c5c93250003';
+    s.async = false;
+    (document.head || document.documentElement).appendChild(s);
 })();
@@ -20,6 +20,7 @@ This script makes the static links regenerate on EVERY publish; the pre-commit
 hook runs it and validate_homepage_crawl_links.py blocks a stale commit.
 """
 import re, sys, os, datetime
+from calendar_shards import read_calendar_js
 
 ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 INDEX = os.path.join(ROOT, "index.html")
@@ -77,7 +78,7 @@ def parse_dated_pages(path):
     """Parse `{ date: "YYYY-MM-DD", page: "x.html", title: "..." }` entries."""
     if not os.path.exists(path):
         return []
-    txt = read(path)
+    txt = read_calendar_js(path)
     out = []
     for m in re.finditer(r'date:\s*"([0-9]{4}-[0-9]{2}-[0-9]{2})"\s*,\s*page:\s*"([^"]+)"\s*,\s*title:\s*"((?:[^"\\]|\\.)*)"', txt):
         out.append({"date": m.group(1), "page": m.group(2), "title": m.group(3).replace('\\"', '"')})
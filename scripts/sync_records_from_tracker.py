@@ -7,6 +7,11 @@ and updates ALL sport-specific records pages (NHL, NBA, NFL, NCAAF, NCAAB, MLB,
 
 Run this after grading picks to update the records pages.
 
+Each page is ingested into the picks ledger (scripts/picks_ledger.py) before
+and after it is rewritten, so the ledger's totals stay current. The rewritten
+table is built from the page's own rows, not the ledger's (which keeps one
+row per pick key).
+
 Usage:
     python scripts/sync_records_from_tracker.py
 """
@@ -18,6 +23,9 @@ import re
 import urllib.request
 from datetime import datetime
 
+from generate_transparency_data import make_pick_key
+from picks_ledger import PicksLedger, html_table_rows
+
 # Pick Tracker URL (the master sheet with all graded picks)
 PICK_TRACKER_URL = 'https://docs.google.com/spreadsheets/d/1izhxwiiazn99SRqcK8QpUE4pfvDRIFpgSyw5ZlMsvmY/export?format=csv&gid=0'
 
@@ -27,36 +35,43 @@ REPO_PATH = r'C:\Users\Nima\nimadamus.github.io'
 # Sport mapping - how to identify picks for each sport from the tracker
 SPORT_CONFIG = {
     'nhl': {
+        'sport': 'NHL',
         'file': 'nhl-records.html',
         'leagues': ['nhl', 'hockey'],
         'sports': ['hockey', 'nhl']
     },
     'nba': {
+        'sport': 'NBA',
         'file': 'nba-records.html',
         'leagues': ['nba', 'basketball'],
         'sports': ['basketball', 'nba']
     },
     'nfl': {
+        'sport': 'NFL',
         'file': 'nfl-records.html',
         'leagues': ['nfl'],
         'sports': ['nfl', 'pro football']
     },
     'ncaaf': {
+        'sport': 'NCAAF',
         'file': 'ncaaf-records.html',
         'leagues': ['ncaaf', 'college football', 'cfb', 'ncaa football'],
         'sports': ['college football', 'ncaaf', 'cfb']
     },
     'ncaab': {
+        'sport': 'NCAAB',
         'file': 'ncaab-records.html',
         'leagues': ['ncaab', 'college basketball', 'cbb', 'ncaa basketball'],
         'sports': ['college basketball', 'ncaab', 'cbb']
     },
     'mlb': {
+        'sport': 'MLB',
         'file': 'mlb-records.html',
         'leagues': ['mlb', 'baseball'],
         'sports': ['baseball', 'mlb']
     },
     'soccer': {
+        'sport': 'Soccer',
         'file': 'soccer-records.html',
         'leagues': ['soccer', 'football', 'mls', 'epl', 'la liga', 'bundesliga', 'serie a', 'ligue 1'],
         'sports': ['soccer']
@@ -309,44 +324,15 @@ def parse_date_for_sorting(date_str):
     return datetime.min
 
 
-def get_existing_picks(html_content):
-    """Extract existing picks from the records page table as a set of keys for deduplication."""
-    existing = set()
-
-    # Find all table rows and extract Date + Pick combinations
-    pattern = r'<tr>\s*<td>([^<]+)</td>\s*<td>([^<]+)</td>'
-    matches = re.findall(pattern, html_content, re.IGNORECASE)
-
-    for date, pick in matches:
-        key = f"{date.strip().lower()}|{pick.strip().lower()}"
-        existing.add(key)
-
-    return existing
-
-
-def extract_all_picks_from_table(html_content):
-    """Extract ALL picks from the records page table with full data for re-sorting."""
-    picks = []
-
-    # Find all table rows with full data: Date, Pick, Line, Result, Units
-    pattern = r'<tr><td>([^<]+)</td><td>([^<]+)</td><td>([^<]*)</td><td[^>]*>([^<]*)</td><td[^>]*>([^<]*)</td></tr>'
-    matches = re.findall(pattern, html_content, re.IGNORECASE)
-
-    for date, pick, line, result, units in matches:
-        try:
-            units_val = float(units.replace('+', '').strip()) if units.strip() else 0.0
-        except ValueError:
-            units_val = 0.0
-
-        picks.append({
-            'Date': date.strip(),
-            'Pick': pick.strip(),
-            'Line': line.strip(),
-            'Result': result.strip(),
-            'Units': units_val
-        })
-
-    return picks
+def table_pick(row):
+    """A picks-ledger row as the pick dict create_table_row() takes."""
+    return {
+        'Date': row['date'],
+        'Pick': row['pick'],
+        'Line': row['line'],
+        'Result': row['result'],
+        'Units': row['units'],
+    }
 
 
 def create_table_row(pick):
@@ -373,7 +359,7 @@ def create_table_row(pick):
     return f'                    <tr><td>{date}</td><td>{pick_text}</td><td>{odds}</td><td class="{result_class}">{result}</td><td class="{units_class}">{units_text}</td></tr>'
 
 
-def update_records_page(sport_key, picks):
+def update_records_page(sport_key, picks, ledger):
     """Update a records page with new picks from the tracker and re-sort by date."""
     config = SPORT_CONFIG[sport_key]
     file_path = os.path.join(REPO_PATH, config['file'])
@@ -386,18 +372,21 @@ def update_records_page(sport_key, picks):
     with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
         html = f.read()
 
-    # Extract ALL existing picks from the table
-    existing_picks = extract_all_picks_from_table(html)
-    existing_keys = set()
-    for p in existing_picks:
-        key = f"{p['Date'].strip().lower()}|{p['Pick'].strip().lower()}"
-        existing_keys.add(key)
+    # ALL existing picks from the table, in the page's own rows: the ledger
+    # keeps one row per pick key, and a page may repeat a key (ncaaf-records
+    # has a pick listed with its odds as both "105" and "+105"), so
+    # rebuilding from ledger.rows() would silently delete a row.
+    sport = config['sport']
+    ledger.ingest('html', html, html_table_rows, sport)
+    existing_picks = [table_pick(row) for row in html_table_rows(html)]
+    existing_keys = {make_pick_key(p['Date'], p['Pick']) for p in existing_picks}
 
     # Find new picks that aren't already in the page
     new_picks = []
     for pick in picks:
-        key = f"{pick['Date'].strip().lower()}|{pick['Pick'].strip().lower()}"
+        key = make_pick_key(pick['Date'], pick['Pick'])
         if key not in existing_keys and pick['Result']:  # Only graded picks
+            existing_keys.add(key)
             new_picks.append(pick)
 
     # Combine existing and new picks
@@ -424,6 +413,7 @@ def update_records_page(sport_key, picks):
         # Write updated file
         with open(file_path, 'w', encoding='utf-8') as f:
             f.write(new_html)
+        ledger.ingest('html', new_html, html_table_rows, sport)
 
         if new_picks:
             print(f"  {sport_key.upper()}: Added {len(new_picks)} new picks, re-sorted {len(all_picks)} total picks by date")
@@ -452,43 +442,43 @@ def main():
     print()
 
     total_added = 0
-
-    for sport_key in SPORT_CONFIG.keys():
-        # Filter picks for this sport
-        sport_picks = []
-        rejected = []
-        for row in all_records:
-            if is_sport_pick(row, sport_key):
-                result = row.get('Result', '').strip()
-                if result and result.upper() in ['W', 'WIN', 'L', 'LOSS', 'P', 'PUSH']:
-                    pick_text = row.get('Pick', '') or row.get('Picks', '')
-                    # TEAM VALIDATION: reject picks that don't belong to this sport
-                    if not validate_pick_for_sport(sport_key, pick_text):
-                        rejected.append(pick_text)
-                        continue
-                    pick_data = {
-                        'Date': format_date(row.get('Date', '')),
-                        'Pick': pick_text,
-                        'Line': row.get('Odds', '') or row.get('Line', '') or '-110',
-                        'Result': result[0].upper(),
-                        'Units': calculate_unit_result(
-                            row.get('Units', '3'),
-                            row.get('Odds', '') or row.get('Line', ''),
-                            result
-                        )
-                    }
-                    if pick_data['Pick']:  # Only add if there's a pick
-                        sport_picks.append(pick_data)
-        if rejected:
-            print(f"  {sport_key.upper()}: REJECTED {len(rejected)} picks (wrong sport):")
-            for r in rejected[:5]:
-                print(f"    - {r}")
-            if len(rejected) > 5:
-                print(f"    ... and {len(rejected) - 5} more")
-
-        # Update the records page
-        added = update_records_page(sport_key, sport_picks)
-        total_added += added
+    with PicksLedger() as ledger:
+        for sport_key in SPORT_CONFIG.keys():
+            # Filter picks for this sport
+            sport_picks = []
+            rejected = []
+            for row in all_records:
+                if is_sport_pick(row, sport_key):
+                    result = row.get('Result', '').strip()
+                    if result and result.upper() in ['W', 'WIN', 'L', 'LOSS', 'P', 'PUSH']:
+                        pick_text = row.get('Pick', '') or row.get('Picks', '')
+                        # TEAM VALIDATION: reject picks that don't belong to this sport
+                        if not validate_pick_for_sport(sport_key, pick_text):
+                            rejected.append(pick_text)
+                            continue
+                        pick_data = {
+                            'Date': format_date(row.get('Date', '')),
+                            'Pick': pick_text,
+                            'Line': row.get('Odds', '') or row.get('Line', '') or '-110',
+                            'Result': result[0].upper(),
+                            'Units': calculate_unit_result(
+                                row.get('Units', '3'),
+                                row.get('Odds', '') or row.get('Line', ''),
+                                result
+                            )
+                        }
+                        if pick_data['Pick']:  # Only add if there's a pick
+                            sport_picks.append(pick_data)
+            if rejected:
+                print(f"  {sport_key.upper()}: REJECTED {len(rejected)} picks (wrong sport):")
+                for r in rejected[:5]:
+                    print(f"    - {r}")
+                if len(rejected) > 5:
+                    print(f"    ... and {len(rejected) - 5} more")
+
+            # Update the records page
+            added = update_records_page(sport_key, sport_picks, ledger)
+            total_added += added
 
     print()
     print("=" * 60)
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Per-stage timing and HTTP telemetry for the workflow scripts.
+
+When daily-handicapping-hub or auto-fix-content ran long there was no record
+of where the time went. A script that calls telemetry.start() now writes a
+run report at exit:
+
+  stages   wall time and entry count per named phase, nested
+           ("NBA/games", "mlb/pages"); a stage entered once per game
+           is summed, not listed per game
+  http     per host: requests, non-200 responses, transport errors, retries,
+           bytes received and seconds in flight
+  caches   hits and misses per named cache (odds snapshots, Covers
+           records, scraper standings)
+
+Requests are counted at the transport: start() wraps requests.Session.send,
+which every requests.get / Session.get goes through, so nothing has to be
+threaded through the fetch helpers. The helpers only report what the
+transport cannot see: retry() from fetch_with_retry and
+BaseScraper._make_request, cache_hit()/cache_miss() from the caches.
+
+The cost is two perf_counter() calls per stage and a dict update per request,
+so it stays on in production. Everything works without start() (nothing is
+written) and without requests installed (no HTTP section).
+
+Reports go to data/cache/telemetry/<script>.json and .txt (or
+$TELEMETRY_DIR), one pair per script, overwritten by its next run. The text
+summary is also printed, and appended to $GITHUB_STEP_SUMMARY when set.
+
+Usage:
+  import telemetry
+  telemetry.start()                    # at the top of main()
+  with telemetry.stage('NBA'):
+      ...
+  python scripts/telemetry.py                         # summary of every report
+  python scripts/telemetry.py run scripts/x.py [args]  # run an uninstrumented script
+"""
+
+import argparse
+import atexit
+import json
+import os
+import runpy
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from urllib.parse import urlsplit
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPORT_DIR = os.environ.get('TELEMETRY_DIR') or os.path.join(REPO, 'data', 'cache', 'telemetry')
+REPORT_VERSION = 1
+
+
+class Run:
+    """Everything recorded by one process."""
+
+    def __init__(self):
+        self.name = None
+        self.started_at = datetime.now().isoformat(timespec='seconds')
+        self.t0 = time.perf_counter()
+        self.stages = {}          # path -> [seconds, entries]
+        self.hosts = {}           # host -> Counter
+        self.caches = {}          # name -> Counter(hit=, miss=)
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.written = False
+
+    def path(self):
+        if not hasattr(self.local, 'stack'):
+            self.local.stack = []
+        return self.local.stack
+
+    def host(self, url):
+        host = urlsplit(url).netloc or url
+        stats = self.hosts.get(host)
+        if stats is None:
+            stats = self.hosts[host] = Counter()
+        return stats
+
+
+_run = Run()
+
+
+@contextmanager
+def stage(name):
+    """Time a phase. Nested stages are recorded as "outer/inner"."""
+    stack = _run.path()
+    stack.append(str(name))
+    key = '/'.join(stack)
+    with _run.lock:
+        # Created on entry so a stage is listed before the stages inside it.
+        entry = _run.stages.setdefault(key, [0.0, 0])
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        stack.pop()
+        with _run.lock:
+            entry[0] += elapsed
+            entry[1] += 1
+
+
+def request(url, status, nbytes, seconds):
+    """Record one HTTP exchange (status None for a transport error)."""
+    with _run.lock:
+        stats = _run.host(url)
+        stats['requests'] += 1
+        stats['bytes'] += nbytes
+        stats['ms'] += int(seconds * 1000)
+        if status is None:
+            stats['errors'] += 1
+        elif status != 200:
+            stats['non_200'] += 1
+
+
+def retry(url, reason=''):
+    """A fetch helper is about to retry `url`."""
+    with _run.lock:
+        stats = _run.host(url)
+        stats['retries'] += 1
+        if reason:
+            stats[f'retry_{reason}'] += 1
+
+
+def cache_hit(name):
+    with _run.lock:
+        _run.caches.setdefault(name, Counter())['hit'] += 1
+
+
+def cache_miss(name):
+    with _run.lock:
+        _run.caches.setdefault(name, Counter())['miss'] += 1
+
+
+def _install_transport():
+    try:
+        import requests
+    except ImportError:
+        return
+    send = requests.Session.send
+    if getattr(send, '_telemetry', False):
+        return
+
+    def timed_send(self, req, **kwargs):
+        start = time.perf_counter()
+        try:
+            resp = send(self, req, **kwargs)
+        except Exception:
+            request(req.url, None, 0, time.perf_counter() - start)
+            raise
+        if kwargs.get('stream'):
+            nbytes = int(resp.headers.get('Content-Length') or 0)
+        else:
+            nbytes = len(resp.content or b'')
+        request(req.url, resp.status_code, nbytes, time.perf_counter() - start)
+        return resp
+
+    timed_send._telemetry = True
+    requests.Session.send = timed_send
+
+
+def start(name=None):
+    """Turn on HTTP counting and write the report when the process exits."""
+    if _run.name is not None:
+        return
+    _run.name = name or os.path.splitext(os.path.basename(sys.argv[0] or 'python'))[0]
+    _install_transport()
+    atexit.register(write_report)
+
+
+def reset(name):
+    """Begin a new, empty run named `name` in this process.
+
+    workflow_runner.py runs several scripts in one interpreter; each gets its
+    own report as if it had been started on its own.
+    """
+    global _run
+    _run = Run()
+    start(name)
+
+
+def report():
+    total = time.perf_counter() - _run.t0
+    with _run.lock:
+        return {
+            'version': REPORT_VERSION,
+            'script': _run.name,
+            'started_at': _run.started_at,
+            'seconds': round(total, 3),
+            'stages': {k: {'seconds': round(s, 3), 'entries': n} for k, (s, n) in _run.stages.items()},
+            'http': {h: dict(sorted(c.items())) for h, c in
+                     sorted(_run.hosts.items(), key=lambda kv: -kv[1]['requests'])},
+            'caches': {k: {'hit': c['hit'], 'miss': c['miss']} for k, c in sorted(_run.caches.items())},
+        }
+
+
+def _mb(nbytes):
+    return f'{nbytes / 1e6:.1f} MB'
+
+
+def summary(rep):
+    """The text summary of a report."""
+    lines = [f"[telemetry] {rep['script']}  {rep['seconds']:.1f}s  (started {rep['started_at']})"]
+    if rep['stages']:
+        lines.append('  stages')
+        for key, st in rep['stages'].items():
+            depth = key.count('/')
+            label = '  ' * depth + key.rsplit('/', 1)[-1]
+            times = f"  x{st['entries']}" if st['entries'] > 1 else ''
+            lines.append(f"    {label:32s} {st['seconds']:8.2f}s{times}")
+    if rep['http']:
+        total = sum(h.get('requests', 0) for h in rep['http'].values())
+        nbytes = sum(h.get('bytes', 0) for h in rep['http'].values())
+        secs = sum(h.get('ms', 0) for h in rep['http'].values()) / 1000
+        lines.append(f'  http  {total} requests  {_mb(nbytes)}  {secs:.1f}s in flight')
+        for host, h in rep['http'].items():
+            extra = ''.join(f'  {k} {h[k]}' for k in ('retries', 'non_200', 'errors') if h.get(k))
+            lines.append(f"    {host:32s} {h.get('requests', 0):5d} req  {_mb(h.get('bytes', 0)):>9s}"
+                         f"  {h.get('ms', 0) / 1000:7.1f}s{extra}")
+    if rep['caches']:
+        lines.append('  caches  ' + '; '.join(f"{k} {c['hit']} hit / {c['miss']} miss"
+                                                for k, c in rep['caches'].items()))
+    return '\n'.join(lines)
+
+
+def write_report():
+    """Write <script>.json and .txt, print the summary (once per process)."""
+    if _run.written or _run.name is None:
+        return
+    _run.written = True
+    rep = report()
+    text = summary(rep)
+    try:
+        os.makedirs(REPORT_DIR, exist_ok=True)
+        base = os.path.join(REPORT_DIR, _run.name)
+        with open(base + '.json', 'w', encoding='utf-8') as f:
+            f.write(json.dumps(rep, indent=1) + '\n')
+        with open(base + '.txt', 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    except OSError as e:
+        print(f'[telemetry] report not written: {e}')
+    print(text)
+    step_summary = os.environ.get('GITHUB_STEP_SUMMARY')
+    if step_summary:
+        try:
+            with open(step_summary, 'a', encoding='utf-8') as f:
+                f.write('```\n' + text + '\n```\n')
+        except OSError:
+            pass
+
+
+def load_reports(directory=REPORT_DIR):
+    reports = []
+    for name in sorted(os.listdir(directory)) if os.path.isdir(directory) else []:
+        if not name.endswith('.json'):
+            continue
+        try:
+            with open(os.path.join(directory, name), encoding='utf-8') as f:
+                rep = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if rep.get('version') == REPORT_VERSION:
+            reports.append(rep)
+    return sorted(reports, key=lambda r: r['started_at'])
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ['run']:
+        if len(argv) < 2:
+            print('usage: telemetry.py run SCRIPT [ARGS...]')
+            return 2
+        script = argv[1]
+        sys.argv = argv[1:]
+        # A script that imports telemetry itself must get this instance.
+        sys.modules.setdefault('telemetry', sys.modules[__name__])
+        sys.path.insert(0, os.path.dirname(os.path.abspath(script)))
+        start(os.path.splitext(os.path.basename(script))[0])
+        with stage('main'):
+            runpy.run_path(script, run_name='__main__')
+        return 0
+
+    ap = argparse.ArgumentParser(description='Summarise the telemetry reports of recent runs.')
+    ap.add_argument('--dir', default=REPORT_DIR, help='Report directory.')
+    args = ap.parse_args(argv)
+    reports = load_reports(args.dir)
+    if not reports:
+        print(f'[telemetry] no reports in {args.dir}')
+        return 0
+    for rep in reports:
+        print(summary(rep))
+    total = sum(r['seconds'] for r in reports)
+    print(f'[telemetry] {len(reports)} script(s), {total:.1f}s in total')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
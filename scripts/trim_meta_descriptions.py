@@ -10,13 +10,17 @@ Rules:
 - Tries sentence boundary (period + space) first, then last word boundary + "..."
 - Also updates og:description and twitter:description to match
 - Minimum result length: 120 characters
+
+Registered with html_rewrite as "trim-meta-descriptions"; main() runs it
+through the same single-pass engine (python scripts/trim_meta_descriptions.py
+[--dry-run]).
 """
 
-import os
+import argparse
 import re
 import sys
 
-REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+from html_rewrite import root_pages, run, transform
 
 
 def trim_description(desc, max_len=165, min_len=120):
@@ -143,33 +147,27 @@ def update_twitter_description(html_content, new_desc_unused):
     return html_content, False
 
 
-def process_file(filepath):
-    """Process a single HTML file. Returns dict with results or None if skipped."""
-    try:
-        with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-            content = f.read()
-    except Exception as e:
-        return {'file': filepath, 'error': str(e)}
-
+def trim_page(content):
+    """Trim one page's descriptions. Returns (new_content, details) or (content, None)."""
     # Skip redirect stubs
     if 'Page Moved' in content[:500]:
-        return None
+        return content, None
 
     # Extract meta description
     desc, full_tag = extract_meta_description(content)
     if desc is None:
-        return None  # No meta description found
+        return content, None  # No meta description found
 
     original_len = len(desc)
     if original_len <= 170:
-        return None  # Within acceptable range, skip
+        return content, None  # Within acceptable range, skip
 
     # Trim the description
     new_desc = trim_description(desc)
     new_len = len(new_desc)
 
     if new_desc == desc:
-        return None  # No change needed (shouldn't happen if > 170, but safety check)
+        return content, None  # No change needed (shouldn't happen if > 170, but safety check)
 
     # Replace in file content - rebuild the tag with new description
     new_tag = full_tag.replace(desc, new_desc)
@@ -181,15 +179,7 @@ def process_file(filepath):
     new_content, og_updated = update_og_description(new_content, new_desc)
     new_content, twitter_updated = update_twitter_description(new_content, new_desc)
 
-    # Write back
-    try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(new_content)
-    except Exception as e:
-        return {'file': filepath, 'error': f'Write failed: {e}'}
-
-    return {
-        'file': os.path.basename(filepath),
+    return new_content, {
         'old_len': original_len,
         'new_len': new_len,
         'old_desc': desc,
@@ -199,124 +189,17 @@ def process_file(filepath):
     }
 
 
-def main():
-    # Get all .html files in repo root only (not subdirectories)
-    html_files = []
-    for fname in os.listdir(REPO_ROOT):
-        if fname.endswith('.html'):
-            fpath = os.path.join(REPO_ROOT, fname)
-            if os.path.isfile(fpath):
-                html_files.append(fpath)
-
-    html_files.sort()
-
-    print(f"Scanning {len(html_files)} HTML files in {REPO_ROOT}...")
-    print(f"Threshold: Only trimming descriptions OVER 170 characters")
-    print(f"Target range: 155-165 characters")
-    print("=" * 80)
-
-    total_scanned = 0
-    total_over_170 = 0
-    total_trimmed = 0
-    total_skipped_redirect = 0
-    total_no_meta = 0
-    results = []
-    errors = []
-
-    for fpath in html_files:
-        total_scanned += 1
-        result = process_file(fpath)
-
-        if result is None:
-            # Check why it was skipped for stats
-            try:
-                with open(fpath, 'r', encoding='utf-8', errors='replace') as f:
-                    content = f.read()
-                if 'Page Moved' in content[:500]:
-                    total_skipped_redirect += 1
-                else:
-                    desc, _ = extract_meta_description(content)
-                    if desc is None:
-                        total_no_meta += 1
-                    elif len(desc) > 170:
-                        total_over_170 += 1  # Over 170 but couldn't trim
-                        print(f"WARNING: Could not process {os.path.basename(fpath)} ({len(desc)} chars)")
-            except:
-                pass
-            continue
-
-        if 'error' in result:
-            errors.append(result)
-            continue
-
-        total_over_170 += 1
-        total_trimmed += 1
-        results.append(result)
-
-    # Print summary
-    print(f"\nSUMMARY")
-    print(f"=" * 80)
-    print(f"Total HTML files scanned:     {total_scanned}")
-    print(f"Redirect stubs skipped:       {total_skipped_redirect}")
-    print(f"Files without meta desc:      {total_no_meta}")
-    print(f"Descriptions over 170 chars:  {total_over_170}")
-    print(f"Descriptions trimmed:         {total_trimmed}")
-    if errors:
-        print(f"Errors:                       {len(errors)}")
-        for e in errors:
-            print(f"  - {e['file']}: {e['error']}")
-
-    # Print examples
-    if results:
-        print(f"\n\nEXAMPLES (first 15 of {len(results)} trimmed):")
-        print("=" * 80)
-        for r in results[:15]:
-            print(f"\nFile: {r['file']}")
-            print(f"  BEFORE ({r['old_len']} chars): {r['old_desc'][:100]}...")
-            print(f"  AFTER  ({r['new_len']} chars): {r['new_desc']}")
-            extras = []
-            if r['og_updated']:
-                extras.append("og:description")
-            if r['twitter_updated']:
-                extras.append("twitter:description")
-            if extras:
-                print(f"  Also updated: {', '.join(extras)}")
-
-    # Print length distribution of trimmed results
-    if results:
-        print(f"\n\nLENGTH DISTRIBUTION OF TRIMMED DESCRIPTIONS:")
-        print("=" * 80)
-        ranges = {
-            '120-130': 0, '131-140': 0, '141-150': 0,
-            '151-155': 0, '156-160': 0, '161-165': 0,
-        }
-        for r in results:
-            l = r['new_len']
-            if 120 <= l <= 130:
-                ranges['120-130'] += 1
-            elif 131 <= l <= 140:
-                ranges['131-140'] += 1
-            elif 141 <= l <= 150:
-                ranges['141-150'] += 1
-            elif 151 <= l <= 155:
-                ranges['151-155'] += 1
-            elif 156 <= l <= 160:
-                ranges['156-160'] += 1
-            elif 161 <= l <= 165:
-                ranges['161-165'] += 1
-
-        for rng, count in ranges.items():
-            bar = '#' * min(count, 80)
-            print(f"  {rng}: {count:3d} {bar}")
-
-    # Full list
-    if results:
-        print(f"\n\nFULL LIST OF ALL {len(results)} TRIMMED FILES:")
-        print("=" * 80)
-        for r in results:
-            print(f"  {r['file']}: {r['old_len']} -> {r['new_len']} chars")
-
-    return 0 if not errors else 1
+@transform('trim-meta-descriptions', applies=root_pages)
+def trim_meta(rel, content):
+    """Trim meta/og/twitter descriptions over 170 characters."""
+    return trim_page(content)[0]
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Trim meta/og/twitter descriptions over 170 characters.')
+    ap.add_argument('--dry-run', action='store_true', help='Print a unified diff; write nothing.')
+    args = ap.parse_args(argv)
+    return run(['trim-meta-descriptions'], dry_run=args.dry_run)
 
 
 if __name__ == '__main__':
@@ -13,6 +13,8 @@ import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from calendar_shards import read_calendar_js
+
 REPO_DIR = Path(__file__).resolve().parent.parent
 SCRIPTS_DIR = REPO_DIR / "scripts"
 
@@ -39,18 +41,18 @@ REQUIRED_REGRESSION_DATES = {
 }
 
 
-def parse_args():
+def parse_args(argv=None):
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("lookback", nargs="?", type=int, default=45)
     parser.add_argument("--today", default=datetime.now().date().isoformat())
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
 def calendar_dates(js_name):
     path = SCRIPTS_DIR / js_name
     if not path.exists():
         return set()
-    text = path.read_text(encoding="utf-8", errors="ignore")
+    text = read_calendar_js(path)
     return set(re.findall(r'date:\s*"(\d{4}-\d{2}-\d{2})"', text))
 
 
@@ -162,8 +164,8 @@ def hub_staleness_failures():
     return problems
 
 
-def main():
-    args = parse_args()
+def main(argv=None):
+    args = parse_args(argv)
     lookback = args.lookback
     manifest = manifest_dates()
     recent = recent_dates(lookback, args.today)
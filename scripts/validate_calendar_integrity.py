@@ -17,12 +17,17 @@ Checks:
   5. Every "Featured Game" nav link across the site points at the stable hub
      /featured-game-of-the-day.html (never a dated page that goes stale).
   6. Each sport calendar JS still contains the stale-hub redirect guard.
+  8. No page reads ARCHIVE_DATA unless it defines it inline or loads a script
+     that does. Sharded sport calendars no longer define it; their runtime
+     renders the calendar itself.
 """
 import os
 import re
 import sys
 import glob
 
+from calendar_shards import read_calendar_js
+
 REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 STABLE_HUB = 'featured-game-of-the-day.html'
 errors = []
@@ -31,6 +36,9 @@ warnings = []
 ENTRY_RE = re.compile(r'\{\s*date:\s*"([0-9]{4}-[0-9]{2}-[0-9]{2})"\s*,\s*page:\s*"([^"]+)"')
 FORCED_RE = re.compile(r"FORCED_PAGE_DATE\s*=\s*'([0-9]{4}-[0-9]{2}-[0-9]{2})'")
 NAV_RE = re.compile(r'<a\b[^>]*?href="([^"]*)"[^>]*>\s*Featured Game<')
+ARCHIVE_USE_RE = re.compile(r'(?<![\w$])ARCHIVE_DATA\b')
+ARCHIVE_DEF_RE = re.compile(r'\b(?:const|let|var)\s+ARCHIVE_DATA\s*=|window\.ARCHIVE_DATA\s*=')
+SCRIPT_SRC_RE = re.compile(r'<script\b[^>]*?\bsrc="([^"?#]+)')
 
 
 def page_path(page):
@@ -46,12 +54,36 @@ def forced_date(page):
     return m.group(1) if m else None
 
 
+_script_defines = {}
+
+
+def defines_archive_data(page_file, content):
+    """True when the page, or a local script it loads, defines ARCHIVE_DATA."""
+    if ARCHIVE_DEF_RE.search(content):
+        return True
+    for src in SCRIPT_SRC_RE.findall(content):
+        if src.startswith(('http:', 'https:', '//')):
+            continue
+        if src.startswith('/'):
+            path = os.path.join(REPO, src.lstrip('/'))
+        else:
+            path = os.path.normpath(os.path.join(os.path.dirname(page_file), src))
+        if path not in _script_defines:
+            try:
+                with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+                    _script_defines[path] = bool(ARCHIVE_DEF_RE.search(f.read()))
+            except OSError:
+                _script_defines[path] = False
+        if _script_defines[path]:
+            return True
+    return False
+
+
 def check_data_file(js_path, label):
     if not os.path.exists(js_path):
         warnings.append(f"{label}: file not found ({js_path})")
         return
-    with open(js_path, 'r', encoding='utf-8', errors='ignore') as f:
-        text = f.read()
+    text = read_calendar_js(js_path)
     for date, page in ENTRY_RE.findall(text):
         if page.endswith('.html') and '#' not in page and not page.startswith('http'):
             if not os.path.exists(page_path(page)):
@@ -75,9 +107,8 @@ def main():
         # clean-state guard renderPreviewHub(); the featured engine uses its own
         # redirectFeaturedHub(). Either is a valid hub stale-guard.
         if name != 'featured-games-calendar.js':
-            with open(js, 'r', encoding='utf-8', errors='ignore') as f:
-                if 'renderPreviewHub' not in f.read():
-                    errors.append(f"{name}: hub stale-guard (renderPreviewHub) MISSING")
+            if 'renderPreviewHub' not in read_calendar_js(js):
+                errors.append(f"{name}: hub stale-guard (renderPreviewHub) MISSING")
 
     # 7: EVERY calendar engine (7 sport + featured) must inject cal-day state CSS,
     # emit the has-content class, and highlight the VIEWED ARTICLE'S date
@@ -89,8 +120,7 @@ def main():
     # 'today' marker.
     for js in glob.glob(os.path.join(REPO, 'scripts', '*-calendar.js')):
         name = os.path.basename(js)
-        with open(js, 'r', encoding='utf-8', errors='ignore') as f:
-            txt = f.read()
+        txt = read_calendar_js(js)
         if "+= ' today'" in txt or '+= " today"' in txt:
             errors.append(f"{name}: emits a 'today' class - BANNED. Highlight only the viewed article's date (current-page).")
         if 'current-page' not in txt:
@@ -113,6 +143,7 @@ def main():
         errors.append(f"{STABLE_HUB}: missing")
 
     # 5: all Featured Game nav links point at the stable hub
+    # 8: pages reading ARCHIVE_DATA that nothing defines (ReferenceError)
     bad_nav = 0
     for fp in glob.glob(os.path.join(REPO, '**', '*.html'), recursive=True):
         if os.sep + '.git' + os.sep in fp:
@@ -125,6 +156,8 @@ def main():
                 bad_nav += 1
                 if bad_nav <= 15:
                     errors.append(f"{os.path.relpath(fp, REPO)}: Featured Game nav -> '{href}' (must be /{STABLE_HUB})")
+        if ARCHIVE_USE_RE.search(content) and not defines_archive_data(fp, content):
+            errors.append(f"{os.path.relpath(fp, REPO)}: reads ARCHIVE_DATA but neither the page nor its scripts define it")
     if bad_nav > 15:
         errors.append(f"... and {bad_nav - 15} more stale Featured Game nav links")
 
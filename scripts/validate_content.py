@@ -13,6 +13,8 @@ import re
 import sys
 from pathlib import Path
 
+from calendar_shards import read_calendar_js
+
 # Auto-detect repo directory
 if sys.platform == 'win32':
     REPO_DIR = Path(r'C:\Users\Nima\nimadamus.github.io')
@@ -114,8 +116,7 @@ def check_calendars():
             WARNINGS.append(f"Calendar file missing: {calendar_file}")
             continue
 
-        with open(calendar_path, 'r', encoding='utf-8') as f:
-            calendar_content = f.read()
+        calendar_content = read_calendar_js(calendar_path)
 
         # Find all sport pages
         for filepath in REPO_DIR.glob(f'{sport}*.html'):
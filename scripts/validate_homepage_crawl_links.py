@@ -13,6 +13,7 @@ Checks the newest entry from each live data source is present in index.html:
 Exit 0 = all present. Exit 1 = stale (lists what is missing).
 """
 import os, re, sys, datetime
+from calendar_shards import read_calendar_js
 
 ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 INDEX = os.path.join(ROOT, "index.html")
@@ -40,7 +41,7 @@ def newest_pick_url():
 def newest_dated(path, label):
     if not os.path.exists(path):
         return None
-    rows = re.findall(r'date:\s*"([0-9]{4}-[0-9]{2}-[0-9]{2})"\s*,\s*page:\s*"([^"]+\.html)"', read(path))
+    rows = re.findall(r'date:\s*"([0-9]{4}-[0-9]{2}-[0-9]{2})"\s*,\s*page:\s*"([^"]+\.html)"', read_calendar_js(path))
     if not rows:
         return None
     rows.sort(key=lambda r: r[0], reverse=True)
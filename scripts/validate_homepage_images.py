@@ -20,6 +20,9 @@ try:
 except ImportError:  # pragma: no cover - local dev may not have pillow
     Image = None
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from image_index import ImageIndex, perceptual_duplicates  # noqa: E402
+
 ROOT = Path(__file__).resolve().parents[1]
 INDEX = ROOT / "index.html"
 PICKS = ROOT / "homepage-picks-data.js"
@@ -122,7 +125,16 @@ def validate_pick_archive(errors: list[str]) -> None:
     featured = picks[:3]
     compact = picks[3:]
     pages = [featured + compact[i : i + COMPACT_PER_PAGE] for i in range(0, len(compact), COMPACT_PER_PAGE)]
+    index = ImageIndex()
     for page_index, page in enumerate(pages, start=1):
+        titles = {pick["image"]: pick["title"] for pick in page}
+        local = [pick["image"] for pick in page if image_exists(pick["image"])]
+        for first, second, distance in perceptual_duplicates(local, index):
+            fail(
+                f"Visible homepage archive page {page_index}: {first} and {second} are the same photo "
+                f"(perceptual distance {distance}) used by '{titles[first]}' and '{titles[second]}'",
+                errors,
+            )
         seen: dict[str, str] = {}
         for pick in page:
             image = pick["image"]
@@ -138,14 +150,15 @@ def validate_pick_archive(errors: list[str]) -> None:
 def validate_static_homepage_cards(errors: list[str]) -> None:
     html = INDEX.read_text(encoding="utf-8")
     for alt, src in REQUIRED_STATIC_IMAGES.items():
-        pattern = re.compile(rf"<img[^>]+src=\"{re.escape(src)}\"[^>]+alt=\"{re.escape(alt)}\"", re.I)
+        # build_image_derivatives.py moves the original to data-original.
+        pattern = re.compile(rf"<img[^>]+(?:\bsrc|data-original)=\"{re.escape(src)}\"[^>]+alt=\"{re.escape(alt)}\"", re.I)
         if not pattern.search(html):
             fail(f"Homepage static card missing approved image/alt pair: {alt} -> {src}", errors)
         if not image_exists(src):
             fail(f"Homepage static approved image file missing: {src}", errors)
 
-    main_html = html.split("<script src=\"homepage-picks-data.js\">", 1)[0]
-    image_pattern = re.compile(r"<img\b[^>]*\bsrc=\"(?P<src>images/[^\"]+)\"[^>]*\balt=\"(?P<alt>[^\"]*)\"", re.I)
+    main_html = re.split(r"<script src=\"homepage-picks-data\.js(?:\?v=[^\"]*)?\">", html, maxsplit=1)[0]
+    image_pattern = re.compile(r"<img\b[^>]*\b(?:src|data-original)=\"(?P<src>images/(?!derived/)[^\"]+)\"[^>]*\balt=\"(?P<alt>[^\"]*)\"", re.I)
     seen: dict[str, str] = {}
     for match in image_pattern.finditer(main_html):
         src = match.group("src")
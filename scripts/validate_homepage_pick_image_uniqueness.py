@@ -14,6 +14,9 @@ from collections import Counter
 from datetime import datetime
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from image_index import perceptual_duplicates  # noqa: E402
+
 ROOT = Path(__file__).resolve().parents[1]
 PICKS = ROOT / "homepage-picks-data.js"
 SYSTEM = ROOT / "homepage-image-system.js"
@@ -157,6 +160,15 @@ def main() -> int:
             urls = ", ".join(url for url, _, rendered_image in rendered if rendered_image == image)
             errors.append(f"Rendered homepage pick image repeats {count} times: {image} ({urls})")
 
+    # Same photo under a different filename slips past the path check above.
+    local_images = [image for _, _, image in rendered if image.startswith("images/")]
+    url_by_image = {image: url for url, _, image in rendered}
+    for first, second, distance in perceptual_duplicates(local_images):
+        errors.append(
+            f"Rendered homepage pick images are visually identical (perceptual distance {distance}): "
+            f"{first} ({url_by_image[first]}) and {second} ({url_by_image[second]})"
+        )
+
     date_counts = Counter(pick["date"] for pick in picks)
     for date, count in date_counts.items():
         if count > MAX_CARDS_PER_DATE:
@@ -21,7 +21,12 @@ Rules enforced:
        - high_saturation_ratio > 0.55, OR
        - top1_color_ratio > 0.20 combined with top3_color_ratio > 0.35
          (large flat-color banners typical of template chrome)
-  3. The top 3 featured card images must not share the same image.
+  3. The top 3 featured card images must not share the same image, by URL
+     or visually (perceptual hash - a renamed copy of the same photo counts).
+
+Visual stats and perceptual hashes come from the persistent image index
+(scripts/image_index.py, data/cache/image-index.json), so unchanged images
+are not re-downloaded or re-decoded on every commit.
 
 Exit 0 on pass, 1 on fail. Prints each rejected pick with the reason.
 """
@@ -33,9 +38,11 @@ import json
 import re
 import subprocess
 import sys
-import urllib.request
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from image_index import ImageIndex, fingerprint, hamming, NEAR_DUPLICATE_DISTANCE  # noqa: E402
+
 ROOT = Path(__file__).resolve().parents[1]
 PICKS_FILE = ROOT / "homepage-picks-data.js"
 PICKS_FILENAME = "homepage-picks-data.js"
@@ -80,51 +87,9 @@ def url_allowed(src: str) -> tuple[bool, str]:
         "and are banned."
     )
 
-def load_image_bytes(src: str) -> bytes | None:
-    if src.startswith("images/"):
-        return (ROOT / src).read_bytes()
-    try:
-        req = urllib.request.Request(
-            src,
-            headers={
-                "User-Agent": "Mozilla/5.0 (BetLegend PickImageValidator)",
-                "Accept": "image/*",
-            },
-        )
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            return resp.read()
-    except Exception as e:
-        print(f"  [warn] could not download {src}: {e}", file=sys.stderr)
-        return None
-
 def visual_checks(data: bytes):
-    try:
-        import cv2
-        import numpy as np
-    except ImportError:
-        return None
-    arr = np.frombuffer(data, dtype=np.uint8)
-    img = cv2.imdecode(arr, cv2.IMREAD_COLOR)
-    if img is None:
-        return None
-    img = cv2.resize(img, (640, 360), interpolation=cv2.INTER_AREA)
-
-    quant = (img // 8).astype(np.int32)
-    keys = quant[:, :, 0] * 1024 + quant[:, :, 1] * 32 + quant[:, :, 2]
-    _, counts = np.unique(keys.ravel(), return_counts=True)
-    counts = np.sort(counts)[::-1]
-    total = counts.sum()
-    top1 = counts[0] / total
-    top3 = counts[:3].sum() / total
-
-    sat = cv2.cvtColor(img, cv2.COLOR_BGR2HSV)[:, :, 1]
-    high_sat = (sat > 180).mean()
-
-    return {
-        "top1_color_ratio": float(top1),
-        "top3_color_ratio": float(top3),
-        "high_saturation_ratio": float(high_sat),
-    }
+    fp = fingerprint(data)
+    return fp["stats"] if fp else None
 
 def image_fails_visual(stats: dict) -> str | None:
     if stats is None:
@@ -170,7 +135,7 @@ def get_new_image_srcs_from_staged_diff() -> set[str] | None:
             added.add(m.group(1))
     return added
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument(
         "--mode",
@@ -180,7 +145,7 @@ def main() -> int:
              "new-only = strict URL check only on entries new/modified in the staged diff "
              "(historical cards are grandfathered). Visual check always runs on all top 12.",
     )
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     picks = parse_picks()
     if not picks:
@@ -196,7 +161,9 @@ def main() -> int:
         if new_srcs is None:
             new_srcs = set()
 
+    index = ImageIndex()
     seen_top3 = {}
+    top3_hashes: list[tuple[int, str]] = []
     for idx, pick in enumerate(visible):
         label = f"[{idx+1}] {pick['sport']} | {pick['title']}"
         src = pick["image"]
@@ -217,20 +184,35 @@ def main() -> int:
             else:
                 seen_top3[src] = pick["title"]
 
-        data = load_image_bytes(src)
-        if data is None:
-            if should_url_check:
+        # The hard gate revalidates remote images every run (a 304 when unchanged),
+        # so a different photo uploaded under the same URL is checked again.
+        fp = index.lookup(src, max_age=0)
+        if fp is None:
+            if should_url_check and src in index.unreadable:
                 errors.append(
                     f"{label}\n    DOWNLOAD-FAIL: could not load {src}. "
                     "Cannot run visual check on a new/modified entry — fix the URL or self-host."
                 )
             continue
 
-        stats = visual_checks(data)
+        if idx < 3:
+            dhash = int(fp["dhash"], 16)
+            for other_hash, other_title in top3_hashes:
+                dist = hamming(dhash, other_hash)
+                if dist <= NEAR_DUPLICATE_DISTANCE and seen_top3.get(src) != other_title:
+                    errors.append(
+                        f"{label}\n    DUPLICATE-IMAGE: visually the same photo as '{other_title}' "
+                        f"(perceptual distance {dist}) - a renamed copy is still a duplicate."
+                    )
+            top3_hashes.append((dhash, pick["title"]))
+
+        stats = fp["stats"]
         bad = image_fails_visual(stats)
         if bad:
             errors.append(f"{label}\n    VISUAL-RULE: {bad}\n    image: {src}")
 
+    index.save()
+
     if errors:
         print("=" * 70)
         print("PICK CARD IMAGE VALIDATION FAILED")
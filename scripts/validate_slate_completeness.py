@@ -27,6 +27,8 @@ import json
 import subprocess
 from datetime import datetime, timedelta
 
+from calendar_shards import read_calendar_js
+
 REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 # Sport keywords that appear in filenames
@@ -115,10 +117,8 @@ def date_to_filename_patterns(date):
 def find_calendar_page(sport, date_iso):
     """Return a page from the sport calendar for date_iso when it exists."""
     calendar_path = os.path.join(REPO_ROOT, CALENDAR_JS[sport])
-    try:
-        with open(calendar_path, 'r', encoding='utf-8', errors='ignore') as f:
-            calendar_data = f.read()
-    except OSError:
+    calendar_data = read_calendar_js(calendar_path)
+    if not calendar_data:
         return None
 
     pattern = re.compile(
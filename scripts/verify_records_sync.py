@@ -5,14 +5,18 @@ as each individual sport records page.
 
 This script fetches the SAME Google Sheet data that both pages use,
 computes totals using both approaches, and compares them.
+
+Sheets, the Pick Tracker and the static HTML tables all go through the picks
+ledger (scripts/picks_ledger.py), so both sides are parsed and counted by the
+same code the transparency widget uses: W/L/P follow the sign of the units,
+and cross-sport parlays are left out. A mismatch is broken down by month
+from the ledger's per-month aggregates.
 """
 
-import csv
-import io
-import re
 import sys
 import urllib.request
-from html.parser import HTMLParser
+
+from picks_ledger import PicksLedger, sheet_pick_rows, sync_records_files, tracker_pick_rows
 
 # ============================================================
 # Google Sheet URLs (same as records.html lines 914-920)
@@ -29,276 +33,41 @@ SPORT_SHEET_URLS = {
 
 PICK_TRACKER_URL = 'https://docs.google.com/spreadsheets/d/1izhxwiiazn99SRqcK8QpUE4pfvDRIFpgSyw5ZlMsvmY/export?format=csv&gid=0'
 
-# Sport-specific default stakes (from records.html fix)
-SPORT_DEFAULTS = {
-    'NFL': 2, 'NBA': 1, 'NHL': 3, 'MLB': 1,
-    'NCAAF': 3, 'NCAAB': 3, 'Soccer': 1
-}
+# Individual records pages with static HTML tables.
+HTML_TABLE_SPORTS = ['NHL', 'NFL', 'NCAAF']
 
-def fetch_csv(url):
-    """Fetch CSV from URL and return list of dicts."""
+
+def fetch_csv_text(url):
+    """Fetch a published CSV as text."""
     req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
     with urllib.request.urlopen(req, timeout=30) as resp:
-        text = resp.read().decode('utf-8-sig')
-    reader = csv.DictReader(io.StringIO(text))
-    return list(reader)
-
-def calculate_unit_result(stake_str, odds_str, result_str):
-    """
-    Same logic as calculateUnitResult() in the JS pages.
-    stake = what you're trying to win (for favorites, you risk more)
-    Returns the P/L value.
-    """
-    try:
-        stake = float(stake_str)
-        odds = float(odds_str)
-    except (ValueError, TypeError):
-        return None
+        return resp.read().decode('utf-8-sig')
 
-    result = result_str.strip().upper() if result_str else ''
 
-    if result in ('W', 'WIN'):
-        if odds < 0:
-            return stake  # Fav win: you win the stake amount
-        else:
-            return stake * (odds / 100)  # Dog win: you win more
-    elif result in ('L', 'LOSS'):
-        if odds < 0:
-            return -(stake * (abs(odds) / 100))  # Fav loss: you lose more
-        else:
-            return -stake  # Dog loss: you lose the stake
-    elif result in ('P', 'PUSH'):
-        return 0.0
-    return None
-
-def compute_from_sheet(rows, sport_name):
-    """
-    Compute stats from a sport-specific Google Sheet.
-    The Units column in sport sheets is PRE-CALCULATED P/L.
-    This is what records.html now does (pre-computed unitPL).
-    """
-    wins = 0
-    losses = 0
-    pushes = 0
-    total_units = 0.0
-    counted = 0
-
-    for row in rows:
-        result = (row.get('Result', '') or row.get('result', '') or '').strip().upper()
-        units_raw = row.get('Units', '') or row.get('units', '') or ''
-
-        if result not in ('W', 'WIN', 'L', 'LOSS', 'P', 'PUSH'):
-            continue
+def record_line(stats):
+    return (f"{stats['wins']}-{stats['losses']}-{stats['pushes']}, "
+            f"Units: {stats['totalUnits']:+.2f}u ({stats['totalPicks']} picks)")
 
-        try:
-            units_val = float(units_raw)
-        except (ValueError, TypeError):
-            continue
-
-        counted += 1
-        total_units += units_val
-
-        if result in ('W', 'WIN'):
-            wins += 1
-        elif result in ('L', 'LOSS'):
-            losses += 1
-        elif result in ('P', 'PUSH'):
-            pushes += 1
-
-    return {
-        'sport': sport_name,
-        'wins': wins,
-        'losses': losses,
-        'pushes': pushes,
-        'units': round(total_units, 2),
-        'counted': counted
-    }
-
-def detect_sport_from_pick(pick_text):
-    """Detect sport from the Pick column text (same logic as records.html)."""
-    pick = (pick_text or '').upper()
-
-    nfl_teams = ['CHIEFS','BILLS','RAVENS','BENGALS','DOLPHINS','CHARGERS','STEELERS',
-                 'TEXANS','JAGUARS','COLTS','BRONCOS','JETS','RAIDERS','TITANS','BROWNS',
-                 'PATRIOTS','EAGLES','COWBOYS','49ERS','LIONS','PACKERS','VIKINGS',
-                 'SEAHAWKS','BUCCANEERS','BUCS','RAMS','COMMANDERS','SAINTS','FALCONS',
-                 'BEARS','CARDINALS','GIANTS','PANTHERS']
-    nhl_teams = ['BRUINS','SABRES','RED WINGS','PANTHERS','CANADIENS','SENATORS','LIGHTNING',
-                 'MAPLE LEAFS','HURRICANES','BLUE JACKETS','DEVILS','ISLANDERS','RANGERS',
-                 'FLYERS','PENGUINS','CAPITALS','BLACKHAWKS','AVALANCHE','STARS','WILD',
-                 'PREDATORS','BLUES','JETS','FLAMES','OILERS','KINGS','DUCKS','COYOTES',
-                 'SHARKS','KRAKEN','CANUCKS','GOLDEN KNIGHTS','UTAH HC','UTAH HOCKEY']
-    nba_teams = ['CELTICS','NETS','KNICKS','76ERS','SIXERS','RAPTORS','BULLS','CAVALIERS',
-                 'PISTONS','PACERS','BUCKS','HAWKS','HORNETS','HEAT','MAGIC','WIZARDS',
-                 'NUGGETS','TIMBERWOLVES','THUNDER','TRAIL BLAZERS','JAZZ','WARRIORS',
-                 'CLIPPERS','LAKERS','SUNS','KINGS','MAVERICKS','ROCKETS','GRIZZLIES',
-                 'PELICANS','SPURS']
-    mlb_teams = ['YANKEES','RED SOX','BLUE JAYS','ORIOLES','RAYS','WHITE SOX','GUARDIANS',
-                 'TIGERS','ROYALS','TWINS','ASTROS','ANGELS','ATHLETICS','MARINERS',
-                 'RANGERS','METS','BRAVES','PHILLIES','MARLINS','NATIONALS','CUBS',
-                 'REDS','BREWERS','PIRATES','CARDINALS','DODGERS','GIANTS','PADRES',
-                 'ROCKIES','DIAMONDBACKS','D-BACKS']
-
-    for t in nfl_teams:
-        if t in pick:
-            return 'NFL'
-    for t in nhl_teams:
-        if t in pick:
-            return 'NHL'
-    for t in nba_teams:
-        if t in pick:
-            return 'NBA'
-    for t in mlb_teams:
-        if t in pick:
-            return 'MLB'
-
-    if any(kw in pick for kw in ['NCAAF', 'CFB', 'BOWL', 'COLLEGE FOOTBALL']):
-        return 'NCAAF'
-    if any(kw in pick for kw in ['NCAAB', 'CBB', 'COLLEGE BASKETBALL', 'MARCH MADNESS']):
-        return 'NCAAB'
-    if any(kw in pick for kw in ['SOCCER', 'PREMIER', 'LA LIGA', 'SERIE A', 'BUNDESLIGA',
-                                   'CHAMPIONS LEAGUE', 'MLS', 'LIGA MX', 'LIGUE 1']):
-        return 'Soccer'
-
-    return None
-
-def compute_pick_tracker_by_sport(rows):
-    """
-    Compute stats from Pick Tracker, grouped by sport.
-    In Pick Tracker, Units = STAKE (not P/L), so we must calculate P/L.
-    """
-    sport_data = {}
-
-    for row in rows:
-        # Detect sport
-        sport_col = (row.get('Sport', '') or '').strip()
-        pick_col = row.get('Pick', '') or row.get('pick', '') or ''
-
-        if sport_col:
-            sport = sport_col.strip().upper()
-            # Normalize sport names from Pick Tracker
-            sport_map = {
-                'HOCKEY': 'NHL', '`HOCKEY': 'NHL',
-                'BASKETBALL': 'NBA', 'BACKETBALL': 'NBA',
-                'FOOTBALL': 'NFL',
-                'BASEBALL': 'MLB', 'BASETBALL': 'MLB',
-                'CBB': 'NCAAB', 'COLLEGE BASKETBALL': 'NCAAB',
-                'CFB': 'NCAAF', 'COLLEGE FOOTBALL': 'NCAAF',
-            }
-            sport = sport_map.get(sport, sport)
-        else:
-            sport = detect_sport_from_pick(pick_col)
 
-        if not sport:
-            continue
+def same_record(a, b):
+    return (a['wins'] == b['wins'] and a['losses'] == b['losses']
+            and a['pushes'] == b['pushes']
+            and abs(a['totalUnits'] - b['totalUnits']) < 0.01)
 
-        result = (row.get('Result', '') or row.get('result', '') or '').strip().upper()
-        if result not in ('W', 'WIN', 'L', 'LOSS', 'P', 'PUSH'):
-            continue
 
-        # Get odds
-        odds_str = row.get('Line', '') or row.get('Odds', '') or row.get('odds', '') or ''
-        odds_str = odds_str.strip()
-        if not odds_str:
-            continue
+def month_diffs(ledger, sport):
+    """Months where the sheet and the HTML table disagree."""
+    sheet = ledger.breakdown('sheet', sport, 'month')
+    html = ledger.breakdown('html', sport, 'month')
+    empty = {'wins': 0, 'losses': 0, 'pushes': 0, 'totalUnits': 0.0}
+    out = []
+    for month in sorted(set(sheet) | set(html)):
+        a = sheet.get(month, empty)
+        b = html.get(month, empty)
+        if not same_record(a, b):
+            out.append((month or '(undated)', a, b))
+    return out
 
-        # Get stake (Units in Pick Tracker = STAKE)
-        units_str = row.get('Units', '') or row.get('units', '') or ''
-        default_stake = SPORT_DEFAULTS.get(sport, 1)
-        try:
-            stake = float(units_str) if units_str.strip() else default_stake
-        except (ValueError, TypeError):
-            stake = default_stake
-
-        try:
-            odds = float(odds_str)
-        except (ValueError, TypeError):
-            continue
-
-        # Calculate P/L
-        pl = calculate_unit_result(stake, odds, result)
-        if pl is None:
-            continue
-
-        if sport not in sport_data:
-            sport_data[sport] = {'wins': 0, 'losses': 0, 'pushes': 0, 'units': 0.0, 'counted': 0}
-
-        sport_data[sport]['counted'] += 1
-        sport_data[sport]['units'] += pl
-
-        if result in ('W', 'WIN'):
-            sport_data[sport]['wins'] += 1
-        elif result in ('L', 'LOSS'):
-            sport_data[sport]['losses'] += 1
-        elif result in ('P', 'PUSH'):
-            sport_data[sport]['pushes'] += 1
-
-    # Round units
-    for sport in sport_data:
-        sport_data[sport]['units'] = round(sport_data[sport]['units'], 2)
-
-    return sport_data
-
-def parse_static_html_table(html_file, sport):
-    """
-    For sports with static HTML tables (NHL, NFL, NCAAF),
-    parse the table rows and sum the P/L values directly.
-    This is what the individual records pages do.
-
-    Table format:
-    <tr><td>Date</td><td>Pick</td><td>Line</td><td class="result-W">W</td><td class="win">+3.00</td></tr>
-    """
-    with open(html_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    wins = 0
-    losses = 0
-    pushes = 0
-    total_units = 0.0
-    counted = 0
-
-    td_pattern = re.compile(r'<td[^>]*>(.*?)</td>', re.DOTALL | re.IGNORECASE)
-    # Match data rows (skip thead rows)
-    row_pattern = re.compile(r'<tr><td>(.*?)</tr>', re.DOTALL | re.IGNORECASE)
-
-    for match in row_pattern.finditer(content):
-        row_html = '<td>' + match.group(1)
-        tds = td_pattern.findall(row_html)
-
-        if len(tds) < 5:
-            continue
-
-        # Columns: Date, Pick, Line, Result, Units
-        result_raw = re.sub(r'<[^>]+>', '', tds[3]).strip().upper()
-        units_raw = re.sub(r'<[^>]+>', '', tds[4]).strip()
-
-        if result_raw not in ('W', 'WIN', 'L', 'LOSS', 'P', 'PUSH'):
-            continue
-
-        try:
-            units_val = float(units_raw)
-        except (ValueError, TypeError):
-            continue
-
-        counted += 1
-        total_units += units_val
-
-        if result_raw in ('W', 'WIN'):
-            wins += 1
-        elif result_raw in ('L', 'LOSS'):
-            losses += 1
-        elif result_raw in ('P', 'PUSH'):
-            pushes += 1
-
-    return {
-        'sport': sport,
-        'wins': wins,
-        'losses': losses,
-        'pushes': pushes,
-        'units': round(total_units, 2),
-        'counted': counted,
-        'source': 'static HTML table'
-    }
 
 def main():
     print("=" * 70)
@@ -307,6 +76,11 @@ def main():
     print("=" * 70)
     print()
 
+    with PicksLedger() as ledger:
+        return verify(ledger)
+
+
+def verify(ledger):
     # ============================================================
     # 1. Fetch data from sport-specific Google Sheets
     #    (This is what records.html uses for all sports)
@@ -315,11 +89,10 @@ def main():
     sheet_results = {}
     for sport, url in SPORT_SHEET_URLS.items():
         try:
-            rows = fetch_csv(url)
-            stats = compute_from_sheet(rows, sport)
+            ledger.ingest('sheet', fetch_csv_text(url), sheet_pick_rows, sport)
+            stats = ledger.stats('sheet', sport)
             sheet_results[sport] = stats
-            print(f"  {sport}: {stats['wins']}-{stats['losses']}-{stats['pushes']}, "
-                  f"Units: {stats['units']:+.2f}u ({stats['counted']} picks)")
+            print(f"  {sport}: {record_line(stats)}")
         except Exception as e:
             print(f"  {sport}: ERROR fetching - {e}")
             sheet_results[sport] = None
@@ -330,15 +103,16 @@ def main():
     # 2. Fetch Pick Tracker data (both pages use this too)
     # ============================================================
     print("Fetching Pick Tracker data...")
+    pt_results = {}
     try:
-        pt_rows = fetch_csv(PICK_TRACKER_URL)
-        pt_results = compute_pick_tracker_by_sport(pt_rows)
-        for sport, stats in sorted(pt_results.items()):
-            print(f"  {sport}: {stats['wins']}-{stats['losses']}-{stats['pushes']}, "
-                  f"Units: {stats['units']:+.2f}u ({stats['counted']} picks)")
+        ledger.ingest('tracker', fetch_csv_text(PICK_TRACKER_URL), tracker_pick_rows)
+        for sport in sorted(SPORT_SHEET_URLS):
+            stats = ledger.stats('tracker', sport)
+            if stats['totalPicks']:
+                pt_results[sport] = stats
+                print(f"  {sport}: {record_line(stats)}")
     except Exception as e:
         print(f"  ERROR fetching Pick Tracker: {e}")
-        pt_results = {}
 
     print()
 
@@ -359,29 +133,26 @@ def main():
 
     for sport in all_sports:
         sheet = sheet_results.get(sport)
-        pt = pt_results.get(sport, {'wins': 0, 'losses': 0, 'pushes': 0, 'units': 0.0, 'counted': 0})
+        pt = pt_results.get(sport)
 
         if sheet:
             # Note: In practice, deduplication means PT picks that already
             # exist in the sheet won't be double-counted. The sheet data
             # is the primary source.
             print(f"  {sport}:")
-            print(f"    Sheet:        {sheet['wins']}-{sheet['losses']}-{sheet['pushes']}, "
-                  f"Units: {sheet['units']:+.2f}u ({sheet['counted']} picks)")
-            if pt['counted'] > 0:
-                print(f"    Pick Tracker: {pt['wins']}-{pt['losses']}-{pt['pushes']}, "
-                      f"Units: {pt['units']:+.2f}u ({pt['counted']} picks)")
+            print(f"    Sheet:        {record_line(sheet)}")
+            if pt:
+                print(f"    Pick Tracker: {record_line(pt)}")
                 print(f"    (PT picks are deduplicated against sheet in the live page)")
             print()
         else:
             print(f"  {sport}: Sheet data unavailable")
-            if pt['counted'] > 0:
-                print(f"    Pick Tracker only: {pt['wins']}-{pt['losses']}-{pt['pushes']}, "
-                      f"Units: {pt['units']:+.2f}u")
+            if pt:
+                print(f"    Pick Tracker only: {record_line(pt)}")
             print()
 
     # ============================================================
-    # 4. Parse static HTML tables from individual records pages
+    # 4. Read static HTML tables from individual records pages
     #    (for NHL, NFL, NCAAF which have static tables)
     # ============================================================
     print("=" * 70)
@@ -389,22 +160,13 @@ def main():
     print("=" * 70)
     print()
 
-    html_pages = {
-        'NHL': 'nhl-records.html',
-        'NFL': 'nfl-records.html',
-        'NCAAF': 'ncaaf-records.html',
-    }
-
+    sync_records_files(ledger, HTML_TABLE_SPORTS, sources=('html',))
     html_results = {}
-    for sport, filename in html_pages.items():
-        try:
-            stats = parse_static_html_table(filename, sport)
-            html_results[sport] = stats
-            print(f"  {sport} ({filename}):")
-            print(f"    Static table: {stats['wins']}-{stats['losses']}-{stats['pushes']}, "
-                  f"Units: {stats['units']:+.2f}u ({stats['counted']} picks)")
-        except Exception as e:
-            print(f"  {sport}: ERROR parsing {filename} - {e}")
+    for sport in HTML_TABLE_SPORTS:
+        stats = ledger.stats('html', sport)
+        html_results[sport] = stats
+        print(f"  {sport} ({sport.lower()}-records.html):")
+        print(f"    Static table: {record_line(stats)}")
 
     print()
 
@@ -423,27 +185,26 @@ def main():
         html = html_results.get(sport)
 
         if sheet and html:
-            units_match = abs(sheet['units'] - html['units']) < 0.01
-            record_match = (sheet['wins'] == html['wins'] and
-                           sheet['losses'] == html['losses'] and
-                           sheet['pushes'] == html['pushes'])
-
-            status = "MATCH" if (units_match and record_match) else "MISMATCH"
+            status = "MATCH" if same_record(sheet, html) else "MISMATCH"
             if status == "MISMATCH":
                 all_ok = False
 
             print(f"  {sport}: [{status}]")
-            print(f"    Sheet:      {sheet['wins']}-{sheet['losses']}-{sheet['pushes']}, {sheet['units']:+.2f}u")
-            print(f"    HTML table: {html['wins']}-{html['losses']}-{html['pushes']}, {html['units']:+.2f}u")
-            if not units_match:
-                diff = sheet['units'] - html['units']
+            print(f"    Sheet:      {sheet['wins']}-{sheet['losses']}-{sheet['pushes']}, {sheet['totalUnits']:+.2f}u")
+            print(f"    HTML table: {html['wins']}-{html['losses']}-{html['pushes']}, {html['totalUnits']:+.2f}u")
+            if abs(sheet['totalUnits'] - html['totalUnits']) >= 0.01:
+                diff = sheet['totalUnits'] - html['totalUnits']
                 print(f"    UNIT DIFF: {diff:+.2f}u")
+            if status == "MISMATCH":
+                for month, a, b in month_diffs(ledger, sport):
+                    print(f"      {month}: sheet {a['wins']}-{a['losses']}-{a['pushes']} {a['totalUnits']:+.2f}u"
+                          f" | table {b['wins']}-{b['losses']}-{b['pushes']} {b['totalUnits']:+.2f}u")
             print()
         elif sheet:
             # For sports without static HTML tables (NBA, NCAAB, Soccer, MLB)
             # These pages fetch from the SAME Google Sheet URL, so they should match by definition
             print(f"  {sport}: [OK - same Google Sheet source]")
-            print(f"    Sheet: {sheet['wins']}-{sheet['losses']}-{sheet['pushes']}, {sheet['units']:+.2f}u")
+            print(f"    Sheet: {sheet['wins']}-{sheet['losses']}-{sheet['pushes']}, {sheet['totalUnits']:+.2f}u")
             print(f"    (Individual page fetches from same CSV URL - guaranteed match)")
             print()
 
@@ -457,6 +218,4 @@ def main():
     return 0 if all_ok else 1
 
 if __name__ == '__main__':
-    import os
-    os.chdir(os.path.dirname(os.path.abspath(__file__)) + '/..')
     sys.exit(main())
@@ -0,0 +1,575 @@
+#!/usr/bin/env python3
+"""
+Dependency-aware runner for the daily content workflows.
+
+auto-fix-content.yml ran thirteen scripts as thirteen workflow steps, one
+after the other, each cold-starting Python and rescanning the checkout, and
+each running whether or not anything it looks at had changed since the
+previous morning. The workflows now run them through this runner:
+
+  - Every step declares the repo paths it reads and writes (globs, with `**`
+    for any depth). An earlier step must finish before a later one when one
+    writes what the other reads or writes; everything else runs at once, each
+    step in its own forked copy of this process.
+  - The checkout is listed once into a PageIndex (paths plus content digests,
+    re-listed only when a directory changes, re-hashed only when a file's
+    size or mtime moves). Forked steps inherit it, and html_rewrite.html_pages
+    (which asset_manifest and the SEO fixers walk the site with) answers from
+    it instead of walking the tree again.
+  - A step is skipped when the digests of its inputs (declared reads, its own
+    code and the sibling modules it imports, its arguments) and of its outputs
+    match those recorded after its last successful run, in
+    data/cache/workflow-state/<workflow>.json. The workflows commit it, so
+    skips carry over between runs (one file per workflow, so the two
+    workflows' commits never touch the same file). Steps that depend on the date are keyed by it too
+    (`daily`); steps that fetch live data always run (`always`).
+
+A step marked `gate` is a hard gate: if it fails, steps not yet started are
+cancelled and the runner exits 1. Any other failure is reported and the
+workflow carries on, as the old continue-on-error steps did. Each step writes
+its telemetry report under the script's name, as `telemetry.py run` did.
+
+A broad writer (a step that may rewrite any page) orders everything around it,
+so declare the narrowest globs that are true.
+
+Usage:
+  python scripts/workflow_runner.py auto-fix-content
+  python scripts/workflow_runner.py auto-fix-content --plan     # order + skips, run nothing
+  python scripts/workflow_runner.py auto-fix-content --force    # ignore recorded state
+  python scripts/workflow_runner.py daily-handicapping-hub --only featured_preview
+"""
+
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import re
+import runpy
+import sys
+import tempfile
+import time
+import traceback
+from collections import namedtuple
+from datetime import date
+from multiprocessing.connection import wait
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO = os.path.dirname(SCRIPT_DIR)
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+import telemetry  # noqa: E402
+
+STATE_DIR = os.path.join(REPO, 'data', 'cache', 'workflow-state')
+# Bump to invalidate every recorded fingerprint (e.g. when hashing changes).
+STATE_VERSION = 1
+
+# Never part of a step's inputs: VCS internals, bytecode, and per-run output
+# (telemetry and bench results are gitignored; the state files are ours).
+SKIP_DIRS = {'.git', 'node_modules', '__pycache__'}
+SKIP_PATHS = {'data/cache/telemetry', 'data/cache/bench/results', 'data/cache/workflow-state'}
+
+Step = namedtuple('Step', 'name script args reads writes gate volatile')
+Outcome = namedtuple('Outcome', 'name status code output seconds')
+
+
+def step(name, script, *args, reads=(), writes=(), gate=False, volatile=None):
+    """volatile: None (inputs decide), 'daily' (also keyed by date), 'always'."""
+    return Step(name, script, args, tuple(reads), tuple(writes), gate, volatile)
+
+
+# =============================================================================
+# WORKFLOWS
+# =============================================================================
+
+ALL_PAGES = ('**/*.html',)
+ASSETS = ('**/*.js', '**/*.css', '**/*.json')
+FEATURED_PAGES = (
+    'featured-game-of-the-day*.html',
+    '*-analysis-stats-preview*.html',
+    '*-prediction-picks*.html',
+    'archive-prediction-picks-november-21-2025.html',
+)
+HOT_PAGES = ('index.html', 'handicapping-hub.html', '*-previews.html')
+
+WORKFLOWS = {
+    # Writers first, then the checks, so every check sees the final pages and
+    # the checks run side by side instead of pinning the writers between them.
+    'auto-fix-content': (
+        step('college_logos', 'college_logo_ids.py', reads=ALL_PAGES, writes=ALL_PAGES),
+        # Rotates the hubs, regenerates calendar JS + shards + hub pages, and
+        # stamps asset versions (asset_manifest) on whatever references them.
+        step('sync_calendars', 'sync_calendars.py',
+             reads=ALL_PAGES + ASSETS,
+             writes=ALL_PAGES + ('scripts/*.js', 'scripts/hub-archive-manifest.json',
+                                 'data/calendar/**', 'data/cache/asset-manifest.json'),
+             volatile='daily'),
+        step('featured_data', 'sync_featured_games_data.py',
+             reads=FEATURED_PAGES + ('featured-games-data.js',),
+             writes=('featured-games-data.js',)),
+        # WARN-ONLY: pages keep their original src, so a failed build only costs bytes.
+        step('image_derivatives', 'build_image_derivatives.py',
+             reads=HOT_PAGES + ('images/**', 'homepage-picks-data.js'),
+             writes=HOT_PAGES + ('images/derived/**', 'image-derivatives-data.js')),
+        step('records_pages', 'sync_records_from_tracker.py',
+             writes=('*-records.html', 'data/cache/picks-ledger.sqlite'),
+             volatile='always'),
+        # WARN-ONLY: the bake writes nothing on failure, so yesterday's real
+        # numbers stay published rather than empty shells.
+        step('seo_bake', 'bake_seo_static_data.py',
+             reads=('records.html', 'upcomingpicks.html'),
+             writes=('records.html', 'upcomingpicks.html'),
+             volatile='always'),
+        step('discovery', 'generate_discovery_artifacts.py',
+             reads=ALL_PAGES + ('featured-games-data.js', 'robots.txt', 'data/cache/discovery-pages.json'),
+             writes=('sitemap*.xml', 'feed.xml', 'robots.txt', 'featured-game-calendar.html',
+                     'data/cache/discovery-pages.json'),
+             gate=True, volatile='daily'),
+        # WARN-ONLY: a missed stamp only delays a browser refetch until the next run.
+        step('asset_versions', 'asset_manifest.py',
+             reads=ALL_PAGES + ASSETS,
+             writes=ALL_PAGES + ('data/cache/asset-manifest.json',)),
+
+        step('featured_calendar', 'sync_featured_games_calendar.py',
+             reads=('featured-games-data.js', 'scripts/featured-games-calendar.js')),
+        # HARD GATE (June 24 2026): the calendar must highlight only the viewed
+        # article's date, never a 'today' cell. Fail here instead of deploying
+        # a regressed calendar.
+        step('calendar_integrity', 'validate_calendar_integrity.py',
+             reads=ALL_PAGES + ('featured-games-data.js', 'scripts/*-calendar.js'),
+             gate=True),
+        # WARN-ONLY (June 22, 2026): a stale-featured warning must never stop
+        # the sitemap from being committed.
+        step('featured_freshness', 'validate_featured_game_freshness.py', '--max-age-days', '3',
+             reads=FEATURED_PAGES + ('featured-games-data.js', 'featured-game-calendar.html', 'index.html',
+                                     'scripts/sync_featured_game_preview.py'),
+             volatile='daily'),
+        step('discovery_audit', 'audit_daily_discovery.py', '--max-age-days', '7',
+             reads=('*.html', 'featured-games-data.js', 'scripts/*-calendar.js',
+                    'sitemap*.xml', 'feed.xml', 'robots.txt'),
+             volatile='daily'),
+        step('seo_bake_check', 'validate_seo_bake.py',
+             reads=('records.html', 'upcomingpicks.html'),
+             gate=True),
+    ),
+    # After handicapping_hub_production.py (which always fetches).
+    'daily-handicapping-hub': (
+        step('odds_compact', 'odds_history.py', '--compact',
+             reads=('data/cache/odds-history/**',),
+             writes=('data/cache/odds-history/**',),
+             volatile='daily'),
+        step('featured_preview', 'sync_featured_game_preview.py',
+             reads=FEATURED_PAGES + ('featured-games-data.js', 'index.html'),
+             writes=('index.html',),
+             gate=True),
+    ),
+}
+
+
+# =============================================================================
+# PAGE INDEX
+# =============================================================================
+
+_GLOB_CACHE = {}
+
+
+def glob_re(pattern):
+    """A compiled regex for a repo-relative glob: `*` stays within a directory,
+    `**/` spans any number of them (including none)."""
+    rx = _GLOB_CACHE.get(pattern)
+    if rx is None:
+        out = []
+        i = 0
+        while i < len(pattern):
+            if pattern.startswith('**/', i):
+                out.append('(?:.*/)?')
+                i += 3
+            elif pattern.startswith('**', i):
+                out.append('.*')
+                i += 2
+            elif pattern[i] == '*':
+                out.append('[^/]*')
+                i += 1
+            elif pattern[i] == '?':
+                out.append('[^/]')
+                i += 1
+            else:
+                out.append(re.escape(pattern[i]))
+                i += 1
+        rx = _GLOB_CACHE[pattern] = re.compile(''.join(out) + r'\Z')
+    return rx
+
+
+class PageIndex:
+    """Every file in the checkout, with content digests computed on demand.
+
+    The listing is redone only when a directory's mtime moves (a file was
+    added, removed or renamed in it); a digest is redone only when the file's
+    size or mtime moves. Both checks are a stat, so the index can be asked
+    again after every step.
+    """
+
+    def __init__(self, root=REPO):
+        self.root = root
+        self.dirs = {}
+        self.files = []
+        self.digests = {}
+        self._html = None
+
+    def _walk(self):
+        dirs, files = {}, []
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            rel_dir = os.path.relpath(dirpath, self.root).replace('\\', '/')
+            rel_dir = '' if rel_dir == '.' else rel_dir + '/'
+            dirnames[:] = sorted(d for d in dirnames
+                                 if d not in SKIP_DIRS and rel_dir + d not in SKIP_PATHS)
+            dirs[dirpath] = os.stat(dirpath).st_mtime_ns
+            files.extend(rel_dir + f for f in filenames if rel_dir + f not in SKIP_PATHS)
+        self.dirs, self.files, self._html = dirs, sorted(files), None
+
+    def _stale(self):
+        if not self.dirs:
+            return True
+        for path, mtime in self.dirs.items():
+            try:
+                if os.stat(path).st_mtime_ns != mtime:
+                    return True
+            except OSError:
+                return True
+        return False
+
+    def listing(self):
+        if self._stale():
+            self._walk()
+        return self.files
+
+    def match(self, patterns):
+        rxs = [glob_re(p) for p in patterns]
+        return [rel for rel in self.listing() if any(rx.match(rel) for rx in rxs)]
+
+    def digest(self, rel):
+        try:
+            st = os.stat(os.path.join(self.root, rel))
+        except OSError:
+            return '-'
+        key = (st.st_size, st.st_mtime_ns)
+        cached = self.digests.get(rel)
+        if cached and cached[0] == key:
+            return cached[1]
+        h = hashlib.md5()
+        with open(os.path.join(self.root, rel), 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                h.update(chunk)
+        self.digests[rel] = (key, h.hexdigest())
+        return self.digests[rel][1]
+
+    def fingerprint(self, patterns, extra=()):
+        h = hashlib.md5()
+        for item in extra:
+            h.update(str(item).encode('utf-8') + b'\0')
+        for rel in self.match(patterns):
+            h.update(f'{rel}\0{self.digest(rel)}\0'.encode('utf-8'))
+        return h.hexdigest()
+
+    def html_pages(self):
+        """Same result as html_rewrite.html_pages(), from the listing."""
+        files = self.listing()
+        if self._html is None:
+            from html_rewrite import SKIP_DIRS as skip
+            self._html = [rel for rel in files
+                          if rel.endswith('.html') and not skip.intersection(rel.split('/')[:-1])]
+        return list(self._html)
+
+
+def share_page_index(index):
+    """Point html_rewrite.html_pages (and so asset_manifest and the fixers) at `index`."""
+    import html_rewrite
+    html_rewrite.html_pages = index.html_pages
+
+
+# =============================================================================
+# PLAN
+# =============================================================================
+
+_IMPORT_RE = re.compile(r'^\s*(?:from|import)\s+([A-Za-z_]\w*)', re.M)
+
+
+def code_files(script, seen=None):
+    """`scripts/<script>` and every sibling module it imports, transitively."""
+    seen = set() if seen is None else seen
+    if script in seen:
+        return seen
+    seen.add(script)
+    try:
+        with open(os.path.join(SCRIPT_DIR, script), encoding='utf-8', errors='ignore') as f:
+            source = f.read()
+    except OSError:
+        return seen
+    for name in _IMPORT_RE.findall(source):
+        if os.path.isfile(os.path.join(SCRIPT_DIR, name + '.py')):
+            code_files(name + '.py', seen)
+    return seen
+
+
+def _sample(pattern):
+    """A path the glob matches, for comparing globs no existing file matches."""
+    return re.sub(r'\*\*/?|\*|\?', 'x', pattern)
+
+
+def overlaps(a, b, files):
+    """Can a path match a glob in `a` and one in `b`? `files` maps each glob
+    tuple to the existing paths it matches."""
+    if not a or not b:
+        return False
+    if any(glob_re(q).match(_sample(p)) for p in a for q in b):
+        return True
+    if any(glob_re(q).match(_sample(p)) for p in b for q in a):
+        return True
+    return not files[a].isdisjoint(files[b])
+
+
+def dependencies(steps, index):
+    """{name: names of earlier steps it must wait for}."""
+    files = {}
+    for st in steps:
+        for globs in (st.reads, st.writes, st.reads + st.writes):
+            if globs not in files:
+                files[globs] = set(index.match(globs))
+    deps = {}
+    for j, later in enumerate(steps):
+        deps[later.name] = [
+            earlier.name for earlier in steps[:j]
+            if overlaps(earlier.writes, later.reads + later.writes, files)
+            or overlaps(earlier.reads, later.writes, files)
+        ]
+    return deps
+
+
+def fingerprints(st, index):
+    """(inputs, outputs) digests of a step as the checkout stands now."""
+    code = tuple(sorted('scripts/' + f for f in code_files(st.script)))
+    extra = [STATE_VERSION, st.script, *st.args]
+    if st.volatile == 'daily':
+        extra.append(date.today().isoformat())
+    return [index.fingerprint(st.reads + code, extra), index.fingerprint(st.writes)]
+
+
+def state_path(workflow):
+    return os.path.join(STATE_DIR, workflow + '.json')
+
+
+def load_state(workflow):
+    """{step name: [inputs, outputs]} as of each step's last successful run."""
+    try:
+        with open(state_path(workflow), encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return state.get('steps', {}) if state.get('version') == STATE_VERSION else {}
+
+
+def save_state(workflow, steps):
+    text = json.dumps({'version': STATE_VERSION, 'steps': dict(sorted(steps.items()))}, indent=1) + '\n'
+    path = state_path(workflow)
+    try:
+        with open(path, encoding='utf-8') as f:
+            if f.read() == text:
+                return
+    except OSError:
+        pass
+    os.makedirs(STATE_DIR, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+# =============================================================================
+# EXECUTION
+# =============================================================================
+
+def run_script(st):
+    """Run one step's script in this process as `python scripts/<script> args`.
+    Returns (exit code, seconds)."""
+    path = os.path.join(SCRIPT_DIR, st.script)
+    saved_argv, saved_cwd = sys.argv, os.getcwd()
+    sys.argv = [path, *st.args]
+    telemetry.reset(os.path.splitext(st.script)[0])
+    start = time.perf_counter()
+    code = 0
+    try:
+        with telemetry.stage('main'):
+            runpy.run_path(path, run_name='__main__')
+    except SystemExit as e:
+        if isinstance(e.code, int):
+            code = e.code
+        elif e.code is not None:
+            print(e.code, file=sys.stderr)
+            code = 1
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    finally:
+        sys.argv = saved_argv
+        os.chdir(saved_cwd)
+    seconds = time.perf_counter() - start
+    telemetry.write_report()
+    return code, seconds
+
+
+def _child(st, conn):
+    """Forked worker: run the step with fd 1/2 (subprocesses included) captured."""
+    with tempfile.TemporaryFile() as out:
+        os.dup2(out.fileno(), 1)
+        os.dup2(out.fileno(), 2)
+        code, seconds = run_script(st)
+        sys.stdout.flush()
+        sys.stderr.flush()
+        out.seek(0)
+        conn.send((code, out.read().decode('utf-8', 'replace'), seconds))
+    conn.close()
+
+
+def _report(o, gate):
+    label = {'ok': 'ok', 'skipped': 'skipped (inputs unchanged)', 'cancelled': 'cancelled',
+             'failed': f'FAILED (exit {o.code})' + (' - hard gate' if gate else ' - warning only')}[o.status]
+    print(f'\n[workflow] {o.name}: {label}  {o.seconds:.2f}s')
+    if o.output:
+        print(o.output.rstrip('\n'))
+    sys.stdout.flush()
+
+
+def run(workflow, jobs=None, force=False, only=None):
+    """Run a workflow's steps. Returns the outcomes in declaration order."""
+    steps = [st for st in WORKFLOWS[workflow] if not only or st.name in only]
+    index = PageIndex()
+    share_page_index(index)
+    deps = dependencies(steps, index)
+    state = load_state(workflow)
+    gates = {st.name for st in steps if st.gate}
+    fork = 'fork' in multiprocessing.get_all_start_methods()
+    jobs = max(1, jobs or min(8, os.cpu_count() or 1)) if fork else 1
+
+    outcomes = {}
+    pending = list(steps)
+    running = {}           # connection -> (step, process)
+    cancelled = False
+
+    def finish(st, status, code=0, output='', seconds=0.0):
+        outcomes[st.name] = Outcome(st.name, status, code, output, seconds)
+        if status == 'ok' and st.volatile != 'always':
+            state[st.name] = fingerprints(st, index)
+        elif status == 'failed':
+            state.pop(st.name, None)
+        _report(outcomes[st.name], st.gate)
+        return status == 'failed' and st.name in gates
+
+    while pending or running:
+        launched = True
+        while launched and not cancelled:
+            launched = False
+            for st in list(pending):
+                if any(d not in outcomes for d in deps[st.name]):
+                    continue
+                if not force and st.volatile != 'always' and state.get(st.name) == fingerprints(st, index):
+                    pending.remove(st)
+                    finish(st, 'skipped')
+                    launched = True
+                    continue
+                if len(running) >= jobs:
+                    break
+                pending.remove(st)
+                launched = True
+                if not fork:
+                    print(f'\n[workflow] {st.name}: running scripts/{st.script}')
+                    sys.stdout.flush()
+                    code, seconds = run_script(st)
+                    cancelled |= finish(st, 'failed' if code else 'ok', code, '', seconds)
+                    break
+                sys.stdout.flush()
+                sys.stderr.flush()
+                recv, send = multiprocessing.Pipe(duplex=False)
+                proc = multiprocessing.get_context('fork').Process(target=_child, args=(st, send))
+                proc.start()
+                send.close()
+                running[recv] = (st, proc)
+        if cancelled:
+            for st in pending:
+                finish(st, 'cancelled')
+            pending = []
+        if not running:
+            if pending and not cancelled and not launched:
+                raise RuntimeError(f'workflow stalled with {[st.name for st in pending]} pending')
+            continue
+        for conn in wait(list(running)):
+            st, proc = running.pop(conn)
+            try:
+                code, output, seconds = conn.recv()
+            except EOFError:
+                code, output, seconds = proc.exitcode or 1, f'worker died (exit {proc.exitcode})', 0.0
+            conn.close()
+            proc.join()
+            cancelled |= finish(st, 'failed' if code else 'ok', code, output, seconds)
+
+    declared = {st.name for st in WORKFLOWS[workflow]}
+    save_state(workflow, {name: fp for name, fp in state.items() if name in declared})
+    return [outcomes[st.name] for st in steps]
+
+
+def plan(workflow, only=None):
+    steps = [st for st in WORKFLOWS[workflow] if not only or st.name in only]
+    index = PageIndex()
+    deps = dependencies(steps, index)
+    state = load_state(workflow)
+    for st in steps:
+        if st.volatile == 'always':
+            verdict = 'run (always)'
+        elif state.get(st.name) == fingerprints(st, index):
+            verdict = 'skip'
+        else:
+            verdict = 'run'
+        after = ', '.join(deps[st.name]) or '-'
+        print(f'  {st.name:20s} {verdict:13s} {"gate" if st.gate else "":4s}  after: {after}')
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Run a content workflow as a dependency graph of steps.')
+    ap.add_argument('workflow', choices=sorted(WORKFLOWS))
+    ap.add_argument('--jobs', type=int, default=None, help='Steps run at once (default: CPU count, max 8).')
+    ap.add_argument('--force', action='store_true', help='Run every step, ignoring recorded state.')
+    ap.add_argument('--only', default='', help='Comma-separated step names to run.')
+    ap.add_argument('--plan', action='store_true', help='Print order and skips, run nothing.')
+    args = ap.parse_args(argv)
+    only = {name for name in args.only.split(',') if name}
+    unknown = only - {st.name for st in WORKFLOWS[args.workflow]}
+    if unknown:
+        ap.error(f"unknown step(s): {', '.join(sorted(unknown))}")
+
+    os.chdir(REPO)
+    if args.plan:
+        print(f'[workflow] {args.workflow}')
+        plan(args.workflow, only)
+        return 0
+
+    start = time.perf_counter()
+    outcomes = run(args.workflow, args.jobs, args.force, only)
+    wall = time.perf_counter() - start
+
+    print(f'\n[workflow] {args.workflow} timings')
+    for o in outcomes:
+        print(f'  {o.name:24s} {o.seconds:6.2f}s  {o.status}')
+    busy = sum(o.seconds for o in outcomes)
+    print(f'  {"total (wall)":24s} {wall:6.2f}s  ({busy:.2f}s of step time)')
+
+    gates = {st.name for st in WORKFLOWS[args.workflow] if st.gate}
+    failed = [o.name for o in outcomes if o.status == 'failed']
+    if failed:
+        print(f"[workflow] failed: {', '.join(failed)}")
+    blocked = [name for name in failed if name in gates]
+    if blocked:
+        print(f"[workflow] hard gate failed: {', '.join(blocked)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+MAINTENANCE = ROOT / "scripts" / "maintenance"
+if str(MAINTENANCE) not in sys.path:
+    sys.path.insert(0, str(MAINTENANCE))
+
+# content_checker exits at import time without its scraping dependencies.
+pytest.importorskip("requests")
+pytest.importorskip("bs4")
+
+from content_checker import EntityMatcher  # noqa: E402
+
+
+def find_all(text, pattern):
+    starts, i = [], text.find(pattern)
+    while i >= 0:
+        starts.append(i)
+        i = text.find(pattern, i + 1)
+    return starts
+
+
+def test_occurrences_include_overlaps():
+    matcher = EntityMatcher(["he", "she", "his", "hers", "", "she"])
+    assert matcher.patterns == ["he", "she", "his", "hers"]
+    assert "hers" in matcher and "her" not in matcher
+    assert matcher.occurrences("ushers") == {"she": [1], "he": [2], "hers": [2]}
+    assert matcher.occurrences("nothing to see") == {}
+
+
+def test_occurrences_match_repeated_find():
+    patterns = ["lebron james", "james", "lakers", "los angeles lakers", "la", "a", "jokic"]
+    text = ("los angeles lakers star lebron james scored 30 as the lakers beat "
+            "the nuggets; jokic had a triple-double for la's visitors.")
+    hits = EntityMatcher(patterns).occurrences(text)
+    expected = {p: find_all(text, p) for p in patterns}
+    assert hits == {p: starts for p, starts in expected.items() if starts}
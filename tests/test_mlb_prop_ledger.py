@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import csv
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = ROOT / "scripts"
+if str(SCRIPTS) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS))
+
+import mlb_prop_ledger  # noqa: E402
+from mlb_prop_ledger import DAILY_CARD, TRACKER_FIELDS, CsvDiverged, PropLedger  # noqa: E402
+
+
+def prop(selection, odds="-110", result="", **extra):
+    return {"date": "2026-05-01", "family": "hits", "game": "NYY@BOS", "market": "batter_hits",
+            "selection": selection, "line": "0.5", "odds": odds, "result": result, **extra}
+
+
+def read_csv(path):
+    with path.open(newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def touch_later(path):
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_upsert_keeps_first_price_unless_refreshed(tmp_path):
+    with PropLedger(tmp_path / "ledger.sqlite") as ledger:
+        assert ledger.upsert(DAILY_CARD, [prop("Judge over"), prop("Devers over")]) == [
+            prop("Judge over"), prop("Devers over")]
+        assert ledger.upsert(DAILY_CARD, [prop("Judge over", odds="-150")]) == []
+        assert ledger.rows(DAILY_CARD)[0]["odds"] == "-110"
+
+        ledger.upsert(DAILY_CARD, [prop("Judge over", odds="-150")], refresh=True)
+        assert ledger.rows(DAILY_CARD)[0]["odds"] == "-150"
+        assert ledger.count(DAILY_CARD) == 2
+
+
+def test_settle_touches_open_rows_only(tmp_path):
+    with PropLedger(tmp_path / "ledger.sqlite") as ledger:
+        ledger.upsert(DAILY_CARD, [prop("Judge over"), prop("Devers over", result="WIN")])
+        (judge_id, judge), = ledger.open_rows(DAILY_CARD, date="2026-05-01")
+        assert judge["selection"] == "Judge over"
+        devers_id = ledger.entries(DAILY_CARD)[1][0]
+
+        graded = [(judge_id, dict(judge, result="LOSS")), (devers_id, prop("Devers over", result="LOSS"))]
+        assert ledger.settle(DAILY_CARD, graded) == 1
+        assert [r["result"] for r in ledger.rows(DAILY_CARD)] == ["LOSS", "WIN"]
+        assert ledger.open_rows(DAILY_CARD) == []
+
+        # Settled rows stay put even on a refreshing upsert.
+        ledger.upsert(DAILY_CARD, [prop("Judge over", odds="+200")], refresh=True)
+        assert ledger.rows(DAILY_CARD)[0]["odds"] == "-110"
+
+
+def test_export_refuses_a_hand_edited_csv(tmp_path):
+    tracker = tmp_path / "tracker.csv"
+    with PropLedger(tmp_path / "ledger.sqlite") as ledger:
+        ledger.upsert(DAILY_CARD, [prop("Judge over")])
+        assert ledger.export_csv(DAILY_CARD, tracker) == 1
+        assert not ledger.csv_diverged(DAILY_CARD, tracker)
+
+        ledger.append_csv(DAILY_CARD, tracker, ledger.upsert(DAILY_CARD, [prop("Devers over")]))
+        assert not ledger.csv_diverged(DAILY_CARD, tracker)
+        assert [r["selection"] for r in read_csv(tracker)] == ["Judge over", "Devers over"]
+
+        rows = read_csv(tracker)
+        rows[0]["result"] = "WIN"
+        with tracker.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=TRACKER_FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+        touch_later(tracker)
+        assert ledger.csv_diverged(DAILY_CARD, tracker)
+        with pytest.raises(CsvDiverged):
+            ledger.export_csv(DAILY_CARD, tracker)
+        assert read_csv(tracker)[0]["result"] == "WIN"
+
+
+def test_adopt_replaces_rows_in_one_transaction(tmp_path, monkeypatch):
+    tracker = tmp_path / "tracker.csv"
+    with PropLedger(tmp_path / "ledger.sqlite") as ledger:
+        ledger.upsert(DAILY_CARD, [prop("Judge over"), prop("Devers over")])
+        ledger.export_csv(DAILY_CARD, tracker)
+        with tracker.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=TRACKER_FIELDS, restval="", extrasaction="ignore")
+            writer.writeheader()
+            writer.writerow(prop("Judge over", result="WIN"))
+        touch_later(tracker)
+
+        def broken_insert(*args, **kwargs):
+            raise RuntimeError("import failed")
+
+        with monkeypatch.context() as m:
+            m.setattr(PropLedger, "_insert", broken_insert)
+            with pytest.raises(RuntimeError):
+                ledger.adopt_csv(DAILY_CARD, tracker)
+        assert ledger.count(DAILY_CARD) == 2
+        assert ledger.csv_diverged(DAILY_CARD, tracker)
+
+        assert ledger.adopt_csv(DAILY_CARD, tracker) == 1
+        assert [(r["selection"], r["result"]) for r in ledger.rows(DAILY_CARD)] == [("Judge over", "WIN")]
+        assert ledger.open_rows(DAILY_CARD) == []
+        assert not ledger.csv_diverged(DAILY_CARD, tracker)
+
+
+def test_main_reports_a_diverged_export_without_a_traceback(tmp_path, monkeypatch, capsys):
+    out = tmp_path / "out.csv"
+    with PropLedger(tmp_path / "ledger.sqlite") as ledger:
+        ledger.upsert(DAILY_CARD, [prop("Judge over")])
+        ledger.export_csv(DAILY_CARD, out)
+    out.write_text("date,selection\n2026-05-01,edited\n", encoding="utf-8")
+
+    monkeypatch.setattr(mlb_prop_ledger, "TRACKER_PATH", tmp_path / "missing.csv")
+    monkeypatch.setattr(PropLedger.__init__, "__defaults__", (tmp_path / "ledger.sqlite",))
+    monkeypatch.setattr(sys, "argv", ["mlb_prop_ledger.py", "--export", str(out)])
+    assert mlb_prop_ledger.main() == 1
+    assert "edited outside the ledger" in capsys.readouterr().err
+    assert out.read_text(encoding="utf-8") == "date,selection\n2026-05-01,edited\n"
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import os
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = ROOT / "scripts"
+if str(SCRIPTS) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS))
+
+from odds_history import OddsHistory  # noqa: E402
+
+
+def quote(line, book="DraftKings", price=-110, selection="home"):
+    return {
+        "event_id": "401",
+        "game_date": "2026-03-10",
+        "market": "spread",
+        "selection": selection,
+        "book": book,
+        "line": line,
+        "price": price,
+    }
+
+
+def test_record_writes_only_changed_quotes(tmp_path):
+    with OddsHistory("basketball_nba", root=str(tmp_path)) as history:
+        assert history.record([quote(-3.5)], "espn", captured_at=100) == 1
+        assert history.record([quote(-3.5)], "espn", captured_at=200) == 0
+        assert history.record([quote(-3.5, price=-115)], "espn", captured_at=300) == 1
+        assert history.record([{**quote(None), "price": None}], "espn", captured_at=400) == 0
+
+
+def test_line_summary_and_movement_pin_the_book(tmp_path):
+    with OddsHistory("basketball_nba", root=str(tmp_path)) as history:
+        history.record([quote(-3.5), quote(-2.5, book="FanDuel")], "espn", captured_at=100)
+        history.record([quote(-4.5)], "espn", captured_at=200)
+        history.record([quote(-1.5, book="FanDuel")], "espn", captured_at=300)
+
+        mixed = history.line_summary("401", "spread")["home"]
+        assert (mixed["open"], mixed["current"]) == (-3.5, -1.5)
+        assert (mixed["min"], mixed["max"], mixed["updates"]) == (-4.5, -1.5, 4)
+
+        dk = history.line_summary("401", "spread", "2026-03-10", "DraftKings")["home"]
+        assert (dk["open"], dk["current"], dk["updates"]) == (-3.5, -4.5, 2)
+        assert history.movement("401", "spread", "home", "2026-03-10", "FanDuel") == (-2.5, -1.5)
+        assert history.movement("401", "spread", "away", "2026-03-10") is None
+
+
+def test_compact_keeps_open_close_and_extremes_then_archives(tmp_path):
+    root = str(tmp_path)
+    with OddsHistory("basketball_nba", root=root) as history:
+        for t, line in enumerate([-3.5, -4.0, -5.5, -4.5, -2.0, -3.0], start=1):
+            history.record([quote(line)], "espn", captured_at=t)
+        before = history.line_summary("401", "spread")["home"]
+
+        actions = history.compact(now=datetime(2026, 5, 1, tzinfo=timezone.utc))
+        assert actions == {"2026-03": "compacted (2 rows removed), archived"}
+        assert os.listdir(os.path.join(root, "basketball_nba")) == ["2026-03.sqlite.gz"]
+
+        after = history.line_summary("401", "spread")["home"]
+        for field in ("open", "current", "min", "max", "open_price", "current_price"):
+            assert after[field] == before[field]
+        assert after["updates"] == 4
+
+        # A late quote unpacks the archived month again.
+        assert history.record([quote(-2.5)], "espn", captured_at=10) == 1
+        assert history.movement("401", "spread", "home", "2026-03-10") == (-3.5, -2.5)
+        assert os.listdir(os.path.join(root, "basketball_nba")) == ["2026-03.sqlite"]
+
+        assert history.compact(now=datetime(2027, 6, 1, tzinfo=timezone.utc)) == {"2026-03": "dropped"}
+        assert history.partitions() == []
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = ROOT / "scripts"
+if str(SCRIPTS) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS))
+
+from picks_ledger import PicksLedger, archive_rows, html_table_rows  # noqa: E402
+
+
+def records_page(rows):
+    body = "\n".join(
+        f"<tr><td>{date}</td><td>{pick}</td><td>{line}</td>"
+        f'<td class="result-{result}">{result}</td><td>{units}</td></tr>'
+        for date, pick, line, result, units in rows
+    )
+    return f'<table><tbody id="picks-table-body">\n{body}\n</tbody></table>'
+
+
+def archive(rows):
+    return json.dumps([
+        {"Date": date, "Picks": pick, "Odds": line, "Result": result, "ProfitLoss": units}
+        for date, pick, line, result, units in rows
+    ])
+
+
+PAGE_V1 = [
+    ("10/4/2025", "Chiefs -3", "-110", "W", "+1.00"),
+    ("10/4/2025", "Bills Over 47.5", "-105", "L", "-1.05"),
+    ("10/11/2025", "Eagles ML", "+120", "W", "+1.20"),
+    ("11/2/2025", "Lions -6.5", "-110", "P", "0.00"),
+]
+PAGE_V2 = [
+    ("11/9/2025", "Ravens +2.5", "-110", "W", "+1.00"),          # added
+    ("10/4/2025", "Chiefs -3", "-110", "L", "-1.10"),            # regraded
+    ("10/11/2025", "Eagles ML", "+120", "W", "+1.20"),
+    ("11/2/2025", "Lions -6.5", "-110", "P", "0.00"),
+]                                                                # Bills dropped
+ARCHIVE = [
+    ("10/4/2025", "Chiefs -3", "-110", "W", "1.00"),
+    ("9/27/2025", "Packers -2", "-110", "W", "1.00"),
+]
+
+
+def snapshot(ledger):
+    out = {}
+    for scope in ("html", "archive", "records"):
+        out[scope] = {
+            "stats": ledger.stats(scope, "NFL"),
+            "month": ledger.breakdown(scope, "NFL", "month"),
+            "bet_type": ledger.breakdown(scope, "NFL", "bet_type"),
+            "rows": [(r["date"], r["pick"], r["result"], r["units"], r["source"])
+                     for r in ledger.rows(scope, "NFL")],
+        }
+    return out
+
+
+def test_incremental_ingest_matches_a_fresh_rebuild(tmp_path):
+    with PicksLedger(str(tmp_path / "incremental.sqlite")) as ledger:
+        ledger.define_view("records", {"NFL": ["html", "archive"]})
+        ledger.ingest("html", records_page(PAGE_V1), html_table_rows, "NFL")
+        ledger.ingest("archive", archive(ARCHIVE), archive_rows, "NFL")
+        assert ledger.stats("records", "NFL")["totalPicks"] == 5
+
+        changes = ledger.ingest("html", records_page(PAGE_V2), html_table_rows, "NFL")
+        assert changes == {"NFL": (1, 1, 1)}
+        assert ledger.ingest("html", records_page(PAGE_V2), html_table_rows, "NFL") is None
+        incremental = snapshot(ledger)
+
+    with PicksLedger(str(tmp_path / "fresh.sqlite")) as ledger:
+        ledger.ingest("archive", archive(ARCHIVE), archive_rows, "NFL")
+        ledger.ingest("html", records_page(PAGE_V2), html_table_rows, "NFL")
+        ledger.define_view("records", {"NFL": ["html", "archive"]})
+        fresh = snapshot(ledger)
+
+    assert incremental == fresh
+    stats = fresh["records"]["stats"]
+    assert (stats["wins"], stats["losses"], stats["pushes"]) == (3, 1, 1)
+    assert stats["totalUnits"] == 2.1
+    assert [r[1] for r in fresh["html"]["rows"]] == [p[1] for p in PAGE_V2]
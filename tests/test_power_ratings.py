@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import sys
+from datetime import date
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = ROOT / "scripts"
+if str(SCRIPTS) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS))
+
+from power_ratings import MIN_GAMES, PowerRatings  # noqa: E402
+
+
+def pkl_game(day, home, away, home_score, away_score, sport="NBA"):
+    return {"Sport": sport, "Date": day, "HomeTeam": home, "AwayTeam": away,
+            "HomeScore": home_score, "AwayScore": away_score}
+
+
+def espn_final(event_id, home, away, home_score, away_score):
+    return {
+        "id": event_id,
+        "status": {"type": {"completed": True, "state": "post"}},
+        "competitions": [{"competitors": [
+            {"homeAway": "home", "score": str(home_score), "team": {"abbreviation": home}},
+            {"homeAway": "away", "score": str(away_score), "team": {"abbreviation": away}},
+        ]}],
+    }
+
+
+def test_backfilled_ratings_answer_espn_abbreviations(tmp_path):
+    ratings = PowerRatings(str(tmp_path / "ratings.json"))
+    games = [pkl_game(f"2026-01-{day:02d}", "Golden State Warriors", "New York Knicks", 120, 105)
+             if day % 2 else
+             pkl_game(f"2026-01-{day:02d}", "New York Knicks", "Golden State Warriors", 101, 112)
+             for day in range(1, 2 * MIN_GAMES + 1)]
+    assert ratings.backfill(games) == {"NBA": 2 * MIN_GAMES}
+
+    line = ratings.true_line("NBA", "GS", "NY")
+    assert line is not None and line < 0
+    assert ratings.true_line("NBA", "GSW", "NYK") == line
+    assert ratings.true_line("NBA", "Golden State Warriors", "New York Knicks") == line
+
+    # Live finals under ESPN's abbreviations land on the backfilled teams.
+    assert ratings.pending_dates("NBA", today=date(2026, 1, 12)) == ["20260111", "20260112"]
+    assert ratings.absorb_events("NBA", "20260111", [espn_final("401", "NY", "GS", 130, 90)],
+                                 today=date(2026, 1, 12)) == 1
+    assert set(ratings.sports["NBA"]["teams"]) == {"GSW", "NYK"}
+    assert ratings.true_line("NBA", "GS", "NY") > line
+
+
+def test_sports_never_backfilled_serve_no_lines(tmp_path):
+    ratings = PowerRatings(str(tmp_path / "ratings.json"))
+    ratings.backfill([pkl_game("2026-01-01", "Boston Celtics", "Miami Heat", 110, 100)])
+
+    assert ratings.pending_dates("NHL", today=date(2026, 1, 12)) == []
+    finals = [espn_final(str(n), "BOS", "TOR", 4, 2) for n in range(2 * MIN_GAMES)]
+    assert ratings.absorb_events("NHL", "20260111", finals, today=date(2026, 1, 12)) == 0
+    assert ratings.true_line("NHL", "BOS", "TOR") is None
+    assert "NHL" not in ratings.sports
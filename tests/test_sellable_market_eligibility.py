@@ -9,6 +9,7 @@ if str(SCRIPTS) not in sys.path:
     sys.path.insert(0, str(SCRIPTS))
 
 from sellable_market_eligibility import (  # noqa: E402
+    PublicTrendGuardrails,
     public_trend_exclusion_reason,
     sellable_exclusion_reason,
 )
@@ -84,3 +85,29 @@ def test_nhl_non_league_alias_is_labeled_and_suppressed():
 
     assert public_trend_exclusion_reason(game, "NHL") == "nhl_non_league_or_international_score_only"
 
+
+
+def test_compiled_guardrails_match_per_row_rules_and_reuse_cached_decisions(tmp_path):
+    rows = []
+    for away, home in (
+        ("St. Louis Blues", "Carolina Hurricanes"),
+        ("SC Bern", "New York Rangers"),
+        ("Utah Mammoth", "Colorado Avalanche"),
+    ):
+        for away_ml, home_ml in ((110, -120), (None, -105), (None, None), ("", 130)):
+            rows.append({"Sport": "NHL", "AwayTeam": away, "HomeTeam": home,
+                         "AwayMoneyline": away_ml, "HomeMoneyline": home_ml})
+    rows.append({"Sport": "NBA", "AwayTeam": "LA Clippers", "HomeTeam": "Boston Celtics",
+                 "AwayMoneyline": None, "HomeMoneyline": -300})
+
+    cache = tmp_path / "guardrails.json"
+    guardrails = PublicTrendGuardrails(cache)
+    expected = [public_trend_exclusion_reason(g, None) is None for g in rows]
+    assert guardrails.mask(rows, None) == expected
+    assert len(guardrails.filter(rows * 2, None)) == 2 * sum(expected)
+    assert cache.exists()
+
+    reloaded = PublicTrendGuardrails(cache)
+    assert reloaded.decisions == guardrails.decisions
+    assert reloaded.mask(rows, None) == expected
+    assert not reloaded.dirty
@@ -10,9 +10,13 @@ Featured Game pages: Page 1 = oldest, higher pages = newer
 
 import os
 import re
+import sys
 import glob
 
 SITE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(SITE_DIR, 'scripts'))
+
+from html_rewrite import rewrite, root_pages, transform
 
 
 def get_all_html_files():
@@ -186,39 +190,15 @@ def get_page_date(filename):
     return "1900-01-01"  # Fallback for pages without dates
 
 
-def update_nav_links_sitewide(featured_pages):
-    """Update navigation links across ALL HTML files to point to the newest featured game page by DATE"""
-    changes = []
-
-    if not featured_pages:
-        return changes
-
-    # Get the newest featured game page by FORCED_PAGE_DATE (not page number!)
-    pages_with_dates = []
-    for page_num, filename in featured_pages:
-        date = get_page_date(filename)
-        pages_with_dates.append((date, page_num, filename))
-
-    # Sort by date descending and get the newest
-    pages_with_dates.sort(key=lambda x: x[0], reverse=True)
-    newest_page = pages_with_dates[0][2] if pages_with_dates else get_featured_filename(1)
-
-    print(f"  Newest by date: {newest_page} ({pages_with_dates[0][0] if pages_with_dates else 'unknown'})")
-
-    html_files = get_all_html_files()
-
-    for filepath in html_files:
-        filename = os.path.basename(filepath)
-
-        # Skip the featured game pages themselves (their internal links should vary)
-        if filename.startswith('featured-game-of-the-day'):
-            continue
-
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
+def not_featured_page(rel):
+    # Skip the featured game pages themselves (their internal links should vary)
+    return root_pages(rel) and not rel.startswith('featured-game-of-the-day')
 
-        original = content
 
+def nav_links_transform(newest_page):
+    """Build the html_rewrite transform that points featured-game nav links at newest_page"""
+    def update_nav_links(rel, content):
+        """Point featured-game nav links at the newest featured game page"""
         # Update ALL nav links that point to any featured-game page
         # Pattern 1: "Game of the Day" links (dropdown and direct nav)
         content = re.sub(
@@ -247,13 +227,34 @@ def update_nav_links_sitewide(featured_pages):
             f"onclick=\"window.location.href='{newest_page}'\"",
             content
         )
+        return content
+    return update_nav_links
 
-        if content != original:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
-            changes.append(filename)
 
-    return changes
+def update_nav_links_sitewide(featured_pages):
+    """Update navigation links across ALL HTML files to point to the newest featured game page by DATE"""
+    if not featured_pages:
+        return []
+
+    # Get the newest featured game page by FORCED_PAGE_DATE (not page number!)
+    pages_with_dates = []
+    for page_num, filename in featured_pages:
+        date = get_page_date(filename)
+        pages_with_dates.append((date, page_num, filename))
+
+    # Sort by date descending and get the newest
+    pages_with_dates.sort(key=lambda x: x[0], reverse=True)
+    newest_page = pages_with_dates[0][2] if pages_with_dates else get_featured_filename(1)
+
+    print(f"  Newest by date: {newest_page} ({pages_with_dates[0][0] if pages_with_dates else 'unknown'})")
+
+    # Computed once, then applied by the rewrite engine in a single pass.
+    transform('featured-nav-links', applies=not_featured_page)(nav_links_transform(newest_page))
+    results = rewrite(['featured-nav-links'])
+    for r in results:
+        if r.error:
+            print(f"  [ERROR] {r.rel}: {r.error}")
+    return [r.rel for r in results if r.applied]
 
 
 def main():